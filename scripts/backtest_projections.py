@@ -30,13 +30,12 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
 from nfl_data_integration import NFLDataFetcher
 from scoring_calculator import calculate_fantasy_points_df, list_scoring_formats
 from player_analytics import (
-    compute_usage_metrics,
-    compute_rolling_averages,
     compute_defensive_strength,
     compute_opponent_rankings,
     compute_implied_team_totals,
 )
 from projection_engine import apply_injury_adjustments, generate_weekly_projections
+from walk_forward_features import WalkForwardSilverState, build_silver_prefix
 from early_season_prior import apply_early_season_prior, compute_prior_season_ppg
 from adp_prior import (
     apply_adp_prior,
@@ -114,29 +113,21 @@ def compute_actuals(
 
 
 def build_silver_features(
-    weekly_df: pd.DataFrame, season: int, up_to_week: int
+    weekly_df: pd.DataFrame,
+    season: int,
+    up_to_week: int,
+    state: Optional[WalkForwardSilverState] = None,
 ) -> pd.DataFrame:
-    """Build Silver-layer features using only data available up to a given week."""
-    hist = weekly_df[
-        (weekly_df["season"] == season) & (weekly_df["week"] < up_to_week)
-    ].copy()
-    if hist.empty or len(hist) < 5:
-        # Need some history; try including prior season
-        prior = weekly_df[weekly_df["season"] == season - 1].copy()
-        hist = pd.concat([prior, hist], ignore_index=True)
-
-    if hist.empty:
-        return pd.DataFrame()
+    """Build Silver-layer features using only data available up to a given week.
 
-    try:
-        usage = compute_usage_metrics(hist)
-        rolling = compute_rolling_averages(usage)
-        return rolling
-    except Exception as e:
-        logger.debug(
-            "Feature build failed for season=%d week<%d: %s", season, up_to_week, e
-        )
-        return pd.DataFrame()
+    When a :class:`WalkForwardSilverState` built over the same ``weekly_df``
+    is passed, the frame is served from its per-season cache (byte-identical
+    output, no per-week groupby rebuild). Without one, the features are
+    rebuilt from scratch.
+    """
+    if state is not None:
+        return state.features_before(season, up_to_week)
+    return build_silver_prefix(weekly_df, season, up_to_week)
 
 
 def _load_local_parquet(base_dir: str, pattern: str) -> pd.DataFrame:
@@ -533,6 +524,7 @@ def run_backtest(
     ecr_anchor_weight: float = 0.3,
     wind_adjust: bool = False,
     wind_adjust_shrink: float = 0.0539,
+    walk_forward_features: bool = True,
 ) -> pd.DataFrame:
     """Run backtesting across specified seasons and weeks.
 
@@ -596,6 +588,11 @@ def run_backtest(
             ``generate_projections.py --wind-adjust``.
         wind_adjust_shrink: Multiplicative shrink for high-wind QB/WR/TE
             rows (default :data:`wind_adjust.HIGH_WIND_SHRINK`).
+        walk_forward_features: Serve each week's Silver frame from a
+            :class:`walk_forward_features.WalkForwardSilverState` (usage and
+            rolling features built once per season, byte-identical to the
+            per-week rebuild). False rebuilds from scratch every week — only
+            useful for parity checks.
     """
     fetcher = NFLDataFetcher()
     project_root = os.path.join(os.path.dirname(__file__), "..")
@@ -618,6 +615,7 @@ def run_backtest(
         print(f"Loaded {len(weekly_df):,} weekly rows from nfl-data-py")
 
     weekly_df = _prepare_weekly(weekly_df)
+    silver_state = WalkForwardSilverState(weekly_df) if walk_forward_features else None
 
     # Load schedules for opponent rankings (and implied totals if --constrain)
     sched_dfs = []
@@ -886,7 +884,9 @@ def run_backtest(
             print(f"  Backtesting {season} Week {week}...", end=" ", flush=True)
 
             # Build features from data available before this week
-            silver_df = build_silver_features(weekly_df, season, up_to_week=week)
+            silver_df = build_silver_features(
+                weekly_df, season, up_to_week=week, state=silver_state
+            )
             if silver_df.empty:
                 print("SKIP (insufficient history)")
                 continue
@@ -1422,6 +1422,22 @@ def main():
         default=0.0539,
         help="Multiplicative shrink for high-wind QB/WR/TE rows (default 0.0539).",
     )
+    parser.add_argument(
+        "--rebuild-features-per-week",
+        action="store_true",
+        help=(
+            "Rebuild Silver usage/rolling features from scratch for every "
+            "(season, week) instead of the walk-forward state (parity checks)."
+        ),
+    )
+    parser.add_argument(
+        "--model-timings",
+        action="store_true",
+        help=(
+            "Print model load/predict timings (model_registry metrics hook) "
+            "after the backtest."
+        ),
+    )
     args = parser.parse_args()
 
     seasons = [int(s) for s in args.seasons.split(",")]
@@ -1483,6 +1499,13 @@ def main():
     # For consensus mode we always use weeks 3-18.
     backtest_weeks = weeks if not vs_consensus else (weeks or list(range(3, 19)))
 
+    timings = None
+    if args.model_timings:
+        from model_registry import TimingCollector, set_metrics_hook
+
+        timings = TimingCollector()
+        set_metrics_hook(timings)
+
     results = run_backtest(
         seasons,
         backtest_weeks,
@@ -1506,8 +1529,13 @@ def main():
         ecr_anchor_weight=args.ecr_anchor_weight,
         wind_adjust=args.wind_adjust,
         wind_adjust_shrink=args.wind_adjust_shrink,
+        walk_forward_features=not args.rebuild_features_per_week,
     )
 
+    if timings is not None:
+        print("\nModel load/predict timings:")
+        print(timings.summary().to_string(index=False))
+
     if results.empty:
         print("\nERROR: No backtest results generated.")
         return 1
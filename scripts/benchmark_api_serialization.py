@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""Benchmark the column-wise response serializer on the read endpoints.
+
+Two measurements over the local Gold data:
+
+* ``rows`` — the per-request payload build for the list endpoints on the
+  same DataFrame slice: ``legacy`` walks ``df.iterrows()`` and validates one
+  Pydantic model per row before encoding the list (the previous router
+  path); ``columnar`` is ``serialization.frame_records`` + ``dumps``. Each
+  columnar record is validated against the schema before any timing is
+  reported.
+* ``http`` — full requests through the ASGI app: ``build`` clears the
+  response cache before every request (read + serialize), ``cached`` serves
+  the stored bytes, and ``304`` polls with the ETag from the first reply.
+
+Latency is reported as p50 / p99 in milliseconds.
+
+Usage::
+
+    python scripts/benchmark_api_serialization.py
+    python scripts/benchmark_api_serialization.py --season 2025 --week 10 --repeat 200
+"""
+
+import argparse
+import logging
+import math
+import os
+import sys
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+from pydantic import TypeAdapter
+
+_SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+_PROJECT_ROOT = os.path.join(_SCRIPTS_DIR, "..")
+sys.path.insert(0, _PROJECT_ROOT)
+sys.path.insert(0, os.path.join(_PROJECT_ROOT, "src"))
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+from web.api.main import app  # noqa: E402
+from web.api.models.schemas import (  # noqa: E402
+    GamePrediction,
+    PlayerProjection,
+    PlayerSearchResult,
+)
+from web.api.routers.predictions import _df_to_prediction_list  # noqa: E402
+from web.api.routers.projections import _df_to_projection_list  # noqa: E402
+from web.api.serialization import dumps, frame_records, response_cache  # noqa: E402
+from web.api.services import prediction_service, projection_service  # noqa: E402
+
+logging.getLogger("web.api").setLevel(logging.WARNING)
+
+
+def _percentiles(samples: List[float]) -> Tuple[float, float]:
+    ms = np.asarray(samples) * 1000.0
+    return float(np.percentile(ms, 50)), float(np.percentile(ms, 99))
+
+
+def _time(fn: Callable[[], Any], repeat: int) -> Tuple[float, float]:
+    fn()  # warm-up
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return _percentiles(samples)
+
+
+def _legacy(df, model, values: Optional[Dict[str, Any]] = None) -> bytes:
+    """Row-at-a-time stand-in: box each row, validate one model, encode."""
+    values = values or {}
+    fields = list(model.model_fields)
+    rows = []
+    for _, row in df.iterrows():
+        kwargs = {}
+        for name in fields:
+            if name in values:
+                kwargs[name] = values[name]
+                continue
+            value = row.get(name)
+            if isinstance(value, float) and math.isnan(value):
+                value = None
+            if value is not None:
+                kwargs[name] = value
+        rows.append(model(**kwargs))
+    return TypeAdapter(List[model]).dump_json(rows)
+
+
+def _row_cases(season: int, week: int, scoring: str) -> List[Tuple[str, Any]]:
+    cases = []
+    projections = projection_service.get_projections(
+        season=season, week=week, scoring_format=scoring, limit=1000
+    )
+    projections = projections.loc[:, ~projections.columns.duplicated()]
+    cases.append(
+        (
+            f"projections ({len(projections)} rows)",
+            projections,
+            PlayerProjection,
+            lambda df: _df_to_projection_list(df, scoring),
+            {"scoring_format": scoring},
+        )
+    )
+    try:
+        predictions = prediction_service.get_predictions(season=season, week=week)
+        cases.append(
+            (
+                f"predictions ({len(predictions)} rows)",
+                predictions,
+                GamePrediction,
+                _df_to_prediction_list,
+                None,
+            )
+        )
+    except FileNotFoundError:
+        print(f"  (no predictions for {season} week {week}; skipped)")
+    search = projection_service.search_players(query="a", season=season, week=week)
+    cases.append(
+        (
+            f"players/search ({len(search)} rows)",
+            search,
+            PlayerSearchResult,
+            lambda df: frame_records(df, PlayerSearchResult),
+            None,
+        )
+    )
+    return cases
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Benchmark columnar vs per-row Pydantic response building."
+    )
+    parser.add_argument("--season", type=int, default=2025)
+    parser.add_argument("--week", type=int, default=10)
+    parser.add_argument("--scoring", default="ppr")
+    parser.add_argument("--repeat", type=int, default=100)
+    args = parser.parse_args()
+
+    try:
+        cases = _row_cases(args.season, args.week, args.scoring)
+    except FileNotFoundError as exc:
+        print(f"No Gold data: {exc}")
+        return 1
+
+    for label, df, model, columnar, _ in cases:
+        for record in columnar(df):
+            if model(**record).model_dump() != record:
+                print(f"ERROR: {label} record does not round-trip {model.__name__}")
+                return 1
+    print("Parity: every columnar record validates against its response model")
+
+    print(f"\nrows (ms, p50 / p99, {args.repeat} runs)")
+    for label, df, model, columnar, values in cases:
+        old = _time(lambda: _legacy(df, model, values), args.repeat)
+        new = _time(lambda: dumps(columnar(df)), args.repeat)
+        print(
+            f"  {label:<28} legacy {old[0]:7.2f} / {old[1]:7.2f}   "
+            f"columnar {new[0]:7.2f} / {new[1]:7.2f}   ({old[0] / max(new[0], 1e-9):.1f}x)"
+        )
+
+    client = TestClient(app)
+    urls = [
+        f"/api/projections?season={args.season}&week={args.week}"
+        f"&scoring={args.scoring}",
+        f"/api/projections?season={args.season}&week={args.week}"
+        f"&scoring={args.scoring}&position=WR&limit=100",
+        f"/api/predictions?season={args.season}&week={args.week}",
+        f"/api/players/search?q=jo&season={args.season}&week={args.week}",
+    ]
+    print(f"\nhttp (ms, p50 / p99, {args.repeat} runs)")
+    for url in urls:
+        first = client.get(url)
+        if first.status_code != 200:
+            print(f"  {url}: HTTP {first.status_code}, skipped")
+            continue
+        etag = first.headers["etag"]
+
+        def build() -> None:
+            response_cache.clear()
+            client.get(url)
+
+        built = _time(build, args.repeat)
+        cached = _time(lambda: client.get(url), args.repeat)
+        not_modified = _time(
+            lambda: client.get(url, headers={"If-None-Match": etag}), args.repeat
+        )
+        print(f"  {url} ({len(first.content) / 1024:.0f} KiB)")
+        print(
+            f"    build {built[0]:7.2f} / {built[1]:7.2f}   "
+            f"cached {cached[0]:7.2f} / {cached[1]:7.2f}   "
+            f"304 {not_modified[0]:7.2f} / {not_modified[1]:7.2f}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
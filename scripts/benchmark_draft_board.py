@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""Benchmark the array-backed DraftBoard on a replayed draft night.
+
+Builds a board from the newest Gold preseason projections and replays a full
+snake draft. Every pick is followed by the per-poll work of the live draft
+co-pilot: ``recommend``, ``best_available`` for the flex positions and a
+``build_queue``. Two advisors run over the same board state:
+
+* ``scan``    — candidates are the whole ``available`` frame (the previous
+  full-sort behaviour);
+* ``indexed`` — ``DraftBoard.top_candidates`` (per-position presorted
+  rankings, only the head of each read).
+
+The outputs are compared for equality at every pick before any timing is
+reported.
+
+Usage::
+
+    python scripts/benchmark_draft_board.py
+    python scripts/benchmark_draft_board.py --season 2026 --teams 12 --rounds 16
+"""
+
+import argparse
+import logging
+import os
+import sys
+import time
+
+import pandas as pd
+
+_SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+_PROJECT_ROOT = os.path.join(_SCRIPTS_DIR, "..")
+sys.path.insert(0, os.path.join(_PROJECT_ROOT, "src"))
+
+from draft_optimizer import DraftAdvisor, DraftBoard, compute_value_scores  # noqa: E402
+from projection_store import load_latest_preseason  # noqa: E402
+
+logging.getLogger("draft_optimizer").setLevel(logging.WARNING)
+
+
+def _full_scan(board: DraftBoard):
+    """``top_candidates`` stand-in returning every eligible available row."""
+
+    def candidates(*args, position_filter=None, **kwargs) -> pd.DataFrame:
+        avail = board.available.copy()
+        if position_filter is not None:
+            avail = avail[avail["position"].map(position_filter).astype(bool)]
+        return avail.reset_index(drop=True)
+
+    return candidates
+
+
+def _poll(advisor: DraftAdvisor, queue_depth: int):
+    recs, reasoning = advisor.recommend(top_n=10)
+    best = advisor.best_available(positions=["RB", "WR", "TE"], top_n=10)
+    queue = advisor.build_queue(depth=queue_depth)
+    return recs, reasoning, best, queue
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Benchmark indexed vs full-scan draft board recommendations."
+    )
+    parser.add_argument("--season", type=int, default=2026)
+    parser.add_argument("--teams", type=int, default=12)
+    parser.add_argument("--rounds", type=int, default=16)
+    parser.add_argument("--queue-depth", type=int, default=12)
+    args = parser.parse_args()
+
+    projections = load_latest_preseason(args.season)
+    if projections is None:
+        print(f"No preseason projections found for season {args.season}")
+        return 1
+    board = DraftBoard(compute_value_scores(projections.copy()), n_teams=args.teams)
+    advisor = DraftAdvisor(board)
+    print(
+        f"Season {args.season}: {board.available_count():,} players, "
+        f"{args.teams} teams x {args.rounds} rounds"
+    )
+
+    scan_s = indexed_s = 0.0
+    n_picks = args.teams * args.rounds
+    for pick in range(n_picks):
+        start = time.perf_counter()
+        indexed = _poll(advisor, args.queue_depth)
+        indexed_s += time.perf_counter() - start
+
+        board.top_candidates = _full_scan(board)
+        try:
+            start = time.perf_counter()
+            scan = _poll(advisor, args.queue_depth)
+            scan_s += time.perf_counter() - start
+        finally:
+            del board.top_candidates
+
+        for got, want in zip(indexed, scan):
+            same = got.equals(want) if isinstance(got, pd.DataFrame) else got == want
+            if not same:
+                print(f"ERROR: indexed and scan outputs differ at pick {pick + 1}")
+                return 1
+
+        recs = indexed[0]
+        if recs.empty:
+            break
+        board.draft_player(str(recs.iloc[0]["player_id"]), by_me=pick % args.teams == 0)
+
+    print(
+        f"Parity: identical recommendations, queues and best-available ({n_picks} picks)"
+    )
+    print(f"  scan    : {scan_s:8.3f}s")
+    print(f"  indexed : {indexed_s:8.3f}s  ({scan_s / max(indexed_s, 1e-9):.1f}x)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""Benchmark indexed fuzzy name resolution on a season of sentiment docs.
+
+Loads every Bronze sentiment document for one season (all sources), runs the
+rule-based extractor over them to collect the player-name mentions the
+sentiment pipeline would resolve, then resolves those names two ways:
+
+* ``scan``    — the previous implementation: one ``resolve`` call per
+  mention, fuzzy fallback scoring every entry in the index, no memo;
+* ``indexed`` — ``PlayerNameResolver.resolve_batch`` (deduped inputs,
+  inverted token index with size-bound pruning, bounded memo).
+
+The two name -> player_id mappings are compared for exact equality before
+any timing is reported.
+
+Usage::
+
+    python scripts/benchmark_name_resolver.py
+    python scripts/benchmark_name_resolver.py --season 2025
+"""
+
+import argparse
+import glob as globmod
+import json
+import logging
+import os
+import sys
+import time
+import types
+from typing import List, Tuple
+
+_SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+_PROJECT_ROOT = os.path.join(_SCRIPTS_DIR, "..")
+sys.path.insert(0, _PROJECT_ROOT)
+sys.path.insert(0, os.path.join(_PROJECT_ROOT, "src"))
+
+from player_name_resolver import (  # noqa: E402
+    PlayerNameResolver,
+    _PlayerEntry,
+    _token_overlap,
+)
+from sentiment.processing.rule_extractor import RuleExtractor  # noqa: E402
+
+logging.getLogger("player_name_resolver").setLevel(logging.ERROR)
+
+
+def _load_mentions(season: int) -> Tuple[int, List[str]]:
+    """Player-name mentions across all Bronze sentiment docs for a season."""
+    pattern = os.path.join(
+        _PROJECT_ROOT, "data", "bronze", "sentiment", "*", f"season={season}", "*.json"
+    )
+    extractor = RuleExtractor()
+    n_docs = 0
+    names: List[str] = []
+    for path in sorted(globmod.glob(pattern)):
+        with open(path, "r") as f:
+            payload = json.load(f)
+        items = payload.get("items", []) if isinstance(payload, dict) else payload
+        for doc in items:
+            n_docs += 1
+            names.extend(s.player_name for s in extractor.extract(doc))
+    return n_docs, names
+
+
+def _scan_fuzzy_candidates(
+    self, norm: str, threshold: float = 0.80
+) -> List[_PlayerEntry]:
+    """The pre-index fuzzy fallback: score every entry."""
+    results = []
+    for entry in self.index:
+        score = _token_overlap(norm, entry.norm_name)
+        if score >= threshold:
+            results.append((score, entry))
+    results.sort(key=lambda t: (-t[0], -t[1].season))
+    return [entry for _, entry in results]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Benchmark indexed vs full-scan player name resolution."
+    )
+    parser.add_argument("--season", type=int, default=2025)
+    args = parser.parse_args()
+
+    n_docs, names = _load_mentions(args.season)
+    if not names:
+        print(f"No sentiment mentions found for season {args.season}")
+        return 1
+    print(
+        f"Season {args.season}: {n_docs:,} docs, {len(names):,} mentions, "
+        f"{len(set(names)):,} distinct names"
+    )
+
+    bronze_root = os.path.join(_PROJECT_ROOT, "data", "bronze")
+    start = time.perf_counter()
+    resolver = PlayerNameResolver(bronze_root=bronze_root)
+    print(
+        f"Index build: {time.perf_counter() - start:.2f}s ({len(resolver.index):,} players)"
+    )
+
+    scan = PlayerNameResolver.__new__(PlayerNameResolver)
+    scan.__dict__.update(resolver.__dict__)
+    scan._memo_size = 0
+    scan._memo = type(resolver._memo)()
+    scan._fuzzy_candidates = types.MethodType(_scan_fuzzy_candidates, scan)
+
+    start = time.perf_counter()
+    expected = {}
+    for name in names:
+        expected[name] = scan.resolve(name)
+    scan_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    actual = resolver.resolve_batch(names)
+    indexed_s = time.perf_counter() - start
+
+    if actual != expected:
+        diff = [n for n in expected if actual.get(n) != expected[n]]
+        print(f"ERROR: {len(diff)} names resolved differently, e.g. {diff[:5]}")
+        return 1
+    resolved = sum(1 for v in actual.values() if v)
+    print(f"Parity: identical results ({resolved:,} of {len(actual):,} names resolved)")
+    print(f"  scan    : {scan_s:8.3f}s")
+    print(f"  indexed : {indexed_s:8.3f}s  ({scan_s / max(indexed_s, 1e-9):.0f}x)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
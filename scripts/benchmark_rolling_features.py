@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""Benchmark the shared rolling kernel against the per-column lambda idiom.
+
+Loads the full local Bronze player-week table (default 2016-2025), derives
+usage shares exactly as the Silver player pipeline does, then times the
+trailing-feature step two ways:
+
+* ``lambda``  — the previous implementation: one
+  ``groupby(["player_id", "season"])[col].transform(lambda s: s.shift(1)...)``
+  per stat column per window, plus one for the season-to-date mean;
+* ``kernel``  — ``player_analytics.compute_rolling_averages`` on
+  ``rolling_kernel.LaggedGroupBlock`` (one NumPy pass for all columns).
+
+Both outputs are compared with exact equality before any timing is reported,
+so a speedup is never quoted for a kernel that drifted.
+
+Usage::
+
+    python scripts/benchmark_rolling_features.py
+    python scripts/benchmark_rolling_features.py --seasons 2016-2025 --repeat 3
+"""
+
+import argparse
+import glob as globmod
+import logging
+import os
+import sys
+import time
+from typing import Callable, List
+
+import pandas as pd
+
+_SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+_PROJECT_ROOT = os.path.join(_SCRIPTS_DIR, "..")
+sys.path.insert(0, os.path.join(_PROJECT_ROOT, "src"))
+
+from player_analytics import (  # noqa: E402
+    ROLLING_STAT_COLS,
+    compute_rolling_averages,
+    compute_usage_metrics,
+)
+
+logging.basicConfig(level=logging.WARNING, format="%(levelname)s - %(message)s")
+logger = logging.getLogger(__name__)
+
+BRONZE_WEEKLY = os.path.join(_PROJECT_ROOT, "data", "bronze", "players", "weekly")
+
+
+def _parse_seasons(text: str) -> List[int]:
+    """Parse '2016-2025' or '2023,2024' into a list of seasons."""
+    if "-" in text:
+        start, end = text.split("-", 1)
+        return list(range(int(start), int(end) + 1))
+    return [int(s) for s in text.split(",")]
+
+
+def _load_player_weeks(seasons: List[int]) -> pd.DataFrame:
+    """Latest Bronze weekly parquet per season, concatenated."""
+    parts = []
+    for season in seasons:
+        files = sorted(
+            globmod.glob(os.path.join(BRONZE_WEEKLY, f"season={season}", "*.parquet"))
+        )
+        if files:
+            parts.append(pd.read_parquet(files[-1]))
+        else:
+            logger.warning("No Bronze weekly data for season %d", season)
+    if not parts:
+        return pd.DataFrame()
+    df = pd.concat(parts, ignore_index=True)
+    if "air_yards" not in df.columns and "receiving_air_yards" in df.columns:
+        df["air_yards"] = df["receiving_air_yards"].fillna(0)
+    return df
+
+
+def _lambda_rolling_averages(df: pd.DataFrame, windows=(3, 6)) -> pd.DataFrame:
+    """The pre-kernel ``compute_rolling_averages`` body, kept for comparison."""
+    df = df.copy()
+    df = df.sort_values(["player_id", "season", "week"])
+    stat_cols = [c for c in ROLLING_STAT_COLS if c in df.columns]
+    for window in windows:
+        roll_cols = {}
+        for col in stat_cols:
+            roll_cols[f"{col}_roll{window}"] = df.groupby(["player_id", "season"])[
+                col
+            ].transform(lambda s: s.shift(1).rolling(window, min_periods=1).mean())
+        df = df.assign(**roll_cols)
+    for col in stat_cols:
+        df[f"{col}_std"] = df.groupby(["player_id", "season"])[col].transform(
+            lambda s: s.shift(1).expanding().mean()
+        )
+    return df
+
+
+def _best_of(func: Callable[[], pd.DataFrame], repeat: int):
+    """Run *func* ``repeat`` times; return (best seconds, last result)."""
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Benchmark the rolling-feature kernel on the player-week table."
+    )
+    parser.add_argument("--seasons", default="2016-2025")
+    parser.add_argument("--repeat", type=int, default=1)
+    args = parser.parse_args()
+
+    seasons = _parse_seasons(args.seasons)
+    weekly = _load_player_weeks(seasons)
+    if weekly.empty:
+        print("ERROR: no Bronze weekly data found for the requested seasons.")
+        return 1
+    usage = compute_usage_metrics(weekly)
+    n_cols = len([c for c in ROLLING_STAT_COLS if c in usage.columns])
+    print(
+        f"Player-week table: {len(usage):,} rows, {n_cols} stat columns, "
+        f"{usage.groupby(['player_id', 'season']).ngroups:,} player-seasons"
+    )
+
+    kernel_s, kernel_df = _best_of(lambda: compute_rolling_averages(usage), args.repeat)
+    lambda_s, lambda_df = _best_of(lambda: _lambda_rolling_averages(usage), args.repeat)
+
+    pd.testing.assert_frame_equal(kernel_df, lambda_df, check_exact=True)
+    print("Parity: kernel output is identical to the lambda idiom")
+    print(f"  lambda : {lambda_s:8.2f}s")
+    print(f"  kernel : {kernel_s:8.2f}s")
+    print(f"  speedup: {lambda_s / kernel_s:8.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""Benchmark single-pass RuleExtractor scanning on a season of sentiment docs.
+
+Loads every Bronze sentiment document for one season (all sources) and runs
+rule extraction three ways:
+
+* ``windows``  — the previous implementation: every pattern searched in every
+  sentence window of every candidate player;
+* ``single``   — ``RuleExtractor.extract_batch`` (one hit scan per document,
+  windows resolved by offset lookup);
+* ``workers``  — the same with ``--workers`` processes.
+
+Signals from all three are compared for exact equality before any timing is
+reported.
+
+Usage::
+
+    python scripts/benchmark_rule_extractor.py
+    python scripts/benchmark_rule_extractor.py --season 2025 --workers 4
+"""
+
+import argparse
+import glob as globmod
+import json
+import os
+import re
+import sys
+import time
+from typing import Any, Dict, List
+
+_SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+_PROJECT_ROOT = os.path.join(_SCRIPTS_DIR, "..")
+sys.path.insert(0, _PROJECT_ROOT)
+
+from src.sentiment.processing.rule_extractor import (  # noqa: E402
+    _PATTERNS,
+    _SENTENCE_DELIMS,
+    _WINDOW_CEILING,
+    RuleExtractor,
+)
+
+
+def _load_docs(season: int) -> List[Dict[str, Any]]:
+    """All Bronze sentiment docs for a season, with unique external ids."""
+    pattern = os.path.join(
+        _PROJECT_ROOT, "data", "bronze", "sentiment", "*", f"season={season}", "*.json"
+    )
+    docs: List[Dict[str, Any]] = []
+    for path in sorted(globmod.glob(pattern)):
+        with open(path, "r") as f:
+            payload = json.load(f)
+        items = payload.get("items", []) if isinstance(payload, dict) else payload
+        for doc in items:
+            docs.append(dict(doc, external_id=f"{len(docs)}:{doc.get('external_id')}"))
+    return docs
+
+
+def _window_extract(extractor: RuleExtractor, doc: Dict[str, Any]) -> List[tuple]:
+    """The pre-single-pass matching: regex search per player window."""
+    title = doc.get("title", "") or ""
+    body = doc.get("body_text", "") or ""
+    text = f"{title}\n\n{body}".strip()
+    out = []
+    for name in extractor._extract_names(text):
+        windows = []
+        for m in re.finditer(re.escape(name), text):
+            left_limit = max(0, m.start() - _WINDOW_CEILING)
+            right_limit = min(len(text), m.end() + _WINDOW_CEILING)
+            left, right = m.start(), m.end()
+            while left > left_limit and text[left - 1] not in _SENTENCE_DELIMS:
+                left -= 1
+            while right < right_limit and text[right] not in _SENTENCE_DELIMS:
+                right += 1
+            if right < len(text):
+                right += 1
+            windows.append(text[left:right])
+        for regex, sentiment, category, _ in _PATTERNS:
+            if any(regex.search(w) for w in windows):
+                out.append((name, sentiment, category))
+                break
+    return out
+
+
+def _signature(results: Dict[str, list]) -> Dict[str, List[tuple]]:
+    return {
+        doc_id: [(s.player_name, s.sentiment, s.category) for s in signals]
+        for doc_id, signals in results.items()
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Benchmark single-pass vs per-window rule extraction."
+    )
+    parser.add_argument("--season", type=int, default=2025)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    docs = _load_docs(args.season)
+    if not docs:
+        print(f"No sentiment docs found for season {args.season}")
+        return 1
+    print(f"Season {args.season}: {len(docs):,} docs")
+
+    extractor = RuleExtractor()
+    start = time.perf_counter()
+    expected = {doc["external_id"]: _window_extract(extractor, doc) for doc in docs}
+    windows_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    single = extractor.extract_batch(docs)
+    single_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    fanned = extractor.extract_batch(docs, workers=args.workers)
+    workers_s = time.perf_counter() - start
+
+    for label, results in (("single", single), ("workers", fanned)):
+        actual = _signature(results)
+        if actual != expected:
+            diff = [d for d in expected if actual.get(d) != expected[d]]
+            print(f"ERROR: {label} differs on {len(diff)} docs, e.g. {diff[:5]}")
+            return 1
+    n_signals = sum(len(v) for v in expected.values())
+    print(f"Parity: identical signals ({n_signals:,} across {len(docs):,} docs)")
+    print(f"  windows : {windows_s:8.3f}s")
+    print(f"  single  : {single_s:8.3f}s  ({windows_s / max(single_s, 1e-9):.1f}x)")
+    print(
+        f"  workers : {workers_s:8.3f}s  ({windows_s / max(workers_s, 1e-9):.1f}x, "
+        f"{args.workers} processes)"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
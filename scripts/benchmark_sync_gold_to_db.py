@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""Benchmark the bulk COPY sync path against per-row executemany.
+
+Builds a synthetic projections frame (default 20,000 rows — roughly a full
+season of weekly projections across three scoring formats) and times both
+``sync_gold_to_db`` write modes end to end: row-tuple construction plus the
+database writes.
+
+Targets, in order of preference:
+
+* a real PostgreSQL given by ``--database-url`` / ``DATABASE_URL`` (e.g. a
+  local ``docker run postgres``). Tables are created in a throwaway
+  ``sync_bench`` schema that is dropped afterwards; both modes must leave
+  identical table contents.
+* otherwise an in-process stand-in connection that charges ``--rtt-ms`` per
+  server round trip — psycopg2's ``executemany`` issues one statement per
+  row, while the bulk path issues three statements per file.
+
+Usage::
+
+    python scripts/benchmark_sync_gold_to_db.py
+    python scripts/benchmark_sync_gold_to_db.py --rows 50000 --rtt-ms 0.5
+    DATABASE_URL=postgresql://postgres:pw@localhost:5432/postgres \\
+        python scripts/benchmark_sync_gold_to_db.py
+"""
+
+import argparse
+import logging
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from scripts.sync_gold_to_db import (  # noqa: E402
+    DDL_PROJECTIONS,
+    PROJECTION_COLUMNS,
+    PROJECTION_KEY,
+    _projection_rows,
+    _write_rows,
+)
+
+logging.getLogger("sync_gold_to_db").setLevel(logging.WARNING)
+
+
+def _synthetic_projections(n: int, seed: int = 0) -> pd.DataFrame:
+    """Projection frame with the post-rename Gold columns."""
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame(
+        {
+            "player_id": [f"00-{i:07d}" for i in range(n)],
+            "player_name": [f"Player {i}" for i in range(n)],
+            "position": rng.choice(["QB", "RB", "WR", "TE", "K"], n),
+            "team": rng.choice(["KC", "BUF", "DAL", "SF", "PHI"], n),
+            "projected_points": rng.normal(10, 5, n),
+            "projected_floor": rng.normal(5, 2, n),
+            "projected_ceiling": rng.normal(16, 5, n),
+            "is_bye_week": rng.random(n) < 0.05,
+            "is_rookie_projection": rng.random(n) < 0.1,
+            "proj_pass_yards": rng.normal(60, 90, n),
+            "proj_pass_tds": rng.random(n),
+            "proj_rush_yards": rng.normal(30, 20, n),
+            "proj_rush_tds": rng.random(n) / 2,
+            "proj_rec": rng.normal(3, 2, n),
+            "proj_rec_yards": rng.normal(40, 25, n),
+            "proj_rec_tds": rng.random(n) / 2,
+            "position_rank": rng.integers(1, 80, n),
+            "injury_status": rng.choice(["", "Questionable", "Out"], n),
+        }
+    )
+
+
+class _StandInCursor:
+    """Counts round trips and sleeps ``rtt`` seconds for each one."""
+
+    def __init__(self, conn):
+        self.conn = conn
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def _round_trip(self):
+        self.conn.round_trips += 1
+        time.sleep(self.conn.rtt)
+
+    def execute(self, sql, params=None):
+        self._round_trip()
+
+    def executemany(self, sql, rows):
+        for _ in rows:
+            self._round_trip()
+
+    def copy_expert(self, sql, buf):
+        buf.read()
+        self._round_trip()
+
+
+class _StandInConnection:
+    def __init__(self, rtt_ms: float):
+        self.rtt = rtt_ms / 1000.0
+        self.round_trips = 0
+
+    def cursor(self):
+        return _StandInCursor(self)
+
+    def commit(self):
+        pass
+
+
+def _time_mode(conn, df: pd.DataFrame, bulk: bool) -> float:
+    start = time.perf_counter()
+    rows = _projection_rows(df, 2026, 1, "half_ppr")
+    _write_rows(conn, "projections", PROJECTION_COLUMNS, PROJECTION_KEY, rows, bulk)
+    conn.commit()
+    return time.perf_counter() - start
+
+
+def _run_stand_in(df: pd.DataFrame, rtt_ms: float) -> None:
+    print(f"Target: in-process stand-in, {rtt_ms} ms per round trip")
+    for label, bulk in (("rows", False), ("bulk", True)):
+        conn = _StandInConnection(rtt_ms)
+        elapsed = _time_mode(conn, df, bulk)
+        print(f"  {label:5s}: {elapsed:8.2f}s  {conn.round_trips:,} round trips")
+
+
+def _run_postgres(df: pd.DataFrame, database_url: str) -> None:
+    import psycopg2
+
+    conn = psycopg2.connect(database_url)
+    print("Target: PostgreSQL (schema sync_bench)")
+    try:
+        snapshots = {}
+        for label, bulk in (("rows", False), ("bulk", True)):
+            with conn.cursor() as cur:
+                cur.execute("DROP SCHEMA IF EXISTS sync_bench CASCADE")
+                cur.execute("CREATE SCHEMA sync_bench")
+                cur.execute("SET search_path TO sync_bench")
+                cur.execute(DDL_PROJECTIONS)
+            conn.commit()
+            elapsed = _time_mode(conn, df, bulk)
+            with conn.cursor() as cur:
+                cur.execute(
+                    f"SELECT {', '.join(PROJECTION_COLUMNS)} FROM projections "
+                    "ORDER BY player_id"
+                )
+                snapshots[label] = cur.fetchall()
+            print(f"  {label:5s}: {elapsed:8.2f}s")
+        if snapshots["rows"] != snapshots["bulk"]:
+            print("ERROR: bulk and rows modes left different table contents")
+            sys.exit(1)
+        print("Parity: both modes wrote identical rows")
+    finally:
+        with conn.cursor() as cur:
+            cur.execute("DROP SCHEMA IF EXISTS sync_bench CASCADE")
+        conn.commit()
+        conn.close()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Benchmark bulk COPY vs executemany Gold -> Postgres sync."
+    )
+    parser.add_argument("--rows", type=int, default=20000)
+    parser.add_argument("--database-url", default=os.getenv("DATABASE_URL"))
+    parser.add_argument("--rtt-ms", type=float, default=0.2)
+    args = parser.parse_args()
+
+    df = _synthetic_projections(args.rows)
+    print(f"Synthetic projections: {len(df):,} rows")
+    if args.database_url:
+        _run_postgres(df, args.database_url)
+    else:
+        _run_stand_in(df, args.rtt_ms)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
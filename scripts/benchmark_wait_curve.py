@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""Benchmark the batched cost-of-waiting curve on a draft-night board.
+
+Builds a board from the newest Gold preseason projections and, at several
+points in a replayed snake draft, computes the expected best-available VORP
+per position at every remaining pick of one user slot two ways:
+
+* ``scalar``  — ``expected_best_vorp_at_pick`` once per pick number;
+* ``batched`` — ``expected_best_vorp_at_picks`` (one matrix pass per
+  position).
+
+Every value is compared for exact equality before any timing is reported.
+
+Usage::
+
+    python scripts/benchmark_wait_curve.py
+    python scripts/benchmark_wait_curve.py --season 2026 --teams 12 --slot 7
+"""
+
+import argparse
+import logging
+import os
+import sys
+import time
+
+_SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+_PROJECT_ROOT = os.path.join(_SCRIPTS_DIR, "..")
+sys.path.insert(0, os.path.join(_PROJECT_ROOT, "src"))
+
+from draft_availability import (  # noqa: E402
+    expected_best_vorp_at_pick,
+    expected_best_vorp_at_picks,
+)
+from draft_optimizer import DraftBoard, compute_value_scores  # noqa: E402
+from projection_store import load_latest_preseason  # noqa: E402
+
+logging.getLogger("draft_optimizer").setLevel(logging.WARNING)
+
+
+def _snake_picks(slot: int, n_teams: int, rounds: int, after: int):
+    picks = []
+    for round_number in range(1, rounds + 1):
+        in_round = slot if round_number % 2 == 1 else n_teams - slot + 1
+        pick_no = (round_number - 1) * n_teams + in_round
+        if pick_no > after:
+            picks.append(pick_no)
+    return picks
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Benchmark batched vs per-pick expected best-available VORP."
+    )
+    parser.add_argument("--season", type=int, default=2026)
+    parser.add_argument("--teams", type=int, default=12)
+    parser.add_argument("--rounds", type=int, default=16)
+    parser.add_argument("--slot", type=int, default=1)
+    parser.add_argument("--every", type=int, default=6, help="Sample every N picks")
+    args = parser.parse_args()
+
+    projections = load_latest_preseason(args.season)
+    if projections is None:
+        print(f"No preseason projections found for season {args.season}")
+        return 1
+    board = DraftBoard(compute_value_scores(projections.copy()), n_teams=args.teams)
+    print(
+        f"Season {args.season}: {board.available_count():,} players, "
+        f"{args.teams} teams x {args.rounds} rounds, slot {args.slot}"
+    )
+
+    scalar_s = batched_s = 0.0
+    n_curves = 0
+    by_adp = board.available.sort_values("adp_rank")["player_id"].astype(str).tolist()
+    for pick in range(args.teams * args.rounds):
+        if pick % args.every == 0:
+            picks = _snake_picks(args.slot, args.teams, args.rounds, pick)
+            if not picks:
+                break
+            available = board.available
+
+            start = time.perf_counter()
+            scalar = {p: expected_best_vorp_at_pick(available, p) for p in picks}
+            scalar_s += time.perf_counter() - start
+
+            start = time.perf_counter()
+            batched = expected_best_vorp_at_picks(available, picks)
+            batched_s += time.perf_counter() - start
+
+            for p, per_pos in scalar.items():
+                if set(per_pos) != set(batched.columns) or any(
+                    batched.loc[p, pos] != v for pos, v in per_pos.items()
+                ):
+                    print(f"ERROR: curves differ at pick {pick + 1}, target {p}")
+                    return 1
+            n_curves += 1
+        board.draft_player(by_adp[pick], by_me=False)
+
+    print(f"Parity: identical curves ({n_curves} board states)")
+    print(f"  scalar  : {scalar_s:8.3f}s")
+    print(f"  batched : {batched_s:8.3f}s  ({scalar_s / max(batched_s, 1e-9):.1f}x)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
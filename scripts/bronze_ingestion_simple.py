@@ -23,6 +23,7 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
 
 from src.nfl_data_adapter import NFLDataAdapter, format_validation_output
 from src.config import DEFAULT_SEASON, validate_season_for_type, DATA_TYPE_SEASON_RANGES
+from src.partition_manifest import record_partition_write
 
 # ---------------------------------------------------------------------------
 # DATA_TYPE_REGISTRY — single source of truth for all Bronze data types.
@@ -176,6 +177,7 @@ def save_local(df: pd.DataFrame, local_path: str) -> str:
     """
     os.makedirs(os.path.dirname(local_path), exist_ok=True)
     df.to_parquet(local_path, index=False)
+    record_partition_write(local_path)
     print(f"  Saved locally: {local_path}")
     return local_path
 
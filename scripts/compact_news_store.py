@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Compact sentiment news JSON into the columnar news store.
+
+Folds new or changed Bronze sentiment documents, Silver signal files and
+LLM-enrichment sidecars into the append-only Parquet store the news service
+reads from (``data/silver/sentiment/news_store/``). Files not compacted yet
+are still served, parsed from JSON, so running this late never hides news --
+it only keeps API latency flat as the corpus grows.
+
+Usage
+-----
+  python scripts/compact_news_store.py
+  python scripts/compact_news_store.py --rewrite          # fold into one part
+  python scripts/compact_news_store.py --tables bronze signals
+  python scripts/compact_news_store.py --benchmark        # parity + timings
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import sys
+import time
+from pathlib import Path
+from typing import List, Optional
+
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(_PROJECT_ROOT))
+
+from src.sentiment.storage import news_store  # noqa: E402
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s [%(levelname)s] %(name)s -- %(message)s",
+    datefmt="%H:%M:%S",
+)
+logger = logging.getLogger("compact_news_store")
+
+
+def _benchmark(data_dir: Path, store_dir: Path) -> int:
+    """Check store reads against raw JSON parsing and time both."""
+    store = news_store.NewsStore(store_dir, data_dir)
+    for table in news_store.TABLES:
+        files = news_store._source_files(data_dir, table)
+        start = time.perf_counter()
+        expected = [
+            rec
+            for path in files
+            for rec in (news_store.read_json_records(table, path) or [])
+        ]
+        json_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        cold = store.load_records(table, files)
+        cold_s = time.perf_counter() - start
+        start = time.perf_counter()
+        store.load_records(table, files)
+        warm_s = time.perf_counter() - start
+
+        if cold != expected:
+            print(f"ERROR: {table} store records differ from the JSON files")
+            return 1
+        print(
+            f"{table:9s}: {len(files):4d} files, {len(expected):6d} records | "
+            f"json {json_s:6.3f}s  store cold {cold_s:6.3f}s  warm {warm_s:6.3f}s"
+        )
+    return 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Compact sentiment news JSON into the Parquet news store."
+    )
+    parser.add_argument(
+        "--data-dir",
+        type=Path,
+        default=_PROJECT_ROOT / "data",
+        help="Data dir holding bronze/sentiment and silver/sentiment.",
+    )
+    parser.add_argument(
+        "--tables",
+        nargs="+",
+        choices=news_store.TABLES,
+        default=list(news_store.TABLES),
+    )
+    parser.add_argument(
+        "--rewrite",
+        action="store_true",
+        help="Fold all existing parts and new files into a single part.",
+    )
+    parser.add_argument(
+        "--max-parts",
+        type=int,
+        default=30,
+        help="Fold a table automatically once it has this many parts.",
+    )
+    parser.add_argument(
+        "--benchmark",
+        action="store_true",
+        help="After compacting, verify store reads against JSON and time them.",
+    )
+    args = parser.parse_args(argv)
+
+    store_dir = news_store.default_store_dir(args.data_dir)
+    start = time.perf_counter()
+    compacted = news_store.compact_news_store(
+        data_dir=args.data_dir,
+        store_dir=store_dir,
+        tables=args.tables,
+        rewrite=args.rewrite,
+        max_parts=args.max_parts,
+    )
+    logger.info(
+        "Compacted %s in %.2fs",
+        ", ".join(f"{t}={n} files" for t, n in compacted.items()),
+        time.perf_counter() - start,
+    )
+    if args.benchmark:
+        return _benchmark(args.data_dir, store_dir)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""Prune superseded partition files and rebuild the layer manifests.
+
+Every re-ingest leaves the previous ``<variant>_YYYYMMDD_HHMMSS.parquet``
+next to the new one. This keeps the newest ``--keep`` files of every
+(dataset, season, week, variant) partition, deletes the rest and rebuilds
+``data/<layer>/_manifest.json`` from disk (see src/partition_manifest.py).
+Append-only datasets (odds snapshots, weather) are never pruned.
+
+Nothing is deleted without ``--apply``.
+
+Usage:
+    python scripts/compact_partitions.py                    # dry run, all layers
+    python scripts/compact_partitions.py --layers gold --apply
+    python scripts/compact_partitions.py --rebuild-only
+"""
+
+import argparse
+import logging
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from partition_manifest import LAYERS, manifest_for
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s %(levelname)s %(name)s: %(message)s",
+)
+logger = logging.getLogger(__name__)
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Prune superseded parquet files and rebuild partition manifests"
+    )
+    parser.add_argument("--layers", nargs="+", choices=LAYERS, default=list(LAYERS))
+    parser.add_argument(
+        "--keep", type=int, default=1, help="Files kept per partition (default 1)"
+    )
+    parser.add_argument(
+        "--apply", action="store_true", help="Delete files (default: dry run)"
+    )
+    parser.add_argument(
+        "--rebuild-only", action="store_true", help="Only rebuild the manifests"
+    )
+    parser.add_argument("--data-dir", default=DATA_DIR)
+    args = parser.parse_args()
+
+    for layer in args.layers:
+        layer_dir = os.path.join(args.data_dir, layer)
+        if not os.path.isdir(layer_dir):
+            logger.info("%s: no directory, skipping", layer)
+            continue
+        manifest = manifest_for(layer_dir)
+        if args.rebuild_only:
+            logger.info("%s: %d partitions indexed", layer, manifest.rebuild())
+            continue
+
+        stale = manifest.superseded(keep=args.keep)
+        freed = sum(os.path.getsize(p) for p in stale)
+        for path in stale:
+            logger.debug("  %s", os.path.relpath(path, layer_dir))
+        logger.info(
+            "%s: %s %d superseded files (%.1f MB)",
+            layer,
+            "deleting" if args.apply else "would delete",
+            len(stale),
+            freed / 1e6,
+        )
+        if args.apply:
+            manifest.compact(keep=args.keep, dry_run=False)
+            logger.info("%s: %d partitions indexed", layer, len(manifest))
+
+    if not args.apply and not args.rebuild_only:
+        logger.info("Dry run -- re-run with --apply to delete")
+
+
+if __name__ == "__main__":
+    main()
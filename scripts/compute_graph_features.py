@@ -7,18 +7,26 @@ OL/RB, TE, scheme, and injury cascade features per season. Outputs
 individual and combined Silver parquet files under
 data/silver/graph_features/season=YYYY/.
 
+Feature groups run as a dependency graph (src/feature_dag.py): each Bronze
+input is loaded once and shared by every group and season that needs it,
+independent groups run concurrently with --workers > 1, and groups whose
+Bronze inputs and code are unchanged since their last save (recorded in
+season=YYYY/_graph_manifest.json) are not recomputed unless --force.
+
 Usage:
     python scripts/compute_graph_features.py --seasons 2020 2021 2022 2023 2024 2025
+    python scripts/compute_graph_features.py --seasons 2024 2025 --workers 4
 """
 
 import argparse
 import datetime
 import glob
+import json
 import logging
 import os
 import sys
 import time
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
 
 import numpy as np
 import pandas as pd
@@ -48,7 +56,8 @@ from graph_qb_wr_chemistry import (
 from graph_participation import (
     identify_cbs_on_field,
     identify_ol_on_field,
-    parse_participation_players,
+    lineups_to_players,
+    load_lineup_table,
 )
 from graph_game_script import (
     GAME_SCRIPT_FEATURE_COLUMNS,
@@ -72,7 +81,14 @@ from graph_te_matchup import (
     compute_te_def_trailing_features,
 )
 from graph_familiarity import build_familiarity_data
-from graph_vacated_opportunity import build_vacated_opportunity_data
+from graph_vacated_opportunity import (
+    build_vacated_opportunity_from_frames,
+    prepare_transition_roster,
+)
+from config import GRAPH_FEATURE_TASK_MB, GRAPH_FEATURE_WORKERS
+from feature_dag import DagTask, dag_fingerprints, file_fingerprint, run_dag
+from partition_manifest import record_partition_write
+from partition_reader import read_partition, resolve_partition
 
 logging.basicConfig(
     level=logging.INFO,
@@ -91,6 +107,11 @@ GRAPH_FEATURES_DIR = os.path.join(SILVER_DIR, "graph_features")
 # ---------------------------------------------------------------------------
 
 
+def _bronze_files(subdir: str, season: int) -> List[str]:
+    """Files :func:`_load_bronze` reads: the latest flat file, else every week."""
+    return resolve_partition(BRONZE_DIR, subdir, season, weeks="fallback")
+
+
 def _load_bronze(subdir: str, season: int) -> pd.DataFrame:
     """Load latest Bronze parquet for a subdirectory and season.
 
@@ -101,18 +122,7 @@ def _load_bronze(subdir: str, season: int) -> pd.DataFrame:
     Returns:
         DataFrame or empty DataFrame if not found.
     """
-    pattern = os.path.join(BRONZE_DIR, subdir, f"season={season}", "*.parquet")
-    files = sorted(glob.glob(pattern))
-    if not files:
-        # Try week-partitioned layout
-        pattern_w = os.path.join(
-            BRONZE_DIR, subdir, f"season={season}", "week=*", "*.parquet"
-        )
-        files_w = sorted(glob.glob(pattern_w))
-        if files_w:
-            return pd.concat([pd.read_parquet(f) for f in files_w], ignore_index=True)
-        return pd.DataFrame()
-    return pd.read_parquet(files[-1])
+    return read_partition(BRONZE_DIR, subdir, season, weeks="fallback")
 
 
 def _load_multi_season(subdir: str, seasons: List[int]) -> pd.DataFrame:
@@ -125,350 +135,566 @@ def _load_multi_season(subdir: str, seasons: List[int]) -> pd.DataFrame:
     Returns:
         Concatenated DataFrame.
     """
+    return _concat_seasons([_load_bronze(subdir, s) for s in seasons], seasons)
+
+
+# ---------------------------------------------------------------------------
+# Feature graph
+# ---------------------------------------------------------------------------
+#
+# Each feature group is a DAG task whose inputs are Bronze loader tasks (one
+# per subdir/season, shared by every group and season that reads it) or
+# derived intermediates (parsed participation, QB-WR pair stats). Tasks are
+# module-level functions so the process pool can pickle them by reference.
+
+# Saved feature groups in output order, with their Silver file prefix.
+GROUP_FILE_PREFIXES: Dict[str, str] = {
+    "wr_matchup": "graph_wr_matchup",
+    "ol_rb": "graph_ol_rb",
+    "te": "graph_te_matchup",
+    "scheme": "graph_scheme",
+    "injury_cascade": "graph_injury_cascade",
+    "qb_wr_chemistry": "graph_qb_wr_chemistry",
+    "familiarity": "graph_familiarity",
+    "red_zone": "graph_red_zone",
+    "game_script": "graph_game_script",
+    "rb_matchup": "graph_rb_matchup",
+    "wr_advanced": "graph_wr_advanced",
+    "te_advanced": "graph_te_advanced",
+    "route_participation": "graph_route_participation",
+    "wr_def_trailing": "graph_wr_def_trailing",
+    "te_def_trailing": "graph_te_def_trailing",
+    # Season-level (no week col) — excluded from the combined
+    # player-week file by the join_cols check in save_features.
+    "vacated_opportunity": "graph_vacated_opportunity",
+}
+
+MANIFEST_NAME = "_graph_manifest.json"
+
+
+def _concat_seasons(frames: List[pd.DataFrame], seasons: List[int]) -> pd.DataFrame:
+    """Concatenate per-season Bronze frames like :func:`_load_multi_season`.
+
+    Inputs are never modified (a frame may be shared with other tasks).
+    """
     dfs = []
-    for s in seasons:
-        df = _load_bronze(subdir, s)
+    for df, s in zip(frames, seasons):
         if not df.empty:
             if "season" not in df.columns:
-                df["season"] = s
+                df = df.assign(season=s)
             dfs.append(df)
     return pd.concat(dfs, ignore_index=True) if dfs else pd.DataFrame()
 
 
-# ---------------------------------------------------------------------------
-# Per-season feature computation
-# ---------------------------------------------------------------------------
+def _target_weeks(player_weekly_df: pd.DataFrame) -> List[int]:
+    """Weeks >= 2 present in the season's player_weekly (features are lagged)."""
+    if player_weekly_df.empty:
+        return []
+    weeks = [int(w) for w in sorted(player_weekly_df["week"].dropna().unique())]
+    return [w for w in weeks if w >= 2]
 
 
-def compute_season_features(
-    season: int,
-    all_seasons: List[int],
-) -> Dict[str, pd.DataFrame]:
-    """Compute all graph features for a single season.
+def _or_none(df: pd.DataFrame) -> Optional[pd.DataFrame]:
+    return df if not df.empty else None
 
-    Returns a dict mapping feature group name to its DataFrame:
-        'wr_matchup', 'ol_rb', 'te', 'scheme', 'injury_cascade'.
 
-    Args:
-        season: Target season.
-        all_seasons: All seasons being processed (for historical context).
+def _task_load_bronze(subdir: str, season: int) -> pd.DataFrame:
+    return _load_bronze(subdir, season)
+
+
+def _task_load_file(path: Optional[str]) -> pd.DataFrame:
+    return pd.read_parquet(path) if path else pd.DataFrame()
 
-    Returns:
-        Dict of feature DataFrames.
-    """
-    logger.info("=" * 60)
-    logger.info("Computing graph features for season %d", season)
-    logger.info("=" * 60)
-
-    # Load data for this season
-    participation_df = _load_bronze("pbp_participation", season)
-    pbp_df = _load_bronze("pbp", season)
-    rosters_df = _load_bronze("players/rosters", season)
-    depth_charts_df = _load_bronze("depth_charts", season)
-    injuries_df = _load_bronze("players/injuries", season)
-    player_weekly_df = _load_bronze("players/weekly", season)
-    pfr_def_df = _load_bronze("pfr/weekly/def", season)
-    schedules_df = _load_bronze("schedules", season)
 
+def _task_parse_participation(rosters_df: pd.DataFrame, season: int) -> pd.DataFrame:
+    # The per-play lineup table is parsed once per season and persisted next
+    # to Bronze; later runs (and other consumers) memory-map it.
+    lineups = load_lineup_table(season, bronze_dir=BRONZE_DIR)
+    if lineups is None or lineups.num_rows == 0 or rosters_df.empty:
+        return pd.DataFrame()
+    parsed = lineups_to_players(lineups, rosters_df)
     logger.info(
-        "Loaded data — participation: %d, pbp: %d, rosters: %d, "
-        "depth_charts: %d, injuries: %d, weekly: %d, pfr_def: %d, schedules: %d",
-        len(participation_df),
-        len(pbp_df),
-        len(rosters_df),
-        len(depth_charts_df),
-        len(injuries_df),
-        len(player_weekly_df),
-        len(pfr_def_df),
-        len(schedules_df),
+        "Parsed %d participation rows (%d unique players)",
+        len(parsed),
+        parsed["player_gsis_id"].nunique() if not parsed.empty else 0,
     )
+    return parsed
 
-    results: Dict[str, pd.DataFrame] = {}
 
-    # --- Parse participation data ---
-    parsed_participation = pd.DataFrame()
-    if not participation_df.empty and not rosters_df.empty:
-        logger.info("Parsing participation data...")
-        parsed_participation = parse_participation_players(participation_df, rosters_df)
-        logger.info(
-            "Parsed %d participation rows (%d unique players)",
-            len(parsed_participation),
-            (
-                parsed_participation["player_gsis_id"].nunique()
-                if not parsed_participation.empty
-                else 0
-            ),
-        )
+def _task_pair_stats(pbp_frames: List[pd.DataFrame], prior: List[int]) -> pd.DataFrame:
+    pbp_multi = _concat_seasons(pbp_frames, prior)
+    return build_qb_wr_chemistry(pbp_multi) if not pbp_multi.empty else pd.DataFrame()
 
-    # --- 1. WR matchup features ---
-    logger.info("Computing WR matchup features...")
-    # Need PBP data from prior seasons too for historical EPA
-    prior_seasons = [s for s in all_seasons if s <= season]
-    pbp_multi = _load_multi_season("pbp", prior_seasons)
-    pw_multi = _load_multi_season("players/weekly", prior_seasons)
 
+def _group_wr_matchup(
+    pbp_frames: List[pd.DataFrame],
+    pw_frames: List[pd.DataFrame],
+    player_weekly_df: pd.DataFrame,
+    season: int,
+    prior: List[int],
+) -> pd.DataFrame:
+    pbp_multi = _concat_seasons(pbp_frames, prior)
+    pw_multi = _concat_seasons(pw_frames, prior)
     wr_dfs = []
     if not pbp_multi.empty and not pw_multi.empty:
-        weeks = (
-            sorted(player_weekly_df["week"].dropna().unique())
-            if not player_weekly_df.empty
-            else []
-        )
-        for week in weeks:
-            week_int = int(week)
-            if week_int < 2:
-                continue
-            wr_feat = compute_wr_matchup_features(pbp_multi, pw_multi, season, week_int)
+        for week in _target_weeks(player_weekly_df):
+            wr_feat = compute_wr_matchup_features(pbp_multi, pw_multi, season, week)
             if not wr_feat.empty:
                 wr_dfs.append(wr_feat)
+    return pd.concat(wr_dfs, ignore_index=True) if wr_dfs else pd.DataFrame()
 
-    results["wr_matchup"] = (
-        pd.concat(wr_dfs, ignore_index=True) if wr_dfs else pd.DataFrame()
-    )
-    logger.info("WR matchup: %d rows", len(results["wr_matchup"]))
 
-    # --- 2. OL/RB features ---
-    logger.info("Computing OL/RB features...")
+def _group_ol_rb(
+    pbp_df: pd.DataFrame,
+    parsed_participation: pd.DataFrame,
+    player_weekly_df: pd.DataFrame,
+    season: int,
+) -> pd.DataFrame:
     ol_dfs = []
-    if (
-        not pbp_df.empty
-        and not parsed_participation.empty
-        and not player_weekly_df.empty
-    ):
-        weeks = sorted(player_weekly_df["week"].dropna().unique())
-        for week in weeks:
-            week_int = int(week)
-            if week_int < 2:
-                continue
+    if not pbp_df.empty and not parsed_participation.empty:
+        for week in _target_weeks(player_weekly_df):
             ol_feat = compute_ol_rb_features(
-                pbp_df, parsed_participation, player_weekly_df, season, week_int
+                pbp_df, parsed_participation, player_weekly_df, season, week
             )
             if not ol_feat.empty:
                 ol_dfs.append(ol_feat)
+    return pd.concat(ol_dfs, ignore_index=True) if ol_dfs else pd.DataFrame()
+
 
-    results["ol_rb"] = (
-        pd.concat(ol_dfs, ignore_index=True) if ol_dfs else pd.DataFrame()
+def _group_te(
+    pw_frames: List[pd.DataFrame],
+    rosters_df: pd.DataFrame,
+    parsed_participation: pd.DataFrame,
+    season: int,
+    prior: List[int],
+) -> pd.DataFrame:
+    pw_multi = _concat_seasons(pw_frames, prior)
+    if pw_multi.empty or rosters_df.empty:
+        return pd.DataFrame()
+    return compute_te_features(
+        pw_multi,
+        rosters_df,
+        participation_df=_or_none(parsed_participation),
+        season=season,
     )
-    logger.info("OL/RB: %d rows", len(results["ol_rb"]))
-
-    # --- 3. TE features ---
-    logger.info("Computing TE features...")
-    te_df = pd.DataFrame()
-    if not pw_multi.empty and not rosters_df.empty:
-        te_df = compute_te_features(
-            pw_multi,
-            rosters_df,
-            participation_df=(
-                parsed_participation if not parsed_participation.empty else None
-            ),
-            season=season,
+
+
+def _group_scheme(
+    pbp_df: pd.DataFrame,
+    pfr_def_df: pd.DataFrame,
+    rosters_df: pd.DataFrame,
+    schedules_df: pd.DataFrame,
+) -> pd.DataFrame:
+    if pbp_df.empty:
+        return pd.DataFrame()
+    return compute_scheme_features(pbp_df, pfr_def_df, rosters_df, schedules_df)
+
+
+def _group_injury_cascade(
+    injuries_df: pd.DataFrame,
+    player_weekly_df: pd.DataFrame,
+    prior_injuries: List[pd.DataFrame],
+    prior_weekly: List[pd.DataFrame],
+    season: int,
+) -> pd.DataFrame:
+    if injuries_df.empty or player_weekly_df.empty:
+        return pd.DataFrame()
+    # Prior seasons supply historical absorption.
+    combined_injuries = pd.concat(
+        [injuries_df] + [df for df in prior_injuries if not df.empty],
+        ignore_index=True,
+    )
+    combined_pw = pd.concat(
+        [player_weekly_df] + [df for df in prior_weekly if not df.empty],
+        ignore_index=True,
+    )
+    injury_dfs = []
+    for week in _target_weeks(player_weekly_df):
+        cascade = compute_graph_features_from_data(
+            combined_injuries, combined_pw, season, week
         )
-    results["te"] = te_df
-    logger.info("TE: %d rows", len(results["te"]))
-
-    # --- 4. Scheme features ---
-    logger.info("Computing scheme features...")
-    scheme_df = pd.DataFrame()
-    if not pbp_df.empty:
-        scheme_df = compute_scheme_features(
-            pbp_df, pfr_def_df, rosters_df, schedules_df
+        if not cascade.empty:
+            injury_dfs.append(cascade)
+    return pd.concat(injury_dfs, ignore_index=True) if injury_dfs else pd.DataFrame()
+
+
+def _group_qb_wr_chemistry(
+    pair_stats: pd.DataFrame,
+    pw_frames: List[pd.DataFrame],
+    season: int,
+    prior: List[int],
+) -> pd.DataFrame:
+    pw_multi = _concat_seasons(pw_frames, prior)
+    if pair_stats.empty or pw_multi.empty:
+        return pd.DataFrame()
+    chem_df = compute_chemistry_features(pair_stats, pw_multi)
+    if not chem_df.empty and "season" in chem_df.columns:
+        chem_df = chem_df[chem_df["season"] == season].copy()
+    return chem_df
+
+
+def _group_familiarity(
+    pair_stats: pd.DataFrame,
+    pw_frames: List[pd.DataFrame],
+    rosters_df: pd.DataFrame,
+    season: int,
+    prior: List[int],
+) -> pd.DataFrame:
+    # Cross-team familiarity (UC2) reuses the multi-season pair stats:
+    # cold-start QB flags, cross-team reunion histories, offense continuity.
+    pw_multi = _concat_seasons(pw_frames, prior)
+    if pair_stats.empty or pw_multi.empty:
+        return pd.DataFrame()
+    return build_familiarity_data(season, pair_stats, pw_multi, rosters_df=rosters_df)
+
+
+def _group_red_zone(
+    pbp_frames: List[pd.DataFrame],
+    rosters_df: pd.DataFrame,
+    pw_frames: List[pd.DataFrame],
+    season: int,
+    prior: List[int],
+) -> pd.DataFrame:
+    pbp_multi = _concat_seasons(pbp_frames, prior)
+    if pbp_multi.empty:
+        return pd.DataFrame()
+    rz_df = pd.DataFrame()
+    rz_usage = compute_red_zone_usage(pbp_multi, rosters_df)
+    if not rz_usage.empty:
+        rz_df = compute_red_zone_features(rz_usage, _concat_seasons(pw_frames, prior))
+        if not rz_df.empty and "season" in rz_df.columns:
+            rz_df = rz_df[rz_df["season"] == season].copy()
+    return rz_df
+
+
+def _group_game_script(
+    pbp_df: pd.DataFrame, schedules_df: pd.DataFrame
+) -> pd.DataFrame:
+    if pbp_df.empty:
+        return pd.DataFrame()
+    usage_df = compute_game_script_usage(pbp_df)
+    if usage_df.empty:
+        return pd.DataFrame()
+    return compute_game_script_features(usage_df, schedules_df)
+
+
+def _group_rb_matchup(
+    pbp_frames: List[pd.DataFrame],
+    rosters_df: pd.DataFrame,
+    parsed_participation: pd.DataFrame,
+    season: int,
+    prior: List[int],
+) -> pd.DataFrame:
+    pbp_multi = _concat_seasons(pbp_frames, prior)
+    if pbp_multi.empty:
+        return pd.DataFrame()
+    return compute_rb_matchup_features_from_data(
+        pbp_df=pbp_multi,
+        rosters_df=_or_none(rosters_df),
+        season=season,
+        participation_parsed_df=_or_none(parsed_participation),
+    )
+
+
+def _season_player_rows(df: pd.DataFrame, season: int) -> pd.DataFrame:
+    """Filter to the target season and key receivers as ``player_id``."""
+    if not df.empty and "season" in df.columns:
+        df = df[df["season"] == season].copy()
+    if not df.empty and "receiver_player_id" in df.columns:
+        df = df.rename(columns={"receiver_player_id": "player_id"})
+    return df
+
+
+def _group_wr_advanced(
+    pbp_frames: List[pd.DataFrame],
+    parsed_participation: pd.DataFrame,
+    season: int,
+    prior: List[int],
+) -> pd.DataFrame:
+    pbp_multi = _concat_seasons(pbp_frames, prior)
+    if pbp_multi.empty:
+        return pd.DataFrame()
+    wr_advanced_df = build_wr_advanced_matchup_features(
+        pbp_df=pbp_multi,
+        participation_parsed_df=parsed_participation,
+    )
+    return _season_player_rows(wr_advanced_df, season)
+
+
+def _group_te_advanced(
+    pbp_frames: List[pd.DataFrame],
+    parsed_participation: pd.DataFrame,
+    rosters_df: pd.DataFrame,
+    season: int,
+    prior: List[int],
+) -> pd.DataFrame:
+    pbp_multi = _concat_seasons(pbp_frames, prior)
+    if pbp_multi.empty or rosters_df.empty:
+        return pd.DataFrame()
+    te_advanced_df = build_te_advanced_matchup_features(
+        pbp_df=pbp_multi,
+        participation_parsed_df=parsed_participation,
+        rosters_df=rosters_df,
+    )
+    return _season_player_rows(te_advanced_df, season)
+
+
+def _group_route_participation(
+    pbp_df: pd.DataFrame,
+    participation_df: pd.DataFrame,
+    parsed_participation: pd.DataFrame,
+) -> pd.DataFrame:
+    return compute_route_participation(
+        pbp_df, participation_df, participation_parsed_df=parsed_participation
+    )
+
+
+def _group_def_trailing(
+    pbp_frames: List[pd.DataFrame],
+    pw_frames: List[pd.DataFrame],
+    rosters_df: pd.DataFrame,
+    parsed_participation: pd.DataFrame,
+    season: int,
+    prior: List[int],
+    position: str,
+) -> pd.DataFrame:
+    # Strictly-lagged defense-unit features (ELITE-2.3). cb_count_per_play is
+    # NaN before 2020 (no pbp_participation); the yardage allowances use only
+    # PBP and are available back to 2016.
+    pbp_multi = _concat_seasons(pbp_frames, prior)
+    pw_multi = _concat_seasons(pw_frames, prior)
+    if pbp_multi.empty or pw_multi.empty:
+        return pd.DataFrame()
+    compute = (
+        compute_wr_def_trailing_features
+        if position == "WR"
+        else compute_te_def_trailing_features
+    )
+    return compute(
+        pbp_df=pbp_multi,
+        player_weekly_df=pw_multi,
+        rosters_df=_or_none(rosters_df),
+        participation_parsed_df=_or_none(parsed_participation),
+        season=season,
+    )
+
+
+def _group_vacated_opportunity(
+    prior_weekly_df: pd.DataFrame,
+    rosters_df: pd.DataFrame,
+    depth_charts_df: pd.DataFrame,
+    draft_picks_df: pd.DataFrame,
+    saved_red_zone_df: pd.DataFrame,
+    *fresh_red_zone: pd.DataFrame,
+    season: int,
+) -> pd.DataFrame:
+    # Season-level offseason churn (UC1): season-1 usage + current rosters.
+    # The season-1 red-zone features come from this run when it computed
+    # (and therefore saved) them, else from the latest Silver file.
+    rz_df = saved_red_zone_df
+    if fresh_red_zone and not fresh_red_zone[0].empty:
+        rz_df = fresh_red_zone[0]
+    return build_vacated_opportunity_from_frames(
+        season,
+        prior_weekly_df,
+        prepare_transition_roster(rosters_df),
+        depth_charts_df=depth_charts_df,
+        draft_picks_df=draft_picks_df,
+        rz_features_df=rz_df,
+    )
+
+
+def _latest_silver(season: int, prefix: str) -> Optional[str]:
+    files = sorted(
+        glob.glob(
+            os.path.join(GRAPH_FEATURES_DIR, f"season={season}", f"{prefix}_*.parquet")
         )
-    results["scheme"] = scheme_df
-    logger.info("Scheme: %d rows", len(results["scheme"]))
+    )
+    return files[-1] if files else None
 
-    # --- 5. Injury cascade features ---
-    logger.info("Computing injury cascade features...")
-    injury_dfs = []
-    if not injuries_df.empty and not player_weekly_df.empty:
-        # Load prior seasons for historical absorption
-        all_injuries = [injuries_df]
-        all_pw = [player_weekly_df]
-        for prior_s in range(max(season - 3, min(all_seasons)), season):
-            pi = _load_bronze("players/injuries", prior_s)
-            pp = _load_bronze("players/weekly", prior_s)
-            if not pi.empty:
-                all_injuries.append(pi)
-            if not pp.empty:
-                all_pw.append(pp)
-
-        combined_injuries = pd.concat(all_injuries, ignore_index=True)
-        combined_pw = pd.concat(all_pw, ignore_index=True)
-
-        weeks = sorted(player_weekly_df["week"].dropna().unique())
-        for week in weeks:
-            week_int = int(week)
-            if week_int < 2:
-                continue
-            cascade = compute_graph_features_from_data(
-                combined_injuries, combined_pw, season, week_int
+
+def build_feature_tasks(seasons: List[int]) -> List[DagTask]:
+    """Declare every feature group of every season as a DAG task.
+
+    Bronze loader tasks are keyed ``bronze:<subdir>:<season>`` and shared by
+    all consumers; feature groups are keyed ``<group>@<season>``. Loader
+    fingerprints hash the Bronze files they read, so a group's fingerprint
+    changes exactly when its inputs or code do.
+
+    Args:
+        seasons: Seasons to compute (sorted); also bound the historical
+            context each season sees, as in the serial implementation.
+
+    Returns:
+        Task list in dependency order.
+    """
+    tasks: Dict[str, DagTask] = {}
+
+    def bronze(subdir: str, season: int) -> str:
+        key = f"bronze:{subdir}:{season}"
+        if key not in tasks:
+            tasks[key] = DagTask(
+                key,
+                _task_load_bronze,
+                kwargs={"subdir": subdir, "season": season},
+                salt=file_fingerprint(_bronze_files(subdir, season)),
             )
-            if not cascade.empty:
-                injury_dfs.append(cascade)
+        return key
 
-    results["injury_cascade"] = (
-        pd.concat(injury_dfs, ignore_index=True) if injury_dfs else pd.DataFrame()
-    )
-    logger.info("Injury cascade: %d rows", len(results["injury_cascade"]))
+    def add(key: str, func, inputs, **kwargs) -> str:
+        tasks[key] = DagTask(key, func, inputs=tuple(inputs), kwargs=kwargs)
+        return key
 
-    # --- 6. QB-WR chemistry features ---
-    logger.info("Computing QB-WR chemistry features...")
-    chem_df = pd.DataFrame()
-    pair_stats = pd.DataFrame()
-    if not pbp_multi.empty and not pw_multi.empty:
-        pair_stats = build_qb_wr_chemistry(pbp_multi)
-        if not pair_stats.empty:
-            chem_df = compute_chemistry_features(pair_stats, pw_multi)
-            # Filter to target season
-            if not chem_df.empty and "season" in chem_df.columns:
-                chem_df = chem_df[chem_df["season"] == season].copy()
-    results["qb_wr_chemistry"] = chem_df
-    logger.info("QB-WR chemistry: %d rows", len(results["qb_wr_chemistry"]))
-
-    # --- 6b. Cross-team familiarity features (UC2) ---
-    # Reuses the multi-season pair stats: cold-start QB flags, cross-team
-    # reunion histories, offense continuity. Strictly lagged QB assignment.
-    logger.info("Computing familiarity features (UC2)...")
-    fam_df = pd.DataFrame()
-    if not pair_stats.empty and not pw_multi.empty:
-        fam_df = build_familiarity_data(season, pair_stats, pw_multi)
-    results["familiarity"] = fam_df
-    logger.info("Familiarity: %d rows", len(results["familiarity"]))
-
-    # --- 7. Red zone target network features ---
-    logger.info("Computing red zone target network features...")
-    rz_df = pd.DataFrame()
-    if not pbp_multi.empty:
-        rosters_for_rz = rosters_df if not rosters_df.empty else pd.DataFrame()
-        rz_usage = compute_red_zone_usage(pbp_multi, rosters_for_rz)
-        if not rz_usage.empty:
-            rz_df = compute_red_zone_features(rz_usage, pw_multi)
-            # Filter to target season
-            if not rz_df.empty and "season" in rz_df.columns:
-                rz_df = rz_df[rz_df["season"] == season].copy()
-    results["red_zone"] = rz_df
-    logger.info("Red zone: %d rows", len(results["red_zone"]))
-
-    # --- 8. Game script role shift features ---
-    logger.info("Computing game script features...")
-    gs_df = pd.DataFrame()
-    if not pbp_df.empty:
-        usage_df = compute_game_script_usage(pbp_df)
-        if not usage_df.empty:
-            gs_df = compute_game_script_features(usage_df, schedules_df)
-    results["game_script"] = gs_df
-    logger.info("Game script: %d rows", len(results["game_script"]))
-
-    # --- 9. RB matchup features (new module) ---
-    logger.info("Computing RB matchup features...")
-    rb_matchup_df = pd.DataFrame()
-    if not pbp_multi.empty:
-        rb_matchup_df = compute_rb_matchup_features_from_data(
-            pbp_df=pbp_multi,
-            rosters_df=rosters_df if not rosters_df.empty else None,
+    for season in seasons:
+        prior = [s for s in seasons if s <= season]
+        pbp_multi = tuple(bronze("pbp", s) for s in prior)
+        pw_multi = tuple(bronze("players/weekly", s) for s in prior)
+        pbp = bronze("pbp", season)
+        participation = bronze("pbp_participation", season)
+        rosters = bronze("players/rosters", season)
+        weekly = bronze("players/weekly", season)
+        schedules = bronze("schedules", season)
+        multi = {"season": season, "prior": prior}
+
+        tasks[f"parsed_participation@{season}"] = DagTask(
+            f"parsed_participation@{season}",
+            _task_parse_participation,
+            inputs=(rosters,),
+            kwargs={"season": season},
+            salt=file_fingerprint(_bronze_files("pbp_participation", season)),
+        )
+        parsed = f"parsed_participation@{season}"
+        pair_stats = add(
+            f"pair_stats@{season}", _task_pair_stats, [pbp_multi], prior=prior
+        )
+        add(
+            f"wr_matchup@{season}",
+            _group_wr_matchup,
+            [pbp_multi, pw_multi, weekly],
+            **multi,
+        )
+        add(
+            f"ol_rb@{season}",
+            _group_ol_rb,
+            [pbp, parsed, weekly],
+            season=season,
+        )
+        add(f"te@{season}", _group_te, [pw_multi, rosters, parsed], **multi)
+        add(
+            f"scheme@{season}",
+            _group_scheme,
+            [pbp, bronze("pfr/weekly/def", season), rosters, schedules],
+        )
+        history = range(max(season - 3, min(seasons)), season)
+        add(
+            f"injury_cascade@{season}",
+            _group_injury_cascade,
+            [
+                bronze("players/injuries", season),
+                weekly,
+                tuple(bronze("players/injuries", s) for s in history),
+                tuple(bronze("players/weekly", s) for s in history),
+            ],
             season=season,
-            participation_parsed_df=(
-                parsed_participation if not parsed_participation.empty else None
-            ),
         )
-    results["rb_matchup"] = rb_matchup_df
-    logger.info("RB matchup: %d rows", len(results["rb_matchup"]))
-
-    # --- 10. Advanced WR matchup features (enhanced module) ---
-    logger.info("Computing advanced WR matchup features...")
-    wr_advanced_df = pd.DataFrame()
-    if not pbp_multi.empty:
-        participation_for_wr = (
-            parsed_participation if not parsed_participation.empty else pd.DataFrame()
+        add(
+            f"qb_wr_chemistry@{season}",
+            _group_qb_wr_chemistry,
+            [pair_stats, pw_multi],
+            **multi,
         )
-        wr_advanced_df = build_wr_advanced_matchup_features(
-            pbp_df=pbp_multi,
-            participation_parsed_df=participation_for_wr,
+        add(
+            f"familiarity@{season}",
+            _group_familiarity,
+            [pair_stats, pw_multi, rosters],
+            **multi,
         )
-        # Filter to target season only
-        if not wr_advanced_df.empty and "season" in wr_advanced_df.columns:
-            wr_advanced_df = wr_advanced_df[wr_advanced_df["season"] == season].copy()
-        # Rename receiver_player_id -> player_id for consistent join keys
-        if not wr_advanced_df.empty and "receiver_player_id" in wr_advanced_df.columns:
-            wr_advanced_df = wr_advanced_df.rename(
-                columns={"receiver_player_id": "player_id"}
-            )
-    results["wr_advanced"] = wr_advanced_df
-    logger.info("WR advanced matchup: %d rows", len(results["wr_advanced"]))
-
-    # --- 11. Advanced TE matchup features (enhanced module) ---
-    logger.info("Computing advanced TE matchup features...")
-    te_advanced_df = pd.DataFrame()
-    if not pbp_multi.empty and not rosters_df.empty:
-        participation_for_te = (
-            parsed_participation if not parsed_participation.empty else pd.DataFrame()
+        add(
+            f"red_zone@{season}",
+            _group_red_zone,
+            [pbp_multi, rosters, pw_multi],
+            **multi,
+        )
+        add(f"game_script@{season}", _group_game_script, [pbp, schedules])
+        add(
+            f"rb_matchup@{season}",
+            _group_rb_matchup,
+            [pbp_multi, rosters, parsed],
+            **multi,
+        )
+        add(
+            f"wr_advanced@{season}",
+            _group_wr_advanced,
+            [pbp_multi, parsed],
+            **multi,
+        )
+        add(
+            f"te_advanced@{season}",
+            _group_te_advanced,
+            [pbp_multi, parsed, rosters],
+            **multi,
         )
-        te_advanced_df = build_te_advanced_matchup_features(
-            pbp_df=pbp_multi,
-            participation_parsed_df=participation_for_te,
-            rosters_df=rosters_df,
+        add(
+            f"route_participation@{season}",
+            _group_route_participation,
+            [pbp, participation, parsed],
         )
-        # Filter to target season only
-        if not te_advanced_df.empty and "season" in te_advanced_df.columns:
-            te_advanced_df = te_advanced_df[te_advanced_df["season"] == season].copy()
-        # Rename receiver_player_id -> player_id for consistent join keys
-        if not te_advanced_df.empty and "receiver_player_id" in te_advanced_df.columns:
-            te_advanced_df = te_advanced_df.rename(
-                columns={"receiver_player_id": "player_id"}
+        for position in ("WR", "TE"):
+            add(
+                f"{position.lower()}_def_trailing@{season}",
+                _group_def_trailing,
+                [pbp_multi, pw_multi, rosters, parsed],
+                position=position,
+                **multi,
             )
-    results["te_advanced"] = te_advanced_df
-    logger.info("TE advanced matchup: %d rows", len(results["te_advanced"]))
 
-    # --- 12. Route participation features (plan 2.2) ---
-    logger.info("Computing route participation features...")
-    results["route_participation"] = compute_route_participation(
-        pbp_df, participation_df
-    )
-    logger.info("Route participation: %d rows", len(results["route_participation"]))
-
-    # --- 13. WR defense-side trailing allowance features (ELITE-2.3) ---
-    # These are strictly-lagged defense-unit features; NaN for seasons < 2020
-    # (pbp_participation absent) for the cb_count_per_play feature; the yardage
-    # allowance features use only PBP and are available back to 2016.
-    logger.info("Computing WR def trailing features (ELITE-2.3)...")
-    wr_def_trail_df = pd.DataFrame()
-    if not pbp_multi.empty and not pw_multi.empty:
-        wr_def_trail_df = compute_wr_def_trailing_features(
-            pbp_df=pbp_multi,
-            player_weekly_df=pw_multi,
-            rosters_df=rosters_df if not rosters_df.empty else None,
-            participation_parsed_df=(
-                parsed_participation if not parsed_participation.empty else None
-            ),
-            season=season,
+        saved_rz = _latest_silver(season - 1, GROUP_FILE_PREFIXES["red_zone"])
+        saved_rz_key = f"saved_red_zone@{season - 1}"
+        tasks[saved_rz_key] = DagTask(
+            saved_rz_key,
+            _task_load_file,
+            kwargs={"path": saved_rz},
+            salt=file_fingerprint([saved_rz] if saved_rz else []),
         )
-    results["wr_def_trailing"] = wr_def_trail_df
-    logger.info("WR def trailing: %d rows", len(results["wr_def_trailing"]))
-
-    # --- 14. TE defense-side trailing allowance features (ELITE-2.3) ---
-    logger.info("Computing TE def trailing features (ELITE-2.3)...")
-    te_def_trail_df = pd.DataFrame()
-    if not pbp_multi.empty and not pw_multi.empty:
-        te_def_trail_df = compute_te_def_trailing_features(
-            pbp_df=pbp_multi,
-            player_weekly_df=pw_multi,
-            rosters_df=rosters_df if not rosters_df.empty else None,
-            participation_parsed_df=(
-                parsed_participation if not parsed_participation.empty else None
-            ),
+        vacated_inputs = [
+            bronze("players/weekly", season - 1),
+            rosters,
+            bronze("depth_charts", season),
+            bronze("draft_picks", season),
+            saved_rz_key,
+        ]
+        if season - 1 in seasons:
+            vacated_inputs.append(f"red_zone@{season - 1}")
+        add(
+            f"vacated_opportunity@{season}",
+            _group_vacated_opportunity,
+            vacated_inputs,
             season=season,
         )
-    results["te_def_trailing"] = te_def_trail_df
-    logger.info("TE def trailing: %d rows", len(results["te_def_trailing"]))
 
-    # --- 15. Vacated opportunity features (UC1) ---
-    # Season-level (no week column): offseason roster churn — vacated
-    # target/carry share from departures, distributed across the current
-    # depth chart. Uses season-1 usage + current-season rosters only.
-    logger.info("Computing vacated opportunity features (UC1)...")
-    results["vacated_opportunity"] = build_vacated_opportunity_data(season)
-    logger.info("Vacated opportunity: %d rows", len(results["vacated_opportunity"]))
+    return list(tasks.values())
+
+
+def compute_season_features(
+    season: int,
+    all_seasons: List[int],
+) -> Dict[str, pd.DataFrame]:
+    """Compute all graph features for a single season.
+
+    Runs the season's feature groups from :func:`build_feature_tasks`
+    serially in this process (``main`` runs all seasons through one DAG).
+
+    Args:
+        season: Target season.
+        all_seasons: All seasons being processed (for historical context).
 
-    return results
+    Returns:
+        Dict of feature group name to DataFrame.
+    """
+    tasks = build_feature_tasks(sorted(all_seasons))
+    targets = [f"{group}@{season}" for group in GROUP_FILE_PREFIXES]
+    frames = run_dag(tasks, targets=targets)
+    return {group: frames[f"{group}@{season}"] for group in GROUP_FILE_PREFIXES}
 
 
 # ---------------------------------------------------------------------------
@@ -479,6 +705,8 @@ def compute_season_features(
 def save_features(
     results: Dict[str, pd.DataFrame],
     season: int,
+    groups: Optional[Iterable[str]] = None,
+    ts: Optional[str] = None,
 ) -> List[str]:
     """Save individual and combined feature files as Silver parquet.
 
@@ -493,6 +721,9 @@ def save_features(
     Args:
         results: Dict of feature group name to DataFrame.
         season: NFL season year.
+        groups: Groups to write individual files for (default: all). The
+            combined file is always built from every group in ``results``.
+        ts: File timestamp (default: now).
 
     Returns:
         List of saved file paths.
@@ -500,38 +731,21 @@ def save_features(
     out_dir = os.path.join(GRAPH_FEATURES_DIR, f"season={season}")
     os.makedirs(out_dir, exist_ok=True)
 
-    ts = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+    ts = ts or datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
     saved: List[str] = []
+    write = set(GROUP_FILE_PREFIXES if groups is None else groups)
 
-    file_map = {
-        "wr_matchup": f"graph_wr_matchup_{ts}.parquet",
-        "ol_rb": f"graph_ol_rb_{ts}.parquet",
-        "te": f"graph_te_matchup_{ts}.parquet",
-        "scheme": f"graph_scheme_{ts}.parquet",
-        "injury_cascade": f"graph_injury_cascade_{ts}.parquet",
-        "qb_wr_chemistry": f"graph_qb_wr_chemistry_{ts}.parquet",
-        "red_zone": f"graph_red_zone_{ts}.parquet",
-        "game_script": f"graph_game_script_{ts}.parquet",
-        "rb_matchup": f"graph_rb_matchup_{ts}.parquet",
-        "wr_advanced": f"graph_wr_advanced_{ts}.parquet",
-        "te_advanced": f"graph_te_advanced_{ts}.parquet",
-        "route_participation": f"graph_route_participation_{ts}.parquet",
-        "wr_def_trailing": f"graph_wr_def_trailing_{ts}.parquet",
-        "te_def_trailing": f"graph_te_def_trailing_{ts}.parquet",
-        # Season-level (no week col) — excluded from the combined
-        # player-week file by the join_cols check below.
-        "vacated_opportunity": f"graph_vacated_opportunity_{ts}.parquet",
-        "familiarity": f"graph_familiarity_{ts}.parquet",
-    }
-
-    for key, filename in file_map.items():
+    for key, prefix in GROUP_FILE_PREFIXES.items():
+        if key not in write:
+            continue
         df = results.get(key, pd.DataFrame())
         if df.empty:
             logger.warning("No %s features for season %d — skipping", key, season)
             continue
 
-        path = os.path.join(out_dir, filename)
+        path = os.path.join(out_dir, f"{prefix}_{ts}.parquet")
         df.to_parquet(path, index=False)
+        record_partition_write(path)
         saved.append(path)
         logger.info("Saved %s: %d rows → %s", key, len(df), path)
 
@@ -607,6 +821,7 @@ def save_features(
 
         all_path = os.path.join(out_dir, f"graph_all_features_{ts}.parquet")
         combined.to_parquet(all_path, index=False)
+        record_partition_write(all_path)
         saved.append(all_path)
         logger.info(
             "Saved combined: %d rows, %d cols → %s",
@@ -733,6 +948,53 @@ def report_quality(
                     print(f"  OK: {key}.{col} is all NaN in week 1 (temporal safe)")
 
 
+# ---------------------------------------------------------------------------
+# Incremental runs
+# ---------------------------------------------------------------------------
+
+
+def _manifest_path(season: int) -> str:
+    return os.path.join(GRAPH_FEATURES_DIR, f"season={season}", MANIFEST_NAME)
+
+
+def _read_manifest(season: int) -> Dict[str, Dict[str, Optional[str]]]:
+    """Per-group ``{"fingerprint", "file"}`` recorded by the last save."""
+    try:
+        with open(_manifest_path(season)) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_manifest(season: int, manifest: Dict[str, Dict[str, Optional[str]]]) -> None:
+    path = _manifest_path(season)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+
+
+def _fresh_groups(
+    season: int,
+    manifest: Dict[str, Dict[str, Optional[str]]],
+    fingerprints: Dict[str, str],
+) -> Dict[str, Optional[str]]:
+    """Groups whose saved output matches the current fingerprint.
+
+    Returns:
+        Group name to saved file path (None when the group was empty).
+    """
+    out_dir = os.path.join(GRAPH_FEATURES_DIR, f"season={season}")
+    fresh: Dict[str, Optional[str]] = {}
+    for group in GROUP_FILE_PREFIXES:
+        entry = manifest.get(group) or {}
+        if entry.get("fingerprint") != fingerprints[f"{group}@{season}"]:
+            continue
+        path = os.path.join(out_dir, entry["file"]) if entry.get("file") else None
+        if path is None or os.path.exists(path):
+            fresh[group] = path
+    return fresh
+
+
 # ---------------------------------------------------------------------------
 # CLI
 # ---------------------------------------------------------------------------
@@ -750,6 +1012,22 @@ def main() -> None:
         required=True,
         help="Seasons to process (e.g. 2020 2021 2022 2023 2024 2025).",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=GRAPH_FEATURE_WORKERS,
+        help="Processes for the feature DAG (1 = serial in this process).",
+    )
+    parser.add_argument(
+        "--scratch-dir",
+        default=None,
+        help="Directory for the pool's shared Arrow files (default: system temp).",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Recompute every group even if its inputs and code are unchanged.",
+    )
     args = parser.parse_args()
 
     seasons = sorted(args.seasons)
@@ -758,19 +1036,88 @@ def main() -> None:
     total_files: List[str] = []
     total_start = time.time()
 
+    tasks = build_feature_tasks(seasons)
+    fingerprints = dag_fingerprints(tasks)
+
+    # Groups whose inputs and code are unchanged since their last save are
+    # not recomputed; their saved file stands in as the task output.
+    manifests = {s: {} if args.force else _read_manifest(s) for s in seasons}
+    fresh = {s: _fresh_groups(s, manifests[s], fingerprints) for s in seasons}
+    saved_outputs = {
+        f"{group}@{s}": path for s in seasons for group, path in fresh[s].items()
+    }
+    tasks = [
+        (
+            DagTask(task.key, _task_load_file, kwargs={"path": saved_outputs[task.key]})
+            if task.key in saved_outputs
+            else task
+        )
+        for task in tasks
+    ]
+    stale = {s: [g for g in GROUP_FILE_PREFIXES if g not in fresh[s]] for s in seasons}
     for season in seasons:
-        season_start = time.time()
+        if not stale[season]:
+            logger.info(
+                "Season %d: all graph feature groups unchanged — skipped", season
+            )
+        elif fresh[season]:
+            logger.info(
+                "Season %d: recomputing %s (%d groups unchanged)",
+                season,
+                ", ".join(stale[season]),
+                len(fresh[season]),
+            )
+
+    pending: Dict[int, Dict[str, pd.DataFrame]] = {s: {} for s in seasons}
 
-        results = compute_season_features(season, seasons)
-        saved = save_features(results, season)
+    def finish_season(season: int) -> None:
+        results = {
+            group: (
+                pending[season][group]
+                if group in pending[season]
+                else _task_load_file(fresh[season][group])
+            )
+            for group in GROUP_FILE_PREFIXES
+        }
+        del pending[season]
+        ts = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+        saved = save_features(results, season, groups=stale[season], ts=ts)
         total_files.extend(saved)
 
+        manifest = manifests[season]
+        for group in stale[season]:
+            filename = f"{GROUP_FILE_PREFIXES[group]}_{ts}.parquet"
+            manifest[group] = {
+                "fingerprint": fingerprints[f"{group}@{season}"],
+                "file": filename if not results[group].empty else None,
+            }
+        _write_manifest(season, manifest)
+
         # Load player_weekly for quality report
         pw = _load_bronze("players/weekly", season)
         report_quality(results, season, pw)
+        logger.info(
+            "Season %d completed at %.1f seconds", season, time.time() - total_start
+        )
 
-        elapsed = time.time() - season_start
-        logger.info("Season %d completed in %.1f seconds", season, elapsed)
+    def on_result(key: str, frame: pd.DataFrame) -> None:
+        group, season = key.rsplit("@", 1)
+        season = int(season)
+        pending[season][group] = frame
+        logger.info("%s (%d): %d rows", group, season, len(frame))
+        if len(pending[season]) == len(stale[season]):
+            finish_season(season)
+
+    targets = [f"{group}@{s}" for s in seasons for group in stale[s]]
+    if targets:
+        run_dag(
+            tasks,
+            targets=targets,
+            workers=args.workers,
+            task_mb=GRAPH_FEATURE_TASK_MB,
+            scratch_dir=args.scratch_dir,
+            on_result=on_result,
+        )
 
     # Final summary
     total_elapsed = time.time() - total_start
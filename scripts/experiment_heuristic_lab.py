@@ -1,10 +1,10 @@
 #!/usr/bin/env python3
 """Heuristic experiment lab — fast config sweeps over cached backtest inputs.
 
-The production-faithful eval (production_eval.py) takes ~7 minutes per run
-because it rebuilds Silver features for every (season, week). This lab caches
-the exact per-week projection inputs once, then evaluates heuristic config
-variants in seconds.
+The production-faithful eval (production_eval.py) takes minutes per run
+because it re-projects every (season, week). This lab caches the exact
+per-week projection inputs once, then evaluates heuristic config variants in
+seconds.
 
 Fidelity: the cache stage replicates run_backtest()'s data assembly exactly
 (build_silver_features -> week-1 target frame -> project_position -> merge
@@ -35,6 +35,7 @@ sys.path.insert(0, os.path.dirname(__file__))
 import projection_engine  # noqa: E402
 from projection_engine import project_position  # noqa: E402
 from scoring_calculator import calculate_fantasy_points_df  # noqa: E402
+from walk_forward_features import WalkForwardSilverState  # noqa: E402
 from backtest_projections import (  # noqa: E402
     build_silver_features,
     compute_actuals,
@@ -97,9 +98,12 @@ def build_cache(seasons: List[int], weeks: Optional[List[int]] = None) -> None:
     weekly_df.to_parquet(os.path.join(CACHE_DIR, "weekly.parquet"), index=False)
 
     manifest = []
+    silver_state = WalkForwardSilverState(weekly_df)
     for season in seasons:
         for week in weeks or range(3, 19):
-            silver_df = build_silver_features(weekly_df, season, up_to_week=week)
+            silver_df = build_silver_features(
+                weekly_df, season, up_to_week=week, state=silver_state
+            )
             if silver_df.empty:
                 continue
             # Mirror generate_weekly_projections step 1: week-1 feature rows
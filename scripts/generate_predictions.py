@@ -37,6 +37,7 @@ from feature_engineering import assemble_game_features, get_feature_columns  # n
 from model_training import load_model  # noqa: E402
 from ensemble_training import load_ensemble, predict_ensemble  # noqa: E402
 from config import MODEL_DIR  # noqa: E402
+from partition_manifest import record_partition_write  # noqa: E402
 
 logging.basicConfig(level=logging.WARNING, format="%(levelname)s - %(message)s")
 logger = logging.getLogger(__name__)
@@ -444,6 +445,7 @@ def main(argv: Optional[List[str]] = None) -> int:
     gold_path = os.path.join(GOLD_DIR, s3_key)
     os.makedirs(os.path.dirname(gold_path), exist_ok=True)
     predictions.to_parquet(gold_path, index=False)
+    record_partition_write(gold_path)
     print(f"\nSaved: {gold_path}")
 
     return 0
@@ -47,6 +47,8 @@ from kicker_analytics import (  # noqa: E402
 from kicker_projection import generate_kicker_projections  # noqa: E402
 from scoring_calculator import list_scoring_formats  # noqa: E402
 from utils import download_latest_parquet  # noqa: E402
+from partition_manifest import record_partition_write  # noqa: E402
+from projection_ledger import ProjectionLedger, ledger_path  # noqa: E402
 import config  # noqa: E402
 
 
@@ -188,7 +190,7 @@ def attach_floor_ceiling_with_features(
     floor_ceiling_input = projections
     try:
         from player_feature_engineering import assemble_player_features
-        from quantile_models import load_quantile_models
+        from quantile_models import cached_quantile_models
 
         feat_df = assemble_player_features(season=season)
         if not feat_df.empty and "week" in feat_df.columns:
@@ -198,7 +200,7 @@ def attach_floor_ceiling_with_features(
             and "player_id" in feat_df.columns
             and "player_id" in projections.columns
         ):
-            qdata = load_quantile_models()
+            qdata = cached_quantile_models()
             if qdata is not None:
                 # Backfill the UNION of feature sets: the top-level list is
                 # the legacy/shared vintage, but since the 2026-08-16
@@ -1233,6 +1235,10 @@ def main():
                 route_df=route_df if not route_df.empty else None,
             )
 
+        # Every post-model layer below is recorded in the ledger (saved next
+        # to the Gold file) so the Sunday refresh can redo one layer exactly.
+        ledger = ProjectionLedger()
+
         # Load injury data and apply adjustments
         injuries_df = _read_local_parquet(
             BRONZE_DIR, f"players/injuries/season={args.season}/*.parquet"
@@ -1269,7 +1275,9 @@ def main():
                 # keep-last semantics would apply STALE statuses (a player
                 # Out in week 5 must not be zeroed for week 7).
                 injuries_df = week_inj
-            projections = apply_injury_adjustments(projections, injuries_df)
+            projections = apply_injury_adjustments(
+                projections, injuries_df, ledger=ledger
+            )
             injured = (projections["injury_multiplier"] < 1.0).sum()
             print(f"Injury adjustments applied: {injured} players affected")
 
@@ -1302,12 +1310,14 @@ def main():
                     prior_weekly_df, scoring_format=args.scoring
                 )
                 before_total = float(projections["projected_points"].sum())
+                before = projections
                 projections = apply_early_season_prior(
                     projections,
                     prior_ppg_df,
                     week=args.week,
                     scale=args.early_season_prior_weight,
                 )
+                ledger.capture("early_season_prior", before, projections)
                 after_total = float(projections["projected_points"].sum())
                 adjusted = int(projections["prior_season_ppg"].notna().sum())
                 print(
@@ -1393,12 +1403,14 @@ def main():
                 else:
                     implied_df = compute_adp_implied_ppg(adp_current, mapping, crosswalk)
                     before_total = float(projections["projected_points"].sum())
+                    before = projections
                     projections = apply_adp_prior(
                         projections,
                         implied_df,
                         week=args.week,
                         scale=args.adp_prior_weight,
                     )
+                    ledger.capture("adp_prior", before, projections)
                     after_total = float(projections["projected_points"].sum())
                     adjusted = int(projections["adp_implied_ppg"].notna().sum())
                     print(
@@ -1430,6 +1442,7 @@ def main():
                 )
             else:
                 before_total = float(projections["projected_points"].sum())
+                before = projections
                 projections = apply_qb_starter_floor(
                     projections,
                     depth_chart_df,
@@ -1439,6 +1452,7 @@ def main():
                     scoring_format=args.scoring,
                     haircut=args.qb_starter_floor_haircut,
                 )
+                ledger.capture("qb_starter_floor", before, projections)
                 after_total = float(projections["projected_points"].sum())
                 flagged = int(projections["qb_starter_floor_flag"].sum())
                 print(
@@ -1464,6 +1478,7 @@ def main():
                     "shrink is unaffected)"
                 )
             before_total = float(projections["projected_points"].sum())
+            before = projections
             projections = apply_rb_tail_calibration(
                 projections,
                 snap_counts_df if not snap_counts_df.empty else None,
@@ -1474,6 +1489,7 @@ def main():
                 low_weight=args.rb_tail_low_weight,
                 high_shrink=args.rb_tail_high_shrink,
             )
+            ledger.capture("rb_tail", before, projections)
             after_total = float(projections["projected_points"].sum())
             low_flagged = int(projections["rb_tail_low_boost_flag"].sum())
             high_flagged = int(projections["rb_tail_high_shrink_flag"].sum())
@@ -1494,12 +1510,14 @@ def main():
             from wr_tiebreak import apply_wr_tiebreak  # noqa: E402
 
             before_total = float(projections["projected_points"].sum())
+            before = projections
             projections = apply_wr_tiebreak(
                 projections,
                 strength_weekly,
                 season=args.season,
                 week=args.week,
             )
+            ledger.capture("wr_tiebreak", before, projections)
             after_total = float(projections["projected_points"].sum())
             tiebreak_flagged = int(projections["wr_tiebreak_flag"].sum())
             print(
@@ -1530,12 +1548,14 @@ def main():
                 args.week,
                 schedules_df if not schedules_df.empty else pd.DataFrame(),
             )
+            before = projections
             projections = apply_ecr_anchor(
                 projections,
                 ecr_lookup,
                 mode=args.ecr_anchor_mode,
                 weight=args.ecr_anchor_weight,
             )
+            ledger.capture("ecr_anchor", before, projections)
             after_total = float(projections["projected_points"].sum())
             ecr_flagged = int(projections["ecr_anchor_flag"].sum())
             print(
@@ -1560,6 +1580,7 @@ def main():
             from wind_adjust import apply_wind_adjust  # noqa: E402
 
             before_total = float(projections["projected_points"].sum())
+            before = projections
             projections = apply_wind_adjust(
                 projections,
                 season=args.season,
@@ -1567,6 +1588,7 @@ def main():
                 schedules_df=schedules_df if not schedules_df.empty else None,
                 shrink=args.wind_adjust_shrink,
             )
+            ledger.capture("wind", before, projections)
             after_total = float(projections["projected_points"].sum())
             flagged = int(projections["wind_adjust_flag"].sum())
             print(
@@ -1587,7 +1609,9 @@ def main():
                 print("WARN: No event data available; skipping event adjustments")
             else:
                 before_total = float(projections["projected_points"].sum())
-                projections = apply_event_adjustments(projections, events_df)
+                projections = apply_event_adjustments(
+                    projections, events_df, ledger=ledger
+                )
                 after_total = float(projections["projected_points"].sum())
                 affected = int((projections["event_multiplier"] != 1.0).sum())
                 delta = after_total - before_total
@@ -1650,7 +1674,9 @@ def main():
                     props_df, scoring_format=args.scoring
                 )
                 before_total = float(projections["projected_points"].sum())
+                before = projections
                 projections = apply_props_blend(projections, implied)
+                ledger.capture("props_blend", before, projections)
                 after_total = float(projections["projected_points"].sum())
                 print(
                     f"Props blend: {len(implied)} players with implied points "
@@ -1677,7 +1703,9 @@ def main():
                         else ""
                     )
                 )
-                projections = apply_sentiment_adjustments(projections, sentiment_df)
+                projections = apply_sentiment_adjustments(
+                    projections, sentiment_df, ledger=ledger
+                )
                 sent_applied = (projections["sentiment_multiplier"] != 1.0).sum()
                 print(f"Sentiment adjustments applied: {sent_applied} players affected")
 
@@ -1856,7 +1884,12 @@ def main():
     gold_path = os.path.join(GOLD_DIR, s3_key)
     os.makedirs(os.path.dirname(gold_path), exist_ok=True)
     projections.to_parquet(gold_path, index=False)
+    record_partition_write(gold_path)
     print(f"Saved Gold -> data/gold/{s3_key}")
+    if not args.preseason and len(ledger):
+        ledger.checkpoint(projections)
+        ledger.save(ledger_path(gold_path))
+        print(f"Saved adjustment ledger ({', '.join(ledger.stage_names)})")
 
     if args.output in ("s3", "both") and has_aws:
         try:
@@ -399,6 +399,7 @@ def run_experiment(
     is_gate: bool,
     use_ml: bool,
     full_features: bool,
+    walk_forward_features: bool = True,
 ) -> Dict:
     """Execute a PFE run, save results, and print summary.
 
@@ -416,6 +417,8 @@ def run_experiment(
         use_ml: Whether to activate the ML projection router.
         full_features: Whether to assemble the full feature vector for residual
             correction (requires local Silver data).
+        walk_forward_features: Serve weekly Silver features from the
+            walk-forward state (default) instead of rebuilding them per week.
 
     Returns:
         The summary dict that was written to disk.
@@ -460,6 +463,7 @@ def run_experiment(
         use_ml=use_ml,
         apply_constraints=False,
         full_features=full_features,
+        walk_forward_features=walk_forward_features,
     )
 
     if results_df.empty:
@@ -635,6 +639,14 @@ def main() -> int:
         action="store_false",
         help="Skip full feature assembly",
     )
+    parser.add_argument(
+        "--rebuild-features-per-week",
+        action="store_true",
+        help=(
+            "Rebuild Silver features from scratch for every (season, week) "
+            "instead of the walk-forward state (parity checks only)"
+        ),
+    )
 
     args = parser.parse_args()
 
@@ -657,6 +669,7 @@ def main() -> int:
         is_gate=args.gate,
         use_ml=args.ml,
         full_features=args.full_features,
+        walk_forward_features=not args.rebuild_features_per_week,
     )
 
     return 0
@@ -29,6 +29,8 @@ import pandas as pd
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
+from partition_manifest import record_partition_write  # noqa: E402
+
 logging.basicConfig(
     level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s'
 )
@@ -411,6 +413,7 @@ def write_bronze_live_rosters(
     timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
     out_path = out_dir / f'sleeper_rosters_{timestamp}.parquet'
     live_df.to_parquet(out_path, index=False)
+    record_partition_write(out_path)
     logger.info(
         "write_bronze_live_rosters: wrote %d rows (%d FAs) to %s",
         len(live_df),
@@ -525,6 +528,7 @@ def main() -> int:
     timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
     output_file = os.path.join(proj_dir, f'season_proj_{timestamp}.parquet')
     updated_df.to_parquet(output_file, index=False)
+    record_partition_write(output_file)
     print(f"\nSaved: {output_file}")
 
     # Persist the change record for audit review (D-02).
@@ -36,6 +36,7 @@ from player_advanced_analytics import (
     log_nan_coverage,
 )
 from config import PLAYER_DATA_SEASONS, SILVER_PLAYER_S3_KEYS
+from partition_manifest import record_partition_write
 
 logging.basicConfig(
     level=logging.INFO,
@@ -122,6 +123,7 @@ def _save_local_silver(df: pd.DataFrame, key: str, ts: str) -> str:
     path = os.path.join(SILVER_DIR, key)
     os.makedirs(os.path.dirname(path), exist_ok=True)
     df.to_parquet(path, index=False)
+    record_partition_write(path)
     print(f"    Saved -> data/silver/{key}")
     return path
 
@@ -26,6 +26,7 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
 
 from config import SILVER_TEAM_S3_KEYS
 from market_analytics import compute_movement_features, reshape_to_per_team
+from partition_manifest import record_partition_write
 
 PROJECT_ROOT = os.path.join(os.path.dirname(__file__), "..")
 BRONZE_DIR = os.path.join(PROJECT_ROOT, "data", "bronze")
@@ -68,6 +69,7 @@ def _save_local_silver(df: pd.DataFrame, key: str, ts: str) -> str:
     path = os.path.join(SILVER_DIR, key)
     os.makedirs(os.path.dirname(path), exist_ok=True)
     df.to_parquet(path, index=False)
+    record_partition_write(path)
     print(f"    Saved -> data/silver/{key}")
     return path
 
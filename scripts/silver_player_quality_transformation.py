@@ -36,6 +36,7 @@ sys.path.insert(0, os.path.join(PROJECT_ROOT, "src"))
 
 from config import DEFAULT_SEASON
 from team_analytics import apply_team_rolling
+from partition_manifest import record_partition_write
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -93,6 +94,7 @@ def _save_local_silver(df: pd.DataFrame, key: str) -> str:
     path = os.path.join(SILVER_DIR, key)
     os.makedirs(os.path.dirname(path), exist_ok=True)
     df.to_parquet(path, index=False)
+    record_partition_write(path)
     print(f"    Saved -> data/silver/{key}")
     return path
 
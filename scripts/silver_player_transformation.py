@@ -27,6 +27,7 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 from config import DEFAULT_SEASON
 from nfl_data_integration import NFLDataFetcher
+from partition_manifest import record_partition_write
 from player_analytics import (
     compute_usage_metrics,
     compute_opponent_rankings,
@@ -145,6 +146,7 @@ def _save_local_silver(df: pd.DataFrame, key: str, ts: str) -> str:
     path = os.path.join(SILVER_DIR, key)
     os.makedirs(os.path.dirname(path), exist_ok=True)
     df.to_parquet(path, index=False)
+    record_partition_write(path)
     print(f"    Saved -> data/silver/{key}")
     return path
 
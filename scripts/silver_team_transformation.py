@@ -25,13 +25,8 @@ from dotenv import load_dotenv
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
 
 from config import DEFAULT_SEASON, SILVER_TEAM_S3_KEYS
-from team_analytics import (
-    compute_pbp_metrics,
-    compute_tendency_metrics,
-    compute_sos_metrics,
-    compute_situational_splits,
-    compute_pbp_derived_metrics,
-)
+from team_analytics import compute_team_silver_tables
+from partition_manifest import record_partition_write
 
 PROJECT_ROOT = os.path.join(os.path.dirname(__file__), "..")
 BRONZE_DIR = os.path.join(PROJECT_ROOT, "data", "bronze")
@@ -74,6 +69,7 @@ def _save_local_silver(df: pd.DataFrame, key: str, ts: str) -> str:
     path = os.path.join(SILVER_DIR, key)
     os.makedirs(os.path.dirname(path), exist_ok=True)
     df.to_parquet(path, index=False)
+    record_partition_write(path)
     print(f"    Saved -> data/silver/{key}")
     return path
 
@@ -150,9 +146,12 @@ def run_silver_team_transform(
             continue
         print(f"    Loaded {len(pbp_df):,} plays")
 
-        # 2. Compute PBP performance metrics
-        print("  Computing PBP performance metrics...")
-        pbp_metrics_df = compute_pbp_metrics(pbp_df)
+        # 2-6. All team tables from one filtered, key-coded pass over the plays
+        print("  Computing team metrics (single pass)...")
+        tables = compute_team_silver_tables(pbp_df)
+
+        # 2. PBP performance metrics
+        pbp_metrics_df = tables["pbp_metrics"]
         if pbp_metrics_df.empty:
             print("    WARNING: No PBP metrics produced, skipping.")
             failed_seasons.append(season)
@@ -162,9 +161,8 @@ def run_silver_team_transform(
             f"{pbp_metrics_df['team'].nunique()} teams"
         )
 
-        # 3. Compute tendency metrics
-        print("  Computing tendency metrics...")
-        tendencies_df = compute_tendency_metrics(pbp_df)
+        # 3. Tendency metrics
+        tendencies_df = tables["tendencies"]
         if tendencies_df.empty:
             print("    WARNING: No tendency metrics produced.")
         else:
@@ -173,9 +171,8 @@ def run_silver_team_transform(
                 f"{tendencies_df['team'].nunique()} teams"
             )
 
-        # 4. Compute SOS metrics
-        print("  Computing SOS metrics...")
-        sos_df = compute_sos_metrics(pbp_df)
+        # 4. SOS metrics
+        sos_df = tables["sos"]
         if sos_df.empty:
             print("    WARNING: No SOS metrics produced.")
         else:
@@ -184,9 +181,8 @@ def run_silver_team_transform(
                 f"{sos_df['team'].nunique()} teams"
             )
 
-        # 5. Compute situational splits
-        print("  Computing situational splits...")
-        sit_df = compute_situational_splits(pbp_df)
+        # 5. Situational splits
+        sit_df = tables["situational"]
         if sit_df.empty:
             print("    WARNING: No situational splits produced.")
         else:
@@ -195,9 +191,8 @@ def run_silver_team_transform(
                 f"{sit_df['team'].nunique()} teams"
             )
 
-        # 6. Compute PBP-derived metrics
-        print("  Computing PBP-derived metrics...")
-        pbp_derived_df = compute_pbp_derived_metrics(pbp_df)
+        # 6. PBP-derived metrics
+        pbp_derived_df = tables["pbp_derived"]
         if pbp_derived_df.empty:
             print("    WARNING: No PBP-derived metrics produced.")
         else:
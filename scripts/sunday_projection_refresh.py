@@ -30,6 +30,17 @@ Case B — Gold file has NO ``injury_multiplier`` column (preseason-era file
     The injury adjustment was never applied to the stored stats. Apply fresh
     multipliers directly with no undo step. This is the simpler, safer path.
 
+Case L — an adjustment ledger was saved next to the Gold file
+    (``projection_ledgers/…``, see src/projection_ledger.py):
+    The ledger holds the pre-adjustment values and every layer applied on top
+    of them, so the injury layer is swapped for the fresh one and the chain is
+    replayed from the base. The result matches a fresh pipeline run,
+    including players who were Out on Tuesday: layers that skip players zeroed
+    by injury (sentiment) re-check that against the new injury layer. The only
+    inexact rows are ones a later layer pinned to a value it computed on the
+    old injury state (reported as ``pinned_by_later_layers``). Cases A/B
+    remain the fallback for files without a ledger.
+
 Idempotency
 -----------
 Running the refresh twice with identical injury data produces no change beyond
@@ -65,6 +76,13 @@ from nfl_data_integration import NFLDataFetcher  # noqa: E402
 from projection_engine import (  # noqa: E402
     INJURY_MULTIPLIERS,
     apply_injury_adjustments,
+    injury_stage,
+)
+from partition_manifest import record_partition_write  # noqa: E402
+from projection_ledger import (  # noqa: E402
+    ProjectionLedger,
+    ledger_path,
+    load_ledger,
 )
 
 logging.basicConfig(
@@ -101,6 +119,16 @@ SCALABLE_ALWAYS_COLS: list = ["projected_points"]
 # Scores that the weekly pipeline can produce.
 SCORING_FORMATS: list = ["half_ppr", "ppr", "standard"]
 
+# Statuses whose injury multiplier zeroes a player.
+_ZEROED_STATUSES: list = [
+    "Out",
+    "IR",
+    "Injured Reserve",
+    "PUP",
+    "Physically Unable to Perform",
+    "Suspension",
+]
+
 
 # ---------------------------------------------------------------------------
 # Season / week auto-detection (mirrors daily_sentiment_pipeline.py)
@@ -407,36 +435,106 @@ def _undo_and_reapply(
             )
             summary["asymmetry_limited"] = n_asymmetric
 
-    # -----------------------------------------------------------------------
-    # Compute change statistics for the summary log.
-    # -----------------------------------------------------------------------
+    _count_status_changes(summary, old_status, old_mult, refreshed)
+    return refreshed, summary
+
+
+def _count_status_changes(
+    summary: dict,
+    old_status: pd.Series,
+    old_mult: pd.Series,
+    refreshed: pd.DataFrame,
+) -> None:
+    """Fill the status/multiplier change counts of a refresh summary.
+
+    Args:
+        summary: Summary dict updated in place.
+        old_status: ``injury_status`` from the Gold file.
+        old_mult: ``injury_multiplier`` from the Gold file.
+        refreshed: Refreshed projections (same index as the Gold file).
+    """
     if "injury_status" in refreshed.columns:
         new_status = refreshed["injury_status"]
         changed_mask = old_status != new_status
         summary["status_changed"] = int(changed_mask.sum())
 
-        new_outs = (new_status.isin(["Out", "IR", "Injured Reserve",
-                                     "PUP", "Physically Unable to Perform",
-                                     "Suspension"])).sum()
+        new_outs = (new_status.isin(_ZEROED_STATUSES)).sum()
         new_q = (new_status == "Questionable").sum()
         cleared = (
-            (old_status.isin(["Out", "IR", "Injured Reserve",
-                               "PUP", "Physically Unable to Perform",
-                               "Suspension"]))
-            & (new_status == "Active")
+            (old_status.isin(_ZEROED_STATUSES)) & (new_status == "Active")
         ).sum()
         summary["new_outs"] = int(new_outs)
         summary["new_questionable"] = int(new_q)
         summary["cleared_to_active"] = int(cleared)
 
     if "injury_multiplier" in refreshed.columns:
-        new_mult = refreshed["injury_multiplier"]
+        new_mult = refreshed["injury_multiplier"].fillna(1.0)
         old_mult_aligned = old_mult.reindex(refreshed.index).fillna(1.0)
         summary["multiplier_changed"] = int(
             (new_mult != old_mult_aligned).sum()
         )
 
-    return refreshed, summary
+
+def _redo_injury_layer(
+    df: pd.DataFrame,
+    new_injuries_df: pd.DataFrame,
+    ledger: ProjectionLedger,
+) -> tuple:
+    """Swap the ledger's injury layer for a fresh one and replay (Case L).
+
+    Unlike :func:`_undo_and_reapply` nothing is divided back out: every
+    recorded layer is replayed from the pre-adjustment values, so players
+    who were zeroed on Tuesday are restored exactly. Rows the ledger does not
+    cover (e.g. kickers, added after the adjustment layers) are left as-is.
+
+    Args:
+        df: Gold projection DataFrame loaded from disk.
+        new_injuries_df: Fresh injury report, week-filtered.
+        ledger: Ledger saved alongside ``df``; must contain an ``injury``
+            stage.
+
+    Returns:
+        Tuple of (refreshed DataFrame, summary dict, updated ledger).
+    """
+    logger.info("Case L: replaying the adjustment ledger with fresh injuries")
+    summary: dict = {
+        "case": "L",
+        "total_players": len(df),
+        "status_changed": 0,
+        "multiplier_changed": 0,
+        "asymmetry_limited": 0,
+        "new_outs": 0,
+        "new_questionable": 0,
+        "cleared_to_active": 0,
+        "pinned_by_later_layers": 0,
+    }
+    old_status = df["injury_status"] if "injury_status" in df.columns else None
+    old_mult = df["injury_multiplier"] if "injury_multiplier" in df.columns else None
+
+    stage = injury_stage(df, new_injuries_df)
+    new_ledger = ledger.replace_stage(df, stage)
+    refreshed = new_ledger.replay(df)
+
+    covered = df[ledger.key].isin(ledger.keys).to_numpy()
+    for col, values in stage.provenance.items():
+        if isinstance(values, pd.Series):
+            values = values.to_numpy()[covered]
+        refreshed.loc[covered, col] = values
+
+    if old_status is not None and old_mult is not None:
+        _count_status_changes(summary, old_status, old_mult, refreshed)
+        new_mult = refreshed["injury_multiplier"].fillna(1.0)
+        changed = df.loc[new_mult != old_mult.fillna(1.0), ledger.key]
+        pinned = changed[changed.isin(new_ledger.overridden_after("injury"))]
+        if len(pinned):
+            logger.warning(
+                "%d player(s) changed injury status but hold values a later "
+                "layer pinned on the old status; those values are kept: %s",
+                len(pinned),
+                pinned.tolist(),
+            )
+        summary["pinned_by_later_layers"] = int(len(pinned))
+    return refreshed, summary, new_ledger
 
 
 # ---------------------------------------------------------------------------
@@ -489,6 +587,8 @@ def _write_refresh_summary(
     print(f"  New Questionable : {summary['new_questionable']}")
     print(f"  Cleared→Active   : {summary['cleared_to_active']}")
     print(f"  Asymmetry-limited: {summary['asymmetry_limited']}")
+    if "pinned_by_later_layers" in summary:
+        print(f"  Pinned (later)   : {summary['pinned_by_later_layers']}")
 
     if summary["status_changed"] > 0 and "injury_status" in refreshed.columns:
         # Print detailed change table
@@ -563,6 +663,7 @@ def _write_gold_output(
     except BaseException:
         os.unlink(tmp_path)
         raise
+    record_partition_write(output_path)
     logger.info("Wrote refreshed Gold file: %s", output_path)
     return output_path
 
@@ -816,13 +917,29 @@ def main() -> int:
             )
             continue
 
-        # Undo old multipliers and re-apply fresh ones
-        refreshed, summary = _undo_and_reapply(gold_df, injuries_df)
+        # Replay the adjustment ledger when one was saved with the file;
+        # otherwise undo old multipliers and re-apply fresh ones.
+        ledger = load_ledger(source_path)
+        new_ledger = None
+        if ledger is not None and "injury" in ledger.stage_names:
+            try:
+                refreshed, summary, new_ledger = _redo_injury_layer(
+                    gold_df, injuries_df, ledger
+                )
+            except (KeyError, ValueError) as exc:
+                logger.warning(
+                    "Ledger replay failed (%s); falling back to undo/re-apply", exc
+                )
+                new_ledger = None
+        if new_ledger is None:
+            refreshed, summary = _undo_and_reapply(gold_df, injuries_df)
 
         # Write output
         output_path = None
         if not args.dry_run:
             output_path = _write_gold_output(refreshed, season, week, scoring, ts)
+            if new_ledger is not None:
+                new_ledger.save(ledger_path(output_path))
             any_refreshed = True
 
         _write_refresh_summary(
@@ -107,6 +107,16 @@ def build_parser() -> argparse.ArgumentParser:
             "at the same target count."
         ),
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help=(
+            "Processes for per-season feature assembly (default: "
+            "FEATURE_ASSEMBLY_WORKERS env, 1 = serial). Output is identical "
+            "to the serial path."
+        ),
+    )
     return parser
 
 
@@ -309,6 +319,7 @@ def main(argv: list = None) -> int:
         all_data = assemble_multiyear_features(
             include_player_features=args.include_player_features,
             include_ep_features=args.include_ep_features,
+            workers=args.workers,
         )
     except Exception as e:
         print(f"ERROR: Failed to assemble features: {e}")
@@ -102,6 +102,20 @@ def build_parser() -> argparse.ArgumentParser:
         help="Model type: xgb (XGBoost, default), ridge (RidgeCV pipeline), "
         "elasticnet (ElasticNetCV pipeline).",
     )
+    parser.add_argument(
+        "--feature-store",
+        action="store_true",
+        help="Load features from the season-partitioned feature store "
+        "(rebuilding only seasons whose inputs changed) instead of "
+        "re-assembling every season.",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Processes for per-season feature assembly (default: "
+        "FEATURE_ASSEMBLY_WORKERS env, 1 = serial).",
+    )
     return parser
 
 
@@ -213,7 +227,9 @@ def main():
     # -----------------------------------------------------------------------
     logger.info("Loading player feature data for seasons %s...", PLAYER_DATA_SEASONS)
     try:
-        all_data = assemble_multiyear_player_features(PLAYER_DATA_SEASONS)
+        all_data = assemble_multiyear_player_features(
+            PLAYER_DATA_SEASONS, use_store=args.feature_store, workers=args.workers
+        )
     except Exception as e:
         logger.error("Failed to assemble player features: %s", e)
         sys.exit(1)
@@ -43,7 +43,6 @@ The script never blocks the pipeline for missing upstream data.
 from __future__ import annotations
 
 import argparse
-import glob as globmod
 import json
 import logging
 import math
@@ -80,6 +79,7 @@ from prediction_backtester import (  # noqa: E402
     evaluate_line_capture,
 )
 from odds_snapshot_loader import load_open_close_lines  # noqa: E402
+from partition_manifest import latest_parquet  # noqa: E402
 from scoring_calculator import calculate_fantasy_points_df  # noqa: E402
 from simulate_fp_accuracy import build_ordinal_table  # noqa: E402
 
@@ -118,9 +118,8 @@ _ORDINAL_EXTERNAL_SOURCES: tuple = ("sleeper", "espn", "yahoo_proxy_fp")
 
 
 def _latest_parquet(directory: str) -> Optional[str]:
-    """Return the lexicographically last .parquet file in ``directory``, or None."""
-    files = sorted(globmod.glob(os.path.join(directory, "*.parquet")))
-    return files[-1] if files else None
+    """Return the newest .parquet file in ``directory`` (partition manifest), or None."""
+    return latest_parquet(directory)
 
 
 def _load_gold_projections(
@@ -152,17 +151,14 @@ def _load_gold_projections(
         return pd.DataFrame()
 
     # Prefer scoring-specific file; fall back to any parquet.
-    scoring_files = sorted(
-        globmod.glob(os.path.join(week_dir, f"*{scoring}*.parquet"))
+    latest = latest_parquet(week_dir, f"*{scoring}*.parquet") or latest_parquet(
+        week_dir
     )
-    all_files = sorted(globmod.glob(os.path.join(week_dir, "*.parquet")))
-    files = scoring_files if scoring_files else all_files
-
-    if not files:
+    if latest is None:
         logger.warning("No parquet files in %s", week_dir)
         return pd.DataFrame()
 
-    df = pd.read_parquet(files[-1])
+    df = pd.read_parquet(latest)
     df["season"] = int(season)
     df["week"] = int(week)
     return df
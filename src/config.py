@@ -46,6 +46,24 @@ DEFAULT_WEEK = 1
 # Note: 2025 uses nflverse stats_player tag (not legacy player_stats tag).
 PLAYER_DATA_SEASONS = list(range(2016, 2026))
 
+# Multi-season feature assembly (season_parallel.map_seasons). 1 = serial.
+# The per-season estimate caps how many seasons are assembled at once so a
+# wide pool cannot exhaust memory: in-flight <= available MB / estimate.
+FEATURE_ASSEMBLY_WORKERS = int(os.getenv("FEATURE_ASSEMBLY_WORKERS", "1"))
+FEATURE_ASSEMBLY_SEASON_MB = int(os.getenv("FEATURE_ASSEMBLY_SEASON_MB", "2048"))
+
+# Graph feature DAG (scripts/compute_graph_features.py). 1 = serial. The
+# per-task estimate caps concurrent feature-group tasks the same way.
+GRAPH_FEATURE_WORKERS = int(os.getenv("GRAPH_FEATURE_WORKERS", "1"))
+GRAPH_FEATURE_TASK_MB = int(os.getenv("GRAPH_FEATURE_TASK_MB", "3072"))
+
+# Walk-forward CV folds (walk_forward_runner.run_cv_jobs). 1 = serial.
+# Threads per worker 0 = cpu_count // workers; the per-fold estimate caps
+# concurrent folds the same way as above.
+CV_WORKERS = int(os.getenv("CV_WORKERS", "1"))
+CV_THREADS_PER_WORKER = int(os.getenv("CV_THREADS_PER_WORKER", "0"))
+CV_FOLD_MB = int(os.getenv("CV_FOLD_MB", "1024"))
+
 # Databricks Configuration - Updated with your workspace
 DATABRICKS_CLUSTER_ID = os.getenv("DATABRICKS_CLUSTER_ID")
 DATABRICKS_WORKSPACE_URL = os.getenv(
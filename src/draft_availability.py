@@ -16,7 +16,7 @@ that case.
 from __future__ import annotations
 
 import math
-from typing import Dict, Optional
+from typing import Dict, Optional, Sequence
 
 import numpy as np
 import pandas as pd
@@ -31,6 +31,18 @@ def _norm_cdf(z: float) -> float:
     """
     return 0.5 * (1.0 + math.erf(z / math.sqrt(2.0)))
 
+
+_erf_ufunc = np.frompyfunc(math.erf, 1, 1)
+
+
+def _norm_cdf_array(z: np.ndarray) -> np.ndarray:
+    """Element-wise :func:`_norm_cdf` over an array.
+
+    Same ``math.erf`` per element (still scipy-free), so every value is
+    bit-identical to the scalar path.
+    """
+    return 0.5 * (1.0 + _erf_ufunc(z / math.sqrt(2.0)).astype(float))
+
 # Clamp bounds -- never report certainty either way. A player projected to
 # go pick 1 overall is still not *literally* 100% gone before pick 50 (an
 # owner could reach for someone else / go off the board), and a player
@@ -225,8 +237,106 @@ def expected_best_vorp_at_pick(
     return result
 
 
+def _prob_gone_matrix(
+    pick_numbers: np.ndarray, adp: np.ndarray, stdev: np.ndarray
+) -> np.ndarray:
+    """:func:`prob_gone_before` for every (pick, player) pair.
+
+    Returns a ``[len(pick_numbers), len(adp)]`` array; ``stdev`` uses ``NaN``
+    for "unknown" and falls back exactly like the scalar function.
+    """
+    with np.errstate(invalid="ignore"):
+        has_stdev = np.isfinite(stdev) & (stdev > 0)
+    sigma = np.where(
+        has_stdev,
+        stdev,
+        np.maximum(_FALLBACK_SIGMA_FLOOR, _FALLBACK_SIGMA_ADP_FRACTION * adp),
+    )
+    z = (pick_numbers[:, None] - adp[None, :]) / sigma[None, :]
+    return np.clip(_norm_cdf_array(z), _MIN_PROB, _MAX_PROB)
+
+
+def expected_best_vorp_at_picks(
+    available_df: pd.DataFrame,
+    pick_numbers: Sequence[float],
+    vorp_col: str = "vorp",
+    adp_col: str = "adp_rank",
+    stdev_col: str = "adp_stdev",
+) -> pd.DataFrame:
+    """:func:`expected_best_vorp_at_pick` for many pick numbers at once.
+
+    Gives the whole "cost of waiting" curve -- e.g. for every remaining user
+    pick -- from one pass per position: the gone-probability matrix for all
+    (pick, candidate) pairs, an exclusive cumulative product of it along the
+    VORP-descending candidate axis (P(every better candidate is gone)), and a
+    cumulative sum of ``P(best) * vorp`` read off at each pick's walk-cap
+    stop. Candidate ordering, the walk cap and the accumulation order all
+    follow the scalar function, so each cell equals
+    ``expected_best_vorp_at_pick(available_df, pick)[position]`` exactly.
+
+    Args:
+        available_df: Board's available-player pool (same requirements as
+            :func:`expected_best_vorp_at_pick`).
+        pick_numbers: Overall pick numbers to evaluate availability at.
+        vorp_col: Column holding VORP.
+        adp_col: Column holding each player's ADP rank.
+        stdev_col: Column holding each player's ADP stdev.
+
+    Returns:
+        DataFrame indexed by pick number with one column per position.
+        Positions with no vorp/adp-eligible candidates are omitted, as in
+        the scalar function.
+    """
+    picks = np.asarray(pick_numbers, dtype=float)
+    result = pd.DataFrame(index=pd.Index(list(pick_numbers), name="pick_number"))
+    if available_df.empty or "position" not in available_df.columns:
+        return result
+    if vorp_col not in available_df.columns or adp_col not in available_df.columns:
+        return result
+    if picks.size == 0:
+        return result
+
+    has_stdev = stdev_col in available_df.columns
+    rows = np.arange(picks.size)
+
+    for position, group in available_df.groupby("position"):
+        candidates = pd.DataFrame(
+            {
+                vorp_col: pd.to_numeric(group[vorp_col], errors="coerce"),
+                adp_col: pd.to_numeric(group[adp_col], errors="coerce"),
+            },
+            index=group.index,
+        )
+        candidates = candidates.dropna(subset=[vorp_col, adp_col])
+        if candidates.empty:
+            continue
+        candidates = candidates.sort_values(vorp_col, ascending=False)
+
+        vorp = candidates[vorp_col].to_numpy(dtype=float)
+        adp = candidates[adp_col].to_numpy(dtype=float)
+        if has_stdev:
+            stdev = pd.to_numeric(
+                group.loc[candidates.index, stdev_col], errors="coerce"
+            ).to_numpy(dtype=float)
+        else:
+            stdev = np.full(adp.shape, np.nan)
+
+        gone = _prob_gone_matrix(picks, adp, stdev)
+        survive = 1.0 - gone
+        all_better_gone = np.ones_like(gone)
+        all_better_gone[:, 1:] = np.cumprod(gone[:, :-1], axis=1)
+        running = np.cumsum(survive * all_better_gone * vorp, axis=1)
+
+        capped = survive >= _SURVIVAL_WALK_CAP
+        stop = np.where(capped.any(axis=1), capped.argmax(axis=1), vorp.size - 1)
+        result[str(position)] = running[rows, stop]
+
+    return result
+
+
 __all__ = [
     "prob_gone_before",
     "prob_gone_before_vectorized",
     "expected_best_vorp_at_pick",
+    "expected_best_vorp_at_picks",
 ]
@@ -23,9 +23,11 @@ Exports:
 import logging
 import time
 from collections import Counter, defaultdict
+from functools import partial
 from typing import Dict, List, Optional, Tuple
 
 try:
+    from http_client import fan_out
     from sleeper_http import (
         get_draft_picks,
         get_drafts_for_league,
@@ -33,6 +35,7 @@ try:
         get_league_users,
     )
 except ImportError:  # pragma: no cover
+    from src.http_client import fan_out
     from src.sleeper_http import (
         get_draft_picks,
         get_drafts_for_league,
@@ -118,6 +121,31 @@ def _picks_by_manager(draft_id: str) -> Dict[str, List[dict]]:
     return by_manager
 
 
+def _season_picks(league_id: Optional[str]) -> Dict[str, List[dict]]:
+    """Picks by manager for a league's first completed draft (``{}`` if none).
+
+    Fail-open per season: a drafts/picks fetch error is logged and that
+    season is simply skipped.
+    """
+    if not league_id:
+        return {}
+    try:
+        drafts = _completed_drafts(str(league_id))
+    except Exception as exc:  # pragma: no cover -- defensive, D-06
+        logger.warning("Draft intel: drafts fetch failed for %s: %s", league_id, exc)
+        return {}
+    if not drafts:
+        return {}
+    draft_id = drafts[0].get("draft_id")
+    if not draft_id:
+        return {}
+    try:
+        return _picks_by_manager(str(draft_id))
+    except Exception as exc:  # pragma: no cover -- defensive, D-06
+        logger.warning("Draft intel: picks fetch failed for %s: %s", draft_id, exc)
+        return {}
+
+
 # ---------------------------------------------------------------------------
 # Tendency math (pick data only -- no ADP)
 # ---------------------------------------------------------------------------
@@ -254,37 +282,29 @@ def build_league_draft_intel(league_id: str, max_seasons: int = 3) -> dict:
     if not chain:
         return empty
 
-    try:
-        display_map = _display_name_map(str(chain[0].get("league_id") or league_id))
-    except Exception as exc:  # pragma: no cover -- defensive, D-06
-        logger.warning("Draft intel: user lookup failed for %s: %s", league_id, exc)
-        display_map = {}
+    def _display_map() -> Dict[str, dict]:
+        try:
+            return _display_name_map(str(chain[0].get("league_id") or league_id))
+        except Exception as exc:  # pragma: no cover -- defensive, D-06
+            logger.warning("Draft intel: user lookup failed for %s: %s", league_id, exc)
+            return {}
+
+    # The chain walk is inherently sequential; everything after it is
+    # per-league and independent, so users + every season's drafts/picks are
+    # fetched concurrently. Results come back in chain order.
+    results = fan_out(
+        [_display_map]
+        + [partial(_season_picks, league.get("league_id")) for league in chain]
+    )
+    display_map = results[0] or {}
 
     manager_season_picks: Dict[str, Dict[str, List[dict]]] = defaultdict(dict)
     seasons_analyzed = 0
 
-    for league in chain:
-        lid = league.get("league_id")
-        season_label = str(league.get("season") or lid)
-        if not lid:
-            continue
-        try:
-            drafts = _completed_drafts(str(lid))
-        except Exception as exc:  # pragma: no cover -- defensive, D-06
-            logger.warning("Draft intel: drafts fetch failed for %s: %s", lid, exc)
-            continue
-        if not drafts:
-            continue
-        draft_id = drafts[0].get("draft_id")
-        if not draft_id:
-            continue
-        try:
-            by_manager = _picks_by_manager(str(draft_id))
-        except Exception as exc:  # pragma: no cover -- defensive, D-06
-            logger.warning("Draft intel: picks fetch failed for %s: %s", draft_id, exc)
-            continue
+    for league, by_manager in zip(chain, results[1:]):
         if not by_manager:
             continue
+        season_label = str(league.get("season") or league.get("league_id"))
         seasons_analyzed += 1
         for uid, picks in by_manager.items():
             manager_season_picks[uid][season_label] = picks
@@ -12,8 +12,9 @@ from __future__ import annotations
 
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Optional, Sequence, Tuple
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
 from collections import Counter
+from dataclasses import dataclass, field
 import logging
 import random
 
@@ -283,12 +284,39 @@ def roster_config_from_slots(settings: Optional[Dict]) -> Optional[Dict[str, int
 # Draft Board
 # ---------------------------------------------------------------------------
 
+# Rows whose sort value is within this of the last row taken from a group are
+# taken too, so a caller's own score (the group's sort value plus per-group
+# constants) can never rank a left-out row above an included one.
+_RANKING_TIE_TOL = 1e-6
+
+
+@dataclass
+class _PoolRanking:
+    """One sort order over the pool, split by position (and optional column).
+
+    ``groups`` maps each group key to its row numbers sorted by ``values``
+    (stable, NaN last). ``cursors`` holds, per group, the index of the first
+    entry that may still be available -- drafted rows only ever leave the
+    head, so advancing it is amortised O(1) per pick.
+    """
+
+    values: np.ndarray
+    groups: Dict[object, np.ndarray]
+    cursors: Dict[object, int] = field(default_factory=dict)
+
 
 class DraftBoard:
     """
     Tracks the state of an active fantasy draft.
 
     Maintains a pool of available players and the user's current roster.
+
+    The pool is an immutable player table plus an availability mask and a
+    player_id -> row hash, so a pick is O(1) instead of a copy of the
+    remaining frame. ``available`` is a DataFrame view materialised on read
+    (and cached until the next pick); assigning to it installs a new table.
+    Presorted per-position rankings (:meth:`top_candidates`) let the advisor
+    read only the head of the board.
     """
 
     def __init__(
@@ -320,9 +348,208 @@ class DraftBoard:
         )
         self.all_players = players.copy()
         self.available = players.copy()
+        self._pool_is_all_players = True
         self.my_roster: List[Dict] = []
         self.drafted_by_others: List[str] = []  # player_ids
 
+    # -----------------------------------------------------------------------
+    # Player pool
+    # -----------------------------------------------------------------------
+
+    @property
+    def available(self) -> pd.DataFrame:
+        """Players still on the board, in board order."""
+        if self._view is None:
+            self._view = self._pool.iloc[np.flatnonzero(self._avail)].reset_index(
+                drop=True
+            )
+        return self._view
+
+    @available.setter
+    def available(self, players: pd.DataFrame) -> None:
+        self._pool = players
+        self._avail = np.ones(len(players), dtype=bool)
+        self._view: Optional[pd.DataFrame] = players
+        self._row_lookup: Dict[str, Dict[object, List[int]]] = {}
+        self._rankings: Dict[tuple, _PoolRanking] = {}
+        self._position_keys: Optional[list] = None
+        self._position_counts: Optional[Counter] = None
+        self._pool_is_all_players = False
+
+    @property
+    def columns(self) -> pd.Index:
+        """Columns of the player table behind ``available``."""
+        return self._pool.columns
+
+    def available_count(self) -> int:
+        """Number of players still on the board."""
+        return int(self._avail.sum())
+
+    def reset_available(self) -> None:
+        """Put every player in ``all_players`` back on the board.
+
+        Equivalent to ``board.available = board.all_players.copy()``, but when
+        the table is still the one built from ``all_players`` only the mask is
+        reset, so lookups and rankings survive (replaying a pick history).
+        """
+        if self._pool_is_all_players:
+            self._restore_pool((np.ones(len(self._pool), dtype=bool), None, None, None))
+        else:
+            self.available = self.all_players.copy()
+            self._pool_is_all_players = True
+
+    def position_counts(self) -> Dict[object, int]:
+        """Available players per (raw) ``position`` value."""
+        if self._position_counts is None:
+            keys = self._pool["position"].tolist()
+            self._position_keys = keys
+            self._position_counts = Counter(
+                keys[row] for row in np.flatnonzero(self._avail)
+            )
+        return dict(self._position_counts)
+
+    def top_candidates(
+        self,
+        sort_col: str,
+        top_n: int,
+        ascending: bool = True,
+        by: Optional[str] = None,
+        fill: Optional[float] = None,
+        position_filter: Optional[Callable[[object], bool]] = None,
+    ) -> pd.DataFrame:
+        """Available players that can make the first ``top_n`` by ``sort_col``.
+
+        Takes the first ``top_n`` available rows of every position (and
+        ``by`` value) group from a presorted ranking, plus rows tied with the
+        last of them, without touching the rest of the pool. Any score that
+        is ``sort_col`` plus constants per group therefore has its true
+        ``top_n`` inside the result, so callers sort this small frame instead
+        of ``available``.
+
+        Args:
+            sort_col:        Column the groups are ranked by.
+            top_n:           Rows taken per group.
+            ascending:       Rank direction (NaN always last).
+            by:              Optional second grouping column.
+            fill:            Fill NaN in ``sort_col`` with this (as float) first.
+            position_filter: Predicate on the raw position; groups failing it
+                             are skipped.
+
+        Returns:
+            Candidate rows in board order, index reset.
+        """
+        ranking = self._ranking(sort_col, ascending, by, fill)
+        rows: List[int] = []
+        for key, order in ranking.groups.items():
+            position = key[0] if by is not None else key
+            if position_filter is not None and not position_filter(position):
+                continue
+            rows.extend(self._group_head(ranking, key, order, top_n))
+        rows.sort()
+        return self._pool.iloc[rows].reset_index(drop=True)
+
+    def _ranking(
+        self, sort_col: str, ascending: bool, by: Optional[str], fill: Optional[float]
+    ) -> _PoolRanking:
+        """Build (once per table) the grouped row order for one sort key."""
+        spec = (sort_col, ascending, by, fill)
+        ranking = self._rankings.get(spec)
+        if ranking is None:
+            values = self._pool[sort_col].reset_index(drop=True)
+            if fill is not None:
+                values = values.fillna(fill).astype(float)
+            order = values.sort_values(
+                ascending=ascending, kind="mergesort", na_position="last"
+            ).index.to_numpy()
+            rank_of = np.empty(len(order), dtype=np.int64)
+            rank_of[order] = np.arange(len(order))
+            keys = ["position"] if by is None else ["position", by]
+            grouped = self._pool[keys].reset_index(drop=True)
+            groups = {
+                key: rows[np.argsort(rank_of[rows], kind="stable")]
+                for key, rows in grouped.groupby(
+                    keys[0] if by is None else keys, dropna=False, sort=False
+                ).indices.items()
+            }
+            ranking = _PoolRanking(values=values.to_numpy(), groups=groups)
+            self._rankings[spec] = ranking
+        return ranking
+
+    def _group_head(
+        self, ranking: _PoolRanking, key: object, order: np.ndarray, top_n: int
+    ) -> List[int]:
+        """First ``top_n`` available rows of a group plus rows tied with the last."""
+        avail = self._avail
+        cursor = ranking.cursors.get(key, 0)
+        while cursor < len(order) and not avail[order[cursor]]:
+            cursor += 1
+        ranking.cursors[key] = cursor
+
+        rows: List[int] = []
+        i = cursor
+        while i < len(order) and len(rows) < top_n:
+            if avail[order[i]]:
+                rows.append(int(order[i]))
+            i += 1
+        if not rows:
+            return rows
+        last = ranking.values[rows[-1]]
+        while i < len(order):
+            row = int(order[i])
+            i += 1
+            if not avail[row]:
+                continue
+            value = ranking.values[row]
+            if pd.isna(last):
+                tied = pd.isna(value)
+            else:
+                tied = not pd.isna(value) and abs(value - last) <= _RANKING_TIE_TOL
+            if not tied:
+                break
+            rows.append(row)
+        return rows
+
+    def _rows_for(self, column: str, key: object) -> List[int]:
+        """Available rows whose ``column`` (lower-cased for names) equals ``key``."""
+        lookup = self._row_lookup.get(column)
+        if lookup is None:
+            values = self._pool[column]
+            if column == "player_name":
+                values = values.str.lower()
+            lookup = {}
+            for row, value in enumerate(values.tolist()):
+                if isinstance(value, float) and np.isnan(value):
+                    continue
+                lookup.setdefault(value, []).append(row)
+            self._row_lookup[column] = lookup
+        return [row for row in lookup.get(key, ()) if self._avail[row]]
+
+    def _drop_rows(self, rows: Sequence[int]) -> None:
+        """Mark pool rows as taken."""
+        self._avail[rows] = False
+        self._view = None
+        if self._position_counts is not None:
+            for row in rows:
+                self._position_counts[self._position_keys[row]] -= 1
+
+    def _snapshot_pool(self) -> tuple:
+        """Availability state for :meth:`_restore_pool` (table unchanged)."""
+        return (
+            self._avail.copy(),
+            self._view,
+            None if self._position_counts is None else Counter(self._position_counts),
+            {spec: dict(r.cursors) for spec, r in self._rankings.items()},
+        )
+
+    def _restore_pool(self, snapshot: tuple) -> None:
+        """Roll availability back to a :meth:`_snapshot_pool` state."""
+        avail, view, counts, cursors = snapshot
+        self._avail = avail
+        self._view = self._pool if avail.all() and view is None else view
+        self._position_counts = counts
+        for spec, ranking in self._rankings.items():
+            ranking.cursors = dict((cursors or {}).get(spec, {}))
+
     # -----------------------------------------------------------------------
     # Drafting actions
     # -----------------------------------------------------------------------
@@ -338,22 +565,22 @@ class DraftBoard:
         Returns:
             Player row as dict, or {} if not found.
         """
-        id_col = "player_id" if "player_id" in self.available.columns else None
+        id_col = "player_id" if "player_id" in self._pool.columns else None
         if id_col is None:
             logger.warning("No player_id column on draft board")
             return {}
 
-        mask = self.available[id_col] == player_id
-        if not mask.any():
+        rows = self._rows_for(id_col, player_id)
+        if not rows:
             # Try by name
-            if "player_name" in self.available.columns:
-                mask = self.available["player_name"].str.lower() == player_id.lower()
-            if not mask.any():
+            if "player_name" in self._pool.columns:
+                rows = self._rows_for("player_name", player_id.lower())
+            if not rows:
                 logger.warning(f"Player '{player_id}' not found in available pool")
                 return {}
 
-        player_row = self.available[mask].iloc[0].to_dict()
-        self.available = self.available[~mask].reset_index(drop=True)
+        player_row = self._pool.iloc[rows[0]].to_dict()
+        self._drop_rows(rows)
 
         if by_me:
             self.my_roster.append(player_row)
@@ -382,7 +609,7 @@ class DraftBoard:
         Returns:
             Number of players actually removed.
         """
-        if self.available.empty or not names_or_ids:
+        if self.available_count() == 0 or not names_or_ids:
             return 0
         try:
             from src.sleeper_player_map import normalize_name
@@ -393,34 +620,40 @@ class DraftBoard:
         norm_keys = {normalize_name(k) for k in keys}
         norm_keys.discard("")
 
-        mask = pd.Series(False, index=self.available.index)
-        if "player_id" in self.available.columns:
-            mask |= self.available["player_id"].astype(str).isin(keys)
-        if "player_name" in self.available.columns:
+        rows = np.flatnonzero(self._avail)
+        pool = self._pool.iloc[rows]
+        mask = np.zeros(len(rows), dtype=bool)
+        if "player_id" in pool.columns:
+            mask |= pool["player_id"].astype(str).isin(keys).to_numpy()
+        if "player_name" in pool.columns:
             mask |= (
-                self.available["player_name"]
+                pool["player_name"]
                 .astype(str)
                 .map(normalize_name)
                 .isin(norm_keys)
+                .to_numpy()
             )
         removed = int(mask.sum())
         if removed:
-            self.available = self.available[~mask].reset_index(drop=True)
+            self._drop_rows(rows[mask])
         return removed
 
     def draft_by_name(self, name: str, by_me: bool = False) -> Dict:
         """Draft a player by (partial) name match."""
-        if "player_name" not in self.available.columns:
+        if "player_name" not in self._pool.columns:
             return {}
+        rows = np.flatnonzero(self._avail)
         mask = (
-            self.available["player_name"]
+            self._pool["player_name"]
+            .iloc[rows]
             .str.lower()
             .str.contains(name.lower(), na=False)
+            .to_numpy()
         )
         if not mask.any():
             logger.warning(f"Player '{name}' not found")
             return {}
-        player_id = self.available[mask].iloc[0].get("player_id", name)
+        player_id = self._pool.iloc[rows[mask.argmax()]].get("player_id", name)
         return self.draft_player(player_id, by_me=by_me)
 
     # -----------------------------------------------------------------------
@@ -511,9 +744,18 @@ class DraftAdvisor:
         Returns:
             DataFrame of top available players.
         """
-        avail = self.board.available.copy()
-        if positions:
-            avail = avail[avail["position"].isin(positions)]
+        board = self.board
+        if "position" in board.columns and "model_rank" in board.columns:
+            wanted = set(positions) if positions else None
+            avail = board.top_candidates(
+                "model_rank",
+                top_n,
+                position_filter=(lambda pos: pos in wanted) if wanted else None,
+            )
+        else:
+            avail = board.available.copy()
+            if positions:
+                avail = avail[avail["position"].isin(positions)]
         return avail.sort_values("model_rank").head(top_n).reset_index(drop=True)
 
     def recommend(
@@ -531,19 +773,52 @@ class DraftAdvisor:
         Returns:
             (DataFrame of recommended players, reasoning string)
         """
-        avail = self.board.available.copy()
-        if avail.empty:
+        board = self.board
+        if board.available_count() == 0:
             return pd.DataFrame(), "Draft board is empty."
 
+        # Score each available player by VORP — value over replacement, not raw
+        # points. Raw points over-value QBs in PPR (a QB's 350 pts dwarf a WR's
+        # 300, yet the QB's marginal value over a streamer is tiny). VORP already
+        # encodes positional scarcity, so it is the correct draft-day signal.
+        pts_col = (
+            "projected_season_points"
+            if "projected_season_points" in board.columns
+            else "projected_points"
+        )
+        score_col = "vorp" if "vorp" in board.columns else pts_col
+
         # Never recommend a position the roster shape can't start at all (e.g.
         # K/DST in a no-kicker Sleeper league) -- those players carry NaN VORP
         # by design (see replacement_ranks_for) and would otherwise poison
         # total_vorp the moment one gets drafted.
-        elig = draftable_positions(self.board.roster_config)
-        if "position" in avail.columns:
-            avail = avail[avail["position"].astype(str).str.upper().isin(elig)]
-        if avail.empty:
-            return pd.DataFrame(), "No draftable players remain."
+        elig = draftable_positions(board.roster_config)
+        if "position" in board.columns and score_col in board.columns:
+            counts = {
+                pos: n
+                for pos, n in board.position_counts().items()
+                if str(pos).upper() in elig
+            }
+            if not any(counts.values()):
+                return pd.DataFrame(), "No draftable players remain."
+            # Every adjustment below is a per-position or per-value-tier
+            # constant, so only the head of each position/tier VORP ranking
+            # can reach the top_n.
+            avail = board.top_candidates(
+                score_col,
+                top_n,
+                ascending=False,
+                by="value_tier" if "value_tier" in board.columns else None,
+                fill=0.0,
+                position_filter=lambda pos: str(pos).upper() in elig,
+            )
+        else:
+            avail = board.available.copy()
+            if "position" in avail.columns:
+                avail = avail[avail["position"].astype(str).str.upper().isin(elig)]
+            if avail.empty:
+                return pd.DataFrame(), "No draftable players remain."
+            counts = avail["position"].value_counts().to_dict()
 
         needs = self.board.remaining_needs()
         my_picks = self.board.my_pick_count()
@@ -552,20 +827,13 @@ class DraftAdvisor:
         reasoning_parts = []
 
         # Positional scarcity alerts
-        scarcity = self._scarcity_alerts(avail)
+        scarcity = self._scarcity_alerts(counts)
         reasoning_parts.extend(scarcity)
 
-        # Score each available player by VORP — value over replacement, not raw
-        # points. Raw points over-value QBs in PPR (a QB's 350 pts dwarf a WR's
-        # 300, yet the QB's marginal value over a streamer is tiny). VORP already
-        # encodes positional scarcity, so it is the correct draft-day signal.
-        pts_col = (
-            "projected_season_points"
-            if "projected_season_points" in avail.columns
-            else "projected_points"
-        )
-        score_col = "vorp" if "vorp" in avail.columns else pts_col
-        avail["recommendation_score"] = avail[score_col].fillna(0).astype(float)
+        # Adjustments are applied to a plain array (same float ops, same order
+        # as per-column .loc updates) -- this runs on every live-draft poll.
+        score = avail[score_col].fillna(0).astype(float).to_numpy(copy=True)
+        position = avail["position"].to_numpy()
 
         # Nudge toward unfilled STARTING slots so the board builds a legal lineup
         # rather than pure best-available. Modest vs VORP's spread (~200) — a
@@ -573,19 +841,20 @@ class DraftAdvisor:
         for pos, count_needed in needs.items():
             if count_needed > 0 and pos in ("QB", "RB", "WR", "TE"):
                 boost = min(count_needed * 8, 16)
-                avail.loc[avail["position"] == pos, "recommendation_score"] += boost
+                score[position == pos] += boost
 
         # FLEX slots still open → gently favor flex-eligible (RB/WR/TE).
         flex_need = needs.get("FLEX", 0)
         if flex_need > 0:
-            avail.loc[
-                avail["position"].isin(FLEX_ELIGIBLE), "recommendation_score"
-            ] += min(flex_need * 3, 9)
+            score[avail["position"].isin(FLEX_ELIGIBLE).to_numpy()] += min(
+                flex_need * 3, 9
+            )
 
         # ADP value tiers: reward fallers, fade reaches.
         if "value_tier" in avail.columns:
-            avail.loc[avail["value_tier"] == "undervalued", "recommendation_score"] += 6
-            avail.loc[avail["value_tier"] == "overvalued", "recommendation_score"] -= 6
+            tier = avail["value_tier"].to_numpy()
+            score[tier == "undervalued"] += 6
+            score[tier == "overvalued"] -= 6
 
         # Positional saturation: VORP alone hoards a deep position (e.g. 6 TEs) — it
         # has no roster sense. Past a sane per-position roster cap, extra depth is
@@ -623,11 +892,15 @@ class DraftAdvisor:
                     unit = 40
                 else:
                     unit = 25
-                avail.loc[avail["position"] == pos, "recommendation_score"] -= unit * (
-                    over + 1
-                )
+                score[position == pos] -= unit * (over + 1)
 
-        recs = avail.sort_values("recommendation_score", ascending=False).head(top_n)
+        avail["recommendation_score"] = score
+
+        # Stable sort: equal scores keep board order, so a pick is a pure
+        # function of board state (mock_draft_batch replays it exactly).
+        recs = avail.sort_values(
+            "recommendation_score", ascending=False, kind="mergesort"
+        ).head(top_n)
 
         # Build reasoning string
         needs_str = (
@@ -654,7 +927,7 @@ class DraftAdvisor:
         """
         board = self.board
         saved_roster = list(board.my_roster)
-        saved_available = board.available.copy()
+        saved_pool = board._snapshot_pool()
         queue: List[Dict] = []
         try:
             for _ in range(max(0, depth)):
@@ -675,17 +948,21 @@ class DraftAdvisor:
                 board.draft_player(str(key), by_me=True)
         finally:
             board.my_roster = saved_roster
-            board.available = saved_available
+            board._restore_pool(saved_pool)
         return queue
 
-    def _scarcity_alerts(self, avail: pd.DataFrame) -> List[str]:
-        """Detect positions with low remaining top-tier talent."""
+    def _scarcity_alerts(self, counts: Dict[object, int]) -> List[str]:
+        """Detect positions with low remaining top-tier talent.
+
+        Args:
+            counts: Draftable players left per position.
+        """
         alerts = []
         SCARCITY_THRESHOLDS = {"QB": 5, "RB": 10, "WR": 12, "TE": 5}
         for pos, threshold in SCARCITY_THRESHOLDS.items():
-            pos_avail = avail[avail["position"] == pos]
-            if len(pos_avail) <= threshold:
-                alerts.append(f"SCARCITY: Only {len(pos_avail)} {pos}s left!")
+            n_left = counts.get(pos, 0)
+            if n_left <= threshold:
+                alerts.append(f"SCARCITY: Only {n_left} {pos}s left!")
         return alerts
 
     def undervalued_players(self, top_n: int = 10) -> pd.DataFrame:
@@ -1033,6 +1310,7 @@ class MockDraftSimulator:
         randomness: int = 3,
         draft_type: str = "snake",
         behavior: Optional[Dict] = None,
+        seed: Optional[int] = None,
     ):
         """
         Args:
@@ -1055,6 +1333,11 @@ class MockDraftSimulator:
                         ``temperature`` (default 3.0) -- softmax-style temperature
                         for the ADP-noise draw; lower = closer to strict ADP,
                         higher = more reaches/slides.
+            seed:       Seeds a private ``random.Random`` for opponent picks so
+                        a draft is reproducible (and replayable from
+                        :class:`mock_draft_batch.MockDraftBatch`'s per-draft
+                        seeds). None draws from the global ``random`` module,
+                        as before.
         """
         if user_pick < 1 or user_pick > n_teams:
             raise ValueError(
@@ -1070,6 +1353,7 @@ class MockDraftSimulator:
         self.behavior: Dict[str, float] = {"run_factor": 1.5, "temperature": 3.0}
         if behavior:
             self.behavior.update(behavior)
+        self._rng = random.Random(seed) if seed is not None else random
 
         # Per-opponent-slot roster tracking (position strings only -- enough
         # to enforce depth caps) and a chronological log of recent pick
@@ -1210,7 +1494,9 @@ class MockDraftSimulator:
             if ("adp_rank" in avail.columns and avail["adp_rank"].notna().any())
             else "model_rank"
         )
-        pool = avail.sort_values(sort_col, na_position="last").reset_index(drop=True)
+        pool = avail.sort_values(
+            sort_col, na_position="last", kind="mergesort"
+        ).reset_index(drop=True)
 
         slot = self._slot_for_pick(pick_number)
         round_number = (pick_number - 1) // self.n_teams + 1
@@ -1260,7 +1546,7 @@ class MockDraftSimulator:
                 for w, p in zip(weights, top_candidates["position"])
             ]
 
-        idx = random.choices(range(len(top_candidates)), weights=weights, k=1)[0]
+        idx = self._rng.choices(range(len(top_candidates)), weights=weights, k=1)[0]
         player_row = top_candidates.iloc[idx]
 
         player_id = player_row.get("player_id", player_row.get("player_name", ""))
@@ -12,6 +12,7 @@ Exports:
     make_lgb_model: Factory for LGBMRegressor.
     make_cb_model: Factory for CatBoostRegressor.
     walk_forward_cv_with_oof: Generalized walk-forward CV producing OOF predictions.
+    game_cv_result: Convert walk_forward_runner folds to (result, oof_df).
     assemble_oof_matrix: Join base model OOF predictions into stacking matrix.
     train_ridge_meta: Train RidgeCV meta-learner on OOF matrix.
     train_ensemble: Full pipeline -- train all base models + Ridge for spread and total.
@@ -23,6 +24,7 @@ import json
 import os
 import pickle
 from datetime import datetime
+from functools import partial
 from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import catboost as cb
@@ -35,6 +37,7 @@ from sklearn.metrics import mean_absolute_error
 
 from model_provenance import build_provenance
 from model_training import WalkForwardResult
+from walk_forward_runner import CvJob, FoldResult, run_cv_jobs
 from config import (
     CB_CONSERVATIVE_PARAMS,
     CONSERVATIVE_PARAMS,
@@ -103,11 +106,14 @@ def walk_forward_cv_with_oof(
     model_factory: Callable[[], Any],
     fit_kwargs_fn: Optional[Callable] = None,
     val_seasons: Optional[List[int]] = None,
+    workers: Optional[int] = None,
 ) -> Tuple[WalkForwardResult, pd.DataFrame]:
     """Run walk-forward cross-validation producing out-of-fold predictions.
 
     For each validation season, trains on all prior seasons and validates
     on that single season. Collects OOF predictions for the meta-learner.
+    Folds run through ``walk_forward_runner.run_cv_jobs`` on a shared
+    design matrix.
 
     Args:
         all_data: DataFrame with feature columns, target column, and 'season'.
@@ -118,88 +124,48 @@ def walk_forward_cv_with_oof(
             of extra kwargs for model.fit(). Handles API differences between
             XGBoost, LightGBM, and CatBoost.
         val_seasons: Seasons to validate on. Defaults to VALIDATION_SEASONS.
+        workers: Fold processes (default CV_WORKERS; 1 = serial).
 
     Returns:
         Tuple of (WalkForwardResult, oof_df) where oof_df has columns
-        [game_id, season, oof_prediction].
+        [game_id, season, oof_prediction]. Each fold detail also carries
+        'seconds' and 'peak_rss_mb'.
 
     Raises:
         ValueError: If a validation season equals HOLDOUT_SEASON.
     """
-    if val_seasons is None:
-        val_seasons = VALIDATION_SEASONS
-
-    fold_maes: List[float] = []
-    fold_details: List[Dict[str, Any]] = []
-    oof_records: List[pd.DataFrame] = []
-
-    for val_season in val_seasons:
-        if val_season == HOLDOUT_SEASON:
-            raise ValueError(
-                f"Validation season {val_season} equals HOLDOUT_SEASON "
-                f"{HOLDOUT_SEASON}. The holdout season must never be used "
-                "during cross-validation."
-            )
-
-        train = all_data[all_data["season"] < val_season]
-        val = all_data[all_data["season"] == val_season]
-
-        if train.empty or val.empty:
-            continue
-
-        train_seasons = sorted(train["season"].unique().tolist())
-
-        X_train = train[feature_cols]
-        y_train = train[target_col]
-        X_val = val[feature_cols]
-        y_val = val[target_col]
-
-        model = model_factory()
+    job = CvJob(
+        frame=all_data,
+        feature_cols=list(feature_cols),
+        target_col=target_col,
+        model_factory=model_factory,
+        fit_kwargs_fn=fit_kwargs_fn,
+        val_seasons=VALIDATION_SEASONS if val_seasons is None else val_seasons,
+    )
+    return game_cv_result(all_data, run_cv_jobs([job], workers=workers)[0])
 
-        # Build fit kwargs
-        fit_kw: Dict[str, Any] = {}
-        if fit_kwargs_fn is not None:
-            fit_kw = fit_kwargs_fn(X_train, y_train, X_val, y_val)
-
-        model.fit(X_train, y_train, **fit_kw)
-
-        preds = model.predict(X_val)
-        mae = float(mean_absolute_error(y_val, preds))
-        fold_maes.append(mae)
-
-        fold_details.append(
-            {
-                "train_seasons": train_seasons,
-                "val_season": val_season,
-                "train_size": len(train),
-                "val_size": len(val),
-                "mae": mae,
-            }
-        )
 
-        # Collect OOF predictions
-        oof_fold = pd.DataFrame(
-            {
-                "game_id": val["game_id"].values,
-                "season": val["season"].values,
-                "oof_prediction": preds,
-            }
-        )
-        oof_records.append(oof_fold)
-
-    mean_mae = float(np.mean(fold_maes)) if fold_maes else 0.0
+def game_cv_result(
+    all_data: pd.DataFrame, folds: List[FoldResult]
+) -> Tuple[WalkForwardResult, pd.DataFrame]:
+    """Turn ``run_cv_jobs`` folds into (WalkForwardResult, oof_df by game_id)."""
+    fold_maes = [f.mae for f in folds]
     result = WalkForwardResult(
-        mean_mae=mean_mae,
+        mean_mae=float(np.mean(fold_maes)) if fold_maes else 0.0,
         fold_maes=fold_maes,
-        fold_details=fold_details,
+        fold_details=[f.detail() for f in folds],
     )
-
-    oof_df = (
-        pd.concat(oof_records, ignore_index=True)
-        if oof_records
-        else pd.DataFrame(columns=["game_id", "season", "oof_prediction"])
+    if not folds:
+        return result, pd.DataFrame(columns=["game_id", "season", "oof_prediction"])
+
+    pos = np.concatenate([f.val_positions for f in folds])
+    oof_df = pd.DataFrame(
+        {
+            "game_id": all_data["game_id"].values[pos],
+            "season": all_data["season"].values[pos],
+            "oof_prediction": np.concatenate([f.predictions for f in folds]),
+        }
     )
-
     return result, oof_df
 
 
@@ -524,31 +490,33 @@ def train_ensemble(
         }),
     }
 
-    for target_name, target_col in targets.items():
-        # --- Walk-forward CV with OOF for each base learner ---
-        xgb_result, xgb_oof = walk_forward_cv_with_oof(
-            all_data,
-            feature_cols,
-            target_col,
-            model_factory=lambda: make_xgb_model(xgb_params),
-            fit_kwargs_fn=_xgb_fit_kwargs,
-        )
-
-        lgb_result, lgb_oof = walk_forward_cv_with_oof(
-            all_data,
-            feature_cols,
-            target_col,
-            model_factory=lambda: make_lgb_model(lgb_params),
-            fit_kwargs_fn=_lgb_fit_kwargs,
-        )
+    # --- Walk-forward CV with OOF for each base learner and target ---
+    # One batch: the six runs share the feature matrices and their folds
+    # can run concurrently (CV_WORKERS).
+    learners = [
+        (partial(make_xgb_model, xgb_params), _xgb_fit_kwargs),
+        (partial(make_lgb_model, lgb_params), _lgb_fit_kwargs),
+        (partial(make_cb_model, cb_params), _cb_fit_kwargs),
+    ]
+    cv_folds = run_cv_jobs(
+        [
+            CvJob(
+                frame=all_data,
+                feature_cols=list(feature_cols),
+                target_col=target_col,
+                model_factory=factory,
+                fit_kwargs_fn=fit_kwargs_fn,
+                val_seasons=VALIDATION_SEASONS,
+            )
+            for target_col in targets.values()
+            for factory, fit_kwargs_fn in learners
+        ]
+    )
 
-        cb_result, cb_oof = walk_forward_cv_with_oof(
-            all_data,
-            feature_cols,
-            target_col,
-            model_factory=lambda: make_cb_model(cb_params),
-            fit_kwargs_fn=_cb_fit_kwargs,
-        )
+    for t, (target_name, target_col) in enumerate(targets.items()):
+        xgb_result, xgb_oof = game_cv_result(all_data, cv_folds[3 * t])
+        lgb_result, lgb_oof = game_cv_result(all_data, cv_folds[3 * t + 1])
+        cb_result, cb_oof = game_cv_result(all_data, cv_folds[3 * t + 2])
 
         # --- Assemble OOF matrix and select meta-learner by season-out CV ---
         oof_matrix = assemble_oof_matrix(
@@ -22,6 +22,8 @@ from typing import List, Optional
 
 import pandas as pd
 
+from src.partition_manifest import record_partition_write
+
 logger = logging.getLogger(__name__)
 
 # Canonical Silver columns in declared order.
@@ -237,5 +239,6 @@ class SilverConsolidator:
         ts = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
         out_path = week_dir / f"external_projections_{ts}.parquet"
         df.to_parquet(out_path, index=False)
+        record_partition_write(out_path)
         logger.info("Wrote %d rows to %s", len(df), out_path)
         return out_path
@@ -0,0 +1,461 @@
+"""Dependency-aware execution of DataFrame-producing tasks.
+
+A feature build is described as a list of :class:`DagTask` — each task is a
+picklable ``func(*input_frames, **kwargs) -> DataFrame`` plus the keys of the
+tasks whose outputs it consumes. :func:`run_dag` runs the graph:
+
+* **Serially** (``workers=1``): topological order in this process, outputs
+  kept in memory and released once their last consumer has run.
+* **On a process pool** (``workers>1``): every task whose inputs are ready
+  is submitted. Outputs never travel back through the pool's pipes — the
+  worker writes them to an uncompressed Arrow IPC file in a scratch
+  directory and downstream workers memory-map that file, so a Bronze frame
+  loaded once is shared by every consumer (and every season) that needs it.
+  Frames Arrow cannot represent (mixed-type object columns) fall back to a
+  pickle file. Intermediate files are deleted as soon as their last
+  consumer finishes.
+
+An input may also be a *tuple* of keys; the function then receives a list
+of those frames (e.g. one Bronze frame per prior season), so multi-season
+inputs are assembled in the consumer instead of being materialized once per
+season.
+
+:func:`dag_fingerprints` gives every task a content fingerprint — its code
+(:func:`code_fingerprint`), kwargs, ``salt`` (e.g. a hash of the files a
+loader reads) and the fingerprints of its inputs — so callers can skip
+tasks whose saved output was produced by an identical fingerprint.
+
+Usage
+-----
+::
+
+    from feature_dag import DagTask, run_dag
+
+    tasks = [
+        DagTask("pbp", load_pbp, kwargs={"season": 2024}),
+        DagTask("scheme", compute_scheme, inputs=("pbp",)),
+    ]
+    frames = run_dag(tasks, targets=["scheme"], workers=4)
+"""
+
+import hashlib
+import inspect
+import logging
+import os
+import pickle
+import re
+import shutil
+import tempfile
+import time
+import types
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from dataclasses import dataclass, field
+from functools import partial
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
+
+import pandas as pd
+import pyarrow as pa
+
+try:
+    from season_parallel import resolve_in_flight
+except ImportError:  # pragma: no cover
+    from src.season_parallel import resolve_in_flight
+
+logger = logging.getLogger(__name__)
+
+InputSpec = Union[str, Tuple[str, ...]]
+
+_SRC_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+@dataclass(frozen=True)
+class DagTask:
+    """One node of the graph.
+
+    Attributes:
+        key: Unique task name.
+        func: Module-level (picklable) ``func(*inputs, **kwargs)`` returning
+            a DataFrame.
+        inputs: Upstream keys, passed positionally as DataFrames; a tuple of
+            keys is passed as a list of DataFrames.
+        kwargs: Static keyword arguments (must be picklable and have a
+            stable ``repr`` for fingerprinting).
+        salt: Extra fingerprint material, e.g. a hash of the files the task
+            reads itself.
+    """
+
+    key: str
+    func: Callable[..., pd.DataFrame]
+    inputs: Tuple[InputSpec, ...] = ()
+    kwargs: Mapping[str, Any] = field(default_factory=dict)
+    salt: str = ""
+
+    def input_keys(self) -> List[str]:
+        """Flattened upstream keys in argument order."""
+        keys: List[str] = []
+        for spec in self.inputs:
+            keys.extend(spec if isinstance(spec, tuple) else (spec,))
+        return keys
+
+
+# ---------------------------------------------------------------------------
+# Fingerprints
+# ---------------------------------------------------------------------------
+
+
+def _code_objects(code: types.CodeType) -> Iterable[types.CodeType]:
+    yield code
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            yield from _code_objects(const)
+
+
+def _collect_code(
+    obj: Any, root_module: str, files: Set[str], sources: List[str], seen: Set[int]
+) -> None:
+    """Gather what ``obj``'s behaviour depends on.
+
+    Project modules under ``src/`` count as whole files (and their imports,
+    transitively). Functions defined in the caller's own module (a script)
+    count by source, plus whatever globals they reference by name.
+    Everything else (stdlib, third-party) is ignored.
+    """
+    if id(obj) in seen:
+        return
+    seen.add(id(obj))
+    if isinstance(obj, partial):
+        _collect_code(obj.func, root_module, files, sources, seen)
+        return
+    module = obj if isinstance(obj, types.ModuleType) else inspect.getmodule(obj)
+    path = getattr(module, "__file__", None)
+    if path and os.path.abspath(path).startswith(_SRC_DIR + os.sep):
+        path = os.path.abspath(path)
+        if path not in files:
+            files.add(path)
+            for value in list(vars(module).values()):
+                if isinstance(value, (types.ModuleType, types.FunctionType, type)):
+                    _collect_code(value, root_module, files, sources, seen)
+        return
+    if isinstance(obj, types.FunctionType) and obj.__module__ == root_module:
+        try:
+            sources.append(inspect.getsource(obj))
+        except (OSError, TypeError):
+            sources.append(obj.__code__.co_code.hex())
+        names: Set[str] = set()
+        for code in _code_objects(obj.__code__):
+            names.update(code.co_names)
+        for name in sorted(names):
+            if name in obj.__globals__:
+                _collect_code(obj.__globals__[name], root_module, files, sources, seen)
+
+
+def code_fingerprint(func: Callable[..., Any]) -> str:
+    """Hash of the code ``func`` runs.
+
+    Covers the source of ``func`` (and of helpers it references by name)
+    when it lives outside ``src/``, and the full text of every ``src/``
+    module it reaches, followed transitively through their imports.
+    Editing any of that code changes the fingerprint; editing unrelated
+    modules does not.
+    """
+    files: Set[str] = set()
+    sources: List[str] = []
+    root = func.func if isinstance(func, partial) else func
+    _collect_code(func, getattr(root, "__module__", ""), files, sources, set())
+    digest = hashlib.blake2b(digest_size=16)
+    for path in sorted(files):
+        digest.update(os.path.relpath(path, _SRC_DIR).encode())
+        with open(path, "rb") as f:
+            digest.update(f.read())
+    for source in sources:
+        digest.update(source.encode())
+    return digest.hexdigest()
+
+
+def file_fingerprint(paths: Sequence[str]) -> str:
+    """Hash of the names and contents of ``paths`` (order-sensitive)."""
+    digest = hashlib.blake2b(digest_size=16)
+    for path in paths:
+        digest.update(os.path.basename(path).encode())
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                digest.update(chunk)
+    return digest.hexdigest()
+
+
+def dag_fingerprints(tasks: Sequence[DagTask]) -> Dict[str, str]:
+    """Content fingerprint of every task's output.
+
+    A task's fingerprint changes when its code, kwargs or salt change, or
+    when any upstream fingerprint does.
+    """
+    by_key = _index(tasks)
+    code_cache: Dict[int, str] = {}
+    out: Dict[str, str] = {}
+    for key in _topological(by_key, list(by_key)):
+        task = by_key[key]
+        func_id = id(task.func)
+        if func_id not in code_cache:
+            code_cache[func_id] = code_fingerprint(task.func)
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(code_cache[func_id].encode())
+        digest.update(repr(sorted(task.kwargs.items())).encode())
+        digest.update(task.salt.encode())
+        for spec in task.inputs:
+            keys = spec if isinstance(spec, tuple) else (spec,)
+            digest.update(repr([out[k] for k in keys]).encode())
+        out[key] = digest.hexdigest()
+    return out
+
+
+# ---------------------------------------------------------------------------
+# Graph helpers
+# ---------------------------------------------------------------------------
+
+
+def _index(tasks: Sequence[DagTask]) -> Dict[str, DagTask]:
+    by_key: Dict[str, DagTask] = {}
+    for task in tasks:
+        if task.key in by_key:
+            raise ValueError(f"duplicate task key: {task.key!r}")
+        by_key[task.key] = task
+    for task in tasks:
+        missing = [k for k in task.input_keys() if k not in by_key]
+        if missing:
+            raise ValueError(f"task {task.key!r} has unknown inputs: {missing}")
+    return by_key
+
+
+def _topological(by_key: Dict[str, DagTask], keys: Sequence[str]) -> List[str]:
+    """Stable topological order of ``keys`` and all their ancestors."""
+    needed: Set[str] = set()
+    stack = list(keys)
+    while stack:
+        key = stack.pop()
+        if key not in needed:
+            needed.add(key)
+            stack.extend(by_key[key].input_keys())
+
+    order: List[str] = []
+    done: Set[str] = set()
+    pending = [k for k in by_key if k in needed]
+    while pending:
+        progressed = [
+            k for k in pending if all(i in done for i in by_key[k].input_keys())
+        ]
+        if not progressed:
+            raise ValueError(f"dependency cycle among tasks: {sorted(pending)}")
+        for key in progressed:
+            order.append(key)
+            done.add(key)
+        pending = [k for k in pending if k not in done]
+    return order
+
+
+def _call(task: DagTask, frames: Mapping[str, pd.DataFrame]) -> pd.DataFrame:
+    args = [
+        [frames[k] for k in spec] if isinstance(spec, tuple) else frames[spec]
+        for spec in task.inputs
+    ]
+    result = task.func(*args, **dict(task.kwargs))
+    return result if result is not None else pd.DataFrame()
+
+
+# ---------------------------------------------------------------------------
+# Frame files (process-pool path)
+# ---------------------------------------------------------------------------
+
+
+def _write_frame(df: pd.DataFrame, stem: str) -> str:
+    """Write ``df`` as Arrow IPC (pickle when Arrow cannot hold it)."""
+    try:
+        table = pa.Table.from_pandas(df)
+    except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+        table = None
+    except (TypeError, ValueError):
+        table = None
+    if table is None:
+        path = f"{stem}.pkl"
+        with open(path, "wb") as f:
+            pickle.dump(df, f, protocol=pickle.HIGHEST_PROTOCOL)
+        return path
+    path = f"{stem}.arrow"
+    with pa.OSFile(path, "wb") as sink:
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+    return path
+
+
+def _read_frame(path: str) -> pd.DataFrame:
+    """Read a frame written by :func:`_write_frame` (Arrow memory-mapped)."""
+    if path.endswith(".pkl"):
+        with open(path, "rb") as f:
+            return pickle.load(f)
+    with pa.memory_map(path, "r") as source:
+        table = pa.ipc.open_file(source).read_all()
+    return table.to_pandas()
+
+
+def _execute(task: DagTask, input_paths: Mapping[str, str], stem: str):
+    """Pool worker: read inputs, run the task, write its output file."""
+    start = time.perf_counter()
+    frames = {key: _read_frame(path) for key, path in input_paths.items()}
+    result = _call(task, frames)
+    return _write_frame(result, stem), len(result), time.perf_counter() - start
+
+
+def _stem(scratch: str, index: int, key: str) -> str:
+    return os.path.join(scratch, f"{index:05d}_{re.sub(r'[^A-Za-z0-9_.-]', '_', key)}")
+
+
+# ---------------------------------------------------------------------------
+# Execution
+# ---------------------------------------------------------------------------
+
+
+def run_dag(
+    tasks: Sequence[DagTask],
+    targets: Optional[Sequence[str]] = None,
+    workers: int = 1,
+    task_mb: int = 0,
+    scratch_dir: Optional[str] = None,
+    on_result: Optional[Callable[[str, pd.DataFrame], None]] = None,
+) -> Dict[str, pd.DataFrame]:
+    """Run the tasks needed for ``targets`` and return the target frames.
+
+    Args:
+        tasks: The graph. Tasks not needed by any target are not run.
+        targets: Keys whose outputs are wanted (default: every task).
+        workers: Process count; 1 runs serially in this process.
+        task_mb: Per-task peak memory estimate; caps concurrent tasks at
+            available memory / ``task_mb`` (0 disables the cap).
+        scratch_dir: Parent directory for the pool's Arrow files (default:
+            the system temp dir). The run's own subdirectory is removed.
+        on_result: Called in this process as each target completes. When
+            given, target frames are handed over instead of collected (so a
+            long run does not hold every output) and the result is empty.
+
+    Returns:
+        ``{target_key: DataFrame}``. An exception in any task propagates.
+    """
+    by_key = _index(tasks)
+    targets = list(by_key) if targets is None else list(dict.fromkeys(targets))
+    order = _topological(by_key, targets)
+    wanted = set(targets)
+
+    consumers: Dict[str, int] = {key: 0 for key in order}
+    for key in order:
+        for upstream in set(by_key[key].input_keys()):
+            consumers[upstream] += 1
+
+    in_flight = resolve_in_flight(workers, len(order), task_mb)
+    if in_flight <= 1:
+        return _run_serial(by_key, order, wanted, consumers, on_result)
+
+    logger.info("Running %d tasks on %d processes", len(order), in_flight)
+    scratch = tempfile.mkdtemp(prefix="feature_dag_", dir=scratch_dir)
+    try:
+        return _run_pool(
+            by_key, order, wanted, consumers, in_flight, scratch, on_result
+        )
+    finally:
+        shutil.rmtree(scratch, ignore_errors=True)
+
+
+def _run_serial(
+    by_key: Dict[str, DagTask],
+    order: List[str],
+    wanted: Set[str],
+    consumers: Dict[str, int],
+    on_result: Optional[Callable[[str, pd.DataFrame], None]],
+) -> Dict[str, pd.DataFrame]:
+    frames: Dict[str, pd.DataFrame] = {}
+    results: Dict[str, pd.DataFrame] = {}
+    for key in order:
+        task = by_key[key]
+        start = time.perf_counter()
+        frames[key] = _call(task, frames)
+        logger.debug(
+            "Task %s: %d rows (%.1fs)",
+            key,
+            len(frames[key]),
+            time.perf_counter() - start,
+        )
+        if key in wanted:
+            if on_result is not None:
+                on_result(key, frames[key])
+            else:
+                results[key] = frames[key]
+        for upstream in set(task.input_keys()):
+            consumers[upstream] -= 1
+            if consumers[upstream] == 0:
+                del frames[upstream]
+        if consumers[key] == 0:
+            del frames[key]
+    return results
+
+
+def _run_pool(
+    by_key: Dict[str, DagTask],
+    order: List[str],
+    wanted: Set[str],
+    consumers: Dict[str, int],
+    in_flight: int,
+    scratch: str,
+    on_result: Optional[Callable[[str, pd.DataFrame], None]],
+) -> Dict[str, pd.DataFrame]:
+    paths: Dict[str, str] = {}
+    results: Dict[str, pd.DataFrame] = {}
+    waiting = deque(order)
+    running: Dict[Any, str] = {}
+    index = {key: i for i, key in enumerate(order)}
+
+    with ProcessPoolExecutor(max_workers=in_flight) as pool:
+        try:
+            while waiting or running:
+                # Submit every ready task (in topological order) up to the cap.
+                for key in list(waiting):
+                    if len(running) >= in_flight:
+                        break
+                    task = by_key[key]
+                    if all(k in paths for k in task.input_keys()):
+                        waiting.remove(key)
+                        inputs = {k: paths[k] for k in task.input_keys()}
+                        stem = _stem(scratch, index[key], key)
+                        running[pool.submit(_execute, task, inputs, stem)] = key
+                done, _ = wait(list(running), return_when=FIRST_COMPLETED)
+                for future in done:
+                    key = running.pop(future)
+                    paths[key], rows, seconds = future.result()
+                    logger.info("Task %s: %d rows (%.1fs)", key, rows, seconds)
+                    if key in wanted:
+                        frame = _read_frame(paths[key])
+                        if on_result is not None:
+                            on_result(key, frame)
+                        else:
+                            results[key] = frame
+                        del frame
+                    for upstream in set(by_key[key].input_keys()):
+                        consumers[upstream] -= 1
+                        if consumers[upstream] == 0:
+                            try:
+                                os.remove(paths[upstream])
+                            except OSError:
+                                pass
+        except BaseException:
+            pool.shutdown(wait=True, cancel_futures=True)
+            raise
+    return results
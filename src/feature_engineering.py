@@ -11,7 +11,7 @@ Exports:
     SILVER_TEAM_SOURCES: Mapping of source name to local subdirectory.
 """
 
-import glob
+import functools
 import os
 from typing import List, Optional
 
@@ -25,6 +25,8 @@ from config import (
     SILVER_TEAM_LOCAL_DIRS,
     TEAM_DIVISIONS,
 )
+from partition_reader import read_partition
+from season_parallel import map_seasons
 from team_analytics import apply_team_rolling
 
 # Base directories for local data
@@ -74,15 +76,7 @@ def _read_latest_local(subdir: str, season: int) -> pd.DataFrame:
     Returns:
         DataFrame from latest parquet file, or empty DataFrame if not found.
     """
-    candidates = []
-    for pattern in (
-        os.path.join(SILVER_DIR, subdir, f"season={season}", "*.parquet"),
-        os.path.join(SILVER_DIR, subdir, f"season={season}", "week=*", "*.parquet"),
-    ):
-        candidates.extend(glob.glob(pattern))
-    if not candidates:
-        return pd.DataFrame()
-    return pd.read_parquet(max(candidates, key=os.path.basename))
+    return read_partition(SILVER_DIR, subdir, season, weeks="latest")
 
 
 def _read_bronze_schedules(season: int) -> pd.DataFrame:
@@ -95,14 +89,12 @@ def _read_bronze_schedules(season: int) -> pd.DataFrame:
         DataFrame with game_id, season, week, home_team, away_team,
         home_score, away_score, result, spread_line, total_line, div_game.
     """
-    pattern = os.path.join(BRONZE_DIR, "schedules", f"season={season}", "*.parquet")
-    files = sorted(glob.glob(pattern))
-    if not files:
-        return pd.DataFrame()
-    df = pd.read_parquet(files[-1])
-
-    # Filter to regular season
-    df = df[df["game_type"] == "REG"].copy()
+    # Regular season only, filtered in the parquet scan
+    df = read_partition(
+        BRONZE_DIR, "schedules", season, filters=[("game_type", "==", "REG")]
+    )
+    if len(df.columns) == 0:
+        return df
 
     keep_cols = [
         "game_id",
@@ -504,13 +496,7 @@ def _read_ep_features(season: int) -> pd.DataFrame:
         opportunity/production/expected columns), or empty DataFrame if the
         season has no ffopportunity_features Silver file.
     """
-    pattern = os.path.join(
-        SILVER_DIR, SILVER_EP_FEATURES_LOCAL_DIR, f"season={season}", "*.parquet"
-    )
-    files = glob.glob(pattern)
-    if not files:
-        return pd.DataFrame()
-    return pd.read_parquet(max(files, key=os.path.basename))
+    return read_partition(SILVER_DIR, SILVER_EP_FEATURES_LOCAL_DIR, season)
 
 
 def _compute_ep_team_features(season: int) -> pd.DataFrame:
@@ -988,6 +974,7 @@ def assemble_multiyear_features(
     seasons: Optional[List[int]] = None,
     include_player_features: bool = False,
     include_ep_features: bool = False,
+    workers: Optional[int] = None,
 ) -> pd.DataFrame:
     """Assemble game features for multiple seasons and concatenate.
 
@@ -1000,6 +987,10 @@ def assemble_multiyear_features(
             ffopportunity expected-points team-aggregate features (opt-in;
             default False leaves the shipped 120-feature path unchanged --
             see .planning/ENSEMBLE_EP_FEATURES_GATE.md).
+        workers: Process count for per-season assembly (see
+            ``season_parallel.map_seasons``). None uses
+            FEATURE_ASSEMBLY_WORKERS; 1 runs serially. Output order and
+            dtypes are identical either way.
 
     Returns:
         Combined DataFrame with all seasons' game features.
@@ -1009,15 +1000,12 @@ def assemble_multiyear_features(
 
         seasons = PREDICTION_SEASONS
 
-    frames = []
-    for season in seasons:
-        df = assemble_game_features(
-            season,
-            include_player_features=include_player_features,
-            include_ep_features=include_ep_features,
-        )
-        if not df.empty:
-            frames.append(df)
+    assemble = functools.partial(
+        assemble_game_features,
+        include_player_features=include_player_features,
+        include_ep_features=include_ep_features,
+    )
+    frames = [df for df in map_seasons(assemble, seasons, workers) if not df.empty]
 
     if not frames:
         return pd.DataFrame()
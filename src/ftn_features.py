@@ -39,7 +39,6 @@ Usage:
     )
 """
 
-import glob
 import logging
 import os
 from typing import List, Optional
@@ -47,6 +46,8 @@ from typing import List, Optional
 import numpy as np
 import pandas as pd
 
+from partition_reader import read_parquet_cached, resolve_partition
+
 logger = logging.getLogger(__name__)
 
 # ---------------------------------------------------------------------------
@@ -102,20 +103,17 @@ def _load_bronze_ftn(season: int, bronze_dir: str) -> pd.DataFrame:
     Returns:
         FTN charting DataFrame, or empty DataFrame if not found.
     """
-    pattern = os.path.join(
-        bronze_dir, "ftn_charting", f"season={season}", "*.parquet"
-    )
-    files = sorted(glob.glob(pattern))
+    files = resolve_partition(bronze_dir, "ftn_charting", season)
     if not files:
-        logger.debug("No Bronze FTN data for season %d at %s", season, pattern)
+        logger.debug("No Bronze FTN data for season %d under %s", season, bronze_dir)
         return pd.DataFrame()
     try:
-        df = pd.read_parquet(files[-1])
+        df = read_parquet_cached(files[0])
         logger.info(
             "Loaded Bronze FTN season %d: %d rows from %s",
             season,
             len(df),
-            files[-1],
+            files[0],
         )
         return df
     except Exception as exc:
@@ -133,8 +131,7 @@ def _load_bronze_pbp(season: int, bronze_dir: str) -> pd.DataFrame:
     Returns:
         PBP DataFrame with join keys and player attribution columns.
     """
-    pattern = os.path.join(bronze_dir, "pbp", f"season={season}", "*.parquet")
-    files = sorted(glob.glob(pattern))
+    files = resolve_partition(bronze_dir, "pbp", season)
     if not files:
         logger.warning("No Bronze PBP data for season %d", season)
         return pd.DataFrame()
@@ -154,9 +151,7 @@ def _load_bronze_pbp(season: int, bronze_dir: str) -> pd.DataFrame:
         "qb_dropback",
     ]
     try:
-        df = pd.read_parquet(files[-1])
-        avail = [c for c in keep_cols if c in df.columns]
-        df = df[avail].copy()
+        df = read_parquet_cached(files[0], columns=keep_cols)
         # Cast play_id to int for FTN join
         if "play_id" in df.columns:
             df[_PBP_PLAY_KEY] = df["play_id"].astype("Int32")
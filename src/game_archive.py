@@ -3,16 +3,29 @@ Historical Game Archive
 
 Provides functions for querying game results, player fantasy stats per game,
 season leaders, and player game logs from Bronze data.
+
+Player queries are served from a per-season :class:`_SeasonArchive` built
+once from the season's player weekly and schedule Parquet: fantasy points
+are precomputed for every scoring format, each player-week is joined to its
+game (game_id, home/away, result) in one vectorized merge, and rows are
+indexed by player_id and week. Game logs, game details and leaders are then
+lookups proportional to the rows returned. Parquet reads are memoized on
+(path, mtime, size), and the archive is rebuilt whenever the loaders hand
+back a different frame (a new or rewritten file).
 """
 
 import logging
-import re
+import os
+import weakref
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional
 
 import numpy as np
 import pandas as pd
 
+from config import SCORING_CONFIGS
+from partition_manifest import latest_parquet
 from scoring_calculator import calculate_fantasy_points_df
 
 logger = logging.getLogger(__name__)
@@ -29,31 +42,47 @@ _PLAYER_WEEKLY_DIR = _DATA_DIR / "bronze" / "players" / "weekly"
 # Earliest season with player weekly data
 _PLAYER_STATS_MIN_SEASON = 2016
 
-#: Bronze filenames embed a YYYYMMDD_HHMMSS generation timestamp. Sort on it,
-#: NOT on filesystem mtime: in the HF Spaces deployment the repo is cloned
-#: fresh at build time, so every file shares the clone-time mtime and an
-#: mtime sort picks an arbitrary file rather than the newest one (this is
-#: the same class of bug documented/fixed in
-#: web/api/services/projection_service.py after the 2026-06-12 incident).
-_FILENAME_TS_RE = re.compile(r"(\d{8}_\d{6})")
+def _latest_parquet(directory: Path) -> Optional[Path]:
+    """Return the newest Parquet file in *directory* by filename-embedded
+    timestamp (falls back to filename sort when no timestamp is present).
+
+    Resolved through the Bronze partition manifest. Sorting is on the
+    filename, NOT on filesystem mtime: in the HF Spaces deployment the repo
+    is cloned fresh at build time, so every file shares the clone-time mtime
+    (same class of bug as the 2026-06-12 projection_service incident).
+    """
+    latest = latest_parquet(directory)
+    return Path(latest) if latest else None
 
 
-def _filename_sort_key(p: Path) -> Tuple[str, str]:
-    m = _FILENAME_TS_RE.search(p.name)
-    return (m.group(1) if m else "", p.name)
+@lru_cache(maxsize=32)
+def _read_parquet_cached(path: str, mtime_ns: int, size: int) -> pd.DataFrame:
+    """Read a Bronze Parquet once per (path, mtime, size).
 
+    The returned frame is shared between callers — treat it as read-only.
+    """
+    return pd.read_parquet(path)
 
-def _latest_parquet(directory: Path) -> Optional[Path]:
-    """Return the newest Parquet file in *directory* by filename-embedded
-    timestamp (falls back to filename sort when no timestamp is present)."""
-    parquets = sorted(directory.glob("*.parquet"), key=_filename_sort_key)
-    return parquets[-1] if parquets else None
+
+def _read_latest(pq: Path) -> pd.DataFrame:
+    st = os.stat(pq)
+    return _read_parquet_cached(str(pq), st.st_mtime_ns, st.st_size)
+
+
+@lru_cache(maxsize=32)
+def _regular_season(path: str, mtime_ns: int, size: int) -> pd.DataFrame:
+    """Regular-season rows of a schedule Parquet (memoized like the read)."""
+    df = _read_parquet_cached(path, mtime_ns, size)
+    if "game_type" in df.columns:
+        df = df[df["game_type"] == "REG"]
+    return df
 
 
 def _load_schedules(season: int) -> pd.DataFrame:
     """Load schedule/game data for a season from Bronze.
 
-    Tries ``schedules/`` first, then falls back to ``games/``.
+    Tries ``schedules/`` first, then falls back to ``games/``. The frame is
+    a shared memoized read — copy before mutating.
 
     Args:
         season: NFL season year.
@@ -69,11 +98,9 @@ def _load_schedules(season: int) -> pd.DataFrame:
         if season_dir.exists():
             pq = _latest_parquet(season_dir)
             if pq is not None:
-                df = pd.read_parquet(pq)
                 # Filter to regular season games only
-                if "game_type" in df.columns:
-                    df = df[df["game_type"] == "REG"]
-                return df
+                st = os.stat(pq)
+                return _regular_season(str(pq), st.st_mtime_ns, st.st_size)
 
     raise FileNotFoundError(
         f"No schedule data found for season={season}. "
@@ -88,7 +115,8 @@ def _load_player_weekly(season: int) -> pd.DataFrame:
         season: NFL season year.
 
     Returns:
-        DataFrame with player weekly stats.
+        DataFrame with player weekly stats (shared memoized read — copy
+        before mutating).
 
     Raises:
         FileNotFoundError: If no data exists for the season.
@@ -104,7 +132,7 @@ def _load_player_weekly(season: int) -> pd.DataFrame:
     if pq is None:
         raise FileNotFoundError(f"No parquet files in {season_dir}")
 
-    return pd.read_parquet(pq)
+    return _read_latest(pq)
 
 
 def _build_game_id(row: pd.Series) -> str:
@@ -144,6 +172,147 @@ def _compute_two_pt(df: pd.DataFrame) -> pd.DataFrame:
     return df
 
 
+def _game_lookup(sched: pd.DataFrame) -> pd.DataFrame:
+    """One row per (week, team): game_id, home_away, team/opponent score.
+
+    A team's home game wins over an away game in the same week, matching
+    the home-then-away precedence of the per-row lookups this replaces.
+    """
+    sched = sched.copy()
+    if "game_id" not in sched.columns:
+        sched["game_id"] = sched.apply(_build_game_id, axis=1)
+    home_score = pd.to_numeric(sched.get("home_score", 0), errors="coerce")
+    away_score = pd.to_numeric(sched.get("away_score", 0), errors="coerce")
+    sides = [
+        pd.DataFrame(
+            {
+                "week": sched["week"],
+                "team": sched["home_team"],
+                "game_id": sched["game_id"],
+                "home_away": "home",
+                "team_score": home_score,
+                "opp_score": away_score,
+            }
+        ),
+        pd.DataFrame(
+            {
+                "week": sched["week"],
+                "team": sched["away_team"],
+                "game_id": sched["game_id"],
+                "home_away": "away",
+                "team_score": away_score,
+                "opp_score": home_score,
+            }
+        ),
+    ]
+    lookup = pd.concat(sides, ignore_index=True)
+    return lookup.drop_duplicates(["week", "team"], keep="first")
+
+
+class _SeasonArchive:
+    """Precomputed player-week table for one season.
+
+    Args:
+        player_weekly: Bronze player weekly frame (not mutated).
+        schedules: Regular-season schedule frame, or None if unavailable.
+    """
+
+    def __init__(
+        self, player_weekly: pd.DataFrame, schedules: Optional[pd.DataFrame]
+    ) -> None:
+        frame = _compute_two_pt(_compute_fumbles_lost(player_weekly))
+        frame = frame.reset_index(drop=True)
+        if "recent_team" in frame.columns:
+            frame["team"] = frame["recent_team"]
+        for fmt in SCORING_CONFIGS:
+            frame[self._fp_col(fmt)] = calculate_fantasy_points_df(
+                frame, fmt, output_col="_fp"
+            )["_fp"]
+
+        frame["_game_id"] = "UNKNOWN"
+        frame["_home_away"] = "unknown"
+        frame["_game_result"] = "unknown"
+        if schedules is not None and not schedules.empty and "team" in frame:
+            games = frame[["week", "team"]].merge(
+                _game_lookup(schedules), how="left", on=["week", "team"]
+            )
+            matched = games["game_id"].notna().to_numpy()
+            team_score = games["team_score"].to_numpy(dtype=float)
+            opp_score = games["opp_score"].to_numpy(dtype=float)
+            result = np.select(
+                [team_score > opp_score, team_score < opp_score],
+                ["W", "L"],
+                default="T",
+            )
+            scored = matched & ~np.isnan(team_score) & ~np.isnan(opp_score)
+            frame["_game_id"] = np.where(matched, games["game_id"], "UNKNOWN")
+            frame["_home_away"] = np.where(matched, games["home_away"], "unknown")
+            frame["_game_result"] = np.where(scored, result, "unknown")
+
+        self.frame = frame
+        self._player_rows = frame.groupby("player_id", sort=False).indices
+        self._week_rows = frame.groupby("week", sort=False).indices
+
+    @staticmethod
+    def _fp_col(scoring_format: str) -> str:
+        return f"_fp_{scoring_format}"
+
+    def _take(self, positions: Optional[np.ndarray]) -> pd.DataFrame:
+        if positions is None:
+            return self.frame.iloc[0:0]
+        return self.frame.iloc[positions]
+
+    def player_rows(self, player_id: str) -> pd.DataFrame:
+        """All of one player's rows, in file order."""
+        return self._take(self._player_rows.get(player_id))
+
+    def week_rows(self, week: int) -> pd.DataFrame:
+        """All player rows for one week, in file order."""
+        return self._take(self._week_rows.get(week))
+
+    def with_points(self, rows: pd.DataFrame, scoring_format: str) -> pd.DataFrame:
+        """Copy of *rows* with a ``fantasy_points`` column for the format."""
+        col = self._fp_col(scoring_format)
+        if col in rows.columns:
+            return rows.assign(fantasy_points=rows[col])
+        return calculate_fantasy_points_df(
+            rows, scoring_format, output_col="fantasy_points"
+        )
+
+
+# season -> (weakref to player weekly frame, weakref to schedules or None,
+# archive). Valid only while the loaders return those same frame objects.
+_ARCHIVES: Dict[int, tuple] = {}
+
+
+def _season_archive(season: int) -> _SeasonArchive:
+    """Memoized :class:`_SeasonArchive` for *season*.
+
+    Raises:
+        FileNotFoundError: If player weekly data is not available.
+    """
+    pw = _load_player_weekly(season)
+    try:
+        sched = _load_schedules(season)
+    except FileNotFoundError:
+        logger.warning("Schedule data not available for season=%d", season)
+        sched = None
+
+    cached = _ARCHIVES.get(season)
+    if cached is not None:
+        pw_ref, sched_ref, archive = cached
+        if pw_ref() is pw and (sched_ref() if sched_ref else None) is sched:
+            return archive
+
+    archive = _SeasonArchive(pw, sched)
+    _ARCHIVES[season] = (
+        weakref.ref(pw),
+        weakref.ref(sched) if sched is not None else None,
+        archive,
+    )
+    return archive
+
+
 def get_game_results(season: int, week: Optional[int] = None) -> pd.DataFrame:
     """Get all game results for a season (or specific week).
 
@@ -158,7 +327,7 @@ def get_game_results(season: int, week: Optional[int] = None) -> pd.DataFrame:
         home_score, away_score, winner, point_spread_result, total_points,
         game_date, game_time.
     """
-    df = _load_schedules(season)
+    df = _load_schedules(season).copy()
 
     if week is not None:
         df = df[df["week"] == week]
@@ -256,46 +425,18 @@ def get_game_player_stats(
             f"Player stats not available before {_PLAYER_STATS_MIN_SEASON}."
         )
 
-    pw = _load_player_weekly(season)
-    pw = pw[pw["week"] == week].copy()
+    archive = _season_archive(season)
+    pw = archive.week_rows(week)
 
     if pw.empty:
         return pd.DataFrame()
 
-    # Compute fumbles_lost and two_pt_conversions
-    pw = _compute_fumbles_lost(pw)
-    pw = _compute_two_pt(pw)
-
-    # Calculate fantasy points
-    pw = calculate_fantasy_points_df(pw, scoring_format, output_col="fantasy_points")
-
-    # Build game_id by joining with schedule data
-    try:
-        sched = _load_schedules(season)
-        sched = sched[sched["week"] == week]
-        if "game_id" not in sched.columns:
-            sched["game_id"] = sched.apply(_build_game_id, axis=1)
-
-        # Create team -> game_id mapping for both home and away
-        home_map = sched.set_index("home_team")["game_id"].to_dict()
-        away_map = sched.set_index("away_team")["game_id"].to_dict()
-
-        team_col = "recent_team" if "recent_team" in pw.columns else "team"
-        pw["game_id"] = pw[team_col].map(
-            lambda t: home_map.get(t, away_map.get(t, "UNKNOWN"))
-        )
-    except FileNotFoundError:
-        pw["game_id"] = "UNKNOWN"
+    pw = archive.with_points(pw, scoring_format)
+    pw["game_id"] = pw["_game_id"]
 
     if game_id is not None:
         pw = pw[pw["game_id"] == game_id]
 
-    # Rename recent_team -> team if needed
-    if "recent_team" in pw.columns and "team" not in pw.columns:
-        pw = pw.rename(columns={"recent_team": "team"})
-    elif "recent_team" in pw.columns:
-        pw["team"] = pw["recent_team"]
-
     # Select and order output columns
     out_cols = [
         "game_id",
@@ -421,13 +562,8 @@ def get_season_leaders(
             f"Player stats not available before {_PLAYER_STATS_MIN_SEASON}."
         )
 
-    pw = _load_player_weekly(season)
-    pw = _compute_fumbles_lost(pw)
-    pw = _compute_two_pt(pw)
-    pw = calculate_fantasy_points_df(pw, scoring_format, output_col="fantasy_points")
-
-    if "recent_team" in pw.columns:
-        pw = pw.rename(columns={"recent_team": "team"})
+    archive = _season_archive(season)
+    pw = archive.with_points(archive.frame, scoring_format)
 
     if position:
         pw = pw[pw["position"].str.upper() == position.upper()]
@@ -492,50 +628,16 @@ def get_player_game_log(
             f"Player stats not available before {_PLAYER_STATS_MIN_SEASON}."
         )
 
-    pw = _load_player_weekly(season)
-    pw = pw[pw["player_id"] == player_id].copy()
+    archive = _season_archive(season)
+    pw = archive.player_rows(player_id)
 
     if pw.empty:
         return pd.DataFrame()
 
-    pw = _compute_fumbles_lost(pw)
-    pw = _compute_two_pt(pw)
-    pw = calculate_fantasy_points_df(pw, scoring_format, output_col="fantasy_points")
-
-    team_col = "recent_team" if "recent_team" in pw.columns else "team"
+    pw = archive.with_points(pw, scoring_format)
     pw["opponent"] = pw.get("opponent_team", pd.Series(dtype="object"))
-
-    # Determine home/away by joining with schedule
-    pw["home_away"] = "unknown"
-    pw["game_result"] = "unknown"
-    try:
-        sched = _load_schedules(season)
-        for idx, row in pw.iterrows():
-            wk = row["week"]
-            team = row[team_col]
-            wk_sched = sched[sched["week"] == wk]
-
-            home_game = wk_sched[wk_sched["home_team"] == team]
-            away_game = wk_sched[wk_sched["away_team"] == team]
-
-            if not home_game.empty:
-                g = home_game.iloc[0]
-                pw.at[idx, "home_away"] = "home"
-                hs = int(g.get("home_score", 0) or 0)
-                as_ = int(g.get("away_score", 0) or 0)
-                pw.at[idx, "game_result"] = (
-                    "W" if hs > as_ else ("L" if as_ > hs else "T")
-                )
-            elif not away_game.empty:
-                g = away_game.iloc[0]
-                pw.at[idx, "home_away"] = "away"
-                hs = int(g.get("home_score", 0) or 0)
-                as_ = int(g.get("away_score", 0) or 0)
-                pw.at[idx, "game_result"] = (
-                    "W" if as_ > hs else ("L" if hs > as_ else "T")
-                )
-    except FileNotFoundError:
-        logger.warning("Schedule data not available for season=%d", season)
+    pw["home_away"] = pw["_home_away"]
+    pw["game_result"] = pw["_game_result"]
 
     out_cols = [
         "week",
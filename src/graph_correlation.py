@@ -43,8 +43,10 @@ import numpy as np
 import pandas as pd
 
 try:
+    from partition_reader import read_partition
     from scoring_calculator import calculate_fantasy_points_df
 except ImportError:  # pragma: no cover
+    from src.partition_reader import read_partition
     from src.scoring_calculator import calculate_fantasy_points_df
 
 logger = logging.getLogger(__name__)
@@ -107,19 +109,7 @@ def _read_bronze_weekly(season: int) -> pd.DataFrame:
     Returns:
         DataFrame or empty DataFrame if no files exist.
     """
-    pattern = os.path.join(
-        BRONZE_DIR, "players", "weekly", f"season={season}", "*.parquet"
-    )
-    files = sorted(glob.glob(pattern))
-    if not files:
-        pattern_w = os.path.join(
-            BRONZE_DIR, "players", "weekly", f"season={season}", "week=*", "*.parquet"
-        )
-        files_w = sorted(glob.glob(pattern_w))
-        if files_w:
-            return pd.concat([pd.read_parquet(f) for f in files_w], ignore_index=True)
-        return pd.DataFrame()
-    return pd.read_parquet(files[-1])
+    return read_partition(BRONZE_DIR, "players/weekly", season, weeks="fallback")
 
 
 # ---------------------------------------------------------------------------
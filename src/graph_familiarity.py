@@ -473,6 +473,7 @@ def build_familiarity_data(
     season: int,
     qb_wr_df: pd.DataFrame,
     player_weekly_multi_df: pd.DataFrame,
+    rosters_df: Optional[pd.DataFrame] = None,
 ) -> pd.DataFrame:
     """Compute UC2 features for one season from pre-loaded multi-season data.
 
@@ -483,16 +484,27 @@ def build_familiarity_data(
         season: Target season.
         qb_wr_df: Multi-season output of build_qb_wr_chemistry.
         player_weekly_multi_df: Multi-season Bronze player_weekly.
+        rosters_df: Bronze ``players/rosters`` for ``season``; read from
+            Bronze when omitted.
 
     Returns:
         Feature DataFrame from compute_familiarity_features.
     """
     try:
-        from graph_vacated_opportunity import _load_transition_inputs
+        from graph_vacated_opportunity import (
+            _load_transition_inputs,
+            prepare_transition_roster,
+        )
     except ImportError:  # pragma: no cover
-        from src.graph_vacated_opportunity import _load_transition_inputs
+        from src.graph_vacated_opportunity import (
+            _load_transition_inputs,
+            prepare_transition_roster,
+        )
 
-    _, roster = _load_transition_inputs(season)
+    if rosters_df is None:
+        _, roster = _load_transition_inputs(season)
+    else:
+        roster = prepare_transition_roster(rosters_df)
     return compute_familiarity_features(
         qb_wr_df=qb_wr_df,
         player_weekly_multi_df=player_weekly_multi_df,
@@ -14,7 +14,6 @@ Exports:
 """
 
 import datetime
-import glob
 import logging
 import os
 from typing import Dict, List, Optional
@@ -22,6 +21,8 @@ from typing import Dict, List, Optional
 import numpy as np
 import pandas as pd
 
+from partition_reader import read_partition
+
 logger = logging.getLogger(__name__)
 
 BASE_DIR = os.path.dirname(os.path.dirname(__file__))
@@ -40,17 +41,7 @@ GRAPH_FEATURE_COLUMNS = [
 
 def _read_bronze_parquet(subdir: str, season: int) -> pd.DataFrame:
     """Read latest Bronze parquet for a subdirectory and season."""
-    pattern = os.path.join(BRONZE_DIR, subdir, f"season={season}", "*.parquet")
-    files = sorted(glob.glob(pattern))
-    if not files:
-        pattern_w = os.path.join(
-            BRONZE_DIR, subdir, f"season={season}", "week=*", "*.parquet"
-        )
-        files_w = sorted(glob.glob(pattern_w))
-        if files_w:
-            return pd.concat([pd.read_parquet(f) for f in files_w], ignore_index=True)
-        return pd.DataFrame()
-    return pd.read_parquet(files[-1])
+    return read_partition(BRONZE_DIR, subdir, season, weeks="fallback")
 
 
 # ---------------------------------------------------------------------------
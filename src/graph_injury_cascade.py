@@ -12,7 +12,6 @@ Exports:
     build_injury_cascade_graph: Orchestrate Neo4j ingestion of cascade edges.
 """
 
-import glob
 import logging
 import os
 from typing import Dict, List, Optional, Tuple
@@ -20,6 +19,8 @@ from typing import Dict, List, Optional, Tuple
 import numpy as np
 import pandas as pd
 
+from partition_reader import read_partition
+
 logger = logging.getLogger(__name__)
 
 BASE_DIR = os.path.dirname(os.path.dirname(__file__))
@@ -51,19 +52,7 @@ def _read_bronze_parquet(subdir: str, season: int) -> pd.DataFrame:
     Returns:
         DataFrame or empty DataFrame if no files exist.
     """
-    pattern = os.path.join(BRONZE_DIR, subdir, f"season={season}", "*.parquet")
-    files = sorted(glob.glob(pattern))
-    if not files:
-        # Check week-level partitioning
-        pattern_w = os.path.join(
-            BRONZE_DIR, subdir, f"season={season}", "week=*", "*.parquet"
-        )
-        files_w = sorted(glob.glob(pattern_w))
-        if files_w:
-            dfs = [pd.read_parquet(f) for f in files_w]
-            return pd.concat(dfs, ignore_index=True)
-        return pd.DataFrame()
-    return pd.read_parquet(files[-1])
+    return read_partition(BRONZE_DIR, subdir, season, weeks="fallback")
 
 
 # ---------------------------------------------------------------------------
@@ -4,19 +4,42 @@ Parses semicolon-delimited GSIS ID strings from ``offense_players`` and
 ``defense_players`` columns in nfl-data-py PBP participation data.
 Cross-references with rosters and depth charts to assign positions.
 
+Parsing runs through Arrow string kernels into a compact per-play *lineup
+table*: one row per participation row (``game_id``, ``play_id``) with
+``players`` -- int-coded player ids whose list offsets are a CSR index over
+plays (the dictionary holds the GSIS ids) -- and a parallel ``side`` flag
+list (0 = offense, 1 = defense). :func:`load_lineup_table` persists it next
+to Bronze under ``data/bronze/pbp_participation_lineups/`` as an
+uncompressed Arrow IPC file and memory-maps it, so a season is parsed once
+and shared by every graph module that needs "who was on the field".
+
 Exports:
+    build_lineup_table: Participation rows -> per-play lineup table.
+    load_lineup_table: Persisted, memory-mapped lineup table for a season.
+    lineups_to_players: Lineup table -> per-player rows with positions.
     parse_participation_players: Explode participation into per-player rows.
     identify_cbs_on_field: Filter to defensive backs (CB/DB).
     identify_ol_on_field: Filter to offensive linemen with position labels.
 """
 
+import glob
+import json
 import logging
-from typing import Optional
+import os
+from typing import List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.ipc as ipc
+import pyarrow.parquet as pq
 
 logger = logging.getLogger(__name__)
 
+BASE_DIR = os.path.dirname(os.path.dirname(__file__))
+BRONZE_DIR = os.path.join(BASE_DIR, "data", "bronze")
+
 # Positions we treat as "cornerback / defensive back" for WR matchup
 CB_POSITIONS = {"CB", "DB"}
 
@@ -26,6 +49,224 @@ OL_POSITIONS = {"T", "G", "C", "OT", "OG", "OL"}
 # Canonical OL labels in left-to-right order
 OL_LABELS = ["LT", "LG", "C", "RG", "RT"]
 
+PARSED_COLUMNS = ["game_id", "play_id", "player_gsis_id", "side", "position"]
+
+# Participation columns in side-flag order (0 = offense, 1 = defense).
+_SIDE_COLUMNS = ["offense_players", "defense_players"]
+_SIDE_LABELS = np.array(["offense", "defense"], dtype=object)
+
+
+# ---------------------------------------------------------------------------
+# Lineup table
+# ---------------------------------------------------------------------------
+
+
+def _split_ids(column: pd.Series) -> Tuple[np.ndarray, pa.Array]:
+    """Split one ``*_players`` column into (row index, GSIS id) arrays.
+
+    Null cells contribute nothing; ids are whitespace-trimmed and empty
+    tokens (``"P1;;P2"``) dropped.
+    """
+    try:
+        arr = pa.array(column, type=pa.string(), from_pandas=True)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        # Non-string cells are parsed from their str() form.
+        arr = pa.array(
+            column.where(column.isna(), column.astype(str)),
+            type=pa.string(),
+            from_pandas=True,
+        )
+    lists = pc.split_pattern(arr, pattern=";")
+    ids = pc.utf8_trim_whitespace(lists.flatten())
+    rows = pc.list_parent_indices(lists)
+    keep = pc.greater(pc.utf8_length(ids), 0)
+    return pc.filter(rows, keep).to_numpy(), pc.filter(ids, keep)
+
+
+def build_lineup_table(participation_df: pd.DataFrame) -> pa.Table:
+    """Encode participation rows as a per-play lineup table.
+
+    Args:
+        participation_df: DataFrame with game_id, play_id and at least one
+            of offense_players / defense_players.
+
+    Returns:
+        Arrow table with one row per input row: game_id, play_id,
+        ``players`` (list<dictionary<int32, string>>, offense ids first)
+        and ``side`` (list<int8>).
+    """
+    rows, ids, flags = [], [], []
+    for flag, side_col in enumerate(_SIDE_COLUMNS):
+        if side_col not in participation_df.columns:
+            continue
+        side_rows, side_ids = _split_ids(participation_df[side_col])
+        rows.append(side_rows)
+        ids.append(side_ids)
+        flags.append(np.full(len(side_rows), flag, dtype=np.int8))
+
+    n = len(participation_df)
+    offsets = np.zeros(n + 1, dtype=np.int32)
+    if rows:
+        # Row-major; within a row offense slots stay ahead of defense slots.
+        all_rows = np.concatenate(rows)
+        order = np.argsort(all_rows, kind="stable")
+        np.cumsum(np.bincount(all_rows, minlength=n), out=offsets[1:])
+        players = pa.concat_arrays(ids).take(pa.array(order)).dictionary_encode()
+        side = pa.array(np.concatenate(flags)[order])
+    else:
+        players = pa.array([], type=pa.string()).dictionary_encode()
+        side = pa.array([], type=pa.int8())
+
+    table = pa.Table.from_pandas(
+        participation_df[["game_id", "play_id"]], preserve_index=False
+    )
+    offsets = pa.array(offsets)
+    table = table.append_column("players", pa.ListArray.from_arrays(offsets, players))
+    return table.append_column("side", pa.ListArray.from_arrays(offsets, side))
+
+
+def _participation_files(season: int, bronze_dir: str) -> List[str]:
+    """Bronze participation files for a season (latest flat file, else weeks)."""
+    season_dir = os.path.join(bronze_dir, "pbp_participation", f"season={season}")
+    files = sorted(glob.glob(os.path.join(season_dir, "*.parquet")))
+    if files:
+        return files[-1:]
+    return sorted(glob.glob(os.path.join(season_dir, "week=*", "*.parquet")))
+
+
+def lineup_table_path(season: int, bronze_dir: Optional[str] = None) -> str:
+    """Location of the persisted lineup table for a season."""
+    return os.path.join(
+        bronze_dir or BRONZE_DIR,
+        "pbp_participation_lineups",
+        f"season={season}",
+        "lineups.arrow",
+    )
+
+
+def _read_lineup_file(path: str) -> pa.Table:
+    return ipc.open_file(pa.memory_map(path)).read_all()
+
+
+def load_lineup_table(
+    season: int,
+    bronze_dir: Optional[str] = None,
+    refresh: bool = False,
+) -> Optional[pa.Table]:
+    """Memory-mapped lineup table for a season, built on first use.
+
+    The persisted table records the Bronze participation files (name and
+    size) it was built from; a newer or re-ingested file triggers a rebuild.
+    Only the four columns the parse needs are read from Bronze.
+
+    Args:
+        season: NFL season year.
+        bronze_dir: Bronze root (default: ``data/bronze``).
+        refresh: Rebuild even if the persisted table is current.
+
+    Returns:
+        The lineup table (see :func:`build_lineup_table`), or None when the
+        season has no participation data.
+    """
+    bronze_dir = bronze_dir or BRONZE_DIR
+    sources = _participation_files(season, bronze_dir)
+    if not sources:
+        return None
+    stamp = json.dumps(
+        [[os.path.basename(f), os.path.getsize(f)] for f in sources]
+    ).encode()
+
+    path = lineup_table_path(season, bronze_dir)
+    if not refresh and os.path.exists(path):
+        try:
+            table = _read_lineup_file(path)
+            if (table.schema.metadata or {}).get(b"sources") == stamp:
+                return table
+        except (OSError, pa.ArrowInvalid) as exc:
+            logger.warning("Unreadable lineup table %s (%s) — rebuilding", path, exc)
+
+    wanted = ["game_id", "play_id"] + _SIDE_COLUMNS
+    frames = [
+        pd.read_parquet(f, columns=[c for c in wanted if c in pq.read_schema(f).names])
+        for f in sources
+    ]
+    table = build_lineup_table(pd.concat(frames, ignore_index=True))
+    table = table.replace_schema_metadata(
+        {**(table.schema.metadata or {}), b"sources": stamp}
+    )
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with pa.OSFile(tmp_path, "wb") as sink:
+            with ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+        os.replace(tmp_path, path)
+    except OSError as exc:
+        logger.warning("Could not persist lineup table %s: %s", path, exc)
+        return table
+    logger.info(
+        "Built lineup table for season %d: %d plays -> %s",
+        season,
+        table.num_rows,
+        path,
+    )
+    return _read_lineup_file(path)
+
+
+def _players_frame(
+    keys: pd.DataFrame, table: pa.Table, rosters_df: pd.DataFrame
+) -> pd.DataFrame:
+    """Per-player rows from a lineup table; ``keys`` holds its game/play ids."""
+    players = table.column("players").combine_chunks()
+    flat = players.flatten()
+    if len(flat) == 0:
+        return pd.DataFrame(columns=PARSED_COLUMNS)
+
+    rows = pc.list_parent_indices(players).to_numpy()
+    flags = table.column("side").combine_chunks().flatten().to_numpy()
+    codes = flat.indices.to_numpy()
+    ids = flat.dictionary.to_numpy(zero_copy_only=False)
+
+    # Positions are resolved once per distinct id, then gathered by code.
+    if not rosters_df.empty:
+        # Normalise roster ID column
+        id_col = "player_id" if "player_id" in rosters_df.columns else "gsis_id"
+        pos_map = rosters_df[[id_col, "position"]].drop_duplicates(
+            subset=[id_col], keep="last"
+        )
+        positions = (
+            pd.Series(ids)
+            .map(pd.Series(pos_map["position"].to_numpy(), index=pos_map[id_col]))
+            .fillna("UNK")
+            .to_numpy(dtype=object)
+        )
+    else:
+        positions = np.full(len(ids), "UNK", dtype=object)
+
+    # Offense block then defense block, each in play/slot order.
+    order = np.argsort(flags, kind="stable")
+    codes = codes[order]
+    result = keys.iloc[rows[order]].reset_index(drop=True)
+    result["player_gsis_id"] = ids[codes]
+    result["side"] = _SIDE_LABELS[flags[order]]
+    result["position"] = positions[codes]
+    return result[PARSED_COLUMNS]
+
+
+def lineups_to_players(table: pa.Table, rosters_df: pd.DataFrame) -> pd.DataFrame:
+    """Expand a lineup table into per-player rows.
+
+    Args:
+        table: Output of :func:`build_lineup_table` / :func:`load_lineup_table`.
+        rosters_df: DataFrame with player_id (GSIS ID), team, position.
+
+    Returns:
+        Same frame as :func:`parse_participation_players` on the
+        participation rows the table was built from.
+    """
+    keys = table.select(["game_id", "play_id"]).to_pandas()
+    return _players_frame(keys, table, rosters_df)
+
 
 # ---------------------------------------------------------------------------
 # Participation parsing
@@ -39,7 +280,8 @@ def parse_participation_players(
     """Parse semicolon-delimited player IDs into structured rows.
 
     Each row in the output represents one player on one play, tagged with
-    side (offense/defense) and roster position.
+    side (offense/defense) and roster position. Offense rows for every play
+    come first, then defense rows.
 
     Args:
         participation_df: DataFrame with game_id, play_id,
@@ -51,55 +293,10 @@ def parse_participation_players(
         side, position. Empty DataFrame if inputs are unusable.
     """
     if participation_df.empty:
-        return pd.DataFrame(
-            columns=["game_id", "play_id", "player_gsis_id", "side", "position"]
-        )
-
-    rows = []
-    for side_col, side_label in [
-        ("offense_players", "offense"),
-        ("defense_players", "defense"),
-    ]:
-        if side_col not in participation_df.columns:
-            continue
-
-        sub = participation_df[["game_id", "play_id", side_col]].copy()
-        sub = sub.dropna(subset=[side_col])
-        if sub.empty:
-            continue
-
-        # Explode semicolon-delimited IDs
-        sub = sub.rename(columns={side_col: "player_gsis_id"})
-        sub["player_gsis_id"] = sub["player_gsis_id"].astype(str).str.split(";")
-        sub = sub.explode("player_gsis_id", ignore_index=True)
-        sub["player_gsis_id"] = sub["player_gsis_id"].str.strip()
-        sub = sub[sub["player_gsis_id"].str.len() > 0]
-        sub["side"] = side_label
-        rows.append(sub)
-
-    if not rows:
-        return pd.DataFrame(
-            columns=["game_id", "play_id", "player_gsis_id", "side", "position"]
-        )
-
-    result = pd.concat(rows, ignore_index=True)
-
-    # Cross-reference with rosters for position
-    if not rosters_df.empty:
-        # Normalise roster ID column
-        id_col = "player_id" if "player_id" in rosters_df.columns else "gsis_id"
-        pos_map = (
-            rosters_df[[id_col, "position"]]
-            .drop_duplicates(subset=[id_col], keep="last")
-            .rename(columns={id_col: "player_gsis_id", "position": "_roster_pos"})
-        )
-        result = result.merge(pos_map, on="player_gsis_id", how="left")
-        result["position"] = result["_roster_pos"].fillna("UNK")
-        result = result.drop(columns=["_roster_pos"])
-    else:
-        result["position"] = "UNK"
+        return pd.DataFrame(columns=PARSED_COLUMNS)
 
-    return result[["game_id", "play_id", "player_gsis_id", "side", "position"]]
+    table = build_lineup_table(participation_df)
+    return _players_frame(participation_df[["game_id", "play_id"]], table, rosters_df)
 
 
 # ---------------------------------------------------------------------------
@@ -63,7 +63,7 @@ Exports:
 """
 
 import logging
-from typing import List
+from typing import List, Optional
 
 import numpy as np
 import pandas as pd
@@ -154,6 +154,7 @@ def _compute_slope_vectorized(
 def compute_route_participation(
     pbp_df: pd.DataFrame,
     participation_df: pd.DataFrame,
+    participation_parsed_df: Optional[pd.DataFrame] = None,
 ) -> pd.DataFrame:
     """Compute per player-week route participation and lagged feature set.
 
@@ -173,6 +174,10 @@ def compute_route_participation(
             week, posteam, qb_dropback.
         participation_df: Participation DataFrame with columns game_id, play_id,
             offense_players (semicolon-separated gsis player IDs).
+        participation_parsed_df: Optional output of
+            ``graph_participation.parse_participation_players`` for the same
+            participation rows; when given, on-field players come from it
+            instead of re-splitting ``offense_players``.
 
     Returns:
         DataFrame with columns: player_id, season, week, recent_team,
@@ -218,12 +223,25 @@ def compute_route_participation(
     )
 
     # --- Explode player IDs ---------------------------------------------------
-    # offense_players is a semicolon-separated string of gsis IDs
-    exploded = dropbacks.assign(
-        player_id=dropbacks["offense_players"].str.split(";")
-    ).explode("player_id")
-    exploded["player_id"] = exploded["player_id"].str.strip()
-    exploded = exploded[exploded["player_id"].notna() & (exploded["player_id"] != "")]
+    if participation_parsed_df is not None and not participation_parsed_df.empty:
+        # Already parsed once per season: join offense rows to the dropbacks.
+        offense = participation_parsed_df.loc[
+            participation_parsed_df["side"] == "offense",
+            ["game_id", "play_id", "player_gsis_id"],
+        ].rename(columns={"player_gsis_id": "player_id"})
+        play_keys = dropbacks[
+            ["game_id", "play_id", "posteam", "season", "week"]
+        ].drop_duplicates(subset=["game_id", "play_id"])
+        exploded = offense.merge(play_keys, on=["game_id", "play_id"], how="inner")
+    else:
+        # offense_players is a semicolon-separated string of gsis IDs
+        exploded = dropbacks.assign(
+            player_id=dropbacks["offense_players"].str.split(";")
+        ).explode("player_id")
+        exploded["player_id"] = exploded["player_id"].str.strip()
+        exploded = exploded[
+            exploded["player_id"].notna() & (exploded["player_id"] != "")
+        ]
 
     # --- Player dropbacks per week -------------------------------------------
     on_field = (
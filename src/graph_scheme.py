@@ -13,7 +13,6 @@ Exports:
     build_defends_run_edges: Create Neo4j [:DEFENDS_RUN] edges.
 """
 
-import glob
 import logging
 import os
 from typing import Optional
@@ -21,6 +20,8 @@ from typing import Optional
 import numpy as np
 import pandas as pd
 
+from partition_reader import read_partition
+
 logger = logging.getLogger(__name__)
 
 BASE_DIR = os.path.dirname(os.path.dirname(__file__))
@@ -58,11 +59,7 @@ def _read_bronze_pbp(season: int) -> pd.DataFrame:
     Returns:
         DataFrame of PBP data, or empty DataFrame if not found.
     """
-    pattern = os.path.join(BRONZE_DIR, "pbp", f"season={season}", "*.parquet")
-    files = sorted(glob.glob(pattern))
-    if not files:
-        return pd.DataFrame()
-    return pd.read_parquet(files[-1])
+    return read_partition(BRONZE_DIR, "pbp", season)
 
 
 def _read_bronze_pfr_def(season: int) -> pd.DataFrame:
@@ -74,13 +71,7 @@ def _read_bronze_pfr_def(season: int) -> pd.DataFrame:
     Returns:
         DataFrame of PFR defensive data, or empty DataFrame if not found.
     """
-    pattern = os.path.join(
-        BRONZE_DIR, "pfr", "weekly", "def", f"season={season}", "*.parquet"
-    )
-    files = sorted(glob.glob(pattern))
-    if not files:
-        return pd.DataFrame()
-    return pd.read_parquet(files[-1])
+    return read_partition(BRONZE_DIR, "pfr/weekly/def", season)
 
 
 # ---------------------------------------------------------------------------
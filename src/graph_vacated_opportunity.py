@@ -30,10 +30,11 @@ Exports:
     identify_departures_arrivals: Roster diff between season N-1 usage and season N roster.
     compute_vacated_opportunity_features: Per-player features for the target season.
     build_vacated_opportunity_data: Load Bronze/Silver and compute features for a season.
+    build_vacated_opportunity_from_frames: The same on pre-loaded frames.
+    prepare_transition_roster: Latest-row-per-player roster for a target season.
     build_vacated_opportunity_graph: Optional Neo4j ingestion of VACATED/COMPETES_FOR edges.
 """
 
-import glob
 import logging
 import os
 from typing import Dict, List, Optional, Tuple
@@ -41,6 +42,11 @@ from typing import Dict, List, Optional, Tuple
 import numpy as np
 import pandas as pd
 
+try:
+    from partition_reader import read_partition
+except ImportError:  # pragma: no cover
+    from src.partition_reader import read_partition
+
 logger = logging.getLogger(__name__)
 
 BASE_DIR = os.path.dirname(os.path.dirname(__file__))
@@ -104,17 +110,7 @@ def _read_bronze_parquet(subdir: str, season: int) -> pd.DataFrame:
     Returns:
         DataFrame or empty DataFrame if no files exist.
     """
-    pattern = os.path.join(BRONZE_DIR, subdir, f"season={season}", "*.parquet")
-    files = sorted(glob.glob(pattern))
-    if not files:
-        pattern_w = os.path.join(
-            BRONZE_DIR, subdir, f"season={season}", "week=*", "*.parquet"
-        )
-        files_w = sorted(glob.glob(pattern_w))
-        if files_w:
-            return pd.concat([pd.read_parquet(f) for f in files_w], ignore_index=True)
-        return pd.DataFrame()
-    return pd.read_parquet(files[-1])
+    return read_partition(BRONZE_DIR, subdir, season, weeks="fallback")
 
 
 def _read_silver_red_zone(season: int) -> pd.DataFrame:
@@ -126,11 +122,9 @@ def _read_silver_red_zone(season: int) -> pd.DataFrame:
     Returns:
         DataFrame or empty DataFrame if not available.
     """
-    pattern = os.path.join(
-        SILVER_DIR, "graph_features", f"season={season}", "graph_red_zone_*.parquet"
+    return read_partition(
+        SILVER_DIR, "graph_features", season, prefix="graph_red_zone_"
     )
-    files = sorted(glob.glob(pattern))
-    return pd.read_parquet(files[-1]) if files else pd.DataFrame()
 
 
 def _load_transition_inputs(
@@ -152,17 +146,27 @@ def _load_transition_inputs(
     prior = target_season - 1
     weekly = _read_bronze_parquet("players/weekly", prior)
     rosters = _read_bronze_parquet("players/rosters", target_season)
+    return weekly, prepare_transition_roster(rosters)
+
+
+def prepare_transition_roster(rosters: pd.DataFrame) -> pd.DataFrame:
+    """Reduce a Bronze roster frame to one latest row per player.
 
+    Args:
+        rosters: Bronze ``players/rosters`` for the target season.
+
+    Returns:
+        player_id/team/position frame (the input unchanged when empty).
+    """
     if rosters.empty:
-        return weekly, rosters
+        return rosters
 
     roster = rosters.copy()
     if "week" in roster.columns:
         roster = roster.sort_values("week").drop_duplicates(
             subset=["player_id"], keep="last"
         )
-    roster = roster[["player_id", "team", "position"]].dropna(subset=["player_id"])
-    return weekly, roster
+    return roster[["player_id", "team", "position"]].dropna(subset=["player_id"])
 
 
 # ---------------------------------------------------------------------------
@@ -662,6 +666,44 @@ def build_vacated_opportunity_data(target_season: int) -> pd.DataFrame:
     """
     weekly, roster = _load_transition_inputs(target_season)
     if weekly.empty or roster.empty:
+        # Logs the skip; no point reading the remaining inputs.
+        return build_vacated_opportunity_from_frames(target_season, weekly, roster)
+
+    return build_vacated_opportunity_from_frames(
+        target_season,
+        weekly,
+        roster,
+        depth_charts_df=_read_bronze_parquet("depth_charts", target_season),
+        draft_picks_df=_read_bronze_parquet("draft_picks", target_season),
+        rz_features_df=_read_silver_red_zone(target_season - 1),
+    )
+
+
+def build_vacated_opportunity_from_frames(
+    target_season: int,
+    prior_weekly_df: pd.DataFrame,
+    roster_df: pd.DataFrame,
+    depth_charts_df: Optional[pd.DataFrame] = None,
+    draft_picks_df: Optional[pd.DataFrame] = None,
+    rz_features_df: Optional[pd.DataFrame] = None,
+) -> pd.DataFrame:
+    """:func:`build_vacated_opportunity_data` on already-loaded inputs.
+
+    Used by ``scripts/compute_graph_features.py``, which loads each Bronze
+    frame once and shares it between feature groups and seasons.
+
+    Args:
+        target_season: The season being projected.
+        prior_weekly_df: Bronze player_weekly for ``target_season - 1``.
+        roster_df: Output of :func:`prepare_transition_roster`.
+        depth_charts_df: Bronze depth charts for ``target_season``.
+        draft_picks_df: Bronze draft picks for ``target_season``.
+        rz_features_df: Silver red-zone features for ``target_season - 1``.
+
+    Returns:
+        Feature DataFrame from compute_vacated_opportunity_features.
+    """
+    if prior_weekly_df.empty or roster_df.empty:
         logger.warning(
             "Missing weekly (season %d) or roster (season %d) data — "
             "skipping vacated opportunity features",
@@ -671,12 +713,12 @@ def build_vacated_opportunity_data(target_season: int) -> pd.DataFrame:
         return pd.DataFrame()
 
     return compute_vacated_opportunity_features(
-        prior_weekly_df=weekly,
-        current_roster_df=roster,
+        prior_weekly_df=prior_weekly_df,
+        current_roster_df=roster_df,
         season=target_season,
-        depth_charts_df=_read_bronze_parquet("depth_charts", target_season),
-        draft_picks_df=_read_bronze_parquet("draft_picks", target_season),
-        rz_features_df=_read_silver_red_zone(target_season - 1),
+        depth_charts_df=depth_charts_df,
+        draft_picks_df=draft_picks_df,
+        rz_features_df=rz_features_df,
     )
 
 
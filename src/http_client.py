@@ -0,0 +1,524 @@
+"""Shared pooled HTTP client for the Sleeper and Yahoo read APIs.
+
+:mod:`src.sleeper_http` (D-01) and :func:`src.yahoo_draft.fetch_yahoo_json`
+both delegate their transport to the process-wide :class:`HttpClient` from
+:func:`get_client`. One client instance owns:
+
+* **Connection pooling** — idle keep-alive ``http.client`` connections are
+  kept per ``(scheme, host, port)`` and reused, so a draft-night poll that
+  reads league + users + rosters + drafts pays one TLS handshake, not four.
+* **Per-host rate limits** — a :class:`HostLimit` spaces request starts and
+  caps in-flight requests per host. Yahoo's undocumented throttle answers
+  **HTTP 999**; a 999 (or 429) puts the host into a cooldown during which
+  requests fail fast instead of extending the throttle.
+* **Retry with backoff** — connection errors and 5xx responses are retried
+  with exponential backoff (``Retry-After`` honoured); timeouts are not.
+* **Conditional GET** — bodies served with an ``ETag`` / ``Last-Modified``
+  validator are cached (bounded LRU); the next GET for the same URL sends
+  ``If-None-Match`` / ``If-Modified-Since`` and a ``304`` replays the cached
+  body.
+* **Bounded fan-out** — :func:`fan_out` runs independent calls (e.g. the
+  league endpoints of one page load) on a small thread pool, fail-open per
+  call.
+
+Everything is stdlib (``http.client`` + ``concurrent.futures``) for the same
+reason :mod:`src.sleeper_http` avoids ``requests``. :meth:`HttpClient.request`
+raises :class:`HttpError` / ``OSError`` once retries are exhausted;
+:meth:`HttpClient.get_json` wraps it in the project-wide D-06 fail-open
+contract and returns ``{}`` on any error.
+"""
+
+from __future__ import annotations
+
+import http.client
+import json
+import logging
+import ssl
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
+from urllib.parse import urljoin, urlsplit
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# ---------------------------------------------------------------------------
+# Constants
+# ---------------------------------------------------------------------------
+
+_DEFAULT_TIMEOUT_S: float = 15
+_DEFAULT_RETRIES: int = 2
+_DEFAULT_BACKOFF_S: float = 0.5
+_MAX_BACKOFF_S: float = 10.0
+_MAX_REDIRECTS: int = 3
+_MAX_IDLE_PER_HOST: int = 8
+_CACHE_ENTRIES: int = 512
+_FAN_OUT_WORKERS: int = 8
+
+_THROTTLE_STATUSES = frozenset({429, 999})
+_REDIRECT_STATUSES = frozenset({301, 302, 303, 307, 308})
+
+
+@dataclass(frozen=True)
+class HostLimit:
+    """Request-rate policy for one host.
+
+    Attributes:
+        min_interval_s: Minimum spacing between request starts.
+        max_concurrency: Maximum in-flight requests.
+        cooldown_s: How long the host is left alone after a throttle
+            response (999/429) without a usable ``Retry-After``.
+    """
+
+    min_interval_s: float = 0.0
+    max_concurrency: int = _FAN_OUT_WORKERS
+    cooldown_s: float = 30.0
+
+
+# Sleeper asks clients to stay under 1000 calls/minute. Yahoo publishes no
+# number and answers 999 when polled too hard (see src/yahoo_draft.py), so it
+# gets one request start per second and at most two in flight.
+DEFAULT_HOST_LIMITS: Dict[str, HostLimit] = {
+    "api.sleeper.app": HostLimit(min_interval_s=0.06, max_concurrency=8),
+    "fantasysports.yahooapis.com": HostLimit(
+        min_interval_s=1.0, max_concurrency=2, cooldown_s=60.0
+    ),
+}
+_UNLISTED_HOST_LIMIT = HostLimit()
+
+
+class HttpError(Exception):
+    """A non-2xx/304 response that survived retries."""
+
+    def __init__(self, status: int, url: str):
+        super().__init__(f"HTTP {status} for {url}")
+        self.code = status
+        self.url = url
+
+
+class HostThrottled(HttpError):
+    """The host is cooling down after a 999/429; the request was not sent."""
+
+
+class HttpResponse(NamedTuple):
+    """A fully-read response.
+
+    ``from_cache`` is ``True`` when the server answered ``304`` and ``body``
+    was replayed from the conditional-GET cache.
+    """
+
+    status: int
+    body: bytes
+    headers: Dict[str, str]
+    from_cache: bool = False
+
+
+# ---------------------------------------------------------------------------
+# Per-host state
+# ---------------------------------------------------------------------------
+
+
+class _HostGate:
+    """Spacing, concurrency cap and throttle cooldown for one host."""
+
+    def __init__(self, limit: HostLimit):
+        self.limit = limit
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(max(1, limit.max_concurrency))
+        self._next_start = 0.0
+        self._cooldown_until = 0.0
+
+    def enter(self, url: str) -> None:
+        """Block until a request to this host may start (or raise if cooling)."""
+        self._slots.acquire()
+        with self._lock:
+            now = time.monotonic()
+            if now < self._cooldown_until:
+                self._slots.release()
+                raise HostThrottled(999, url)
+            start = max(now, self._next_start)
+            self._next_start = start + self.limit.min_interval_s
+        if start > now:
+            time.sleep(start - now)
+
+    def leave(self) -> None:
+        self._slots.release()
+
+    def cool_down(self, seconds: Optional[float]) -> None:
+        wait = self.limit.cooldown_s if seconds is None else seconds
+        with self._lock:
+            self._cooldown_until = max(self._cooldown_until, time.monotonic() + wait)
+
+
+def _retry_after_s(headers: Mapping[str, str]) -> Optional[float]:
+    """Parse ``Retry-After`` (seconds or HTTP date); ``None`` when absent/bad."""
+    raw = headers.get("retry-after")
+    if not raw:
+        return None
+    try:
+        return max(0.0, float(raw))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(raw).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+# ---------------------------------------------------------------------------
+# Client
+# ---------------------------------------------------------------------------
+
+
+class HttpClient:
+    """Thread-safe pooled GET client with rate limits, retries and validators.
+
+    Args:
+        host_limits: Per-host :class:`HostLimit` overrides; hosts not listed
+            are unthrottled.
+        retries: Extra attempts after a transport error or 5xx.
+        backoff_s: Base of the exponential backoff between attempts.
+        max_idle_per_host: Idle keep-alive connections kept per host.
+        cache_entries: Conditional-GET cache size (responses, LRU).
+        user_agent: Default ``User-Agent`` header.
+    """
+
+    def __init__(
+        self,
+        host_limits: Optional[Mapping[str, HostLimit]] = None,
+        retries: int = _DEFAULT_RETRIES,
+        backoff_s: float = _DEFAULT_BACKOFF_S,
+        max_idle_per_host: int = _MAX_IDLE_PER_HOST,
+        cache_entries: int = _CACHE_ENTRIES,
+        user_agent: str = "NFLDataEngineering/1.0",
+    ):
+        self.host_limits = dict(
+            DEFAULT_HOST_LIMITS if host_limits is None else host_limits
+        )
+        self.retries = max(0, retries)
+        self.backoff_s = backoff_s
+        self.max_idle_per_host = max_idle_per_host
+        self.cache_entries = cache_entries
+        self.user_agent = user_agent
+
+        self._lock = threading.Lock()
+        self._idle: Dict[Tuple[str, str], List[http.client.HTTPConnection]] = {}
+        self._gates: Dict[str, _HostGate] = {}
+        self._cache: "OrderedDict[Tuple[str, str], HttpResponse]" = OrderedDict()
+        self._ssl_context: Optional[ssl.SSLContext] = None
+
+    # -- pool ---------------------------------------------------------------
+
+    def _gate(self, host: str) -> _HostGate:
+        with self._lock:
+            gate = self._gates.get(host)
+            if gate is None:
+                limit = self.host_limits.get(host, _UNLISTED_HOST_LIMIT)
+                gate = self._gates[host] = _HostGate(limit)
+            return gate
+
+    def _checkout(
+        self, scheme: str, netloc: str, timeout: float
+    ) -> http.client.HTTPConnection:
+        with self._lock:
+            idle = self._idle.get((scheme, netloc))
+            conn = idle.pop() if idle else None
+        if conn is None:
+            if scheme == "https":
+                if self._ssl_context is None:
+                    self._ssl_context = ssl.create_default_context()
+                conn = http.client.HTTPSConnection(
+                    netloc, timeout=timeout, context=self._ssl_context
+                )
+            else:
+                conn = http.client.HTTPConnection(netloc, timeout=timeout)
+        conn.timeout = timeout
+        if conn.sock is not None:
+            conn.sock.settimeout(timeout)
+        return conn
+
+    def _checkin(
+        self, scheme: str, netloc: str, conn: http.client.HTTPConnection
+    ) -> None:
+        with self._lock:
+            idle = self._idle.setdefault((scheme, netloc), [])
+            if len(idle) < self.max_idle_per_host:
+                idle.append(conn)
+                return
+        conn.close()
+
+    def close(self) -> None:
+        """Close every idle pooled connection."""
+        with self._lock:
+            idle, self._idle = self._idle, {}
+        for conns in idle.values():
+            for conn in conns:
+                conn.close()
+
+    # -- conditional-GET cache ------------------------------------------------
+
+    def _cached(self, key: Tuple[str, str]) -> Optional[HttpResponse]:
+        with self._lock:
+            hit = self._cache.get(key)
+            if hit is not None:
+                self._cache.move_to_end(key)
+            return hit
+
+    def _remember(self, key: Tuple[str, str], resp: HttpResponse) -> None:
+        if self.cache_entries <= 0:
+            return
+        with self._lock:
+            self._cache[key] = resp
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.cache_entries:
+                self._cache.popitem(last=False)
+
+    def clear_cache(self) -> None:
+        """Drop every cached validator/body."""
+        with self._lock:
+            self._cache.clear()
+
+    # -- requests -----------------------------------------------------------
+
+    def _send_once(
+        self, url: str, headers: Dict[str, str], timeout: float
+    ) -> HttpResponse:
+        parts = urlsplit(url)
+        scheme = parts.scheme.lower()
+        if scheme not in ("http", "https") or not parts.netloc:
+            raise ValueError(f"unsupported URL: {url!r}")
+        path = parts.path or "/"
+        if parts.query:
+            path = f"{path}?{parts.query}"
+
+        gate = self._gate(parts.hostname or parts.netloc)
+        gate.enter(url)
+        try:
+            conn = self._checkout(scheme, parts.netloc, timeout)
+            reused = conn.sock is not None
+            try:
+                try:
+                    conn.request("GET", path, headers=headers)
+                    resp = conn.getresponse()
+                except (http.client.RemoteDisconnected, ConnectionError):
+                    if not reused:
+                        raise
+                    # The server dropped an idle keep-alive socket; one fresh
+                    # connection is not a retry.
+                    conn.close()
+                    conn.request("GET", path, headers=headers)
+                    resp = conn.getresponse()
+                body = resp.read()
+            except BaseException:
+                conn.close()
+                raise
+            if resp.will_close:
+                conn.close()
+            else:
+                self._checkin(scheme, parts.netloc, conn)
+        finally:
+            gate.leave()
+
+        resp_headers = {k.lower(): v for k, v in resp.getheaders()}
+        if resp.status in _THROTTLE_STATUSES:
+            gate.cool_down(_retry_after_s(resp_headers))
+        return HttpResponse(resp.status, body, resp_headers)
+
+    def request(
+        self,
+        url: str,
+        headers: Optional[Mapping[str, str]] = None,
+        timeout: float = _DEFAULT_TIMEOUT_S,
+        conditional: bool = True,
+    ) -> HttpResponse:
+        """GET ``url`` with pooling, rate limiting, retries and validators.
+
+        Args:
+            url: Absolute ``http``/``https`` URL.
+            headers: Extra request headers (e.g. ``Authorization``).
+            timeout: Socket timeout in seconds, per attempt.
+            conditional: Send/record ``ETag``/``Last-Modified`` validators.
+
+        Returns:
+            The 2xx :class:`HttpResponse` (``from_cache=True`` on a 304).
+
+        Raises:
+            HttpError: Non-2xx status after retries (:class:`HostThrottled`
+                for 999/429 or a host in cooldown).
+            OSError: Transport failure after retries.
+        """
+        req_headers = {"User-Agent": self.user_agent, "Connection": "keep-alive"}
+        req_headers.update(headers or {})
+        cache_key = (url, req_headers.get("Authorization", ""))
+        cached = self._cached(cache_key) if conditional else None
+        if cached is not None:
+            if "etag" in cached.headers:
+                req_headers["If-None-Match"] = cached.headers["etag"]
+            if "last-modified" in cached.headers:
+                req_headers["If-Modified-Since"] = cached.headers["last-modified"]
+
+        target = url
+        redirects = 0
+        attempt = 0
+        while True:
+            try:
+                resp = self._send_once(target, req_headers, timeout)
+            except HttpError:
+                raise
+            except (OSError, http.client.HTTPException) as exc:
+                # A timed-out attempt would most likely time out again; the
+                # caller's latency budget is worth more than a retry.
+                if attempt >= self.retries or isinstance(exc, TimeoutError):
+                    if isinstance(exc, OSError):
+                        raise
+                    raise ConnectionError(str(exc) or type(exc).__name__) from exc
+                self._backoff(attempt, None)
+                attempt += 1
+                continue
+
+            status = resp.status
+            if status == 304 and cached is not None:
+                return cached._replace(from_cache=True)
+            if 200 <= status < 300:
+                if conditional and (
+                    "etag" in resp.headers or "last-modified" in resp.headers
+                ):
+                    self._remember(cache_key, resp)
+                return resp
+            if status in _REDIRECT_STATUSES and "location" in resp.headers:
+                if redirects >= _MAX_REDIRECTS:
+                    raise HttpError(status, target)
+                redirects += 1
+                target = urljoin(target, resp.headers["location"])
+                continue
+            if status in _THROTTLE_STATUSES:
+                raise HostThrottled(status, target)
+            if status >= 500 and attempt < self.retries:
+                self._backoff(attempt, _retry_after_s(resp.headers))
+                attempt += 1
+                continue
+            raise HttpError(status, target)
+
+    def _backoff(self, attempt: int, retry_after: Optional[float]) -> None:
+        delay = self.backoff_s * (2**attempt) if retry_after is None else retry_after
+        time.sleep(min(delay, _MAX_BACKOFF_S))
+
+    def get_json(
+        self,
+        url: str,
+        headers: Optional[Mapping[str, str]] = None,
+        timeout: float = _DEFAULT_TIMEOUT_S,
+        label: str = "HTTP",
+    ) -> Any:
+        """GET ``url`` and parse JSON, fail-open (D-06).
+
+        Any HTTP, network or parse error is logged at WARNING (prefixed with
+        ``label``, e.g. ``"Sleeper"``) and yields ``{}``.
+
+        Args:
+            url: Absolute URL.
+            headers: Extra request headers.
+            timeout: Socket timeout in seconds, per attempt.
+            label: Service name used in log lines.
+
+        Returns:
+            The parsed JSON value, or ``{}`` on any error.
+        """
+        try:
+            resp = self.request(url, headers=headers, timeout=timeout)
+        except HostThrottled as exc:
+            logger.warning(
+                "%s throttled (HTTP %d) for %s — fail-open returning {}",
+                label,
+                exc.code,
+                exc.url,
+            )
+            return {}
+        except HttpError as exc:
+            logger.warning(
+                "%s HTTP %d for %s — fail-open returning {}", label, exc.code, url
+            )
+            return {}
+        except (OSError, ValueError) as exc:
+            logger.warning(
+                "%s transport error for %s: %s — fail-open returning {}",
+                label,
+                url,
+                exc,
+            )
+            return {}
+
+        try:
+            return json.loads(resp.body)
+        except (json.JSONDecodeError, UnicodeDecodeError) as exc:
+            logger.warning(
+                "%s invalid JSON from %s: %s — fail-open returning {}", label, url, exc
+            )
+            return {}
+
+
+# ---------------------------------------------------------------------------
+# Shared instance + fan-out
+# ---------------------------------------------------------------------------
+
+_client: Optional[HttpClient] = None
+_client_lock = threading.Lock()
+
+
+def get_client() -> HttpClient:
+    """Return the process-wide :class:`HttpClient` (created on first use)."""
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = HttpClient()
+        return _client
+
+
+def fan_out(
+    calls: Sequence[Callable[[], T]],
+    max_workers: int = _FAN_OUT_WORKERS,
+    default: Any = None,
+) -> List[T]:
+    """Run independent zero-argument calls concurrently, results in input order.
+
+    Meant for I/O-bound reads such as one page's league/users/rosters/drafts
+    fetches; per-host limits still apply inside :class:`HttpClient`. A call
+    that raises is logged at WARNING and contributes ``default`` (D-06) —
+    one failed endpoint never sinks its siblings.
+
+    Args:
+        calls: Zero-argument callables (use ``functools.partial``/lambdas).
+        max_workers: Upper bound on concurrent calls.
+        default: Result used for a call that raised.
+
+    Returns:
+        One result per call, in the order given.
+    """
+
+    def _run(call: Callable[[], T]) -> Any:
+        try:
+            return call()
+        except Exception as exc:
+            logger.warning("fan_out: call %r failed: %s", call, exc)
+            return default
+
+    if len(calls) <= 1 or max_workers <= 1:
+        return [_run(call) for call in calls]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(calls))) as pool:
+        return list(pool.map(_run, calls))
@@ -47,6 +47,8 @@ from sklearn.metrics import mean_absolute_error
 from sklearn.pipeline import Pipeline
 
 from model_provenance import build_provenance
+from model_registry import MODEL_REGISTRY, timed
+from partition_reader import read_partition
 from projection_engine import POSITION_STAT_PROFILE
 from scoring_calculator import calculate_fantasy_points_df
 
@@ -297,13 +299,8 @@ def _read_latest_graph_parquet(season: int, prefix: str) -> pd.DataFrame:
     Returns:
         DataFrame from the latest matching parquet, or empty DataFrame if none found.
     """
-    season_dir = os.path.join(_SILVER_GRAPH_DIR, f"season={season}")
-    pattern = os.path.join(season_dir, f"{prefix}_*.parquet")
-    files = sorted(glob.glob(pattern))
-    if not files:
-        return pd.DataFrame()
     try:
-        return pd.read_parquet(files[-1])
+        return read_partition(_SILVER_GRAPH_DIR, "", season, prefix=f"{prefix}_")
     except Exception as exc:
         logger.warning("Failed to read %s for season=%d: %s", prefix, season, exc)
         return pd.DataFrame()
@@ -1304,6 +1301,68 @@ def load_residual_model(
     return model, meta
 
 
+def _validate_residual_model(position: str, model: Any, meta: Dict[str, Any]) -> None:
+    """Check a residual model (and imputer) expect the meta's feature list.
+
+    Estimators trained on a DataFrame carry ``feature_names_in_``; LightGBM
+    trained on arrays reports placeholder ``Column_<i>`` names, so only its
+    column count (``n_features_in_``) is checked.
+
+    Raises:
+        ValueError: If the feature count or names disagree with the meta.
+    """
+    features = list(meta.get("features", []))
+    if not features:
+        return
+    parts = (
+        [model.get("model"), model.get("imputer")]
+        if isinstance(model, dict)
+        else [model]
+    )
+    for est in parts:
+        names = getattr(est, "feature_names_in_", None)
+        placeholder = names is not None and all(
+            name == f"Column_{i}" for i, name in enumerate(names)
+        )
+        if names is not None and not placeholder and list(names) != features:
+            raise ValueError(
+                f"{position} residual {type(est).__name__} feature names do not "
+                "match the meta feature list"
+            )
+        n_features = getattr(est, "n_features_in_", None)
+        if isinstance(n_features, (int, np.integer)) and n_features != len(features):
+            raise ValueError(
+                f"{position} residual {type(est).__name__} expects {n_features} "
+                f"features, meta lists {len(features)}"
+            )
+
+
+def _cached_residual_model(
+    position: str,
+    model_dir: Optional[str] = None,
+) -> Tuple[Any, Dict[str, Any]]:
+    """``load_residual_model`` through MODEL_REGISTRY (validated once per load).
+
+    Raises:
+        FileNotFoundError: If the model file does not exist.
+        ValueError: If the model does not match its meta feature list.
+    """
+    if model_dir is None:
+        model_dir = RESIDUAL_MODEL_DIR
+    stem = os.path.join(model_dir, position.lower())
+    return MODEL_REGISTRY.get(
+        "residual",
+        f"{os.path.abspath(model_dir)}:{position}",
+        [
+            f"{stem}_residual.joblib",
+            f"{stem}_residual_meta.json",
+            f"{stem}_residual_imputer.joblib",
+        ],
+        lambda: load_residual_model(position, model_dir),
+        validate=lambda loaded: _validate_residual_model(position, *loaded),
+    )
+
+
 def apply_residual_correction(
     heuristic_projections: pd.DataFrame,
     player_features: pd.DataFrame,
@@ -1351,10 +1410,13 @@ def apply_residual_correction(
         loading fails or no matching features.
     """
     try:
-        model_obj, meta = load_residual_model(position, model_dir)
+        model_obj, meta = _cached_residual_model(position, model_dir)
     except FileNotFoundError:
         logger.warning("No residual model for %s; returning heuristic as-is", position)
         return heuristic_projections
+    except ValueError as exc:
+        logger.warning("Residual model rejected (%s); returning heuristic as-is", exc)
+        return heuristic_projections
 
     model_type = meta.get("model_type", "ridge")
     features = meta.get("features", [])
@@ -1496,7 +1558,7 @@ def apply_residual_correction(
         return heuristic_projections
 
     corrections = np.zeros(len(merged))
-    if has_features.any():
+    with timed("model_predict", kind="residual", name=position):
         X_predict = X[has_features]
 
         if str(model_type).startswith("lgb") and isinstance(model_obj, dict):
@@ -9,12 +9,20 @@ downstream value (VORP, ranks, lineup, drops, recommendations) reflects the real
 Only offensive stats we actually project are scored. Rules we can't model from the
 available columns (first downs, 2-pt conversions, fumbles, kicker, DST) are reported via
 :func:`unmodeled_offense_keys` so the caller can disclose the gap rather than hide it.
+
+:class:`ScoringEngine` holds a projections frame as a (players x term) float matrix,
+built once, and turns each league's settings into a weight vector, so any number of
+leagues is scored in one pass over the matrix. Position-conditional bonuses (TE
+premium, RB/WR reception bonuses) are extra terms whose column is zero outside the
+position. Per-league frames are shallow copies of the base frame that only replace
+the point columns.
 """
 
 from __future__ import annotations
 
-from typing import Any, Dict, List
+from typing import Any, Dict, Hashable, List, Mapping, Optional, Sequence, Tuple
 
+import numpy as np
 import pandas as pd
 
 # Sleeper scoring key -> projection column (offensive stats we project).
@@ -29,6 +37,16 @@ _STAT_MAP: Dict[str, str] = {
     "rec_td": "receiving_tds",
 }
 
+# Position-conditional bonuses: Sleeper key -> (projection column, position).
+_MASKED_TERMS: Dict[str, Tuple[str, str]] = {
+    "bonus_rec_te": ("receptions", "TE"),
+    "bonus_rec_rb": ("receptions", "RB"),
+    "bonus_rec_wr": ("receptions", "WR"),
+}
+
+# Scoring keys in matrix-column order.
+_TERM_KEYS: Tuple[str, ...] = tuple(_STAT_MAP) + tuple(_MASKED_TERMS)
+
 # Offensive scoring keys we recognize but cannot model (no projection column).
 _UNMODELED_OFFENSE = {
     "rec_fd",
@@ -41,41 +59,122 @@ _UNMODELED_OFFENSE = {
 }
 
 
+def settings_vector(scoring_settings: Dict[str, Any]) -> np.ndarray:
+    """Return a league's scoring settings as a weight vector over the engine terms.
+
+    Keys that are absent, ``None`` or zero get weight 0; unknown keys are ignored.
+    """
+    return np.array(
+        [float(scoring_settings.get(key) or 0.0) for key in _TERM_KEYS],
+        dtype=np.float64,
+    )
+
+
+class ScoringEngine:
+    """Re-score one projections frame under any number of league settings.
+
+    The (players x term) matrix is built once per frame; scoring a league is a
+    weight vector applied to it, and :meth:`score_many` scores a whole batch of
+    leagues in one pass. The base frame is never copied or modified -- returned
+    frames share its unscored columns, so callers that write into those columns
+    in place must copy first (replacing a column is fine).
+
+    Terms are accumulated in :data:`_TERM_KEYS` order, matching the historical
+    per-league loop, so points are identical to it to the last bit.
+    """
+
+    def __init__(self, projections: pd.DataFrame) -> None:
+        self.projections = projections
+        self.terms = self._term_matrix(projections)
+
+    @staticmethod
+    def _term_matrix(df: pd.DataFrame) -> np.ndarray:
+        terms = np.zeros((len(df), len(_TERM_KEYS)), dtype=np.float64)
+        for j, col in enumerate(_STAT_MAP.values()):
+            if col in df.columns:
+                terms[:, j] = df[col].fillna(0).to_numpy(dtype=np.float64)
+        if "position" in df.columns:
+            position = df["position"].astype(str).str.upper().to_numpy()
+            for j, (col, pos) in enumerate(_MASKED_TERMS.values(), len(_STAT_MAP)):
+                if col in df.columns:
+                    terms[:, j] = np.where(
+                        position == pos, df[col].fillna(0).to_numpy(np.float64), 0.0
+                    )
+        return terms
+
+    def points(self, settings_list: Sequence[Dict[str, Any]]) -> np.ndarray:
+        """Return a (players x leagues) matrix of points rounded to 0.1."""
+        weights = np.stack([settings_vector(s) for s in settings_list], axis=1)
+        points = np.zeros((len(self.projections), weights.shape[1]), dtype=np.float64)
+        for j, row in enumerate(weights):
+            leagues = np.flatnonzero(row)
+            if leagues.size:
+                points[:, leagues] += self.terms[:, j, None] * row[leagues]
+        return np.round(points, 1)
+
+    def view(self, points: np.ndarray) -> pd.DataFrame:
+        """Return the base frame with ``points`` as the projected point columns.
+
+        Adds ``base_season_points`` preserving the original preset value.
+        """
+        base = self.projections
+        df = base.copy(deep=False)
+        if "projected_season_points" in base.columns:
+            df["base_season_points"] = base["projected_season_points"].copy()
+        df["projected_season_points"] = points.copy()
+        if "projected_points" in base.columns:
+            df["projected_points"] = points.copy()
+        return df
+
+    def score(self, scoring_settings: Dict[str, Any]) -> pd.DataFrame:
+        """Return the projections re-scored under one league's settings."""
+        if self.projections.empty or not scoring_settings:
+            return self.projections
+        return self.view(self.points([scoring_settings])[:, 0])
+
+    def score_many(
+        self, settings_by_league: Mapping[Hashable, Optional[Dict[str, Any]]]
+    ) -> Dict[Hashable, pd.DataFrame]:
+        """Score many leagues at once.
+
+        Args:
+            settings_by_league: League key -> raw Sleeper ``scoring_settings``.
+                Leagues with empty settings get the base frame back unchanged.
+
+        Returns:
+            League key -> re-scored frame (see :meth:`view`).
+        """
+        scored = {k: s for k, s in settings_by_league.items() if s}
+        out: Dict[Hashable, pd.DataFrame] = {
+            k: self.projections for k in settings_by_league if k not in scored
+        }
+        if scored and not self.projections.empty:
+            points = self.points(list(scored.values()))
+            for i, key in enumerate(scored):
+                out[key] = self.view(points[:, i])
+        else:
+            out.update({k: self.projections for k in scored})
+        return out
+
+
 def score_with_settings(
     projections: pd.DataFrame, scoring_settings: Dict[str, Any]
 ) -> pd.DataFrame:
-    """Return a copy of ``projections`` with custom points applied.
+    """Return ``projections`` with custom points applied.
 
     Overwrites ``projected_season_points`` (and ``projected_points`` if present) with
     points computed under ``scoring_settings`` so existing consumers
     (``compute_value_scores``, the engine, the optimizer) use league-accurate values.
     Adds a ``base_season_points`` column preserving the original preset value.
 
-    TE premium (``bonus_rec_te``) adds to receptions for TE rows only.
+    Position bonuses (``bonus_rec_te`` / ``_rb`` / ``_wr``) add to receptions for
+    that position's rows only. The input frame is not modified; the result shares
+    its unscored columns (see :class:`ScoringEngine`). To score several leagues
+    against the same projections, build one :class:`ScoringEngine` instead.
     """
     if projections is None or projections.empty or not scoring_settings:
         return projections
-    df = projections.copy()
-
-    points = pd.Series(0.0, index=df.index)
-    for key, col in _STAT_MAP.items():
-        weight = scoring_settings.get(key)
-        if weight and col in df.columns:
-            points = points + df[col].fillna(0) * float(weight)
-
-    te_bonus = scoring_settings.get("bonus_rec_te")
-    if te_bonus and "receptions" in df.columns and "position" in df.columns:
-        is_te = df["position"].astype(str).str.upper() == "TE"
-        points = points + is_te.astype(float) * df["receptions"].fillna(0) * float(
-            te_bonus
-        )
-
-    if "projected_season_points" in df.columns:
-        df["base_season_points"] = df["projected_season_points"]
-    df["projected_season_points"] = points.round(1)
-    if "projected_points" in df.columns:
-        df["projected_points"] = points.round(1)
-    return df
+    return ScoringEngine(projections).score(scoring_settings)
 
 
 def unmodeled_offense_keys(scoring_settings: Dict[str, Any]) -> List[str]:
@@ -20,6 +20,7 @@ Routing (v4.4, 2026-08-15 — see .planning/HYBRID_SHIP_2026_08_15.md):
 
 Exports:
     generate_ml_projections: Main entry point for mixed ML/heuristic projections.
+    predict_ml_positions: Warm-model stat predictions for several positions.
     check_team_total_coherence: Warn when team fantasy totals exceed implied total.
     compute_mapie_intervals: MAPIE-based prediction intervals (optional dependency;
         real/tested but not currently invoked by generate_ml_projections — see
@@ -47,6 +48,7 @@ from player_model_training import (
     predict_player_stats,
 )
 from scoring_calculator import calculate_fantasy_points_df
+from model_registry import MODEL_REGISTRY, MatrixPool, timed
 
 logger = logging.getLogger(__name__)
 
@@ -116,6 +118,23 @@ except ImportError:
 
 
 def _load_ship_gate(model_dir: str = "models/player") -> Dict[str, str]:
+    """Per-position verdicts, cached in MODEL_REGISTRY until the files change.
+
+    See ``_read_ship_gate`` for the routing rules. The cache is stamped
+    with the report and every HYBRID position's residual meta file.
+    """
+    residual_dir = os.path.join(os.path.dirname(os.path.abspath(model_dir)), "residual")
+    paths = [os.path.join(model_dir, "ship_gate_report.json")] + [
+        os.path.join(residual_dir, f"{position.lower()}_residual_meta.json")
+        for position in sorted(HYBRID_POSITIONS)
+    ]
+    verdicts = MODEL_REGISTRY.get(
+        "ship_gate", os.path.abspath(model_dir), paths, lambda: _read_ship_gate(model_dir)
+    )
+    return dict(verdicts)
+
+
+def _read_ship_gate(model_dir: str = "models/player") -> Dict[str, str]:
     """Read ship_gate_report.json and return per-position verdicts.
 
     If QB is absent from the report but QB model files exist on disk,
@@ -356,7 +375,28 @@ def compute_fantasy_intervals(
 # ---------------------------------------------------------------------------
 
 
+_FEATURE_GROUPS = ["yardage", "td", "volume", "turnover"]
+
+
 def _load_feature_cols(model_dir: str) -> Dict[str, List[str]]:
+    """Feature columns per stat-type group, cached in MODEL_REGISTRY.
+
+    See ``_read_feature_cols``; the cache is stamped with the group files.
+    """
+    fs_dir = os.path.join(model_dir, "feature_selection")
+    paths = [fs_dir] + [
+        os.path.join(fs_dir, f"{group}_features.json") for group in _FEATURE_GROUPS
+    ]
+    cols = MODEL_REGISTRY.get(
+        "feature_cols",
+        os.path.abspath(model_dir),
+        paths,
+        lambda: _read_feature_cols(model_dir),
+    )
+    return {group: list(features) for group, features in cols.items()}
+
+
+def _read_feature_cols(model_dir: str) -> Dict[str, List[str]]:
     """Load feature columns per stat-type group from feature_selection directory.
 
     Args:
@@ -368,7 +408,7 @@ def _load_feature_cols(model_dir: str) -> Dict[str, List[str]]:
     fs_dir = os.path.join(model_dir, "feature_selection")
     result: Dict[str, List[str]] = {}
 
-    for group in ["yardage", "td", "volume", "turnover"]:
+    for group in _FEATURE_GROUPS:
         path = os.path.join(fs_dir, f"{group}_features.json")
         if os.path.exists(path):
             with open(path, "r") as f:
@@ -390,6 +430,106 @@ def _load_feature_cols(model_dir: str) -> Dict[str, List[str]]:
     return result
 
 
+# ---------------------------------------------------------------------------
+# Warm player models
+# ---------------------------------------------------------------------------
+
+
+def _load_position_models(position: str, model_dir: str) -> Dict[str, Any]:
+    """Load one position's stat models plus the feature lists they expect."""
+    model_dict: Dict[str, Dict[str, Any]] = {}
+    for stat in POSITION_STAT_PROFILE.get(position, []):
+        try:
+            model = load_player_model(position, stat, model_dir)
+            model_dict[stat] = {"model": model}
+        except Exception as e:
+            logger.warning("Could not load %s/%s model: %s", position, stat, e)
+    return {
+        "models": model_dict,
+        "feature_cols": _load_feature_cols(model_dir),
+        "pool": MatrixPool(),
+    }
+
+
+def _validate_position_models(position: str, entry: Dict[str, Any]) -> None:
+    """Check each model was trained on its stat-type group's feature list.
+
+    Raises:
+        ValueError: If a model's stored feature names differ from the
+            feature-selection list it will be fed.
+    """
+    for stat, spec in entry["models"].items():
+        booster = getattr(spec["model"], "get_booster", None)
+        names = getattr(booster(), "feature_names", None) if booster else None
+        if not isinstance(names, list):
+            continue
+        expected = entry["feature_cols"].get(get_stat_type(stat), [])
+        if names != expected:
+            raise ValueError(
+                f"{position}/{stat} model was trained on {len(names)} features "
+                f"that do not match the {len(expected)} in feature_selection/"
+                f"{get_stat_type(stat)}_features.json"
+            )
+
+
+def _position_models(position: str, model_dir: str) -> Dict[str, Any]:
+    """Cached ``_load_position_models`` entry (validated once per load)."""
+    pos_dir = os.path.join(model_dir, position.lower())
+    fs_dir = os.path.join(model_dir, "feature_selection")
+    paths = (
+        [pos_dir]
+        + [
+            os.path.join(pos_dir, f"{stat}.json")
+            for stat in POSITION_STAT_PROFILE.get(position, [])
+        ]
+        + [os.path.join(fs_dir, f"{group}_features.json") for group in _FEATURE_GROUPS]
+    )
+    return MODEL_REGISTRY.get(
+        "player_models",
+        f"{os.path.abspath(model_dir)}:{position}",
+        paths,
+        lambda: _load_position_models(position, model_dir),
+        validate=lambda entry: _validate_position_models(position, entry),
+    )
+
+
+def predict_ml_positions(
+    players_by_position: Dict[str, pd.DataFrame],
+    model_dir: str = "models/player",
+) -> Dict[str, pd.DataFrame]:
+    """Predict pred_{stat} columns for several positions with warm models.
+
+    Models and feature lists are loaded once per process (MODEL_REGISTRY);
+    each stat-type group's features go into a preallocated float32 matrix
+    reused across calls. Load and predict timings reach the metrics hook.
+
+    Args:
+        players_by_position: Position code -> player rows to predict.
+        model_dir: Base directory for player models.
+
+    Returns:
+        Position -> ``predict_player_stats`` output. Positions without any
+        loadable model are omitted.
+
+    Raises:
+        ValueError: If a position's models do not match their feature lists.
+    """
+    results: Dict[str, pd.DataFrame] = {}
+    for position, players in players_by_position.items():
+        entry = _position_models(position, model_dir)
+        if not entry["models"]:
+            continue
+        with timed("model_predict", kind="player_models", name=position):
+            results[position] = predict_player_stats(
+                entry["models"],
+                players,
+                position,
+                entry["feature_cols"],
+                matrix_pool=entry["pool"],
+            )
+    return results
+
+
 # ---------------------------------------------------------------------------
 # Team-total coherence check
 # ---------------------------------------------------------------------------
@@ -774,28 +914,18 @@ def _generate_ml_for_position(
 
         # ---- ML predictions for eligible players ----
         if not ml_players.empty:
-            feature_cols = _load_feature_cols(model_dir)
             stats = POSITION_STAT_PROFILE.get(position, [])
 
-            # Load models
-            model_dict: Dict[str, Dict[str, Any]] = {}
-            for stat in stats:
-                try:
-                    model = load_player_model(position, stat, model_dir)
-                    model_dict[stat] = {"model": model}
-                except Exception as e:
-                    logger.warning("Could not load %s/%s model: %s", position, stat, e)
+            # Models come from the warm registry (loaded once per process)
+            pred_df = predict_ml_positions({position: ml_players}, model_dir).get(
+                position
+            )
 
-            if not model_dict:
+            if pred_df is None:
                 logger.warning("No models loaded for %s; using heuristic", position)
                 # Fall through to heuristic for all players
                 fallback_players = target_df.copy()
             else:
-                # Predict
-                pred_df = predict_player_stats(
-                    model_dict, ml_players, position, feature_cols
-                )
-
                 # Rename pred_{stat} to proj_{stat} for output consistency
                 rename_map = {}
                 for stat in stats:
@@ -0,0 +1,554 @@
+"""
+Monte Carlo mock-draft batch engine.
+
+Runs thousands of seeded mock drafts for one board in lockstep. The board is
+held as NumPy arrays (pick order, position codes, VORP and recommendation
+score inputs) and every draft owns one row of an availability mask, opponent
+roster counts and recent-pick history, so each overall pick is a handful of
+vectorized operations across all drafts instead of a DataFrame re-sort per
+pick per draft.
+
+Draft ``i`` is an exact replay of::
+
+    MockDraftSimulator(board, user_pick, n_teams, seed=result.seeds[i])
+        .run_full_simulation(DraftAdvisor(board))
+
+Opponents apply the same roster caps, K/DST nudge, run amplification and
+ADP-noise draw (one ``random.Random.random()`` per opponent pick, resolved by
+the same cumulative-weight bisection as ``random.choices``); on the user's
+turns the top ``DraftAdvisor.recommend()`` score is drafted. Players at
+positions the roster cannot start are left off the board, as both the
+simulator and the advisor already do.
+
+Usage
+-----
+::
+
+    from mock_draft_batch import MockDraftBatch
+
+    batch = MockDraftBatch(board, user_pick=5, n_teams=12)
+    result = batch.run(n_drafts=5000, seed=7)
+    result.slot_distribution()    # where each player goes
+    result.roster_vorp_summary()  # the user's roster VORP distribution
+    result.positional_runs()      # per-round positional runs
+"""
+
+from __future__ import annotations
+
+import logging
+import random
+import warnings
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from draft_optimizer import (
+    FLEX_ELIGIBLE,
+    DraftBoard,
+    MockDraftSimulator,
+    _pick_grade,
+    draftable_positions,
+)
+
+logger = logging.getLogger(__name__)
+
+# Extra rank-ordered columns scanned past the overall pick number before
+# falling back to a full-board scan for a draft's candidate pool.
+_WINDOW_PAD = 64
+
+_SUMMARY_COLUMNS = [
+    "player_id",
+    "player_name",
+    "position",
+    "adp_rank",
+    "model_rank",
+    "vorp",
+]
+
+
+@dataclass
+class MockDraftBatchResult:
+    """Per-draft outcomes of :meth:`MockDraftBatch.run`.
+
+    Attributes:
+        players: Board players in pick-order rank, one row per column of
+            ``draft_slots``.
+        positions: Position label for each position code.
+        draft_slots: ``(n_drafts, n_players)`` overall pick each player
+            went at; 0 when undrafted.
+        user_picks: Overall pick numbers belonging to the user.
+        roster_vorp: ``(n_drafts,)`` total VORP of the user's roster.
+        round_counts: ``(n_drafts, rounds, n_positions)`` picks at each
+            position in each round, all teams.
+        round_runs: ``(n_drafts, rounds, n_positions)`` longest streak of
+            consecutive picks at each position within each round.
+        expected_vorp: ADP-optimal VORP baseline for the user's slots.
+        seeds: Per-draft seeds; ``seeds[i]`` replays draft ``i`` through
+            :class:`MockDraftSimulator`.
+    """
+
+    players: pd.DataFrame
+    positions: List[str]
+    draft_slots: np.ndarray
+    user_picks: List[int]
+    roster_vorp: np.ndarray
+    round_counts: np.ndarray
+    round_runs: np.ndarray
+    expected_vorp: float
+    seeds: List[int] = field(default_factory=list)
+
+    @property
+    def n_drafts(self) -> int:
+        return int(self.draft_slots.shape[0])
+
+    def slot_distribution(self) -> pd.DataFrame:
+        """Per-player draft-slot distribution across all drafts.
+
+        Returns:
+            ``players`` summary columns plus ``p_drafted``, ``p_user``
+            (share of drafts the user took the player), ``mean_slot``,
+            ``p10_slot``, ``median_slot`` and ``p90_slot`` (over the drafts
+            the player was taken in; NaN if never), sorted by ``mean_slot``.
+        """
+        drafted = self.draft_slots > 0
+        slots = np.where(drafted, self.draft_slots, np.nan).astype(float)
+        cols = [c for c in _SUMMARY_COLUMNS if c in self.players.columns]
+        out = self.players[cols].copy()
+        out["p_drafted"] = drafted.mean(axis=0)
+        out["p_user"] = np.isin(self.draft_slots, self.user_picks).mean(axis=0)
+        with warnings.catch_warnings():
+            # Never-drafted players are all-NaN columns.
+            warnings.simplefilter("ignore", category=RuntimeWarning)
+            out["mean_slot"] = np.nanmean(slots, axis=0)
+            p10, p50, p90 = np.nanpercentile(slots, [10, 50, 90], axis=0)
+        out["p10_slot"] = p10
+        out["median_slot"] = p50
+        out["p90_slot"] = p90
+        return out.sort_values("mean_slot", na_position="last", kind="mergesort")
+
+    def roster_vorp_summary(self) -> Dict:
+        """Distribution of the user's roster VORP and letter grades."""
+        vorp = self.roster_vorp
+        grades = Counter(_pick_grade(float(v), self.expected_vorp) for v in vorp)
+        p10, p50, p90 = np.percentile(vorp, [10, 50, 90])
+        return {
+            "n_drafts": self.n_drafts,
+            "mean": round(float(vorp.mean()), 1),
+            "std": round(float(vorp.std()), 1),
+            "p10": round(float(p10), 1),
+            "median": round(float(p50), 1),
+            "p90": round(float(p90), 1),
+            "expected_vorp": round(self.expected_vorp, 1),
+            "grades": {g: grades[g] / self.n_drafts for g in sorted(grades)},
+        }
+
+    def positional_runs(self, min_run: int = 3) -> pd.DataFrame:
+        """Per-round positional picks and runs across all drafts.
+
+        Args:
+            min_run: Consecutive same-position picks that count as a run.
+
+        Returns:
+            One row per (round, position): ``mean_picks``,
+            ``mean_longest_run`` and ``run_rate`` (share of drafts with a
+            run of at least ``min_run`` at that position in that round).
+        """
+        n_rounds = self.round_counts.shape[1]
+        rounds = np.repeat(np.arange(1, n_rounds + 1), len(self.positions))
+        return pd.DataFrame(
+            {
+                "round": rounds,
+                "position": self.positions * n_rounds,
+                "mean_picks": self.round_counts.mean(axis=0).ravel(),
+                "mean_longest_run": self.round_runs.mean(axis=0).ravel(),
+                "run_rate": (self.round_runs >= min_run).mean(axis=0).ravel(),
+            }
+        )
+
+
+def _first_k(mask: np.ndarray, k: int):
+    """Column indices of the first ``k`` True entries of each row.
+
+    Returns:
+        ``(cand, n_found)``: ``(rows, k)`` indices (padding is 0) and the
+        number of valid entries per row.
+    """
+    ranks = np.cumsum(mask, axis=1, dtype=np.int32)
+    rows, cols = np.nonzero(mask & (ranks <= k))
+    cand = np.zeros((mask.shape[0], k), dtype=np.intp)
+    cand[rows, ranks[rows, cols] - 1] = cols
+    return cand, np.minimum(ranks[:, -1], k)
+
+
+def _stable_order(values: np.ndarray) -> np.ndarray:
+    """Ascending stable argsort with NaN last (pandas ``mergesort`` order)."""
+    return np.argsort(values, kind="stable")
+
+
+class MockDraftBatch:
+    """Vectorized Monte Carlo driver for :class:`MockDraftSimulator` drafts.
+
+    Args:
+        board: A fresh DraftBoard (read, never mutated).
+        user_pick: The user's draft position (1-based).
+        n_teams: Total number of teams in the league.
+        randomness: Same as :class:`MockDraftSimulator`.
+        draft_type: ``"snake"`` or ``"linear"``.
+        behavior: Same as :class:`MockDraftSimulator`.
+    """
+
+    def __init__(
+        self,
+        board: DraftBoard,
+        user_pick: int,
+        n_teams: int,
+        randomness: int = 3,
+        draft_type: str = "snake",
+        behavior: Optional[Dict] = None,
+    ):
+        # The simulator supplies slot math, bot caps and the expected-VORP
+        # baseline; the batch only ever reads its board.
+        self._sim = MockDraftSimulator(
+            board,
+            user_pick=user_pick,
+            n_teams=n_teams,
+            randomness=randomness,
+            draft_type=draft_type,
+            behavior=behavior,
+        )
+        self.board = board
+        self.n_teams = n_teams
+        self.roster_config = dict(board.roster_config)
+
+        players = board.available
+        pos_upper = players["position"].astype(str).str.upper()
+        players = players[pos_upper.isin(draftable_positions(self.roster_config))]
+        pos_upper = players["position"].astype(str).str.upper().to_numpy()
+        n = len(players)
+
+        pts_col = self._sim._pts_col
+        score_col = "vorp" if "vorp" in players.columns else pts_col
+
+        def column(name: str, default: float = np.nan) -> np.ndarray:
+            if name in players.columns:
+                return pd.to_numeric(players[name], errors="coerce").to_numpy(float)
+            return np.full(n, default)
+
+        adp = column("adp_rank")
+        has_adp = ~np.isnan(adp)
+        # Rank space: the simulator's ADP order (NaN ADP last). Drafts whose
+        # remaining pool has no ADP at all switch to model_rank order.
+        order = (
+            _stable_order(adp) if has_adp.any() else _stable_order(column("model_rank"))
+        )
+        model_order = _stable_order(column("model_rank")[order])
+
+        tier = np.zeros(n)
+        if "value_tier" in players.columns:
+            tiers = players["value_tier"].to_numpy()
+            tier[tiers == "undervalued"] = 6
+            tier[tiers == "overvalued"] = -6
+
+        self.positions: List[str] = sorted(set(pos_upper))
+        codes = pd.Categorical(pos_upper, categories=self.positions).codes
+
+        self.players = players.iloc[order].reset_index(drop=True)
+        self._codes = codes[order].astype(np.intp)
+        self._has_adp = has_adp[order]
+        self._model_order = model_order
+        self._board_pos = order  # rank -> board row, for advisor tie-breaks
+        self._score = players[score_col].fillna(0).astype(float).to_numpy()[order]
+        self._tier = tier[order]
+        self._vorp = np.nan_to_num(column("vorp", 0.0)[order])
+
+    # -----------------------------------------------------------------------
+    # Per-pick policies
+    # -----------------------------------------------------------------------
+
+    def _code(self, position: str) -> int:
+        return self.positions.index(position) if position in self.positions else -1
+
+    def _advisor_adjustments(self, have: np.ndarray) -> List[np.ndarray]:
+        """Per-draft, per-position-code score terms of ``DraftAdvisor.recommend``.
+
+        Returned in the order recommend applies them (needs boost, FLEX
+        boost, saturation penalty) so float sums match exactly.
+        """
+        rc = self.roster_config
+        n_drafts, n_pos = have.shape
+
+        def count(pos: str) -> np.ndarray:
+            c = self._code(pos)
+            return have[:, c] if c >= 0 else np.zeros(n_drafts, dtype=have.dtype)
+
+        needs_boost = np.zeros((n_drafts, n_pos))
+        flex_boost = np.zeros((n_drafts, n_pos))
+        penalty = np.zeros((n_drafts, n_pos))
+        for slot, required in rc.items():
+            if slot == "BN":
+                continue
+            if slot == "FLEX":
+                flexed = sum(
+                    np.maximum(0, count(p) - rc.get(p, 0)) for p in ("RB", "WR", "TE")
+                )
+                need = np.maximum(0, required - flexed)
+                for pos in FLEX_ELIGIBLE:
+                    c = self._code(pos)
+                    if c >= 0:
+                        flex_boost[:, c] = np.where(
+                            need > 0, np.minimum(need * 3, 9), 0
+                        )
+            elif slot in ("QB", "RB", "WR", "TE") and self._code(slot) >= 0:
+                need = np.maximum(0, required - count(slot))
+                needs_boost[:, self._code(slot)] = np.where(
+                    need > 0, np.minimum(need * 8, 16), 0
+                )
+
+        base = {p: int(rc.get(p, 0)) for p in ("QB", "RB", "WR", "TE")}
+        flex_total = int(rc.get("FLEX", 0))
+        pos_cap = {
+            "QB": base["QB"] + int(rc.get("SFLEX", 0)) + 1,
+            "TE": base["TE"] + 1,
+            "RB": base["RB"] + flex_total + 2,
+            "WR": base["WR"] + flex_total + 2,
+            "K": int(rc.get("K", 0)),
+            "DST": int(rc.get("DST", 0)),
+        }
+        units = {"K": 1000, "DST": 1000, "QB": 40, "TE": 40, "RB": 25, "WR": 25}
+        for pos, cap in pos_cap.items():
+            c = self._code(pos)
+            if c < 0:
+                continue
+            over = have[:, c] - cap
+            penalty[:, c] = np.where(over >= 0, units[pos] * (over + 1), 0)
+        return [needs_boost, flex_boost, penalty]
+
+    def _user_picks(self, avail: np.ndarray, have: np.ndarray) -> np.ndarray:
+        """Rank index of the advisor's top pick per draft (-1: none left)."""
+        needs_boost, flex_boost, penalty = self._advisor_adjustments(have)
+        codes = self._codes
+        score = np.broadcast_to(self._score, avail.shape).copy()
+        score += needs_boost[:, codes]
+        score += flex_boost[:, codes]
+        score += self._tier
+        score -= penalty[:, codes]
+        score[~avail] = -np.inf
+        best = score.max(axis=1, keepdims=True)
+        tied = (score == best) & avail
+        big = np.iinfo(np.intp).max
+        pick = np.where(tied, self._board_pos, big).argmin(axis=1)
+        pick[~avail.any(axis=1)] = -1
+        return pick
+
+    def _allowed_positions(
+        self,
+        opp: np.ndarray,
+        left: np.ndarray,
+        caps: np.ndarray,
+        rounds_left: int,
+    ) -> np.ndarray:
+        """Position codes each bot may draft this pick, ``(n_drafts, n_pos)``.
+
+        Legal positions under the depth caps (every position when nothing
+        legal is left), narrowed to a forced K/DST in the closing rounds.
+        """
+        rc = self.roster_config
+        legal = opp < caps
+        allowed = np.where(((legal & (left > 0)).any(axis=1))[:, None], legal, True)
+
+        n_drafts = opp.shape[0]
+        forced = np.full(n_drafts, -1)
+        undecided = np.ones(n_drafts, dtype=bool)
+        for pos, window in (("K", 1), ("DST", 2)):
+            if not (rc.get(pos, 0) > 0 and rounds_left <= window):
+                continue
+            c = self._code(pos)
+            # A forced position with nothing on the board changes nothing,
+            # but still pre-empts DST (the simulator's elif).
+            hit = undecided & ((opp[:, c] == 0) if c >= 0 else True)
+            forced[hit] = c if c >= 0 else -2
+            undecided &= ~hit
+
+        rows = np.nonzero(forced >= 0)[0]
+        if len(rows):
+            fc = forced[rows]
+            ok = allowed[rows, fc] & (left[rows, fc] > 0)
+            rows, fc = rows[ok], fc[ok]
+            allowed[rows] = False
+            allowed[rows, fc] = True
+        return allowed
+
+    def _candidates(
+        self,
+        avail: np.ndarray,
+        allowed: np.ndarray,
+        by_model: np.ndarray,
+        k: int,
+        width: int,
+    ):
+        """First ``k`` allowed, available players in pick order per draft."""
+        codes = self._codes
+        n_players = avail.shape[1]
+        width = min(width, n_players)
+        cand, n_found = _first_k(avail[:, :width] & allowed[:, codes[:width]], k)
+
+        # Rows short of k inside the window, or ordering by model_rank,
+        # need the full board.
+        redo = (n_found < k) & (width < n_players) & ~by_model
+        rows = np.nonzero(redo)[0]
+        if len(rows):
+            full = avail[rows] & allowed[rows][:, codes]
+            cand[rows], n_found[rows] = _first_k(full, k)
+
+        rows = np.nonzero(by_model)[0]
+        if len(rows):
+            mo = self._model_order
+            full = avail[rows][:, mo] & allowed[rows][:, codes[mo]]
+            sub, n_found[rows] = _first_k(full, k)
+            cand[rows] = mo[sub]
+        return cand, n_found
+
+    @staticmethod
+    def _run_codes(recent: np.ndarray) -> np.ndarray:
+        """Position code of a positional run per draft (-1: none).
+
+        ``recent`` holds the last four pick codes (oldest first, -1 pads),
+        matching ``MockDraftSimulator._run_position``'s Counter semantics.
+        """
+        valid = recent >= 0
+        counts = ((recent[:, :, None] == recent[:, None, :]) & valid[:, None, :]).sum(2)
+        counts[~valid] = 0
+        first = counts.argmax(axis=1)
+        rows = np.arange(len(recent))
+        run = recent[rows, first]
+        run[(counts[rows, first] < 2) | (valid.sum(axis=1) < 2)] = -1
+        return run
+
+    # -----------------------------------------------------------------------
+    # Driver
+    # -----------------------------------------------------------------------
+
+    def run(
+        self,
+        n_drafts: int = 1000,
+        seed: int = 0,
+        rounds: Optional[int] = None,
+    ) -> MockDraftBatchResult:
+        """Simulate ``n_drafts`` full drafts.
+
+        Args:
+            n_drafts: Number of drafts.
+            seed: Master seed; per-draft seeds are derived from it with
+                ``numpy.random.SeedSequence``.
+            rounds: Rounds per draft (default: roster size, as in
+                :meth:`MockDraftSimulator.run_full_simulation`).
+
+        Returns:
+            A :class:`MockDraftBatchResult`.
+        """
+        sim = self._sim
+        if rounds is None:
+            rounds = sum(self.roster_config.values())
+        total_rounds = max(1, rounds)
+        total_picks = self.n_teams * rounds
+        n_players, n_pos = len(self._codes), len(self.positions)
+
+        seeds = [int(s) for s in np.random.SeedSequence(seed).generate_state(n_drafts)]
+        rngs = [random.Random(s) for s in seeds]
+
+        temperature = max(float(sim.behavior.get("temperature", 3.0)), 0.1)
+        run_factor = float(sim.behavior.get("run_factor", 1.5))
+        k_max = max(sim.randomness * 2 + 1, 8)
+        # Same scalar expression as simulate_opponent_pick, so weights (and
+        # therefore draws) are bit-identical.
+        weights = np.array([float(np.exp(-i / temperature)) for i in range(k_max)])
+        caps = np.array(
+            [
+                [sim._bot_max_for_position(p, r) for p in self.positions]
+                for r in range(1, rounds + 1)
+            ]
+        )
+
+        codes = self._codes
+        avail = np.ones((n_drafts, n_players), dtype=bool)
+        left = np.tile(np.bincount(codes, minlength=n_pos), (n_drafts, 1))
+        adp_left = np.full(n_drafts, int(self._has_adp.sum()))
+        opp = np.zeros((n_drafts, self.n_teams + 1, n_pos), dtype=np.int32)
+        have = np.zeros((n_drafts, n_pos), dtype=np.int32)
+        recent = np.full((n_drafts, 4), -1, dtype=np.intp)
+        draft_slots = np.zeros((n_drafts, n_players), dtype=np.int32)
+        roster_vorp = np.zeros(n_drafts)
+        round_counts = np.zeros((n_drafts, rounds, n_pos), dtype=np.int32)
+        round_runs = np.zeros((n_drafts, rounds, n_pos), dtype=np.int32)
+        streak = np.zeros(n_drafts, dtype=np.int32)
+        last_code = np.full(n_drafts, -1, dtype=np.intp)
+        all_rows = np.arange(n_drafts)
+        user_picks: List[int] = []
+
+        for pick in range(1, total_picks + 1):
+            rnd = (pick - 1) // self.n_teams + 1
+            if rnd != (pick - 2) // self.n_teams + 1:
+                last_code[:] = -1
+
+            if sim._is_user_turn(pick):
+                user_picks.append(pick)
+                chosen = self._user_picks(avail, have)
+                rows = all_rows[chosen >= 0]
+                chosen = chosen[rows]
+                have[rows, codes[chosen]] += 1
+                roster_vorp[rows] += self._vorp[chosen]
+            else:
+                k = min(k_max, n_players)
+                slot = sim._slot_for_pick(pick)
+                allowed = self._allowed_positions(
+                    opp[:, slot], left, caps[rnd - 1], total_rounds - rnd
+                )
+                cand, n_found = self._candidates(
+                    avail, allowed, adp_left == 0, k, pick + k + _WINDOW_PAD
+                )
+                rows = all_rows[n_found > 0]
+                if not len(rows):
+                    continue
+                cand, n_found = cand[rows], n_found[rows]
+
+                w = np.broadcast_to(weights[:k], cand.shape)
+                run = self._run_codes(recent[rows])
+                w = np.where(codes[cand] == run[:, None], w * run_factor, w)
+                cum = np.cumsum(w, axis=1)
+                total = cum[np.arange(len(rows)), n_found - 1] + 0.0
+                u = np.fromiter((rngs[d].random() for d in rows), float, len(rows))
+                # bisect_right(cum, u * total, 0, n_found - 1)
+                below = (cum <= (u * total)[:, None]) & (
+                    np.arange(k) < (n_found - 1)[:, None]
+                )
+                chosen = cand[np.arange(len(rows)), below.sum(axis=1)]
+                opp[rows, slot, codes[chosen]] += 1
+
+            picked = codes[chosen]
+            avail[rows, chosen] = False
+            left[rows, picked] -= 1
+            adp_left[rows] -= self._has_adp[chosen]
+            draft_slots[rows, chosen] = pick
+            recent[rows] = np.column_stack([recent[rows, 1:], picked])
+
+            round_counts[rows, rnd - 1, picked] += 1
+            streak[rows] = np.where(last_code[rows] == picked, streak[rows] + 1, 1)
+            last_code[rows] = picked
+            round_runs[rows, rnd - 1, picked] = np.maximum(
+                round_runs[rows, rnd - 1, picked], streak[rows]
+            )
+
+        return MockDraftBatchResult(
+            players=self.players,
+            positions=list(self.positions),
+            draft_slots=draft_slots,
+            user_picks=user_picks,
+            roster_vorp=roster_vorp,
+            round_counts=round_counts,
+            round_runs=round_runs,
+            expected_vorp=float(sim._estimate_expected_vorp(total_picks)),
+            seeds=seeds,
+        )
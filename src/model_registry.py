@@ -0,0 +1,253 @@
+"""Process-wide cache of model artifacts, with load/predict timing.
+
+``generate_ml_projections`` is called once per week by the backtest and the
+Sunday refresh, and every call used to re-read the ship gate report, the
+feature-selection lists, each position's XGBoost/residual models and the
+quantile pickles from disk. :data:`MODEL_REGISTRY` loads each artifact once
+per process:
+
+* entries are keyed by kind + name and stamped with the ``(mtime, size)``
+  of every file they were built from; a retrained or promoted artifact is
+  picked up on the next lookup without a restart;
+* an optional ``validate`` callback runs once at load time (e.g. feature
+  columns match what the model was trained on), so a bad artifact fails at
+  load instead of on every prediction;
+* artifacts whose primary file is missing are never cached -- the loader
+  decides what "missing" means (raise, return None, ...) every time.
+
+Prediction inputs reuse preallocated float32 buffers from a
+:class:`MatrixPool` instead of a fresh DataFrame per stat.
+
+Timings of loads and predictions go to a metrics hook (``set_metrics_hook``)
+as ``hook(event, seconds, labels)``; :class:`TimingCollector` is a ready
+made hook that aggregates them per event and label set.
+
+Usage
+-----
+::
+
+    from model_registry import MODEL_REGISTRY, TimingCollector, set_metrics_hook
+
+    timings = TimingCollector()
+    set_metrics_hook(timings)
+    ...  # generate_ml_projections(...) for every week
+    print(timings.summary())
+"""
+
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+MetricsHook = Callable[[str, float, Dict[str, str]], None]
+
+_metrics_hook: Optional[MetricsHook] = None
+
+FileStamp = Optional[Tuple[int, int]]
+
+
+# ---------------------------------------------------------------------------
+# Metrics hook
+# ---------------------------------------------------------------------------
+
+
+def set_metrics_hook(hook: Optional[MetricsHook]) -> Optional[MetricsHook]:
+    """Install the timing hook (None removes it).
+
+    Args:
+        hook: Callable ``(event, seconds, labels)``. Events are
+            ``"model_load"`` and ``"model_predict"``; labels carry ``kind``
+            and ``name`` (e.g. ``{"kind": "residual", "name": "WR"}``).
+
+    Returns:
+        The previously installed hook, so callers can restore it.
+    """
+    global _metrics_hook
+    previous, _metrics_hook = _metrics_hook, hook
+    return previous
+
+
+def emit_timing(event: str, seconds: float, **labels: str) -> None:
+    """Report one timing to the metrics hook. Hook errors are logged, not raised."""
+    logger.debug("%s %s: %.4fs", event, labels, seconds)
+    hook = _metrics_hook
+    if hook is None:
+        return
+    try:
+        hook(event, seconds, labels)
+    except Exception as exc:  # never let metrics break a projection run
+        logger.warning("Metrics hook failed for %s: %s", event, exc)
+
+
+@contextmanager
+def timed(event: str, **labels: str) -> Iterator[None]:
+    """Time the enclosed block and report it via :func:`emit_timing`."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        emit_timing(event, time.perf_counter() - start, **labels)
+
+
+class TimingCollector:
+    """Metrics hook that aggregates count / total / max seconds per key."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._stats: Dict[Tuple[str, Tuple[Tuple[str, str], ...]], List[float]] = {}
+
+    def __call__(self, event: str, seconds: float, labels: Dict[str, str]) -> None:
+        key = (event, tuple(sorted(labels.items())))
+        with self._lock:
+            stats = self._stats.setdefault(key, [0, 0.0, 0.0])
+            stats[0] += 1
+            stats[1] += seconds
+            stats[2] = max(stats[2], seconds)
+
+    def summary(self) -> pd.DataFrame:
+        """One row per (event, labels), slowest total first."""
+        with self._lock:
+            rows = [
+                {
+                    "event": event,
+                    **dict(labels),
+                    "count": int(count),
+                    "total_s": round(total, 4),
+                    "max_s": round(peak, 4),
+                }
+                for (event, labels), (count, total, peak) in self._stats.items()
+            ]
+        if not rows:
+            return pd.DataFrame(columns=["event", "count", "total_s", "max_s"])
+        return pd.DataFrame(rows).sort_values("total_s", ascending=False)
+
+
+# ---------------------------------------------------------------------------
+# Registry
+# ---------------------------------------------------------------------------
+
+
+def _stamp(path: str) -> FileStamp:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+@dataclass
+class _Entry:
+    stamps: Tuple[FileStamp, ...]
+    value: Any
+
+
+class ModelRegistry:
+    """Load-once cache of model artifacts keyed by name, path and mtime.
+
+    Thread-safe: concurrent lookups of the same stale entry load it once.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.RLock()
+        self._entries: Dict[Tuple[str, str], _Entry] = {}
+
+    def get(
+        self,
+        kind: str,
+        name: str,
+        paths: Sequence[str],
+        loader: Callable[[], Any],
+        validate: Optional[Callable[[Any], None]] = None,
+    ) -> Any:
+        """Return the cached artifact, (re)loading it if its files changed.
+
+        Args:
+            kind: Artifact family (``"player_models"``, ``"residual"``, ...).
+            name: Artifact name within the family (position, directory, ...).
+            paths: Files the artifact is built from. ``paths[0]`` is the
+                primary file: when it does not exist nothing is cached.
+                Optional files may be listed too; appearing or changing
+                invalidates the entry.
+            loader: Builds the artifact. Exceptions propagate (uncached).
+            validate: Optional check run once per load; raise to reject the
+                artifact (nothing is cached).
+
+        Returns:
+            The loaded artifact. Treat it as read-only -- it is shared.
+        """
+        stamps = tuple(_stamp(p) for p in paths)
+        key = (kind, name)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.stamps == stamps:
+                return entry.value
+
+            with timed("model_load", kind=kind, name=name):
+                value = loader()
+                if validate is not None:
+                    validate(value)
+            if stamps and stamps[0] is not None:
+                self._entries[key] = _Entry(stamps, value)
+            else:
+                self._entries.pop(key, None)
+            return value
+
+    def invalidate(self, kind: Optional[str] = None) -> None:
+        """Drop every cached entry (or only those of ``kind``)."""
+        with self._lock:
+            if kind is None:
+                self._entries.clear()
+            else:
+                for key in [k for k in self._entries if k[0] == kind]:
+                    del self._entries[key]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+MODEL_REGISTRY = ModelRegistry()
+
+
+# ---------------------------------------------------------------------------
+# Preallocated feature matrices
+# ---------------------------------------------------------------------------
+
+
+class MatrixPool:
+    """Reusable float32 feature buffers, one per key (e.g. stat-type group).
+
+    ``fill`` writes a frame's columns into the key's buffer (NaN for columns
+    the frame lacks) and returns a view of the first ``len(frame)`` rows.
+    Buffers grow geometrically and are never shrunk, so repeated weekly
+    predictions allocate nothing after warm-up. Hold :attr:`lock` while
+    filling and consuming views -- the next ``fill`` overwrites them.
+    """
+
+    def __init__(self) -> None:
+        self.lock = threading.RLock()
+        self._buffers: Dict[str, np.ndarray] = {}
+
+    def fill(self, key: str, frame: pd.DataFrame, columns: Sequence[str]) -> np.ndarray:
+        n_rows, n_cols = len(frame), len(columns)
+        buf = self._buffers.get(key)
+        if buf is None or buf.shape[0] < n_rows or buf.shape[1] != n_cols:
+            capacity = max(n_rows, 2 * buf.shape[0] if buf is not None else 0, 64)
+            buf = np.empty((capacity, n_cols), dtype=np.float32)
+            self._buffers[key] = buf
+        X = buf[:n_rows]
+        for j, col in enumerate(columns):
+            if col in frame.columns:
+                X[:, j] = pd.to_numeric(frame[col], errors="coerce").to_numpy(
+                    dtype=np.float64, na_value=np.nan
+                )
+            else:
+                X[:, j] = np.nan
+        return X
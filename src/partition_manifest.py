@@ -0,0 +1,499 @@
+"""Per-layer manifest of the latest parquet file in every partition.
+
+Every Bronze/Silver/Gold writer adds a ``<variant>_YYYYMMDD_HHMMSS.parquet``
+file next to the previous ones, and every reader used to glob and sort the
+partition directory on each request or run. Each layer now keeps an index at
+``data/<layer>/_manifest.json`` mapping
+
+    (dataset, season, week, variant) -> latest path, rows, schema hash, bytes
+
+where ``dataset`` is the path under the layer up to ``season=``
+(e.g. ``projections`` or ``players/weekly``) and ``variant`` is the filename
+without its timestamp (e.g. ``projections_half_ppr``).
+
+Writers call :func:`record_partition_write` (or :func:`write_parquet_atomic`)
+after a file lands; the manifest is rewritten under a lock via an atomic
+rename, so concurrent writers and readers never see a torn file. Readers call
+:func:`latest_parquet` for an O(1) lookup. The manifest also records each
+partition directory's mtime: if a file was added by a writer that does not
+record itself, the directory mtime no longer matches and the reader falls back
+to a (memoized) directory scan, so a stale manifest can slow a lookup down but
+never return an old file.
+
+``python scripts/compact_partitions.py`` prunes superseded files and rebuilds
+the manifests from disk. Datasets in :data:`APPEND_ONLY_DATASETS` hold
+complementary files rather than snapshots of one table and are never pruned.
+"""
+
+import fnmatch
+import glob
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import pandas as pd
+import pyarrow.parquet as pq
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+try:
+    from partition_reader import file_sort_key, latest_file
+except ImportError:  # pragma: no cover
+    from src.partition_reader import file_sort_key, latest_file
+
+logger = logging.getLogger(__name__)
+
+LAYERS = ("bronze", "silver", "gold")
+MANIFEST_FILE = "_manifest.json"
+MANIFEST_VERSION = 1
+
+# Datasets whose files complement each other (odds snapshots over time,
+# weather written per date range): readers concatenate every file, so
+# compaction must not treat older files as superseded.
+APPEND_ONLY_DATASETS = frozenset({"odds_api/snapshots", "weather"})
+
+_VARIANT_RE = re.compile(r"^(.*?)_?\d{8}_\d{6}$")
+_SEASON_RE = re.compile(r"^season=(\d+)$")
+_WEEK_RE = re.compile(r"^week=(\d+)$")
+
+PartitionKey = Tuple[str, Optional[int], Optional[int], str]
+
+
+# ---------------------------------------------------------------------------
+# Path conventions
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class ManifestEntry:
+    """Latest file of one (dataset, season, week, variant) partition."""
+
+    dataset: str
+    season: Optional[int]
+    week: Optional[int]
+    variant: str
+    path: str  # relative to the layer root, '/'-separated
+    rows: int
+    schema_hash: str
+    bytes: int
+
+    @property
+    def key(self) -> PartitionKey:
+        return (self.dataset, self.season, self.week, self.variant)
+
+    @property
+    def directory(self) -> str:
+        return self.path.rsplit("/", 1)[0] if "/" in self.path else ""
+
+
+def file_variant(filename: str) -> str:
+    """Filename minus its ``_YYYYMMDD_HHMMSS.parquet`` suffix."""
+    stem = os.path.basename(filename)
+    if stem.endswith(".parquet"):
+        stem = stem[: -len(".parquet")]
+    match = _VARIANT_RE.match(stem)
+    return match.group(1) if match else stem
+
+
+def layer_root(path: str) -> Optional[str]:
+    """Nearest ancestor directory of ``path`` named after a layer, or None."""
+    current = os.path.dirname(os.path.abspath(path))
+    while True:
+        if os.path.basename(current) in LAYERS:
+            return current
+        parent = os.path.dirname(current)
+        if parent == current:
+            return None
+        current = parent
+
+
+def parse_partition_path(path: str, layer_dir: str) -> Optional[PartitionKey]:
+    """Split a file path into its (dataset, season, week, variant) key.
+
+    Returns None for files outside ``layer_dir``.
+    """
+    rel = os.path.relpath(os.path.abspath(path), os.path.abspath(layer_dir))
+    parts = rel.replace(os.sep, "/").split("/")
+    if parts[0] == ".." or len(parts) < 2:
+        return None
+    dirs, filename = parts[:-1], parts[-1]
+    season = week = None
+    dataset_parts = []
+    for part in dirs:
+        season_match, week_match = _SEASON_RE.match(part), _WEEK_RE.match(part)
+        if season_match and season is None:
+            season = int(season_match.group(1))
+        elif week_match and season is not None and week is None:
+            week = int(week_match.group(1))
+        elif season is None:
+            dataset_parts.append(part)
+        else:
+            # Deeper nesting below season/week: keep it in the variant so
+            # distinct sub-directories never collide.
+            filename = f"{part}/{filename}"
+    variant = "/".join(filename.split("/")[:-1] + [file_variant(filename)])
+    return ("/".join(dataset_parts), season, week, variant)
+
+
+def describe_file(path: str) -> Tuple[int, str, int]:
+    """``(rows, schema_hash, bytes)`` from the parquet footer (no data read)."""
+    meta = pq.read_metadata(path)
+    schema = meta.schema.to_arrow_schema()
+    fields = ",".join(f"{f.name}:{f.type}" for f in schema)
+    digest = hashlib.sha1(fields.encode()).hexdigest()[:16]
+    return meta.num_rows, digest, os.path.getsize(path)
+
+
+def _dir_mtime(path: str) -> Optional[int]:
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+# ---------------------------------------------------------------------------
+# Manifest
+# ---------------------------------------------------------------------------
+
+
+class PartitionManifest:
+    """Latest-file index of one layer directory, persisted as JSON.
+
+    The in-memory copy is reloaded when the manifest file changes on disk,
+    so several processes can share one layer.
+    """
+
+    def __init__(self, layer_dir: str) -> None:
+        self.layer_dir = os.path.abspath(layer_dir)
+        self.path = os.path.join(self.layer_dir, MANIFEST_FILE)
+        self._lock = threading.RLock()
+        self._stamp: Optional[Tuple[int, int]] = None
+        self._entries: Dict[PartitionKey, ManifestEntry] = {}
+        self._dirs: Dict[str, int] = {}
+        self._by_dir: Dict[str, List[ManifestEntry]] = {}
+        self._scans: Dict[Tuple[str, str], Tuple[int, Optional[str]]] = {}
+
+    # -- persistence ------------------------------------------------------
+
+    def _file_stamp(self) -> Optional[Tuple[int, int]]:
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+
+    def _refresh(self) -> None:
+        stamp = self._file_stamp()
+        if stamp == self._stamp:
+            return
+        entries: Dict[PartitionKey, ManifestEntry] = {}
+        dirs: Dict[str, int] = {}
+        if stamp is not None:
+            try:
+                with open(self.path) as f:
+                    payload = json.load(f)
+                for raw in payload.get("entries", []):
+                    entry = ManifestEntry(**raw)
+                    entries[entry.key] = entry
+                dirs = {k: int(v) for k, v in payload.get("dirs", {}).items()}
+            except (OSError, ValueError, TypeError) as exc:
+                logger.warning("Ignoring unreadable manifest %s: %s", self.path, exc)
+                entries, dirs = {}, {}
+        self._set(entries, dirs)
+        self._stamp = stamp
+
+    def _set(
+        self, entries: Dict[PartitionKey, ManifestEntry], dirs: Dict[str, int]
+    ) -> None:
+        self._entries, self._dirs = entries, dirs
+        by_dir: Dict[str, List[ManifestEntry]] = {}
+        for entry in entries.values():
+            by_dir.setdefault(entry.directory, []).append(entry)
+        self._by_dir = by_dir
+
+    def _save(self) -> None:
+        payload = {
+            "version": MANIFEST_VERSION,
+            "updated_at": datetime.now().isoformat(timespec="seconds"),
+            "entries": [
+                asdict(e) for e in sorted(self._entries.values(), key=lambda e: e.path)
+            ],
+            "dirs": dict(sorted(self._dirs.items())),
+        }
+        tmp = self.path + ".tmp"
+        with open(tmp, "w") as f:
+            json.dump(payload, f, indent=1)
+        os.replace(tmp, self.path)
+        self._stamp = self._file_stamp()
+
+    @contextmanager
+    def _writing(self) -> Iterator[None]:
+        """Hold the in-process and cross-process lock around a rewrite."""
+        with self._lock:
+            os.makedirs(self.layer_dir, exist_ok=True)
+            with open(os.path.join(self.layer_dir, "_manifest.lock"), "a") as lock:
+                if fcntl is not None:
+                    fcntl.flock(lock, fcntl.LOCK_EX)
+                try:
+                    self._stamp = None  # re-read what other writers saved
+                    self._refresh()
+                    yield
+                    self._save()
+                finally:
+                    if fcntl is not None:
+                        fcntl.flock(lock, fcntl.LOCK_UN)
+
+    # -- writers ----------------------------------------------------------
+
+    def _entry_for(self, path: str) -> ManifestEntry:
+        key = parse_partition_path(path, self.layer_dir)
+        rows, schema_hash, nbytes = describe_file(path)
+        rel = os.path.relpath(os.path.abspath(path), self.layer_dir)
+        return ManifestEntry(*key, rel.replace(os.sep, "/"), rows, schema_hash, nbytes)
+
+    def _group(self, files: List[str]) -> Dict[PartitionKey, List[str]]:
+        groups: Dict[PartitionKey, List[str]] = {}
+        for path in files:
+            key = parse_partition_path(path, self.layer_dir)
+            if key is not None:
+                groups.setdefault(key, []).append(path)
+        return groups
+
+    def _index_dir(self, directory: str) -> None:
+        """Replace the entries of one directory with what is on disk now.
+
+        The directory mtime is taken before the scan, so a file landing
+        mid-scan leaves the directory marked stale rather than missing.
+        """
+        rel_dir = os.path.relpath(directory, self.layer_dir).replace(os.sep, "/")
+        mtime = _dir_mtime(directory)
+        files = glob.glob(os.path.join(directory, "*.parquet"))
+        for key in [k for k, e in self._entries.items() if e.directory == rel_dir]:
+            del self._entries[key]
+        for group in self._group(files).values():
+            newest = latest_file(group)
+            try:
+                entry = self._entry_for(newest)
+            except Exception as exc:  # unreadable footer: leave it to scans
+                logger.warning("Skipping unreadable %s: %s", newest, exc)
+                mtime = None
+                continue
+            self._entries[entry.key] = entry
+        if mtime is None:
+            self._dirs.pop(rel_dir, None)
+        else:
+            self._dirs[rel_dir] = mtime
+
+    def record(self, path: str) -> Optional[ManifestEntry]:
+        """Re-index the directory of a freshly written file.
+
+        The whole directory is indexed (one listing plus one footer read per
+        variant), so files dropped there by writers that do not record
+        themselves are picked up too.
+
+        Returns:
+            The entry now stored for the file's partition, or None when the
+            file is not under this layer or does not exist.
+        """
+        key = parse_partition_path(path, self.layer_dir)
+        if key is None or not os.path.exists(path):
+            return None
+        with self._writing():
+            self._index_dir(os.path.dirname(os.path.abspath(path)))
+            self._set(self._entries, self._dirs)
+            return self._entries.get(key)
+
+    def _scan(self) -> Dict[str, List[str]]:
+        """Every parquet file under the layer, grouped by directory."""
+        by_dir: Dict[str, List[str]] = {}
+        pattern = os.path.join(self.layer_dir, "**", "*.parquet")
+        for path in glob.glob(pattern, recursive=True):
+            by_dir.setdefault(os.path.dirname(path), []).append(path)
+        return by_dir
+
+    def rebuild(self) -> int:
+        """Re-index the layer from disk. Returns the number of partitions."""
+        with self._writing():
+            self._entries, self._dirs = {}, {}
+            for directory in self._scan():
+                self._index_dir(directory)
+            self._set(self._entries, self._dirs)
+        logger.info("Rebuilt %s: %d partitions", self.path, len(self._entries))
+        return len(self._entries)
+
+    def superseded(self, keep: int = 1) -> List[str]:
+        """Files older than the newest ``keep`` of their partition.
+
+        Datasets in :data:`APPEND_ONLY_DATASETS` are never listed.
+        """
+        if keep < 1:
+            raise ValueError("keep must be >= 1")
+        stale: List[str] = []
+        for files in self._scan().values():
+            for key, group in self._group(files).items():
+                if key[0] in APPEND_ONLY_DATASETS:
+                    continue
+                stale.extend(sorted(group, key=file_sort_key)[:-keep])
+        return sorted(stale)
+
+    def compact(self, keep: int = 1, dry_run: bool = True) -> List[str]:
+        """Delete superseded files, then rebuild the manifest.
+
+        Args:
+            keep: Files to keep per partition (newest first). Must be >= 1.
+            dry_run: Only report what would be deleted.
+
+        Returns:
+            The superseded file paths (deleted unless ``dry_run``).
+        """
+        stale = self.superseded(keep)
+        if dry_run:
+            return stale
+        for path in stale:
+            os.remove(path)
+        self.rebuild()
+        return stale
+
+    # -- readers ----------------------------------------------------------
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._refresh()
+            return len(self._entries)
+
+    def get(
+        self,
+        dataset: str,
+        season: Optional[int] = None,
+        week: Optional[int] = None,
+        variant: Optional[str] = None,
+    ) -> Optional[ManifestEntry]:
+        """Recorded entry for a partition (newest variant when None).
+
+        No disk validation -- use :meth:`latest_in_dir` for request paths.
+        """
+        with self._lock:
+            self._refresh()
+            if variant is not None:
+                return self._entries.get((dataset, season, week, variant))
+            matches = [
+                e
+                for (d, s, w, _), e in self._entries.items()
+                if (d, s, w) == (dataset, season, week)
+            ]
+        if not matches:
+            return None
+        newest = latest_file([m.path for m in matches])
+        return next(m for m in matches if m.path == newest)
+
+    def latest_in_dir(
+        self, directory: str, pattern: str = "*.parquet"
+    ) -> Optional[str]:
+        """Newest file in ``directory`` whose name matches ``pattern``.
+
+        Served from the manifest when the directory has not changed since it
+        was recorded; otherwise from a directory scan memoized on the
+        directory's mtime. Patterns select by filename (e.g.
+        ``"projections_half_ppr_*.parquet"``).
+        """
+        abs_dir = os.path.abspath(directory)
+        mtime = _dir_mtime(abs_dir)
+        if mtime is None:
+            return None
+        rel_dir = os.path.relpath(abs_dir, self.layer_dir).replace(os.sep, "/")
+        with self._lock:
+            self._refresh()
+            if self._dirs.get(rel_dir) == mtime:
+                names = [
+                    e.path
+                    for e in self._by_dir.get(rel_dir, [])
+                    if fnmatch.fnmatch(e.path.rsplit("/", 1)[-1], pattern)
+                ]
+                newest = latest_file(names)
+                return os.path.join(self.layer_dir, newest) if newest else None
+            cached = self._scans.get((abs_dir, pattern))
+            if cached is not None and cached[0] == mtime:
+                return cached[1]
+        newest = latest_file(glob.glob(os.path.join(abs_dir, pattern)))
+        with self._lock:
+            self._scans[(abs_dir, pattern)] = (mtime, newest)
+        return newest
+
+
+# ---------------------------------------------------------------------------
+# Module-level helpers
+# ---------------------------------------------------------------------------
+
+_MANIFESTS: Dict[str, PartitionManifest] = {}
+_MANIFESTS_LOCK = threading.Lock()
+
+
+def manifest_for(layer_dir: str) -> PartitionManifest:
+    """Process-wide :class:`PartitionManifest` for a layer directory."""
+    key = os.path.abspath(layer_dir)
+    with _MANIFESTS_LOCK:
+        manifest = _MANIFESTS.get(key)
+        if manifest is None:
+            manifest = _MANIFESTS[key] = PartitionManifest(key)
+        return manifest
+
+
+def record_partition_write(path: str) -> Optional[ManifestEntry]:
+    """Record a written file in its layer's manifest.
+
+    A no-op for files outside ``bronze``/``silver``/``gold`` and for paths
+    that were never written (e.g. a mocked ``to_parquet``). Failures are
+    logged, never raised: the data file is already in place and readers fall
+    back to scanning a directory the manifest does not cover.
+    """
+    root = layer_root(path)
+    if root is None:
+        return None
+    try:
+        return manifest_for(root).record(path)
+    except Exception as exc:
+        logger.warning("Could not record %s in the partition manifest: %s", path, exc)
+        return None
+
+
+def write_parquet_atomic(df: pd.DataFrame, path: str, **kwargs) -> str:
+    """Write ``df`` via a temp file + rename, then record it in the manifest.
+
+    Args:
+        df: Frame to write.
+        path: Destination parquet path.
+        **kwargs: Passed to ``DataFrame.to_parquet`` (``index=False`` default).
+
+    Returns:
+        ``path``.
+    """
+    kwargs.setdefault("index", False)
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp = path + ".tmp"
+    df.to_parquet(tmp, **kwargs)
+    os.replace(tmp, path)
+    record_partition_write(path)
+    return path
+
+
+def latest_parquet(directory: str, pattern: str = "*.parquet") -> Optional[str]:
+    """Newest parquet in ``directory`` by filename timestamp, or None.
+
+    Directories under a layer go through the layer manifest; anything else
+    is a plain scan.
+    """
+    directory = str(directory)
+    root = layer_root(os.path.join(directory, "_"))
+    if root is None:
+        return latest_file(glob.glob(os.path.join(directory, pattern)))
+    return manifest_for(root).latest_in_dir(directory, pattern)
@@ -0,0 +1,352 @@
+"""Shared reader for the season/week-partitioned parquet lake.
+
+Bronze, Silver and Gold tables are written as
+``<layer>/<subdir>/season=YYYY[/week=W]/<prefix>_YYYYMMDD_HHMMSS.parquet``
+and every re-ingest adds a new timestamped file next to the old ones. The
+feature modules used to each carry their own glob / sort / ``read_parquet``
+helper; this module is the one implementation:
+
+* :func:`resolve_partition` picks the latest file of a partition by the
+  filename-embedded timestamp (never the directory path, so ``week=9``
+  cannot lexically outrank ``week=18``);
+* :func:`read_partition` pushes ``columns=`` and row ``filters=`` down to
+  pyarrow, so only the needed column chunks are decoded;
+* decoded tables are memoized per ``(path, columns, filters)`` in
+  :data:`PARTITION_CACHE`, an LRU bounded by a byte budget
+  (``PARTITION_CACHE_MB``, default 1024; 0 disables caching). Entries are
+  stamped with the file's ``(mtime, size)``, so a re-ingest is picked up
+  without a restart, and a column subset is served from a cached full read
+  of the same file. A pipeline run that reads Bronze PBP in five modules
+  decodes it once.
+
+Callers get a private copy by default; pass ``copy=False`` only when the
+frame is treated as read-only.
+
+Usage
+-----
+::
+
+    from partition_reader import read_partition
+
+    pbp = read_partition(BRONZE_DIR, "pbp", 2024, columns=["game_id", "epa"])
+    usage = read_partition(SILVER_DIR, "players/usage", 2024, weeks="latest")
+"""
+
+import glob
+import logging
+import os
+import re
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import pandas as pd
+import pyarrow.parquet as pq
+
+logger = logging.getLogger(__name__)
+
+_TIMESTAMP_RE = re.compile(r"(\d{8})_(\d{6})")
+_WEEK_RE = re.compile(r"week=(\d+)")
+
+WEEK_MODES = ("none", "fallback", "latest")
+
+Filters = Optional[Sequence[Tuple[str, str, Any]]]
+
+
+# ---------------------------------------------------------------------------
+# Partition resolution
+# ---------------------------------------------------------------------------
+
+
+def file_sort_key(path: str) -> Tuple[str, str]:
+    """Sort key ``(timestamp, basename)``; files without a timestamp sort first."""
+    name = os.path.basename(path)
+    matches = _TIMESTAMP_RE.findall(name)
+    stamp = "".join(matches[-1]) if matches else ""
+    return (stamp, name)
+
+
+def _week_number(directory: str) -> int:
+    match = _WEEK_RE.search(os.path.basename(directory))
+    return int(match.group(1)) if match else -1
+
+
+def latest_file(paths: Sequence[str]) -> Optional[str]:
+    """Return the newest file by filename timestamp, or None for no paths."""
+    return max(paths, key=file_sort_key) if paths else None
+
+
+def partition_dir(base_dir: str, subdir: str, season: Optional[int] = None) -> str:
+    """Directory of a partition: ``base_dir/subdir[/season=YYYY]``."""
+    path = os.path.join(base_dir, subdir)
+    return path if season is None else os.path.join(path, f"season={season}")
+
+
+def resolve_partition(
+    base_dir: str,
+    subdir: str,
+    season: Optional[int] = None,
+    prefix: str = "",
+    weeks: str = "none",
+) -> List[str]:
+    """Resolve the files to read for one partition.
+
+    Args:
+        base_dir: Layer root (e.g. ``data/bronze``).
+        subdir: Table path under the layer (e.g. ``players/weekly``).
+        season: Season partition; None reads files directly under ``subdir``.
+        prefix: Only consider files named ``<prefix>*.parquet``.
+        weeks: How ``week=W/`` sub-partitions are handled:
+
+            * ``"none"`` -- only files directly in the season directory;
+            * ``"fallback"`` -- the latest season-level file, else the latest
+              file of every week partition (ordered by week);
+            * ``"latest"`` -- the single latest file across the season
+              directory and all of its week partitions.
+
+    Returns:
+        File paths to read (empty when the partition has no data).
+    """
+    if weeks not in WEEK_MODES:
+        raise ValueError(f"weeks must be one of {WEEK_MODES}, got {weeks!r}")
+    root = partition_dir(base_dir, subdir, season)
+    pattern = f"{prefix}*.parquet"
+    flat = glob.glob(os.path.join(root, pattern))
+    if weeks == "none":
+        return [latest_file(flat)] if flat else []
+    if weeks == "latest":
+        nested = glob.glob(os.path.join(root, "week=*", pattern))
+        candidates = flat + nested
+        return [latest_file(candidates)] if candidates else []
+    if flat:
+        return [latest_file(flat)]
+    files = []
+    for week_dir in sorted(glob.glob(os.path.join(root, "week=*")), key=_week_number):
+        newest = latest_file(glob.glob(os.path.join(week_dir, pattern)))
+        if newest is not None:
+            files.append(newest)
+    return files
+
+
+# ---------------------------------------------------------------------------
+# Decoded-table cache
+# ---------------------------------------------------------------------------
+
+
+def _stamp(path: str) -> Optional[Tuple[int, int]]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _freeze(value: Any) -> Any:
+    """Hashable form of a filter value (lists/sets become tuples)."""
+    if isinstance(value, (list, tuple, set, frozenset)):
+        items = (
+            sorted(value, key=repr) if isinstance(value, (set, frozenset)) else value
+        )
+        return tuple(_freeze(v) for v in items)
+    return value
+
+
+def _budget_from_env() -> int:
+    raw = os.environ.get("PARTITION_CACHE_MB", "1024")
+    try:
+        return max(int(float(raw) * 1024 * 1024), 0)
+    except ValueError:
+        logger.warning("Ignoring invalid PARTITION_CACHE_MB=%r", raw)
+        return 1024 * 1024 * 1024
+
+
+class PartitionCache:
+    """LRU of decoded parquet reads bounded by a byte budget.
+
+    Keys are ``(path, columns, filters)``; every entry carries the file's
+    ``(mtime, size)`` stamp and is dropped when the file changes. Sizes are
+    the pandas frames' deep memory usage (object string columns run several
+    times their Arrow size), so the budget bounds what is actually held. A
+    single read larger than the whole
+    budget is returned but not cached. Thread-safe: concurrent misses on the
+    same key decode once.
+    """
+
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes = max_bytes
+        self._lock = threading.RLock()
+        self._entries: "OrderedDict[Tuple, Tuple[Tuple[int, int], pd.DataFrame, int]]"
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def read(
+        self,
+        path: str,
+        columns: Optional[Sequence[str]] = None,
+        filters: Filters = None,
+    ) -> pd.DataFrame:
+        """Decoded frame for ``path`` (shared -- callers must not mutate it).
+
+        Args:
+            path: Parquet file.
+            columns: Columns to decode; names missing from the file are
+                skipped. None decodes every column.
+            filters: pyarrow row filters, e.g. ``[("game_type", "==", "REG")]``.
+
+        Returns:
+            The cached or freshly decoded DataFrame.
+        """
+        stamp = _stamp(path)
+        if stamp is None:
+            raise FileNotFoundError(path)
+        cols = None if columns is None else tuple(columns)
+        frozen = _freeze(filters) if filters else None
+        key = (path, cols, frozen)
+        with self._lock:
+            frame = self._lookup(key, stamp)
+            if frame is not None:
+                self.hits += 1
+                return frame
+            if cols is not None:
+                full = self._lookup((path, None, frozen), stamp)
+                if full is not None:
+                    self.hits += 1
+                    return full[[c for c in cols if c in full.columns]]
+
+            self.misses += 1
+            table = self._decode(path, cols, filters)
+            frame = table.to_pandas()
+            nbytes = int(frame.memory_usage(index=True, deep=True).sum())
+            self._store(key, stamp, frame, nbytes)
+            return frame
+
+    @staticmethod
+    def _decode(path: str, cols: Optional[Tuple[str, ...]], filters: Filters):
+        # partitioning=None: the season=/week= directories are layout, not
+        # columns -- the files already carry season/week.
+        read_cols = None
+        if cols is not None:
+            present = set(pq.read_schema(path).names)
+            read_cols = [c for c in cols if c in present]
+        return pq.read_table(
+            path,
+            columns=read_cols,
+            filters=list(filters) if filters else None,
+            partitioning=None,
+            use_pandas_metadata=True,
+        )
+
+    def _lookup(self, key: Tuple, stamp: Tuple[int, int]) -> Optional[pd.DataFrame]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry[0] != stamp:
+            self._drop(key)
+            return None
+        self._entries.move_to_end(key)
+        return entry[1]
+
+    def _store(
+        self, key: Tuple, stamp: Tuple[int, int], frame: pd.DataFrame, nbytes: int
+    ) -> None:
+        if key in self._entries:
+            self._drop(key)
+        if nbytes > self.max_bytes:
+            return
+        while self._entries and self._bytes + nbytes > self.max_bytes:
+            self._drop(next(iter(self._entries)))
+            self.evictions += 1
+        self._entries[key] = (stamp, frame, nbytes)
+        self._bytes += nbytes
+
+    def _drop(self, key: Tuple) -> None:
+        _, _, nbytes = self._entries.pop(key)
+        self._bytes -= nbytes
+
+    def clear(self) -> None:
+        """Drop every cached table and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Entry count, cached bytes, budget, hits, misses and evictions."""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+
+PARTITION_CACHE = PartitionCache(_budget_from_env())
+
+
+# ---------------------------------------------------------------------------
+# Public readers
+# ---------------------------------------------------------------------------
+
+
+def read_parquet_cached(
+    path: str,
+    columns: Optional[Sequence[str]] = None,
+    filters: Filters = None,
+    copy: bool = True,
+) -> pd.DataFrame:
+    """Read one parquet file through :data:`PARTITION_CACHE`.
+
+    Args:
+        path: Parquet file.
+        columns: Columns to decode (missing names are skipped); None for all.
+        filters: pyarrow row filters pushed down to the scan.
+        copy: Return a private copy. ``False`` returns the shared cached
+            frame, which must not be mutated.
+
+    Returns:
+        Decoded DataFrame.
+    """
+    frame = PARTITION_CACHE.read(path, columns, filters)
+    return frame.copy() if copy else frame
+
+
+def read_partition(
+    base_dir: str,
+    subdir: str,
+    season: Optional[int] = None,
+    columns: Optional[Sequence[str]] = None,
+    filters: Filters = None,
+    prefix: str = "",
+    weeks: str = "none",
+    copy: bool = True,
+) -> pd.DataFrame:
+    """Read the latest data of one partition.
+
+    Args:
+        base_dir: Layer root (e.g. ``data/bronze``).
+        subdir: Table path under the layer (e.g. ``pbp``).
+        season: Season partition; None reads files directly under ``subdir``.
+        columns: Columns to decode (missing names are skipped); None for all.
+        filters: pyarrow row filters pushed down to the scan.
+        prefix: Only consider files named ``<prefix>*.parquet``.
+        weeks: Week sub-partition handling, see :func:`resolve_partition`.
+        copy: Return a private copy (see :func:`read_parquet_cached`).
+
+    Returns:
+        DataFrame of the resolved file(s) -- concatenated in week order when
+        several week partitions are read -- or an empty DataFrame when the
+        partition has no files.
+    """
+    files = resolve_partition(base_dir, subdir, season, prefix=prefix, weeks=weeks)
+    if not files:
+        return pd.DataFrame()
+    if len(files) == 1:
+        return read_parquet_cached(files[0], columns, filters, copy=copy)
+    frames = [read_parquet_cached(f, columns, filters, copy=False) for f in files]
+    return pd.concat(frames, ignore_index=True)
@@ -47,7 +47,6 @@ Usage:
     )
 """
 
-import glob
 import logging
 import os
 from typing import List, Optional
@@ -55,6 +54,9 @@ from typing import List, Optional
 import numpy as np
 import pandas as pd
 
+from partition_reader import read_parquet_cached, resolve_partition
+from rolling_kernel import LaggedGroupBlock
+
 logger = logging.getLogger(__name__)
 
 # ---------------------------------------------------------------------------
@@ -122,8 +124,7 @@ def _slope_for_window(sub: "pd.Series") -> float:
 
 def _load_bronze_pbp(season: int, bronze_dir: str) -> pd.DataFrame:
     """Read latest Bronze PBP parquet for a season, retaining only needed cols."""
-    pattern = os.path.join(bronze_dir, "pbp", f"season={season}", "*.parquet")
-    files = sorted(glob.glob(pattern))
+    files = resolve_partition(bronze_dir, "pbp", season)
     if not files:
         logger.warning("No Bronze PBP data for season %d", season)
         return pd.DataFrame()
@@ -141,9 +142,7 @@ def _load_bronze_pbp(season: int, bronze_dir: str) -> pd.DataFrame:
         "passer_player_id",
     ]
     try:
-        df = pd.read_parquet(files[-1])
-        avail = [c for c in keep_cols if c in df.columns]
-        return df[avail].copy()
+        return read_parquet_cached(files[0], columns=keep_cols)
     except Exception as exc:
         logger.warning("Failed to read Bronze PBP season %d: %s", season, exc)
         return pd.DataFrame()
@@ -391,23 +390,22 @@ def add_pbp_advanced_trailing_features(df: pd.DataFrame) -> pd.DataFrame:
         )
         return df
 
-    grouped = df.groupby(["player_id", "season"])
+    block = LaggedGroupBlock(df, ["player_id", "season"], raw_features)
+    roll = block.columns(
+        block.rolling_mean(_TRAIL_WINDOW, min_periods=_MIN_GAMES), "{col}_roll4"
+    )
+    trail = block.columns(block.expanding_mean(min_periods=_MIN_GAMES), "{col}_trail")
 
     new_cols: dict = {}
     for feat in raw_features:
-        new_cols[f"{feat}_roll4"] = grouped[feat].transform(
-            lambda s: s.shift(1).rolling(_TRAIL_WINDOW, min_periods=_MIN_GAMES).mean()
-        )
-        new_cols[f"{feat}_trail"] = grouped[feat].transform(
-            lambda s: s.shift(1).expanding(min_periods=_MIN_GAMES).mean()
-        )
+        new_cols[f"{feat}_roll4"] = roll[f"{feat}_roll4"]
+        new_cols[f"{feat}_trail"] = trail[f"{feat}_trail"]
 
     if "adot" in df.columns:
-        new_cols["adot_slope"] = grouped["adot"].transform(
-            lambda s: s.shift(1).rolling(_TRAIL_WINDOW, min_periods=_SLOPE_MIN_GAMES).apply(
-                _slope_for_window, raw=False
-            )
-        )
+        slope_block = LaggedGroupBlock(df, ["player_id", "season"], ["adot"])
+        new_cols["adot_slope"] = slope_block.rolling_slope(
+            _TRAIL_WINDOW, min_periods=_SLOPE_MIN_GAMES
+        )[:, 0]
 
     df = df.assign(**new_cols)
     logger.info(
@@ -10,6 +10,8 @@ import numpy as np
 from typing import Dict, List, Optional
 import logging
 
+from rolling_kernel import LaggedGroupBlock
+
 logger = logging.getLogger(__name__)
 
 
@@ -468,19 +470,14 @@ def compute_rolling_averages(
 
     stat_cols = [c for c in ROLLING_STAT_COLS if c in df.columns]
 
+    block = LaggedGroupBlock(df, ["player_id", "season"], stat_cols)
     for window in windows:
-        roll_cols = {}
-        for col in stat_cols:
-            roll_cols[f"{col}_roll{window}"] = df.groupby(["player_id", "season"])[
-                col
-            ].transform(lambda s: s.shift(1).rolling(window, min_periods=1).mean())
-        df = df.assign(**roll_cols)
+        df = df.assign(
+            **block.columns(block.rolling_mean(window), f"{{col}}_roll{window}")
+        )
 
     # Season-to-date average
-    for col in stat_cols:
-        df[f"{col}_std"] = df.groupby(["player_id", "season"])[col].transform(
-            lambda s: s.shift(1).expanding().mean()
-        )
+    df = df.assign(**block.columns(block.expanding_mean(), "{col}_std"))
 
     logger.info(f"Rolling averages computed ({windows}) for {len(df)} rows")
     return df
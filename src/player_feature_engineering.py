@@ -27,6 +27,8 @@ from config import (
     SILVER_PLAYER_LOCAL_DIRS,
     SILVER_PLAYER_TEAM_SOURCES,
 )
+from partition_reader import read_partition
+from season_parallel import map_seasons
 
 logger = logging.getLogger(__name__)
 
@@ -427,15 +429,7 @@ def _read_latest_local(subdir: str, season: int) -> pd.DataFrame:
     Returns:
         DataFrame from latest parquet file, or empty DataFrame if not found.
     """
-    candidates = []
-    for pattern in (
-        os.path.join(SILVER_DIR, subdir, f"season={season}", "*.parquet"),
-        os.path.join(SILVER_DIR, subdir, f"season={season}", "week=*", "*.parquet"),
-    ):
-        candidates.extend(glob.glob(pattern))
-    if not candidates:
-        return pd.DataFrame()
-    return pd.read_parquet(max(candidates, key=os.path.basename))
+    return read_partition(SILVER_DIR, subdir, season, weeks="latest")
 
 
 def _read_bronze_schedules(season: int) -> pd.DataFrame:
@@ -448,16 +442,6 @@ def _read_bronze_schedules(season: int) -> pd.DataFrame:
         DataFrame with season, week, home_team, away_team, spread_line,
         total_line, game_type columns.
     """
-    pattern = os.path.join(BRONZE_DIR, "schedules", f"season={season}", "*.parquet")
-    files = sorted(glob.glob(pattern))
-    if not files:
-        return pd.DataFrame()
-    df = pd.read_parquet(files[-1])
-
-    # Filter to regular season
-    if "game_type" in df.columns:
-        df = df[df["game_type"] == "REG"].copy()
-
     keep_cols = [
         "season",
         "week",
@@ -467,8 +451,12 @@ def _read_bronze_schedules(season: int) -> pd.DataFrame:
         "total_line",
         "game_type",
     ]
-    available = [c for c in keep_cols if c in df.columns]
-    return df[available].copy()
+    df = read_partition(BRONZE_DIR, "schedules", season, columns=keep_cols)
+
+    # Filter to regular season
+    if "game_type" in df.columns:
+        df = df[df["game_type"] == "REG"].copy()
+    return df
 
 
 # ---------------------------------------------------------------------------
@@ -2164,11 +2152,23 @@ def detect_leakage(
 
 def assemble_multiyear_player_features(
     seasons: Optional[List[int]] = None,
+    use_store: bool = False,
+    columns: Optional[List[str]] = None,
+    workers: Optional[int] = None,
 ) -> pd.DataFrame:
     """Assemble player features across multiple seasons.
 
     Args:
         seasons: List of season years. Defaults to PLAYER_DATA_SEASONS.
+        use_store: Read from the season-partitioned feature store
+            (``player_feature_store``), rebuilding only seasons whose Silver
+            inputs or feature code changed, instead of re-running every join.
+        columns: Column projection when ``use_store`` is set (identifier
+            columns are always kept). Ignored otherwise.
+        workers: Process count for per-season assembly (see
+            ``season_parallel.map_seasons``). None uses
+            FEATURE_ASSEMBLY_WORKERS; 1 runs serially. Output order and
+            dtypes are identical either way.
 
     Returns:
         Concatenated DataFrame of player-week features across all seasons.
@@ -2176,9 +2176,15 @@ def assemble_multiyear_player_features(
     if seasons is None:
         seasons = PLAYER_DATA_SEASONS
 
+    if use_store:
+        from player_feature_store import load_player_features
+
+        return load_player_features(seasons, columns=columns)
+
     dfs = []
-    for season in seasons:
-        df = assemble_player_features(season)
+    for season, df in zip(
+        seasons, map_seasons(assemble_player_features, seasons, workers)
+    ):
         if not df.empty:
             dfs.append(df)
             logger.info("Season %d: %d rows", season, len(df))
@@ -0,0 +1,313 @@
+"""Season-partitioned, versioned store of assembled player-week features.
+
+``assemble_player_features(season)`` performs ~20 left-joins against Silver
+(and a few Bronze fallbacks) every time it runs, and every training script,
+``generate_ml_projections`` and the hybrid residual path used to rebuild it
+from scratch for each season in ``PLAYER_DATA_SEASONS``. This module
+materializes the result once per season under::
+
+    data/gold/player_feature_store/season=YYYY/features.parquet
+    data/gold/player_feature_store/season=YYYY/manifest.json
+
+Each partition is keyed by a fingerprint of its inputs — every Silver file
+under a ``season=YYYY`` partition, the unpartitioned Silver historical
+profiles, and the Bronze partitions the assembler falls back to for that
+season — plus :func:`feature_code_version`. A partition is rebuilt only when
+that key changes, and :func:`load_player_features` can project a column
+subset (``pd.read_parquet(columns=...)``) instead of loading ~500 columns.
+
+Fingerprints use ``(relative path, size, mtime_ns)`` rather than content
+hashes, so checking freshness costs a directory walk, not a read.
+
+Exports:
+    load_player_features: Read (refreshing stale seasons) a column subset.
+    refresh_feature_store: Rebuild the partitions whose inputs changed.
+    feature_store_status: Report per-season freshness without rebuilding.
+"""
+
+import glob
+import hashlib
+import json
+import logging
+import os
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+
+import pandas as pd
+import pyarrow.parquet as pq
+
+from config import PLAYER_DATA_SEASONS
+
+logger = logging.getLogger(__name__)
+
+_BASE_DIR = os.path.dirname(os.path.dirname(__file__))
+DATA_DIR = os.path.join(_BASE_DIR, "data")
+STORE_DIR = os.path.join(DATA_DIR, "gold", "player_feature_store")
+
+# Bump when a change outside player_feature_engineering.py (e.g. a Silver
+# helper it calls) alters assembled features; edits to the assembler module
+# itself are picked up automatically through its source hash.
+FEATURE_STORE_VERSION = 1
+
+# Columns always returned alongside a projected feature subset.
+STORE_KEY_COLUMNS = [
+    "player_id",
+    "player_name",
+    "season",
+    "week",
+    "position",
+    "recent_team",
+    "opponent_team",
+]
+
+_FEATURES_FILE = "features.parquet"
+_MANIFEST_FILE = "manifest.json"
+
+# Bronze partitions assemble_player_features falls back to (current season
+# and up to three prior seasons for the chemistry / red-zone fallbacks).
+_BRONZE_FALLBACK_DIRS = [
+    os.path.join("bronze", "schedules"),
+    os.path.join("bronze", "pbp"),
+    os.path.join("bronze", "pfr", "weekly", "def"),
+    os.path.join("bronze", "players", "weekly"),
+    os.path.join("bronze", "players", "rosters"),
+]
+_BRONZE_LOOKBACK_SEASONS = 3
+_MIN_BRONZE_SEASON = 2016
+
+
+def feature_code_version() -> str:
+    """Version string for the feature code that produced a partition.
+
+    Combines :data:`FEATURE_STORE_VERSION` with a hash of the
+    ``player_feature_engineering`` source so that editing the assembler
+    invalidates every partition without a manual bump.
+    """
+    import player_feature_engineering
+
+    with open(player_feature_engineering.__file__, "rb") as f:
+        source_hash = hashlib.sha256(f.read()).hexdigest()[:16]
+    return f"v{FEATURE_STORE_VERSION}-{source_hash}"
+
+
+def _season_input_files(season: int, data_dir: str) -> List[str]:
+    """All parquet files that can feed ``assemble_player_features(season)``."""
+    silver_dir = os.path.join(data_dir, "silver")
+    patterns = [
+        os.path.join(silver_dir, "**", f"season={season}", "*.parquet"),
+        os.path.join(silver_dir, "**", f"season={season}", "week=*", "*.parquet"),
+        os.path.join(silver_dir, "players", "historical", "*.parquet"),
+    ]
+    first = max(season - _BRONZE_LOOKBACK_SEASONS, _MIN_BRONZE_SEASON)
+    for subdir in _BRONZE_FALLBACK_DIRS:
+        for s in range(first, season + 1):
+            base = os.path.join(data_dir, subdir, f"season={s}")
+            patterns.append(os.path.join(base, "*.parquet"))
+            patterns.append(os.path.join(base, "week=*", "*.parquet"))
+
+    files = set()
+    for pattern in patterns:
+        files.update(glob.glob(pattern, recursive=True))
+    return sorted(files)
+
+
+def season_fingerprint(season: int, data_dir: str = DATA_DIR) -> str:
+    """Hash of the input files and feature code version for one season.
+
+    Args:
+        season: NFL season year.
+        data_dir: Root of the data lake (``data/``).
+
+    Returns:
+        Hex digest that changes whenever an input file is added, removed,
+        rewritten, or the feature code version changes.
+    """
+    digest = hashlib.sha256(feature_code_version().encode())
+    for path in _season_input_files(season, data_dir):
+        stat = os.stat(path)
+        rel = os.path.relpath(path, data_dir).replace(os.sep, "/")
+        digest.update(f"{rel}|{stat.st_size}|{stat.st_mtime_ns}\n".encode())
+    return digest.hexdigest()
+
+
+def _partition_dir(season: int, store_dir: str) -> str:
+    return os.path.join(store_dir, f"season={season}")
+
+
+def _read_manifest(season: int, store_dir: str) -> Optional[dict]:
+    path = os.path.join(_partition_dir(season, store_dir), _MANIFEST_FILE)
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, "r") as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError) as e:
+        logger.warning("Unreadable feature store manifest %s: %s", path, e)
+        return None
+
+
+def _is_fresh(season: int, fingerprint: str, store_dir: str) -> bool:
+    manifest = _read_manifest(season, store_dir)
+    features = os.path.join(_partition_dir(season, store_dir), _FEATURES_FILE)
+    return (
+        manifest is not None
+        and manifest.get("fingerprint") == fingerprint
+        and os.path.exists(features)
+    )
+
+
+def _write_partition(
+    season: int, df: pd.DataFrame, fingerprint: str, store_dir: str
+) -> None:
+    """Write features then manifest, each via an atomic rename."""
+    part_dir = _partition_dir(season, store_dir)
+    os.makedirs(part_dir, exist_ok=True)
+
+    features_path = os.path.join(part_dir, _FEATURES_FILE)
+    tmp_path = features_path + ".tmp"
+    df.to_parquet(tmp_path, index=False)
+    os.replace(tmp_path, features_path)
+
+    manifest = {
+        "season": season,
+        "fingerprint": fingerprint,
+        "code_version": feature_code_version(),
+        "rows": len(df),
+        "columns": len(df.columns),
+        "built_at": datetime.now().isoformat(timespec="seconds"),
+    }
+    manifest_path = os.path.join(part_dir, _MANIFEST_FILE)
+    with open(manifest_path + ".tmp", "w") as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(manifest_path + ".tmp", manifest_path)
+
+
+def _default_builder(season: int) -> pd.DataFrame:
+    from player_feature_engineering import assemble_player_features
+
+    return assemble_player_features(season)
+
+
+def feature_store_status(
+    seasons: Optional[List[int]] = None,
+    data_dir: str = DATA_DIR,
+    store_dir: str = STORE_DIR,
+) -> Dict[int, bool]:
+    """Report which season partitions are fresh, without rebuilding.
+
+    Args:
+        seasons: Seasons to check. Defaults to PLAYER_DATA_SEASONS.
+        data_dir: Root of the data lake the fingerprint is computed over.
+        store_dir: Feature store root.
+
+    Returns:
+        Dict mapping season to True if its stored partition is current.
+    """
+    if seasons is None:
+        seasons = PLAYER_DATA_SEASONS
+    return {
+        season: _is_fresh(season, season_fingerprint(season, data_dir), store_dir)
+        for season in seasons
+    }
+
+
+def refresh_feature_store(
+    seasons: Optional[List[int]] = None,
+    force: bool = False,
+    builder: Optional[Callable[[int], pd.DataFrame]] = None,
+    data_dir: str = DATA_DIR,
+    store_dir: str = STORE_DIR,
+) -> Dict[int, bool]:
+    """Rebuild the season partitions whose input fingerprint changed.
+
+    Args:
+        seasons: Seasons to refresh. Defaults to PLAYER_DATA_SEASONS.
+        force: Rebuild every requested season regardless of fingerprint.
+        builder: ``season -> DataFrame`` assembler (defaults to
+            ``assemble_player_features``); injectable for tests.
+        data_dir: Root of the data lake the fingerprint is computed over.
+        store_dir: Feature store root.
+
+    Returns:
+        Dict mapping season to True if it was rebuilt on this call. Seasons
+        that assemble to an empty frame are not written and map to False.
+    """
+    if seasons is None:
+        seasons = PLAYER_DATA_SEASONS
+    if builder is None:
+        builder = _default_builder
+
+    rebuilt: Dict[int, bool] = {}
+    for season in seasons:
+        fingerprint = season_fingerprint(season, data_dir)
+        if not force and _is_fresh(season, fingerprint, store_dir):
+            rebuilt[season] = False
+            continue
+        logger.info("Feature store: building season %d", season)
+        df = builder(season)
+        if df.empty:
+            logger.warning("Feature store: season %d assembled empty", season)
+            rebuilt[season] = False
+            continue
+        _write_partition(season, df, fingerprint, store_dir)
+        rebuilt[season] = True
+    return rebuilt
+
+
+def load_player_features(
+    seasons: Optional[List[int]] = None,
+    columns: Optional[List[str]] = None,
+    refresh: bool = True,
+    builder: Optional[Callable[[int], pd.DataFrame]] = None,
+    data_dir: str = DATA_DIR,
+    store_dir: str = STORE_DIR,
+) -> pd.DataFrame:
+    """Read player-week features from the store, building stale seasons.
+
+    Args:
+        seasons: Seasons to read. Defaults to PLAYER_DATA_SEASONS.
+        columns: Columns to project. ``None`` reads every column; otherwise
+            :data:`STORE_KEY_COLUMNS` are always included and names absent
+            from a partition are skipped.
+        refresh: Rebuild partitions whose fingerprint changed before
+            reading. With ``False``, whatever is stored is read as-is.
+        builder: Forwarded to :func:`refresh_feature_store`.
+        data_dir: Root of the data lake the fingerprint is computed over.
+        store_dir: Feature store root.
+
+    Returns:
+        Concatenated DataFrame across seasons (same shape contract as
+        ``assemble_multiyear_player_features``), or empty if nothing stored.
+    """
+    if seasons is None:
+        seasons = PLAYER_DATA_SEASONS
+    if refresh:
+        refresh_feature_store(
+            seasons, builder=builder, data_dir=data_dir, store_dir=store_dir
+        )
+
+    wanted = None
+    if columns is not None:
+        wanted = list(dict.fromkeys(list(STORE_KEY_COLUMNS) + list(columns)))
+
+    dfs = []
+    for season in seasons:
+        path = os.path.join(_partition_dir(season, store_dir), _FEATURES_FILE)
+        if not os.path.exists(path):
+            continue
+        read_cols = None
+        if wanted is not None:
+            available = set(pq.read_schema(path).names)
+            read_cols = [c for c in wanted if c in available]
+        dfs.append(pd.read_parquet(path, columns=read_cols))
+
+    if not dfs:
+        return pd.DataFrame()
+    result = pd.concat(dfs, ignore_index=True)
+    logger.info(
+        "Feature store read: %d seasons, %d rows, %d columns",
+        len(dfs),
+        len(result),
+        len(result.columns),
+    )
+    return result
@@ -14,6 +14,8 @@ Exports:
     _player_xgb_fit_kwargs: XGBoost fit kwargs for walk-forward CV.
     _player_lgb_fit_kwargs: LightGBM fit kwargs for walk-forward CV.
     player_walk_forward_cv: Walk-forward CV keyed on row index.
+    player_cv_job: Describe a player CV run for walk_forward_runner.run_cv_jobs.
+    player_cv_result: Convert run_cv_jobs folds to (result, oof_df).
     run_player_feature_selection: SHAP selection per stat-type group.
     train_position_models: Train all stat models for one position.
     assemble_player_oof_matrix: Merge XGB/LGB OOF predictions on idx.
@@ -28,6 +30,7 @@ import json
 import logging
 import os
 from datetime import datetime
+from functools import partial
 from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import numpy as np
@@ -36,7 +39,6 @@ import shap
 import xgboost as xgb
 from sklearn.impute import SimpleImputer
 from sklearn.linear_model import ElasticNetCV, RidgeCV
-from sklearn.metrics import mean_absolute_error
 from sklearn.model_selection import train_test_split
 from sklearn.pipeline import Pipeline
 
@@ -45,6 +47,7 @@ from ensemble_training import make_lgb_model, make_xgb_model
 from feature_selector import _assert_no_holdout, filter_correlated_features
 from model_training import WalkForwardResult
 from projection_engine import POSITION_STAT_PROFILE
+from walk_forward_runner import CvJob, FoldResult, run_cv_jobs
 
 logger = logging.getLogger(__name__)
 
@@ -256,11 +259,14 @@ def player_walk_forward_cv(
     model_factory: Callable[[], Any],
     fit_kwargs_fn: Optional[Callable] = None,
     val_seasons: Optional[List[int]] = None,
+    workers: Optional[int] = None,
 ) -> Tuple[WalkForwardResult, pd.DataFrame]:
     """Walk-forward CV keyed on row index (NOT game_id).
 
     For each validation season, trains on all prior seasons and validates
     on that single season. Collects OOF predictions keyed by row index.
+    Folds share one design matrix and run through
+    ``walk_forward_runner.run_cv_jobs``.
 
     Args:
         pos_data: Position-filtered DataFrame with features, target, 'season'.
@@ -270,99 +276,74 @@ def player_walk_forward_cv(
         fit_kwargs_fn: Optional callable(X_train, y_train, X_val, y_val) -> dict.
             Defaults to _player_xgb_fit_kwargs.
         val_seasons: Seasons to validate on. Defaults to PLAYER_VALIDATION_SEASONS.
+        workers: Fold processes (default CV_WORKERS; 1 = serial).
 
     Returns:
         Tuple of (WalkForwardResult, oof_df) where oof_df has columns
-        [idx, season, week, oof_prediction].
+        [idx, season, week, oof_prediction]. Each fold detail also carries
+        'seconds' and 'peak_rss_mb'.
 
     Raises:
         ValueError: If a validation season equals HOLDOUT_SEASON.
     """
-    if val_seasons is None:
-        val_seasons = PLAYER_VALIDATION_SEASONS
-
-    if fit_kwargs_fn is None:
-        fit_kwargs_fn = _player_xgb_fit_kwargs
-
-    fold_maes: List[float] = []
-    fold_details: List[Dict[str, Any]] = []
-    oof_records: List[pd.DataFrame] = []
-
-    for val_season in val_seasons:
-        if val_season == HOLDOUT_SEASON:
-            raise ValueError(
-                f"Validation season {val_season} equals HOLDOUT_SEASON "
-                f"{HOLDOUT_SEASON}. The holdout season must never be used "
-                "during cross-validation."
-            )
-
-        train = pos_data[pos_data["season"] < val_season]
-        val = pos_data[pos_data["season"] == val_season]
-
-        if train.empty or val.empty:
-            continue
-
-        # Skip fold if train has fewer than 2 unique seasons (per D-17)
-        train_seasons = sorted(train["season"].unique().tolist())
-        if len(train_seasons) < 2:
-            logger.info(
-                f"Skipping fold val_season={val_season}: only {len(train_seasons)} "
-                "training season(s) (need >= 2)"
-            )
-            continue
-
-        X_train = train[feature_cols]
-        y_train = train[target_col]
-        X_val = val[feature_cols]
-        y_val = val[target_col]
-
-        model = model_factory()
-
-        # Build fit kwargs
-        fit_kw: Dict[str, Any] = {}
-        if fit_kwargs_fn is not None:
-            fit_kw = fit_kwargs_fn(X_train, y_train, X_val, y_val)
-
-        model.fit(X_train, y_train, **fit_kw)
+    job = player_cv_job(
+        pos_data, feature_cols, target_col, model_factory, fit_kwargs_fn, val_seasons
+    )
+    folds = run_cv_jobs([job], workers=workers)[0]
+    return player_cv_result(pos_data, folds)
 
-        preds = model.predict(X_val)
-        mae = float(mean_absolute_error(y_val, preds))
-        fold_maes.append(mae)
 
-        fold_details.append(
-            {
-                "train_seasons": train_seasons,
-                "val_season": val_season,
-                "train_size": len(train),
-                "val_size": len(val),
-                "mae": mae,
-            }
-        )
+def player_cv_job(
+    pos_data: pd.DataFrame,
+    feature_cols: List[str],
+    target_col: str,
+    model_factory: Callable[[], Any],
+    fit_kwargs_fn: Optional[Callable] = None,
+    val_seasons: Optional[List[int]] = None,
+    rows: Optional[np.ndarray] = None,
+) -> CvJob:
+    """Describe one player walk-forward CV run for ``run_cv_jobs``.
+
+    Uses the player defaults: PLAYER_VALIDATION_SEASONS, XGBoost fit
+    kwargs, and folds need >= 2 training seasons (per D-17). ``rows``
+    restricts the run to those positions of ``pos_data`` so every stat of
+    a position shares the position's design matrix.
+    """
+    return CvJob(
+        frame=pos_data,
+        feature_cols=list(feature_cols),
+        target_col=target_col,
+        model_factory=model_factory,
+        fit_kwargs_fn=fit_kwargs_fn or _player_xgb_fit_kwargs,
+        val_seasons=PLAYER_VALIDATION_SEASONS if val_seasons is None else val_seasons,
+        min_train_seasons=2,
+        rows=rows,
+    )
 
-        # Collect OOF predictions keyed by row index (NOT game_id)
-        oof_fold = pd.DataFrame(
-            {
-                "idx": val.index.values,
-                "season": val["season"].values,
-                "week": val["week"].values,
-                "oof_prediction": preds,
-            }
-        )
-        oof_records.append(oof_fold)
 
-    mean_mae = float(np.mean(fold_maes)) if fold_maes else 0.0
+def player_cv_result(
+    pos_data: pd.DataFrame, folds: List[FoldResult]
+) -> Tuple[WalkForwardResult, pd.DataFrame]:
+    """Turn ``run_cv_jobs`` folds into (WalkForwardResult, oof_df)."""
+    fold_maes = [f.mae for f in folds]
     result = WalkForwardResult(
-        mean_mae=mean_mae,
+        mean_mae=float(np.mean(fold_maes)) if fold_maes else 0.0,
         fold_maes=fold_maes,
-        fold_details=fold_details,
+        fold_details=[f.detail() for f in folds],
     )
-
-    oof_df = (
-        pd.concat(oof_records, ignore_index=True)
-        if oof_records
-        else pd.DataFrame(columns=["idx", "season", "week", "oof_prediction"])
+    if not folds:
+        return result, pd.DataFrame(columns=["idx", "season", "week", "oof_prediction"])
+
+    # Collect OOF predictions keyed by row index (NOT game_id)
+    pos = np.concatenate([f.val_positions for f in folds])
+    oof_df = pd.DataFrame(
+        {
+            "idx": pos_data.index.values[pos],
+            "season": pos_data["season"].values[pos],
+            "week": pos_data["week"].values[pos],
+            "oof_prediction": np.concatenate([f.predictions for f in folds]),
+        }
     )
-
     return result, oof_df
 
 
@@ -520,6 +501,14 @@ def run_player_feature_selection(
 # ---------------------------------------------------------------------------
 
 
+def _stat_rows(pos_data: pd.DataFrame, stat: str) -> np.ndarray:
+    """Positions of rows with a non-NaN ``stat`` outside the holdout season."""
+    mask = pos_data[stat].notna().to_numpy() & (
+        pos_data["season"].to_numpy() != HOLDOUT_SEASON
+    )
+    return np.flatnonzero(mask)
+
+
 def train_position_models(
     pos_data: pd.DataFrame,
     position: str,
@@ -531,7 +520,7 @@ def train_position_models(
     For each stat in POSITION_STAT_PROFILE[position]:
     1. Get stat type and corresponding features/hyperparams
     2. Drop rows with NaN target
-    3. Run walk-forward CV
+    3. Run walk-forward CV (all stats in one ``run_cv_jobs`` batch)
     4. Train final model on all non-holdout data
     5. Save model and metadata
 
@@ -547,6 +536,7 @@ def train_position_models(
     stats = POSITION_STAT_PROFILE.get(position, [])
     results: Dict[str, Any] = {}
 
+    plans: List[Tuple[str, str, List[str], np.ndarray, dict]] = []
     for stat in stats:
         stat_type = get_stat_type(stat)
         feat_cols = feature_cols_by_group.get(stat_type, [])
@@ -561,22 +551,27 @@ def train_position_models(
             logger.warning(f"No available features for {position}/{stat}")
             continue
 
-        # Drop rows with NaN target
-        stat_data = pos_data.dropna(subset=[stat]).copy()
-        if stat_data.empty:
+        # Drop rows with NaN target; exclude holdout from training
+        rows = _stat_rows(pos_data, stat)
+        if not rows.size:
             logger.warning(f"No non-NaN rows for {position}/{stat}")
             continue
 
-        # Exclude holdout from training
-        stat_data = stat_data[stat_data["season"] != HOLDOUT_SEASON]
+        plans.append((stat, stat_type, available, rows, get_player_model_params(stat)))
 
-        params = get_player_model_params(stat)
-        model_factory = lambda p=params: make_xgb_model(p)
+    # Walk-forward CV for every stat at once (shared per-position matrices)
+    cv_folds = run_cv_jobs(
+        [
+            player_cv_job(
+                pos_data, available, stat, partial(make_xgb_model, params), rows=rows
+            )
+            for stat, _, available, rows, params in plans
+        ]
+    )
 
-        # Walk-forward CV
-        wf_result, oof_df = player_walk_forward_cv(
-            stat_data, available, stat, model_factory
-        )
+    for (stat, stat_type, available, rows, params), folds in zip(plans, cv_folds):
+        stat_data = pos_data.iloc[rows]
+        wf_result, oof_df = player_cv_result(pos_data, folds)
 
         # Train final model on all non-holdout data
         X_all = stat_data[available]
@@ -673,24 +668,33 @@ def train_position_models_linear(
         f"(from {len(available)} available)"
     )
 
+    stat_rows: List[Tuple[str, np.ndarray]] = []
     for stat in stats:
-        # Drop rows with NaN target
-        stat_data = pos_data.dropna(subset=[stat]).copy()
-        if stat_data.empty:
+        # Drop rows with NaN target; exclude holdout from training
+        rows = _stat_rows(pos_data, stat)
+        if not rows.size:
             logger.warning(f"No non-NaN rows for {position}/{stat}")
             continue
+        stat_rows.append((stat, rows))
 
-        # Exclude holdout from training
-        stat_data = stat_data[stat_data["season"] != HOLDOUT_SEASON]
+    # Walk-forward CV with linear model, every stat in one batch
+    cv_folds = run_cv_jobs(
+        [
+            player_cv_job(
+                pos_data,
+                nonzero_var,
+                stat,
+                model_factory=factory,
+                fit_kwargs_fn=_linear_fit_kwargs,
+                rows=rows,
+            )
+            for stat, rows in stat_rows
+        ]
+    )
 
-        # Walk-forward CV with linear model
-        wf_result, oof_df = player_walk_forward_cv(
-            stat_data,
-            nonzero_var,
-            stat,
-            model_factory=factory,
-            fit_kwargs_fn=_linear_fit_kwargs,
-        )
+    for (stat, rows), folds in zip(stat_rows, cv_folds):
+        stat_data = pos_data.iloc[rows]
+        wf_result, oof_df = player_cv_result(pos_data, folds)
 
         # Train final model on all non-holdout data
         final_model = factory()
@@ -823,6 +827,8 @@ def player_ensemble_stacking(
     stats = POSITION_STAT_PROFILE.get(position, [])
     results: Dict[str, Any] = {}
 
+    plans: List[Tuple[str, List[str], np.ndarray, dict]] = []
+    jobs: List[CvJob] = []
     for stat in stats:
         stat_type = get_stat_type(stat)
         feat_cols = feature_cols_by_group.get(stat_type, [])
@@ -830,30 +836,40 @@ def player_ensemble_stacking(
         if not available:
             continue
 
-        stat_data = pos_data.dropna(subset=[stat]).copy()
-        stat_data = stat_data[stat_data["season"] != HOLDOUT_SEASON]
-        if stat_data.empty:
+        rows = _stat_rows(pos_data, stat)
+        if not rows.size:
             continue
 
-        # XGB walk-forward CV
-        xgb_params = get_player_model_params(stat)
-        xgb_wf, xgb_oof = player_walk_forward_cv(
-            stat_data,
-            available,
-            stat,
-            lambda p=xgb_params: make_xgb_model(p),
-            fit_kwargs_fn=_player_xgb_fit_kwargs,
-        )
-
-        # LGB walk-forward CV
+        # XGB + LGB walk-forward CV, all stats in one batch
         lgb_params = get_lgb_params_for_stat(stat)
-        lgb_wf, lgb_oof = player_walk_forward_cv(
-            stat_data,
-            available,
-            stat,
-            lambda p=lgb_params: make_lgb_model(p),
-            fit_kwargs_fn=_player_lgb_fit_kwargs,
+        plans.append((stat, available, rows, lgb_params))
+        jobs.append(
+            player_cv_job(
+                pos_data,
+                available,
+                stat,
+                partial(make_xgb_model, get_player_model_params(stat)),
+                fit_kwargs_fn=_player_xgb_fit_kwargs,
+                rows=rows,
+            )
         )
+        jobs.append(
+            player_cv_job(
+                pos_data,
+                available,
+                stat,
+                partial(make_lgb_model, lgb_params),
+                fit_kwargs_fn=_player_lgb_fit_kwargs,
+                rows=rows,
+            )
+        )
+
+    cv_folds = run_cv_jobs(jobs)
+
+    for n, (stat, available, rows, lgb_params) in enumerate(plans):
+        stat_data = pos_data.iloc[rows]
+        xgb_wf, xgb_oof = player_cv_result(pos_data, cv_folds[2 * n])
+        lgb_wf, lgb_oof = player_cv_result(pos_data, cv_folds[2 * n + 1])
 
         # Assemble OOF matrix and train Ridge
         oof_matrix = assemble_player_oof_matrix(xgb_oof, lgb_oof, stat_data, stat)
@@ -967,6 +983,7 @@ def predict_player_stats(
     player_data: pd.DataFrame,
     position: str,
     feature_cols_by_group: Dict[str, List[str]],
+    matrix_pool: Optional[Any] = None,
 ) -> pd.DataFrame:
     """Predict all stats for a position.
 
@@ -978,10 +995,21 @@ def predict_player_stats(
         player_data: Player-week DataFrame to predict on.
         position: Position code.
         feature_cols_by_group: Features per stat-type group.
+        matrix_pool: Optional ``model_registry.MatrixPool``. When given, each
+            stat-type group's features are written once into a reused
+            float32 buffer shared by the group's stats (models must have
+            been validated against the group's columns -- numpy input skips
+            XGBoost's feature-name check). Predictions are identical.
 
     Returns:
         DataFrame with pred_{stat} columns for each predicted stat.
     """
+    if matrix_pool is not None:
+        with matrix_pool.lock:
+            return _predict_player_stats_pooled(
+                model_dict, player_data, position, feature_cols_by_group, matrix_pool
+            )
+
     result_df = player_data.copy()
     stats = POSITION_STAT_PROFILE.get(position, [])
 
@@ -1016,6 +1044,32 @@ def predict_player_stats(
     return result_df
 
 
+def _predict_player_stats_pooled(
+    model_dict: Dict[str, Any],
+    player_data: pd.DataFrame,
+    position: str,
+    feature_cols_by_group: Dict[str, List[str]],
+    matrix_pool: Any,
+) -> pd.DataFrame:
+    """predict_player_stats on one pooled float32 matrix per stat-type group."""
+    preds: Dict[str, Any] = {}
+    filled: Dict[str, np.ndarray] = {}
+    for stat in POSITION_STAT_PROFILE.get(position, []):
+        stat_type = get_stat_type(stat)
+        feat_cols = feature_cols_by_group.get(stat_type, [])
+        if stat not in model_dict or not feat_cols:
+            preds[f"pred_{stat}"] = np.nan
+            continue
+        if stat_type not in filled:
+            filled[stat_type] = matrix_pool.fill(stat_type, player_data, feat_cols)
+        preds[f"pred_{stat}"] = model_dict[stat]["model"].predict(filled[stat_type])
+
+    result_df = player_data.copy()
+    for col, values in preds.items():
+        result_df[col] = values
+    return result_df
+
+
 def predict_player_stats_linear(
     model_dict: Dict[str, Any],
     player_data: pd.DataFrame,
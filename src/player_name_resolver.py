@@ -15,8 +15,12 @@ Public API
 
 Notes
 -----
-- The resolver is intentionally stateless across calls; all state lives in the
-  lookup index built at construction time.
+- All matching state lives in the lookup index built at construction time;
+  the only per-call state is a bounded memo of recent query results, which
+  never changes an answer.
+- Fuzzy matching goes through an inverted token index (token → entry
+  positions): only entries sharing a token with the query, and whose token
+  count can reach the Jaccard threshold, are scored.
 - When multiple candidates share an identical normalised name, team and
   position are used as tiebreakers.  If ambiguity remains after tiebreaking,
   None is returned so callers can skip or escalate.
@@ -29,8 +33,9 @@ from __future__ import annotations
 import logging
 import re
 import unicodedata
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, FrozenSet, List, Optional, Tuple
 
 import pandas as pd
 
@@ -84,6 +89,16 @@ _NICKNAME_MAP: Dict[str, str] = {
     "dk": "dk metcalf",
 }
 
+# Default number of (name, team, position) query results memoised per resolver.
+_MEMO_SIZE = 8192
+
+# Slack on the token-count bounds so float rounding can never prune an entry
+# whose exact Jaccard score would reach the threshold.
+_SIZE_BOUND_EPS = 1e-9
+
+# Memo key: (normalised name, team hint, position hint).
+_MemoKey = Tuple[str, Optional[str], Optional[str]]
+
 
 # ---------------------------------------------------------------------------
 # Internal helpers
@@ -178,6 +193,8 @@ class PlayerNameResolver:
             files under data/bronze/.
         _norm_to_entries: Mapping from exact normalised name → list of entries
             (used for O(1) exact-match lookups before fuzzy fallback).
+        _token_to_ids: Inverted index from name token → positions in
+            ``index`` (used to prune fuzzy candidates).
 
     Example:
         >>> resolver = PlayerNameResolver()
@@ -185,16 +202,24 @@ class PlayerNameResolver:
         >>> print(pid)  # "00-0033873"
     """
 
-    def __init__(self, bronze_root: Optional[Path] = None) -> None:
+    def __init__(
+        self, bronze_root: Optional[Path] = None, memo_size: int = _MEMO_SIZE
+    ) -> None:
         """Initialise the resolver and build the lookup index.
 
         Args:
             bronze_root: Path to the local Bronze data directory.  Defaults to
                 ``data/bronze`` relative to the current working directory.
+            memo_size: Maximum number of recent query results kept; 0
+                disables the memo.
         """
         self._root = Path(bronze_root) if bronze_root else _BRONZE_ROOT
         self.index: List[_PlayerEntry] = []
         self._norm_to_entries: Dict[str, List[_PlayerEntry]] = {}
+        self._token_to_ids: Dict[str, List[int]] = {}
+        self._entry_tokens: List[FrozenSet[str]] = []
+        self._memo_size = memo_size
+        self._memo: "OrderedDict[_MemoKey, Optional[str]]" = OrderedDict()
         self._build_index()
 
     # ------------------------------------------------------------------
@@ -336,10 +361,24 @@ class PlayerNameResolver:
             self.index.append(entry)
             self._norm_to_entries.setdefault(norm, []).append(entry)
 
+        self._build_token_index()
         logger.info(
             "PlayerNameResolver: index built with %d unique players.", len(self.index)
         )
 
+    def _build_token_index(self) -> None:
+        """(Re)build the token inverted index from ``self.index``.
+
+        Also clears the query memo, since cached answers were computed
+        against the previous index.
+        """
+        self._entry_tokens = [frozenset(e.norm_name.split()) for e in self.index]
+        self._token_to_ids = {}
+        for i, tokens in enumerate(self._entry_tokens):
+            for token in tokens:
+                self._token_to_ids.setdefault(token, []).append(i)
+        self._memo.clear()
+
     def _normalise_columns(self, df: pd.DataFrame) -> pd.DataFrame:
         """Rename raw parquet columns to the internal schema.
 
@@ -429,12 +468,40 @@ class PlayerNameResolver:
         # 1. Apply nickname overrides
         norm = _normalise(name)
         norm = _NICKNAME_MAP.get(norm, norm)
+        return self._resolve_norm(norm, team, position, name)
 
+    def _resolve_norm(
+        self,
+        norm: str,
+        team: Optional[str],
+        position: Optional[str],
+        name: str,
+    ) -> Optional[str]:
+        """Resolve an already-normalised name, consulting the memo first."""
+        key = (norm, team, position)
+        if key in self._memo:
+            self._memo.move_to_end(key)
+            return self._memo[key]
+        result = self._match(norm, team, position, name)
+        if self._memo_size > 0:
+            self._memo[key] = result
+            if len(self._memo) > self._memo_size:
+                self._memo.popitem(last=False)
+        return result
+
+    def _match(
+        self,
+        norm: str,
+        team: Optional[str],
+        position: Optional[str],
+        name: str,
+    ) -> Optional[str]:
+        """Strategy steps 2-5 of :meth:`resolve` for a normalised name."""
         # 2. Exact match
         candidates = self._norm_to_entries.get(norm, [])
 
         if not candidates:
-            # 4. Fuzzy fallback — scan full index
+            # 4. Fuzzy fallback — entries sharing a token with the query
             candidates = self._fuzzy_candidates(norm, threshold=0.80)
 
         if not candidates:
@@ -464,8 +531,21 @@ class PlayerNameResolver:
 
         Returns:
             Dict mapping each input name to its resolved player_id or None.
+            Identical to calling :meth:`resolve` per name; duplicate names
+            (and names that normalise identically) are resolved once.
         """
-        return {n: self.resolve(n, team=team, position=position) for n in names}
+        by_norm: Dict[str, Optional[str]] = {}
+        out: Dict[str, Optional[str]] = {}
+        for n in dict.fromkeys(names):
+            if not n or not n.strip():
+                out[n] = None
+                continue
+            norm = _normalise(n)
+            norm = _NICKNAME_MAP.get(norm, norm)
+            if norm not in by_norm:
+                by_norm[norm] = self._resolve_norm(norm, team, position, n)
+            out[n] = by_norm[norm]
+        return out
 
     # ------------------------------------------------------------------
     # Internal helpers
@@ -476,6 +556,12 @@ class PlayerNameResolver:
     ) -> List[_PlayerEntry]:
         """Return all index entries whose token overlap with norm ≥ threshold.
 
+        Only entries sharing at least one token with ``norm`` can have a
+        positive Jaccard score, and a score ≥ ``threshold`` needs the
+        entry's token count within ``[threshold·|q|, |q|/threshold]``, so
+        just those entries are scored. Scores, ties and ordering are the same
+        as a scan of the full index.
+
         Args:
             norm: Normalised query string.
             threshold: Minimum Jaccard similarity to consider a match.
@@ -483,11 +569,35 @@ class PlayerNameResolver:
         Returns:
             List of matching _PlayerEntry objects sorted by descending score.
         """
+        if len(self._entry_tokens) != len(self.index):
+            self._build_token_index()
+        query = frozenset(norm.split())
+        if threshold <= 0.0:
+            ids: List[int] = list(range(len(self.index)))
+        elif not query:
+            return []
+        else:
+            lo = threshold * len(query) - _SIZE_BOUND_EPS
+            hi = len(query) / threshold + _SIZE_BOUND_EPS
+            tokens = self._entry_tokens
+            ids = sorted(
+                {
+                    i
+                    for token in query
+                    for i in self._token_to_ids.get(token, ())
+                    if lo <= len(tokens[i]) <= hi
+                }
+            )
+
         results: List[Tuple[float, _PlayerEntry]] = []
-        for entry in self.index:
-            score = _token_overlap(norm, entry.norm_name)
+        for i in ids:
+            entry_tokens = self._entry_tokens[i]
+            if query and entry_tokens:
+                score = len(query & entry_tokens) / len(query | entry_tokens)
+            else:
+                score = 0.0
             if score >= threshold:
-                results.append((score, entry))
+                results.append((score, self.index[i]))
         results.sort(key=lambda t: (-t[0], -t[1].season))
         return [entry for _, entry in results]
 
@@ -20,6 +20,12 @@ from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 import logging
 
+from projection_ledger import (
+    AdjustmentStage,
+    ProjectionLedger,
+    apply_stage,
+    stat_columns,
+)
 from scoring_calculator import calculate_fantasy_points_df
 
 logger = logging.getLogger(__name__)
@@ -2158,9 +2164,10 @@ def add_floor_ceiling(
 
     # Try quantile models first
     try:
-        from quantile_models import load_quantile_models, predict_quantiles
+        from model_registry import timed
+        from quantile_models import cached_quantile_models, predict_quantiles
 
-        qdata = load_quantile_models(path=quantile_model_path)
+        qdata = cached_quantile_models(path=quantile_model_path)
         if qdata is not None:
             has_features = any(c in df.columns for c in qdata["feature_cols"][:5])
             if has_features:
@@ -2183,9 +2190,10 @@ def add_floor_ceiling(
 
                     mask = df["position"] == pos
                     pos_df = df[mask]
-                    preds = predict_quantiles(
-                        qdata, pos_df, pos, apply_conformal=use_conformal
-                    )
+                    with timed("model_predict", kind="quantile", name=pos):
+                        preds = predict_quantiles(
+                            qdata, pos_df, pos, apply_conformal=use_conformal
+                        )
                     df.loc[mask, "projected_floor"] = (
                         preds["quantile_floor"].clip(lower=0).round(2).values
                     )
@@ -2234,34 +2242,27 @@ INJURY_MULTIPLIERS: Dict[str, float] = {
 }
 
 
-def apply_injury_adjustments(
+def injury_stage(
     projections_df: pd.DataFrame,
     injuries_df: pd.DataFrame,
-) -> pd.DataFrame:
-    """
-    Adjust projected fantasy points based on weekly injury report status.
-
-    Players not listed on the injury report are assumed healthy (multiplier 1.0).
-    Players listed as Out/IR/PUP receive zero projected points.
-
-    Args:
-        projections_df: Projection output from ``generate_weekly_projections()``.
-        injuries_df:    Injury report DataFrame (from ``nfl.import_injuries()``).
-                        Expected columns: ``gsis_id`` or ``player_name``,
-                        ``report_status``.
+) -> AdjustmentStage:
+    """Injury layer as an :class:`~projection_ledger.AdjustmentStage`.
 
-    Returns:
-        Projections DataFrame with added ``injury_status`` (str) and
-        ``injury_multiplier`` (float) columns.  ``projected_points`` and
-        all ``proj_*`` stat columns are scaled by the multiplier.
+    See :func:`apply_injury_adjustments` for the semantics. The stage scales
+    ``projected_points`` and the ``proj_*`` stat columns by each player's
+    injury multiplier; it is a no-op (provenance columns only) when the
+    report cannot be joined.
     """
-    df = projections_df.copy()
-    df["injury_status"] = "Active"
-    df["injury_multiplier"] = 1.0
+    neutral = AdjustmentStage(
+        "injury",
+        columns=(),
+        provenance={"injury_status": "Active", "injury_multiplier": 1.0},
+    )
+    df = projections_df
 
     if injuries_df is None or injuries_df.empty:
         logger.info("No injury data provided; all players treated as Active")
-        return df
+        return neutral
 
     # Determine join column — prefer gsis_id, fall back to player_name
     if "gsis_id" in df.columns and "gsis_id" in injuries_df.columns:
@@ -2277,13 +2278,13 @@ def apply_injury_adjustments(
         join_col = "player_name"
     else:
         logger.warning("Cannot join injury data — no common identifier column found")
-        return df
+        return neutral
 
     # Build a lookup: player -> most severe status
     status_col = "report_status" if "report_status" in injuries_df.columns else "status"
     if status_col not in injuries_df.columns:
         logger.warning("Injury DataFrame missing status column; skipping adjustment")
-        return df
+        return neutral
 
     inj_lookup = (
         injuries_df[[join_col, status_col]]
@@ -2293,20 +2294,47 @@ def apply_injury_adjustments(
         .to_dict()
     )
 
-    df["injury_status"] = df[join_col].map(inj_lookup).fillna("Active")
-    df["injury_multiplier"] = df["injury_status"].map(
+    status = df[join_col].map(inj_lookup).fillna("Active")
+    multiplier = status.map(
         lambda s: INJURY_MULTIPLIERS.get(s, 0.85)  # unknown status → cautious
     )
+    return AdjustmentStage(
+        "injury",
+        columns=tuple(stat_columns(df)) + ("projected_points",),
+        multiplier=multiplier.to_numpy(dtype=float),
+        provenance={"injury_status": status, "injury_multiplier": multiplier},
+    )
 
-    # Scale projections
-    proj_cols = [
-        c
-        for c in df.columns
-        if c.startswith("proj_") and c not in ("proj_season", "proj_week")
-    ]
-    for col in proj_cols:
-        df[col] = (df[col] * df["injury_multiplier"]).round(2)
-    df["projected_points"] = (df["projected_points"] * df["injury_multiplier"]).round(2)
+
+def apply_injury_adjustments(
+    projections_df: pd.DataFrame,
+    injuries_df: pd.DataFrame,
+    ledger: Optional[ProjectionLedger] = None,
+) -> pd.DataFrame:
+    """
+    Adjust projected fantasy points based on weekly injury report status.
+
+    Players not listed on the injury report are assumed healthy (multiplier 1.0).
+    Players listed as Out/IR/PUP receive zero projected points.
+
+    Args:
+        projections_df: Projection output from ``generate_weekly_projections()``.
+        injuries_df:    Injury report DataFrame (from ``nfl.import_injuries()``).
+                        Expected columns: ``gsis_id`` or ``player_name``,
+                        ``report_status``.
+        ledger:         Optional :class:`~projection_ledger.ProjectionLedger`
+                        to record the ``injury`` stage in.
+
+    Returns:
+        Projections DataFrame with added ``injury_status`` (str) and
+        ``injury_multiplier`` (float) columns.  ``projected_points`` and
+        all ``proj_*`` stat columns are scaled by the multiplier.
+    """
+    df = projections_df.copy()
+    stage = injury_stage(df, injuries_df)
+    apply_stage(df, stage, ledger)
+    if stage.is_noop:
+        return df
 
     injured_count = (df["injury_multiplier"] < 1.0).sum()
     logger.info("Injury adjustments applied: %d players affected", injured_count)
@@ -2351,9 +2379,95 @@ EVENT_MULT_MIN: float = 0.0
 EVENT_MULT_MAX: float = 1.10
 
 
+def event_stage(
+    projections_df: pd.DataFrame,
+    events_df: pd.DataFrame,
+) -> AdjustmentStage:
+    """Structured-event layer as an :class:`~projection_ledger.AdjustmentStage`.
+
+    See :func:`apply_event_adjustments` for the semantics. The compounded,
+    clamped multiplier of every player is computed column-wise from the
+    flag matrix (no per-row Python loop over the projections).
+    """
+    df = projections_df
+    neutral = AdjustmentStage(
+        "events",
+        columns=(),
+        provenance={
+            "event_multiplier": 1.0,
+            "event_flags": [[] for _ in range(len(df))],
+        },
+    )
+
+    if events_df is None or events_df.empty:
+        logger.info("No event data provided; all players get neutral event multiplier")
+        return neutral
+
+    # Determine join column — prefer player_id, fall back to gsis_id
+    if "player_id" in df.columns and "player_id" in events_df.columns:
+        join_col = "player_id"
+    elif "gsis_id" in df.columns and "gsis_id" in events_df.columns:
+        join_col = "gsis_id"
+    elif "player_id" in df.columns and "gsis_id" in events_df.columns:
+        events_df = events_df.rename(columns={"gsis_id": "player_id"})
+        join_col = "player_id"
+    else:
+        logger.warning("Cannot join events data — no common identifier column found")
+        return neutral
+
+    # Only consider known event flags actually present in events_df.
+    # Unknown columns are ignored (mitigates T-61-03-04 — elevation of
+    # privilege via injected flags).
+    present_flags = [f for f in EVENT_MULTIPLIERS if f in events_df.columns]
+    if not present_flags:
+        logger.info(
+            "events_df contained no known event flag columns; "
+            "returning projections with neutral multipliers"
+        )
+        return neutral
+
+    # Flag matrix: one row per player (last report wins), one column per
+    # flag. Truthiness matches bool() -- a NaN flag counts as set.
+    lookup = (
+        events_df[[join_col, *present_flags]]
+        .dropna(subset=[join_col])
+        .drop_duplicates(subset=[join_col], keep="last")
+    )
+    flag_matrix = np.column_stack(
+        [lookup[flag].to_numpy().astype(bool) for flag in present_flags]
+    )
+    pos = pd.Index(lookup[join_col]).get_indexer(df[join_col])
+    matched = np.flatnonzero(pos >= 0)
+    active = flag_matrix[pos[matched]]
+
+    # Compound in flag order, then clamp per D-03 (T-61-03-01).
+    mult = np.ones(len(matched))
+    for k, flag in enumerate(present_flags):
+        mult = np.where(active[:, k], mult * EVENT_MULTIPLIERS[flag], mult)
+    mult = np.maximum(EVENT_MULT_MIN, np.minimum(EVENT_MULT_MAX, mult))
+
+    multiplier = np.ones(len(df))
+    multiplier[matched] = [round(m, 4) for m in mult.tolist()]
+    # Drop the "is_" prefix for a compact display tag.
+    tags = [flag[3:] if flag.startswith("is_") else flag for flag in present_flags]
+    event_tags: List[List[str]] = [[] for _ in range(len(df))]
+    for i, row_flags in zip(matched, active):
+        event_tags[i] = [tags[k] for k in np.flatnonzero(row_flags)]
+
+    columns = stat_columns(df) + ["projected_points"]
+    columns += [c for c in ("projected_floor", "projected_ceiling") if c in df.columns]
+    return AdjustmentStage(
+        "events",
+        columns=tuple(columns),
+        multiplier=multiplier,
+        provenance={"event_multiplier": multiplier, "event_flags": event_tags},
+    )
+
+
 def apply_event_adjustments(
     projections_df: pd.DataFrame,
     events_df: pd.DataFrame,
+    ledger: Optional[ProjectionLedger] = None,
 ) -> pd.DataFrame:
     """Apply structured event multipliers to player projections.
 
@@ -2379,6 +2493,8 @@ def apply_event_adjustments(
             flags in :data:`EVENT_MULTIPLIERS`.  Missing flag columns are
             silently treated as ``False`` (T-61-03-04 — unknown columns
             are ignored).
+        ledger: Optional :class:`~projection_ledger.ProjectionLedger` to
+            record the ``events`` stage in.
 
     Returns:
         A new DataFrame with two added columns:
@@ -2409,96 +2525,11 @@ def apply_event_adjustments(
         17.0
     """
     df = projections_df.copy()
-    df["event_multiplier"] = 1.0
-    df["event_flags"] = [[] for _ in range(len(df))]
-
-    if events_df is None or events_df.empty:
-        logger.info("No event data provided; all players get neutral event multiplier")
-        return df
-
-    # Determine join column — prefer player_id, fall back to gsis_id
-    if "player_id" in df.columns and "player_id" in events_df.columns:
-        join_col = "player_id"
-    elif "gsis_id" in df.columns and "gsis_id" in events_df.columns:
-        join_col = "gsis_id"
-    elif "player_id" in df.columns and "gsis_id" in events_df.columns:
-        events_df = events_df.rename(columns={"gsis_id": "player_id"})
-        join_col = "player_id"
-    else:
-        logger.warning("Cannot join events data — no common identifier column found")
-        return df
-
-    # Only consider known event flags actually present in events_df.
-    # Unknown columns are ignored (mitigates T-61-03-04 — elevation of
-    # privilege via injected flags).
-    present_flags = [f for f in EVENT_MULTIPLIERS if f in events_df.columns]
-    if not present_flags:
-        logger.info(
-            "events_df contained no known event flag columns; "
-            "returning projections with neutral multipliers"
-        )
+    stage = event_stage(df, events_df)
+    apply_stage(df, stage, ledger)
+    if stage.is_noop:
         return df
 
-    # Build a lookup: player_id → {flag_name: bool, ...}
-    events_lookup: Dict[str, Dict[str, bool]] = {}
-    for _, row in (
-        events_df[[join_col, *present_flags]]
-        .dropna(subset=[join_col])
-        .drop_duplicates(subset=[join_col], keep="last")
-        .iterrows()
-    ):
-        pid = row[join_col]
-        events_lookup[pid] = {
-            flag: bool(row.get(flag, False)) for flag in present_flags
-        }
-
-    proj_cols = [
-        c
-        for c in df.columns
-        if c.startswith("proj_") and c not in ("proj_season", "proj_week")
-    ]
-
-    # Iterate row-wise and compute per-player multiplier + tag list.
-    event_mults: List[float] = []
-    event_tags: List[List[str]] = []
-    for _, row in df.iterrows():
-        pid = row.get(join_col)
-        flags = events_lookup.get(pid)
-        if not flags:
-            event_mults.append(1.0)
-            event_tags.append([])
-            continue
-
-        mult = 1.0
-        tags: List[str] = []
-        for flag, active in flags.items():
-            if not active:
-                continue
-            mult *= EVENT_MULTIPLIERS[flag]
-            # Drop the "is_" prefix for a compact display tag.
-            tags.append(flag[3:] if flag.startswith("is_") else flag)
-
-        # Clamp compounding per D-03 (T-61-03-01)
-        mult = max(EVENT_MULT_MIN, min(EVENT_MULT_MAX, mult))
-        event_mults.append(round(mult, 4))
-        event_tags.append(tags)
-
-    df["event_multiplier"] = event_mults
-    df["event_flags"] = event_tags
-
-    # Scale projection columns by the event multiplier.
-    for col in proj_cols:
-        df[col] = (df[col] * df["event_multiplier"]).round(2)
-    df["projected_points"] = (df["projected_points"] * df["event_multiplier"]).round(2)
-    if "projected_floor" in df.columns:
-        df["projected_floor"] = (df["projected_floor"] * df["event_multiplier"]).round(
-            2
-        )
-    if "projected_ceiling" in df.columns:
-        df["projected_ceiling"] = (
-            df["projected_ceiling"] * df["event_multiplier"]
-        ).round(2)
-
     affected = (df["event_multiplier"] != 1.0).sum()
     logger.info(
         "Event adjustments applied: %d players affected (of %d)",
@@ -2604,9 +2635,117 @@ def load_latest_sentiment(season: int, week: int) -> pd.DataFrame:
         return pd.DataFrame()
 
 
+def sentiment_stage(
+    projections_df: pd.DataFrame,
+    sentiment_df: pd.DataFrame,
+) -> AdjustmentStage:
+    """Sentiment layer as an :class:`~projection_ledger.AdjustmentStage`.
+
+    See :func:`apply_sentiment_adjustments` for the semantics: matched
+    players are scaled (clamped, floored at 0, rounded with the builtin
+    ``round``), ruled-out/inactive players are overridden to 0, and players
+    already zeroed by injury are left alone. The injury check is made when the
+    stage is applied (``skip_zeroed_by``), so replaying the stage after a
+    refreshed injury layer re-decides which players it may touch.
+    """
+    df = projections_df
+    n = len(df)
+    neutral = AdjustmentStage(
+        "sentiment",
+        columns=(),
+        provenance={"sentiment_multiplier": 1.0, "sentiment_events": ""},
+    )
+
+    if sentiment_df is None or sentiment_df.empty:
+        logger.info("No sentiment data provided; all players get neutral multiplier")
+        return neutral
+
+    if (
+        "player_id" not in sentiment_df.columns
+        or "sentiment_multiplier" not in sentiment_df.columns
+    ):
+        logger.warning(
+            "Sentiment DataFrame missing required columns (player_id, sentiment_multiplier); skipping"
+        )
+        return neutral
+
+    event_flag_cols = [
+        "is_ruled_out",
+        "is_inactive",
+        "is_questionable",
+        "is_suspended",
+        "is_returning",
+    ]
+
+    # Build a lookup keyed by player_id
+    present_flags = [c for c in event_flag_cols if c in sentiment_df.columns]
+    sent_lookup = (
+        sentiment_df[["player_id", "sentiment_multiplier"] + present_flags]
+        .drop_duplicates(subset=["player_id"], keep="last")
+        .set_index("player_id")
+    )
+    pids = df["player_id"] if "player_id" in df.columns else pd.Series([None] * n)
+    pos = sent_lookup.index.get_indexer(pids)
+
+    # Players already zeroed by injury are skipped at apply time
+    # (skip_zeroed_by below) — sentiment never restores them
+    matched = pos >= 0
+    rows = np.flatnonzero(matched)
+
+    # Active event flags (bool() truthiness, NaN counts as set)
+    active = {
+        flag: np.zeros(n, dtype=bool) for flag in ("is_ruled_out", "is_inactive")
+    }
+    events = np.full(n, "", dtype=object)
+    if present_flags:
+        flag_matrix = np.column_stack(
+            [sent_lookup[flag].to_numpy().astype(bool) for flag in present_flags]
+        )[pos[rows]]
+        for k, flag in enumerate(present_flags):
+            active[flag] = np.zeros(n, dtype=bool)
+            active[flag][rows] = flag_matrix[:, k]
+        events[rows] = [
+            ",".join(present_flags[k] for k in np.flatnonzero(row_flags))
+            for row_flags in flag_matrix
+        ]
+
+    # Ruled-out / inactive → zero projection regardless of multiplier
+    ruled_out = matched & (active["is_ruled_out"] | active["is_inactive"])
+    scaled = matched & ~ruled_out
+
+    # Clamp multiplier to valid range as a defensive guard (same comparisons
+    # as the scalar max(MIN, min(MAX, m)) chain, NaN included)
+    raw = sent_lookup["sentiment_multiplier"].to_numpy(dtype=float)[pos]
+    capped = np.where(raw < _SENTIMENT_MULT_MAX, raw, _SENTIMENT_MULT_MAX)
+    mult = np.where(capped > _SENTIMENT_MULT_MIN, capped, _SENTIMENT_MULT_MIN)
+
+    display = np.ones(n)
+    display[ruled_out] = 0.0
+    display[scaled] = [round(m, 4) for m in mult[scaled].tolist()]
+
+    columns = ["projected_points"] + [
+        c for c in ("projected_floor", "projected_ceiling") if c in df.columns
+    ]
+    return AdjustmentStage(
+        "sentiment",
+        columns=tuple(columns),
+        multiplier=np.where(scaled, mult, 1.0),
+        rows=scaled,
+        overrides=np.zeros((n, len(columns))),
+        override_mask=np.repeat(ruled_out[:, None], len(columns), axis=1),
+        clip_lower=0.0,
+        clip_nan=("projected_points",),
+        builtin_round=True,
+        provenance={"sentiment_multiplier": display, "sentiment_events": events},
+        skip_zeroed_by="injury",
+        skip_provenance={"sentiment_multiplier": 1.0, "sentiment_events": ""},
+    )
+
+
 def apply_sentiment_adjustments(
     projections_df: pd.DataFrame,
     sentiment_df: pd.DataFrame,
+    ledger: Optional[ProjectionLedger] = None,
 ) -> pd.DataFrame:
     """Apply sentiment multipliers to player projections.
 
@@ -2628,6 +2767,8 @@ def apply_sentiment_adjustments(
             ``player_id`` and ``sentiment_multiplier`` columns, plus optional
             event-flag boolean columns (``is_ruled_out``, ``is_inactive``,
             ``is_questionable``, ``is_suspended``, ``is_returning``).
+        ledger: Optional :class:`~projection_ledger.ProjectionLedger` to
+            record the ``sentiment`` stage in.
 
     Returns:
         Projections DataFrame with two additional transparency columns:
@@ -2651,92 +2792,11 @@ def apply_sentiment_adjustments(
         22.0
     """
     df = projections_df.copy()
-    df["sentiment_multiplier"] = 1.0
-    df["sentiment_events"] = ""
-
-    if sentiment_df is None or sentiment_df.empty:
-        logger.info("No sentiment data provided; all players get neutral multiplier")
+    stage = sentiment_stage(df, sentiment_df)
+    apply_stage(df, stage, ledger)
+    if stage.is_noop:
         return df
 
-    if (
-        "player_id" not in sentiment_df.columns
-        or "sentiment_multiplier" not in sentiment_df.columns
-    ):
-        logger.warning(
-            "Sentiment DataFrame missing required columns (player_id, sentiment_multiplier); skipping"
-        )
-        return df
-
-    event_flag_cols = [
-        "is_ruled_out",
-        "is_inactive",
-        "is_questionable",
-        "is_suspended",
-        "is_returning",
-    ]
-
-    # Build a lookup keyed by player_id
-    sent_cols = ["player_id", "sentiment_multiplier"] + [
-        c for c in event_flag_cols if c in sentiment_df.columns
-    ]
-    sent_lookup = (
-        sentiment_df[sent_cols]
-        .drop_duplicates(subset=["player_id"], keep="last")
-        .set_index("player_id")
-    )
-
-    for idx, row in df.iterrows():
-        pid = row.get("player_id")
-        if pid not in sent_lookup.index:
-            continue
-
-        sent_row = sent_lookup.loc[pid]
-
-        # Skip players already zeroed by injury — do not restore via sentiment
-        if (
-            row.get("projected_points", 0.0) == 0.0
-            and row.get("injury_multiplier", 1.0) == 0.0
-        ):
-            continue
-
-        # Determine active event flags for transparency column
-        active_flags = [
-            flag
-            for flag in event_flag_cols
-            if flag in sent_row.index and bool(sent_row[flag])
-        ]
-        df.at[idx, "sentiment_events"] = ",".join(active_flags)
-
-        # Ruled-out / inactive → zero projection regardless of multiplier
-        if ("is_ruled_out" in sent_row.index and bool(sent_row["is_ruled_out"])) or (
-            "is_inactive" in sent_row.index and bool(sent_row["is_inactive"])
-        ):
-            df.at[idx, "sentiment_multiplier"] = 0.0
-            df.at[idx, "projected_points"] = 0.0
-            if "projected_floor" in df.columns:
-                df.at[idx, "projected_floor"] = 0.0
-            if "projected_ceiling" in df.columns:
-                df.at[idx, "projected_ceiling"] = 0.0
-            continue
-
-        # Clamp multiplier to valid range as a defensive guard
-        raw_mult = float(sent_row["sentiment_multiplier"])
-        mult = max(_SENTIMENT_MULT_MIN, min(_SENTIMENT_MULT_MAX, raw_mult))
-        df.at[idx, "sentiment_multiplier"] = round(mult, 4)
-
-        # Scale projection columns
-        df.at[idx, "projected_points"] = round(
-            max(0.0, row["projected_points"] * mult), 2
-        )
-        if "projected_floor" in df.columns and pd.notna(row.get("projected_floor")):
-            df.at[idx, "projected_floor"] = round(
-                max(0.0, row["projected_floor"] * mult), 2
-            )
-        if "projected_ceiling" in df.columns and pd.notna(row.get("projected_ceiling")):
-            df.at[idx, "projected_ceiling"] = round(
-                max(0.0, row["projected_ceiling"] * mult), 2
-            )
-
     applied_count = (df["sentiment_multiplier"] != 1.0).sum()
     total_count = len(df)
     logger.info(
@@ -0,0 +1,667 @@
+"""Ledgered post-model projection adjustments.
+
+After the model runs, a chain of adjustment layers rewrites a few numeric
+columns of the projection frame: injury, the opt-in heuristic levers in
+``scripts/generate_projections.py`` (early-season/ADP priors, QB floor, RB
+tail, WR tiebreak, ECR anchor, wind), structured events, props and sentiment.
+Here a layer is an :class:`AdjustmentStage` -- per-row vectors instead of a
+rewritten frame:
+
+* ``multiplier`` scales every stage column (then the layer's clip/rounding),
+  optionally only on ``rows``;
+* ``overrides`` / ``override_mask`` write values as-is;
+* ``skip_zeroed_by`` leaves alone the rows an earlier layer zeroed. It is
+  decided when the stage is applied, not when it was built, so a replay with
+  a different injury layer re-decides which players a later layer may touch.
+
+:func:`apply_stage` applies one stage in a single block pass over its
+columns. A :class:`ProjectionLedger` records the pre-adjustment ``base``
+values and every stage applied on top of them, so the chain can be replayed
+from the base in one fused pass -- with one layer swapped -- reproducing the
+published values exactly. Layers that are not expressed as stages are
+recorded with :meth:`ProjectionLedger.capture` as the values they wrote, and
+any change made outside the ledger is recorded as an ``unrecorded`` stage, so
+a replay never silently drops an edit.
+
+Ledgers are saved next to the Gold projections
+(``projection_ledgers/season=S/week=W/ledger_<scoring>_<ts>.parquet``, see
+:func:`ledger_path`); ``scripts/sunday_projection_refresh.py`` uses them to
+redo the injury layer without reverse-engineering multipliers from the file.
+"""
+
+import json
+import logging
+import os
+from dataclasses import dataclass, field, replace
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+try:
+    from partition_manifest import record_partition_write
+except ImportError:  # pragma: no cover
+    from src.partition_manifest import record_partition_write
+
+logger = logging.getLogger(__name__)
+
+LEDGER_DATASET = "projection_ledgers"
+LEDGER_METADATA_KEY = b"projection_ledger"
+UNRECORDED_STAGE = "unrecorded"
+
+# proj_* columns that are metadata, not projected stats.
+_NON_STAT_PROJ_COLS = ("proj_season", "proj_week")
+
+
+def stat_columns(df: pd.DataFrame) -> List[str]:
+    """The ``proj_*`` stat columns an adjustment scales (not season/week)."""
+    return [
+        c for c in df.columns if c.startswith("proj_") and c not in _NON_STAT_PROJ_COLS
+    ]
+
+
+def adjustable_columns(df: pd.DataFrame) -> List[str]:
+    """Every column an adjustment layer may rewrite, in frame order."""
+    named = ("projected_points", "projected_floor", "projected_ceiling")
+    return [c for c in df.columns if c in named] + stat_columns(df)
+
+
+def zeroed_rows(points: np.ndarray, gate: np.ndarray) -> np.ndarray:
+    """Rows a gate layer zeroed: multiplier 0 and ``projected_points`` 0."""
+    return (points == 0.0) & (gate == 0.0)
+
+
+def _round(values: np.ndarray, decimals: int, builtin: bool) -> np.ndarray:
+    if not builtin:
+        return np.round(values, decimals)
+    # Python's round() is correctly rounded and differs from np.round by a
+    # cent on ~2% of inputs; layers written with scalar round() need it.
+    flat = [round(v, decimals) for v in values.ravel().tolist()]
+    return np.array(flat, dtype=float).reshape(values.shape)
+
+
+# ---------------------------------------------------------------------------
+# Stages
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class AdjustmentStage:
+    """One adjustment layer as per-row vectors.
+
+    Attributes:
+        name: Layer name (``"injury"``, ``"events"``, ...).
+        columns: Columns the stage rewrites.
+        multiplier: Per-row scale factor, or None for no scaling.
+        rows: Rows the multiplier applies to (None = every row). Rows
+            outside the mask are left exactly as they are -- not rounded.
+        overrides: ``(rows, columns)`` values written where
+            ``override_mask`` is set, after scaling.
+        override_mask: Boolean mask matching ``overrides``.
+        clip_lower: Lower bound applied to scaled values (NaN stays NaN,
+            except in ``clip_nan``).
+        clip_nan: Columns whose scaled NaN also clips to ``clip_lower``, like
+            the scalar ``max(0.0, nan) == 0.0``.
+        decimals: Rounding of scaled values (None = no rounding).
+        builtin_round: Round like Python's ``round()`` instead of
+            ``np.round`` (the two differ in the last cent).
+        provenance: Columns the layer sets for transparency (e.g.
+            ``injury_status``); replayed only for ``skip_zeroed_by`` stages.
+        skip_zeroed_by: Name of an earlier stage (its multiplier is the
+            ``<name>_multiplier`` column). Rows it zeroed (see
+            :func:`zeroed_rows`) are left untouched and get
+            ``skip_provenance`` instead of ``provenance``.
+        skip_provenance: Provenance values for skipped rows.
+    """
+
+    name: str
+    columns: Tuple[str, ...]
+    multiplier: Optional[np.ndarray] = None
+    rows: Optional[np.ndarray] = None
+    overrides: Optional[np.ndarray] = None
+    override_mask: Optional[np.ndarray] = None
+    clip_lower: Optional[float] = None
+    clip_nan: Tuple[str, ...] = ()
+    decimals: Optional[int] = 2
+    builtin_round: bool = False
+    provenance: Dict[str, Any] = field(default_factory=dict)
+    skip_zeroed_by: Optional[str] = None
+    skip_provenance: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def is_noop(self) -> bool:
+        if self.overrides is not None:
+            return False
+        if self.multiplier is None:
+            return True
+        return self.rows is not None and not self.rows.any()
+
+    def transform(
+        self, block: np.ndarray, skip: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """Apply the stage to a ``(rows, len(columns))`` float block.
+
+        Args:
+            block: Current values of ``columns``.
+            skip: Rows to leave untouched (see ``skip_zeroed_by``).
+        """
+        out = block
+        rows = self.rows
+        if skip is not None and skip.any():
+            rows = ~skip if rows is None else rows & ~skip
+        if self.multiplier is not None:
+            sel = slice(None) if rows is None else rows
+            scaled = block[sel] * self.multiplier[sel, None]
+            if self.clip_lower is not None:
+                scaled = np.maximum(scaled, self.clip_lower)
+                for j, col in enumerate(self.columns):
+                    if col in self.clip_nan:
+                        scaled[np.isnan(scaled[:, j]), j] = self.clip_lower
+            if self.decimals is not None:
+                scaled = _round(scaled, self.decimals, self.builtin_round)
+            out = block.copy()
+            out[sel] = scaled
+        if self.overrides is not None:
+            mask = self.override_mask
+            if skip is not None:
+                mask = mask & ~skip[:, None]
+            out = np.where(mask, self.overrides, out)
+        return out
+
+    def gated_provenance(self, skip: Optional[np.ndarray]) -> Dict[str, Any]:
+        """``provenance`` with ``skip_provenance`` on the skipped rows."""
+        if skip is None or not skip.any():
+            return self.provenance
+        out = {}
+        for col, values in self.provenance.items():
+            if col in self.skip_provenance and not np.isscalar(values):
+                values = np.where(skip, self.skip_provenance[col], values)
+            out[col] = values
+        return out
+
+    def scatter(self, positions: np.ndarray, n_rows: int) -> "AdjustmentStage":
+        """Re-index the row vectors onto ``n_rows`` target rows.
+
+        ``positions[i]`` is the target row of source row ``i`` (-1 = none);
+        target rows without a source row are left neutral.
+        """
+        covered = positions >= 0
+        target = positions[covered]
+
+        def _move(values, fill):
+            if values is None:
+                return None
+            shape = (n_rows,) + values.shape[1:]
+            moved = np.full(shape, fill, dtype=values.dtype)
+            moved[target] = values[covered]
+            return moved
+
+        rows = self.rows
+        if self.multiplier is not None and rows is None and len(target) != n_rows:
+            # Target rows with no source row must stay untouched (not rounded).
+            rows = np.ones(len(positions), dtype=bool)
+        provenance: Dict[str, Any] = {}
+        if self.skip_zeroed_by is not None:
+            # Gated provenance is replayed, so it travels with the stage.
+            for col, values in self.provenance.items():
+                if np.isscalar(values):
+                    provenance[col] = values
+                else:
+                    fill = self.skip_provenance.get(col)
+                    moved = np.full(n_rows, fill, dtype=np.asarray(values).dtype)
+                    moved[target] = np.asarray(values)[covered]
+                    provenance[col] = moved
+        return replace(
+            self,
+            multiplier=_move(self.multiplier, 1.0),
+            rows=_move(rows, False),
+            overrides=_move(self.overrides, np.nan),
+            override_mask=_move(self.override_mask, False),
+            provenance=provenance,
+        )
+
+
+def _frame_skip(df: pd.DataFrame, stage: AdjustmentStage) -> Optional[np.ndarray]:
+    """Rows of ``df`` the stage's ``skip_zeroed_by`` gate excludes."""
+    if stage.skip_zeroed_by is None:
+        return None
+    n = len(df)
+    gate_col = f"{stage.skip_zeroed_by}_multiplier"
+    points = (
+        df["projected_points"].to_numpy(dtype=float)
+        if "projected_points" in df.columns
+        else np.zeros(n)
+    )
+    gate = df[gate_col].to_numpy(dtype=float) if gate_col in df.columns else np.ones(n)
+    return zeroed_rows(points, gate)
+
+
+def apply_stage(
+    df: pd.DataFrame,
+    stage: AdjustmentStage,
+    ledger: Optional["ProjectionLedger"] = None,
+) -> pd.DataFrame:
+    """Apply ``stage`` to ``df`` in place (one block pass) and record it.
+
+    Args:
+        df: Projection frame the stage vectors are aligned to.
+        stage: Stage to apply.
+        ledger: Ledger to record the stage in, if any.
+
+    Returns:
+        ``df``.
+    """
+    skip = _frame_skip(df, stage)
+    if ledger is not None:
+        ledger.record(df, stage)
+    for col, values in stage.gated_provenance(skip).items():
+        df[col] = values
+    if stage.is_noop or not stage.columns:
+        return df
+    cols = list(stage.columns)
+    df[cols] = stage.transform(df[cols].to_numpy(dtype=float), skip)
+    return df
+
+
+# ---------------------------------------------------------------------------
+# Ledger
+# ---------------------------------------------------------------------------
+
+
+def _same(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    return (a == b) | (np.isnan(a) & np.isnan(b))
+
+
+class ProjectionLedger:
+    """Base values plus the ordered stages applied to one projection frame.
+
+    Rows are matched on ``key`` (``player_id``), so rows added after the
+    ledger started (e.g. kickers) are simply not covered, and row order may
+    change between stages. The ledger starts on the first recorded stage.
+    """
+
+    def __init__(self, key: str = "player_id") -> None:
+        self.key = key
+        self.keys: Optional[pd.Index] = None
+        self.base: Dict[str, np.ndarray] = {}
+        self.stages: List[AdjustmentStage] = []
+        self._state: Dict[str, np.ndarray] = {}
+        self._gates: Dict[str, np.ndarray] = {}
+
+    def __len__(self) -> int:
+        return len(self.stages)
+
+    @property
+    def stage_names(self) -> List[str]:
+        return [s.name for s in self.stages]
+
+    # -- alignment --------------------------------------------------------
+
+    def _positions(self, frame: pd.DataFrame) -> np.ndarray:
+        """Ledger row of every frame row (-1 for rows the ledger lacks)."""
+        keys = pd.Index(frame[self.key])
+        if self.keys is None:
+            if not keys.is_unique:
+                raise ValueError(f"Ledger key {self.key!r} is not unique")
+            self.keys = keys
+        if keys.equals(self.keys):
+            return np.arange(len(keys))
+        return self.keys.get_indexer(keys)
+
+    def _gather(self, frame: pd.DataFrame, col: str, pos: np.ndarray) -> np.ndarray:
+        values = np.full(len(self.keys), np.nan)
+        covered = pos >= 0
+        values[pos[covered]] = frame[col].to_numpy(dtype=float)[covered]
+        return values
+
+    def _sync(self, frame: pd.DataFrame, pos: np.ndarray) -> None:
+        """Track new adjustable columns and record edits made outside the ledger."""
+        covered = pos >= 0
+        drifted = {}
+        for col in adjustable_columns(frame):
+            current = self._gather(frame, col, pos)
+            if col not in self.base:
+                self.base[col] = current
+                self._state[col] = current.copy()
+                continue
+            rows = pos[covered]
+            changed = ~_same(current[rows], self._state[col][rows])
+            if changed.any():
+                mask = np.zeros(len(self.keys), dtype=bool)
+                mask[rows[changed]] = True
+                drifted[col] = (current, mask)
+        if drifted:
+            self._append_overrides(UNRECORDED_STAGE, drifted)
+
+    def _append_overrides(
+        self, name: str, changes: Dict[str, Tuple[np.ndarray, np.ndarray]]
+    ) -> None:
+        cols = tuple(changes)
+        stage = AdjustmentStage(
+            name=name,
+            columns=cols,
+            overrides=np.column_stack([changes[c][0] for c in cols]),
+            override_mask=np.column_stack([changes[c][1] for c in cols]),
+            decimals=None,
+        )
+        self._push(stage)
+
+    def _skip(
+        self,
+        stage: AdjustmentStage,
+        points: Optional[np.ndarray],
+        gates: Dict[str, np.ndarray],
+    ) -> Optional[np.ndarray]:
+        """Replay-time ``skip_zeroed_by`` rows, from the current state."""
+        if stage.skip_zeroed_by is None:
+            return None
+        n = len(self.keys)
+        gate = gates.get(stage.skip_zeroed_by)
+        return zeroed_rows(
+            np.zeros(n) if points is None else points,
+            np.ones(n) if gate is None else gate,
+        )
+
+    @staticmethod
+    def _track_gate(gates: Dict[str, np.ndarray], stage: AdjustmentStage, n: int):
+        """Remember the latest multiplier of each stage name for later gates."""
+        gates[stage.name] = np.ones(n) if stage.multiplier is None else stage.multiplier
+
+    def _push(self, stage: AdjustmentStage) -> None:
+        self.stages.append(stage)
+        n = len(self.keys)
+        skip = self._skip(stage, self._state.get("projected_points"), self._gates)
+        self._track_gate(self._gates, stage, n)
+        if stage.is_noop or not stage.columns:
+            return
+        cols = list(stage.columns)
+        out = stage.transform(np.column_stack([self._state[c] for c in cols]), skip)
+        for j, col in enumerate(cols):
+            self._state[col] = out[:, j]
+
+    # -- recording --------------------------------------------------------
+
+    def record(self, frame: pd.DataFrame, stage: AdjustmentStage) -> None:
+        """Record ``stage`` (aligned to ``frame``) before it is applied."""
+        pos = self._positions(frame)
+        self._sync(frame, pos)
+        missing = [c for c in stage.columns if c not in self.base]
+        if missing:
+            raise ValueError(f"Stage {stage.name!r} rewrites untracked {missing}")
+        self._push(stage.scatter(pos, len(self.keys)))
+
+    def capture(self, name: str, before: pd.DataFrame, after: pd.DataFrame) -> None:
+        """Record a layer that was applied as a frame transform.
+
+        The values the layer wrote (every adjustable cell that differs
+        between ``before`` and ``after``) are stored as overrides.
+        """
+        self._sync(before, self._positions(before))
+        pos = self._positions(after)
+        covered = pos >= 0
+        changes = {}
+        for col in adjustable_columns(after):
+            if col not in self.base:
+                continue
+            current = self._gather(after, col, pos)
+            rows = pos[covered]
+            changed = ~_same(current[rows], self._state[col][rows])
+            mask = np.zeros(len(self.keys), dtype=bool)
+            mask[rows[changed]] = True
+            if mask.any():
+                changes[col] = (current, mask)
+        if changes:
+            self._append_overrides(name, changes)
+        else:
+            self.stages.append(AdjustmentStage(name=name, columns=()))
+
+    def checkpoint(self, frame: pd.DataFrame) -> None:
+        """Record edits made to ``frame`` since the last stage (before saving)."""
+        if self.keys is not None:
+            self._sync(frame, self._positions(frame))
+
+    # -- replay -----------------------------------------------------------
+
+    def replace_stage(
+        self, frame: pd.DataFrame, stage: AdjustmentStage
+    ) -> "ProjectionLedger":
+        """Copy of the ledger with every stage named ``stage.name`` swapped.
+
+        Args:
+            frame: Frame ``stage`` is aligned to.
+            stage: New stage; its columns must already be tracked.
+
+        Raises:
+            KeyError: The ledger has no stage of that name.
+        """
+        if stage.name not in self.stage_names:
+            raise KeyError(f"Ledger has no {stage.name!r} stage")
+        missing = [c for c in stage.columns if c not in self.base]
+        if missing:
+            raise ValueError(f"Stage {stage.name!r} rewrites untracked {missing}")
+        moved = stage.scatter(self.keys.get_indexer(frame[self.key]), len(self.keys))
+        new = ProjectionLedger(self.key)
+        new.keys = self.keys
+        new.base = self.base
+        new._state = {c: v.copy() for c, v in self.base.items()}
+        new._gates = {}
+        for old in self.stages:
+            new._push(moved if old.name == stage.name else old)
+        return new
+
+    def replay(self, frame: pd.DataFrame) -> pd.DataFrame:
+        """Recompute every tracked column from the base in one fused pass.
+
+        Rows of ``frame`` the ledger does not cover are left untouched.
+
+        Returns:
+            A copy of ``frame`` with the replayed values.
+        """
+        cols = list(self.base)
+        index = {c: j for j, c in enumerate(cols)}
+        block = np.column_stack([self.base[c] for c in cols])
+        n = len(self.keys)
+        gates: Dict[str, np.ndarray] = {}
+        provenance: Dict[str, Any] = {}
+        for stage in self.stages:
+            points = (
+                block[:, index["projected_points"]]
+                if "projected_points" in index
+                else None
+            )
+            skip = self._skip(stage, points, gates)
+            self._track_gate(gates, stage, n)
+            if stage.skip_zeroed_by is not None:
+                provenance.update(stage.gated_provenance(skip))
+            if stage.is_noop or not stage.columns:
+                continue
+            idx = [index[c] for c in stage.columns]
+            block[:, idx] = stage.transform(block[:, idx], skip)
+
+        out = frame.copy()
+        pos = self.keys.get_indexer(frame[self.key])
+        covered = pos >= 0
+        for col in cols:
+            if col not in out.columns:
+                continue
+            values = out[col].to_numpy(dtype=float, copy=True)
+            values[covered] = block[pos[covered], index[col]]
+            out[col] = values
+        for col, values in provenance.items():
+            if np.isscalar(values):
+                out.loc[covered, col] = values
+            elif covered.all():
+                out[col] = np.asarray(values)[pos]
+            else:
+                out.loc[covered, col] = np.asarray(values)[pos[covered]]
+        return out
+
+    def overridden_after(self, name: str) -> pd.Index:
+        """Keys whose values a later override stage pinned after ``name``.
+
+        Gated stages (``skip_zeroed_by``) are not counted: their overrides are
+        re-decided against the replayed state rather than carried over.
+        """
+        names = self.stage_names
+        if name not in names:
+            return pd.Index([])
+        pinned = np.zeros(len(self.keys), dtype=bool)
+        for stage in self.stages[names.index(name) + 1 :]:
+            if stage.overrides is not None and stage.skip_zeroed_by is None:
+                pinned |= stage.override_mask.any(axis=1)
+        return self.keys[pinned]
+
+    # -- persistence ------------------------------------------------------
+
+    def to_frame(self) -> Tuple[pd.DataFrame, Dict[str, Any]]:
+        """Columnar form: one row per key, plus the stage specs."""
+        data: Dict[str, Any] = {self.key: self.keys.to_numpy()}
+        for col, values in self.base.items():
+            data[f"base:{col}"] = values
+        specs = []
+        for i, stage in enumerate(self.stages):
+            spec = {
+                "name": stage.name,
+                "columns": list(stage.columns),
+                "clip_lower": stage.clip_lower,
+                "clip_nan": list(stage.clip_nan),
+                "decimals": stage.decimals,
+                "builtin_round": stage.builtin_round,
+                "skip_zeroed_by": stage.skip_zeroed_by,
+                "skip_provenance": stage.skip_provenance,
+                "provenance": {},
+                "multiplier": stage.multiplier is not None,
+                "rows": stage.rows is not None,
+                "set_columns": [],
+            }
+            if stage.skip_zeroed_by is not None:
+                for col, values in stage.provenance.items():
+                    if np.isscalar(values):
+                        spec["provenance"][col] = values
+                    else:
+                        spec["provenance"][col] = None
+                        data[f"{i}:prov:{col}"] = values
+            if stage.multiplier is not None:
+                data[f"{i}:mult"] = stage.multiplier
+            if stage.rows is not None:
+                data[f"{i}:rows"] = stage.rows
+            if stage.overrides is not None:
+                for j, col in enumerate(stage.columns):
+                    if stage.override_mask[:, j].any():
+                        spec["set_columns"].append(col)
+                        data[f"{i}:set:{col}"] = stage.overrides[:, j]
+                        data[f"{i}:isset:{col}"] = stage.override_mask[:, j]
+            specs.append(spec)
+        return pd.DataFrame(data), {"key": self.key, "stages": specs}
+
+    @classmethod
+    def from_frame(
+        cls, frame: pd.DataFrame, meta: Dict[str, Any]
+    ) -> "ProjectionLedger":
+        ledger = cls(meta["key"])
+        ledger.keys = pd.Index(frame[ledger.key])
+        n = len(frame)
+        for col in frame.columns:
+            if col.startswith("base:"):
+                ledger.base[col[5:]] = frame[col].to_numpy(dtype=float)
+        ledger._state = {c: v.copy() for c, v in ledger.base.items()}
+        for i, spec in enumerate(meta["stages"]):
+            cols = tuple(spec["columns"])
+            overrides = mask = None
+            if spec["set_columns"]:
+                overrides = np.full((n, len(cols)), np.nan)
+                mask = np.zeros((n, len(cols)), dtype=bool)
+                for col in spec["set_columns"]:
+                    j = cols.index(col)
+                    overrides[:, j] = frame[f"{i}:set:{col}"].to_numpy(dtype=float)
+                    mask[:, j] = frame[f"{i}:isset:{col}"].to_numpy(dtype=bool)
+            ledger._push(
+                AdjustmentStage(
+                    name=spec["name"],
+                    columns=cols,
+                    multiplier=(
+                        frame[f"{i}:mult"].to_numpy(dtype=float)
+                        if spec["multiplier"]
+                        else None
+                    ),
+                    rows=(
+                        frame[f"{i}:rows"].to_numpy(dtype=bool)
+                        if spec["rows"]
+                        else None
+                    ),
+                    overrides=overrides,
+                    override_mask=mask,
+                    clip_lower=spec["clip_lower"],
+                    clip_nan=tuple(spec.get("clip_nan", ())),
+                    decimals=spec["decimals"],
+                    builtin_round=spec["builtin_round"],
+                    provenance={
+                        col: (
+                            frame[f"{i}:prov:{col}"].to_numpy()
+                            if value is None
+                            else value
+                        )
+                        for col, value in spec.get("provenance", {}).items()
+                    },
+                    skip_zeroed_by=spec.get("skip_zeroed_by"),
+                    skip_provenance=spec.get("skip_provenance", {}),
+                )
+            )
+        return ledger
+
+    def save(self, path: str) -> str:
+        """Write the ledger parquet atomically and record it in the manifest."""
+        frame, meta = self.to_frame()
+        table = pa.Table.from_pandas(frame, preserve_index=False)
+        metadata = dict(table.schema.metadata or {})
+        metadata[LEDGER_METADATA_KEY] = json.dumps(meta).encode()
+        table = table.replace_schema_metadata(metadata)
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        tmp = path + ".tmp"
+        pq.write_table(table, tmp)
+        os.replace(tmp, path)
+        record_partition_write(path)
+        return path
+
+    @classmethod
+    def load(cls, path: str) -> "ProjectionLedger":
+        """Read a ledger written by :meth:`save`."""
+        table = pq.read_table(path, partitioning=None)
+        meta = json.loads(table.schema.metadata[LEDGER_METADATA_KEY])
+        return cls.from_frame(table.to_pandas(), meta)
+
+
+def ledger_path(projection_path: str) -> str:
+    """Ledger file for a Gold projection file.
+
+    ``.../projections/season=S/week=W/projections_<scoring>_<ts>.parquet``
+    maps to
+    ``.../projection_ledgers/season=S/week=W/ledger_<scoring>_<ts>.parquet``.
+    """
+    parts = os.path.normpath(projection_path).split(os.sep)
+    if "projections" not in parts[:-1]:
+        raise ValueError(f"Not a Gold projection path: {projection_path}")
+    i = len(parts) - 2 - parts[-2::-1].index("projections")
+    parts[i] = LEDGER_DATASET
+    name = parts[-1]
+    if name.startswith("projections_"):
+        name = "ledger_" + name[len("projections_") :]
+    parts[-1] = name
+    return os.sep.join(parts)
+
+
+def load_ledger(projection_path: str) -> Optional[ProjectionLedger]:
+    """Ledger saved alongside ``projection_path``, or None when absent."""
+    try:
+        path = ledger_path(projection_path)
+    except ValueError:
+        return None
+    if not os.path.exists(path):
+        return None
+    try:
+        return ProjectionLedger.load(path)
+    except Exception as exc:
+        logger.warning("Ignoring unreadable projection ledger %s: %s", path, exc)
+        return None
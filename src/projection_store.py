@@ -72,8 +72,9 @@ def _read_preseason_parquet(path: str) -> pd.DataFrame:
     Returns:
         The parsed (and column-normalised) DataFrame.  This is a shared
         cached object — callers must NOT mutate it; copy before writing
-        (all current consumers — ``compute_value_scores``,
-        ``score_with_settings``, ``DraftBoard`` — already copy).
+        (all current consumers — ``compute_value_scores``, ``DraftBoard`` —
+        already copy; ``score_with_settings`` returns a new frame that shares
+        the unscored columns).
     """
     df = pd.read_parquet(path)
     # Normalise column name: pipeline older than v4.3 uses recent_team.
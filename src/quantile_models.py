@@ -9,10 +9,12 @@ Exports:
     train_quantile_models: Train LightGBM quantile models per position.
     save_quantile_models: Persist trained models to disk.
     load_quantile_models: Load saved models from disk.
+    cached_quantile_models: load_quantile_models, loaded once per process.
     predict_quantiles: Generate floor/projection/ceiling from trained models.
     compute_calibration: Evaluate coverage and tail calibration.
 """
 
+import glob
 import json
 import logging
 import os
@@ -27,6 +29,7 @@ from sklearn.impute import SimpleImputer
 from sklearn.metrics import mean_absolute_error
 
 from model_provenance import build_provenance
+from model_registry import MODEL_REGISTRY
 
 logger = logging.getLogger(__name__)
 
@@ -553,6 +556,31 @@ def load_quantile_models(
     }
 
 
+def cached_quantile_models(
+    path: Optional[str] = None,
+) -> Optional[Dict[str, Any]]:
+    """``load_quantile_models`` through MODEL_REGISTRY.
+
+    add_floor_ceiling runs several times per projection call; this loads
+    the pickles once and reloads only when metadata.json or a ``*.pkl`` in
+    the directory changes. The returned dict is shared -- do not mutate it.
+
+    Args:
+        path: Directory to load from (default: models/quantile/).
+
+    Returns:
+        Same as load_quantile_models.
+    """
+    if path is None:
+        path = DEFAULT_MODEL_DIR
+    paths = [os.path.join(path, "metadata.json")] + sorted(
+        glob.glob(os.path.join(path, "*.pkl"))
+    )
+    return MODEL_REGISTRY.get(
+        "quantile", os.path.abspath(path), paths, lambda: load_quantile_models(path)
+    )
+
+
 # ---------------------------------------------------------------------------
 # Prediction
 # ---------------------------------------------------------------------------
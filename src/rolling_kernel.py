@@ -0,0 +1,289 @@
+"""Vectorized shifted-window kernel for trailing (leak-free) features.
+
+The Silver feature builders compute trailing features with the idiom::
+
+    df.groupby(keys)[col].transform(lambda s: s.shift(1).rolling(w).mean())
+
+once per column and window, which costs one Python-level lambda call per
+group per column (and ``rolling().apply`` costs one call per *window*).
+:class:`LaggedGroupBlock` replaces that with a single NumPy pass: rows are
+scattered once into a padded ``(groups, max_group_len, columns)`` block,
+shifted by one position, and every statistic is evaluated for all groups
+and columns at once by stepping along the within-group position axis.
+
+The window recurrences mirror pandas' Cython kernels step for step
+(Kahan-compensated add/remove for rolling and expanding means, the
+``adjust=True`` weight recurrence for EWMs), so outputs match the
+``transform(lambda ...)`` idiom bit for bit on the pinned pandas 1.5 —
+``tests/test_rolling_kernel.py`` pins that parity for every stat.
+
+Usage
+-----
+::
+
+    from rolling_kernel import LaggedGroupBlock
+
+    df = df.sort_values(["player_id", "season", "week"])
+    block = LaggedGroupBlock(df, ["player_id", "season"], stat_cols)
+    df = df.assign(
+        **block.columns(block.rolling_mean(3), "{col}_roll3"),
+        **block.columns(block.expanding_mean(), "{col}_std"),
+    )
+
+Rows must already be in within-group time order (the callers sort by
+``[*keys, "week"]`` first, exactly as the pandas path required). Rows with
+a null group key get NaN, matching ``groupby(dropna=True).transform``.
+"""
+
+import logging
+from typing import Dict, List, Sequence
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+
+class LaggedGroupBlock:
+    """Shift(1)-lagged value block for a set of columns, grouped by keys.
+
+    Args:
+        df: Frame whose rows are in within-group time order.
+        group_cols: Grouping key columns (e.g. ``["player_id", "season"]``).
+        value_cols: Numeric columns to compute trailing stats for.
+    """
+
+    def __init__(
+        self,
+        df: pd.DataFrame,
+        group_cols: Sequence[str],
+        value_cols: Sequence[str],
+    ) -> None:
+        self.value_cols: List[str] = list(value_cols)
+        self.n_rows = len(df)
+
+        codes = (
+            df.groupby(list(group_cols), sort=False).ngroup().to_numpy()
+            if self.n_rows
+            else np.empty(0, dtype=np.int64)
+        )
+        keyed = np.flatnonzero(codes >= 0)
+        # Stable sort keeps each group's rows in their incoming (time) order.
+        self._rows = keyed[np.argsort(codes[keyed], kind="stable")]
+        sorted_codes = codes[self._rows]
+
+        n = len(self._rows)
+        if n:
+            is_start = np.empty(n, dtype=bool)
+            is_start[0] = True
+            np.not_equal(sorted_codes[1:], sorted_codes[:-1], out=is_start[1:])
+            starts = np.flatnonzero(is_start)
+            group_of_row = np.cumsum(is_start) - 1
+            pos = np.arange(n) - starts[group_of_row]
+            n_groups = len(starts)
+            max_len = int(pos.max()) + 1
+        else:
+            group_of_row = pos = np.empty(0, dtype=np.int64)
+            n_groups, max_len = 0, 0
+
+        self._group_of_row = group_of_row
+        self._pos = pos
+
+        values = df[self.value_cols].to_numpy(dtype=np.float64, na_value=np.nan)
+        values = values[self._rows]
+        # pandas window ops treat +/-inf as missing before aggregating.
+        values = np.where(np.isinf(values), np.nan, values)
+
+        # lagged[g, p] = value at position p - 1 of group g (the shift(1)).
+        lagged = np.full((n_groups, max_len, len(self.value_cols)), np.nan)
+        next_pos = pos + 1
+        keep = next_pos < max_len
+        lagged[group_of_row[keep], next_pos[keep]] = values[keep]
+        self._lagged = lagged
+
+    # ------------------------------------------------------------------
+    # Output helpers
+    # ------------------------------------------------------------------
+
+    def _scatter(self, block: np.ndarray) -> np.ndarray:
+        """Map a (groups, positions, cols) result back to input row order."""
+        out = np.full((self.n_rows, len(self.value_cols)), np.nan)
+        out[self._rows] = block[self._group_of_row, self._pos]
+        return out
+
+    def columns(self, result: np.ndarray, name_format: str) -> Dict[str, np.ndarray]:
+        """Name a result matrix's columns for ``DataFrame.assign``.
+
+        Args:
+            result: ``(n_rows, n_cols)`` array from one of the stat methods.
+            name_format: Format string with a ``{col}`` placeholder, e.g.
+                ``"{col}_roll3"``.
+
+        Returns:
+            Dict of output column name to 1-D array in input row order.
+        """
+        return {
+            name_format.format(col=col): result[:, j]
+            for j, col in enumerate(self.value_cols)
+        }
+
+    # ------------------------------------------------------------------
+    # Window statistics (all on the shift(1)-lagged values)
+    # ------------------------------------------------------------------
+
+    def rolling_mean(self, window: int, min_periods: int = 1) -> np.ndarray:
+        """``shift(1).rolling(window, min_periods).mean()`` per group."""
+        return self._scatter(self._windowed_mean(window, min_periods))
+
+    def expanding_mean(self, min_periods: int = 1) -> np.ndarray:
+        """``shift(1).expanding(min_periods).mean()`` per group."""
+        return self._scatter(self._windowed_mean(None, min_periods))
+
+    def _windowed_mean(self, window, min_periods: int) -> np.ndarray:
+        """Kahan-compensated add/remove mean, as pandas ``roll_mean``.
+
+        ``window=None`` means expanding (no removals).
+        """
+        lagged = self._lagged
+        n_groups, max_len, n_cols = lagged.shape
+        out = np.full(lagged.shape, np.nan)
+        shape = (n_groups, n_cols)
+
+        nobs = np.zeros(shape, dtype=np.int64)
+        neg_ct = np.zeros(shape, dtype=np.int64)
+        sum_x = np.zeros(shape)
+        comp_add = np.zeros(shape)
+        comp_remove = np.zeros(shape)
+        same_run = np.zeros(shape, dtype=np.int64)
+        prev_value = np.zeros(shape)
+
+        def _add(val: np.ndarray) -> None:
+            obs = val == val
+            nobs[obs] += 1
+            y = val - comp_add
+            t = sum_x + y
+            comp_add[obs] = (t - sum_x - y)[obs]
+            sum_x[obs] = t[obs]
+            neg_ct[obs & np.signbit(val)] += 1
+            repeat = obs & (val == prev_value)
+            same_run[repeat] += 1
+            same_run[obs & ~repeat] = 1
+            prev_value[obs] = val[obs]
+
+        def _remove(val: np.ndarray) -> None:
+            obs = val == val
+            nobs[obs] -= 1
+            y = -val - comp_remove
+            t = sum_x + y
+            comp_remove[obs] = (t - sum_x - y)[obs]
+            sum_x[obs] = t[obs]
+            neg_ct[obs & np.signbit(val)] -= 1
+
+        for p in range(max_len):
+            start = 0 if window is None else max(0, p - window + 1)
+            if p == 0 or start >= p:
+                # Window shares nothing with the previous one: reset.
+                nobs[:] = 0
+                neg_ct[:] = 0
+                sum_x[:] = 0.0
+                comp_add[:] = 0.0
+                comp_remove[:] = 0.0
+                same_run[:] = 0
+                prev_value[:] = lagged[:, start]
+                for j in range(start, p + 1):
+                    _add(lagged[:, j])
+            else:
+                prev_start = 0 if window is None else max(0, p - window)
+                for j in range(prev_start, start):
+                    _remove(lagged[:, j])
+                _add(lagged[:, p])
+
+            with np.errstate(invalid="ignore", divide="ignore"):
+                result = sum_x / nobs
+            result = np.where(same_run >= nobs, prev_value, result)
+            result = np.where(
+                (same_run < nobs) & (neg_ct == 0) & (result < 0), 0.0, result
+            )
+            result = np.where(
+                (same_run < nobs) & (neg_ct == nobs) & (result > 0), 0.0, result
+            )
+            ready = (nobs >= min_periods) & (nobs > 0)
+            out[:, p] = np.where(ready, result, np.nan)
+        return out
+
+    def ewm_mean(self, halflife: float, min_periods: int = 1) -> np.ndarray:
+        """``shift(1).ewm(halflife=halflife, min_periods).mean()`` per group.
+
+        Uses pandas' defaults (``adjust=True``, ``ignore_na=False``).
+        """
+        decay = 1 - np.exp(np.log(0.5) / halflife)
+        com = float(1 / decay - 1)
+        alpha = 1.0 / (1.0 + com)
+        old_wt_factor = 1.0 - alpha
+        new_wt = 1.0
+
+        lagged = self._lagged
+        n_groups, max_len, n_cols = lagged.shape
+        out = np.full(lagged.shape, np.nan)
+        if max_len == 0:
+            return self._scatter(out)
+
+        weighted = lagged[:, 0].copy()
+        nobs = (weighted == weighted).astype(np.int64)
+        old_wt = np.ones((n_groups, n_cols))
+        out[:, 0] = np.where(nobs >= min_periods, weighted, np.nan)
+
+        for p in range(1, max_len):
+            cur = lagged[:, p]
+            obs = cur == cur
+            nobs += obs
+            started = weighted == weighted
+            old_wt = np.where(started, old_wt * old_wt_factor, old_wt)
+            update = started & obs
+            changed = update & (weighted != cur)
+            blended = (old_wt * weighted + new_wt * cur) / (old_wt + new_wt)
+            weighted = np.where(changed, blended, weighted)
+            old_wt = np.where(update, old_wt + new_wt, old_wt)
+            weighted = np.where(~started & obs, cur, weighted)
+            out[:, p] = np.where(nobs >= min_periods, weighted, np.nan)
+        return self._scatter(out)
+
+    def rolling_slope(self, window: int, min_periods: int) -> np.ndarray:
+        """OLS slope of each trailing window's non-null lagged values.
+
+        Equivalent to ``shift(1).rolling(window, min_periods).apply(f)``
+        where ``f`` drops nulls and regresses the remaining values on
+        ``0..n-1`` (``pbp_advanced_features._slope_for_window``): NaN when
+        fewer than ``min_periods`` values are present.
+        """
+        lagged = self._lagged
+        n_groups, max_len, n_cols = lagged.shape
+        out = np.full(lagged.shape, np.nan)
+        if max_len == 0:
+            return self._scatter(out)
+
+        # windows[g, p, c, k] = lagged value at position p - window + 1 + k.
+        padded = np.concatenate(
+            [np.full((n_groups, window - 1, n_cols), np.nan), lagged], axis=1
+        )
+        windows = np.stack([padded[:, k : k + max_len] for k in range(window)], axis=-1)
+        present = windows == windows
+        counts = present.sum(axis=-1)
+
+        for n in range(max(min_periods, 1), window + 1):
+            sel = counts == n
+            if not sel.any():
+                continue
+            # Left-align each window's non-null values (order preserved).
+            vals = windows[sel]
+            keep = present[sel]
+            order = np.argsort(~keep, axis=1, kind="stable")
+            y = np.take_along_axis(vals, order, axis=1)[:, :n]
+            x = np.arange(n, dtype=float)
+            x_mean = x.mean()
+            den = ((x - x_mean) ** 2).sum()
+            if den == 0:
+                continue
+            y_mean = y.mean(axis=1, keepdims=True)
+            out[sel] = ((x - x_mean) * (y - y_mean)).sum(axis=1) / den
+        return self._scatter(out)
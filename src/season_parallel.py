@@ -0,0 +1,130 @@
+"""Process-pool execution of independent per-season assembly work.
+
+The multi-season assemblers (``assemble_multiyear_player_features`` and
+``assemble_multiyear_features``) build each season from its own Silver
+partitions with CPU-bound pandas code, so seasons can run in separate
+processes. :func:`map_seasons` does that while keeping the serial path's
+contract:
+
+* results come back in the order of ``seasons`` regardless of which
+  worker finishes first, so ``pd.concat`` produces the same row order;
+* frames cross the process boundary by pickling, which preserves dtypes;
+* an exception in any season propagates to the caller, as it would serially.
+
+Each assembled season holds several hundred MB of intermediate frames, so
+the number of seasons *in flight* (submitted but not yet collected) is
+capped by available memory divided by a per-season estimate
+(``FEATURE_ASSEMBLY_SEASON_MB``), in addition to the worker count.
+
+Usage
+-----
+::
+
+    from season_parallel import map_seasons
+
+    frames = map_seasons(assemble_player_features, seasons, workers=8)
+"""
+
+import logging
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, List, Optional, Sequence, TypeVar
+
+from config import FEATURE_ASSEMBLY_SEASON_MB, FEATURE_ASSEMBLY_WORKERS
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+def available_memory_mb() -> Optional[int]:
+    """Available physical memory in MB, or None when it cannot be read."""
+    try:
+        with open("/proc/meminfo", "r") as f:
+            for line in f:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1]) // 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    try:
+        pages = os.sysconf("SC_AVPHYS_PAGES")
+        page_size = os.sysconf("SC_PAGE_SIZE")
+        return int(pages * page_size // (1024 * 1024))
+    except (ValueError, OSError, AttributeError):
+        return None
+
+
+def resolve_in_flight(
+    workers: int,
+    n_seasons: int,
+    season_mb: int = FEATURE_ASSEMBLY_SEASON_MB,
+    memory_mb: Optional[int] = None,
+) -> int:
+    """How many seasons may be assembled concurrently.
+
+    Args:
+        workers: Requested process count.
+        n_seasons: Number of seasons to assemble.
+        season_mb: Estimated peak memory per in-flight season.
+        memory_mb: Available memory; read from the OS when None.
+
+    Returns:
+        ``min(workers, n_seasons, memory_mb // season_mb)``, never below 1.
+    """
+    limit = min(workers, n_seasons)
+    if memory_mb is None:
+        memory_mb = available_memory_mb()
+    if memory_mb is not None and season_mb > 0:
+        limit = min(limit, memory_mb // season_mb)
+    return max(1, limit)
+
+
+def map_seasons(
+    func: Callable[[int], T],
+    seasons: Sequence[int],
+    workers: Optional[int] = None,
+    season_mb: int = FEATURE_ASSEMBLY_SEASON_MB,
+) -> List[T]:
+    """Apply ``func`` to every season, optionally across processes.
+
+    Args:
+        func: Picklable ``season -> result`` callable (a module-level
+            function or a ``functools.partial`` of one).
+        seasons: Seasons in the order results should be returned.
+        workers: Process count. None uses ``FEATURE_ASSEMBLY_WORKERS``;
+            1 (or a single season) runs serially in this process.
+        season_mb: Per-season memory estimate for the in-flight cap.
+
+    Returns:
+        ``[func(s) for s in seasons]`` — same order, same values.
+    """
+    seasons = list(seasons)
+    if workers is None:
+        workers = FEATURE_ASSEMBLY_WORKERS
+    in_flight = resolve_in_flight(workers, len(seasons), season_mb)
+    if in_flight <= 1:
+        return [func(season) for season in seasons]
+
+    logger.info(
+        "Assembling %d seasons on %d processes (requested %d)",
+        len(seasons),
+        in_flight,
+        workers,
+    )
+    results: List[T] = []
+    with ProcessPoolExecutor(max_workers=in_flight) as pool:
+        pending = deque()
+        remaining = iter(seasons)
+        for season in remaining:
+            pending.append(pool.submit(func, season))
+            if len(pending) >= in_flight:
+                break
+        # Collect strictly in season order; submit one new season per
+        # collected result so at most ``in_flight`` frames are alive.
+        while pending:
+            results.append(pending.popleft().result())
+            next_season = next(remaining, None)
+            if next_season is not None:
+                pending.append(pool.submit(func, next_season))
+    return results
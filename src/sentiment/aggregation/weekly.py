@@ -29,6 +29,7 @@ from typing import Any, Dict, List, Optional, Tuple
 import pandas as pd
 
 from src.config import SENTIMENT_CONFIG
+from src.partition_manifest import record_partition_write
 
 logger = logging.getLogger(__name__)
 
@@ -497,6 +498,7 @@ class WeeklyAggregator:
 
         output_path = output_dir / f"sentiment_multipliers_{ts}.parquet"
         df.to_parquet(output_path, index=False)
+        record_partition_write(output_path)
         logger.info(
             "Wrote Gold sentiment Parquet (%d rows) → %s", len(df), output_path
         )
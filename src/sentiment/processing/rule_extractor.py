@@ -77,9 +77,11 @@ Public API
 
 from __future__ import annotations
 
+import bisect
 import logging
 import re
-from typing import Any, Dict, List, Optional, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 from src.sentiment.processing.extractor import PlayerSignal
 
@@ -410,6 +412,29 @@ def _compile_patterns() -> List[_PatternEntry]:
 
 _PATTERNS: List[_PatternEntry] = _compile_patterns()
 
+
+def _fold_pattern(regex: re.Pattern) -> re.Pattern:
+    """Case-sensitive twin of an IGNORECASE rule, for lower-cased ASCII text.
+
+    On ASCII input, lower-casing the text and the pattern gives exactly the
+    IGNORECASE matches at the same offsets, and the engine scans several
+    times faster without case folding. Patterns with an upper-case escape
+    (``\\S``, ``\\W`` ...) are kept as-is since lower-casing would change them.
+
+    Args:
+        regex: A compiled ``_PATTERNS`` regex.
+
+    Returns:
+        A regex to run against ``text.lower()``.
+    """
+    if re.search(r"\\[A-Z]", regex.pattern):
+        return regex
+    return re.compile(regex.pattern.lower())
+
+
+_FOLDED_REGEXES: List[re.Pattern] = [_fold_pattern(p[0]) for p in _PATTERNS]
+_PATTERN_REGEXES: List[re.Pattern] = [p[0] for p in _PATTERNS]
+
 # Regex for extracting candidate player names from text (Title Case two-word).
 # Handles hyphenated names (Amon-Ra), Mc/Mac prefixes (McCaffrey, McVay),
 # St. prefix (St. Brown), apostrophes (O'Brien), and suffixes (Jr., III).
@@ -438,6 +463,13 @@ _DRAFT_SEASON_CONFIDENCE = 0.5
 # good enough to stop one player's event bleeding onto another's.
 _WINDOW_CEILING = 500
 _SENTENCE_DELIMS = ".!?\n"
+_DELIM_PATTERN = re.compile(r"[.!?\n]")
+
+# Docs handed to each worker per task when ``extract_batch`` fans out.
+_BATCH_CHUNK_SIZE = 64
+
+# (pattern index into ``_PATTERNS``, sorted start offsets of every match)
+_PatternHits = Tuple[int, List[int]]
 
 # Set of draft-season event flag keys (Plan 72-01). Used by
 # ``RuleExtractor.extract`` to decide whether a given best-match's
@@ -511,9 +543,15 @@ class RuleExtractor:
         if not candidate_names:
             return []
 
-        # Fast path: if nothing in the whole document matches any pattern,
-        # no per-player window can match either.
-        if not self._find_matches(combined):
+        # One scan of the whole document per pattern records every hit
+        # offset. If nothing matches anywhere, no per-player window can
+        # match either.
+        if combined.isascii():
+            scan_text, regexes = combined.lower(), _FOLDED_REGEXES
+        else:
+            scan_text, regexes = combined, _PATTERN_REGEXES
+        hits = self._find_pattern_hits(scan_text, regexes)
+        if not hits:
             return []
 
         # For each player, pick the best (highest-priority) matching pattern
@@ -522,6 +560,7 @@ class RuleExtractor:
         # questionable. Kelce has been ruled out.") and matching against
         # the whole document stamped one player's event onto every player
         # in the text.
+        delims = [m.start() for m in _DELIM_PATTERN.finditer(combined)]
         signals: List[PlayerSignal] = []
         seen_players: set = set()
 
@@ -530,13 +569,11 @@ class RuleExtractor:
                 continue
             seen_players.add(name)
 
-            windows = self._player_windows(combined, name)
-            local_matches = self._find_matches_in_windows(windows)
-            if not local_matches:
+            spans = self._player_spans(combined, name, delims)
+            best = self._best_match_in_spans(scan_text, regexes, spans, hits)
+            if best is None:
                 continue
 
-            # Find the best match: first match wins (patterns are priority-ordered)
-            best = local_matches[0]
             sentiment, category, events = best
 
             # Confidence cap (Plan 72-01): when the best-match's events
@@ -612,49 +649,96 @@ class RuleExtractor:
                 result.append(name)
         return result
 
-    def _find_matches(self, text: str) -> List[Tuple[float, str, Dict[str, bool]]]:
-        """Find all pattern matches in the text.
+    def _find_pattern_hits(
+        self, text: str, regexes: List[re.Pattern]
+    ) -> List[_PatternHits]:
+        """Record every offset at which each pattern matches in ``text``.
+
+        Overlapping matches are kept (the scan resumes one character
+        after each match start), so any match a sentence window could
+        contain starts at one of the recorded offsets.
 
         Args:
-            text: Combined title + body text.
+            text: Combined title + body text (lower-cased when ASCII).
+            regexes: ``_FOLDED_REGEXES`` for lower-cased ASCII text,
+                otherwise ``_PATTERN_REGEXES``.
 
         Returns:
-            List of (sentiment, category, events) tuples for each match,
-            in pattern-priority order.
+            ``(pattern_index, starts)`` for each pattern with at least one
+            hit, in pattern-priority order.
         """
-        matches: List[Tuple[float, str, Dict[str, bool]]] = []
-        for regex, sentiment, category, events in _PATTERNS:
-            if regex.search(text):
-                matches.append((sentiment, category, events))
-        return matches
-
-    def _find_matches_in_windows(
-        self, windows: List[str]
-    ) -> List[Tuple[float, str, Dict[str, bool]]]:
-        """Find pattern matches across a player's scoped text window(s).
-
-        Same priority-ordered semantics as ``_find_matches``, except a
-        pattern only counts if it appears in one of ``windows`` (the
+        hits: List[_PatternHits] = []
+        for idx, regex in enumerate(regexes):
+            starts: List[int] = []
+            m = regex.search(text)
+            while m is not None:
+                starts.append(m.start())
+                m = regex.search(text, m.start() + 1)
+            if starts:
+                hits.append((idx, starts))
+        return hits
+
+    def _best_match_in_spans(
+        self,
+        text: str,
+        regexes: List[re.Pattern],
+        spans: List[Tuple[int, int]],
+        hits: List[_PatternHits],
+    ) -> Optional[Tuple[float, str, Dict[str, bool]]]:
+        """Highest-priority pattern found inside one of a player's windows.
+
+        A pattern only counts if it matches within one of ``spans`` (the
         sentence(s) mentioning this specific player) rather than anywhere
-        in the whole document. Checked per-window instead of on a joined
-        string so a match can't be manufactured by two windows' text
-        butting up against each other.
+        in the whole document. Each window is checked on its own so a
+        match can't be manufactured by two windows' text butting up
+        against each other.
+
+        A window that starts and ends on a sentence boundary is resolved
+        from the document-wide ``hits``: its delimiters are non-word
+        characters and no pattern ends on one, so a match of the window
+        text starts at a recorded hit and is re-checked there with the
+        search truncated at the window end. Windows cut short by
+        ``_WINDOW_CEILING`` can split a word, so they are searched
+        directly.
 
         Args:
-            windows: Sentence-scoped text slices for one player's mentions.
+            text: The text ``hits`` were scanned from.
+            regexes: The regexes ``hits`` were scanned with.
+            spans: ``[left, right)`` window offsets for one player.
+            hits: Output of ``_find_pattern_hits`` for ``text``.
 
         Returns:
-            List of (sentiment, category, events) tuples, in
-            pattern-priority order.
+            ``(sentiment, category, events)`` of the first matching
+            pattern, or None when no window matches any pattern.
         """
-        matches: List[Tuple[float, str, Dict[str, bool]]] = []
-        for regex, sentiment, category, events in _PATTERNS:
-            if any(regex.search(window) for window in windows):
-                matches.append((sentiment, category, events))
-        return matches
-
-    def _player_windows(self, text: str, name: str) -> List[str]:
-        """Return the sentence(s) mentioning ``name`` within ``text``.
+        n = len(text)
+        bounded = [
+            (left == 0 or text[left - 1] in _SENTENCE_DELIMS)
+            and (right == n or text[right - 1] in _SENTENCE_DELIMS)
+            for left, right in spans
+        ]
+        for idx, starts in hits:
+            regex = regexes[idx]
+            _, sentiment, category, events = _PATTERNS[idx]
+            for (left, right), on_boundary in zip(spans, bounded):
+                if on_boundary:
+                    i = bisect.bisect_left(starts, left)
+                    found = False
+                    while i < len(starts) and starts[i] < right:
+                        if regex.match(text, starts[i], right):
+                            found = True
+                            break
+                        i += 1
+                else:
+                    found = regex.search(text[left:right]) is not None
+                if found:
+                    return sentiment, category, events
+        return None
+
+    def _player_spans(
+        self, text: str, name: str, delims: Sequence[int]
+    ) -> List[Tuple[int, int]]:
+        """Return the sentence window(s) mentioning ``name`` within ``text``.
 
         A player can be named more than once (title + body); every
         mention contributes its own sentence window so a pattern near
@@ -663,58 +747,79 @@ class RuleExtractor:
         Args:
             text: Combined title + body text.
             name: A candidate player name as returned by ``_extract_names``.
+            delims: Sorted offsets of every sentence delimiter in ``text``.
 
         Returns:
-            List of sentence-scoped text windows, one per mention.
+            List of ``[left, right)`` window offsets, one per mention.
         """
-        return [
-            self._sentence_window(text, m.start(), m.end())
-            for m in re.finditer(re.escape(name), text)
-        ]
-
-    def _sentence_window(self, text: str, start: int, end: int) -> str:
+        spans: List[Tuple[int, int]] = []
+        start = text.find(name)
+        while start != -1:
+            end = start + len(name)
+            spans.append(self._sentence_span(text, start, end, delims))
+            start = text.find(name, end)
+        return spans
+
+    def _sentence_span(
+        self, text: str, start: int, end: int, delims: Sequence[int]
+    ) -> Tuple[int, int]:
         """Expand a [start, end) span out to its enclosing sentence.
 
         Grows left and right from the span until hitting a sentence
         delimiter (``.``, ``!``, ``?``, or newline), capped at
-        ``_WINDOW_CEILING`` chars each direction.
+        ``_WINDOW_CEILING`` chars each direction. The delimiter on the
+        right is included for pattern context.
 
         Args:
             text: Full text the span was found in.
             start: Start offset of the span (e.g. a name match).
             end: End offset of the span.
+            delims: Sorted offsets of every sentence delimiter in ``text``.
 
         Returns:
-            The substring of ``text`` covering the enclosing sentence(s).
+            ``(left, right)`` offsets of the enclosing sentence(s).
         """
         left_limit = max(0, start - _WINDOW_CEILING)
         right_limit = min(len(text), end + _WINDOW_CEILING)
 
-        left = start
-        while left > left_limit and text[left - 1] not in _SENTENCE_DELIMS:
-            left -= 1
+        i = bisect.bisect_left(delims, start)
+        left = max(left_limit, delims[i - 1] + 1) if i > 0 else left_limit
 
-        right = end
-        while right < right_limit and text[right] not in _SENTENCE_DELIMS:
-            right += 1
+        j = bisect.bisect_left(delims, end)
+        right = min(right_limit, delims[j]) if j < len(delims) else right_limit
         if right < len(text):
-            right += 1  # include the delimiter itself for pattern context
-
-        return text[left:right]
+            right += 1
+        return left, right
 
     def extract_batch(
-        self, docs: List[Dict[str, Any]]
+        self, docs: List[Dict[str, Any]], workers: Optional[int] = None
     ) -> Dict[str, List[PlayerSignal]]:
         """Extract signals from a list of Bronze documents.
 
         Args:
             docs: List of Bronze JSON document dicts.
+            workers: Process count for a large backfill. None or 1 runs
+                serially in this process; results are identical either way.
 
         Returns:
             Dict mapping ``external_id`` to list of ``PlayerSignal``.
         """
+        if workers is not None and workers > 1 and len(docs) > _BATCH_CHUNK_SIZE:
+            logger.info("Extracting %d docs on %d processes", len(docs), workers)
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                extracted = list(
+                    pool.map(_extract_doc, docs, chunksize=_BATCH_CHUNK_SIZE)
+                )
+        else:
+            extracted = [self.extract(doc) for doc in docs]
+
         results: Dict[str, List[PlayerSignal]] = {}
-        for doc in docs:
+        for doc, signals in zip(docs, extracted):
             doc_id = str(doc.get("external_id", id(doc)))
-            results[doc_id] = self.extract(doc)
+            results[doc_id] = signals
         return results
+
+
+def _extract_doc(doc: Dict[str, Any]) -> List[PlayerSignal]:
+    """Module-level ``RuleExtractor().extract`` for process-pool workers."""
+    return RuleExtractor().extract(doc)
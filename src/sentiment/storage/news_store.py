@@ -0,0 +1,542 @@
+"""Columnar serving store for sentiment news (Bronze docs, Silver signals,
+LLM-enrichment sidecars).
+
+The news service used to answer every feed / top-stories / rankings request
+by re-reading and JSON-parsing every Bronze document file for the season and
+every Silver signal file, so homepage latency grew with the total number of
+documents ever ingested. This module compacts those JSON trees into an
+append-only Parquet store and serves records back out of it:
+
+    data/silver/sentiment/news_store/{table}/part-YYYYMMDD_HHMMSS_<hex>.parquet
+
+with ``table`` one of :data:`TABLES`. Each part holds one row per record,
+sorted by ``published_ts``, with index columns (``doc_id``, ``player_id``,
+``team``, ``source``, ``season``, ``week``, ``published_ts``) next to the
+verbatim record JSON, plus the source file (``file``, relative to the data
+dir), its size and the record's position inside it.
+
+Design guarantees
+-----------------
+* **Exact parity**: :meth:`NewsStore.load_records` returns, for a list of
+  JSON files, the same records in the same order that parsing those files
+  would. Records are decoded from the stored JSON, not rebuilt from columns.
+* **Tail reads**: files the store does not cover yet (new since the last
+  compaction, rewritten, or outside the data dir -- e.g. test fixtures) are
+  parsed directly, memoized per (path, mtime, size). No compaction means
+  every file is tail: the service degrades to the old behaviour, never to
+  missing news.
+* **Coverage is keyed on (relative path, size), not mtime**: the HF Spaces
+  deployment clones the repo at build time, giving every file the same
+  mtime, so an mtime key would void the whole store on each deploy.
+* **Append-only**: a compaction run writes one new part per table with the
+  files it has not seen (or whose size changed); the newest part wins for a
+  file. ``rewrite=True`` folds every part into a single one.
+* **Predicate pushdown** for trailing-window queries: ``since`` is pushed
+  into the Parquet read as a ``published_ts >= since`` filter, and
+  published_ts-sorted parts let row-group statistics skip old history.
+
+Decoded store parts and tail files are cached in memory and shared between
+callers -- treat returned records as read-only.
+
+Usage::
+
+    python scripts/compact_news_store.py            # append new files
+    python scripts/compact_news_store.py --rewrite  # fold parts into one
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import uuid
+from collections import defaultdict
+from datetime import datetime, timezone
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+logger = logging.getLogger(__name__)
+
+# ---------------------------------------------------------------------------
+# Module constants
+# ---------------------------------------------------------------------------
+
+# ``src/sentiment/storage/news_store.py`` ⇒ 4 parents = repo root.
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent.parent
+_DEFAULT_DATA_DIR = _PROJECT_ROOT / "data"
+
+#: Store tables and the JSON trees (relative to the data dir) they compact.
+TABLES = ("bronze", "signals", "enriched")
+_TABLE_SOURCES: Dict[str, Tuple[str, Tuple[str, ...]]] = {
+    "bronze": ("bronze/sentiment", ("*/season=*/*.json",)),
+    "signals": (
+        "silver/sentiment/signals",
+        ("season=*/week=*/*.json", "season=*/*.json"),
+    ),
+    "enriched": (
+        "silver/sentiment/signals_enriched",
+        ("season=*/week=*/enriched_*.json",),
+    ),
+}
+
+# Parts are sorted by published_ts; small row groups keep the min/max
+# statistics tight enough for window queries to skip most of the history.
+_ROW_GROUP_SIZE = 2048
+
+_SCHEMA = pa.schema(
+    [
+        ("file", pa.string()),
+        ("file_size", pa.int64()),
+        ("pos", pa.int32()),
+        ("season", pa.int16()),
+        ("week", pa.int16()),
+        ("doc_id", pa.string()),
+        ("player_id", pa.string()),
+        ("team", pa.string()),
+        ("source", pa.string()),
+        ("published_at", pa.string()),
+        ("published_ts", pa.timestamp("us", tz="UTC")),
+        ("record", pa.string()),
+    ]
+)
+
+
+def default_store_dir(data_dir: Path = _DEFAULT_DATA_DIR) -> Path:
+    """Store location for a data dir (``silver/sentiment/news_store``)."""
+    return Path(data_dir) / "silver" / "sentiment" / "news_store"
+
+
+# ---------------------------------------------------------------------------
+# JSON parsing (shared by compaction and tail reads)
+# ---------------------------------------------------------------------------
+
+
+def parse_published_at(value: Any) -> Optional[datetime]:
+    """Parse an ISO published_at string to an aware UTC datetime, or None."""
+    if not value:
+        return None
+    try:
+        dt = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt
+
+
+def read_json_records(table: str, path: Path) -> Optional[List[Dict[str, Any]]]:
+    """Records held by one JSON file of *table*, or None when unreadable.
+
+    Bronze files carry ``items`` (current pipeline), ``documents`` (legacy),
+    a bare list or a single document; Silver signal files a ``records`` list
+    or a bare list; enrichment sidecars a ``records`` list.
+    """
+    try:
+        data = json.loads(Path(path).read_text(encoding="utf-8"))
+    except Exception as exc:
+        logger.warning("Could not read %s file %s: %s", table, path, exc)
+        return None
+
+    if table == "bronze":
+        if isinstance(data, list):
+            return [r for r in data if isinstance(r, dict)]
+        if isinstance(data, dict):
+            items = data.get("items") or data.get("documents") or []
+            if items:
+                return [r for r in items if isinstance(r, dict)]
+            if "external_id" in data or "title" in data:
+                return [data]
+        return []
+
+    if table == "signals":
+        if isinstance(data, dict):
+            batch = data.get("records", [])
+        elif isinstance(data, list):
+            batch = data
+        else:
+            return []
+        return [r for r in batch if isinstance(r, dict)]
+
+    if not isinstance(data, dict):
+        return []
+    records = data.get("records") or []
+    if not isinstance(records, list):
+        return []
+    return [r for r in records if isinstance(r, dict)]
+
+
+def _str_or_none(value: Any) -> Optional[str]:
+    return str(value) if value else None
+
+
+def _index_fields(table: str, rec: Dict[str, Any]) -> Dict[str, Any]:
+    """doc_id / player_id / team / source / published_at for one record."""
+    if table == "bronze":
+        doc_id = rec.get("external_id") or rec.get("id")
+        resolved = rec.get("resolved_player_ids") or []
+        player_id = (resolved[0] if resolved else None) or rec.get("resolved_player_id")
+        team = rec.get("team") or rec.get("team_hint")
+        published_at = rec.get("published_at") or rec.get("news_date")
+    elif table == "signals":
+        doc_id = rec.get("doc_id") or rec.get("external_id")
+        player_id = rec.get("player_id")
+        team = rec.get("team_abbr")
+        published_at = rec.get("published_at")
+    else:
+        doc_id = rec.get("doc_id") or rec.get("signal_id")
+        player_id = rec.get("player_id")
+        team = None
+        published_at = rec.get("published_at")
+    return {
+        "doc_id": _str_or_none(doc_id),
+        "player_id": _str_or_none(player_id),
+        "team": _str_or_none(team),
+        "source": _str_or_none(rec.get("source")),
+        "published_at": _str_or_none(published_at),
+        "published_ts": parse_published_at(published_at),
+    }
+
+
+def _partition_value(rel_file: str, key: str) -> Optional[int]:
+    for part in rel_file.split("/"):
+        if part.startswith(f"{key}="):
+            try:
+                return int(part.split("=", 1)[1])
+            except ValueError:
+                return None
+    return None
+
+
+# ---------------------------------------------------------------------------
+# Store parts
+# ---------------------------------------------------------------------------
+
+
+def _stat_key(path: Path) -> Tuple[str, int, int]:
+    st = os.stat(path)
+    return str(path), st.st_mtime_ns, st.st_size
+
+
+def _list_parts(table_dir: Path) -> List[Path]:
+    """Parts oldest -> newest (the filename carries the write timestamp)."""
+    if not table_dir.exists():
+        return []
+    return sorted(table_dir.glob("part-*.parquet"), key=lambda p: p.name)
+
+
+@lru_cache(maxsize=256)
+def _part_files(path: str, _mtime_ns: int, _size: int) -> Dict[str, int]:
+    """``file -> file_size`` for every source file held by one part."""
+    t = pq.read_table(path, columns=["file", "file_size"])
+    return dict(zip(t.column("file").to_pylist(), t.column("file_size").to_pylist()))
+
+
+@lru_cache(maxsize=16)
+def _coverage(
+    _table_dir: str, parts: Tuple[Tuple[str, int, int], ...]
+) -> Dict[str, Tuple[int, Tuple[str, int, int]]]:
+    """``file -> (file_size, part key)``; the newest part wins for a file."""
+    covered: Dict[str, Tuple[int, Tuple[str, int, int]]] = {}
+    for key in parts:
+        for rel, size in _part_files(*key).items():
+            covered[rel] = (size, key)
+    return covered
+
+
+def _group_rows(
+    files: List[str], positions: List[int], payloads: List[Optional[str]]
+) -> Dict[str, List[Dict[str, Any]]]:
+    rows: Dict[str, List[Tuple[int, str]]] = defaultdict(list)
+    for rel, pos, payload in zip(files, positions, payloads):
+        if payload is not None:  # pos -1 sentinel: a file with no records
+            rows[rel].append((pos, payload))
+    # One json.loads over the whole batch instead of one call per row.
+    ordered = [(rel, sorted(items)) for rel, items in rows.items()]
+    decoded = iter(
+        json.loads("[" + ",".join(p for _, items in ordered for _, p in items) + "]")
+    )
+    return {rel: [next(decoded) for _ in items] for rel, items in ordered}
+
+
+@lru_cache(maxsize=64)
+def _part_records(
+    path: str, _mtime_ns: int, _size: int
+) -> Dict[str, List[Dict[str, Any]]]:
+    """Every record of one part, decoded, grouped by source file."""
+    t = pq.read_table(path, columns=["file", "pos", "record"])
+    return _group_rows(
+        t.column("file").to_pylist(),
+        t.column("pos").to_pylist(),
+        t.column("record").to_pylist(),
+    )
+
+
+def _part_records_since(path: str, since: datetime) -> Dict[str, List[Dict[str, Any]]]:
+    """Records of one part published at/after *since* (filter pushed down)."""
+    t = pq.read_table(
+        path,
+        columns=["file", "pos", "record"],
+        filters=[("published_ts", ">=", pa.scalar(since, pa.timestamp("us", "UTC")))],
+    )
+    return _group_rows(
+        t.column("file").to_pylist(),
+        t.column("pos").to_pylist(),
+        t.column("record").to_pylist(),
+    )
+
+
+@lru_cache(maxsize=4096)
+def _tail_records(
+    table: str, path: str, _mtime_ns: int, _size: int
+) -> Tuple[Dict[str, Any], ...]:
+    return tuple(read_json_records(table, Path(path)) or ())
+
+
+# ---------------------------------------------------------------------------
+# Reader
+# ---------------------------------------------------------------------------
+
+
+class NewsStore:
+    """Read side of the store, with a parsed-JSON tail for uncovered files.
+
+    Args:
+        store_dir: Store root (``.../news_store``).
+        data_dir: Data dir the store's ``file`` column is relative to. Files
+            outside it are always read as tail.
+    """
+
+    def __init__(self, store_dir: Path, data_dir: Path = _DEFAULT_DATA_DIR):
+        self.store_dir = Path(store_dir)
+        self.data_dir = Path(data_dir)
+        self._data_prefix = os.path.abspath(self.data_dir) + os.sep
+
+    def _relative(self, path: Path) -> Optional[str]:
+        full = os.path.abspath(path)
+        if not full.startswith(self._data_prefix):
+            return None
+        return full[len(self._data_prefix) :].replace(os.sep, "/")
+
+    def coverage(self, table: str) -> Dict[str, Tuple[int, Tuple[str, int, int]]]:
+        """``file -> (file_size, part key)`` for every file the store holds."""
+        table_dir = self.store_dir / table
+        parts = tuple(_stat_key(p) for p in _list_parts(table_dir))
+        if not parts:
+            return {}
+        return _coverage(str(table_dir), parts)
+
+    def load_records(
+        self,
+        table: str,
+        files: Iterable[Path],
+        since: Optional[datetime] = None,
+    ) -> List[Dict[str, Any]]:
+        """Records of *files*, in file order then in-file order.
+
+        Args:
+            table: One of :data:`TABLES`.
+            files: Source JSON files, in the order their records should be
+                returned.
+            since: When given, only records whose ``published_at`` parses
+                to a time at/after it (pushed down for store reads).
+
+        Returns:
+            Flat list of record dicts (shared -- do not mutate).
+        """
+        files = [Path(f) for f in files]
+        covered = self.coverage(table) if files else {}
+
+        by_part: Dict[Tuple[str, int, int], List[str]] = defaultdict(list)
+        plan: List[Tuple[Path, Optional[str], Optional[Tuple[str, int, int]]]] = []
+        for path in files:
+            rel = self._relative(path)
+            hit = covered.get(rel) if rel is not None else None
+            try:
+                size = os.stat(path).st_size
+            except OSError:
+                continue
+            if hit is not None and hit[0] == size:
+                by_part[hit[1]].append(rel)
+                plan.append((path, rel, hit[1]))
+            else:
+                plan.append((path, None, None))
+
+        part_rows: Dict[Tuple[str, int, int], Dict[str, List[Dict[str, Any]]]] = {}
+        for key in by_part:
+            part_rows[key] = (
+                _part_records(*key)
+                if since is None
+                else _part_records_since(key[0], since)
+            )
+
+        records: List[Dict[str, Any]] = []
+        for path, rel, key in plan:
+            if key is not None:
+                records.extend(part_rows[key].get(rel, ()))
+                continue
+            tail = _tail_records(table, *_stat_key(path))
+            if since is None:
+                records.extend(tail)
+            else:
+                for rec in tail:
+                    published = parse_published_at(
+                        _index_fields(table, rec)["published_at"]
+                    )
+                    if published is not None and published >= since:
+                        records.append(rec)
+        return records
+
+
+# ---------------------------------------------------------------------------
+# Compaction
+# ---------------------------------------------------------------------------
+
+
+def _source_files(data_dir: Path, table: str) -> List[Path]:
+    root, patterns = _TABLE_SOURCES[table]
+    base = data_dir / root
+    if not base.exists():
+        return []
+    files = set()
+    for pattern in patterns:
+        files.update(p for p in base.glob(pattern) if p.is_file())
+    return sorted(files)
+
+
+def _rows_for_file(table: str, rel: str, size: int, records: List[Dict[str, Any]]):
+    season = _partition_value(rel, "season")
+    week = _partition_value(rel, "week")
+    base = {"file": rel, "file_size": size, "season": season, "week": week}
+    if not records:
+        yield dict(
+            base,
+            pos=-1,
+            doc_id=None,
+            player_id=None,
+            team=None,
+            source=None,
+            published_at=None,
+            published_ts=None,
+            record=None,
+        )
+        return
+    for pos, rec in enumerate(records):
+        yield dict(
+            base,
+            pos=pos,
+            record=json.dumps(rec, ensure_ascii=False),
+            **_index_fields(table, rec),
+        )
+
+
+def _write_part(table_dir: Path, rows: List[Dict[str, Any]]) -> Path:
+    """Write *rows* sorted by published_ts as a new part (atomic rename)."""
+    floor = datetime.min.replace(tzinfo=timezone.utc)
+    rows.sort(
+        key=lambda r: (
+            r["published_ts"] is None,
+            r["published_ts"] or floor,
+            r["file"],
+            r["pos"],
+        )
+    )
+    table = pa.Table.from_pylist(rows, schema=_SCHEMA)
+    table_dir.mkdir(parents=True, exist_ok=True)
+    stamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
+    path = table_dir / f"part-{stamp}_{uuid.uuid4().hex[:8]}.parquet"
+    tmp = path.with_suffix(".parquet.tmp")
+    pq.write_table(table, tmp, row_group_size=_ROW_GROUP_SIZE)
+    os.replace(tmp, path)
+    return path
+
+
+def compact_news_store(
+    data_dir: Path = _DEFAULT_DATA_DIR,
+    store_dir: Optional[Path] = None,
+    tables: Iterable[str] = TABLES,
+    rewrite: bool = False,
+    max_parts: Optional[int] = None,
+) -> Dict[str, int]:
+    """Fold new/changed sentiment JSON files into the store.
+
+    Args:
+        data_dir: Data dir holding ``bronze/sentiment`` and
+            ``silver/sentiment``.
+        store_dir: Store root; defaults to :func:`default_store_dir`.
+        tables: Subset of :data:`TABLES` to compact.
+        rewrite: Fold every existing part (dropping superseded rows) plus
+            the new files into a single part, then delete the old parts.
+        max_parts: Rewrite a table anyway once it has this many parts, so
+            daily appends don't leave cold starts reading hundreds of parts.
+
+    Returns:
+        ``table -> number of source files compacted`` in this run.
+    """
+    data_dir = Path(data_dir)
+    store = NewsStore(store_dir or default_store_dir(data_dir), data_dir)
+    compacted: Dict[str, int] = {}
+
+    for table in tables:
+        table_dir = store.store_dir / table
+        covered = store.coverage(table)
+        old_parts = _list_parts(table_dir)
+
+        rows: List[Dict[str, Any]] = []
+        n_files = 0
+        for path in _source_files(data_dir, table):
+            rel = path.relative_to(data_dir).as_posix()
+            size = path.stat().st_size
+            hit = covered.get(rel)
+            if hit is not None and hit[0] == size:
+                continue
+            records = read_json_records(table, path)
+            if records is None:
+                continue  # unreadable: stays a tail file, retried next run
+            rows.extend(_rows_for_file(table, rel, size, records))
+            n_files += 1
+
+        # Folding a lone part with nothing new would just rewrite it.
+        fold = (
+            rewrite or (max_parts is not None and len(old_parts) >= max_parts)
+        ) and (len(old_parts) > 1 or (old_parts and rows))
+        if fold:
+            fresh = {r["file"] for r in rows}
+            for part in old_parts:
+                key = _stat_key(part)
+                rows.extend(
+                    r
+                    for r in pq.read_table(part).to_pylist()
+                    if r["file"] not in fresh and covered[r["file"]][1] == key
+                )
+
+        compacted[table] = n_files
+        if not rows:
+            logger.info("news store %s: up to date (%d parts)", table, len(old_parts))
+            continue
+        path = _write_part(table_dir, rows)
+        if fold:
+            for old in old_parts:
+                old.unlink()
+        logger.info(
+            "news store %s: %d files, %d rows -> %s",
+            table,
+            n_files,
+            len(rows),
+            path.name,
+        )
+
+    return compacted
+
+
+__all__ = [
+    "TABLES",
+    "NewsStore",
+    "compact_news_store",
+    "default_store_dir",
+    "parse_published_at",
+    "read_json_records",
+]
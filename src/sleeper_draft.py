@@ -20,6 +20,7 @@ from typing import Any, Dict, List, Optional
 from src import sleeper_http
 from src.config import ROSTER_CONFIGS, SCORING_CONFIGS
 from src.draft_models import DraftState, PickEvent
+from src.http_client import fan_out
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -157,11 +158,17 @@ def load_draft_state(draft_id: str) -> DraftState:
 
     The single place in this module that performs network I/O. Fail-open: an
     unreachable Sleeper yields a DraftState with empty picks rather than raising.
+    The three reads are independent and run concurrently (one live-draft poll
+    costs one round trip, not three).
     """
-    draft = sleeper_http.get_draft(draft_id)
-    picks = sleeper_http.get_draft_picks(draft_id)
-    traded = sleeper_http.get_traded_picks(draft_id)
-    return state_from_sleeper(draft, picks, traded)
+    draft, picks, traded = fan_out(
+        [
+            lambda: sleeper_http.get_draft(draft_id),
+            lambda: sleeper_http.get_draft_picks(draft_id),
+            lambda: sleeper_http.get_traded_picks(draft_id),
+        ]
+    )
+    return state_from_sleeper(draft or {}, picks or [], traded or [])
 
 
 def _draft_recency_key(draft: Dict[str, Any]) -> int:
@@ -11,7 +11,8 @@ Why centralised?
 Sleeper's API is rate-limited, has occasional 5xx blips, and emits inconsistent
 JSON when overloaded.  Centralising the fetch lets us:
 
-* tune timeouts and retries in one place,
+* tune timeouts, retries, connection pooling and rate limits in one place
+  (the transport itself lives in :mod:`src.http_client`),
 * swap to a future MCP/SDK transport without grep-replacing every caller, and
 * enforce the project-wide D-06 fail-open contract: any error returns an empty
   ``{}`` (or ``[]``) rather than raising — callers detect the empty payload
@@ -41,11 +42,13 @@ Draft + user read helpers (typed, fail-open) — v8.0 Live Draft Co-Pilot
 
 from __future__ import annotations
 
-import json
 import logging
 from typing import Any
-from urllib.error import HTTPError, URLError
-from urllib.request import Request, urlopen
+
+try:
+    from http_client import get_client
+except ImportError:  # pragma: no cover
+    from src.http_client import get_client
 
 logger = logging.getLogger(__name__)
 
@@ -65,9 +68,12 @@ def fetch_sleeper_json(url: str, timeout: int = _DEFAULT_TIMEOUT_S) -> Any:
     function returns ``{}`` (an empty dict).  Callers should treat an empty
     return as "skip this run" rather than retrying.
 
-    Uses ``urllib.request`` (stdlib) deliberately so this helper has zero
-    third-party dependencies — important for environments where ``requests``
-    is intentionally not vendored (e.g. lambdas, minimal CI runners).
+    Transport is the shared :class:`~src.http_client.HttpClient` (stdlib
+    ``http.client``, zero third-party dependencies): keep-alive connections
+    are pooled across calls, requests to ``api.sleeper.app`` are spaced by
+    its per-host limit, connection errors and 5xx blips are retried with
+    backoff, and unchanged payloads are revalidated with ``If-None-Match`` /
+    ``If-Modified-Since`` instead of re-downloaded.
 
     Args:
         url: Fully-qualified Sleeper API URL.
@@ -80,36 +86,12 @@ def fetch_sleeper_json(url: str, timeout: int = _DEFAULT_TIMEOUT_S) -> Any:
     if not url:
         logger.warning("fetch_sleeper_json: empty URL provided")
         return {}
-
-    req = Request(url, headers={"User-Agent": _USER_AGENT})
-    try:
-        with urlopen(req, timeout=timeout) as resp:
-            raw = resp.read()
-    except HTTPError as exc:
-        logger.warning("Sleeper HTTP %d for %s — fail-open returning {}", exc.code, url)
-        return {}
-    except URLError as exc:
-        logger.warning(
-            "Sleeper network error for %s: %s — fail-open returning {}",
-            url,
-            exc.reason,
-        )
-        return {}
-    except (TimeoutError, OSError) as exc:
-        logger.warning(
-            "Sleeper transport error for %s: %s — fail-open returning {}",
-            url,
-            exc,
-        )
-        return {}
-
-    try:
-        return json.loads(raw)
-    except json.JSONDecodeError as exc:
-        logger.warning(
-            "Sleeper invalid JSON from %s: %s — fail-open returning {}", url, exc
-        )
-        return {}
+    return get_client().get_json(
+        url,
+        headers={"User-Agent": _USER_AGENT},
+        timeout=timeout,
+        label="Sleeper",
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -6,15 +6,20 @@ Computes team-level PBP metrics and tendencies for the Silver layer of the
 NFL data pipeline. Provides shared utility functions (play filtering, rolling
 window application) used by all team metric computation functions.
 
-Metric computation functions are added in Plans 02 and 03.
+Metric computation functions are added in Plans 02 and 03. Grouped play
+metrics are declared in ``team_metric_engine.TEAM_METRICS`` and evaluated
+in one pass per season; the public per-metric functions below are thin
+views of single registry tables.
 """
 
 import pandas as pd
 import numpy as np
-from typing import List, Optional
+from typing import Dict, List, Optional
 import logging
 
-from config import EWM_TARGET_COLS, TEAM_DIVISIONS
+from config import EWM_TARGET_COLS
+from rolling_kernel import LaggedGroupBlock
+from team_metric_engine import KEY_COLS, TeamWeekAggregator, table_columns
 
 logger = logging.getLogger(__name__)
 
@@ -64,6 +69,23 @@ def _filter_valid_plays(pbp_df: pd.DataFrame) -> pd.DataFrame:
     return df.reset_index(drop=True)
 
 
+def _metric_table(
+    plays: pd.DataFrame, table: str, filtered: bool = True
+) -> pd.DataFrame:
+    """Evaluate one registered metric table on a play frame.
+
+    Args:
+        plays: Valid plays (``filtered=True``) or raw PBP (``filtered=False``).
+        table: Table name in ``team_metric_engine.METRICS_BY_TABLE``.
+        filtered: Whether ``plays`` is already ``_filter_valid_plays`` output.
+
+    Returns:
+        DataFrame with team, season, week and the table's metric columns
+        (no rows when the table has no qualifying plays).
+    """
+    return TeamWeekAggregator(plays, filtered=filtered).frame([table], keep_empty=[table])
+
+
 def apply_team_rolling(
     df: pd.DataFrame,
     stat_cols: List[str],
@@ -108,40 +130,27 @@ def apply_team_rolling(
         logger.warning("No stat_cols found in DataFrame; returning unchanged")
         return df
 
+    block = LaggedGroupBlock(df, ["team", "season"], available_cols)
+
     # Rolling averages per window
     for window in windows:
-        roll_cols = {}
-        for col in available_cols:
-            roll_cols[f"{col}_roll{window}"] = (
-                df.groupby(["team", "season"])[col]
-                .transform(
-                    lambda s: s.shift(1).rolling(window, min_periods=1).mean()
-                )
-            )
-        df = df.assign(**roll_cols)
+        df = df.assign(
+            **block.columns(block.rolling_mean(window), f"{{col}}_roll{window}")
+        )
 
     # Season-to-date expanding average
-    for col in available_cols:
-        df[f"{col}_std"] = (
-            df.groupby(["team", "season"])[col]
-            .transform(lambda s: s.shift(1).expanding().mean())
-        )
+    df = df.assign(**block.columns(block.expanding_mean(), "{col}_std"))
 
     # Exponentially weighted moving average (optional)
     if ewm_cols:
         available_ewm = [c for c in ewm_cols if c in df.columns]
-        ewm_data = {}
-        for col in available_ewm:
-            ewm_data[f"{col}_ewm{ewm_halflife}"] = (
-                df.groupby(["team", "season"])[col]
-                .transform(
-                    lambda s: s.shift(1).ewm(
-                        halflife=ewm_halflife, min_periods=1
-                    ).mean()
+        if available_ewm:
+            ewm_block = LaggedGroupBlock(df, ["team", "season"], available_ewm)
+            df = df.assign(
+                **ewm_block.columns(
+                    ewm_block.ewm_mean(ewm_halflife), f"{{col}}_ewm{ewm_halflife}"
                 )
             )
-        if ewm_data:
-            df = df.assign(**ewm_data)
 
     logger.info(
         "Team rolling averages computed (%s) for %d rows, %d stat columns",
@@ -526,44 +535,7 @@ def compute_team_epa(valid_plays: pd.DataFrame) -> pd.DataFrame:
         DataFrame with columns: team, season, week, off_epa_per_play,
         off_pass_epa, off_rush_epa, def_epa_per_play.
     """
-    # Offense EPA: overall + pass/rush splits
-    off_all = (
-        valid_plays.groupby(["posteam", "season", "week"])["epa"]
-        .mean()
-        .reset_index()
-        .rename(columns={"posteam": "team", "epa": "off_epa_per_play"})
-    )
-
-    off_pass = (
-        valid_plays[valid_plays["play_type"] == "pass"]
-        .groupby(["posteam", "season", "week"])["epa"]
-        .mean()
-        .reset_index()
-        .rename(columns={"posteam": "team", "epa": "off_pass_epa"})
-    )
-
-    off_rush = (
-        valid_plays[valid_plays["play_type"] == "run"]
-        .groupby(["posteam", "season", "week"])["epa"]
-        .mean()
-        .reset_index()
-        .rename(columns={"posteam": "team", "epa": "off_rush_epa"})
-    )
-
-    # Defense EPA
-    def_all = (
-        valid_plays.groupby(["defteam", "season", "week"])["epa"]
-        .mean()
-        .reset_index()
-        .rename(columns={"defteam": "team", "epa": "def_epa_per_play"})
-    )
-
-    # Merge all offense components
-    off = off_all.merge(off_pass, on=["team", "season", "week"], how="left")
-    off = off.merge(off_rush, on=["team", "season", "week"], how="left")
-
-    # Merge offense + defense
-    result = off.merge(def_all, on=["team", "season", "week"], how="outer")
+    result = _metric_table(valid_plays, "epa")
 
     logger.info("Team EPA computed for %d team-weeks", len(result))
     return result
@@ -580,21 +552,7 @@ def compute_team_success_rate(valid_plays: pd.DataFrame) -> pd.DataFrame:
     Returns:
         DataFrame with columns: team, season, week, off_success_rate, def_success_rate.
     """
-    off = (
-        valid_plays.groupby(["posteam", "season", "week"])["success"]
-        .mean()
-        .reset_index()
-        .rename(columns={"posteam": "team", "success": "off_success_rate"})
-    )
-
-    defense = (
-        valid_plays.groupby(["defteam", "season", "week"])["success"]
-        .mean()
-        .reset_index()
-        .rename(columns={"defteam": "team", "success": "def_success_rate"})
-    )
-
-    result = off.merge(defense, on=["team", "season", "week"], how="outer")
+    result = _metric_table(valid_plays, "success_rate")
 
     logger.info("Team success rate computed for %d team-weeks", len(result))
     return result
@@ -612,15 +570,7 @@ def compute_team_cpoe(valid_plays: pd.DataFrame) -> pd.DataFrame:
     Returns:
         DataFrame with columns: team, season, week, off_cpoe.
     """
-    # Filter to rows with valid CPOE (non-null)
-    cpoe_plays = valid_plays.dropna(subset=["cpoe"])
-
-    result = (
-        cpoe_plays.groupby(["posteam", "season", "week"])["cpoe"]
-        .mean()
-        .reset_index()
-        .rename(columns={"posteam": "team", "cpoe": "off_cpoe"})
-    )
+    result = _metric_table(valid_plays, "cpoe")
 
     logger.info("Team CPOE computed for %d team-weeks", len(result))
     return result
@@ -640,41 +590,7 @@ def compute_red_zone_metrics(valid_plays: pd.DataFrame) -> pd.DataFrame:
         off_rz_success_rate, off_rz_pass_rate, off_rz_td_rate,
         def_rz_epa, def_rz_success_rate, def_rz_pass_rate, def_rz_td_rate.
     """
-    rz = valid_plays[valid_plays["yardline_100"] <= 20].copy()
-
-    if rz.empty:
-        logger.info("No red zone plays found")
-        return pd.DataFrame(columns=[
-            "team", "season", "week",
-            "off_rz_epa", "off_rz_success_rate", "off_rz_pass_rate", "off_rz_td_rate",
-            "def_rz_epa", "def_rz_success_rate", "def_rz_pass_rate", "def_rz_td_rate",
-        ])
-
-    def _agg_rz(df: pd.DataFrame, team_col: str, prefix: str) -> pd.DataFrame:
-        """Aggregate red zone metrics for a given team column."""
-        agg = df.groupby([team_col, "season", "week"]).agg(
-            rz_epa=("epa", "mean"),
-            rz_success_rate=("success", "mean"),
-            rz_pass_rate=("pass_attempt", "mean"),
-            rz_tds=("touchdown", "sum"),
-            rz_drives=("drive", "nunique"),
-        ).reset_index()
-
-        agg[f"{prefix}_rz_td_rate"] = agg["rz_tds"] / agg["rz_drives"]
-        agg = agg.rename(columns={
-            team_col: "team",
-            "rz_epa": f"{prefix}_rz_epa",
-            "rz_success_rate": f"{prefix}_rz_success_rate",
-            "rz_pass_rate": f"{prefix}_rz_pass_rate",
-        })
-        # Drop intermediate columns
-        agg = agg.drop(columns=["rz_tds", "rz_drives"])
-        return agg
-
-    off_rz = _agg_rz(rz, "posteam", "off")
-    def_rz = _agg_rz(rz, "defteam", "def")
-
-    result = off_rz.merge(def_rz, on=["team", "season", "week"], how="outer")
+    result = _metric_table(valid_plays, "red_zone")
 
     logger.info("Red zone metrics computed for %d team-weeks", len(result))
     return result
@@ -685,9 +601,9 @@ def compute_pbp_metrics(pbp_df: pd.DataFrame) -> pd.DataFrame:
 
     Pipeline:
         1. Filter valid plays
-        2. Compute EPA, success rate, CPOE, and red zone metrics
-        3. Merge all results
-        4. Apply rolling windows to all stat columns
+        2. Compute EPA, success rate, CPOE, and red zone metrics in one
+           grouped pass (see ``team_metric_engine``)
+        3. Apply rolling windows to all stat columns
 
     Args:
         pbp_df: Raw play-by-play DataFrame.
@@ -695,23 +611,20 @@ def compute_pbp_metrics(pbp_df: pd.DataFrame) -> pd.DataFrame:
     Returns:
         DataFrame with all PBP metrics plus rolling (_roll3, _roll6, _std) columns.
     """
-    valid = _filter_valid_plays(pbp_df)
+    return _pbp_metrics_from(TeamWeekAggregator(pbp_df))
 
-    if valid.empty:
+
+def _pbp_metrics_from(engine: TeamWeekAggregator) -> pd.DataFrame:
+    """compute_pbp_metrics on a prepared aggregator."""
+    if not engine.has_valid_plays():
         logger.warning("No valid plays after filtering; returning empty DataFrame")
         return pd.DataFrame()
 
-    # Compute individual metrics
-    epa_df = compute_team_epa(valid)
-    success_df = compute_team_success_rate(valid)
-    cpoe_df = compute_team_cpoe(valid)
-    rz_df = compute_red_zone_metrics(valid)
-
-    # Merge all on (team, season, week)
-    merged = epa_df.merge(success_df, on=["team", "season", "week"], how="outer")
-    merged = merged.merge(cpoe_df, on=["team", "season", "week"], how="outer")
-    if not rz_df.empty:
-        merged = merged.merge(rz_df, on=["team", "season", "week"], how="outer")
+    # Red zone columns only appear when the season has red zone plays
+    merged = engine.frame(
+        ["epa", "success_rate", "cpoe", "red_zone"],
+        keep_empty=["epa", "success_rate", "cpoe"],
+    )
 
     # Identify stat columns (everything except team/season/week)
     key_cols = {"team", "season", "week"}
@@ -744,14 +657,9 @@ def compute_pace(valid_plays: pd.DataFrame) -> pd.DataFrame:
     Returns:
         DataFrame with columns: team, season, week, pace.
     """
-    result = (
-        valid_plays.groupby(["posteam", "season", "week"])
-        .size()
-        .reset_index(name="pace")
-        .rename(columns={"posteam": "team"})
-    )
+    result = _metric_table(valid_plays, "pace")
     logger.info("Pace computed for %d team-weeks", len(result))
-    return result[["team", "season", "week", "pace"]]
+    return result
 
 
 def compute_proe(valid_plays: pd.DataFrame) -> pd.DataFrame:
@@ -767,18 +675,9 @@ def compute_proe(valid_plays: pd.DataFrame) -> pd.DataFrame:
     Returns:
         DataFrame with columns: team, season, week, proe.
     """
-    agg = valid_plays.groupby(["posteam", "season", "week"]).agg(
-        total_plays=("pass_attempt", "count"),
-        pass_plays=("pass_attempt", "sum"),
-        mean_xpass=("xpass", "mean"),  # NaN excluded by pandas mean
-    ).reset_index()
-
-    agg["actual_pass_rate"] = agg["pass_plays"] / agg["total_plays"]
-    agg["proe"] = agg["actual_pass_rate"] - agg["mean_xpass"]
-
-    result = agg.rename(columns={"posteam": "team"})
+    result = _metric_table(valid_plays, "proe")
     logger.info("PROE computed for %d team-weeks", len(result))
-    return result[["team", "season", "week", "proe"]]
+    return result
 
 
 def compute_fourth_down_aggressiveness(pbp_df: pd.DataFrame) -> pd.DataFrame:
@@ -794,49 +693,9 @@ def compute_fourth_down_aggressiveness(pbp_df: pd.DataFrame) -> pd.DataFrame:
         DataFrame with columns: team, season, week, fourth_down_go_rate,
         fourth_down_success_rate.
     """
-    df = pbp_df.copy()
-
-    # Apply basic filters
-    if "season_type" in df.columns:
-        df = df[df["season_type"] == "REG"]
-    if "week" in df.columns:
-        df = df[df["week"] <= 18]
-
-    # 4th down plays only
-    df = df[df["down"] == 4]
-
-    # Only meaningful 4th down decisions
-    df = df[df["play_type"].isin(["pass", "run", "punt", "field_goal"])]
-
-    if df.empty:
-        logger.info("No 4th down plays found")
-        return pd.DataFrame(columns=[
-            "team", "season", "week", "fourth_down_go_rate", "fourth_down_success_rate",
-        ])
-
-    # go_attempt: pass or run on 4th down
-    df["go_attempt"] = df["play_type"].isin(["pass", "run"]).astype(int)
-
-    agg = df.groupby(["posteam", "season", "week"]).agg(
-        go_attempts=("go_attempt", "sum"),
-        total_decisions=("go_attempt", "count"),
-        converted=("fourth_down_converted", "sum"),
-        failed=("fourth_down_failed", "sum"),
-    ).reset_index()
-
-    agg["fourth_down_go_rate"] = agg["go_attempts"] / agg["total_decisions"]
-
-    # Success rate: only on go attempts; NaN when zero go attempts
-    total_go_outcomes = agg["converted"] + agg["failed"]
-    agg["fourth_down_success_rate"] = np.where(
-        total_go_outcomes > 0,
-        agg["converted"] / total_go_outcomes,
-        np.nan,
-    )
-
-    result = agg.rename(columns={"posteam": "team"})
+    result = _metric_table(pbp_df, "fourth_down", filtered=False)
     logger.info("4th down aggressiveness computed for %d team-weeks", len(result))
-    return result[["team", "season", "week", "fourth_down_go_rate", "fourth_down_success_rate"]]
+    return result
 
 
 def compute_early_down_run_rate(valid_plays: pd.DataFrame) -> pd.DataFrame:
@@ -848,22 +707,9 @@ def compute_early_down_run_rate(valid_plays: pd.DataFrame) -> pd.DataFrame:
     Returns:
         DataFrame with columns: team, season, week, early_down_run_rate.
     """
-    early = valid_plays[valid_plays["down"] <= 2].copy()
-
-    if early.empty:
-        logger.info("No early-down plays found")
-        return pd.DataFrame(columns=["team", "season", "week", "early_down_run_rate"])
-
-    agg = early.groupby(["posteam", "season", "week"]).agg(
-        rush_attempts=("rush_attempt", "sum"),
-        total_plays=("rush_attempt", "count"),
-    ).reset_index()
-
-    agg["early_down_run_rate"] = agg["rush_attempts"] / agg["total_plays"]
-
-    result = agg.rename(columns={"posteam": "team"})
+    result = _metric_table(valid_plays, "early_down")
     logger.info("Early-down run rate computed for %d team-weeks", len(result))
-    return result[["team", "season", "week", "early_down_run_rate"]]
+    return result
 
 
 def compute_tendency_metrics(pbp_df: pd.DataFrame) -> pd.DataFrame:
@@ -871,10 +717,10 @@ def compute_tendency_metrics(pbp_df: pd.DataFrame) -> pd.DataFrame:
 
     Pipeline:
         1. Filter valid plays (for pace, PROE, early-down run rate)
-        2. Compute pace, PROE, early-down run rate from valid plays
-        3. Compute 4th down aggressiveness from raw PBP (needs punt/FG)
-        4. Merge all on (team, season, week)
-        5. Apply rolling windows to all stat columns
+        2. Compute pace, PROE, early-down run rate from valid plays and 4th
+           down aggressiveness from all REG plays (needs punt/FG) in one
+           grouped pass
+        3. Apply rolling windows to all stat columns
 
     Args:
         pbp_df: Raw play-by-play DataFrame.
@@ -882,23 +728,19 @@ def compute_tendency_metrics(pbp_df: pd.DataFrame) -> pd.DataFrame:
     Returns:
         DataFrame with all tendency metrics plus rolling (_roll3, _roll6, _std) columns.
     """
-    valid = _filter_valid_plays(pbp_df)
+    return _tendency_metrics_from(TeamWeekAggregator(pbp_df))
 
-    if valid.empty:
+
+def _tendency_metrics_from(engine: TeamWeekAggregator) -> pd.DataFrame:
+    """compute_tendency_metrics on a prepared aggregator."""
+    if not engine.has_valid_plays():
         logger.warning("No valid plays after filtering; returning empty DataFrame")
         return pd.DataFrame()
 
-    # Compute individual metrics
-    pace_df = compute_pace(valid)
-    proe_df = compute_proe(valid)
-    early_df = compute_early_down_run_rate(valid)
-    fourth_df = compute_fourth_down_aggressiveness(pbp_df)  # Raw PBP for punt/FG
-
-    # Merge all on (team, season, week)
-    merged = pace_df.merge(proe_df, on=["team", "season", "week"], how="outer")
-    merged = merged.merge(early_df, on=["team", "season", "week"], how="outer")
-    if not fourth_df.empty:
-        merged = merged.merge(fourth_df, on=["team", "season", "week"], how="outer")
+    merged = engine.frame(
+        ["pace", "proe", "early_down", "fourth_down"],
+        keep_empty=["pace", "proe", "early_down"],
+    )
 
     # Identify stat columns (everything except team/season/week)
     key_cols = {"team", "season", "week"}
@@ -944,6 +786,15 @@ def _build_opponent_schedule(valid_plays: pd.DataFrame) -> pd.DataFrame:
     return result
 
 
+def _nanmean(values: np.ndarray) -> float:
+    """Mean of the non-NaN values (NaN when none), summed like Series.mean()."""
+    missing = np.isnan(values)
+    count = (~missing).sum()
+    if count == 0:
+        return np.nan
+    return np.where(missing, 0.0, values).sum() / count
+
+
 def compute_sos_metrics(pbp_df: pd.DataFrame) -> pd.DataFrame:
     """Compute opponent-adjusted EPA and schedule difficulty rankings.
 
@@ -966,86 +817,76 @@ def compute_sos_metrics(pbp_df: pd.DataFrame) -> pd.DataFrame:
         def_sos_score, adj_off_epa, adj_def_epa, off_sos_rank, def_sos_rank
         plus rolling (_roll3, _roll6, _std) columns.
     """
-    valid = _filter_valid_plays(pbp_df)
+    return _sos_metrics_from(TeamWeekAggregator(pbp_df))
+
 
-    if valid.empty:
+def _sos_metrics_from(engine: TeamWeekAggregator) -> pd.DataFrame:
+    """compute_sos_metrics on a prepared aggregator."""
+    if not engine.has_valid_plays():
         logger.warning("No valid plays after filtering; returning empty DataFrame")
         return pd.DataFrame()
+    valid = engine.valid_plays
 
     # Step 1: Get raw team EPA per week
-    team_epa = compute_team_epa(valid)
+    team_epa = engine.frame(["epa"], keep_empty=["epa"])
 
     # Step 2: Build opponent schedule from PBP
     schedule = _build_opponent_schedule(valid)
 
-    # Step 3: For each team-week, compute lagged SOS
+    # Step 3: For each team-week, compute lagged SOS. Each schedule row gets
+    # the opponent's EPA from the week it was faced (one keyed lookup), so
+    # the per-week loop only slices arrays.
+    epa_cols = ["off_epa_per_play", "def_epa_per_play"]
+    raw_epa = {
+        key: (off, dfn)
+        for key, off, dfn in zip(
+            zip(team_epa["team"], team_epa["season"], team_epa["week"]),
+            team_epa["off_epa_per_play"],
+            team_epa["def_epa_per_play"],
+        )
+    }
+    faced = pd.MultiIndex.from_arrays(
+        [schedule["opponent"], schedule["season"], schedule["week"]]
+    )
+    epa_by_key = team_epa.set_index(["team", "season", "week"])[epa_cols]
+    opp_epa = epa_by_key.reindex(faced)
+    schedule = schedule.assign(
+        _found=faced.isin(epa_by_key.index),
+        _opp_off=opp_epa["off_epa_per_play"].to_numpy(),
+        _opp_def=opp_epa["def_epa_per_play"].to_numpy(),
+    )
+
     rows = []
     for (team, season), group in schedule.groupby(["team", "season"]):
-        weeks = sorted(group["week"].unique())
-        for week in weeks:
+        group_weeks = group["week"].to_numpy()
+        found = group["_found"].to_numpy()
+        opp_off = group["_opp_off"].to_numpy()
+        opp_def = group["_opp_def"].to_numpy()
+        for week in sorted(group["week"].unique()):
             # Get raw EPA for this team-week
-            raw = team_epa[
-                (team_epa["team"] == team)
-                & (team_epa["season"] == season)
-                & (team_epa["week"] == week)
-            ]
-            if raw.empty:
+            raw = raw_epa.get((team, season, week))
+            if raw is None:
                 continue  # Bye week — skip
-
-            raw_off = raw["off_epa_per_play"].iloc[0]
-            raw_def = raw["def_epa_per_play"].iloc[0]
-
-            # Opponents faced in prior weeks
-            prior_opps = group[group["week"] < week]
-
-            if prior_opps.empty:
-                # Week 1: no opponents faced yet
-                rows.append(
-                    {
-                        "team": team,
-                        "season": season,
-                        "week": week,
-                        "off_sos_score": np.nan,
-                        "def_sos_score": np.nan,
-                        "adj_off_epa": raw_off,
-                        "adj_def_epa": raw_def,
-                    }
-                )
-            else:
-                # Get each opponent's EPA from the specific week they were faced
-                opp_epa_rows = []
-                for _, opp_row in prior_opps.iterrows():
-                    opp_team = opp_row["opponent"]
-                    opp_week = opp_row["week"]
-                    opp_data = team_epa[
-                        (team_epa["team"] == opp_team)
-                        & (team_epa["season"] == season)
-                        & (team_epa["week"] == opp_week)
-                    ]
-                    if not opp_data.empty:
-                        opp_epa_rows.append(opp_data.iloc[0])
-
-                if opp_epa_rows:
-                    opp_epa_df = pd.DataFrame(opp_epa_rows)
-                    # off_sos = opponents' DEF EPA (how well opponents defended)
-                    off_sos = opp_epa_df["def_epa_per_play"].mean()
-                    # def_sos = opponents' OFF EPA (how well opponents attacked)
-                    def_sos = opp_epa_df["off_epa_per_play"].mean()
-                else:
-                    off_sos = np.nan
-                    def_sos = np.nan
-
-                rows.append(
-                    {
-                        "team": team,
-                        "season": season,
-                        "week": week,
-                        "off_sos_score": off_sos,
-                        "def_sos_score": def_sos,
-                        "adj_off_epa": raw_off - off_sos if not np.isnan(off_sos) else raw_off,
-                        "adj_def_epa": raw_def - def_sos if not np.isnan(def_sos) else raw_def,
-                    }
-                )
+            raw_off, raw_def = raw
+
+            # Opponents faced in prior weeks (week 1: none yet)
+            prior = (group_weeks < week) & found
+            # off_sos = opponents' DEF EPA (how well opponents defended)
+            # def_sos = opponents' OFF EPA (how well opponents attacked)
+            off_sos = _nanmean(opp_def[prior])
+            def_sos = _nanmean(opp_off[prior])
+
+            rows.append(
+                {
+                    "team": team,
+                    "season": season,
+                    "week": week,
+                    "off_sos_score": off_sos,
+                    "def_sos_score": def_sos,
+                    "adj_off_epa": raw_off - off_sos if not np.isnan(off_sos) else raw_off,
+                    "adj_def_epa": raw_def - def_sos if not np.isnan(def_sos) else raw_def,
+                }
+            )
 
     result = pd.DataFrame(rows)
 
@@ -1107,11 +948,15 @@ def compute_situational_splits(pbp_df: pd.DataFrame) -> pd.DataFrame:
     Returns:
         Wide-format DataFrame with situational split columns plus rolling variants.
     """
-    valid = _filter_valid_plays(pbp_df)
+    return _situational_splits_from(TeamWeekAggregator(pbp_df))
+
 
-    if valid.empty:
+def _situational_splits_from(engine: TeamWeekAggregator) -> pd.DataFrame:
+    """compute_situational_splits on a prepared aggregator."""
+    if not engine.has_valid_plays():
         logger.warning("No valid plays after filtering; returning empty DataFrame")
         return pd.DataFrame()
+    valid = engine.valid_plays
 
     # Ensure required columns exist
     for col in ["home_team", "score_differential"]:
@@ -1119,103 +964,26 @@ def compute_situational_splits(pbp_df: pd.DataFrame) -> pd.DataFrame:
             logger.warning("Missing column %s; returning empty DataFrame", col)
             return pd.DataFrame()
 
-    # --- Tag each play ---
-    valid = valid.copy()
-    valid["is_home_off"] = valid["posteam"] == valid["home_team"]
-    valid["is_home_def"] = valid["defteam"] == valid["home_team"]
-
-    # Divisional tagging (handle missing teams gracefully)
-    valid["posteam_div"] = valid["posteam"].map(TEAM_DIVISIONS)
-    valid["defteam_div"] = valid["defteam"].map(TEAM_DIVISIONS)
-    valid["is_divisional"] = (
-        valid["posteam_div"].notna()
-        & valid["defteam_div"].notna()
-        & (valid["posteam_div"] == valid["defteam_div"])
-    )
-
-    # Game script tagging
-    valid["is_leading"] = valid["score_differential"] >= 7
-    valid["is_trailing"] = valid["score_differential"] <= -7
-
-    # --- Helper to compute mean EPA for a filtered subset ---
-    def _mean_epa(df: pd.DataFrame, team_col: str, mask: pd.Series) -> pd.DataFrame:
-        """Compute mean EPA grouped by (team_col, season, week) for rows where mask is True."""
-        subset = df[mask]
-        if subset.empty:
-            return pd.DataFrame(columns=[team_col, "season", "week", "epa"])
-        return (
-            subset.groupby([team_col, "season", "week"])["epa"]
-            .mean()
-            .reset_index()
-        )
-
-    # --- Compute all 12 splits ---
-    # Home/away offense
-    home_off = _mean_epa(valid, "posteam", valid["is_home_off"])
-    home_off = home_off.rename(columns={"posteam": "team", "epa": "home_off_epa"})
-
-    away_off = _mean_epa(valid, "posteam", ~valid["is_home_off"])
-    away_off = away_off.rename(columns={"posteam": "team", "epa": "away_off_epa"})
-
-    # Home/away defense
-    home_def = _mean_epa(valid, "defteam", valid["is_home_def"])
-    home_def = home_def.rename(columns={"defteam": "team", "epa": "home_def_epa"})
-
-    away_def = _mean_epa(valid, "defteam", ~valid["is_home_def"])
-    away_def = away_def.rename(columns={"defteam": "team", "epa": "away_def_epa"})
-
-    # Divisional offense/defense
-    div_off = _mean_epa(valid, "posteam", valid["is_divisional"])
-    div_off = div_off.rename(columns={"posteam": "team", "epa": "div_off_epa"})
-
-    nondiv_off = _mean_epa(valid, "posteam", ~valid["is_divisional"])
-    nondiv_off = nondiv_off.rename(columns={"posteam": "team", "epa": "nondiv_off_epa"})
-
-    div_def = _mean_epa(valid, "defteam", valid["is_divisional"])
-    div_def = div_def.rename(columns={"defteam": "team", "epa": "div_def_epa"})
-
-    nondiv_def = _mean_epa(valid, "defteam", ~valid["is_divisional"])
-    nondiv_def = nondiv_def.rename(columns={"defteam": "team", "epa": "nondiv_def_epa"})
-
-    # Game script offense (exclude neutral)
-    leading_off = _mean_epa(valid, "posteam", valid["is_leading"])
-    leading_off = leading_off.rename(columns={"posteam": "team", "epa": "leading_off_epa"})
-
-    trailing_off = _mean_epa(valid, "posteam", valid["is_trailing"])
-    trailing_off = trailing_off.rename(columns={"posteam": "team", "epa": "trailing_off_epa"})
+    # --- All 12 splits in one grouped pass ---
+    # Home/away by posteam/defteam == home_team, divisional via
+    # TEAM_DIVISIONS, game script by score_differential >= 7 / <= -7.
+    splits = engine.frame(["situational"], keep_empty=["situational"])
 
-    # Game script defense
-    leading_def = _mean_epa(valid, "defteam", valid["is_leading"])
-    leading_def = leading_def.rename(columns={"defteam": "team", "epa": "leading_def_epa"})
-
-    trailing_def = _mean_epa(valid, "defteam", valid["is_trailing"])
-    trailing_def = trailing_def.rename(columns={"defteam": "team", "epa": "trailing_def_epa"})
-
-    # --- Merge all splits into wide format ---
-    # Start with all unique (team, season, week) combinations from offense + defense
+    # --- Wide format over every (team, season, week) seen on offense or defense ---
     off_keys = valid[["posteam", "season", "week"]].rename(columns={"posteam": "team"})
     def_keys = valid[["defteam", "season", "week"]].rename(columns={"defteam": "team"})
     all_keys = pd.concat([off_keys, def_keys]).drop_duplicates().reset_index(drop=True)
 
-    result = all_keys
-    for split_df in [
-        home_off, away_off, home_def, away_def,
-        div_off, nondiv_off, div_def, nondiv_def,
-        leading_off, trailing_off, leading_def, trailing_def,
-    ]:
-        if not split_df.empty:
-            result = result.merge(split_df, on=["team", "season", "week"], how="left")
+    result = all_keys.merge(splits, on=KEY_COLS, how="left")
 
     # --- Apply rolling windows ---
-    split_cols = [
-        "home_off_epa", "away_off_epa", "home_def_epa", "away_def_epa",
-        "div_off_epa", "nondiv_off_epa", "div_def_epa", "nondiv_def_epa",
-        "leading_off_epa", "trailing_off_epa", "leading_def_epa", "trailing_def_epa",
+    split_cols = table_columns("situational")
+    # Splits with no qualifying plays trail the populated ones
+    result = result[
+        KEY_COLS
+        + [c for c in split_cols if result[c].notna().any()]
+        + [c for c in split_cols if not result[c].notna().any()]
     ]
-    # Ensure all split columns exist (some might be missing if all empty)
-    for col in split_cols:
-        if col not in result.columns:
-            result[col] = np.nan
 
     result = apply_team_rolling(result, split_cols)
 
@@ -1283,52 +1051,7 @@ def compute_penalty_metrics(pbp_df: pd.DataFrame) -> pd.DataFrame:
         DataFrame with columns: team, season, week, off_penalties,
         off_penalty_yards, def_penalties, def_penalty_yards.
     """
-    df = pbp_df.copy()
-
-    # Apply basic filters
-    if "season_type" in df.columns:
-        df = df[df["season_type"] == "REG"]
-    if "week" in df.columns:
-        df = df[df["week"] <= 18]
-
-    # Filter to penalty plays
-    if "penalty" not in df.columns:
-        logger.warning("No penalty column found; returning empty DataFrame")
-        return pd.DataFrame(columns=[
-            "team", "season", "week",
-            "off_penalties", "off_penalty_yards", "def_penalties", "def_penalty_yards",
-        ])
-
-    pen = df[df["penalty"] == 1].copy()
-    pen = pen.dropna(subset=["penalty_team"])
-
-    if pen.empty:
-        logger.info("No penalty plays found")
-        return pd.DataFrame(columns=[
-            "team", "season", "week",
-            "off_penalties", "off_penalty_yards", "def_penalties", "def_penalty_yards",
-        ])
-
-    # Offensive penalties (penalty_team == posteam)
-    off_pen = pen[pen["penalty_team"] == pen["posteam"]]
-    off_agg = (
-        off_pen.groupby(["posteam", "season", "week"])
-        .agg(off_penalties=("penalty", "sum"), off_penalty_yards=("penalty_yards", "sum"))
-        .reset_index()
-        .rename(columns={"posteam": "team"})
-    )
-
-    # Defensive penalties (penalty_team == defteam)
-    def_pen = pen[pen["penalty_team"] == pen["defteam"]]
-    def_agg = (
-        def_pen.groupby(["defteam", "season", "week"])
-        .agg(def_penalties=("penalty", "sum"), def_penalty_yards=("penalty_yards", "sum"))
-        .reset_index()
-        .rename(columns={"defteam": "team"})
-    )
-
-    result = off_agg.merge(def_agg, on=["team", "season", "week"], how="outer")
-    result = result.fillna({"off_penalties": 0, "off_penalty_yards": 0, "def_penalties": 0, "def_penalty_yards": 0})
+    result = _metric_table(pbp_df, "penalties", filtered=False)
 
     logger.info("Penalty metrics computed for %d team-weeks", len(result))
     return result
@@ -1348,57 +1071,7 @@ def compute_opp_drawn_penalties(pbp_df: pd.DataFrame) -> pd.DataFrame:
         DataFrame with columns: team, season, week, off_penalties_drawn,
         off_penalty_yards_drawn, def_penalties_drawn, def_penalty_yards_drawn.
     """
-    df = pbp_df.copy()
-
-    if "season_type" in df.columns:
-        df = df[df["season_type"] == "REG"]
-    if "week" in df.columns:
-        df = df[df["week"] <= 18]
-
-    if "penalty" not in df.columns:
-        logger.warning("No penalty column found; returning empty DataFrame")
-        return pd.DataFrame(columns=[
-            "team", "season", "week",
-            "off_penalties_drawn", "off_penalty_yards_drawn",
-            "def_penalties_drawn", "def_penalty_yards_drawn",
-        ])
-
-    pen = df[df["penalty"] == 1].copy()
-    pen = pen.dropna(subset=["penalty_team"])
-
-    if pen.empty:
-        logger.info("No penalty plays found")
-        return pd.DataFrame(columns=[
-            "team", "season", "week",
-            "off_penalties_drawn", "off_penalty_yards_drawn",
-            "def_penalties_drawn", "def_penalty_yards_drawn",
-        ])
-
-    # Offensive penalties drawn = defensive penalties (penalty_team == defteam)
-    # grouped by posteam (the offense benefits)
-    def_committed = pen[pen["penalty_team"] == pen["defteam"]]
-    off_drawn = (
-        def_committed.groupby(["posteam", "season", "week"])
-        .agg(off_penalties_drawn=("penalty", "sum"), off_penalty_yards_drawn=("penalty_yards", "sum"))
-        .reset_index()
-        .rename(columns={"posteam": "team"})
-    )
-
-    # Defensive penalties drawn = offensive penalties (penalty_team == posteam)
-    # grouped by defteam (the defense benefits)
-    off_committed = pen[pen["penalty_team"] == pen["posteam"]]
-    def_drawn = (
-        off_committed.groupby(["defteam", "season", "week"])
-        .agg(def_penalties_drawn=("penalty", "sum"), def_penalty_yards_drawn=("penalty_yards", "sum"))
-        .reset_index()
-        .rename(columns={"defteam": "team"})
-    )
-
-    result = off_drawn.merge(def_drawn, on=["team", "season", "week"], how="outer")
-    result = result.fillna({
-        "off_penalties_drawn": 0, "off_penalty_yards_drawn": 0,
-        "def_penalties_drawn": 0, "def_penalty_yards_drawn": 0,
-    })
+    result = _metric_table(pbp_df, "opp_penalties", filtered=False)
 
     logger.info("Opponent-drawn penalty metrics computed for %d team-weeks", len(result))
     return result
@@ -1555,30 +1228,7 @@ def compute_red_zone_trips(valid_plays: pd.DataFrame) -> pd.DataFrame:
     Returns:
         DataFrame with columns: team, season, week, off_rz_trips, def_rz_trips.
     """
-    rz = valid_plays[valid_plays["yardline_100"] <= 20].copy()
-
-    if rz.empty:
-        logger.info("No red zone plays found")
-        return pd.DataFrame(columns=["team", "season", "week", "off_rz_trips", "def_rz_trips"])
-
-    # Offensive RZ trips
-    off_trips = (
-        rz.groupby(["posteam", "season", "week"])["drive"]
-        .nunique()
-        .reset_index()
-        .rename(columns={"posteam": "team", "drive": "off_rz_trips"})
-    )
-
-    # Defensive RZ trips
-    def_trips = (
-        rz.groupby(["defteam", "season", "week"])["drive"]
-        .nunique()
-        .reset_index()
-        .rename(columns={"defteam": "team", "drive": "def_rz_trips"})
-    )
-
-    result = off_trips.merge(def_trips, on=["team", "season", "week"], how="outer")
-    result = result.fillna({"off_rz_trips": 0, "def_rz_trips": 0})
+    result = _metric_table(valid_plays, "rz_trips")
 
     logger.info("Red zone trips computed for %d team-weeks", len(result))
     return result
@@ -1597,33 +1247,7 @@ def compute_third_down_rates(valid_plays: pd.DataFrame) -> pd.DataFrame:
         DataFrame with columns: team, season, week, off_third_down_rate,
         def_third_down_rate.
     """
-    third = valid_plays[valid_plays["down"] == 3].copy()
-
-    if third.empty:
-        logger.info("No 3rd down plays found")
-        return pd.DataFrame(columns=["team", "season", "week", "off_third_down_rate", "def_third_down_rate"])
-
-    # Offensive 3rd down rate
-    off_agg = (
-        third.groupby(["posteam", "season", "week"])
-        .agg(converted=("third_down_converted", "sum"), failed=("third_down_failed", "sum"))
-        .reset_index()
-    )
-    total = off_agg["converted"] + off_agg["failed"]
-    off_agg["off_third_down_rate"] = np.where(total > 0, off_agg["converted"] / total, np.nan)
-    off_agg = off_agg.rename(columns={"posteam": "team"})[["team", "season", "week", "off_third_down_rate"]]
-
-    # Defensive 3rd down rate
-    def_agg = (
-        third.groupby(["defteam", "season", "week"])
-        .agg(converted=("third_down_converted", "sum"), failed=("third_down_failed", "sum"))
-        .reset_index()
-    )
-    total_d = def_agg["converted"] + def_agg["failed"]
-    def_agg["def_third_down_rate"] = np.where(total_d > 0, def_agg["converted"] / total_d, np.nan)
-    def_agg = def_agg.rename(columns={"defteam": "team"})[["team", "season", "week", "def_third_down_rate"]]
-
-    result = off_agg.merge(def_agg, on=["team", "season", "week"], how="outer")
+    result = _metric_table(valid_plays, "third_down")
 
     logger.info("3rd down rates computed for %d team-weeks", len(result))
     return result
@@ -1642,64 +1266,7 @@ def compute_explosive_plays(valid_plays: pd.DataFrame) -> pd.DataFrame:
         DataFrame with columns: team, season, week, off_explosive_pass_rate,
         off_explosive_rush_rate, def_explosive_pass_rate, def_explosive_rush_rate.
     """
-    empty_cols = [
-        "team", "season", "week",
-        "off_explosive_pass_rate", "off_explosive_rush_rate",
-        "def_explosive_pass_rate", "def_explosive_rush_rate",
-    ]
-
-    if valid_plays.empty:
-        return pd.DataFrame(columns=empty_cols)
-
-    df = valid_plays.copy()
-    df["explosive_pass"] = ((df["play_type"] == "pass") & (df["yards_gained"] >= 20)).astype(int)
-    df["explosive_rush"] = ((df["play_type"] == "run") & (df["yards_gained"] >= 10)).astype(int)
-    df["is_pass"] = (df["play_type"] == "pass").astype(int)
-    df["is_rush"] = (df["play_type"] == "run").astype(int)
-
-    # Offense
-    off_agg = (
-        df.groupby(["posteam", "season", "week"])
-        .agg(
-            exp_pass=("explosive_pass", "sum"),
-            exp_rush=("explosive_rush", "sum"),
-            total_pass=("is_pass", "sum"),
-            total_rush=("is_rush", "sum"),
-        )
-        .reset_index()
-    )
-    off_agg["off_explosive_pass_rate"] = np.where(
-        off_agg["total_pass"] > 0, off_agg["exp_pass"] / off_agg["total_pass"], np.nan
-    )
-    off_agg["off_explosive_rush_rate"] = np.where(
-        off_agg["total_rush"] > 0, off_agg["exp_rush"] / off_agg["total_rush"], np.nan
-    )
-    off_agg = off_agg.rename(columns={"posteam": "team"})[
-        ["team", "season", "week", "off_explosive_pass_rate", "off_explosive_rush_rate"]
-    ]
-
-    # Defense
-    def_agg = (
-        df.groupby(["defteam", "season", "week"])
-        .agg(
-            exp_pass=("explosive_pass", "sum"),
-            exp_rush=("explosive_rush", "sum"),
-            total_pass=("is_pass", "sum"),
-            total_rush=("is_rush", "sum"),
-        )
-        .reset_index()
-    )
-    def_agg["def_explosive_pass_rate"] = np.where(
-        def_agg["total_pass"] > 0, def_agg["exp_pass"] / def_agg["total_pass"], np.nan
-    )
-    def_agg["def_explosive_rush_rate"] = np.where(
-        def_agg["total_rush"] > 0, def_agg["exp_rush"] / def_agg["total_rush"], np.nan
-    )
-    def_agg = def_agg.rename(columns={"defteam": "team"})[
-        ["team", "season", "week", "def_explosive_pass_rate", "def_explosive_rush_rate"]
-    ]
-
-    result = off_agg.merge(def_agg, on=["team", "season", "week"], how="outer")
+    result = _metric_table(valid_plays, "explosive")
 
     logger.info("Explosive play rates computed for %d team-weeks", len(result))
     return result
@@ -1718,39 +1285,7 @@ def compute_sack_rates(valid_plays: pd.DataFrame) -> pd.DataFrame:
     Returns:
         DataFrame with columns: team, season, week, off_sack_rate, def_sack_rate.
     """
-    if valid_plays.empty:
-        return pd.DataFrame(columns=["team", "season", "week", "off_sack_rate", "def_sack_rate"])
-
-    df = valid_plays.copy()
-
-    # Ensure sack column exists
-    if "sack" not in df.columns:
-        logger.warning("No sack column found; returning empty DataFrame")
-        return pd.DataFrame(columns=["team", "season", "week", "off_sack_rate", "def_sack_rate"])
-
-    # Offensive sack rate
-    off_agg = (
-        df.groupby(["posteam", "season", "week"])
-        .agg(sacks=("sack", "sum"), dropbacks=("pass_attempt", "sum"))
-        .reset_index()
-    )
-    off_agg["off_sack_rate"] = np.where(
-        off_agg["dropbacks"] > 0, off_agg["sacks"] / off_agg["dropbacks"], np.nan
-    )
-    off_agg = off_agg.rename(columns={"posteam": "team"})[["team", "season", "week", "off_sack_rate"]]
-
-    # Defensive sack rate
-    def_agg = (
-        df.groupby(["defteam", "season", "week"])
-        .agg(sacks=("sack", "sum"), dropbacks=("pass_attempt", "sum"))
-        .reset_index()
-    )
-    def_agg["def_sack_rate"] = np.where(
-        def_agg["dropbacks"] > 0, def_agg["sacks"] / def_agg["dropbacks"], np.nan
-    )
-    def_agg = def_agg.rename(columns={"defteam": "team"})[["team", "season", "week", "def_sack_rate"]]
-
-    result = off_agg.merge(def_agg, on=["team", "season", "week"], how="outer")
+    result = _metric_table(valid_plays, "sacks")
 
     logger.info("Sack rates computed for %d team-weeks", len(result))
     return result
@@ -1764,9 +1299,12 @@ def compute_sack_rates(valid_plays: pd.DataFrame) -> pd.DataFrame:
 def compute_pbp_derived_metrics(pbp_df: pd.DataFrame) -> pd.DataFrame:
     """Orchestrate all PBP-derived metric computations and apply rolling windows.
 
-    Calls 11 individual compute functions, merges results on (team, season, week),
-    and applies rolling windows to all stat columns except turnover luck (which uses
-    its own expanding window internally).
+    Penalty, red zone trip, 3rd down, explosive play and sack metrics come
+    from one grouped pass; turnover luck, FG accuracy, returns, drive
+    efficiency and TOP aggregate per drive/kick first and keep their own
+    functions. Results are merged on (team, season, week) and rolling windows
+    applied to all stat columns except turnover luck (which uses its own
+    expanding window internally).
 
     Args:
         pbp_df: Raw play-by-play DataFrame.
@@ -1774,38 +1312,48 @@ def compute_pbp_derived_metrics(pbp_df: pd.DataFrame) -> pd.DataFrame:
     Returns:
         DataFrame with all PBP-derived metrics plus rolling (_roll3, _roll6, _std) columns.
     """
-    valid = _filter_valid_plays(pbp_df)
+    return _pbp_derived_metrics_from(TeamWeekAggregator(pbp_df))
 
-    if valid.empty:
+
+def _pbp_derived_metrics_from(engine: TeamWeekAggregator) -> pd.DataFrame:
+    """compute_pbp_derived_metrics on a prepared aggregator."""
+    if not engine.has_valid_plays():
         logger.warning("No valid plays after filtering; returning empty DataFrame")
         return pd.DataFrame()
 
-    # Functions receiving raw PBP (apply own filters)
-    penalties_df = compute_penalty_metrics(pbp_df)
-    opp_penalties_df = compute_opp_drawn_penalties(pbp_df)
-    turnover_df = compute_turnover_luck(pbp_df)
-    fg_df = compute_fg_accuracy(pbp_df)
-    return_df = compute_return_metrics(pbp_df)
-    top_df = compute_top(pbp_df)
-
-    # Functions receiving filtered valid plays
-    rz_trips_df = compute_red_zone_trips(valid)
-    third_down_df = compute_third_down_rates(valid)
-    explosive_df = compute_explosive_plays(valid)
-    drive_df = compute_drive_efficiency(valid)
-    sack_df = compute_sack_rates(valid)
-
-    # Merge all on (team, season, week)
-    dfs = [
-        penalties_df, opp_penalties_df, turnover_df, rz_trips_df,
-        fg_df, return_df, third_down_df, explosive_df, drive_df,
-        sack_df, top_df,
+    grouped = engine.frame(
+        ["penalties", "opp_penalties", "rz_trips", "third_down", "explosive", "sacks"],
+        keep_empty=["penalties"],
+    )
+
+    # Drive/kick-level functions (REG-season scope; they re-apply the same
+    # filters, which is a no-op here)
+    scope = engine.scope
+    valid = engine.valid_plays
+    parts = [
+        ("penalties", None),
+        ("opp_penalties", None),
+        ("turnover", compute_turnover_luck(scope)),
+        ("rz_trips", None),
+        ("fg", compute_fg_accuracy(scope)),
+        ("return", compute_return_metrics(scope)),
+        ("third_down", None),
+        ("explosive", None),
+        ("drive", compute_drive_efficiency(valid)),
+        ("sacks", None),
+        ("top", compute_top(scope)),
     ]
 
-    merged = dfs[0]
-    for df in dfs[1:]:
-        if not df.empty:
-            merged = merged.merge(df, on=["team", "season", "week"], how="outer")
+    # Merge the drive/kick tables in, keeping the historical column order
+    merged = grouped
+    columns = list(KEY_COLS)
+    for table, df in parts:
+        if df is None:
+            columns += [c for c in table_columns(table) if c in grouped.columns]
+        elif not df.empty:
+            merged = merged.merge(df, on=KEY_COLS, how="outer")
+            columns += [c for c in df.columns if c not in KEY_COLS]
+    merged = merged[columns]
 
     # Identify stat columns, excluding turnover luck (uses expanding window internally)
     key_cols = {"team", "season", "week"}
@@ -1823,3 +1371,42 @@ def compute_pbp_derived_metrics(pbp_df: pd.DataFrame) -> pd.DataFrame:
         len(result), result["team"].nunique(), len(result.columns),
     )
     return result
+
+
+# ---------------------------------------------------------------------------
+# Team Silver Tables (single pass)
+# ---------------------------------------------------------------------------
+
+# Registry tables used by the Silver team builders, evaluated together
+SILVER_METRIC_TABLES = [
+    "epa", "success_rate", "cpoe", "red_zone",
+    "pace", "proe", "early_down", "fourth_down",
+    "situational",
+    "penalties", "opp_penalties", "rz_trips", "third_down", "explosive", "sacks",
+]
+
+
+def compute_team_silver_tables(pbp_df: pd.DataFrame) -> Dict[str, pd.DataFrame]:
+    """Build every Silver team table from one scan of a season's PBP.
+
+    Filters and key-codes the plays once and evaluates every registry
+    metric in a single grouped pass, then assembles the same frames as
+    calling the five ``compute_*`` orchestrators separately.
+
+    Args:
+        pbp_df: Raw play-by-play DataFrame.
+
+    Returns:
+        Dict keyed like ``SILVER_TEAM_S3_KEYS``: pbp_metrics, tendencies,
+        sos, situational, pbp_derived (empty DataFrame when not computable).
+    """
+    engine = TeamWeekAggregator(pbp_df)
+    if engine.has_valid_plays():
+        engine.prefetch(SILVER_METRIC_TABLES)
+    return {
+        "pbp_metrics": _pbp_metrics_from(engine),
+        "tendencies": _tendency_metrics_from(engine),
+        "sos": _sos_metrics_from(engine),
+        "situational": _situational_splits_from(engine),
+        "pbp_derived": _pbp_derived_metrics_from(engine),
+    }
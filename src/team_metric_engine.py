@@ -0,0 +1,671 @@
+"""Single-pass team-week aggregation of play-by-play metrics.
+
+The team Silver builders (``compute_pbp_metrics``, ``compute_tendency_metrics``,
+``compute_situational_splits``, ``compute_pbp_derived_metrics`` ...) used to
+re-filter the season's plays in every metric function, run a separate
+``groupby(["posteam" | "defteam", "season", "week"])`` per metric and chain
+the ~15 partial frames together with outer merges.
+
+Here every metric is a :class:`TeamMetric` row in :data:`TEAM_METRICS`:
+
+* ``mask`` names a play filter in the mask registry (valid run/pass plays,
+  red zone, 3rd down, offensive penalties, home games, ...);
+* ``numerator`` / ``denominator`` are aggregate specs over the masked plays
+  -- ``"sum:<col>"``, ``"count:<col>"`` (non-null values), ``"nunique:<col>"``
+  or ``"rows"``; a mean is ``sum:x / count:x`` and a plain count or total
+  leaves ``denominator`` unset;
+* ``side`` is the perspective: ``"off"`` credits the play to ``posteam``,
+  ``"def"`` to ``defteam``.
+
+:class:`TeamWeekAggregator` filters the plays once (REG season, week <= 18),
+int-codes the team and (season, week) keys once, and evaluates every
+requested metric with one grouped sum per perspective over a matrix holding
+all the masked value columns. Rows come out sorted by (team, season, week)
+-- the order the outer-merge chains produced.
+
+Each metric belongs to the ``table`` of the legacy function that produced
+it. A table's team-weeks are those with at least one play in any of its
+masks, exactly the key set of the old per-function outer merge, and
+``fill_value`` is applied only inside that key set (so ``off_rz_trips`` is
+0 for a team that only *defended* red-zone plays that week, and NaN for a
+team-week with no red-zone plays at all).
+
+Sums use pandas' Kahan-compensated group sum in the original row order, so
+means match ``groupby().mean()`` bit for bit.
+
+Usage
+-----
+::
+
+    from team_metric_engine import TeamWeekAggregator
+
+    engine = TeamWeekAggregator(pbp_df)
+    engine.prefetch(["epa", "success_rate", "red_zone"])
+    metrics = engine.frame(["epa", "success_rate", "red_zone"])
+"""
+
+import logging
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
+import pandas as pd
+
+from config import TEAM_DIVISIONS
+
+logger = logging.getLogger(__name__)
+
+KEY_COLS = ["team", "season", "week"]
+
+
+@dataclass(frozen=True)
+class TeamMetric:
+    """Declarative team-week metric: ``numerator / denominator`` over masked plays.
+
+    Attributes:
+        name: Output column. Names starting with ``_`` are helpers that
+            other metrics reference via ``minus`` and are not emitted.
+        table: Table (legacy metric function) the column belongs to.
+        side: ``"off"`` groups by posteam, ``"def"`` by defteam.
+        numerator: Aggregate spec (``"sum:epa"``, ``"nunique:drive"``, ``"rows"``).
+        denominator: Aggregate spec, or None for a plain total/count. The
+            ratio is NaN where the denominator is 0.
+        mask: Play filter name (see ``_MASKS``).
+        minus: Optional helper metric subtracted from this one (PROE).
+        fill_value: Value for team-weeks inside the table's key set that
+            have no plays for this metric (None leaves NaN).
+    """
+
+    name: str
+    table: str
+    side: str
+    numerator: str
+    denominator: Optional[str] = None
+    mask: str = "valid"
+    minus: Optional[str] = None
+    fill_value: Optional[float] = None
+
+
+# ---------------------------------------------------------------------------
+# Play masks and derived value columns
+# ---------------------------------------------------------------------------
+
+MaskFn = Callable[[pd.DataFrame, Callable[[str], np.ndarray]], np.ndarray]
+
+
+def _eq(frame: pd.DataFrame, col: str, value) -> np.ndarray:
+    return (frame[col] == value).to_numpy()
+
+
+def _same_team(frame: pd.DataFrame, col: str, other: str) -> np.ndarray:
+    return (frame[col] == frame[other]).to_numpy()
+
+
+def _divisional(frame: pd.DataFrame) -> np.ndarray:
+    pos_div = frame["posteam"].map(TEAM_DIVISIONS)
+    def_div = frame["defteam"].map(TEAM_DIVISIONS)
+    return (pos_div.notna() & def_div.notna() & (pos_div == def_div)).to_numpy()
+
+
+# name -> (required columns, fn(frame, mask) -> bool array). ``mask`` looks up
+# another registered mask, so composites reuse the cached "valid" mask.
+_MASKS: Dict[str, Tuple[Tuple[str, ...], MaskFn]] = {
+    "valid": ((), lambda f, m: m("valid")),
+    "pass": (("play_type",), lambda f, m: m("valid") & _eq(f, "play_type", "pass")),
+    "run": (("play_type",), lambda f, m: m("valid") & _eq(f, "play_type", "run")),
+    "cpoe": (("cpoe",), lambda f, m: m("valid") & f["cpoe"].notna().to_numpy()),
+    "red_zone": (
+        ("yardline_100",),
+        lambda f, m: m("valid") & (f["yardline_100"] <= 20).to_numpy(),
+    ),
+    "early_down": (("down",), lambda f, m: m("valid") & (f["down"] <= 2).to_numpy()),
+    "third_down": (("down",), lambda f, m: m("valid") & _eq(f, "down", 3)),
+    # 4th-down decisions include punts and field goals, so not "valid"-based.
+    "fourth_down": (
+        ("down", "play_type"),
+        lambda f, m: _eq(f, "down", 4)
+        & f["play_type"].isin(["pass", "run", "punt", "field_goal"]).to_numpy(),
+    ),
+    "off_penalty": (
+        ("penalty", "penalty_team"),
+        lambda f, m: _eq(f, "penalty", 1) & _same_team(f, "penalty_team", "posteam"),
+    ),
+    "def_penalty": (
+        ("penalty", "penalty_team"),
+        lambda f, m: _eq(f, "penalty", 1) & _same_team(f, "penalty_team", "defteam"),
+    ),
+    "home_off": (
+        ("home_team",),
+        lambda f, m: m("valid") & _same_team(f, "posteam", "home_team"),
+    ),
+    "away_off": (
+        ("home_team",),
+        lambda f, m: m("valid") & ~_same_team(f, "posteam", "home_team"),
+    ),
+    "home_def": (
+        ("home_team",),
+        lambda f, m: m("valid") & _same_team(f, "defteam", "home_team"),
+    ),
+    "away_def": (
+        ("home_team",),
+        lambda f, m: m("valid") & ~_same_team(f, "defteam", "home_team"),
+    ),
+    "divisional": ((), lambda f, m: m("valid") & _divisional(f)),
+    "non_divisional": ((), lambda f, m: m("valid") & ~_divisional(f)),
+    "leading": (
+        ("score_differential",),
+        lambda f, m: m("valid") & (f["score_differential"] >= 7).to_numpy(),
+    ),
+    "trailing": (
+        ("score_differential",),
+        lambda f, m: m("valid") & (f["score_differential"] <= -7).to_numpy(),
+    ),
+}
+
+# name -> (required columns, fn(frame) -> Series). Computed play-level inputs.
+_DERIVED: Dict[str, Tuple[Tuple[str, ...], Callable[[pd.DataFrame], pd.Series]]] = {
+    "go_attempt": (
+        ("play_type",),
+        lambda f: f["play_type"].isin(["pass", "run"]).astype(int),
+    ),
+    "fourth_down_outcomes": (
+        ("fourth_down_converted", "fourth_down_failed"),
+        lambda f: f["fourth_down_converted"].fillna(0)
+        + f["fourth_down_failed"].fillna(0),
+    ),
+    "third_down_outcomes": (
+        ("third_down_converted", "third_down_failed"),
+        lambda f: f["third_down_converted"].fillna(0)
+        + f["third_down_failed"].fillna(0),
+    ),
+    "explosive_pass": (
+        ("yards_gained",),
+        lambda f: (f["yards_gained"] >= 20).astype(int),
+    ),
+    "explosive_rush": (
+        ("yards_gained",),
+        lambda f: (f["yards_gained"] >= 10).astype(int),
+    ),
+}
+
+_INTEGRAL_DERIVED = {"go_attempt", "explosive_pass", "explosive_rush"}
+
+
+# ---------------------------------------------------------------------------
+# Metric registry (column order within each table is the legacy output order)
+# ---------------------------------------------------------------------------
+
+
+def _mean(
+    name: str, table: str, side: str, col: str, mask: str = "valid"
+) -> TeamMetric:
+    """Mean of ``col`` over the masked plays (NaN values skipped)."""
+    return TeamMetric(name, table, side, f"sum:{col}", f"count:{col}", mask=mask)
+
+
+def _total(name: str, table: str, side: str, spec: str, mask: str) -> TeamMetric:
+    """Count/total that is 0 (not NaN) inside the table's key set."""
+    return TeamMetric(name, table, side, spec, mask=mask, fill_value=0)
+
+
+TEAM_METRICS: List[TeamMetric] = [
+    # compute_team_epa
+    _mean("off_epa_per_play", "epa", "off", "epa"),
+    _mean("off_pass_epa", "epa", "off", "epa", "pass"),
+    _mean("off_rush_epa", "epa", "off", "epa", "run"),
+    _mean("def_epa_per_play", "epa", "def", "epa"),
+    # compute_team_success_rate
+    _mean("off_success_rate", "success_rate", "off", "success"),
+    _mean("def_success_rate", "success_rate", "def", "success"),
+    # compute_team_cpoe
+    _mean("off_cpoe", "cpoe", "off", "cpoe", "cpoe"),
+    # compute_red_zone_metrics (TD rate per red zone drive, not per play)
+    _mean("off_rz_epa", "red_zone", "off", "epa", "red_zone"),
+    _mean("off_rz_success_rate", "red_zone", "off", "success", "red_zone"),
+    _mean("off_rz_pass_rate", "red_zone", "off", "pass_attempt", "red_zone"),
+    TeamMetric(
+        "off_rz_td_rate",
+        "red_zone",
+        "off",
+        "sum:touchdown",
+        "nunique:drive",
+        "red_zone",
+    ),
+    _mean("def_rz_epa", "red_zone", "def", "epa", "red_zone"),
+    _mean("def_rz_success_rate", "red_zone", "def", "success", "red_zone"),
+    _mean("def_rz_pass_rate", "red_zone", "def", "pass_attempt", "red_zone"),
+    TeamMetric(
+        "def_rz_td_rate",
+        "red_zone",
+        "def",
+        "sum:touchdown",
+        "nunique:drive",
+        "red_zone",
+    ),
+    # compute_pace / compute_proe / compute_early_down_run_rate
+    TeamMetric("pace", "pace", "off", "rows"),
+    _mean("_mean_xpass", "proe", "off", "xpass"),
+    TeamMetric(
+        "proe",
+        "proe",
+        "off",
+        "sum:pass_attempt",
+        "count:pass_attempt",
+        minus="_mean_xpass",
+    ),
+    _mean("early_down_run_rate", "early_down", "off", "rush_attempt", "early_down"),
+    # compute_fourth_down_aggressiveness
+    TeamMetric(
+        "fourth_down_go_rate",
+        "fourth_down",
+        "off",
+        "sum:go_attempt",
+        "rows",
+        "fourth_down",
+    ),
+    TeamMetric(
+        "fourth_down_success_rate",
+        "fourth_down",
+        "off",
+        "sum:fourth_down_converted",
+        "sum:fourth_down_outcomes",
+        "fourth_down",
+    ),
+    # compute_situational_splits
+    _mean("home_off_epa", "situational", "off", "epa", "home_off"),
+    _mean("away_off_epa", "situational", "off", "epa", "away_off"),
+    _mean("home_def_epa", "situational", "def", "epa", "home_def"),
+    _mean("away_def_epa", "situational", "def", "epa", "away_def"),
+    _mean("div_off_epa", "situational", "off", "epa", "divisional"),
+    _mean("nondiv_off_epa", "situational", "off", "epa", "non_divisional"),
+    _mean("div_def_epa", "situational", "def", "epa", "divisional"),
+    _mean("nondiv_def_epa", "situational", "def", "epa", "non_divisional"),
+    _mean("leading_off_epa", "situational", "off", "epa", "leading"),
+    _mean("trailing_off_epa", "situational", "off", "epa", "trailing"),
+    _mean("leading_def_epa", "situational", "def", "epa", "leading"),
+    _mean("trailing_def_epa", "situational", "def", "epa", "trailing"),
+    # compute_penalty_metrics
+    _total("off_penalties", "penalties", "off", "sum:penalty", "off_penalty"),
+    _total("off_penalty_yards", "penalties", "off", "sum:penalty_yards", "off_penalty"),
+    _total("def_penalties", "penalties", "def", "sum:penalty", "def_penalty"),
+    _total("def_penalty_yards", "penalties", "def", "sum:penalty_yards", "def_penalty"),
+    # compute_opp_drawn_penalties (committed by the opponent)
+    _total("off_penalties_drawn", "opp_penalties", "off", "sum:penalty", "def_penalty"),
+    _total(
+        "off_penalty_yards_drawn",
+        "opp_penalties",
+        "off",
+        "sum:penalty_yards",
+        "def_penalty",
+    ),
+    _total("def_penalties_drawn", "opp_penalties", "def", "sum:penalty", "off_penalty"),
+    _total(
+        "def_penalty_yards_drawn",
+        "opp_penalties",
+        "def",
+        "sum:penalty_yards",
+        "off_penalty",
+    ),
+    # compute_red_zone_trips
+    _total("off_rz_trips", "rz_trips", "off", "nunique:drive", "red_zone"),
+    _total("def_rz_trips", "rz_trips", "def", "nunique:drive", "red_zone"),
+    # compute_third_down_rates
+    TeamMetric(
+        "off_third_down_rate",
+        "third_down",
+        "off",
+        "sum:third_down_converted",
+        "sum:third_down_outcomes",
+        "third_down",
+    ),
+    TeamMetric(
+        "def_third_down_rate",
+        "third_down",
+        "def",
+        "sum:third_down_converted",
+        "sum:third_down_outcomes",
+        "third_down",
+    ),
+    # compute_explosive_plays (20+ yard passes, 10+ yard runs)
+    TeamMetric(
+        "off_explosive_pass_rate",
+        "explosive",
+        "off",
+        "sum:explosive_pass",
+        "rows",
+        "pass",
+    ),
+    TeamMetric(
+        "off_explosive_rush_rate",
+        "explosive",
+        "off",
+        "sum:explosive_rush",
+        "rows",
+        "run",
+    ),
+    TeamMetric(
+        "def_explosive_pass_rate",
+        "explosive",
+        "def",
+        "sum:explosive_pass",
+        "rows",
+        "pass",
+    ),
+    TeamMetric(
+        "def_explosive_rush_rate",
+        "explosive",
+        "def",
+        "sum:explosive_rush",
+        "rows",
+        "run",
+    ),
+    # compute_sack_rates (sacks per dropback)
+    TeamMetric("off_sack_rate", "sacks", "off", "sum:sack", "sum:pass_attempt"),
+    TeamMetric("def_sack_rate", "sacks", "def", "sum:sack", "sum:pass_attempt"),
+]
+
+METRICS_BY_TABLE: Dict[str, List[TeamMetric]] = {}
+for _metric in TEAM_METRICS:
+    METRICS_BY_TABLE.setdefault(_metric.table, []).append(_metric)
+del _metric
+
+
+def table_columns(table: str) -> List[str]:
+    """Output columns (without keys) of a registered table, in order."""
+    return [m.name for m in METRICS_BY_TABLE[table] if not m.name.startswith("_")]
+
+
+def _parse_spec(spec: str) -> Tuple[str, Optional[str]]:
+    kind, _, col = spec.partition(":")
+    if kind not in ("rows", "sum", "count", "nunique") or (kind == "rows") == bool(col):
+        raise ValueError(f"Bad aggregate spec {spec!r}")
+    return kind, col or None
+
+
+# ---------------------------------------------------------------------------
+# Engine
+# ---------------------------------------------------------------------------
+
+
+class TeamWeekAggregator:
+    """Evaluates registered team metrics over one season frame in one pass.
+
+    Args:
+        pbp_df: Play-by-play DataFrame.
+        filtered: True when ``pbp_df`` already holds only valid plays (the
+            output of ``_filter_valid_plays``): no scope filter is applied
+            and every row counts as valid. False (default) takes raw PBP,
+            keeps REG season weeks <= 18 and derives the valid run/pass
+            mask itself.
+    """
+
+    def __init__(self, pbp_df: pd.DataFrame, filtered: bool = False) -> None:
+        if filtered:
+            scope = pbp_df
+            valid = np.ones(len(scope), dtype=bool)
+        else:
+            keep = np.ones(len(pbp_df), dtype=bool)
+            if "season_type" in pbp_df.columns:
+                keep &= _eq(pbp_df, "season_type", "REG")
+            else:
+                logger.warning("No season_type column; skipping season_type filter")
+            if "week" in pbp_df.columns:
+                keep &= (pbp_df["week"] <= 18).to_numpy()
+            scope = pbp_df if keep.all() else pbp_df[keep]
+
+            valid = np.ones(len(scope), dtype=bool)
+            if "play_type" in scope.columns:
+                valid &= scope["play_type"].isin(["pass", "run"]).to_numpy()
+            else:
+                logger.warning("No play_type column; cannot filter to pass/run plays")
+            if "epa" in scope.columns:
+                valid &= scope["epa"].notna().to_numpy()
+            else:
+                logger.warning("No epa column found; skipping EPA NaN filter")
+
+        self.scope = scope
+        self._masks: Dict[str, np.ndarray] = {"valid": valid}
+        self._values: Dict[str, np.ndarray] = {}
+        self._cache: Dict[Tuple[str, str, str], np.ndarray] = {}
+        self._valid_plays: Optional[pd.DataFrame] = None
+        self._skipped: Set[str] = set()
+
+        # Int-code team and (season, week) once; group id order == sorted keys.
+        n = len(scope)
+        team_codes, teams = pd.factorize(
+            pd.concat([scope["posteam"], scope["defteam"]], ignore_index=True),
+            sort=True,
+        )
+        season_codes, seasons = pd.factorize(scope["season"], sort=True)
+        week_codes, weeks = pd.factorize(scope["week"], sort=True)
+        self._teams, self._seasons, self._weeks = teams, seasons, weeks
+        self._n_sw = max(len(seasons) * len(weeks), 1)
+        self.n_groups = max(len(teams), 1) * self._n_sw
+
+        sw = season_codes * len(weeks) + week_codes
+        sw_ok = (season_codes >= 0) & (week_codes >= 0)
+        self._gid = {}
+        for side, codes in (("off", team_codes[:n]), ("def", team_codes[n:])):
+            self._gid[side] = np.where(
+                sw_ok & (codes >= 0), codes * self._n_sw + sw, -1
+            )
+
+    # -- plays ------------------------------------------------------------
+
+    @property
+    def valid_plays(self) -> pd.DataFrame:
+        """Valid run/pass plays, identical to ``_filter_valid_plays`` output."""
+        if self._valid_plays is None:
+            valid = self._masks["valid"]
+            plays = self.scope if valid.all() else self.scope[valid]
+            self._valid_plays = plays.reset_index(drop=True)
+            logger.info(
+                "Filtered to %d valid plays from %d in-scope rows",
+                len(self._valid_plays),
+                len(self.scope),
+            )
+        return self._valid_plays
+
+    def has_valid_plays(self) -> bool:
+        return bool(self._masks["valid"].any())
+
+    def mask(self, name: str) -> np.ndarray:
+        """Boolean play mask from the registry (cached)."""
+        if name not in self._masks:
+            _, fn = _MASKS[name]
+            self._masks[name] = np.asarray(fn(self.scope, self.mask), dtype=bool)
+        return self._masks[name]
+
+    def _column(self, col: str) -> np.ndarray:
+        if col not in self._values:
+            if col in _DERIVED:
+                series = _DERIVED[col][1](self.scope)
+            else:
+                series = self.scope[col]
+            self._values[col] = series.to_numpy(dtype=np.float64, na_value=np.nan)
+        return self._values[col]
+
+    def _is_integral(self, col: str) -> bool:
+        if col in _DERIVED:
+            return col in _INTEGRAL_DERIVED
+        dtype = self.scope[col].dtype
+        return pd.api.types.is_integer_dtype(dtype) or pd.api.types.is_bool_dtype(dtype)
+
+    def _missing_columns(self, metric: TeamMetric) -> List[str]:
+        needed = set(_MASKS[metric.mask][0])
+        for spec in (metric.numerator, metric.denominator):
+            if spec is None:
+                continue
+            col = _parse_spec(spec)[1]
+            if col is None:
+                continue
+            needed.update(_DERIVED[col][0] if col in _DERIVED else (col,))
+        return sorted(c for c in needed if c not in self.scope.columns)
+
+    # -- reduction --------------------------------------------------------
+
+    def _reduce(self, side: str, keys: Sequence[Tuple[str, str]]) -> None:
+        """Evaluate (mask, spec) aggregates for one side and cache them."""
+        gid = self._gid[side]
+        summed = [k for k in keys if _parse_spec(k[1])[0] != "nunique"]
+        distinct = [k for k in keys if _parse_spec(k[1])[0] == "nunique"]
+
+        if summed:
+            rows = gid >= 0
+            any_mask = np.zeros(len(gid), dtype=bool)
+            for mask_name, _ in summed:
+                any_mask |= self.mask(mask_name)
+            rows &= any_mask
+            idx = np.flatnonzero(rows)
+
+            matrix = np.empty((len(idx), len(summed)), dtype=np.float64)
+            for j, (mask_name, spec) in enumerate(summed):
+                kind, col = _parse_spec(spec)
+                mask = self.mask(mask_name)[idx]
+                if kind == "rows":
+                    matrix[:, j] = mask
+                elif kind == "count":
+                    matrix[:, j] = mask & ~np.isnan(self._column(col)[idx])
+                else:
+                    matrix[:, j] = np.where(mask, self._column(col)[idx], np.nan)
+
+            # One Kahan-compensated grouped sum for every column (NaNs skipped),
+            # in original row order -- bit-identical to groupby().sum()/.mean().
+            grouped = pd.DataFrame(matrix).groupby(gid[idx], sort=True).sum()
+            present = grouped.index.to_numpy()
+            for j, key in enumerate(summed):
+                full = np.zeros(self.n_groups, dtype=np.float64)
+                full[present] = grouped[j].to_numpy()
+                self._cache[(side,) + key] = full
+
+        for mask_name, spec in distinct:
+            col = _parse_spec(spec)[1]
+            values = self._column(col)
+            idx = np.flatnonzero(self.mask(mask_name) & (gid >= 0) & ~np.isnan(values))
+            codes, uniques = pd.factorize(values[idx])
+            width = max(len(uniques), 1)
+            pairs = np.unique(gid[idx].astype(np.int64) * width + codes)
+            self._cache[(side, mask_name, spec)] = np.bincount(
+                pairs // width, minlength=self.n_groups
+            ).astype(np.float64)
+
+    def _usable(self, tables: Iterable[str]) -> List[TeamMetric]:
+        """Metrics of the tables whose input columns are all present."""
+        metrics = []
+        for table in tables:
+            missing = sorted(
+                {c for m in METRICS_BY_TABLE[table] for c in self._missing_columns(m)}
+            )
+            if not missing:
+                metrics.extend(METRICS_BY_TABLE[table])
+            elif table not in self._skipped:
+                self._skipped.add(table)
+                logger.warning(
+                    "Skipping %s metrics; missing columns %s", table, missing
+                )
+        return metrics
+
+    def prefetch(self, tables: Iterable[str]) -> None:
+        """Evaluate every aggregate the tables need: one grouped pass per side."""
+        needed: Dict[str, List[Tuple[str, str]]] = {"off": [], "def": []}
+        for metric in self._usable(tables):
+            for spec in ("rows", metric.numerator, metric.denominator):
+                if spec is None:
+                    continue
+                key = (metric.mask, spec)
+                pending = needed[metric.side]
+                if (metric.side,) + key not in self._cache and key not in pending:
+                    pending.append(key)
+        for side, keys in needed.items():
+            if keys:
+                self._reduce(side, keys)
+
+    # -- output -----------------------------------------------------------
+
+    def _metric_values(
+        self, metric: TeamMetric, by_name: Dict[str, TeamMetric]
+    ) -> np.ndarray:
+        num = self._cache[(metric.side, metric.mask, metric.numerator)]
+        if metric.denominator is not None:
+            den = self._cache[(metric.side, metric.mask, metric.denominator)]
+            with np.errstate(divide="ignore", invalid="ignore"):
+                values = np.where(den > 0, num / np.where(den > 0, den, 1.0), np.nan)
+        else:
+            rows = self._cache[(metric.side, metric.mask, "rows")]
+            values = np.where(rows > 0, num, np.nan)
+        if metric.minus is not None:
+            values = values - self._metric_values(by_name[metric.minus], by_name)
+        return values
+
+    def _present(self, metrics: Sequence[TeamMetric]) -> np.ndarray:
+        present = np.zeros(self.n_groups, dtype=bool)
+        for metric in metrics:
+            present |= self._cache[(metric.side, metric.mask, "rows")] > 0
+        return present
+
+    def frame(
+        self, tables: Sequence[str], keep_empty: Iterable[str] = ()
+    ) -> pd.DataFrame:
+        """Team-week frame with the columns of ``tables``, in table order.
+
+        Rows are the union of the tables' key sets, sorted by (team, season,
+        week) with a RangeIndex -- what the chain of outer merges produced.
+        A table with no rows (or missing input columns) contributes no
+        columns unless it is listed in ``keep_empty`` (all-NaN columns).
+
+        Args:
+            tables: Registered table names.
+            keep_empty: Tables whose columns are always emitted.
+
+        Returns:
+            DataFrame with ``team``, ``season``, ``week`` and metric columns.
+        """
+        keep_empty = set(keep_empty)
+        self.prefetch(tables)
+        usable = {m.table for m in self._usable(tables)}
+
+        table_present = {
+            t: self._present(METRICS_BY_TABLE[t]) for t in tables if t in usable
+        }
+        rows = np.zeros(self.n_groups, dtype=bool)
+        for present in table_present.values():
+            rows |= present
+        ids = np.flatnonzero(rows)
+
+        team_idx, sw_idx = np.divmod(ids, self._n_sw)
+        season_idx, week_idx = np.divmod(sw_idx, max(len(self._weeks), 1))
+        out = {
+            "team": np.asarray(self._teams.take(team_idx), dtype=object),
+            "season": self._seasons.take(season_idx),
+            "week": self._weeks.take(week_idx),
+        }
+
+        for table in tables:
+            present = table_present.get(table)
+            if present is None or not present.any():
+                if table in keep_empty:
+                    for name in table_columns(table):
+                        out[name] = np.full(len(ids), np.nan)
+                continue
+            by_name = {m.name: m for m in METRICS_BY_TABLE[table]}
+            for metric in METRICS_BY_TABLE[table]:
+                if metric.name.startswith("_"):
+                    continue
+                values = self._metric_values(metric, by_name)
+                filled = False
+                if metric.fill_value is not None:
+                    gap = present & np.isnan(values)
+                    filled = bool(gap[ids].any())
+                    values = np.where(gap, metric.fill_value, values)
+                values = values[ids]
+                if self._integral(metric) and not filled and not np.isnan(values).any():
+                    values = values.astype(np.int64)
+                out[metric.name] = values
+
+        return pd.DataFrame(out)
+
+    def _integral(self, metric: TeamMetric) -> bool:
+        if metric.denominator is not None or metric.minus is not None:
+            return False
+        kind, col = _parse_spec(metric.numerator)
+        return kind != "sum" or self._is_integral(col)
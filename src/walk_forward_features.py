@@ -0,0 +1,185 @@
+"""Walk-forward Silver feature state for backtests.
+
+``scripts/backtest_projections.build_silver_features`` rebuilds usage
+metrics and rolling averages from scratch for every (season, week) it is
+asked about, so a season of backtest weeks re-runs the same groupby
+transforms over a growing prefix of the season — quadratic in weeks.
+
+:class:`WalkForwardSilverState` removes that redundancy. Every column the
+Silver frame carries is causal within a season:
+
+* usage shares (``target_share``, ``carry_share``, ...) are computed from
+  the team's totals for the *same* week only;
+* rolling (``*_roll3``/``*_roll6``) and season-to-date (``*_std``) columns
+  are ``shift(1)``-lagged inside each (player_id, season) group, and
+  pandas' rolling/expanding kernels only ever read values at or before the
+  output position.
+
+So a row's features are final the moment its week is appended — later
+weeks never change them. The state therefore materialises each season's
+usage + rolling frame once, in the exact row order
+``build_silver_features`` produces, and walks a week cursor forward: the
+frame for ``up_to_week`` is the prefix of weeks ``< up_to_week`` with the
+index relabelled to what the per-week rebuild would have assigned. The
+result is byte-identical to the per-week path (pinned by
+``tests/test_walk_forward_features.py``) while each season's transforms
+run once instead of once per backtest week.
+
+Weeks with too little in-season history (fewer than
+:data:`MIN_HISTORY_ROWS` rows) fall back to the per-week builder, which
+prepends the prior season — that branch is only hit for week 1-2 and is
+cheap.
+
+Usage
+-----
+::
+
+    from walk_forward_features import WalkForwardSilverState
+
+    state = WalkForwardSilverState(weekly_df)
+    for week in range(3, 19):
+        silver_df = state.features_before(2024, week)
+"""
+
+import logging
+from typing import Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+from player_analytics import compute_rolling_averages, compute_usage_metrics
+
+logger = logging.getLogger(__name__)
+
+#: Minimum in-season history rows before the prior season is no longer
+#: prepended (mirrors ``build_silver_features``).
+MIN_HISTORY_ROWS: int = 5
+
+
+def build_silver_prefix(
+    weekly_df: pd.DataFrame, season: int, up_to_week: int
+) -> pd.DataFrame:
+    """Build Silver features from scratch using only weeks before *up_to_week*.
+
+    This is the reference (per-week rebuild) path; the walk-forward state
+    reproduces its output exactly and falls back to it for thin history.
+
+    Args:
+        weekly_df: Bronze player weekly stats spanning *season* and,
+            ideally, ``season - 1``.
+        season: Season being projected.
+        up_to_week: First week NOT visible to the features.
+
+    Returns:
+        Usage + rolling-average frame, or an empty DataFrame when there is
+        no history or the feature build fails.
+    """
+    hist = weekly_df[
+        (weekly_df["season"] == season) & (weekly_df["week"] < up_to_week)
+    ].copy()
+    if hist.empty or len(hist) < MIN_HISTORY_ROWS:
+        # Need some history; try including prior season
+        prior = weekly_df[weekly_df["season"] == season - 1].copy()
+        hist = pd.concat([prior, hist], ignore_index=True)
+
+    if hist.empty:
+        return pd.DataFrame()
+
+    try:
+        usage = compute_usage_metrics(hist)
+        rolling = compute_rolling_averages(usage)
+        return rolling
+    except Exception as e:
+        logger.debug(
+            "Feature build failed for season=%d week<%d: %s", season, up_to_week, e
+        )
+        return pd.DataFrame()
+
+
+class WalkForwardSilverState:
+    """Per-season Silver features materialised once and served week by week.
+
+    The first request for a season runs ``compute_usage_metrics`` and
+    ``compute_rolling_averages`` over every week of that season present in
+    *weekly_df*; subsequent requests slice the cached frame. Advancing the
+    cursor costs one boolean mask plus an index relabel — no groupby.
+
+    Args:
+        weekly_df: Bronze player weekly stats (already passed through the
+            backtest's ``_prepare_weekly``). Treated as read-only.
+    """
+
+    def __init__(self, weekly_df: pd.DataFrame) -> None:
+        self._weekly = weekly_df
+        self._seasons: Dict[int, Optional[pd.DataFrame]] = {}
+        self._cursor: Dict[int, int] = {}
+
+    def _season_frame(self, season: int) -> Optional[pd.DataFrame]:
+        """Return (building on first use) the full-season feature frame.
+
+        The frame's index is each row's position within the season's rows
+        of ``weekly_df`` — the label ``compute_usage_metrics`` assigns when
+        it is handed a week-filtered slice, before relabelling.
+        """
+        if season in self._seasons:
+            return self._seasons[season]
+
+        weekly = self._weekly
+        season_rows = weekly[(weekly["season"] == season) & weekly["week"].notna()]
+        frame: Optional[pd.DataFrame] = None
+        if not season_rows.empty:
+            try:
+                usage = compute_usage_metrics(season_rows.copy())
+                frame = compute_rolling_averages(usage)
+            except Exception as e:
+                logger.debug("Season feature build failed for season=%d: %s", season, e)
+                frame = None
+        self._seasons[season] = frame
+        return frame
+
+    def features_before(self, season: int, up_to_week: int) -> pd.DataFrame:
+        """Silver features using only data available before *up_to_week*.
+
+        Drop-in replacement for ``build_silver_prefix(weekly_df, season,
+        up_to_week)`` — same columns, dtypes, row order and index.
+
+        Args:
+            season: Season being projected.
+            up_to_week: First week NOT visible to the features.
+
+        Returns:
+            Feature DataFrame (a fresh copy the caller may mutate), or an
+            empty DataFrame when there is no usable history.
+        """
+        self._cursor[season] = up_to_week
+        frame = self._season_frame(season)
+        if frame is None:
+            return build_silver_prefix(self._weekly, season, up_to_week)
+
+        visible = (frame["week"] < up_to_week).to_numpy()
+        n_visible = int(visible.sum())
+        if n_visible < MIN_HISTORY_ROWS:
+            return build_silver_prefix(self._weekly, season, up_to_week)
+
+        out = frame.loc[visible]
+        positions = out.index.to_numpy()
+        # Relabel to the row's rank among visible rows — the index the
+        # per-week rebuild's merge would have produced for this prefix.
+        out.index = pd.Index(np.searchsorted(np.sort(positions), positions))
+        return out
+
+    def advance(self, season: int) -> pd.DataFrame:
+        """Move *season*'s cursor forward one week and return its features.
+
+        The first call for a season starts at week 1 (i.e. features for
+        projecting week 2 need week 1 appended, and so on).
+
+        Args:
+            season: Season to advance.
+
+        Returns:
+            Feature frame for the new cursor position, as
+            :meth:`features_before`.
+        """
+        next_week = self._cursor.get(season, 1) + 1
+        return self.features_before(season, next_week)
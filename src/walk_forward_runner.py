@@ -0,0 +1,537 @@
+"""Walk-forward CV on shared design matrices, optionally on a process pool.
+
+The walk-forward loops in ``player_model_training`` and ``ensemble_training``
+used to re-slice ``frame[feature_cols]`` into fresh DataFrames for every
+fold of every stat and model family, and ran the folds one after another.
+:func:`run_cv_jobs` instead:
+
+* builds **one feature matrix per (frame, feature set, dtype)** and shares
+  it between every fold and every job (model family / target) that uses it.
+  Folds are positional index ranges into that matrix -- a contiguous season
+  block is a zero-copy slice. XGBoost and CatBoost train on float32 anyway,
+  so their matrix is float32; LightGBM and the sklearn pipelines keep
+  float64 so their predictions stay bit-identical to the DataFrame path;
+* runs folds (and jobs) on a process pool when ``workers > 1``. The
+  matrices are written once as ``.npy`` files and memory-mapped by the
+  workers; each worker limits OpenMP/BLAS threads so N workers do not
+  oversubscribe the machine;
+* reports each fold's wall time and peak resident memory.
+
+Fold models still receive ``pandas`` frames (zero-copy wrappers around the
+matrix rows) so ``model_factory`` / ``fit_kwargs_fn`` see the same API as
+before. Frames with non-numeric feature columns (e.g. pandas categoricals)
+and jobs whose factory cannot be pickled run in-process on the DataFrame
+path.
+
+Usage
+-----
+::
+
+    from walk_forward_runner import CvJob, run_cv_jobs
+
+    job = CvJob(df, cols, "target", partial(make_xgb_model, params),
+                val_seasons=[2022, 2023])
+    folds = run_cv_jobs([job], workers=4)[0]
+"""
+
+import logging
+import multiprocessing
+import os
+import pickle
+import resource
+import shutil
+import sys
+import tempfile
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+from sklearn.metrics import mean_absolute_error
+
+try:
+    from config import CV_FOLD_MB, CV_THREADS_PER_WORKER, CV_WORKERS, HOLDOUT_SEASON
+    from season_parallel import resolve_in_flight
+except ImportError:  # pragma: no cover
+    from src.config import (
+        CV_FOLD_MB,
+        CV_THREADS_PER_WORKER,
+        CV_WORKERS,
+        HOLDOUT_SEASON,
+    )
+    from src.season_parallel import resolve_in_flight
+
+logger = logging.getLogger(__name__)
+
+Positions = Union[slice, np.ndarray]
+
+# Estimators that convert features to float32 internally; a float32 matrix
+# gives them exactly the values they would have trained on.
+_FLOAT32_MODULES = ("xgboost", "catboost")
+
+_THREAD_ENV_VARS = (
+    "OMP_NUM_THREADS",
+    "OPENBLAS_NUM_THREADS",
+    "MKL_NUM_THREADS",
+)
+
+
+@dataclass
+class CvJob:
+    """One walk-forward CV run: a model family on one target.
+
+    Attributes:
+        frame: Rows to cross-validate (feature columns, target, 'season').
+        feature_cols: Feature column names.
+        target_col: Target column name.
+        model_factory: Callable returning a fresh, unfitted model. Must be
+            picklable (module-level function or ``functools.partial``) for
+            the job to run on the process pool.
+        fit_kwargs_fn: Optional callable(X_train, y_train, X_val, y_val)
+            returning extra ``fit`` kwargs.
+        val_seasons: Seasons to validate on, in order.
+        min_train_seasons: Folds with fewer distinct training seasons are
+            skipped (logged).
+        rows: Optional positions into ``frame`` the job is restricted to
+            (e.g. rows with a non-NaN target). Jobs on one frame with
+            different ``rows`` still share its matrix.
+    """
+
+    frame: pd.DataFrame
+    feature_cols: List[str]
+    target_col: str
+    model_factory: Callable[[], Any]
+    fit_kwargs_fn: Optional[Callable] = None
+    val_seasons: Sequence[int] = ()
+    min_train_seasons: int = 1
+    rows: Optional[np.ndarray] = None
+
+
+@dataclass
+class FoldResult:
+    """Outcome of one fold.
+
+    ``val_positions`` index ``CvJob.frame`` positionally (``iloc``), not
+    ``CvJob.rows``.
+    ``peak_rss_mb`` is the peak resident memory of the process while the
+    fold ran (process lifetime peak where the OS cannot reset it).
+    """
+
+    val_season: int
+    train_seasons: List[int]
+    train_size: int
+    val_size: int
+    val_positions: np.ndarray
+    predictions: np.ndarray
+    mae: float
+    seconds: float
+    peak_rss_mb: Optional[float] = None
+
+    def detail(self) -> Dict[str, Any]:
+        """The fold's entry for ``WalkForwardResult.fold_details``."""
+        return {
+            "train_seasons": self.train_seasons,
+            "val_season": self.val_season,
+            "train_size": self.train_size,
+            "val_size": self.val_size,
+            "mae": self.mae,
+            "seconds": round(self.seconds, 3),
+            "peak_rss_mb": self.peak_rss_mb,
+        }
+
+
+@dataclass
+class _Fold:
+    val_season: int
+    train_seasons: List[int]
+    train: Positions
+    val: Positions
+    train_size: int
+    val_size: int
+
+
+@dataclass
+class _Prepared:
+    job: CvJob
+    folds: List[_Fold]
+    matrix_key: Optional[Tuple[int, Tuple[str, ...], str]]
+    poolable: bool
+    y: np.ndarray = field(repr=False, default=None)
+
+
+# ---------------------------------------------------------------------------
+# Folds and matrices
+# ---------------------------------------------------------------------------
+
+
+def _positions(mask: np.ndarray, rows: Optional[np.ndarray] = None) -> Positions:
+    """Frame positions where ``mask`` is set; a slice when contiguous."""
+    idx = np.flatnonzero(mask)
+    if rows is not None:
+        idx = rows[idx]
+    if idx.size and idx[-1] - idx[0] + 1 == idx.size:
+        return slice(int(idx[0]), int(idx[-1]) + 1)
+    return idx
+
+
+def build_folds(
+    seasons: np.ndarray,
+    val_seasons: Sequence[int],
+    min_train_seasons: int = 1,
+    rows: Optional[np.ndarray] = None,
+) -> List[_Fold]:
+    """Expanding-window folds: train on seasons < v, validate on v.
+
+    Args:
+        seasons: Season of every frame row.
+        val_seasons: Seasons to validate on, in order.
+        min_train_seasons: Minimum distinct training seasons per fold.
+        rows: Optional frame positions to restrict the folds to.
+
+    Returns:
+        Folds whose train/val positions index the full frame.
+
+    Raises:
+        ValueError: If a validation season equals HOLDOUT_SEASON.
+    """
+    subset = seasons if rows is None else seasons[rows]
+    folds: List[_Fold] = []
+    for val_season in val_seasons:
+        if val_season == HOLDOUT_SEASON:
+            raise ValueError(
+                f"Validation season {val_season} equals HOLDOUT_SEASON "
+                f"{HOLDOUT_SEASON}. The holdout season must never be used "
+                "during cross-validation."
+            )
+        train_mask = subset < val_season
+        val_mask = subset == val_season
+        train_size, val_size = int(train_mask.sum()), int(val_mask.sum())
+        if not train_size or not val_size:
+            continue
+
+        train_seasons = sorted(np.unique(subset[train_mask]).tolist())
+        if len(train_seasons) < min_train_seasons:
+            logger.info(
+                f"Skipping fold val_season={val_season}: only {len(train_seasons)} "
+                f"training season(s) (need >= {min_train_seasons})"
+            )
+            continue
+        folds.append(
+            _Fold(
+                val_season=val_season,
+                train_seasons=train_seasons,
+                train=_positions(train_mask, rows),
+                val=_positions(val_mask, rows),
+                train_size=train_size,
+                val_size=val_size,
+            )
+        )
+    return folds
+
+
+def _matrix_dtype(model_factory: Callable[[], Any]) -> type:
+    module = type(model_factory()).__module__
+    return np.float32 if module.startswith(_FLOAT32_MODULES) else np.float64
+
+
+def _numeric_features(frame: pd.DataFrame, cols: Sequence[str]) -> bool:
+    """True when every feature column is a plain numpy bool/int/float."""
+    return all(
+        isinstance(dtype, np.dtype) and dtype.kind in "biuf"
+        for dtype in frame[list(cols)].dtypes
+    )
+
+
+def _picklable(*objs: Any) -> bool:
+    try:
+        pickle.dumps(objs)
+        return True
+    except Exception:
+        return False
+
+
+def _prepare(
+    jobs: Sequence[CvJob],
+) -> Tuple[List[_Prepared], Dict[Tuple[int, Tuple[str, ...], str], np.ndarray]]:
+    prepared: List[_Prepared] = []
+    matrices: Dict[Tuple[int, Tuple[str, ...], str], np.ndarray] = {}
+    for job in jobs:
+        folds = build_folds(
+            job.frame["season"].to_numpy(),
+            job.val_seasons,
+            job.min_train_seasons,
+            None if job.rows is None else np.asarray(job.rows, dtype=np.intp),
+        )
+        key = None
+        if folds and _numeric_features(job.frame, job.feature_cols):
+            dtype = _matrix_dtype(job.model_factory)
+            key = (id(job.frame), tuple(job.feature_cols), np.dtype(dtype).name)
+            if key not in matrices:
+                matrices[key] = job.frame[list(job.feature_cols)].to_numpy(dtype=dtype)
+        prepared.append(
+            _Prepared(
+                job=job,
+                folds=folds,
+                matrix_key=key,
+                poolable=key is not None
+                and _picklable(job.model_factory, job.fit_kwargs_fn),
+                y=job.frame[job.target_col].to_numpy(),
+            )
+        )
+    return prepared, matrices
+
+
+# ---------------------------------------------------------------------------
+# Fold execution
+# ---------------------------------------------------------------------------
+
+
+def _reset_peak_rss() -> bool:
+    """Reset the kernel's peak-RSS counter for this process (Linux only)."""
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+        return True
+    except OSError:
+        return False
+
+
+def _peak_rss_mb() -> Optional[float]:
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return round(int(line.split()[1]) / 1024, 1)
+    except (OSError, ValueError, IndexError):
+        pass
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is bytes on macOS, kilobytes elsewhere.
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+def _fit_fold(
+    X: Union[np.ndarray, pd.DataFrame],
+    columns: Sequence[str],
+    y: np.ndarray,
+    fold: _Fold,
+    model_factory: Callable[[], Any],
+    fit_kwargs_fn: Optional[Callable],
+) -> Tuple[np.ndarray, float, float, Optional[float]]:
+    """Train on ``fold.train`` rows, predict ``fold.val`` rows."""
+    start = time.perf_counter()
+    _reset_peak_rss()
+    if isinstance(X, pd.DataFrame):
+        X_train = X.iloc[fold.train]
+        X_val = X.iloc[fold.val]
+    else:
+        # float64 blocks go column-major, as pandas stores them: BLAS-backed
+        # estimators (RidgeCV) then sum in the same order as on the frame.
+        layout = np.asfortranarray if X.dtype == np.float64 else np.asarray
+        X_train = pd.DataFrame(layout(X[fold.train]), columns=columns, copy=False)
+        X_val = pd.DataFrame(layout(X[fold.val]), columns=columns, copy=False)
+    y_train = pd.Series(y[fold.train])
+    y_val = pd.Series(y[fold.val])
+
+    model = model_factory()
+    fit_kw: Dict[str, Any] = {}
+    if fit_kwargs_fn is not None:
+        fit_kw = fit_kwargs_fn(X_train, y_train, X_val, y_val)
+    model.fit(X_train, y_train, **fit_kw)
+
+    preds = np.asarray(model.predict(X_val))
+    mae = float(mean_absolute_error(y_val, preds))
+    return preds, mae, time.perf_counter() - start, _peak_rss_mb()
+
+
+def _pool_fold(
+    matrix_path: str,
+    columns: Sequence[str],
+    y: np.ndarray,
+    fold: _Fold,
+    model_factory: Callable[[], Any],
+    fit_kwargs_fn: Optional[Callable],
+) -> Tuple[np.ndarray, float, float, Optional[float]]:
+    """Pool worker: memory-map the shared matrix and fit one fold."""
+    X = np.load(matrix_path, mmap_mode="r")
+    return _fit_fold(X, columns, y, fold, model_factory, fit_kwargs_fn)
+
+
+def _init_worker(threads: int) -> None:
+    """Cap OpenMP/BLAS threads in a pool worker."""
+    for var in _THREAD_ENV_VARS:
+        os.environ[var] = str(threads)
+    try:
+        from threadpoolctl import threadpool_limits
+
+        threadpool_limits(limits=threads)
+    except ImportError:  # pragma: no cover — threadpoolctl ships with sklearn
+        pass
+
+
+def _threads_per_worker(in_flight: int, threads: Optional[int]) -> int:
+    if threads:
+        return max(1, threads)
+    return max(1, (os.cpu_count() or 1) // in_flight)
+
+
+# ---------------------------------------------------------------------------
+# Public API
+# ---------------------------------------------------------------------------
+
+
+def run_cv_jobs(
+    jobs: Sequence[CvJob],
+    workers: Optional[int] = None,
+    threads_per_worker: Optional[int] = None,
+    fold_mb: Optional[int] = None,
+    scratch_dir: Optional[str] = None,
+) -> List[List[FoldResult]]:
+    """Run walk-forward CV for every job, sharing feature matrices.
+
+    Args:
+        jobs: CV jobs (model family x target). Jobs on the same frame and
+            feature set share one matrix per dtype.
+        workers: Fold processes; default ``CV_WORKERS``. 1 runs every fold
+            in this process.
+        threads_per_worker: OpenMP/BLAS threads per pool worker; default
+            ``CV_THREADS_PER_WORKER`` or, when 0, cpu_count / workers.
+        fold_mb: Per-fold memory estimate capping concurrent folds
+            (default ``CV_FOLD_MB``).
+        scratch_dir: Parent dir for the shared ``.npy`` matrices.
+
+    Returns:
+        One list of :class:`FoldResult` per job, in validation-season order.
+        Fold predictions are identical to fitting the same folds serially.
+
+    Raises:
+        ValueError: If any job validates on HOLDOUT_SEASON.
+    """
+    workers = CV_WORKERS if workers is None else workers
+    fold_mb = CV_FOLD_MB if fold_mb is None else fold_mb
+    threads_per_worker = threads_per_worker or CV_THREADS_PER_WORKER
+
+    prepared, matrices = _prepare(jobs)
+    results: List[List[Optional[FoldResult]]] = [
+        [None] * len(p.folds) for p in prepared
+    ]
+    tasks = [(j, f) for j, p in enumerate(prepared) for f in range(len(p.folds))]
+    pooled = [(j, f) for j, f in tasks if prepared[j].poolable]
+    in_flight = resolve_in_flight(workers, len(pooled), fold_mb)
+
+    def record(j: int, f: int, outcome: Tuple) -> None:
+        preds, mae, seconds, peak = outcome
+        fold = prepared[j].folds[f]
+        val = fold.val
+        val_positions = (
+            np.arange(val.start, val.stop) if isinstance(val, slice) else val
+        )
+        results[j][f] = FoldResult(
+            val_season=fold.val_season,
+            train_seasons=fold.train_seasons,
+            train_size=fold.train_size,
+            val_size=fold.val_size,
+            val_positions=val_positions,
+            predictions=preds,
+            mae=mae,
+            seconds=seconds,
+            peak_rss_mb=peak,
+        )
+        logger.info(
+            "CV %s val_season=%d: MAE=%.3f (%d train rows, %.1fs, peak %s MB)",
+            prepared[j].job.target_col,
+            fold.val_season,
+            mae,
+            fold.train_size,
+            seconds,
+            peak,
+        )
+
+    def run_local(j: int, f: int) -> None:
+        p = prepared[j]
+        X = (
+            matrices[p.matrix_key]
+            if p.matrix_key is not None
+            else p.job.frame[list(p.job.feature_cols)]
+        )
+        record(
+            j,
+            f,
+            _fit_fold(
+                X,
+                p.job.feature_cols,
+                p.y,
+                p.folds[f],
+                p.job.model_factory,
+                p.job.fit_kwargs_fn,
+            ),
+        )
+
+    if in_flight <= 1:
+        for j, f in tasks:
+            run_local(j, f)
+        return results
+
+    scratch = tempfile.mkdtemp(prefix="walk_forward_", dir=scratch_dir)
+    try:
+        paths: Dict[Tuple[int, Tuple[str, ...], str], str] = {}
+        for n, key in enumerate({prepared[j].matrix_key for j, _ in pooled}):
+            paths[key] = os.path.join(scratch, f"matrix_{n}.npy")
+            np.save(paths[key], matrices[key])
+
+        threads = _threads_per_worker(in_flight, threads_per_worker)
+        logger.info(
+            "Walk-forward CV: %d folds on %d processes (%d threads each)",
+            len(pooled),
+            in_flight,
+            threads,
+        )
+        context = multiprocessing.get_context(
+            "forkserver"
+            if "forkserver" in multiprocessing.get_all_start_methods()
+            else "spawn"
+        )
+        with ProcessPoolExecutor(
+            max_workers=in_flight,
+            mp_context=context,
+            initializer=_init_worker,
+            initargs=(threads,),
+        ) as pool:
+            running = {}
+            waiting = list(pooled)
+            try:
+                while waiting or running:
+                    while waiting and len(running) < in_flight:
+                        j, f = waiting.pop(0)
+                        p = prepared[j]
+                        future = pool.submit(
+                            _pool_fold,
+                            paths[p.matrix_key],
+                            p.job.feature_cols,
+                            p.y,
+                            p.folds[f],
+                            p.job.model_factory,
+                            p.job.fit_kwargs_fn,
+                        )
+                        running[future] = (j, f)
+                    done, _ = wait(list(running), return_when=FIRST_COMPLETED)
+                    for future in done:
+                        j, f = running.pop(future)
+                        record(j, f, future.result())
+            except BaseException:
+                pool.shutdown(wait=True, cancel_futures=True)
+                raise
+        # Jobs that cannot cross a process boundary run here.
+        local = [(j, f) for j, f in tasks if not prepared[j].poolable]
+        if local:
+            logger.warning(
+                "Walk-forward CV: %d folds run in-process (unpicklable model "
+                "factory or non-numeric features)",
+                len(local),
+            )
+        for j, f in local:
+            run_local(j, f)
+    finally:
+        shutil.rmtree(scratch, ignore_errors=True)
+    return results
@@ -28,21 +28,21 @@ Conservative polling
 --------------------
 Yahoo applies undocumented throttling and returns **HTTP 999** when a client
 polls too aggressively. Callers (the live engine) MUST poll conservatively —
-no faster than ~once every 5-10 seconds — and back off on any error. All fetch
-helpers honour the project-wide D-06 fail-open contract: a throttle/blip yields
+no faster than ~once every 5-10 seconds — and back off on any error. The
+shared :mod:`src.http_client` enforces a per-host rate limit for Yahoo and,
+after a 999, a cooldown during which requests fail fast. All fetch helpers
+honour the project-wide D-06 fail-open contract: a throttle/blip yields
 empty data and a stale-but-usable :class:`DraftState`, never an exception.
 """
 
 from __future__ import annotations
 
-import json
 import logging
 from typing import Any, Dict, Iterable, List, Optional, Tuple
-from urllib.error import HTTPError, URLError
-from urllib.request import Request, urlopen
 
 from src.config import ROSTER_CONFIGS, SCORING_CONFIGS
 from src.draft_models import DraftState, PickEvent
+from src.http_client import get_client
 from src.yahoo_oauth import YahooOAuth
 
 logger = logging.getLogger(__name__)
@@ -102,38 +102,18 @@ def fetch_yahoo_json(
 
     sep = "&" if "?" in path else "?"
     url = f"{API_BASE_URL}{path}{sep}format=json"
-    req = Request(
+    # 999 = Yahoo throttling; 401 = token died mid-session. The shared
+    # client spaces requests to Yahoo and, after a 999, fails fast for a
+    # cooldown instead of re-triggering the throttle.
+    data = get_client().get_json(
         url,
         headers={
             "User-Agent": _USER_AGENT,
             "Authorization": f"Bearer {token}",
         },
+        timeout=timeout,
+        label="Yahoo",
     )
-    try:
-        with urlopen(req, timeout=timeout) as resp:
-            raw = resp.read()
-    except HTTPError as exc:
-        # 999 = Yahoo throttling; 401 = token died mid-session.
-        logger.warning("Yahoo HTTP %d for %s — fail-open returning {}", exc.code, url)
-        return {}
-    except URLError as exc:
-        logger.warning(
-            "Yahoo network error for %s: %s — fail-open returning {}", url, exc.reason
-        )
-        return {}
-    except (TimeoutError, OSError) as exc:
-        logger.warning(
-            "Yahoo transport error for %s: %s — fail-open returning {}", url, exc
-        )
-        return {}
-
-    try:
-        data = json.loads(raw)
-    except json.JSONDecodeError as exc:
-        logger.warning(
-            "Yahoo invalid JSON from %s: %s — fail-open returning {}", url, exc
-        )
-        return {}
     return data if isinstance(data, dict) else {}
 
 
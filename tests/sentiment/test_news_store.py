@@ -0,0 +1,277 @@
+"""Tests for the columnar news store (``src/sentiment/storage/news_store.py``).
+
+Every test builds a hermetic data dir under ``tmp_path``:
+
+* Store reads return exactly what parsing the JSON files returns, in the
+  same file order, for every table.
+* Files not compacted yet (new, or rewritten with a different size) are
+  served from the JSON tail; the next compaction appends a new part and
+  the newest part wins.
+* ``rewrite`` / ``max_parts`` fold all parts into one without losing rows.
+* ``since`` (pushed-down window filter) matches filtering in Python.
+* The news service answers identically with and without a store.
+"""
+
+from __future__ import annotations
+
+import json
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List
+
+import pytest
+
+from src.sentiment.storage.news_store import (
+    NewsStore,
+    compact_news_store,
+    default_store_dir,
+    parse_published_at,
+    read_json_records,
+)
+
+
+# ---------------------------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------------------------
+
+
+def _bronze_doc(i: int, published_at: str) -> Dict[str, Any]:
+    return {
+        "external_id": f"doc-{i}",
+        "title": f"Headline {i}",
+        "source": "rss_espn",
+        "published_at": published_at,
+        "body_text": f"Body {i}",
+        "resolved_player_ids": [f"00-{i:07d}"],
+        "team_hint": "KC",
+    }
+
+
+def _signal(i: int, published_at: str) -> Dict[str, Any]:
+    return {
+        "signal_id": f"sig-{i}",
+        "doc_id": f"doc-{i}",
+        "player_id": f"00-{i:07d}",
+        "player_name": f"Player {i}",
+        "source": "rss_espn",
+        "sentiment_score": 0.1 * (i % 7) - 0.3,
+        "sentiment_confidence": 0.7,
+        "events": {"is_questionable": i % 2 == 0},
+        "published_at": published_at,
+        "raw_excerpt": f"Excerpt {i}",
+    }
+
+
+def _write(path: Path, payload: Any) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(payload), encoding="utf-8")
+    return path
+
+
+@pytest.fixture
+def data_dir(tmp_path: Path) -> Path:
+    data = tmp_path / "data"
+    bronze = data / "bronze" / "sentiment"
+    signals = data / "silver" / "sentiment" / "signals"
+    enriched = data / "silver" / "sentiment" / "signals_enriched"
+    stamps = [f"2026-0{m}-1{d}T12:00:00Z" for m in (5, 6, 7) for d in range(3)]
+    _write(
+        bronze / "rss" / "season=2026" / "rss_a.json",
+        {"items": [_bronze_doc(i, stamps[i]) for i in range(5)]},
+    )
+    _write(
+        bronze / "reddit" / "season=2025" / "reddit_a.json",
+        [_bronze_doc(i, stamps[i]) for i in range(5, 9)],
+    )
+    _write(bronze / "rss" / "season=2026" / "empty.json", {"items": []})
+    _write(
+        signals / "season=2026" / "week=01" / "signals_a.json",
+        {"records": [_signal(i, stamps[i]) for i in range(6)]},
+    )
+    _write(
+        signals / "season=2025" / "signals_flat.json",
+        [_signal(i, "not-a-date" if i == 7 else stamps[i]) for i in range(6, 9)],
+    )
+    _write(
+        enriched / "season=2026" / "week=01" / "enriched_a.json",
+        {"records": [{"doc_id": "doc-1", "summary": "Short summary"}]},
+    )
+    return data
+
+
+def _files(data: Path, table: str) -> List[Path]:
+    roots = {
+        "bronze": data / "bronze" / "sentiment",
+        "signals": data / "silver" / "sentiment" / "signals",
+        "enriched": data / "silver" / "sentiment" / "signals_enriched",
+    }
+    return sorted(roots[table].rglob("*.json"))
+
+
+def _parsed(table: str, files: List[Path]) -> List[Dict[str, Any]]:
+    return [rec for path in files for rec in (read_json_records(table, path) or [])]
+
+
+# ---------------------------------------------------------------------------
+# Parity
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.parametrize("table", ["bronze", "signals", "enriched"])
+def test_store_reads_match_json_parsing(data_dir: Path, table: str) -> None:
+    compacted = compact_news_store(data_dir)
+    assert compacted[table] == len(_files(data_dir, table))
+
+    store = NewsStore(default_store_dir(data_dir), data_dir)
+    files = _files(data_dir, table)
+    assert set(store.coverage(table)) == {
+        p.relative_to(data_dir).as_posix() for p in files
+    }
+    assert store.load_records(table, files) == _parsed(table, files)
+    # Caller-chosen file order is honored, not store (published_at) order.
+    reversed_files = files[::-1]
+    assert store.load_records(table, reversed_files) == _parsed(table, reversed_files)
+
+
+def test_no_store_reads_everything_as_tail(data_dir: Path) -> None:
+    store = NewsStore(default_store_dir(data_dir), data_dir)
+    files = _files(data_dir, "bronze")
+    assert store.coverage("bronze") == {}
+    assert store.load_records("bronze", files) == _parsed("bronze", files)
+
+
+def test_second_compaction_is_a_noop(data_dir: Path) -> None:
+    compact_news_store(data_dir)
+    assert compact_news_store(data_dir) == {"bronze": 0, "signals": 0, "enriched": 0}
+    assert len(list((default_store_dir(data_dir) / "bronze").glob("*.parquet"))) == 1
+
+
+# ---------------------------------------------------------------------------
+# Tail + append-only parts
+# ---------------------------------------------------------------------------
+
+
+def test_new_and_rewritten_files_are_tail_until_next_compaction(
+    data_dir: Path,
+) -> None:
+    compact_news_store(data_dir)
+    bronze = data_dir / "bronze" / "sentiment"
+    _write(
+        bronze / "rss" / "season=2026" / "rss_b.json",
+        {"items": [_bronze_doc(20, "2026-08-01T00:00:00Z")]},
+    )
+    _write(
+        bronze / "rss" / "season=2026" / "rss_a.json",
+        {"items": [_bronze_doc(i, "2026-08-02T00:00:00Z") for i in range(3)]},
+    )
+
+    store = NewsStore(default_store_dir(data_dir), data_dir)
+    files = _files(data_dir, "bronze")
+    assert store.load_records("bronze", files) == _parsed("bronze", files)
+
+    assert compact_news_store(data_dir, tables=["bronze"]) == {"bronze": 2}
+    parts = list((default_store_dir(data_dir) / "bronze").glob("*.parquet"))
+    assert len(parts) == 2
+    assert store.load_records("bronze", files) == _parsed("bronze", files)
+
+
+@pytest.mark.parametrize("kwargs", [{"rewrite": True}, {"max_parts": 2}])
+def test_folding_parts_keeps_every_record(data_dir: Path, kwargs) -> None:
+    compact_news_store(data_dir)
+    _write(
+        data_dir / "bronze" / "sentiment" / "rss" / "season=2026" / "rss_b.json",
+        {"items": [_bronze_doc(30, "2026-09-01T00:00:00Z")]},
+    )
+    compact_news_store(data_dir, tables=["bronze"])
+    compact_news_store(data_dir, tables=["bronze"], **kwargs)
+
+    parts = list((default_store_dir(data_dir) / "bronze").glob("*.parquet"))
+    assert len(parts) == 1
+    store = NewsStore(default_store_dir(data_dir), data_dir)
+    files = _files(data_dir, "bronze")
+    assert len(store.coverage("bronze")) == len(files)
+    assert store.load_records("bronze", files) == _parsed("bronze", files)
+
+
+def test_files_outside_data_dir_are_never_served_from_store(
+    data_dir: Path, tmp_path: Path
+) -> None:
+    compact_news_store(data_dir)
+    # Same relative layout, different root (e.g. a test fixture tree).
+    other = tmp_path / "elsewhere" / "bronze" / "sentiment" / "rss" / "season=2026"
+    path = _write(other / "rss_a.json", {"items": [_bronze_doc(99, "2026-01-01")]})
+    store = NewsStore(default_store_dir(data_dir), data_dir)
+    assert store.load_records("bronze", [path]) == read_json_records("bronze", path)
+
+
+# ---------------------------------------------------------------------------
+# Window pushdown
+# ---------------------------------------------------------------------------
+
+
+def test_since_filter_matches_python_filtering(data_dir: Path) -> None:
+    compact_news_store(data_dir, tables=["signals"])
+    _write(
+        data_dir
+        / "silver"
+        / "sentiment"
+        / "signals"
+        / "season=2026"
+        / "week=02"
+        / "signals_tail.json",
+        [_signal(40, "2026-07-20T08:00:00+00:00"), _signal(41, "2026-05-01")],
+    )
+    since = datetime(2026, 6, 11, 12, 0, tzinfo=timezone.utc)
+    files = _files(data_dir, "signals")
+
+    expected = [
+        rec
+        for rec in _parsed("signals", files)
+        if (ts := parse_published_at(rec.get("published_at"))) and ts >= since
+    ]
+    store = NewsStore(default_store_dir(data_dir), data_dir)
+    got = store.load_records("signals", files, since=since)
+    assert got == expected
+    assert sorted(r["signal_id"] for r in got) == [
+        "sig-4",
+        "sig-40",
+        "sig-5",
+        "sig-6",
+        "sig-8",
+    ]
+
+
+# ---------------------------------------------------------------------------
+# Service integration
+# ---------------------------------------------------------------------------
+
+
+def test_news_service_identical_with_and_without_store(
+    data_dir: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from web.api.services import news_service
+
+    silver = data_dir / "silver" / "sentiment"
+    monkeypatch.setattr(
+        news_service, "_BRONZE_SENTIMENT_DIR", data_dir / "bronze" / "sentiment"
+    )
+    monkeypatch.setattr(news_service, "_SILVER_SIGNALS_DIR", silver / "signals")
+    monkeypatch.setattr(
+        news_service, "_SILVER_ENRICHED_DIR", silver / "signals_enriched"
+    )
+    monkeypatch.setattr(news_service, "_NEWS_STORE_DIR", default_store_dir(data_dir))
+    monkeypatch.setattr(news_service, "DATA_DIR", data_dir)
+
+    def _answers():
+        return (
+            news_service.get_news_feed(2026, None, None, None, None),
+            news_service.get_news_feed(2026, 1, None, "KC", None, limit=2, offset=1),
+            news_service.get_player_news("00-0000002", 2026, 1),
+        )
+
+    before = _answers()
+    assert before[0] and before[2]
+    compact_news_store(data_dir)
+    assert _answers() == before
+    # Enrichment from the sidecar reached the feed either way.
+    assert any(item.get("summary") == "Short summary" for item in before[0])
@@ -332,6 +332,32 @@ class TestMockDraft:
 
         assert pick_numbers == [1, 2, 3, 4]
 
+    def test_mock_batch(self):
+        """POST /api/draft/mock/batch returns draft-slot and VORP distributions."""
+        body = {"n_teams": 4, "user_pick": 2, "n_drafts": 50, "seed": 3, "rounds": 4}
+        resp = client.post("/api/draft/mock/batch", json=body)
+        assert resp.status_code == 200
+        data = resp.json()
+        assert data["n_drafts"] == 50
+        assert data["user_picks"] == [2, 7, 10, 15]
+        assert len(data["players"]) == 20
+        assert sum(p["p_user"] for p in data["players"]) == pytest.approx(4)
+        assert data["roster_vorp"]["p10"] <= data["roster_vorp"]["p90"]
+        assert {r["round"] for r in data["rounds"]} == {1, 2, 3, 4}
+
+        again = client.post("/api/draft/mock/batch", json=body).json()
+        assert again["players"] == data["players"]
+
+    def test_mock_batch_rejects_oversized_rounds_and_negative_seed(self):
+        for extra in ({"rounds": 31}, {"rounds": 10**6}, {"seed": -1}):
+            body = {"n_teams": 4, "user_pick": 2, "n_drafts": 10, **extra}
+            resp = client.post("/api/draft/mock/batch", json=body)
+            assert resp.status_code == 422
+
+    def test_mock_batch_invalid_pick(self):
+        resp = client.post("/api/draft/mock/batch", json={"n_teams": 8, "user_pick": 9})
+        assert resp.status_code == 400
+
     def test_mock_pick_invalid_session(self):
         """POST /api/draft/mock/pick with bad session returns 404."""
         resp = client.post(
@@ -1105,6 +1131,37 @@ class TestPositionWait:
                 round(expected_vorp, 1), abs=0.05
             )
 
+    def test_position_wait_curve_covers_remaining_user_picks(self):
+        """expected_best_vorp_by_pick holds one entry per remaining user pick
+        (12-team snake from slot 1: 1, 24, 25, 48, ...), led by the next pick
+        and matching the scalar expectation at every pick."""
+        from draft_availability import expected_best_vorp_at_pick
+
+        session = self._banded_adp_session()
+        sid = session["session_id"]
+        resp = client.get(
+            "/api/draft/recommendations",
+            params={"session_id": sid, "top_n": 5, "user_pick": 1},
+        )
+        assert resp.status_code == 200, resp.text
+        data = resp.json()
+
+        from web.api.routers import draft as draft_module
+
+        board = draft_module._sessions[sid]["board"]
+        n_rounds = sum(board.roster_config.values())
+        assert data["position_wait"]
+        for pw in data["position_wait"]:
+            curve = {int(k): v for k, v in pw["expected_best_vorp_by_pick"].items()}
+            assert len(curve) == n_rounds
+            assert list(curve)[:4] == [1, 24, 25, 48]
+            assert curve[1] == pw["expected_best_next_vorp"]
+            for pick_no in (24, 25):
+                expected = expected_best_vorp_at_pick(board.available, pick_no)
+                assert curve[pick_no] == pytest.approx(
+                    round(expected[pw["position"]], 1), abs=0.05
+                )
+
 
 # ---------------------------------------------------------------------------
 # Feature 2: floor/ceiling bands, strategy re-rank, roster_risk
@@ -14,6 +14,7 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
 
 from draft_availability import (  # noqa: E402
     expected_best_vorp_at_pick,
+    expected_best_vorp_at_picks,
     prob_gone_before,
     prob_gone_before_vectorized,
 )
@@ -255,3 +256,65 @@ def test_expected_best_vorp_no_stdev_column_uses_fallback():
     result = expected_best_vorp_at_pick(df, pick_number=15)
     survive = 1.0 - prob_gone_before(15, 10.0, None)
     assert result["RB"] == pytest.approx(survive * 30.0, abs=1e-9)
+
+
+# ---------------------------------------------------------------------------
+# expected_best_vorp_at_picks -- batched cost-of-waiting curve
+# ---------------------------------------------------------------------------
+
+
+def _random_pool(rng: np.random.Generator, n: int) -> pd.DataFrame:
+    """Pool with VORP ties, missing values and invalid stdevs mixed in."""
+    return pd.DataFrame(
+        {
+            "position": rng.choice(["QB", "RB", "WR", "TE"], n),
+            "vorp": rng.choice([np.nan, 5.0, 10.0, 20.0, *rng.normal(30, 15, 6)], n),
+            "adp_rank": rng.choice([np.nan, 3.0, *rng.uniform(1, 200, 8)], n),
+            "adp_stdev": rng.choice([np.nan, -1.0, 0.0, np.inf, 2.0, 9.0, 20.0], n),
+        }
+    )
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_expected_best_vorp_at_picks_matches_scalar_exactly(seed):
+    rng = np.random.default_rng(seed)
+    df = _random_pool(rng, 80)
+    picks = [1, 12, 13, 24, 25, 60, 61, 150, 250]
+
+    curve = expected_best_vorp_at_picks(df, picks)
+
+    assert list(curve.index) == picks
+    for pick in picks:
+        scalar = expected_best_vorp_at_pick(df, pick)
+        assert set(curve.columns) == set(scalar)
+        for pos, value in scalar.items():
+            # Same ordering, walk cap and accumulation order -> bit-identical.
+            assert curve.loc[pick, pos] == value
+
+
+def test_expected_best_vorp_at_picks_no_stdev_column_matches_scalar():
+    df = _random_pool(np.random.default_rng(7), 40).drop(columns=["adp_stdev"])
+    curve = expected_best_vorp_at_picks(df, [10, 50])
+    for pick in (10, 50):
+        for pos, value in expected_best_vorp_at_pick(df, pick).items():
+            assert curve.loc[pick, pos] == value
+
+
+def test_expected_best_vorp_at_picks_omits_positions_without_candidates():
+    df = pd.DataFrame(
+        {
+            "position": ["RB", "K"],
+            "vorp": [30.0, np.nan],
+            "adp_rank": [10.0, 150.0],
+        }
+    )
+    curve = expected_best_vorp_at_picks(df, [5, 20])
+    assert list(curve.columns) == ["RB"]
+
+
+def test_expected_best_vorp_at_picks_degenerate_inputs_return_empty():
+    df = pd.DataFrame({"position": ["RB"], "vorp": [10.0]})  # no adp_rank
+    assert expected_best_vorp_at_picks(df, [1, 2]).empty
+    assert expected_best_vorp_at_picks(pd.DataFrame(), [1, 2]).empty
+    full = pd.DataFrame({"position": ["RB"], "vorp": [10.0], "adp_rank": [5.0]})
+    assert expected_best_vorp_at_picks(full, []).empty
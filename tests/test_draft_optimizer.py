@@ -223,6 +223,88 @@ class TestDraftAdvisor(unittest.TestCase):
             self.assertNotIn(name, waiver_names)
 
 
+class TestArrayBackedBoard(unittest.TestCase):
+    """The pick-indexed board must answer exactly like a full-frame scan."""
+
+    def _make_board(self):
+        proj = _make_projections(60)
+        rng = np.random.default_rng(0)
+        adp = pd.DataFrame(
+            {
+                "player_name": proj["player_name"],
+                "adp_rank": rng.permutation(60) + 1,
+            }
+        )
+        enriched = compute_value_scores(proj, adp_df=adp)
+        return DraftBoard(enriched, roster_format="standard", n_teams=10)
+
+    @staticmethod
+    def _full_scan(board):
+        """top_candidates replacement returning every eligible available row."""
+
+        def candidates(*args, position_filter=None, **kwargs):
+            avail = board.available.copy()
+            if position_filter is not None:
+                avail = avail[avail["position"].map(position_filter).astype(bool)]
+            return avail.reset_index(drop=True)
+
+        return candidates
+
+    def test_available_view_tracks_picks(self):
+        board = self._make_board()
+        order = list(board.all_players["player_id"])
+        for pid in order[5:40:3]:
+            board.draft_player(pid, by_me=False)
+        expected = board.all_players[
+            ~board.all_players["player_id"].isin(order[5:40:3])
+        ].reset_index(drop=True)
+        pd.testing.assert_frame_equal(board.available, expected)
+        self.assertEqual(board.available_count(), len(expected))
+
+    def test_recommend_and_best_available_match_full_scan(self):
+        board = self._make_board()
+        fast = DraftAdvisor(board)
+        rng = np.random.default_rng(1)
+        for _ in range(40):
+            recs, reasoning = fast.recommend(top_n=5)
+            best = fast.best_available(top_n=6, positions=["RB", "TE"])
+
+            board.top_candidates = self._full_scan(board)
+            try:
+                exp_recs, exp_reasoning = fast.recommend(top_n=5)
+                exp_best = fast.best_available(top_n=6, positions=["RB", "TE"])
+            finally:
+                del board.top_candidates
+            pd.testing.assert_frame_equal(recs, exp_recs)
+            pd.testing.assert_frame_equal(best, exp_best)
+            self.assertEqual(reasoning, exp_reasoning)
+
+            ids = board.available["player_id"].tolist()
+            pick = recs.iloc[0]["player_id"] if rng.random() < 0.5 else ids[-1]
+            board.draft_player(pick, by_me=bool(rng.random() < 0.3))
+
+    def test_build_queue_restores_board(self):
+        board = self._make_board()
+        advisor = DraftAdvisor(board)
+        board.draft_player("p3", by_me=True)
+        before = board.available.copy()
+        first = advisor.build_queue(depth=6)
+        pd.testing.assert_frame_equal(board.available, before)
+        self.assertEqual(len(board.my_roster), 1)
+        self.assertEqual(advisor.build_queue(depth=6), first)
+
+    def test_reset_and_reassign_available(self):
+        board = self._make_board()
+        board.draft_player("p0", by_me=True)
+        board.reset_available()
+        pd.testing.assert_frame_equal(board.available, board.all_players)
+
+        board.draft_player("p1", by_me=False)
+        board.available = board.all_players.head(10).copy()
+        self.assertEqual(board.available_count(), 10)
+        self.assertEqual(board.draft_player("p1")["player_id"], "p1")
+        self.assertEqual(board.draft_player("p20"), {})
+
 if __name__ == "__main__":
     unittest.main()
 
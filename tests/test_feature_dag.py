@@ -0,0 +1,157 @@
+"""Tests for the dependency-aware feature DAG runner (src/feature_dag.py)."""
+
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from feature_dag import (  # noqa: E402
+    DagTask,
+    code_fingerprint,
+    dag_fingerprints,
+    file_fingerprint,
+    run_dag,
+)
+
+
+def _load(season: int) -> pd.DataFrame:
+    rng = np.random.default_rng(season)
+    n = 6 + season % 5
+    return pd.DataFrame(
+        {
+            "player_id": [f"{season}-{i}" for i in range(n)],
+            "season": season,
+            "value": rng.normal(size=n),
+            "team": pd.Categorical(["KC", "BUF", "DET"] * n)[:n],
+        }
+    )
+
+
+def _total(frame: pd.DataFrame, scale: float = 1.0) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "season": [int(frame["season"].iloc[0])],
+            "total": [frame["value"].sum() * scale],
+        }
+    )
+
+
+def _history(frames, current: pd.DataFrame) -> pd.DataFrame:
+    hist = pd.concat(frames, ignore_index=True)
+    return pd.DataFrame(
+        {"season": [int(current["season"].iloc[0])], "rows": [len(hist)]}
+    )
+
+
+def _mixed(frame: pd.DataFrame) -> pd.DataFrame:
+    # Mixed-type object column: not Arrow-representable, pickled instead.
+    return pd.DataFrame({"x": [1, "a", 2.5], "n": len(frame)})
+
+
+def _boom(frame: pd.DataFrame) -> pd.DataFrame:
+    raise ValueError("bad group")
+
+
+def _tasks(seasons):
+    tasks = [DagTask(f"load@{s}", _load, kwargs={"season": s}) for s in seasons]
+    for s in seasons:
+        tasks.append(DagTask(f"total@{s}", _total, inputs=(f"load@{s}",)))
+        prior = tuple(f"load@{p}" for p in seasons if p <= s)
+        tasks.append(DagTask(f"history@{s}", _history, inputs=(prior, f"load@{s}")))
+    return tasks
+
+
+class TestRunDag:
+    def test_serial_runs_only_what_targets_need(self):
+        out = run_dag(_tasks([2020, 2021]), targets=["total@2021"])
+        assert list(out) == ["total@2021"]
+        expected = _load(2021)["value"].sum()
+        assert out["total@2021"]["total"].iloc[0] == pytest.approx(expected)
+
+    def test_list_inputs_receive_every_frame(self):
+        out = run_dag(_tasks([2019, 2020, 2021]), targets=["history@2021"])
+        rows = sum(len(_load(s)) for s in (2019, 2020, 2021))
+        assert out["history@2021"]["rows"].iloc[0] == rows
+
+    def test_pool_matches_serial(self, tmp_path):
+        tasks = _tasks([2018, 2019, 2020, 2021])
+        serial = run_dag(tasks)
+        pooled = run_dag(tasks, workers=3, scratch_dir=str(tmp_path))
+        assert set(serial) == set(pooled)
+        for key, frame in serial.items():
+            pd.testing.assert_frame_equal(frame, pooled[key])
+        # The run's scratch files are removed.
+        assert os.listdir(tmp_path) == []
+
+    def test_pool_handles_non_arrow_frames(self):
+        tasks = [
+            DagTask("load", _load, kwargs={"season": 2020}),
+            DagTask("mixed", _mixed, inputs=("load",)),
+        ]
+        out = run_dag(tasks, workers=2)
+        assert out["mixed"]["x"].tolist() == [1, "a", 2.5]
+
+    def test_on_result_receives_targets_instead_of_return(self):
+        seen = {}
+        out = run_dag(
+            _tasks([2020, 2021]),
+            targets=["total@2020", "total@2021"],
+            on_result=seen.__setitem__,
+        )
+        assert out == {}
+        assert sorted(seen) == ["total@2020", "total@2021"]
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_task_exception_propagates(self, workers):
+        tasks = [
+            DagTask("load", _load, kwargs={"season": 2020}),
+            DagTask("boom", _boom, inputs=("load",)),
+        ]
+        with pytest.raises(ValueError, match="bad group"):
+            run_dag(tasks, workers=workers)
+
+    def test_unknown_input_and_duplicate_key_rejected(self):
+        with pytest.raises(ValueError):
+            run_dag([DagTask("a", _total, inputs=("missing",))])
+        with pytest.raises(ValueError):
+            run_dag([DagTask("a", _load), DagTask("a", _load)])
+
+    def test_cycle_rejected(self):
+        tasks = [
+            DagTask("a", _total, inputs=("b",)),
+            DagTask("b", _total, inputs=("a",)),
+        ]
+        with pytest.raises(ValueError, match="[Cc]ycle"):
+            run_dag(tasks)
+
+
+class TestFingerprints:
+    def test_stable_across_calls(self):
+        assert dag_fingerprints(_tasks([2020, 2021])) == dag_fingerprints(
+            _tasks([2020, 2021])
+        )
+
+    def test_kwargs_change_propagates_downstream_only(self):
+        base = dag_fingerprints(_tasks([2020, 2021]))
+        tasks = _tasks([2020, 2021])
+        tasks[1] = DagTask("load@2021", _load, kwargs={"season": 2021}, salt="v2")
+        changed = dag_fingerprints(tasks)
+        assert changed["total@2020"] == base["total@2020"]
+        assert changed["history@2020"] == base["history@2020"]
+        assert changed["total@2021"] != base["total@2021"]
+        assert changed["history@2021"] != base["history@2021"]
+
+    def test_code_fingerprint_distinguishes_functions(self):
+        assert code_fingerprint(_total) != code_fingerprint(_history)
+        assert code_fingerprint(_total) == code_fingerprint(_total)
+
+    def test_file_fingerprint_tracks_contents(self, tmp_path):
+        path = tmp_path / "a.parquet"
+        path.write_bytes(b"one")
+        first = file_fingerprint([str(path)])
+        path.write_bytes(b"two")
+        assert file_fingerprint([str(path)]) != first
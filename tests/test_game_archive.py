@@ -364,6 +364,63 @@ class TestGetAvailableSeasons:
             assert seasons == sorted(seasons, reverse=True)
 
 
+class TestSeasonArchive:
+    """Tests for the memoized per-season player-week index."""
+
+    @patch("game_archive._load_schedules")
+    @patch("game_archive._load_player_weekly")
+    def test_home_away_and_result_join(self, mock_pw, mock_sched):
+        from game_archive import get_player_game_log
+
+        sched = _mock_schedule_df()
+        sched.loc[1, "home_score"] = np.nan  # GB @ PHI not final
+        mock_pw.return_value = _mock_player_weekly_multi_week()
+        mock_sched.return_value = sched
+
+        mahomes = get_player_game_log("00-0033873", 2024)
+        assert list(mahomes["home_away"]) == ["home", "unknown"]
+        assert list(mahomes["game_result"]) == ["W", "unknown"]
+
+        lamar = get_player_game_log("00-0034796", 2024)
+        assert lamar["home_away"].iloc[0] == "away"
+        assert lamar["game_result"].iloc[0] == "L"
+
+        love = get_player_game_log("00-0036264", 2024)
+        assert love["home_away"].iloc[0] == "away"
+        assert love["game_result"].iloc[0] == "unknown"
+
+    @patch("game_archive._load_schedules")
+    @patch("game_archive._load_player_weekly")
+    def test_archive_reused_until_frames_change(self, mock_pw, mock_sched):
+        import game_archive
+
+        pw = _mock_player_weekly_multi_week()
+        mock_pw.return_value = pw
+        mock_sched.return_value = _mock_schedule_df()
+
+        first = game_archive._season_archive(2024)
+        assert game_archive._season_archive(2024) is first
+
+        mock_pw.return_value = pw.iloc[:6].copy()
+        rebuilt = game_archive._season_archive(2024)
+        assert rebuilt is not first
+        assert len(rebuilt.frame) == 6
+
+    @patch("game_archive._load_schedules")
+    @patch("game_archive._load_player_weekly")
+    def test_loaded_frame_not_mutated(self, mock_pw, mock_sched):
+        from game_archive import get_game_player_stats, get_season_leaders
+
+        pw = _mock_player_weekly_multi_week()
+        before = pw.copy()
+        mock_pw.return_value = pw
+        mock_sched.return_value = _mock_schedule_df()
+
+        get_game_player_stats(2024, 1)
+        get_season_leaders(2024, scoring_format="standard")
+        pd.testing.assert_frame_equal(pw, before)
+
+
 # ---------------------------------------------------------------------------
 # API endpoint tests
 # ---------------------------------------------------------------------------
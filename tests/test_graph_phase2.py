@@ -348,6 +348,72 @@ class TestParseParticipation:
         assert len(offense) == 2
 
 
+# ---------------------------------------------------------------------------
+# Test: lineup table
+# ---------------------------------------------------------------------------
+
+
+class TestLineupTable:
+    """Tests for the int-coded per-play lineup table and its Bronze cache."""
+
+    def test_table_roundtrip_matches_parse(self, participation_df, rosters_df):
+        """Expanding the lineup table reproduces parse_participation_players."""
+        from graph_participation import (
+            build_lineup_table,
+            lineups_to_players,
+            parse_participation_players,
+        )
+
+        table = build_lineup_table(participation_df)
+        assert table.num_rows == len(participation_df)
+        # CSR offsets: one list entry per on-field player, 22 per play.
+        assert table.column("players").combine_chunks().value_lengths().to_pylist() == [
+            22
+        ] * len(participation_df)
+        pd.testing.assert_frame_equal(
+            lineups_to_players(table, rosters_df),
+            parse_participation_players(participation_df, rosters_df),
+        )
+
+    def test_offense_rows_precede_defense_rows(self, participation_df, rosters_df):
+        """Output order is every offense row, then every defense row."""
+        from graph_participation import parse_participation_players
+
+        sides = parse_participation_players(participation_df, rosters_df)["side"]
+        n_off = int((sides == "offense").sum())
+        assert (sides.iloc[:n_off] == "offense").all()
+        assert (sides.iloc[n_off:] == "defense").all()
+
+    def test_persisted_table_is_reused_until_bronze_changes(
+        self, tmp_path, participation_df, rosters_df
+    ):
+        """load_lineup_table writes once, memory-maps after, rebuilds on change."""
+        from graph_participation import lineup_table_path, load_lineup_table
+
+        season_dir = tmp_path / "pbp_participation" / "season=2024"
+        season_dir.mkdir(parents=True)
+        participation_df.to_parquet(season_dir / "pbp_participation_1.parquet")
+
+        first = load_lineup_table(2024, bronze_dir=str(tmp_path))
+        path = lineup_table_path(2024, bronze_dir=str(tmp_path))
+        assert os.path.exists(path)
+        mtime = os.path.getmtime(path)
+        again = load_lineup_table(2024, bronze_dir=str(tmp_path))
+        assert again.equals(first)
+        assert os.path.getmtime(path) == mtime
+
+        # A newer Bronze file (new ingest) invalidates the persisted table.
+        participation_df.iloc[:2].to_parquet(season_dir / "pbp_participation_2.parquet")
+        rebuilt = load_lineup_table(2024, bronze_dir=str(tmp_path))
+        assert rebuilt.num_rows == 2
+
+    def test_no_participation_returns_none(self, tmp_path):
+        """Seasons without Bronze participation have no lineup table."""
+        from graph_participation import load_lineup_table
+
+        assert load_lineup_table(2019, bronze_dir=str(tmp_path)) is None
+
+
 # ---------------------------------------------------------------------------
 # Test: identify_cbs_on_field
 # ---------------------------------------------------------------------------
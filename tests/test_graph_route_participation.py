@@ -251,6 +251,26 @@ class TestPlayerIDParsing:
         assert player_ids == {"A001", "B002"}
 
 
+    def test_parsed_participation_matches_string_split(
+        self, pbp_8_weeks, participation_one_absent_week4
+    ):
+        """Pre-parsed on-field rows give the same features as re-splitting."""
+        from graph_participation import parse_participation_players
+
+        parsed = parse_participation_players(
+            participation_one_absent_week4, pd.DataFrame()
+        )
+        expected = compute_route_participation(
+            pbp_8_weeks, participation_one_absent_week4
+        )
+        result = compute_route_participation(
+            pbp_8_weeks,
+            participation_one_absent_week4,
+            participation_parsed_df=parsed,
+        )
+        pd.testing.assert_frame_equal(result, expected)
+
+
 # ---------------------------------------------------------------------------
 # Tests: lagging correctness
 # ---------------------------------------------------------------------------
@@ -0,0 +1,271 @@
+"""Tests for the shared pooled HTTP client (``src/http_client.py``).
+
+Every test talks to a local stub HTTP/1.1 server on 127.0.0.1 (no network):
+
+* sequential requests reuse one keep-alive connection;
+* ETag / Last-Modified validators are sent back and a 304 replays the body;
+* 5xx is retried with backoff, 4xx is not;
+* a 999 puts the host into a cooldown during which nothing is sent;
+* per-host spacing and the fan-out API;
+* ``fetch_sleeper_json`` / ``get_json`` stay fail-open (D-06).
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Iterator, List
+
+import pytest
+
+from src import sleeper_http
+from src.http_client import (
+    HostLimit,
+    HostThrottled,
+    HttpClient,
+    HttpError,
+    fan_out,
+)
+
+
+# ---------------------------------------------------------------------------
+# Stub server
+# ---------------------------------------------------------------------------
+
+
+class _Stub:
+    """Scripted responses per path plus a log of what the server saw."""
+
+    def __init__(self) -> None:
+        self.routes: Dict[str, List[Dict[str, Any]]] = {}
+        self.seen: List[Dict[str, Any]] = []
+        self.lock = threading.Lock()
+
+    def script(self, path: str, *responses: Dict[str, Any]) -> None:
+        self.routes[path] = list(responses)
+
+    def next_response(self, path: str) -> Dict[str, Any]:
+        with self.lock:
+            queue = self.routes.get(path) or [{"status": 404}]
+            return queue.pop(0) if len(queue) > 1 else queue[0]
+
+
+def _handler(stub: _Stub):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self) -> None:  # noqa: N802 — http.server API
+            with stub.lock:
+                stub.seen.append(
+                    {
+                        "path": self.path,
+                        "port": self.client_address[1],
+                        "headers": dict(self.headers),
+                    }
+                )
+            spec = stub.next_response(self.path)
+            if spec.get("delay"):
+                time.sleep(spec["delay"])
+            etag = spec.get("etag")
+            if etag and self.headers.get("If-None-Match") == etag:
+                status, body = 304, b""
+            else:
+                status = spec.get("status", 200)
+                body = spec.get("body", b"")
+                if not isinstance(body, bytes):
+                    body = json.dumps(body).encode("utf-8")
+            self.send_response(status)
+            if etag:
+                self.send_header("ETag", etag)
+            for key, value in spec.get("headers", {}).items():
+                self.send_header(key, value)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args: Any) -> None:
+            pass
+
+    return Handler
+
+
+@pytest.fixture
+def stub() -> Iterator[_Stub]:
+    state = _Stub()
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _handler(state))
+    server.daemon_threads = True
+    thread = threading.Thread(
+        target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+    )
+    thread.start()
+    state.base = f"http://127.0.0.1:{server.server_address[1]}"
+    try:
+        yield state
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.fixture
+def client() -> Iterator[HttpClient]:
+    c = HttpClient(host_limits={}, retries=2, backoff_s=0.0)
+    try:
+        yield c
+    finally:
+        c.close()
+
+
+# ---------------------------------------------------------------------------
+# Pooling + conditional GET
+# ---------------------------------------------------------------------------
+
+
+def test_sequential_requests_reuse_one_connection(stub, client) -> None:
+    stub.script("/league", {"body": {"name": "L"}})
+    for _ in range(5):
+        assert client.get_json(f"{stub.base}/league") == {"name": "L"}
+    assert len(stub.seen) == 5
+    assert len({hit["port"] for hit in stub.seen}) == 1
+
+
+def test_etag_revalidation_replays_cached_body(stub, client) -> None:
+    stub.script("/rosters", {"body": [{"roster_id": 1}], "etag": '"v1"'})
+    first = client.request(f"{stub.base}/rosters")
+    second = client.request(f"{stub.base}/rosters")
+
+    assert not first.from_cache and second.from_cache
+    assert json.loads(second.body) == [{"roster_id": 1}]
+    assert "If-None-Match" not in stub.seen[0]["headers"]
+    assert stub.seen[1]["headers"]["If-None-Match"] == '"v1"'
+
+
+def test_last_modified_is_sent_back(stub, client) -> None:
+    stamp = "Wed, 21 Oct 2026 07:28:00 GMT"
+    stub.script("/users", {"body": [], "headers": {"Last-Modified": stamp}})
+    client.request(f"{stub.base}/users")
+    client.request(f"{stub.base}/users")
+    assert stub.seen[1]["headers"]["If-Modified-Since"] == stamp
+
+
+def test_conditional_cache_is_keyed_by_authorization(stub, client) -> None:
+    stub.script("/me", {"body": {"ok": 1}, "etag": '"a"'})
+    client.request(f"{stub.base}/me", headers={"Authorization": "Bearer one"})
+    client.request(f"{stub.base}/me", headers={"Authorization": "Bearer two"})
+    assert "If-None-Match" not in stub.seen[1]["headers"]
+
+
+# ---------------------------------------------------------------------------
+# Retries, throttling, spacing
+# ---------------------------------------------------------------------------
+
+
+def test_5xx_is_retried_then_succeeds(stub, client) -> None:
+    stub.script("/draft", {"status": 503}, {"status": 502}, {"body": {"ok": True}})
+    assert client.get_json(f"{stub.base}/draft") == {"ok": True}
+    assert len(stub.seen) == 3
+
+
+def test_retries_exhausted_raises_http_error(stub, client) -> None:
+    stub.script("/draft", {"status": 500})
+    with pytest.raises(HttpError) as excinfo:
+        client.request(f"{stub.base}/draft")
+    assert excinfo.value.code == 500
+    assert len(stub.seen) == 3  # one attempt + two retries
+
+
+def test_4xx_is_not_retried(stub, client) -> None:
+    stub.script("/missing", {"status": 404})
+    assert client.get_json(f"{stub.base}/missing") == {}
+    assert len(stub.seen) == 1
+
+
+def test_999_puts_host_in_cooldown(stub) -> None:
+    c = HttpClient(host_limits={"127.0.0.1": HostLimit(cooldown_s=60.0)})
+    stub.script("/league", {"status": 999})
+    assert c.get_json(f"{stub.base}/league", label="Yahoo") == {}
+    # The throttled host is not contacted again until the cooldown ends.
+    with pytest.raises(HostThrottled):
+        c.request(f"{stub.base}/league")
+    assert c.get_json(f"{stub.base}/league") == {}
+    assert len(stub.seen) == 1
+    c.close()
+
+
+def test_retry_after_bounds_the_cooldown(stub) -> None:
+    c = HttpClient(host_limits={"127.0.0.1": HostLimit(cooldown_s=60.0)})
+    stub.script("/x", {"status": 429, "headers": {"Retry-After": "0"}}, {"body": [1]})
+    assert c.get_json(f"{stub.base}/x") == {}
+    assert c.get_json(f"{stub.base}/x") == [1]
+    c.close()
+
+
+def test_min_interval_spaces_request_starts(stub) -> None:
+    c = HttpClient(host_limits={"127.0.0.1": HostLimit(min_interval_s=0.05)})
+    stub.script("/p", {"body": []})
+    start = time.perf_counter()
+    for _ in range(4):
+        c.get_json(f"{stub.base}/p")
+    assert time.perf_counter() - start >= 0.15
+    c.close()
+
+
+# ---------------------------------------------------------------------------
+# Fan-out
+# ---------------------------------------------------------------------------
+
+
+def test_fan_out_runs_calls_concurrently_in_order(stub, client) -> None:
+    for name in ("league", "users", "rosters", "drafts"):
+        stub.script(f"/{name}", {"body": {"name": name}, "delay": 0.2})
+    calls = [
+        lambda name=name: client.get_json(f"{stub.base}/{name}")
+        for name in ("league", "users", "rosters", "drafts")
+    ]
+    start = time.perf_counter()
+    results = fan_out(calls)
+    elapsed = time.perf_counter() - start
+
+    assert [r["name"] for r in results] == ["league", "users", "rosters", "drafts"]
+    assert elapsed < 0.6  # four 0.2s calls overlapped, not serialized
+
+
+def test_max_concurrency_caps_in_flight_requests(stub) -> None:
+    c = HttpClient(host_limits={"127.0.0.1": HostLimit(max_concurrency=1)})
+    stub.script("/slow", {"body": {}, "delay": 0.1})
+    start = time.perf_counter()
+    fan_out([lambda: c.get_json(f"{stub.base}/slow")] * 3)
+    assert time.perf_counter() - start >= 0.3
+    c.close()
+
+
+def test_fan_out_failed_call_yields_default() -> None:
+    def boom():
+        raise RuntimeError("network down")
+
+    assert fan_out([lambda: 1, boom, lambda: 3], default=[]) == [1, [], 3]
+
+
+# ---------------------------------------------------------------------------
+# Fail-open wrappers
+# ---------------------------------------------------------------------------
+
+
+def test_invalid_json_fails_open(stub, client) -> None:
+    stub.script("/bad", {"body": b"{not json"})
+    assert client.get_json(f"{stub.base}/bad") == {}
+
+
+def test_connection_refused_fails_open(client) -> None:
+    assert client.get_json("http://127.0.0.1:9/nothing-listens-here") == {}
+
+
+def test_fetch_sleeper_json_goes_through_shared_client(stub) -> None:
+    stub.script("/v1/league/1", {"body": {"league_id": "1"}})
+    assert sleeper_http.fetch_sleeper_json(f"{stub.base}/v1/league/1") == {
+        "league_id": "1"
+    }
+    assert stub.seen[0]["headers"]["User-Agent"].startswith("NFLDataEngineering")
+    stub.script("/v1/league/2", {"status": 404})
+    assert sleeper_http.fetch_sleeper_json(f"{stub.base}/v1/league/2") == {}
@@ -2,10 +2,15 @@
 
 from __future__ import annotations
 
+import numpy as np
 import pandas as pd
 import pytest
 
-from src.league_scoring import score_with_settings, unmodeled_offense_keys
+from src.league_scoring import (
+    ScoringEngine,
+    score_with_settings,
+    unmodeled_offense_keys,
+)
 from src.roster_optimizer import optimal_lineup
 
 # Mirrors the user's dynasty league: full PPR + TE premium + 6-pt pass TD.
@@ -116,3 +121,109 @@ def test_optimal_lineup_honors_roster_positions():
     assert s["FLEX"][0]["player_name"] == "TE2"
     # 8-man roster fills 8 of the (BN-excluded) 8 starting slots → no bench.
     assert lu["bench"] == []
+
+
+# --- batched scoring engine -------------------------------------------------
+
+_STATS = [
+    "passing_yards",
+    "passing_tds",
+    "interceptions",
+    "rushing_yards",
+    "rushing_tds",
+    "receptions",
+    "receiving_yards",
+    "receiving_tds",
+]
+_KEYS = [
+    "pass_yd",
+    "pass_td",
+    "pass_int",
+    "rush_yd",
+    "rush_td",
+    "rec",
+    "rec_yd",
+    "rec_td",
+]
+
+
+def _legacy_points(projections, settings):
+    """The per-league loop the engine replaced."""
+    points = pd.Series(0.0, index=projections.index)
+    for key, col in zip(_KEYS, _STATS):
+        weight = settings.get(key)
+        if weight and col in projections.columns:
+            points = points + projections[col].fillna(0) * float(weight)
+    te_bonus = settings.get("bonus_rec_te")
+    if te_bonus:
+        is_te = projections["position"].astype(str).str.upper() == "TE"
+        points = points + is_te.astype(float) * projections["receptions"].fillna(
+            0
+        ) * float(te_bonus)
+    return points.round(1)
+
+
+def _random_projections(n=400, seed=11):
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame(
+        {stat: rng.gamma(2.0, 30.0, size=n).round(2) for stat in _STATS},
+        index=rng.permutation(n) + 100,
+    )
+    df.insert(0, "position", rng.choice(["QB", "RB", "WR", "te", "K"], size=n))
+    df.loc[rng.random(n) < 0.1, "receptions"] = np.nan
+    df["projected_season_points"] = rng.normal(150, 40, size=n)
+    df["vorp"] = 0.0
+    return df
+
+
+@pytest.mark.unit
+def test_engine_matches_per_league_loop_bit_for_bit():
+    proj = _random_projections()
+    rng = np.random.default_rng(5)
+    leagues = {
+        f"L{i}": {
+            **{k: float(rng.choice([0, 0.04, 0.1, 0.5, 1, 4, 6, -2])) for k in _KEYS},
+            "bonus_rec_te": float(rng.choice([0, 0.5, 1.0])),
+        }
+        for i in range(25)
+    }
+    scored = ScoringEngine(proj).score_many(leagues)
+    for league_id, settings in leagues.items():
+        np.testing.assert_array_equal(
+            scored[league_id]["projected_season_points"].to_numpy(),
+            _legacy_points(proj, settings).to_numpy(),
+        )
+
+
+@pytest.mark.unit
+def test_engine_does_not_copy_or_modify_base_frame():
+    proj = _random_projections(50)
+    before = proj.copy()
+    out = score_with_settings(proj, _SETTINGS)
+    pd.testing.assert_frame_equal(proj, before)
+    # Unscored columns are shared, not copied.
+    assert np.shares_memory(
+        out["rushing_yards"].to_numpy(), proj["rushing_yards"].to_numpy()
+    )
+    assert list(out.columns) == list(proj.columns) + ["base_season_points"]
+    np.testing.assert_array_equal(
+        out["base_season_points"], proj["projected_season_points"]
+    )
+
+
+@pytest.mark.unit
+def test_rb_and_wr_reception_bonuses_are_position_masked():
+    out = score_with_settings(
+        _PROJ, {"rec": 1.0, "bonus_rec_wr": 0.5, "bonus_rec_rb": 2.0}
+    )
+    pts = dict(zip(out["player_name"], out["projected_season_points"]))
+    assert pts == {"QB1": 0.0, "TE1": 90.0, "WR1": 135.0}
+
+
+@pytest.mark.unit
+def test_score_many_passes_through_leagues_without_settings():
+    engine = ScoringEngine(_PROJ)
+    scored = engine.score_many({"custom": _SETTINGS, "preset": {}, "none": None})
+    assert scored["preset"] is _PROJ and scored["none"] is _PROJ
+    assert scored["custom"] is not _PROJ
+    assert engine.points([_SETTINGS, {"rec": 0.5}]).shape == (3, 2)
@@ -217,7 +217,7 @@ class TestGenerateMlProjections:
         mock_load_model.return_value = mock_model
 
         # Mock predict_player_stats to return pred_ columns
-        def fake_predict(model_dict, player_data, position, feat_cols):
+        def fake_predict(model_dict, player_data, position, feat_cols, matrix_pool=None):
             result = player_data.copy()
             for stat in ["passing_yards", "passing_tds", "interceptions", "rushing_yards", "rushing_tds"]:
                 result[f"pred_{stat}"] = [250.0, 240.0] if "yards" in stat else [1.5, 1.3]
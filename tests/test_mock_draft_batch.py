@@ -0,0 +1,133 @@
+"""Tests for the Monte Carlo mock-draft batch engine (src/mock_draft_batch.py)."""
+
+from __future__ import annotations
+
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from draft_optimizer import (  # noqa: E402
+    DraftAdvisor,
+    DraftBoard,
+    MockDraftSimulator,
+    compute_value_scores,
+)
+from mock_draft_batch import MockDraftBatch  # noqa: E402
+
+_CFG = {"QB": 1, "RB": 2, "WR": 2, "TE": 1, "FLEX": 1, "K": 1, "DST": 1}
+
+
+def _pool(n_per_pos: int = 30, with_adp: bool = True) -> pd.DataFrame:
+    rows = []
+    for pos, base in (
+        ("QB", 380),
+        ("RB", 320),
+        ("WR", 330),
+        ("TE", 250),
+        ("K", 140),
+        ("DST", 130),
+    ):
+        for i in range(n_per_pos):
+            rows.append(
+                {
+                    "player_id": f"{pos}{i}",
+                    "player_name": f"{pos} {i}",
+                    "position": pos,
+                    "projected_season_points": base - i * 3,
+                }
+            )
+    df = pd.DataFrame(rows)
+    adp = None
+    if with_adp:
+        rng = np.random.default_rng(3)
+        # Noisy ADP with a few undrafted (NaN) players and exact ties.
+        adp = df[["player_id"]].copy()
+        score = df["projected_season_points"] + rng.normal(0, 25, len(df))
+        adp["adp_rank"] = score.rank(ascending=False).round().to_numpy()
+        adp.loc[adp.index[::17], "adp_rank"] = np.nan
+    return compute_value_scores(df, adp_df=adp)
+
+
+def _replay(pool, seed, user_pick, n_teams, **kw):
+    board = DraftBoard(pool, roster_config=dict(_CFG), n_teams=n_teams)
+    sim = MockDraftSimulator(board, user_pick, n_teams, seed=seed, **kw)
+    return sim.run_full_simulation(DraftAdvisor(board))
+
+
+class TestReplayParity:
+    @pytest.mark.parametrize(
+        "with_adp,draft_type", [(True, "snake"), (False, "snake"), (True, "linear")]
+    )
+    def test_each_draft_matches_single_simulator(self, with_adp, draft_type):
+        pool = _pool(with_adp=with_adp)
+        board = DraftBoard(pool, roster_config=dict(_CFG), n_teams=6)
+        result = MockDraftBatch(board, 4, 6, draft_type=draft_type).run(
+            n_drafts=4, seed=11
+        )
+        col = {pid: i for i, pid in enumerate(result.players["player_id"])}
+        name_to_id = dict(zip(pool["player_name"], pool["player_id"]))
+
+        for i, seed in enumerate(result.seeds):
+            single = _replay(pool, seed, 4, 6, draft_type=draft_type)
+            expected = np.zeros(len(col), dtype=int)
+            for p in single["picks"]:
+                expected[col[name_to_id[p["player_name"]]]] = p["pick"]
+            np.testing.assert_array_equal(result.draft_slots[i], expected)
+            assert round(result.roster_vorp[i], 1) == single["total_vorp"]
+        assert result.expected_vorp == pytest.approx(single["expected_vorp"], abs=0.05)
+
+    def test_seeded_simulator_is_reproducible(self):
+        pool = _pool()
+        first = _replay(pool, 99, 2, 6)
+        second = _replay(pool, 99, 2, 6)
+        assert [p["player_name"] for p in first["picks"]] == [
+            p["player_name"] for p in second["picks"]
+        ]
+
+
+class TestDistributions:
+    @pytest.fixture(scope="class")
+    def result(self):
+        board = DraftBoard(_pool(), roster_config=dict(_CFG), n_teams=8)
+        return MockDraftBatch(board, 3, 8).run(n_drafts=200, seed=5)
+
+    def test_every_pick_made_once(self, result):
+        rounds = sum(_CFG.values())
+        for row in result.draft_slots:
+            picks = np.sort(row[row > 0])
+            np.testing.assert_array_equal(picks, np.arange(1, 8 * rounds + 1))
+        assert result.user_picks[:3] == [3, 14, 19]
+
+    def test_slot_distribution(self, result):
+        dist = result.slot_distribution()
+        assert dist["p_drafted"].between(0, 1).all()
+        assert (dist["p_user"] <= dist["p_drafted"]).all()
+        assert np.isclose(dist["p_user"].sum(), len(result.user_picks))
+        top = dist.iloc[0]
+        assert top["p_drafted"] == 1.0
+        assert top["p10_slot"] <= top["median_slot"] <= top["p90_slot"]
+
+    def test_roster_vorp_summary(self, result):
+        summary = result.roster_vorp_summary()
+        assert summary["n_drafts"] == 200
+        assert summary["p10"] <= summary["median"] <= summary["p90"]
+        assert sum(summary["grades"].values()) == pytest.approx(1.0)
+
+    def test_positional_runs(self, result):
+        runs = result.positional_runs(min_run=2)
+        per_round = runs.groupby("round")["mean_picks"].sum()
+        assert np.allclose(per_round, 8)
+        assert (runs["mean_longest_run"] <= 8).all()
+        assert runs["run_rate"].between(0, 1).all()
+
+    def test_same_seed_same_result(self):
+        board = DraftBoard(_pool(), roster_config=dict(_CFG), n_teams=8)
+        a = MockDraftBatch(board, 3, 8).run(n_drafts=20, seed=1)
+        b = MockDraftBatch(board, 3, 8).run(n_drafts=20, seed=1)
+        np.testing.assert_array_equal(a.draft_slots, b.draft_slots)
+        assert len(board.available) == len(_pool())
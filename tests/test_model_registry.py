@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+"""Tests for the warm model registry (``src/model_registry.py``).
+
+Covers the cache contract (load once, reload on file change, never cache
+missing or rejected artifacts), the metrics hook, pooled feature matrices,
+and the router / residual call sites that go through the registry.
+"""
+
+import json
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+import xgboost as xgb
+from sklearn.impute import SimpleImputer
+from sklearn.linear_model import Ridge
+from sklearn.pipeline import Pipeline
+
+# Project src/ on path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from model_registry import (
+    MatrixPool,
+    ModelRegistry,
+    TimingCollector,
+    set_metrics_hook,
+)
+from player_model_training import predict_player_stats, save_player_model
+from projection_engine import POSITION_STAT_PROFILE
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+def _touch(path, text):
+    with open(path, "w") as f:
+        f.write(text)
+
+
+def _bump_mtime(path):
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+@pytest.fixture
+def timings():
+    collector = TimingCollector()
+    previous = set_metrics_hook(collector)
+    yield collector
+    set_metrics_hook(previous)
+
+
+def _player_frame(n=40, seed=3):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame(
+        {
+            "player_id": [f"p{i}" for i in range(n)],
+            "f1": rng.normal(size=n),
+            "f2": rng.normal(size=n),
+            "f3": rng.integers(0, 5, size=n),
+        }
+    )
+
+
+def _write_player_models(model_dir, position, features):
+    """Train tiny XGB models for every stat and the feature_selection files."""
+    frame = _player_frame(120)
+    rng = np.random.default_rng(0)
+    for stat in POSITION_STAT_PROFILE[position]:
+        model = xgb.XGBRegressor(n_estimators=10, max_depth=2)
+        model.fit(frame[features], rng.normal(size=len(frame)))
+        save_player_model(model, position, stat, {"stat": stat}, str(model_dir))
+    fs_dir = model_dir / "feature_selection"
+    fs_dir.mkdir(exist_ok=True)
+    for group in ["yardage", "td", "volume", "turnover"]:
+        _touch(
+            fs_dir / f"{group}_features.json",
+            json.dumps({"group": group, "features": features}),
+        )
+
+
+# ---------------------------------------------------------------------------
+# Registry
+# ---------------------------------------------------------------------------
+
+
+class TestModelRegistry:
+    def test_loads_once_and_reloads_on_change(self, tmp_path, timings):
+        path = tmp_path / "a.json"
+        _touch(path, "1")
+        registry = ModelRegistry()
+        calls = []
+
+        def loader():
+            calls.append(1)
+            return path.read_text()
+
+        assert registry.get("k", "a", [str(path)], loader) == "1"
+        assert registry.get("k", "a", [str(path)], loader) == "1"
+        assert len(calls) == 1
+
+        _touch(path, "22")
+        _bump_mtime(path)
+        assert registry.get("k", "a", [str(path)], loader) == "22"
+        assert len(calls) == 2
+
+        summary = timings.summary()
+        row = summary[(summary["event"] == "model_load") & (summary["kind"] == "k")]
+        assert int(row["count"].iloc[0]) == 2
+
+    def test_optional_file_appearing_invalidates(self, tmp_path):
+        primary, optional = tmp_path / "m.joblib", tmp_path / "imputer.joblib"
+        _touch(primary, "m")
+        registry = ModelRegistry()
+        loads = []
+        paths = [str(primary), str(optional)]
+        registry.get("k", "m", paths, lambda: loads.append(1))
+        _touch(optional, "i")
+        registry.get("k", "m", paths, lambda: loads.append(1))
+        assert len(loads) == 2
+
+    def test_missing_primary_is_never_cached(self, tmp_path):
+        registry = ModelRegistry()
+        values = iter([1, 2])
+        paths = [str(tmp_path / "missing.json")]
+        assert registry.get("k", "x", paths, lambda: next(values)) == 1
+        assert registry.get("k", "x", paths, lambda: next(values)) == 2
+        assert len(registry) == 0
+
+    def test_rejected_artifact_is_not_cached(self, tmp_path):
+        path = tmp_path / "a.json"
+        _touch(path, "bad")
+        registry = ModelRegistry()
+
+        def reject(value):
+            raise ValueError("feature mismatch")
+
+        with pytest.raises(ValueError, match="feature mismatch"):
+            registry.get("k", "a", [str(path)], path.read_text, validate=reject)
+        assert len(registry) == 0
+
+    def test_failing_hook_does_not_break_loads(self, tmp_path):
+        def broken(event, seconds, labels):
+            raise RuntimeError("statsd down")
+
+        previous = set_metrics_hook(broken)
+        try:
+            path = tmp_path / "a.json"
+            _touch(path, "ok")
+            assert ModelRegistry().get("k", "a", [str(path)], path.read_text) == "ok"
+        finally:
+            set_metrics_hook(previous)
+
+
+# ---------------------------------------------------------------------------
+# Matrix pool
+# ---------------------------------------------------------------------------
+
+
+class TestMatrixPool:
+    def test_fill_reuses_buffer_and_fills_missing_with_nan(self):
+        pool = MatrixPool()
+        frame = _player_frame(10)
+        X = pool.fill("g", frame, ["f1", "absent", "f3"])
+        assert X.dtype == np.float32 and X.shape == (10, 3)
+        np.testing.assert_array_equal(X[:, 0], frame["f1"].to_numpy(np.float32))
+        assert np.isnan(X[:, 1]).all()
+
+        base = X.base
+        Y = pool.fill("g", _player_frame(7, seed=9), ["f1", "absent", "f3"])
+        assert Y.base is base and Y.shape == (7, 3)
+
+    def test_pooled_predictions_identical(self, tmp_path):
+        features = ["f1", "f2", "f3"]
+        _write_player_models(tmp_path, "RB", features)
+        from player_model_training import load_player_model
+
+        models = {
+            stat: {"model": load_player_model("RB", stat, str(tmp_path))}
+            for stat in POSITION_STAT_PROFILE["RB"]
+        }
+        groups = {g: features for g in ["yardage", "td", "volume", "turnover"]}
+        frame = _player_frame()
+        frame.loc[::5, "f2"] = np.nan
+
+        plain = predict_player_stats(models, frame, "RB", groups)
+        pooled = predict_player_stats(
+            models, frame, "RB", groups, matrix_pool=MatrixPool()
+        )
+        pd.testing.assert_frame_equal(plain, pooled)
+
+
+# ---------------------------------------------------------------------------
+# Call sites
+# ---------------------------------------------------------------------------
+
+
+class TestRouterRegistry:
+    def test_predict_ml_positions_loads_models_once(self, tmp_path, timings):
+        from ml_projection_router import predict_ml_positions
+
+        _write_player_models(tmp_path, "RB", ["f1", "f2", "f3"])
+        frame = _player_frame()
+        first = predict_ml_positions({"RB": frame}, str(tmp_path))["RB"]
+        second = predict_ml_positions({"RB": frame.iloc[:5]}, str(tmp_path))["RB"]
+
+        pd.testing.assert_frame_equal(first.iloc[:5], second)
+        summary = timings.summary()
+        loads = summary[
+            (summary["event"] == "model_load") & (summary["kind"] == "player_models")
+        ]
+        predicts = summary[
+            (summary["event"] == "model_predict") & (summary["kind"] == "player_models")
+        ]
+        assert int(loads["count"].sum()) == 1
+        assert int(predicts["count"].sum()) == 2
+
+    def test_feature_list_mismatch_rejected_at_load(self, tmp_path):
+        from ml_projection_router import predict_ml_positions
+
+        _write_player_models(tmp_path, "RB", ["f1", "f2", "f3"])
+        _touch(
+            tmp_path / "feature_selection" / "yardage_features.json",
+            json.dumps(["f1", "f2"]),
+        )
+        with pytest.raises(ValueError, match="do not match"):
+            predict_ml_positions({"RB": _player_frame()}, str(tmp_path))
+
+    def test_ship_gate_is_cached_until_report_changes(self, tmp_path):
+        from ml_projection_router import _load_ship_gate
+
+        model_dir = tmp_path / "player"
+        model_dir.mkdir()
+        report = model_dir / "ship_gate_report.json"
+        _touch(
+            report, json.dumps({"positions": [{"position": "QB", "verdict": "SKIP"}]})
+        )
+        assert _load_ship_gate(str(model_dir)) == {"QB": "SKIP"}
+
+        verdicts = _load_ship_gate(str(model_dir))
+        verdicts["QB"] = "mutated"  # callers get a copy
+        assert _load_ship_gate(str(model_dir)) == {"QB": "SKIP"}
+
+        time.sleep(0.01)
+        _touch(
+            report, json.dumps({"positions": [{"position": "QB", "verdict": "SHIP"}]})
+        )
+        _bump_mtime(report)
+        assert _load_ship_gate(str(model_dir)) == {"QB": "SHIP"}
+
+
+class TestResidualValidation:
+    def test_mismatched_residual_returns_heuristic(self, tmp_path):
+        import joblib
+
+        from hybrid_projection import apply_residual_correction
+
+        X = pd.DataFrame({"a": [1.0, 2.0, 3.0], "b": [0.0, 1.0, 0.0]})
+        pipe = Pipeline([("imputer", SimpleImputer()), ("model", Ridge())])
+        pipe.fit(X, [1.0, 2.0, 3.0])
+        joblib.dump(pipe, tmp_path / "wr_residual.joblib")
+        _touch(
+            tmp_path / "wr_residual_meta.json",
+            json.dumps({"model_type": "ridge", "features": ["a", "c"]}),
+        )
+        heuristic = pd.DataFrame({"player_id": ["p1"], "projected_points": [10.0]})
+        features = pd.DataFrame({"player_id": ["p1"], "a": [1.0], "c": [2.0]})
+
+        result = apply_residual_correction(heuristic, features, "WR", str(tmp_path))
+        assert result is heuristic
@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""Tests for the per-layer partition manifest (``src/partition_manifest.py``).
+
+Covers path parsing, recording writes, O(1) lookups, the directory-mtime
+fallback that keeps a stale manifest from ever serving an old file,
+rebuilds, and compaction (including the append-only exclusions).
+"""
+
+import json
+import os
+import sys
+
+import pandas as pd
+import pytest
+
+# Project src/ on path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from partition_manifest import (
+    MANIFEST_FILE,
+    PartitionManifest,
+    file_variant,
+    latest_parquet,
+    layer_root,
+    parse_partition_path,
+    record_partition_write,
+    write_parquet_atomic,
+)
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+def _frame(n=3):
+    return pd.DataFrame({"player_id": [f"p{i}" for i in range(n)], "pts": 1.5})
+
+
+def _write(path, n=3, record=False):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    _frame(n).to_parquet(path, index=False)
+    if record:
+        record_partition_write(str(path))
+    return str(path)
+
+
+def _bump_dir(directory):
+    """Push a directory's mtime forward (filesystem mtime granularity)."""
+    st = os.stat(directory)
+    os.utime(directory, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+@pytest.fixture
+def gold(tmp_path):
+    return tmp_path / "data" / "gold"
+
+
+# ---------------------------------------------------------------------------
+# Path conventions
+# ---------------------------------------------------------------------------
+
+
+class TestPaths:
+    def test_file_variant_strips_timestamp(self):
+        assert file_variant("projections_ppr_20251012_101500.parquet") == (
+            "projections_ppr"
+        )
+        assert file_variant("odds_20240101_000000.parquet") == "odds"
+        assert file_variant("no_timestamp.parquet") == "no_timestamp"
+
+    def test_parse_partition_path(self, gold):
+        week = gold / "players" / "weekly" / "season=2024" / "week=07"
+        path = week / "weekly_20241020_120000.parquet"
+        assert parse_partition_path(str(path), str(gold)) == (
+            "players/weekly",
+            2024,
+            7,
+            "weekly",
+        )
+        assert parse_partition_path(str(gold.parent / "x.parquet"), str(gold)) is None
+
+    def test_layer_root(self, gold, tmp_path):
+        assert layer_root(str(gold / "projections" / "a.parquet")) == str(gold)
+        assert layer_root(str(tmp_path / "elsewhere" / "a.parquet")) is None
+
+
+# ---------------------------------------------------------------------------
+# Recording and lookups
+# ---------------------------------------------------------------------------
+
+
+class TestRecordAndLookup:
+    def test_record_stores_footer_stats(self, gold):
+        week = gold / "projections" / "season=2025" / "week=05"
+        path = _write(week / "projections_ppr_20251001_000000.parquet", n=4)
+        entry = record_partition_write(path)
+        assert entry.key == ("projections", 2025, 5, "projections_ppr")
+        assert entry.rows == 4 and entry.bytes == os.path.getsize(path)
+        assert len(entry.schema_hash) == 16
+
+        payload = json.loads((gold / MANIFEST_FILE).read_text())
+        assert [e["path"] for e in payload["entries"]] == [
+            "projections/season=2025/week=05/projections_ppr_20251001_000000.parquet"
+        ]
+
+    def test_missing_file_writes_no_manifest(self, gold):
+        path = gold / "projections" / "season=2025" / "week=05" / "p_1.parquet"
+        assert record_partition_write(str(path)) is None
+        assert not (gold / MANIFEST_FILE).exists()
+
+    def test_lookup_by_pattern_and_variant(self, gold):
+        week = gold / "projections" / "season=2025" / "week=05"
+        ppr = _write(week / "projections_ppr_20251001_000000.parquet")
+        half = _write(week / "projections_half_ppr_20250901_000000.parquet")
+        _write(week / "projections_ppr_20250801_000000.parquet", record=True)
+
+        assert latest_parquet(str(week)) == ppr
+        assert latest_parquet(str(week), "projections_half_ppr_*.parquet") == half
+        manifest = PartitionManifest(str(gold))
+        assert manifest.get("projections", 2025, 5, "projections_ppr").rows == 3
+        assert manifest.get("projections", 2025, 5).path.endswith(
+            "projections_ppr_20251001_000000.parquet"
+        )
+
+    def test_unrecorded_write_is_never_missed(self, gold):
+        week = gold / "projections" / "season=2025" / "week=05"
+        _write(week / "projections_ppr_20251001_000000.parquet", record=True)
+        newer = _write(week / "projections_ppr_20251002_000000.parquet")
+        _bump_dir(week)
+        assert latest_parquet(str(week)) == newer
+
+    def test_recorded_lookup_skips_the_scan(self, gold, monkeypatch):
+        week = gold / "projections" / "season=2025" / "week=05"
+        newest = _write(week / "projections_ppr_20251001_000000.parquet", record=True)
+
+        import partition_manifest
+
+        def _no_glob(*args, **kwargs):
+            raise AssertionError("manifest hit should not scan")
+
+        monkeypatch.setattr(partition_manifest.glob, "glob", _no_glob)
+        assert latest_parquet(str(week)) == newest
+
+    def test_missing_and_non_layer_dirs(self, gold, tmp_path):
+        assert latest_parquet(str(gold / "projections" / "season=1999")) is None
+        loose = _write(tmp_path / "exports" / "a_20240101_000000.parquet")
+        _write(tmp_path / "exports" / "a_20230101_000000.parquet")
+        assert latest_parquet(str(tmp_path / "exports")) == loose
+        assert not (tmp_path / "exports" / MANIFEST_FILE).exists()
+
+    def test_write_parquet_atomic_records(self, gold):
+        path = gold / "preds" / "season=2025" / "preds_20251001_000000.parquet"
+        write_parquet_atomic(_frame(2), str(path))
+        assert not os.path.exists(str(path) + ".tmp")
+        entry = PartitionManifest(str(gold)).get("preds", 2025, None, "preds")
+        assert entry.rows == 2
+
+    def test_corrupt_manifest_falls_back(self, gold):
+        week = gold / "projections" / "season=2025"
+        newest = _write(week / "projections_ppr_20251001_000000.parquet")
+        gold.mkdir(parents=True, exist_ok=True)
+        (gold / MANIFEST_FILE).write_text("{not json")
+        assert PartitionManifest(str(gold)).latest_in_dir(str(week)) == newest
+
+
+# ---------------------------------------------------------------------------
+# Rebuild and compaction
+# ---------------------------------------------------------------------------
+
+
+class TestCompaction:
+    def _layer(self, root):
+        season = root / "projections" / "season=2025" / "week=01"
+        for ts in ("20250901_000000", "20250902_000000", "20250903_000000"):
+            _write(season / f"projections_ppr_{ts}.parquet")
+        _write(season / "projections_half_ppr_20250901_000000.parquet")
+        snaps = root / "odds_api" / "snapshots" / "season=2025"
+        for ts in ("20250901_000000", "20250902_000000"):
+            _write(snaps / f"odds_{ts}.parquet")
+        return season
+
+    def test_rebuild_indexes_latest_per_variant(self, gold):
+        self._layer(gold)
+        manifest = PartitionManifest(str(gold))
+        assert manifest.rebuild() == 3
+        assert manifest.get("projections", 2025, 1, "projections_ppr").path.endswith(
+            "20250903_000000.parquet"
+        )
+
+    def test_superseded_skips_append_only(self, gold):
+        self._layer(gold)
+        stale = PartitionManifest(str(gold)).superseded(keep=1)
+        assert [os.path.basename(p) for p in stale] == [
+            "projections_ppr_20250901_000000.parquet",
+            "projections_ppr_20250902_000000.parquet",
+        ]
+
+    def test_compact_dry_run_then_apply(self, gold):
+        season = self._layer(gold)
+        manifest = PartitionManifest(str(gold))
+        assert len(manifest.compact(keep=2)) == 1
+        assert len(list(season.glob("*.parquet"))) == 4
+
+        removed = manifest.compact(keep=2, dry_run=False)
+        assert len(removed) == 1 and not os.path.exists(removed[0])
+        assert len(list(season.glob("*.parquet"))) == 3
+        assert len(manifest) == 3
+
+    def test_keep_must_be_positive(self, gold):
+        with pytest.raises(ValueError, match="keep must be"):
+            PartitionManifest(str(gold)).superseded(keep=0)
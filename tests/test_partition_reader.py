@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""Tests for the shared partition reader (``src/partition_reader.py``).
+
+Covers latest-file resolution across the season / week layouts, column and
+row-filter pushdown, and the memoizing cache (hits, superset reuse,
+invalidation on re-ingest, byte budget, private copies).
+"""
+
+import os
+import sys
+
+import pandas as pd
+import pytest
+
+# Project src/ on path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from partition_reader import (
+    PARTITION_CACHE,
+    PartitionCache,
+    read_parquet_cached,
+    read_partition,
+    resolve_partition,
+)
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+def _write(root, rel, frame):
+    path = root / rel
+    path.parent.mkdir(parents=True, exist_ok=True)
+    frame.to_parquet(path, index=False)
+    return str(path)
+
+
+def _frame(tag, n=3):
+    return pd.DataFrame(
+        {
+            "season": 2024,
+            "week": list(range(1, n + 1)),
+            "game_type": ["REG"] * (n - 1) + ["POST"],
+            "tag": tag,
+        }
+    )
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    PARTITION_CACHE.clear()
+    yield
+    PARTITION_CACHE.clear()
+
+
+# ---------------------------------------------------------------------------
+# Resolution
+# ---------------------------------------------------------------------------
+
+
+class TestResolvePartition:
+    def test_latest_by_filename_timestamp(self, tmp_path):
+        _write(tmp_path, "pbp/season=2024/pbp_20240102_000000.parquet", _frame("a"))
+        newest = _write(
+            tmp_path, "pbp/season=2024/pbp_20240301_120000.parquet", _frame("b")
+        )
+        _write(tmp_path, "pbp/season=2024/pbp_20240201_000000.parquet", _frame("c"))
+        assert resolve_partition(str(tmp_path), "pbp", 2024) == [newest]
+
+    def test_missing_partition_is_empty(self, tmp_path):
+        assert resolve_partition(str(tmp_path), "pbp", 1999) == []
+        assert read_partition(str(tmp_path), "pbp", 1999).empty
+
+    def test_latest_spans_week_dirs_by_timestamp(self, tmp_path):
+        _write(tmp_path, "u/season=2024/week=9/u_20240901_000000.parquet", _frame("a"))
+        newest = _write(
+            tmp_path, "u/season=2024/week=18/u_20241231_000000.parquet", _frame("b")
+        )
+        _write(tmp_path, "u/season=2024/u_20240801_000000.parquet", _frame("c"))
+        assert resolve_partition(str(tmp_path), "u", 2024, weeks="latest") == [newest]
+
+    def test_fallback_reads_latest_per_week_in_week_order(self, tmp_path):
+        _write(tmp_path, "w/season=2024/week=10/w_20241101_000000.parquet", _frame("a"))
+        _write(tmp_path, "w/season=2024/week=2/w_20240901_000000.parquet", _frame("b"))
+        newer = _write(
+            tmp_path, "w/season=2024/week=2/w_20240902_000000.parquet", _frame("c")
+        )
+        files = resolve_partition(str(tmp_path), "w", 2024, weeks="fallback")
+        assert len(files) == 2 and files[0] == newer
+
+        df = read_partition(str(tmp_path), "w", 2024, weeks="fallback")
+        assert df["tag"].tolist() == ["c"] * 3 + ["a"] * 3
+
+    def test_flat_file_wins_over_weeks_in_fallback(self, tmp_path):
+        flat = _write(tmp_path, "w/season=2024/w_20240101_000000.parquet", _frame("a"))
+        _write(tmp_path, "w/season=2024/week=1/w_20240901_000000.parquet", _frame("b"))
+        assert resolve_partition(str(tmp_path), "w", 2024, weeks="fallback") == [flat]
+
+    def test_prefix_and_bad_mode(self, tmp_path):
+        keep = _write(
+            tmp_path, "g/season=2024/graph_a_20240101_000000.parquet", _frame("a")
+        )
+        _write(tmp_path, "g/season=2024/graph_b_20250101_000000.parquet", _frame("b"))
+        assert resolve_partition(str(tmp_path), "g", 2024, prefix="graph_a_") == [keep]
+        with pytest.raises(ValueError, match="weeks must be one of"):
+            resolve_partition(str(tmp_path), "g", 2024, weeks="all")
+
+
+# ---------------------------------------------------------------------------
+# Pushdown
+# ---------------------------------------------------------------------------
+
+
+class TestPushdown:
+    def test_columns_keep_requested_order_and_skip_missing(self, tmp_path):
+        _write(tmp_path, "s/season=2024/s_20240101_000000.parquet", _frame("a"))
+        df = read_partition(str(tmp_path), "s", 2024, columns=["tag", "absent", "week"])
+        assert list(df.columns) == ["tag", "week"]
+
+    def test_row_filters(self, tmp_path):
+        _write(tmp_path, "s/season=2024/s_20240101_000000.parquet", _frame("a", n=5))
+        df = read_partition(
+            str(tmp_path), "s", 2024, filters=[("game_type", "==", "REG")]
+        )
+        assert df["week"].tolist() == [1, 2, 3, 4]
+        assert isinstance(df.index, pd.RangeIndex)
+
+
+# ---------------------------------------------------------------------------
+# Cache
+# ---------------------------------------------------------------------------
+
+
+class TestPartitionCache:
+    def test_decodes_once_and_serves_subsets_from_full_read(self, tmp_path):
+        path = _write(tmp_path, "p.parquet", _frame("a"))
+        full = read_parquet_cached(path)
+        sub = read_parquet_cached(path, columns=["week", "tag"])
+        again = read_parquet_cached(path)
+        pd.testing.assert_frame_equal(sub, full[["week", "tag"]])
+        pd.testing.assert_frame_equal(again, full)
+        stats = PARTITION_CACHE.stats()
+        assert stats["misses"] == 1 and stats["hits"] == 2
+
+    def test_copies_are_private(self, tmp_path):
+        path = _write(tmp_path, "p.parquet", _frame("a"))
+        first = read_parquet_cached(path)
+        first.loc[0, "tag"] = "mutated"
+        assert read_parquet_cached(path).loc[0, "tag"] == "a"
+
+    def test_rewritten_file_is_reloaded(self, tmp_path):
+        path = _write(tmp_path, "p.parquet", _frame("a"))
+        assert read_parquet_cached(path)["tag"].iloc[0] == "a"
+        _write(tmp_path, "p.parquet", _frame("b", n=4))
+        st = os.stat(path)
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        assert read_parquet_cached(path)["tag"].iloc[0] == "b"
+
+    def test_budget_evicts_least_recently_used(self, tmp_path):
+        paths = [_write(tmp_path, f"p{i}.parquet", _frame(str(i))) for i in range(3)]
+        cache = PartitionCache(max_bytes=1 << 30)
+        cache.read(paths[0])
+        entry_bytes = cache.stats()["bytes"]
+        cache.max_bytes = 2 * entry_bytes
+        cache.read(paths[1])
+        cache.read(paths[0])  # refresh p0
+        cache.read(paths[2])  # evicts p1
+        stats = cache.stats()
+        assert stats["entries"] == 2 and stats["evictions"] == 1
+        cache.read(paths[0])
+        assert cache.stats()["misses"] == 3
+
+    def test_budget_counts_pandas_bytes(self, tmp_path):
+        names = pd.DataFrame(
+            {"player_name": [f"Player Number {i}" for i in range(500)]}
+        )
+        paths = [_write(tmp_path, f"s{i}.parquet", names) for i in range(2)]
+        probe = PartitionCache(max_bytes=1 << 30)
+        frame = probe.read(paths[0])
+        pandas_bytes = int(frame.memory_usage(index=True, deep=True).sum())
+        assert probe.stats()["bytes"] == pandas_bytes
+
+        # Room for one frame's pandas footprint (well above its Arrow size).
+        cache = PartitionCache(max_bytes=pandas_bytes + pandas_bytes // 2)
+        cache.read(paths[0])
+        cache.read(paths[1])
+        stats = cache.stats()
+        assert stats["entries"] == 1 and stats["evictions"] == 1
+        assert stats["bytes"] <= cache.max_bytes
+
+    def test_oversized_reads_are_not_cached(self, tmp_path):
+        path = _write(tmp_path, "p.parquet", _frame("a"))
+        cache = PartitionCache(max_bytes=0)
+        assert len(cache.read(path)) == 3
+        assert cache.stats()["entries"] == 0
+
+    def test_missing_file_raises(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            read_parquet_cached(str(tmp_path / "missing.parquet"))
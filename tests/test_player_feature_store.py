@@ -0,0 +1,159 @@
+"""Tests for the season-partitioned player feature store."""
+
+import os
+import sys
+
+import pandas as pd
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import player_feature_store as store  # noqa: E402
+
+
+def _write_silver(data_dir, season, name="usage_20240101_000000.parquet", rows=3):
+    part = os.path.join(data_dir, "silver", "players", "usage", f"season={season}")
+    os.makedirs(part, exist_ok=True)
+    pd.DataFrame({"player_id": [f"p{i}" for i in range(rows)]}).to_parquet(
+        os.path.join(part, name)
+    )
+
+
+class _Builder:
+    """Counts calls and returns a small feature frame per season."""
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, season):
+        self.calls.append(season)
+        return pd.DataFrame(
+            {
+                "player_id": ["p1", "p2"],
+                "season": [season, season],
+                "week": [1, 1],
+                "position": ["WR", "RB"],
+                "feat_a": [1.0, 2.0],
+                "feat_b": [3.0, 4.0],
+                "feat_c": [5.0, 6.0],
+            }
+        )
+
+
+@pytest.fixture
+def lake(tmp_path):
+    data_dir = str(tmp_path / "data")
+    store_dir = str(tmp_path / "store")
+    for season in (2023, 2024):
+        _write_silver(data_dir, season)
+    return data_dir, store_dir
+
+
+class TestRefresh:
+    def test_builds_then_skips_unchanged(self, lake):
+        data_dir, store_dir = lake
+        builder = _Builder()
+        first = store.refresh_feature_store(
+            [2023, 2024], builder=builder, data_dir=data_dir, store_dir=store_dir
+        )
+        second = store.refresh_feature_store(
+            [2023, 2024], builder=builder, data_dir=data_dir, store_dir=store_dir
+        )
+        assert first == {2023: True, 2024: True}
+        assert second == {2023: False, 2024: False}
+        assert builder.calls == [2023, 2024]
+
+    def test_only_changed_season_rebuilds(self, lake):
+        data_dir, store_dir = lake
+        builder = _Builder()
+        store.refresh_feature_store(
+            [2023, 2024], builder=builder, data_dir=data_dir, store_dir=store_dir
+        )
+        _write_silver(data_dir, 2024, name="usage_20250101_000000.parquet")
+        rebuilt = store.refresh_feature_store(
+            [2023, 2024], builder=builder, data_dir=data_dir, store_dir=store_dir
+        )
+        assert rebuilt == {2023: False, 2024: True}
+        assert builder.calls == [2023, 2024, 2024]
+
+    def test_code_version_change_invalidates(self, lake, monkeypatch):
+        data_dir, store_dir = lake
+        builder = _Builder()
+        store.refresh_feature_store(
+            [2023], builder=builder, data_dir=data_dir, store_dir=store_dir
+        )
+        monkeypatch.setattr(store, "FEATURE_STORE_VERSION", 999)
+        assert store.feature_store_status(
+            [2023], data_dir=data_dir, store_dir=store_dir
+        ) == {2023: False}
+
+    def test_force_rebuilds(self, lake):
+        data_dir, store_dir = lake
+        builder = _Builder()
+        for _ in range(2):
+            store.refresh_feature_store(
+                [2023],
+                force=True,
+                builder=builder,
+                data_dir=data_dir,
+                store_dir=store_dir,
+            )
+        assert builder.calls == [2023, 2023]
+
+    def test_empty_season_not_written(self, lake):
+        data_dir, store_dir = lake
+        rebuilt = store.refresh_feature_store(
+            [2023],
+            builder=lambda season: pd.DataFrame(),
+            data_dir=data_dir,
+            store_dir=store_dir,
+        )
+        assert rebuilt == {2023: False}
+        assert not os.path.exists(os.path.join(store_dir, "season=2023"))
+
+    def test_bronze_lookback_in_fingerprint(self, lake):
+        data_dir, _ = lake
+        before = store.season_fingerprint(2024, data_dir)
+        sched = os.path.join(data_dir, "bronze", "schedules", "season=2022")
+        os.makedirs(sched)
+        pd.DataFrame({"game_id": ["g"]}).to_parquet(
+            os.path.join(sched, "schedules_20240101_000000.parquet")
+        )
+        with_2022 = store.season_fingerprint(2024, data_dir)
+        assert with_2022 != before
+        # Outside the lookback window: 2024 unaffected by 2019 Bronze.
+        old = os.path.join(data_dir, "bronze", "schedules", "season=2019")
+        os.makedirs(old)
+        pd.DataFrame({"game_id": ["g"]}).to_parquet(
+            os.path.join(old, "schedules_20240101_000000.parquet")
+        )
+        assert store.season_fingerprint(2024, data_dir) == with_2022
+
+
+class TestLoad:
+    def test_full_read_matches_builder(self, lake):
+        data_dir, store_dir = lake
+        builder = _Builder()
+        df = store.load_player_features(
+            [2023, 2024], builder=builder, data_dir=data_dir, store_dir=store_dir
+        )
+        expected = pd.concat([_Builder()(2023), _Builder()(2024)], ignore_index=True)
+        pd.testing.assert_frame_equal(df, expected)
+
+    def test_column_projection_keeps_keys_and_skips_missing(self, lake):
+        data_dir, store_dir = lake
+        df = store.load_player_features(
+            [2023],
+            columns=["feat_b", "not_a_column"],
+            builder=_Builder(),
+            data_dir=data_dir,
+            store_dir=store_dir,
+        )
+        assert list(df.columns) == ["player_id", "season", "week", "position", "feat_b"]
+
+    def test_no_refresh_reads_stored_only(self, lake):
+        data_dir, store_dir = lake
+        df = store.load_player_features(
+            [2023], refresh=False, data_dir=data_dir, store_dir=store_dir
+        )
+        assert df.empty
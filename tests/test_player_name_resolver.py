@@ -113,3 +113,113 @@ class TestSourcePriorityOrdering:
             f"season sort must use kind='stable' to preserve source-priority "
             f"ordering on ties; got kind values {captured_kinds}"
         )
+
+
+# ---------------------------------------------------------------------------
+# Indexed fuzzy matching, memo and batch resolution
+# ---------------------------------------------------------------------------
+
+
+_FUZZY_NAMES = [
+    ("00-0000001", "Josh Allen", "BUF", "QB", 2024),
+    ("00-0000002", "Josh Allen", "JAX", "DE", 2023),
+    ("00-0000003", "Amon-Ra St. Brown", "DET", "WR", 2024),
+    ("00-0000004", "Marvin Harrison Jr.", "ARI", "WR", 2024),
+    ("00-0000005", "Marvin Harrison", "IND", "WR", 2016),
+    ("00-0000006", "Kenneth Walker III", "SEA", "RB", 2024),
+    ("00-0000007", "Michael Pittman Jr.", "IND", "WR", 2024),
+    ("00-0000008", "Michael Thomas", "NO", "WR", 2023),
+    ("00-0000009", "Mike Williams", "PIT", "WR", 2024),
+    ("00-0000010", "Chris Olave", "NO", "WR", 2024),
+    ("00-0000011", "Brian Thomas", "JAX", "WR", 2024),
+    ("00-0000012", "Lamar Jackson", "BAL", "QB", 2024),
+    ("00-0000013", "Jackson Lamar Smith", "BAL", "TE", 2022),
+]
+
+
+@pytest.fixture
+def fuzzy_resolver(tmp_path):
+    rosters = pd.DataFrame(
+        _FUZZY_NAMES,
+        columns=["player_id", "full_name", "team", "position", "season"],
+    )
+    _write_parquet(
+        tmp_path / "players" / "rosters" / "season=2024" / "rosters_20240101.parquet",
+        rosters,
+    )
+    return PlayerNameResolver(bronze_root=tmp_path, memo_size=4)
+
+
+def _linear_scan(resolver, norm, threshold):
+    """Reference implementation: score every entry in the index."""
+    from player_name_resolver import _token_overlap
+
+    results = []
+    for entry in resolver.index:
+        score = _token_overlap(norm, entry.norm_name)
+        if score >= threshold:
+            results.append((score, entry))
+    results.sort(key=lambda t: (-t[0], -t[1].season))
+    return [entry for _, entry in results]
+
+
+class TestIndexedFuzzyMatching:
+    QUERIES = [
+        "josh allen",
+        "allen",
+        "marvin harrison",
+        "marvin harrison iii",
+        "kenneth walker",
+        "michael",
+        "michael thomas jr",
+        "lamar jackson",
+        "jackson lamar",
+        "jackson lamar smith",
+        "nobody at all",
+        "",
+    ]
+
+    @pytest.mark.parametrize("threshold", [0.0, 0.3, 0.5, 0.66, 0.8, 1.0])
+    def test_matches_full_scan(self, fuzzy_resolver, threshold):
+        for query in self.QUERIES:
+            got = fuzzy_resolver._fuzzy_candidates(query, threshold=threshold)
+            want = _linear_scan(fuzzy_resolver, query, threshold)
+            assert [e.player_id for e in got] == [e.player_id for e in want], query
+
+    def test_index_rebuilt_when_entries_added(self, fuzzy_resolver):
+        from player_name_resolver import _PlayerEntry
+
+        entry = _PlayerEntry("00-0000099", "Puka Nacua", "puka nacua", "LAR", "WR", 0)
+        fuzzy_resolver.index.append(entry)
+        got = fuzzy_resolver._fuzzy_candidates("puka nacua", threshold=0.8)
+        assert [e.player_id for e in got] == ["00-0000099"]
+
+
+class TestMemoAndBatch:
+    def test_memo_is_bounded_and_consistent(self, fuzzy_resolver):
+        names = ["Josh Allen", "Chris Olave", "Lamar Jackson", "Brian Thomas"]
+        first = [fuzzy_resolver.resolve(n) for n in names]
+        assert len(fuzzy_resolver._memo) == 4
+        fuzzy_resolver.resolve("Mike Williams")
+        assert len(fuzzy_resolver._memo) == 4
+        assert [fuzzy_resolver.resolve(n) for n in names] == first
+
+    def test_hints_are_part_of_the_memo_key(self, fuzzy_resolver):
+        assert fuzzy_resolver.resolve("Josh Allen", team="BUF") == "00-0000001"
+        assert fuzzy_resolver.resolve("Josh Allen", team="JAX") == "00-0000002"
+
+    def test_batch_dedupes_and_matches_resolve(self, fuzzy_resolver, monkeypatch):
+        names = ["Josh Allen", "josh allen", "Josh Allen", "Chris Olave", "", "Nobody"]
+        calls = []
+        real_match = fuzzy_resolver._match
+
+        def spy(norm, *args):
+            calls.append(norm)
+            return real_match(norm, *args)
+
+        monkeypatch.setattr(fuzzy_resolver, "_match", spy)
+        out = fuzzy_resolver.resolve_batch(names, team="BUF")
+
+        assert sorted(calls) == ["chris olave", "josh allen", "nobody"]
+        fresh = PlayerNameResolver(bronze_root=fuzzy_resolver._root, memo_size=0)
+        assert out == {n: fresh.resolve(n, team="BUF") for n in names}
@@ -530,9 +530,11 @@ class TestMissingSeasonMinus1FailsLoudly:
 
         with patch("nfl_data_integration.NFLDataFetcher", return_value=mock_fetcher):
             with patch("nfl_data_adapter.NFLDataAdapter", return_value=mock_adapter):
-                # Suppress all file writes
+                # Suppress all file writes (manifest and ledger included)
                 with patch("pandas.DataFrame.to_parquet"), \
-                     patch("pandas.DataFrame.to_csv"):
+                     patch("pandas.DataFrame.to_csv"), \
+                     patch("partition_manifest.record_partition_write"), \
+                     patch("projection_ledger.ProjectionLedger.save"):
                     import importlib
                     import scripts.generate_projections as gp_mod
                     importlib.reload(gp_mod)
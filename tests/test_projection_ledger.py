@@ -0,0 +1,284 @@
+#!/usr/bin/env python3
+"""Tests for the projection adjustment ledger (``src/projection_ledger.py``).
+
+Covers exact replay of the staged injury/event/sentiment layers, captured
+frame-transform layers, unrecorded edits, the parquet round trip, and the
+Sunday refresh redoing the injury layer to match a fresh pipeline run.
+"""
+
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Project src/ on path (and the repo root for scripts/)
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from projection_engine import (
+    apply_event_adjustments,
+    apply_injury_adjustments,
+    apply_sentiment_adjustments,
+)
+from projection_ledger import (
+    UNRECORDED_STAGE,
+    AdjustmentStage,
+    ProjectionLedger,
+    apply_stage,
+    ledger_path,
+    load_ledger,
+)
+from scripts.sunday_projection_refresh import _redo_injury_layer
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+def _projections(n=40, seed=0):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame(
+        {
+            "player_id": [f"p{i}" for i in range(n)],
+            "player_name": [f"Player {i}" for i in range(n)],
+            "position": rng.choice(["QB", "RB", "WR", "TE"], n),
+            "projected_points": np.round(rng.uniform(0, 30, n), 2),
+            "proj_rushing_yards": np.round(rng.uniform(0, 120, n), 2),
+            "proj_receptions": np.round(rng.uniform(0, 9, n), 2),
+            "proj_season": 2025,
+            "proj_week": 5,
+        }
+    )
+
+
+def _injuries(statuses):
+    return pd.DataFrame(
+        {"gsis_id": list(statuses), "report_status": list(statuses.values())}
+    )
+
+
+def _events():
+    return pd.DataFrame(
+        {
+            "player_id": ["p1", "p2", "p3"],
+            "is_questionable": [True, False, True],
+            "is_returning": [False, True, True],
+        }
+    )
+
+
+def _sentiment():
+    return pd.DataFrame(
+        {
+            "player_id": ["p2", "p4", "p5", "p6"],
+            "sentiment_multiplier": [1.07, 0.93, 1.12, 0.88],
+            "is_ruled_out": [False, False, False, True],
+        }
+    )
+
+
+def _bump_rbs(df):
+    """A frame-transform layer, like the opt-in levers in generate_projections."""
+    out = df.copy()
+    rb = out["position"] == "RB"
+    out.loc[rb, "projected_points"] = out.loc[rb, "projected_points"] + 0.37
+    return out
+
+
+def _pipeline(base, injuries, ledger=None, lever=False):
+    ledger = ledger if ledger is not None else ProjectionLedger()
+    df = apply_injury_adjustments(base, injuries, ledger=ledger)
+    if lever:
+        before = df
+        df = _bump_rbs(df)
+        ledger.capture("rb_bump", before, df)
+    df = apply_event_adjustments(df, _events(), ledger=ledger)
+    df = apply_sentiment_adjustments(df, _sentiment(), ledger=ledger)
+    return df, ledger
+
+
+TUESDAY = {"p1": "Questionable", "p3": "Out", "p7": "Doubtful"}
+SUNDAY = {"p1": "Active", "p3": "Questionable", "p8": "Out"}
+
+
+# ---------------------------------------------------------------------------
+# Stages and replay
+# ---------------------------------------------------------------------------
+
+
+class TestStages:
+    def test_stage_scales_selected_rows_only(self):
+        df = pd.DataFrame({"player_id": ["a", "b"], "projected_points": [10.0, 7.005]})
+        stage = AdjustmentStage(
+            "x",
+            columns=("projected_points",),
+            multiplier=np.array([0.5, 2.0]),
+            rows=np.array([True, False]),
+        )
+        apply_stage(df, stage)
+        assert df["projected_points"].tolist() == [5.0, 7.005]
+
+    def test_empty_row_mask_is_noop(self):
+        stage = AdjustmentStage(
+            "x",
+            columns=("projected_points",),
+            multiplier=np.ones(2),
+            rows=np.zeros(2, dtype=bool),
+        )
+        assert stage.is_noop
+
+    def test_sentiment_clips_nan_points_but_not_floor_or_ceiling(self):
+        df = pd.DataFrame(
+            {
+                "player_id": ["p2", "p3"],
+                "projected_points": [np.nan, np.nan],
+                "projected_floor": [np.nan, 4.0],
+                "projected_ceiling": [np.nan, 9.0],
+            }
+        )
+        ledger = ProjectionLedger()
+        out = apply_sentiment_adjustments(df, _sentiment(), ledger=ledger)
+        # Matched p2 follows max(0.0, nan) == 0.0; unmatched p3 is untouched.
+        assert out["projected_points"].tolist()[0] == 0.0
+        assert np.isnan(out["projected_points"].iloc[1])
+        assert out[["projected_floor", "projected_ceiling"]].iloc[0].isna().all()
+        pd.testing.assert_frame_equal(ledger.replay(out), out, check_exact=True)
+
+    def test_replay_reproduces_pipeline_exactly(self):
+        final, ledger = _pipeline(_projections(), _injuries(TUESDAY), lever=True)
+        assert ledger.stage_names == ["injury", "rb_bump", "events", "sentiment"]
+        pd.testing.assert_frame_equal(ledger.replay(final), final, check_exact=True)
+
+    def test_replay_follows_keys_not_row_order(self):
+        final, ledger = _pipeline(_projections(), _injuries(TUESDAY))
+        shuffled = final.sample(frac=1.0, random_state=3)
+        pd.testing.assert_frame_equal(
+            ledger.replay(shuffled), shuffled, check_exact=True
+        )
+
+    def test_unrecorded_edit_is_kept(self):
+        ledger = ProjectionLedger()
+        df = apply_injury_adjustments(_projections(), _injuries(TUESDAY), ledger=ledger)
+        df.loc[0, "projected_points"] = 99.0
+        df = apply_event_adjustments(df, _events(), ledger=ledger)
+        assert ledger.stage_names == ["injury", UNRECORDED_STAGE, "events"]
+        assert ledger.replay(df).loc[0, "projected_points"] == 99.0
+
+    def test_rows_added_later_are_not_covered(self):
+        final, ledger = _pipeline(_projections(), _injuries(TUESDAY))
+        kicker = pd.DataFrame(
+            {"player_id": ["k1"], "position": ["K"], "projected_points": [8.5]}
+        )
+        full = pd.concat([final, kicker], ignore_index=True)
+        ledger.checkpoint(full)
+        replayed = ledger.replay(full)
+        assert replayed.iloc[-1]["projected_points"] == 8.5
+        pd.testing.assert_frame_equal(replayed, full, check_exact=True)
+
+    def test_replace_unknown_stage_raises(self):
+        final, ledger = _pipeline(_projections(), _injuries(TUESDAY))
+        with pytest.raises(KeyError):
+            ledger.replace_stage(final, AdjustmentStage("wind", columns=()))
+
+
+# ---------------------------------------------------------------------------
+# Persistence
+# ---------------------------------------------------------------------------
+
+
+class TestPersistence:
+    def test_ledger_path(self, tmp_path):
+        gold = tmp_path / "gold" / "projections" / "season=2025" / "week=5"
+        path = ledger_path(str(gold / "projections_ppr_20251012_101500.parquet"))
+        assert path == str(
+            tmp_path
+            / "gold"
+            / "projection_ledgers"
+            / "season=2025"
+            / "week=5"
+            / "ledger_ppr_20251012_101500.parquet"
+        )
+        with pytest.raises(ValueError):
+            ledger_path(str(tmp_path / "elsewhere.parquet"))
+
+    def test_round_trip(self, tmp_path):
+        final, ledger = _pipeline(_projections(), _injuries(TUESDAY), lever=True)
+        gold = tmp_path / "projections" / "season=2025" / "week=5"
+        proj_path = str(gold / "projections_ppr_20251012_101500.parquet")
+        ledger.save(ledger_path(proj_path))
+
+        loaded = load_ledger(proj_path)
+        assert loaded.stage_names == ledger.stage_names
+        pd.testing.assert_frame_equal(loaded.replay(final), final, check_exact=True)
+
+    def test_missing_ledger(self, tmp_path):
+        gold = tmp_path / "projections" / "season=2025" / "week=5"
+        assert load_ledger(str(gold / "projections_ppr_1.parquet")) is None
+
+
+# ---------------------------------------------------------------------------
+# Sunday refresh redo
+# ---------------------------------------------------------------------------
+
+
+class TestInjuryRedo:
+    def test_redo_matches_fresh_pipeline(self):
+        base = _projections()
+        tuesday, ledger = _pipeline(base, _injuries(TUESDAY))
+        fresh, _ = _pipeline(base, _injuries(SUNDAY))
+
+        refreshed, summary, new_ledger = _redo_injury_layer(
+            tuesday, _injuries(SUNDAY), ledger
+        )
+        pd.testing.assert_frame_equal(refreshed, fresh, check_exact=True)
+        assert summary["case"] == "L"
+        assert summary["asymmetry_limited"] == 0
+        assert summary["status_changed"] == 4
+        # The Tuesday Out player is restored, not left at zero.
+        p3 = refreshed.set_index("player_id").loc["p3", "projected_points"]
+        assert p3 > 0
+        pd.testing.assert_frame_equal(
+            new_ledger.replay(refreshed), refreshed, check_exact=True
+        )
+
+    def test_redo_regates_sentiment_on_the_new_injury_state(self, tmp_path):
+        # p2 (sentiment 1.07) and p6 (sentiment ruled out) are Out on Tuesday,
+        # so sentiment skipped them; on Sunday they play and p4 (0.93) sits.
+        tuesday_status = {**TUESDAY, "p2": "Out", "p6": "Out"}
+        sunday_status = {**SUNDAY, "p2": "Active", "p6": "Active", "p4": "Out"}
+        base = _projections()
+        tuesday, ledger = _pipeline(base, _injuries(tuesday_status))
+        fresh, _ = _pipeline(base, _injuries(sunday_status))
+        assert tuesday.set_index("player_id").loc["p2", "sentiment_multiplier"] == 1.0
+
+        proj_path = str(tmp_path / "projections" / "projections_ppr_1.parquet")
+        ledger.save(ledger_path(proj_path))
+        refreshed, summary, new_ledger = _redo_injury_layer(
+            tuesday, _injuries(sunday_status), load_ledger(proj_path)
+        )
+        pd.testing.assert_frame_equal(refreshed, fresh, check_exact=True)
+        by_id = refreshed.set_index("player_id")
+        assert by_id.loc["p2", "sentiment_multiplier"] == 1.07
+        assert by_id.loc["p6", "projected_points"] == 0.0
+        assert by_id.loc["p6", "sentiment_events"] == "is_ruled_out"
+        assert by_id.loc["p4", "sentiment_multiplier"] == 1.0
+        assert summary["pinned_by_later_layers"] == 0
+        pd.testing.assert_frame_equal(
+            new_ledger.replay(refreshed), refreshed, check_exact=True
+        )
+
+    def test_redo_is_idempotent(self):
+        tuesday, ledger = _pipeline(_projections(), _injuries(TUESDAY))
+        refreshed, summary, _ = _redo_injury_layer(tuesday, _injuries(TUESDAY), ledger)
+        pd.testing.assert_frame_equal(refreshed, tuesday, check_exact=True)
+        assert summary["status_changed"] == 0
+
+    def test_pinned_rows_are_reported(self):
+        base = _projections()
+        base.loc[base["player_id"] == "p3", "position"] = "RB"
+        tuesday, ledger = _pipeline(base, _injuries(TUESDAY), lever=True)
+        _, summary, _ = _redo_injury_layer(tuesday, _injuries(SUNDAY), ledger)
+        assert summary["pinned_by_later_layers"] >= 1
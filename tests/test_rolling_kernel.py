@@ -0,0 +1,240 @@
+"""Parity tests for ``src/rolling_kernel.py``.
+
+Every statistic of :class:`LaggedGroupBlock` must reproduce the pandas
+``groupby(keys)[col].transform(lambda s: s.shift(1)...)`` idiom it replaced
+bit for bit — including NaN gaps, repeated values, negative values, inf,
+null group keys and single-row groups. The second half pins the three
+Silver builders that moved onto the kernel against verbatim copies of
+their previous per-column lambda implementations.
+"""
+
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from pbp_advanced_features import (  # noqa: E402
+    PBP_ADV_ALL_RAW_FEATURES,
+    _slope_for_window,
+    add_pbp_advanced_trailing_features,
+)
+from player_analytics import ROLLING_STAT_COLS, compute_rolling_averages  # noqa: E402
+from rolling_kernel import LaggedGroupBlock  # noqa: E402
+from team_analytics import apply_team_rolling  # noqa: E402
+
+VALUE_COLS = ["normal", "rounded", "repeated", "positive", "negative"]
+
+
+def _assert_identical(actual: np.ndarray, expected: np.ndarray) -> None:
+    """Exact equality with NaN == NaN."""
+    np.testing.assert_array_equal(actual, expected)
+
+
+@pytest.fixture(scope="module")
+def frame() -> pd.DataFrame:
+    rng = np.random.default_rng(42)
+    n = 6000
+    df = pd.DataFrame(
+        {
+            "key": rng.integers(0, 400, n).astype(float),
+            "season": rng.integers(2023, 2025, n),
+            "week": rng.integers(1, 19, n),
+            "normal": rng.normal(0, 40, n),
+            "rounded": np.round(rng.normal(60, 30, n)),
+            "repeated": np.where(rng.random(n) < 0.4, 0.1, rng.random(n)),
+            "positive": np.abs(rng.normal(0, 1, n)),
+            "negative": -np.abs(rng.normal(0, 1, n)),
+        }
+    )
+    df.loc[rng.random(n) < 0.15, "normal"] = np.nan
+    df.loc[rng.random(n) < 0.01, "rounded"] = np.inf
+    df.loc[rng.random(n) < 0.01, "key"] = np.nan
+    return df.sort_values(["key", "season", "week"])
+
+
+@pytest.fixture(scope="module")
+def block(frame) -> LaggedGroupBlock:
+    return LaggedGroupBlock(frame, ["key", "season"], VALUE_COLS)
+
+
+def _reference(frame: pd.DataFrame, func) -> np.ndarray:
+    grouped = frame.groupby(["key", "season"])
+    return np.column_stack([grouped[c].transform(func).to_numpy() for c in VALUE_COLS])
+
+
+class TestKernelParity:
+    @pytest.mark.parametrize(
+        "window,min_periods", [(1, 1), (3, 1), (4, 2), (6, 1), (8, 3)]
+    )
+    def test_rolling_mean(self, frame, block, window, min_periods):
+        expected = _reference(
+            frame,
+            lambda s: s.shift(1).rolling(window, min_periods=min_periods).mean(),
+        )
+        _assert_identical(block.rolling_mean(window, min_periods), expected)
+
+    @pytest.mark.parametrize("min_periods", [1, 2])
+    def test_expanding_mean(self, frame, block, min_periods):
+        expected = _reference(
+            frame, lambda s: s.shift(1).expanding(min_periods=min_periods).mean()
+        )
+        _assert_identical(block.expanding_mean(min_periods), expected)
+
+    @pytest.mark.parametrize("halflife", [1, 3, 5.5])
+    def test_ewm_mean(self, frame, block, halflife):
+        expected = _reference(
+            frame, lambda s: s.shift(1).ewm(halflife=halflife, min_periods=1).mean()
+        )
+        _assert_identical(block.ewm_mean(halflife), expected)
+
+    def test_rolling_slope(self, frame, block):
+        expected = _reference(
+            frame,
+            lambda s: s.shift(1)
+            .rolling(4, min_periods=3)
+            .apply(_slope_for_window, raw=False),
+        )
+        _assert_identical(block.rolling_slope(4, min_periods=3), expected)
+
+    def test_unsorted_groups_keep_incoming_order(self, frame):
+        shuffled = frame.sample(frac=1.0, random_state=3)
+        block = LaggedGroupBlock(shuffled, ["key", "season"], ["normal"])
+        expected = (
+            shuffled.groupby(["key", "season"])["normal"]
+            .transform(lambda s: s.shift(1).rolling(3, min_periods=1).mean())
+            .to_numpy()
+        )
+        _assert_identical(block.rolling_mean(3)[:, 0], expected)
+
+    def test_empty_frame(self):
+        empty = pd.DataFrame({"key": [], "season": [], "x": []})
+        block = LaggedGroupBlock(empty, ["key", "season"], ["x"])
+        assert block.rolling_mean(3).shape == (0, 1)
+        assert block.ewm_mean(3).shape == (0, 1)
+        assert block.rolling_slope(4, 3).shape == (0, 1)
+
+    def test_columns_names_outputs(self, block):
+        cols = block.columns(block.rolling_mean(3), "{col}_roll3")
+        assert list(cols) == [f"{c}_roll3" for c in VALUE_COLS]
+
+
+# ---------------------------------------------------------------------------
+# Builder parity — the pre-kernel implementations, verbatim
+# ---------------------------------------------------------------------------
+
+
+def _legacy_compute_rolling_averages(df, windows=(3, 6)):
+    df = df.copy()
+    df = df.sort_values(["player_id", "season", "week"])
+    stat_cols = [c for c in ROLLING_STAT_COLS if c in df.columns]
+    for window in windows:
+        roll_cols = {}
+        for col in stat_cols:
+            roll_cols[f"{col}_roll{window}"] = df.groupby(["player_id", "season"])[
+                col
+            ].transform(lambda s: s.shift(1).rolling(window, min_periods=1).mean())
+        df = df.assign(**roll_cols)
+    for col in stat_cols:
+        df[f"{col}_std"] = df.groupby(["player_id", "season"])[col].transform(
+            lambda s: s.shift(1).expanding().mean()
+        )
+    return df
+
+
+def _legacy_apply_team_rolling(df, stat_cols, windows, ewm_cols, ewm_halflife):
+    df = df.copy()
+    df = df.sort_values(["team", "season", "week"])
+    available_cols = [c for c in stat_cols if c in df.columns]
+    for window in windows:
+        roll_cols = {}
+        for col in available_cols:
+            roll_cols[f"{col}_roll{window}"] = df.groupby(["team", "season"])[
+                col
+            ].transform(lambda s: s.shift(1).rolling(window, min_periods=1).mean())
+        df = df.assign(**roll_cols)
+    for col in available_cols:
+        df[f"{col}_std"] = df.groupby(["team", "season"])[col].transform(
+            lambda s: s.shift(1).expanding().mean()
+        )
+    ewm_data = {}
+    for col in [c for c in ewm_cols if c in df.columns]:
+        ewm_data[f"{col}_ewm{ewm_halflife}"] = df.groupby(["team", "season"])[
+            col
+        ].transform(
+            lambda s: s.shift(1).ewm(halflife=ewm_halflife, min_periods=1).mean()
+        )
+    return df.assign(**ewm_data)
+
+
+def _legacy_pbp_trailing(df):
+    df = df.sort_values(["player_id", "season", "week"]).copy()
+    raw_features = [c for c in PBP_ADV_ALL_RAW_FEATURES if c in df.columns]
+    grouped = df.groupby(["player_id", "season"])
+    new_cols = {}
+    for feat in raw_features:
+        new_cols[f"{feat}_roll4"] = grouped[feat].transform(
+            lambda s: s.shift(1).rolling(4, min_periods=2).mean()
+        )
+        new_cols[f"{feat}_trail"] = grouped[feat].transform(
+            lambda s: s.shift(1).expanding(min_periods=2).mean()
+        )
+    new_cols["adot_slope"] = grouped["adot"].transform(
+        lambda s: s.shift(1)
+        .rolling(4, min_periods=3)
+        .apply(_slope_for_window, raw=False)
+    )
+    return df.assign(**new_cols)
+
+
+def _player_weeks(cols, seed=11) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    rows = []
+    for season in (2023, 2024):
+        for p in range(40):
+            for week in range(1, 19):
+                if rng.random() < 0.25:
+                    continue
+                rows.append({"player_id": f"p{p}", "season": season, "week": week})
+    df = pd.DataFrame(rows).sample(frac=1.0, random_state=seed)
+    for c in cols:
+        df[c] = rng.normal(5, 4, len(df))
+        df.loc[rng.random(len(df)) < 0.1, c] = np.nan
+    return df
+
+
+class TestBuilderParity:
+    def test_compute_rolling_averages(self):
+        df = _player_weeks(ROLLING_STAT_COLS)
+        pd.testing.assert_frame_equal(
+            compute_rolling_averages(df),
+            _legacy_compute_rolling_averages(df),
+            check_exact=True,
+        )
+
+    def test_apply_team_rolling(self):
+        df = _player_weeks(["epa", "success_rate", "pace"]).rename(
+            columns={"player_id": "team"}
+        )
+        kwargs = dict(
+            stat_cols=["epa", "success_rate", "pace"],
+            windows=[3, 6],
+            ewm_cols=["epa", "pace"],
+            ewm_halflife=3,
+        )
+        pd.testing.assert_frame_equal(
+            apply_team_rolling(df, **kwargs),
+            _legacy_apply_team_rolling(df, **kwargs),
+            check_exact=True,
+        )
+
+    def test_add_pbp_advanced_trailing_features(self):
+        df = _player_weeks(PBP_ADV_ALL_RAW_FEATURES)
+        pd.testing.assert_frame_equal(
+            add_pbp_advanced_trailing_features(df),
+            _legacy_pbp_trailing(df),
+            check_exact=True,
+        )
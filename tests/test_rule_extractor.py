@@ -317,6 +317,136 @@ class TestMultiPattern(unittest.TestCase):
         self.assertFalse(kelce.is_questionable)
 
 
+def _legacy_extract(doc: dict) -> List[tuple]:
+    """Per-name, per-window reference implementation of ``extract``."""
+    import re
+
+    from src.sentiment.processing.rule_extractor import (
+        _NAME_PATTERN,
+        _PATTERNS,
+        _SENTENCE_DELIMS,
+        _WINDOW_CEILING,
+    )
+
+    text = f"{doc.get('title', '') or ''}\n\n{doc.get('body_text', '') or ''}".strip()
+    out = []
+    for name in dict.fromkeys(_NAME_PATTERN.findall(text)):
+        windows = []
+        for m in re.finditer(re.escape(name), text):
+            left_limit = max(0, m.start() - _WINDOW_CEILING)
+            right_limit = min(len(text), m.end() + _WINDOW_CEILING)
+            left, right = m.start(), m.end()
+            while left > left_limit and text[left - 1] not in _SENTENCE_DELIMS:
+                left -= 1
+            while right < right_limit and text[right] not in _SENTENCE_DELIMS:
+                right += 1
+            if right < len(text):
+                right += 1
+            windows.append(text[left:right])
+        for regex, sentiment, category, events in _PATTERNS:
+            if any(regex.search(w) for w in windows):
+                out.append((name, sentiment, category, tuple(sorted(events))))
+                break
+    return out
+
+
+def _random_docs(n: int, seed: int) -> List[dict]:
+    """Synthetic multi-player docs that stress window edges."""
+    import random
+
+    rng = random.Random(seed)
+    names = ["Patrick Mahomes", "Travis Kelce", "Josh Allen", "Amon-Ra St. Brown"]
+    phrases = [
+        "ruled out",
+        "ruled\nout",
+        "RULED OUT",
+        "Placed On ir",
+        "is questionable",
+        "activated from injured reserve",
+        "placed on IR",
+        "signed with",
+        "resigned with",
+        "hold out",
+        "holdouts",
+        "drafted by the Chiefs",
+        "limited to 12 snaps",
+        "gusts of 35 mph",
+        "workhorse back",
+        "breakout",
+        "concern",
+    ]
+    fillers = ["the", "team", "said", "Sunday", "week", "coach", "café", "x" * 40]
+    delims = [". ", "! ", "? ", "\n", " ", " ", " ", ""]
+    docs = []
+    for i in range(n):
+        parts = []
+        for _ in range(rng.randint(5, 60)):
+            pool = rng.choice([names, phrases, fillers, fillers])
+            parts.append(rng.choice(pool) + rng.choice(delims))
+        if rng.random() < 0.2:
+            # A punctuation-free run longer than the window ceiling.
+            parts.insert(rng.randrange(len(parts)), "word " * rng.randint(90, 140))
+        docs.append(
+            {
+                "external_id": f"doc-{i}",
+                "title": rng.choice(names),
+                "body_text": "".join(parts),
+            }
+        )
+    return docs
+
+
+class TestSinglePassParity(unittest.TestCase):
+    """The single-scan extractor must match per-window regex searches."""
+
+    def setUp(self) -> None:
+        from src.sentiment.processing.rule_extractor import RuleExtractor
+
+        self.extractor = RuleExtractor()
+
+    def _signature(self, signals) -> List[tuple]:
+        out = []
+        for s in signals:
+            events = tuple(sorted(k for k, v in s.to_dict()["events"].items() if v))
+            out.append((s.player_name, s.sentiment, s.category, events))
+        return out
+
+    def test_matches_per_window_reference(self) -> None:
+        for doc in _random_docs(400, seed=7):
+            self.assertEqual(
+                self._signature(self.extractor.extract(doc)), _legacy_extract(doc)
+            )
+
+    def test_window_edge_cases(self) -> None:
+        long_run = "word " * 120
+        docs = [
+            # Pattern split across a newline sentence boundary.
+            {"title": "Travis Kelce ruled", "body_text": "out for the season."},
+            # Name mention in a >500 char sentence: window is capped mid-word.
+            {"title": "", "body_text": f"Josh Allen {long_run} signed with Bills."},
+            {"title": "", "body_text": f"resigned with {long_run}Josh Allen went."},
+            # Repeated mention; only the second sentence has a pattern.
+            {
+                "title": "Patrick Mahomes update",
+                "body_text": "Quiet day. Patrick Mahomes is questionable.",
+            },
+        ]
+        for doc in docs:
+            self.assertEqual(
+                self._signature(self.extractor.extract(doc)), _legacy_extract(doc)
+            )
+
+    def test_extract_batch_workers_match_serial(self) -> None:
+        docs = _random_docs(150, seed=3)
+        serial = self.extractor.extract_batch(docs)
+        parallel = self.extractor.extract_batch(docs, workers=2)
+        self.assertEqual(list(parallel), list(serial))
+        for doc_id, signals in serial.items():
+            self.assertEqual(
+                self._signature(parallel[doc_id]), self._signature(signals)
+            )
+
+
 class TestPlayerSignalFormat(unittest.TestCase):
     """Verify signals match the PlayerSignal dataclass from extractor.py."""
 
@@ -0,0 +1,77 @@
+"""Tests for process-pool per-season assembly (src/season_parallel.py)."""
+
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import season_parallel  # noqa: E402
+from season_parallel import map_seasons, resolve_in_flight  # noqa: E402
+
+
+def _season_frame(season: int) -> pd.DataFrame:
+    """Deterministic mixed-dtype frame; early seasons finish last."""
+    time.sleep(max(0.0, (2030 - season) * 0.01))
+    rng = np.random.default_rng(season)
+    n = 5 + season % 7
+    return pd.DataFrame(
+        {
+            "season": np.full(n, season, dtype=np.int32),
+            "player_id": [f"{season}-{i}" for i in range(n)],
+            "value": rng.normal(size=n),
+            "flag": rng.random(n) < 0.5,
+            "position": pd.Categorical(["QB", "RB", "WR", "TE", "K"] * n)[:n],
+        }
+    )
+
+
+def _fail_on_2021(season: int) -> int:
+    if season == 2021:
+        raise ValueError("bad season")
+    return season
+
+
+class TestResolveInFlight:
+    def test_workers_and_seasons_bound(self):
+        assert resolve_in_flight(8, 3, season_mb=1, memory_mb=10_000) == 3
+        assert resolve_in_flight(2, 10, season_mb=1, memory_mb=10_000) == 2
+
+    def test_memory_cap(self):
+        assert resolve_in_flight(8, 10, season_mb=2048, memory_mb=6000) == 2
+
+    def test_never_below_one(self):
+        assert resolve_in_flight(8, 10, season_mb=4096, memory_mb=100) == 1
+        assert resolve_in_flight(0, 10, season_mb=1, memory_mb=100) == 1
+
+
+class TestMapSeasons:
+    seasons = [2016, 2017, 2018, 2019, 2020, 2021]
+
+    def test_parallel_matches_serial(self, monkeypatch):
+        monkeypatch.setattr(season_parallel, "available_memory_mb", lambda: 10**6)
+        serial = pd.concat(
+            map_seasons(_season_frame, self.seasons, workers=1), ignore_index=True
+        )
+        parallel = pd.concat(
+            map_seasons(_season_frame, self.seasons, workers=3), ignore_index=True
+        )
+        pd.testing.assert_frame_equal(parallel, serial, check_exact=True)
+        assert list(parallel["season"].unique()) == self.seasons
+
+    def test_serial_when_memory_tight(self, monkeypatch):
+        monkeypatch.setattr(season_parallel, "available_memory_mb", lambda: 1)
+        calls = []
+        # A closure is not picklable, so this only works on the serial path.
+        out = map_seasons(lambda s: calls.append(s) or s, self.seasons, workers=4)
+        assert out == self.seasons
+        assert calls == self.seasons
+
+    def test_exception_propagates(self, monkeypatch):
+        monkeypatch.setattr(season_parallel, "available_memory_mb", lambda: 10**6)
+        with pytest.raises(ValueError, match="bad season"):
+            map_seasons(_fail_on_2021, self.seasons, workers=2)
@@ -5,17 +5,36 @@ _upsert_projections() renames projection columns (e.g. proj_passing_yards ->
 proj_pass_yards) BEFORE calling _build_projected_stats_json() on each row.
 _build_projected_stats_json() previously looked up the pre-rename names, so
 `col in row.index` never matched and `projected_stats` was always None.
+
+Also pins the columnar row builders against the previous iterrows builders
+and the COPY staging / single-merge bulk path against a fake connection.
 """
 
 import json
+import math
 import os
 import sys
 
+import numpy as np
 import pandas as pd
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
-from scripts.sync_gold_to_db import _build_projected_stats_json
+from scripts.sync_gold_to_db import (
+    PREDICTION_COLUMNS,
+    PREDICTION_KEY,
+    PROJECTION_COLUMNS,
+    PROJECTION_KEY,
+    _already_synced,
+    _build_projected_stats_json,
+    _bulk_upsert,
+    _copy_payload,
+    _prediction_rows,
+    _projection_rows,
+    _safe_bool,
+    _safe_float,
+    _upsert_sql,
+)
 
 
 def _renamed_row() -> pd.Series:
@@ -70,3 +89,193 @@ def test_build_projected_stats_json_none_when_no_stat_columns_present():
     """A row with none of the expected (post-rename) stat columns yields None."""
     row = pd.Series({"player_id": "00-0012345", "projected_points": 21.4})
     assert _build_projected_stats_json(row) is None
+
+
+# ---------------------------------------------------------------------------
+# Columnar row builders and COPY bulk path
+# ---------------------------------------------------------------------------
+
+def _legacy_projection_rows(df, season, week, scoring_format):
+    """The pre-columnar iterrows tuple builder, verbatim."""
+    rows = []
+    for _, row in df.iterrows():
+        stats_json = _build_projected_stats_json(row)
+        rows.append((
+            str(row.get("player_id", "")),
+            str(row.get("player_name", "")),
+            str(row.get("position", "")),
+            str(row.get("team", "")),
+            int(season),
+            int(week),
+            scoring_format,
+            _safe_float(row.get("projected_points")),
+            _safe_float(row.get("projected_floor")),
+            _safe_float(row.get("projected_ceiling")),
+            _safe_bool(row.get("is_bye_week")),
+            _safe_bool(row.get("is_rookie_projection")),
+            _safe_float(row.get("proj_pass_yards")),
+            _safe_float(row.get("proj_pass_tds")),
+            _safe_float(row.get("proj_rush_yards")),
+            _safe_float(row.get("proj_rush_tds")),
+            _safe_float(row.get("proj_rec")),
+            _safe_float(row.get("proj_rec_yards")),
+            _safe_float(row.get("proj_rec_tds")),
+            _safe_float(row.get("proj_fg_makes")),
+            _safe_float(row.get("proj_xp_makes")),
+            int(row["position_rank"]) if _safe_float(row.get("position_rank")) is not None else None,
+            str(row["injury_status"]) if row.get("injury_status") not in (None, float("nan")) and str(row.get("injury_status", "")).lower() not in ("nan", "none", "") else None,
+            stats_json,
+        ))
+    return rows
+
+
+def _legacy_prediction_rows(df, season, week):
+    rows = []
+    for _, row in df.iterrows():
+        rows.append((
+            str(row.get("game_id", "")),
+            int(season),
+            int(week),
+            str(row.get("home_team", "")),
+            str(row.get("away_team", "")),
+            _safe_float(row.get("predicted_spread")),
+            _safe_float(row.get("predicted_total")),
+            _safe_float(row.get("vegas_spread")),
+            _safe_float(row.get("vegas_total")),
+            _safe_float(row.get("spread_edge")),
+            _safe_float(row.get("total_edge")),
+            str(row.get("confidence_tier", "low")),
+            str(row.get("ats_pick", "")),
+            str(row.get("ou_pick", "")),
+            str(row.get("model_version", "P30 Ensemble")),
+        ))
+    return rows
+
+
+def _projection_frame(n=60) -> pd.DataFrame:
+    rng = np.random.default_rng(7)
+    df = pd.DataFrame(
+        {
+            "player_id": [f"00-{i:07d}" for i in range(n)],
+            "player_name": [f"Player {i}" for i in range(n)],
+            "position": rng.choice(["QB", "RB", "WR", "TE"], n),
+            "team": rng.choice(["KC", "BUF", None], n),
+            "projected_points": rng.normal(12, 5, n),
+            "projected_floor": rng.normal(6, 2, n),
+            "is_bye_week": rng.random(n) < 0.1,
+            "is_rookie_projection": rng.choice([True, False, None], n),
+            "proj_pass_yards": rng.normal(200, 50, n),
+            "proj_rec": rng.normal(4, 2, n),
+            "proj_targets": rng.normal(6, 2, n),
+            "position_rank": rng.integers(1, 60, n).astype(float),
+            "injury_status": rng.choice(["Questionable", None, "nan", ""], n),
+        }
+    )
+    df.loc[rng.random(n) < 0.2, "projected_points"] = np.nan
+    df.loc[rng.random(n) < 0.2, "proj_rec"] = np.nan
+    df.loc[rng.random(n) < 0.2, "position_rank"] = np.nan
+    return df
+
+
+def _same(a, b) -> bool:
+    if isinstance(a, float) and isinstance(b, float) and math.isnan(a):
+        return math.isnan(b)
+    return a == b and type(a) is type(b)
+
+
+def test_projection_rows_match_iterrows_builder():
+    df = _projection_frame()
+    new = _projection_rows(df, 2026, 3, "half_ppr")
+    old = _legacy_projection_rows(df, 2026, 3, "half_ppr")
+    assert len(new) == len(old)
+    for a, b in zip(new, old):
+        assert len(a) == len(PROJECTION_COLUMNS)
+        assert all(_same(x, y) for x, y in zip(a, b)), (a, b)
+
+
+def test_prediction_rows_match_iterrows_builder():
+    df = pd.DataFrame(
+        {
+            "game_id": ["2026_01_KC_BUF", "2026_01_DAL_NYG"],
+            "home_team": ["BUF", "NYG"],
+            "away_team": ["KC", "DAL"],
+            "predicted_spread": [-2.5, np.nan],
+            "vegas_total": [48.5, 44.0],
+            "ats_pick": ["KC", None],
+        }
+    )
+    new = _prediction_rows(df, 2026, 1)
+    old = _legacy_prediction_rows(df, 2026, 1)
+    assert len(new[0]) == len(PREDICTION_COLUMNS)
+    assert all(_same(x, y) for a, b in zip(new, old) for x, y in zip(a, b))
+
+
+def test_empty_frame_builds_no_rows():
+    assert _projection_rows(pd.DataFrame(), 2026, 1, "ppr") == []
+
+
+def test_copy_payload_escapes_and_nulls():
+    buf = _copy_payload([("a\tb", None, True, 1.5, '{"x": "back\\\\slash"}')])
+    assert buf.getvalue() == 'a\\tb\t\\N\tt\t1.5\t{"x": "back\\\\\\\\slash"}\n'
+
+
+def test_upsert_sql_updates_non_key_columns():
+    sql = _upsert_sql("predictions", PREDICTION_COLUMNS, PREDICTION_KEY, "VALUES (1)")
+    assert "ON CONFLICT (game_id, model_version)" in sql
+    assert "season = EXCLUDED.season" in sql
+    assert "game_id = EXCLUDED.game_id" not in sql
+    assert "model_version = EXCLUDED.model_version" not in sql
+
+
+class _FakeCursor:
+    def __init__(self, log, fetch=None):
+        self.log = log
+        self.fetch = fetch
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, sql, params=None):
+        self.log.append(("execute", sql, params))
+
+    def copy_expert(self, sql, buf):
+        self.log.append(("copy", sql, buf.getvalue()))
+
+    def fetchone(self):
+        return self.fetch
+
+
+class _FakeConn:
+    def __init__(self, fetch=None):
+        self.log = []
+        self.fetch = fetch
+
+    def cursor(self):
+        return _FakeCursor(self.log, self.fetch)
+
+
+def test_bulk_upsert_stages_copy_then_single_merge():
+    conn = _FakeConn()
+    rows = _projection_rows(_projection_frame(5), 2026, 1, "ppr")
+    # A duplicate key: the later row must win, as with executemany.
+    dup = rows[0][:7] + (99.0,) + rows[0][8:]
+    _bulk_upsert(conn, "projections", PROJECTION_COLUMNS, PROJECTION_KEY, rows + [dup])
+
+    kinds = [entry[0] for entry in conn.log]
+    assert kinds == ["execute", "copy", "execute"]
+    assert "CREATE TEMP TABLE _stage_projections" in conn.log[0][1]
+    payload = conn.log[1][2].splitlines()
+    assert len(payload) == 5
+    assert payload[0].split("\t")[7] == "99.0"
+    merge = conn.log[2][1]
+    assert "SELECT player_id" in merge and "FROM _stage_projections" in merge
+    assert "ON CONFLICT (player_id, season, week, scoring_format)" in merge
+
+
+def test_already_synced_compares_hash():
+    assert _already_synced(_FakeConn(fetch=("abc",)), "projections", "x.parquet", "abc")
+    assert not _already_synced(_FakeConn(fetch=("abc",)), "projections", "x.parquet", "def")
+    assert not _already_synced(_FakeConn(fetch=None), "projections", "x.parquet", "abc")
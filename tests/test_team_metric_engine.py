@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""Tests for the single-pass team-week metric engine (``src/team_metric_engine.py``).
+
+The engine must reproduce the per-metric groupby + outer-merge functions it
+replaced (same rows, values and fill rules), and the one-scan Silver helper
+must match the five orchestrators called separately.
+"""
+
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Project src/ on path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from config import TEAM_DIVISIONS
+from team_analytics import (
+    _filter_valid_plays,
+    compute_pbp_derived_metrics,
+    compute_pbp_metrics,
+    compute_situational_splits,
+    compute_sos_metrics,
+    compute_team_silver_tables,
+    compute_tendency_metrics,
+)
+from team_metric_engine import (
+    KEY_COLS,
+    TEAM_METRICS,
+    TeamWeekAggregator,
+    _parse_spec,
+    table_columns,
+)
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+def _make_season(seed=11, weeks=20, games_per_week=4):
+    """Random season of plays with NaNs, non-REG weeks and every input column."""
+    rng = np.random.default_rng(seed)
+    teams = sorted(TEAM_DIVISIONS)[:8]
+    rows = []
+    for week in range(1, weeks + 1):
+        order = rng.permutation(teams)
+        for g in range(games_per_week):
+            home, away = order[2 * g], order[2 * g + 1]
+            for drive in range(1, 15):
+                pos, dfn = (home, away) if drive % 2 else (away, home)
+                for _ in range(rng.integers(1, 7)):
+                    play_type = rng.choice(
+                        ["pass", "run", "punt", "field_goal", "kickoff", "no_play"],
+                        p=[0.45, 0.35, 0.06, 0.04, 0.05, 0.05],
+                    )
+                    rows.append(
+                        {
+                            "game_id": f"{week}_{home}_{away}",
+                            "season": 2024,
+                            "week": week,
+                            "season_type": "REG" if week <= 18 else "POST",
+                            "posteam": pos,
+                            "defteam": dfn,
+                            "home_team": home,
+                            "away_team": away,
+                            "play_type": play_type,
+                            "epa": rng.normal() if rng.random() > 0.03 else np.nan,
+                            "success": float(rng.random() < 0.45),
+                            "cpoe": (
+                                rng.normal(0, 10) if play_type == "pass" else np.nan
+                            ),
+                            "pass_attempt": float(play_type == "pass"),
+                            "rush_attempt": float(play_type == "run"),
+                            "xpass": rng.random() if rng.random() > 0.1 else np.nan,
+                            "yardline_100": float(rng.integers(1, 100)),
+                            "drive": float(drive),
+                            "touchdown": float(rng.random() < 0.05),
+                            "down": float(rng.integers(1, 5)),
+                            "fourth_down_converted": float(rng.random() < 0.5),
+                            "fourth_down_failed": float(rng.random() < 0.5),
+                            "third_down_converted": float(rng.random() < 0.4),
+                            "third_down_failed": float(rng.random() < 0.5),
+                            "yards_gained": float(rng.integers(-5, 40)),
+                            "sack": float(rng.random() < 0.07),
+                            "penalty": float(rng.random() < 0.1),
+                            "penalty_team": rng.choice([pos, dfn]),
+                            "penalty_yards": float(rng.choice([5, 10, 15])),
+                            "score_differential": float(rng.integers(-21, 22)),
+                            "fumble": float(rng.random() < 0.03),
+                            "fumble_recovery_1_team": rng.choice([pos, dfn]),
+                            "special_teams_play": float(
+                                play_type in ("punt", "field_goal", "kickoff")
+                            ),
+                            "field_goal_attempt": float(play_type == "field_goal"),
+                            "field_goal_result": rng.choice(["made", "missed"]),
+                            "kick_distance": float(rng.integers(20, 60)),
+                            "kickoff_attempt": float(play_type == "kickoff"),
+                            "punt_attempt": float(play_type == "punt"),
+                            "return_yards": float(rng.integers(0, 40)),
+                            "kickoff_returner_player_id": None,
+                            "punt_in_endzone": float(rng.random() < 0.1),
+                            "first_down": float(rng.random() < 0.3),
+                            "drive_time_of_possession": f"{rng.integers(0, 8)}:{rng.integers(0, 60):02d}",
+                        }
+                    )
+    return pd.DataFrame(rows)
+
+
+def _legacy_mean(valid, team_col, mask, col, name):
+    """The per-metric groupby the engine replaced."""
+    return (
+        valid[mask]
+        .groupby([team_col, "season", "week"])[col]
+        .mean()
+        .reset_index()
+        .rename(columns={team_col: "team", col: name})
+    )
+
+
+@pytest.fixture(scope="module")
+def season():
+    return _make_season()
+
+
+# ---------------------------------------------------------------------------
+# Registry
+# ---------------------------------------------------------------------------
+
+
+class TestRegistry:
+    def test_specs_and_masks_are_valid(self):
+        names = [m.name for m in TEAM_METRICS]
+        assert len(names) == len(set(names))
+        for metric in TEAM_METRICS:
+            assert metric.side in ("off", "def")
+            _parse_spec(metric.numerator)
+            if metric.denominator is not None:
+                _parse_spec(metric.denominator)
+
+    def test_bad_spec_rejected(self):
+        with pytest.raises(ValueError, match="Bad aggregate spec"):
+            _parse_spec("median:epa")
+
+    def test_helper_metrics_are_not_emitted(self):
+        assert table_columns("proe") == ["proe"]
+
+
+# ---------------------------------------------------------------------------
+# Parity with the per-metric groupbys
+# ---------------------------------------------------------------------------
+
+
+class TestParity:
+    def test_means_bit_identical_to_groupby(self, season):
+        valid = _filter_valid_plays(season)
+        result = TeamWeekAggregator(season).frame(["epa"])
+        expected = _legacy_mean(
+            valid, "posteam", valid["play_type"] == "pass", "epa", "off_pass_epa"
+        )
+        merged = expected.merge(result, on=KEY_COLS, suffixes=("", "_engine"))
+        assert len(merged) == len(expected)
+        np.testing.assert_array_equal(
+            merged["off_pass_epa"].to_numpy(), merged["off_pass_epa_engine"].to_numpy()
+        )
+
+    def test_rows_sorted_with_range_index(self, season):
+        result = TeamWeekAggregator(season).frame(["penalties", "rz_trips"])
+        expected = result.sort_values(KEY_COLS).reset_index(drop=True)
+        pd.testing.assert_frame_equal(result, expected)
+
+    def test_fill_only_inside_table_key_set(self):
+        plays = pd.DataFrame(
+            {
+                "posteam": ["A", "A", "C"],
+                "defteam": ["B", "B", "A"],
+                "season": 2024,
+                "week": [1, 1, 2],
+                "play_type": "pass",
+                "epa": 0.1,
+                "yardline_100": [10, 50, 50],
+                "drive": [1, 2, 3],
+            }
+        )
+        result = TeamWeekAggregator(plays, filtered=True).frame(["pace", "rz_trips"])
+        by_key = result.set_index(["team", "week"])
+        # A drove into the red zone; B only defended it -> 0, not NaN
+        assert by_key.loc[("A", 1), "off_rz_trips"] == 1
+        assert by_key.loc[("B", 1), "off_rz_trips"] == 0
+        # No red zone plays at all in week 2 -> outside the table, NaN
+        assert np.isnan(by_key.loc[("C", 2), "off_rz_trips"])
+
+    def test_missing_columns_skip_table(self, season):
+        engine = TeamWeekAggregator(season.drop(columns=["sack"]))
+        result = engine.frame(["pace", "sacks"], keep_empty=["pace"])
+        assert "off_sack_rate" not in result.columns
+        assert "pace" in result.columns
+
+
+# ---------------------------------------------------------------------------
+# One-scan Silver tables
+# ---------------------------------------------------------------------------
+
+
+class TestSilverTables:
+    def test_matches_separate_orchestrators(self, season):
+        tables = compute_team_silver_tables(season)
+        expected = {
+            "pbp_metrics": compute_pbp_metrics(season),
+            "tendencies": compute_tendency_metrics(season),
+            "sos": compute_sos_metrics(season),
+            "situational": compute_situational_splits(season),
+            "pbp_derived": compute_pbp_derived_metrics(season),
+        }
+        assert set(tables) == set(expected)
+        for name, frame in expected.items():
+            assert not frame.empty
+            pd.testing.assert_frame_equal(tables[name], frame, check_exact=True)
+
+    def test_no_valid_plays_returns_empty_tables(self, season):
+        post = season.assign(season_type="POST")
+        tables = compute_team_silver_tables(post)
+        assert all(frame.empty for frame in tables.values())
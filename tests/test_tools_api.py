@@ -132,3 +132,64 @@ def test_compare_404_when_no_weekly_parquet():
 def test_injuries_404_when_no_weekly_parquet():
     resp = client.get("/api/tools/injuries?season=2030&week=1")
     assert resp.status_code == 404
+
+
+def _synthetic_preseason():
+    import pandas as pd
+
+    return pd.DataFrame(
+        {
+            "player_id": ["p1", "p2", "p3", "p4", "p2"],
+            "player_name": ["A", "B", "C", "D", "B-dup"],
+            "team": ["KC", "SF", "KC", "BUF", "SF"],
+            "position": ["QB", "RB", "wr", "WR", "RB"],
+            "projected_season_points": [360.0, 180.0, 180.0, 36.0, 999.0],
+            "proj_season": 2026,
+        }
+    )
+
+
+@pytest.fixture
+def synthetic_tools(monkeypatch, tmp_path):
+    """Tools router backed by a synthetic preseason frame and no schedule."""
+    frame = _synthetic_preseason()
+    monkeypatch.setattr(tools_mod, "load_latest_preseason", lambda season: frame)
+    monkeypatch.setattr(tools_mod, "DATA_DIR", tmp_path)
+    monkeypatch.setattr(tools_mod, "_ros_cache", type(tools_mod._ros_cache)())
+    return frame
+
+
+def test_ros_table_is_shared_and_indexed(synthetic_tools):
+    table = tools_mod._ros_table(2026, "half_ppr", 10)
+    assert tools_mod._ros_table(2026, "half_ppr", 10) is table
+    assert tools_mod._ros_table(2026, "half_ppr", 11) is not table
+    # First row wins for duplicated ids; unknown ids are -1.
+    assert list(table.rows(["p2", "nope", "p1"])) == [1, -1, 0]
+    assert list(table.ranking("WR")) == [2, 3]
+    assert table.player(0).ros_points == 180.0  # 360 * 9/18 (linear fallback)
+
+
+def test_batch_trades_match_single_trade_endpoint(synthetic_tools):
+    trades = [
+        {"side_a": ["p1"], "side_b": ["p2", "p3"]},
+        {"side_a": ["p4", "nope"], "side_b": ["p2"]},
+        {"side_a": ["p3"], "side_b": ["p3"]},
+    ]
+    resp = client.post(
+        "/api/tools/trades", json={"trades": trades, "season": 2026, "week": 10}
+    )
+    assert resp.status_code == 200
+    results = resp.json()["trades"]
+    assert len(results) == len(trades)
+    for trade, result in zip(trades, results):
+        single = client.post(
+            "/api/tools/trade", json={**trade, "season": 2026, "week": 10}
+        )
+        assert single.json() == result
+    assert results[1]["side_a"]["unmatched_player_ids"] == ["nope"]
+    assert results[0]["delta_ros_points"] == 0.0  # 180 vs 90 + 90
+
+
+def test_batch_trades_rejects_empty_batch():
+    resp = client.post("/api/tools/trades", json={"trades": [], "season": 2026})
+    assert resp.status_code == 422
@@ -0,0 +1,114 @@
+"""Parity tests for ``src/walk_forward_features.py``.
+
+The walk-forward state must serve exactly the frame the per-week rebuild
+(``build_silver_prefix``) produces — same values to the bit, same dtypes,
+same row order and the same index labels — for every backtest week,
+including the thin-history weeks that fall back to the prior season.
+"""
+
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from walk_forward_features import (  # noqa: E402
+    WalkForwardSilverState,
+    build_silver_prefix,
+)
+
+
+def _make_weekly(seed: int = 7) -> pd.DataFrame:
+    """Two seasons of shuffled player-weeks with fractional stat values."""
+    rng = np.random.default_rng(seed)
+    rows = []
+    teams = ["KC", "BUF", "SF"]
+    for season in (2023, 2024):
+        for week in range(1, 19):
+            for p in range(12):
+                # Players miss weeks so groups have gaps of varying length.
+                if rng.random() < 0.2:
+                    continue
+                rows.append(
+                    {
+                        "player_id": f"p{p:02d}",
+                        "player_name": f"P.Player{p}",
+                        "position": ["QB", "RB", "WR", "TE"][p % 4],
+                        "recent_team": teams[p % 3],
+                        "season": season,
+                        "week": week,
+                        "targets": int(rng.integers(0, 12)),
+                        "carries": int(rng.integers(0, 20)),
+                        "air_yards": float(rng.normal(40, 25)),
+                        "receiving_yards": float(rng.normal(45, 30)),
+                        "rushing_yards": float(rng.normal(30, 20)),
+                        "receptions": int(rng.integers(0, 9)),
+                        "passing_yards": float(rng.normal(120, 90)),
+                        "fantasy_points_ppr": float(rng.normal(10, 6)),
+                        "wopr": float(rng.random()),
+                    }
+                )
+    df = pd.DataFrame(rows)
+    # Bronze files are not guaranteed to be week-sorted.
+    return df.sample(frac=1.0, random_state=seed).reset_index(drop=True)
+
+
+@pytest.fixture(scope="module")
+def weekly_df() -> pd.DataFrame:
+    return _make_weekly()
+
+
+class TestWalkForwardParity:
+    @pytest.mark.parametrize("week", list(range(1, 21)))
+    def test_matches_per_week_rebuild(self, weekly_df, week):
+        state = WalkForwardSilverState(weekly_df)
+        expected = build_silver_prefix(weekly_df, 2024, week)
+        actual = state.features_before(2024, week)
+        pd.testing.assert_frame_equal(actual, expected, check_exact=True)
+        assert actual.index.equals(expected.index)
+
+    def test_sequential_walk_matches_rebuild(self, weekly_df):
+        state = WalkForwardSilverState(weekly_df)
+        for week in range(3, 19):
+            expected = build_silver_prefix(weekly_df, 2024, week)
+            actual = state.features_before(2024, week)
+            pd.testing.assert_frame_equal(actual, expected, check_exact=True)
+
+    def test_advance_steps_one_week(self, weekly_df):
+        state = WalkForwardSilverState(weekly_df)
+        for week in range(2, 8):
+            actual = state.advance(2024)
+            expected = build_silver_prefix(weekly_df, 2024, week)
+            pd.testing.assert_frame_equal(actual, expected, check_exact=True)
+
+
+class TestWalkForwardBehaviour:
+    def test_season_frame_built_once(self, weekly_df, monkeypatch):
+        import walk_forward_features as wff
+
+        calls = []
+        real = wff.compute_rolling_averages
+
+        def _counting(df, *args, **kwargs):
+            calls.append(len(df))
+            return real(df, *args, **kwargs)
+
+        monkeypatch.setattr(wff, "compute_rolling_averages", _counting)
+        state = wff.WalkForwardSilverState(weekly_df)
+        for week in range(3, 19):
+            state.features_before(2024, week)
+        assert len(calls) == 1
+
+    def test_returned_frame_is_independent_copy(self, weekly_df):
+        state = WalkForwardSilverState(weekly_df)
+        first = state.features_before(2024, 6)
+        first["targets_roll3"] = -1.0
+        second = state.features_before(2024, 6)
+        assert (second["targets_roll3"] != -1.0).any()
+
+    def test_unknown_season_returns_empty(self, weekly_df):
+        state = WalkForwardSilverState(weekly_df)
+        assert state.features_before(2030, 5).empty
@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+"""Tests for the shared-matrix walk-forward CV runner.
+
+The runner must reproduce the per-fold DataFrame loop it replaced exactly
+(same folds, same OOF predictions) for every model family the training
+code uses, in-process and on the process pool, and report per-fold timing
+and memory.
+"""
+
+import os
+import sys
+from functools import partial
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Project src/ on path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from config import HOLDOUT_SEASON
+from ensemble_training import (
+    _cb_fit_kwargs,
+    _lgb_fit_kwargs,
+    _xgb_fit_kwargs,
+    make_cb_model,
+    make_lgb_model,
+    make_xgb_model,
+    walk_forward_cv_with_oof,
+)
+from player_model_training import (
+    _linear_fit_kwargs,
+    _player_lgb_fit_kwargs,
+    create_ridge_pipeline,
+    player_cv_job,
+    player_cv_result,
+    player_walk_forward_cv,
+)
+from walk_forward_runner import CvJob, build_folds, run_cv_jobs
+
+SEASONS = [2018, 2019, 2020, 2021, 2022]
+FEATURES = ["f_a", "f_b", "f_c", "f_int"]
+
+XGB_PARAMS = {"n_estimators": 30, "max_depth": 3, "learning_rate": 0.1}
+LGB_PARAMS = {"n_estimators": 30, "num_leaves": 7, "verbose": -1}
+CB_PARAMS = {"iterations": 30, "depth": 3, "verbose": 0}
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+def _make_frame(n_per_season=60, seed=7):
+    """Shuffled multi-season frame with NaNs, an int feature and a gappy target."""
+    rng = np.random.default_rng(seed)
+    n = n_per_season * len(SEASONS)
+    df = pd.DataFrame(
+        {
+            "season": np.repeat(SEASONS, n_per_season),
+            "week": np.tile(np.arange(1, n_per_season + 1), len(SEASONS)),
+            "game_id": [f"g{i}" for i in range(n)],
+            "f_a": rng.normal(size=n),
+            "f_b": rng.normal(size=n),
+            "f_c": rng.normal(size=n),
+            "f_int": rng.integers(0, 5, size=n),
+        }
+    )
+    df.loc[rng.random(n) < 0.1, "f_b"] = np.nan
+    df["target"] = 2 * df["f_a"] - df["f_int"] + rng.normal(scale=0.5, size=n)
+    df["gappy"] = df["target"].where(rng.random(n) > 0.2)
+    # Shuffle so season blocks are not contiguous and the index is not 0..n.
+    df = df.sample(frac=1.0, random_state=seed)
+    df.index = df.index * 3 + 11
+    return df
+
+
+def _legacy_walk_forward(
+    data,
+    feature_cols,
+    target_col,
+    factory,
+    fit_kwargs_fn,
+    val_seasons,
+    min_train_seasons=1,
+):
+    """The per-fold DataFrame loop walk_forward_runner replaced."""
+    preds_by_fold, maes = [], []
+    for val_season in val_seasons:
+        train = data[data["season"] < val_season]
+        val = data[data["season"] == val_season]
+        if train.empty or val.empty:
+            continue
+        if train["season"].nunique() < min_train_seasons:
+            continue
+        X_train, y_train = train[feature_cols], train[target_col]
+        X_val, y_val = val[feature_cols], val[target_col]
+        model = factory()
+        fit_kw = fit_kwargs_fn(X_train, y_train, X_val, y_val) if fit_kwargs_fn else {}
+        model.fit(X_train, y_train, **fit_kw)
+        preds = np.asarray(model.predict(X_val))
+        preds_by_fold.append((val.index.values, preds))
+        maes.append(float(np.mean(np.abs(y_val.values - preds))))
+    return preds_by_fold, maes
+
+
+LEARNERS = {
+    "xgb": (partial(make_xgb_model, XGB_PARAMS), _xgb_fit_kwargs),
+    "lgb": (partial(make_lgb_model, LGB_PARAMS), _lgb_fit_kwargs),
+    "cb": (partial(make_cb_model, CB_PARAMS), _cb_fit_kwargs),
+    "ridge": (create_ridge_pipeline, _linear_fit_kwargs),
+}
+
+
+@pytest.fixture(scope="module")
+def frame():
+    return _make_frame()
+
+
+# ---------------------------------------------------------------------------
+# Folds
+# ---------------------------------------------------------------------------
+
+
+class TestBuildFolds:
+    def test_contiguous_seasons_become_slices(self):
+        seasons = np.repeat([2018, 2019, 2020], 4)
+        folds = build_folds(seasons, [2019, 2020])
+        assert [f.val_season for f in folds] == [2019, 2020]
+        assert folds[1].train == slice(0, 8)
+        assert folds[1].val == slice(8, 12)
+
+    def test_rows_restrict_and_map_to_frame_positions(self):
+        seasons = np.array([2018, 2019, 2018, 2019, 2020, 2020])
+        rows = np.array([0, 1, 3, 5])
+        (fold,) = build_folds(seasons, [2019], rows=rows)
+        assert list(np.arange(6)[fold.train]) == [0]
+        assert list(np.arange(6)[fold.val]) == [1, 3]
+        assert fold.train_size == 1 and fold.val_size == 2
+
+    def test_min_train_seasons_skips_fold(self):
+        seasons = np.repeat([2018, 2019, 2020], 2)
+        folds = build_folds(seasons, [2019, 2020], min_train_seasons=2)
+        assert [f.val_season for f in folds] == [2020]
+
+    def test_holdout_raises(self):
+        with pytest.raises(ValueError, match="HOLDOUT_SEASON"):
+            build_folds(np.array([2018, HOLDOUT_SEASON]), [HOLDOUT_SEASON])
+
+
+# ---------------------------------------------------------------------------
+# Parity with the legacy loop
+# ---------------------------------------------------------------------------
+
+
+class TestParity:
+    @pytest.mark.parametrize("learner", sorted(LEARNERS))
+    def test_predictions_identical_to_dataframe_loop(self, frame, learner):
+        factory, fit_kwargs_fn = LEARNERS[learner]
+        val_seasons = [2020, 2021, 2022]
+        expected, expected_maes = _legacy_walk_forward(
+            frame, FEATURES, "target", factory, fit_kwargs_fn, val_seasons
+        )
+        job = CvJob(frame, FEATURES, "target", factory, fit_kwargs_fn, val_seasons)
+        folds = run_cv_jobs([job], workers=1)[0]
+
+        assert len(folds) == len(expected)
+        for fold, (idx, preds) in zip(folds, expected):
+            np.testing.assert_array_equal(frame.index.values[fold.val_positions], idx)
+            np.testing.assert_array_equal(fold.predictions, preds)
+        assert [f.mae for f in folds] == pytest.approx(expected_maes)
+
+    def test_player_rows_match_dropna_frame(self, frame):
+        factory, fit_kwargs_fn = (
+            partial(make_lgb_model, LGB_PARAMS),
+            _player_lgb_fit_kwargs,
+        )
+        stat_data = frame.dropna(subset=["gappy"])
+        expected, _ = _legacy_walk_forward(
+            stat_data, FEATURES, "gappy", factory, fit_kwargs_fn, [2020, 2021, 2022], 2
+        )
+        rows = np.flatnonzero(frame["gappy"].notna().to_numpy())
+        job = player_cv_job(
+            frame, FEATURES, "gappy", factory, fit_kwargs_fn, [2020, 2021, 2022], rows
+        )
+        wf, oof = player_cv_result(frame, run_cv_jobs([job], workers=1)[0])
+
+        np.testing.assert_array_equal(
+            oof["idx"].values, np.concatenate([idx for idx, _ in expected])
+        )
+        np.testing.assert_array_equal(
+            oof["oof_prediction"].values, np.concatenate([p for _, p in expected])
+        )
+        assert list(oof.columns) == ["idx", "season", "week", "oof_prediction"]
+        assert [d["val_season"] for d in wf.fold_details] == [2020, 2021, 2022]
+
+    def test_pool_matches_serial(self, frame):
+        rows = np.flatnonzero(frame["gappy"].notna().to_numpy())
+        jobs = [
+            CvJob(frame, FEATURES, "target", factory, fit_kwargs_fn, [2020, 2021, 2022])
+            for factory, fit_kwargs_fn in (LEARNERS["xgb"], LEARNERS["lgb"])
+        ] + [player_cv_job(frame, FEATURES, "gappy", *LEARNERS["xgb"], rows=rows)]
+        serial = run_cv_jobs(jobs, workers=1)
+        pooled = run_cv_jobs(jobs, workers=2, threads_per_worker=1, fold_mb=1)
+        for serial_folds, pooled_folds in zip(serial, pooled):
+            for a, b in zip(serial_folds, pooled_folds):
+                np.testing.assert_array_equal(a.val_positions, b.val_positions)
+                np.testing.assert_allclose(a.predictions, b.predictions, rtol=0, atol=0)
+
+    def test_unpicklable_factory_still_runs_with_pool(self, frame):
+        job = CvJob(
+            frame,
+            FEATURES,
+            "target",
+            lambda: make_xgb_model(XGB_PARAMS),
+            _xgb_fit_kwargs,
+            [2021, 2022],
+        )
+        folds = run_cv_jobs([job], workers=2, fold_mb=1)[0]
+        assert [f.val_season for f in folds] == [2021, 2022]
+
+
+# ---------------------------------------------------------------------------
+# Public wrappers
+# ---------------------------------------------------------------------------
+
+
+class TestWrappers:
+    def test_fold_details_report_time_and_memory(self, frame):
+        wf, _ = walk_forward_cv_with_oof(
+            frame,
+            FEATURES,
+            "target",
+            LEARNERS["ridge"][0],
+            val_seasons=[2021, 2022],
+        )
+        for detail in wf.fold_details:
+            assert detail["seconds"] >= 0
+            assert detail["peak_rss_mb"] > 0
+
+    def test_player_wrapper_holdout_guard(self, frame):
+        with pytest.raises(ValueError, match="HOLDOUT_SEASON"):
+            player_walk_forward_cv(
+                frame,
+                FEATURES,
+                "target",
+                LEARNERS["ridge"][0],
+                val_seasons=[HOLDOUT_SEASON],
+            )
@@ -0,0 +1,155 @@
+"""Tests for the in-process Gold read cache (web/api/services/gold_cache.py)."""
+
+from __future__ import annotations
+
+import os
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pytest
+from fastapi.testclient import TestClient
+
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(_PROJECT_ROOT))
+sys.path.insert(0, str(_PROJECT_ROOT / "src"))
+
+from web.api.main import app  # noqa: E402
+from web.api.services import projection_service  # noqa: E402
+from web.api.services.gold_cache import GoldCache, gold_cache  # noqa: E402
+
+
+def _name_key(p: Path):
+    return p.name
+
+
+def _frame(n: int = 6) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "player_id": [f"p{i}" for i in range(n)],
+            "player_name": [f"Player {i}" for i in range(n)],
+            "position": ["QB", "rb", "WR", None, "RB", "wr"][:n],
+            "recent_team": ["KC"] * n,
+            "projected_points": [float(20 - i) for i in range(n)],
+        }
+    )
+
+
+def _upper(s: pd.Series) -> pd.Series:
+    return s.str.upper()
+
+
+@pytest.fixture
+def parquet(tmp_path) -> Path:
+    path = tmp_path / "projections_half_ppr_20260901_120000.parquet"
+    _frame().to_parquet(path, index=False)
+    return path
+
+
+class TestFrames:
+    def test_second_read_is_a_hit(self, parquet):
+        cache = GoldCache(max_bytes=10**8)
+        first = cache.read(parquet)
+        second = cache.read(parquet)
+        assert first is second
+        stats = cache.stats()
+        assert (stats["frame_misses"], stats["frame_hits"]) == (1, 1)
+        assert stats["entries"] == 1 and stats["bytes"] > 0
+
+    def test_rewritten_file_is_reloaded(self, parquet):
+        cache = GoldCache(max_bytes=10**8)
+        cache.read(parquet)
+        _frame(3).to_parquet(parquet, index=False)
+        st = os.stat(parquet)
+        os.utime(parquet, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+        assert len(cache.read(parquet)) == 3
+        assert cache.stats()["frame_misses"] == 2
+
+    def test_lru_eviction_under_byte_budget(self, tmp_path):
+        paths = []
+        for i in range(3):
+            p = tmp_path / f"f{i}.parquet"
+            _frame().to_parquet(p, index=False)
+            paths.append(p)
+        one = GoldCache(max_bytes=10**8)
+        one.read(paths[0])
+        budget = one.stats()["bytes"] * 2
+
+        cache = GoldCache(max_bytes=budget)
+        cache.read(paths[0])
+        cache.read(paths[1])
+        cache.read(paths[0])  # paths[1] is now least recently used
+        cache.read(paths[2])
+        stats = cache.stats()
+        assert stats["entries"] == 2 and stats["evictions"] == 1
+        assert stats["bytes"] <= budget
+        cache.read(paths[0])
+        assert cache.stats()["frame_hits"] == 2
+
+    def test_zero_budget_disables_caching(self, parquet):
+        cache = GoldCache(max_bytes=0)
+        cache.read(parquet)
+        cache.read(parquet)
+        assert cache.stats()["frame_misses"] == 2
+        assert cache.stats()["entries"] == 0
+
+
+class TestIndexes:
+    def test_rows_where_matches_boolean_filter(self, parquet):
+        cache = GoldCache(max_bytes=10**8)
+        df = pd.read_parquet(parquet)
+        for value in ("RB", "WR", "QB", "K"):
+            expected = df[df["position"].str.upper() == value]
+            actual = cache.rows_where(parquet, "position", value, normalize=_upper)
+            pd.testing.assert_frame_equal(actual, expected)
+        pd.testing.assert_frame_equal(
+            cache.rows_where(parquet, "player_id", "p2"),
+            df[df["player_id"].astype(str) == "p2"],
+        )
+        assert cache.stats()["index_builds"] == 2
+
+
+class TestListings:
+    def test_listing_cached_until_directory_changes(self, tmp_path):
+        cache = GoldCache(max_bytes=10**8)
+        _frame().to_parquet(tmp_path / "a_20260101_000000.parquet")
+        assert cache.latest(tmp_path, "*.parquet", _name_key).name.startswith("a_")
+        assert cache.latest(tmp_path, "*.parquet", _name_key).name.startswith("a_")
+        assert cache.stats()["listing_hits"] == 1
+
+        _frame().to_parquet(tmp_path / "b_20260102_000000.parquet")
+        st = os.stat(tmp_path)
+        os.utime(tmp_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+        assert cache.latest(tmp_path, "*.parquet", _name_key).name.startswith("b_")
+
+    def test_missing_directory(self, tmp_path):
+        cache = GoldCache(max_bytes=10**8)
+        assert cache.latest(tmp_path / "nope", "*.parquet", _name_key) is None
+
+
+class TestProjectionService:
+    def test_weekly_reads_served_from_cache(self, tmp_path, monkeypatch):
+        week_dir = tmp_path / "season=2020" / "week=3"
+        week_dir.mkdir(parents=True)
+        _frame().to_parquet(
+            week_dir / "projections_half_ppr_20200920_000000.parquet", index=False
+        )
+        monkeypatch.setattr(projection_service, "GOLD_PROJECTIONS_DIR", tmp_path)
+        gold_cache.clear()
+
+        rbs = projection_service._get_projections_parquet(2020, 3, "half_ppr", "RB")
+        assert list(rbs["player_id"]) == ["p1", "p4"]
+        assert set(rbs["scoring_format"]) == {"half_ppr"}
+        everyone = projection_service._get_projections_parquet(2020, 3, "half_ppr")
+        assert len(everyone) == 6
+
+        stats = gold_cache.stats()
+        assert stats["frame_misses"] == 1 and stats["frame_hits"] >= 1
+        assert stats["listing_hits"] >= 1
+
+    def test_cache_stats_endpoint(self):
+        resp = TestClient(app).get("/api/ops/cache-stats")
+        assert resp.status_code == 200
+        body = resp.json()
+        for key in ("frame_hits", "frame_misses", "listing_hits", "bytes"):
+            assert key in body
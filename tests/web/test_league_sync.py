@@ -740,3 +740,38 @@ class TestEndpointParitySmoke:
         assert data["roster_size"] == len(matched), (
             f"Endpoint roster_size={data['roster_size']} but direct call matched {len(matched)}"
         )
+
+
+# ---------------------------------------------------------------------------
+# Batched league scoring: one engine per season, shared by every league
+# ---------------------------------------------------------------------------
+
+
+class TestBatchedLeagueScoring:
+    """_score_leagues scores many leagues off one cached ScoringEngine."""
+
+    def test_leagues_share_one_engine_and_match_single_league_scoring(self):
+        import web.api.routers.sleeper_user as mod
+        from src.league_scoring import score_with_settings
+
+        proj = _make_proj_df()
+        proj["vorp"] = 1.0
+        settings = {
+            "A": {"rec": 1.0, "rec_yd": 0.1, "bonus_rec_te": 1.0},
+            "B": {"rec": 0.5, "rec_yd": 0.1, "pass_td": 6.0},
+            "C": {},
+        }
+        with patch.object(mod, "_load_projections", return_value=proj) as load:
+            scored = mod._score_leagues(2026, settings)
+            engine = mod._scoring_engine(2026)
+            again = mod._league_projections("A", 2026, settings["A"])
+
+        assert load.call_count == 1
+        assert engine is mod._scoring_engine(2026)
+        assert again is scored["A"]
+        assert scored["C"] is proj  # preset scoring keeps vorp
+        for league_id in ("A", "B"):
+            expected = score_with_settings(proj, settings[league_id]).drop(
+                columns=["vorp"]
+            )
+            pd.testing.assert_frame_equal(scored[league_id], expected)
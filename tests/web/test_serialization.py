@@ -0,0 +1,317 @@
+"""Tests for the column-wise response serializer (web/api/serialization.py)."""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+from pathlib import Path
+from typing import List, Optional
+
+import numpy as np
+import pandas as pd
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(_PROJECT_ROOT))
+sys.path.insert(0, str(_PROJECT_ROOT / "src"))
+
+from web.api.main import app  # noqa: E402
+from web.api.models.schemas import (  # noqa: E402
+    GamePrediction,
+    PlayerProjection,
+    ProjectionResponse,
+)
+from web.api.serialization import (  # noqa: E402
+    ResponseCache,
+    dumps,
+    envelope,
+    frame_records,
+    integer,
+    json_response,
+    number,
+    optional_number,
+    optional_text,
+    response_cache,
+    tag_version,
+)
+from web.api.services import projection_service  # noqa: E402
+from web.api.services.gold_cache import gold_cache  # noqa: E402
+
+
+class _Row(BaseModel):
+    player_id: str
+    name: str = "unknown"
+    points: float
+    bonus: Optional[float] = None
+    rank: int
+    tier: Optional[int] = None
+    note: Optional[str] = None
+    active: bool = False
+
+
+def _frame() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "player_id": ["a", "b", "c"],
+            "points": [12.5, np.nan, 3.0],
+            "bonus": [1.25, np.nan, None],
+            "rank": [1.0, 2.0, np.nan],
+            "tier": [1, np.nan, 3],
+            "note": ["ok", "nan", None],
+            "active": [True, False, True],
+        }
+    )
+
+
+@pytest.fixture(autouse=True)
+def _clean_caches():
+    response_cache.clear()
+    gold_cache.clear()
+    yield
+    response_cache.clear()
+    gold_cache.clear()
+
+
+class TestFrameRecords:
+    def test_inferred_converters(self):
+        records = frame_records(_frame(), _Row)
+        assert list(records[0]) == list(_Row.model_fields)
+        assert records[1] == {
+            "player_id": "b",
+            "name": "unknown",
+            "points": 0.0,
+            "bonus": None,
+            "rank": 2,
+            "tier": None,
+            "note": None,
+            "active": False,
+        }
+        assert records[2]["rank"] == 0 and records[2]["tier"] == 3
+
+    def test_records_validate_against_model(self):
+        for record in frame_records(_frame(), _Row):
+            assert _Row(**record).model_dump() == record
+
+    def test_overrides(self):
+        df = _frame().rename(columns={"player_id": "gsis_id"})
+        records = frame_records(
+            df,
+            _Row,
+            columns={"player_id": ("pfr_id", "gsis_id")},
+            values={"name": "fixed"},
+            converters={
+                "points": number(-1.0),
+                "bonus": optional_number(1),
+                "rank": integer(999),
+            },
+        )
+        assert [r["player_id"] for r in records] == ["a", "b", "c"]
+        assert {r["name"] for r in records} == {"fixed"}
+        assert [r["points"] for r in records] == [12.5, -1.0, 3.0]
+        assert records[0]["bonus"] == 1.2
+        assert records[2]["rank"] == 999
+
+    def test_duplicate_columns_use_the_first(self):
+        df = pd.DataFrame(
+            [["a", 1.0, 2.0, 5]], columns=["player_id"] + ["points"] * 2 + ["rank"]
+        )
+        assert frame_records(df, _Row)[0]["points"] == 1.0
+
+    def test_empty_frame(self):
+        assert frame_records(_frame().iloc[:0], _Row) == []
+
+    def test_unsupported_annotation_needs_a_converter(self):
+        class Nested(BaseModel):
+            tags: List[str]
+
+        with pytest.raises(TypeError, match="tags"):
+            frame_records(_frame(), Nested)
+        assert frame_records(_frame(), Nested, values={"tags": []})[0] == {"tags": []}
+
+    def test_optional_text_nulls(self):
+        s = pd.Series(["Out", "", "None", np.nan])
+        assert optional_text()(s, 4) == ["Out", None, None, None]
+
+    def test_prediction_rows_match_model(self):
+        df = pd.DataFrame(
+            {
+                "game_id": ["2024_10_KC_BUF"],
+                "season": [2024],
+                "week": [10],
+                "home_team": ["BUF"],
+                "away_team": ["KC"],
+                "predicted_spread": [-2.5],
+                "predicted_total": [47.0],
+                "vegas_spread": [np.nan],
+                "confidence_tier": ["high"],
+                "ats_pick": ["home"],
+                "ou_pick": ["under"],
+            }
+        )
+        record = frame_records(df, GamePrediction)[0]
+        assert record["vegas_spread"] is None and record["vegas_total"] is None
+        assert GamePrediction(**record).model_dump() == record
+
+
+class TestEnvelope:
+    def test_defaults_and_nested_models(self):
+        body = envelope(
+            ProjectionResponse,
+            season=2025,
+            week=3,
+            scoring_format="ppr",
+            projections=[],
+            generated_at="now",
+        )
+        assert list(body) == list(ProjectionResponse.model_fields)
+        assert ProjectionResponse(**body).model_dump() == body
+
+    def test_unknown_and_missing_fields(self):
+        with pytest.raises(TypeError, match="no fields"):
+            envelope(_Row, player_id="a", points=1.0, rank=1, colour="red")
+        with pytest.raises(TypeError, match="rank is required"):
+            envelope(_Row, player_id="a", points=1.0)
+
+    def test_dumps_numpy_scalars(self):
+        assert json.loads(dumps({"x": np.int64(3), "y": np.float64(1.5)})) == {
+            "x": 3,
+            "y": 1.5,
+        }
+
+
+def _app(calls: list, version_box: list, count: bool = True) -> TestClient:
+    test_app = FastAPI()
+
+    @test_app.get("/thing")
+    def thing(request: Request):
+        def build():
+            calls.append(1)
+            return {"n": len(calls) if count else 0, "version": version_box[0]}
+
+        return json_response(request, build, version=version_box[0])
+
+    return TestClient(test_app)
+
+
+class TestJsonResponse:
+    def test_cached_bytes_and_304(self):
+        calls: list = []
+        client = _app(calls, [("v", 1)])
+        first = client.get("/thing?a=1")
+        etag = first.headers["etag"]
+        assert first.headers["cache-control"] == "no-cache"
+
+        again = client.get("/thing?a=1")
+        assert again.content == first.content and len(calls) == 1
+
+        not_modified = client.get("/thing?a=1", headers={"If-None-Match": etag})
+        assert not_modified.status_code == 304 and not_modified.content == b""
+        assert (
+            client.get("/thing?a=1", headers={"If-None-Match": f"W/{etag}"}).status_code
+            == 304
+        )
+
+        stats = response_cache.stats()
+        assert (stats["misses"], stats["hits"], stats["not_modified"]) == (1, 3, 2)
+
+    def test_query_and_version_key_the_cache(self):
+        calls: list = []
+        version = [("v", 1)]
+        client = _app(calls, version)
+        etag = client.get("/thing?a=1").headers["etag"]
+        client.get("/thing?a=2")
+        assert len(calls) == 2
+
+        version[0] = ("v", 2)
+        fresh = client.get("/thing?a=1", headers={"If-None-Match": etag})
+        assert fresh.status_code == 200 and fresh.headers["etag"] != etag
+        assert fresh.json() == {"n": 3, "version": ["v", 2]}
+
+    def test_unversioned_payloads_are_not_cached(self):
+        calls: list = []
+        client = _app(calls, [None], count=False)
+        etag = client.get("/thing").headers["etag"]
+        assert client.get("/thing", headers={"If-None-Match": etag}).status_code == 304
+        assert len(calls) == 2 and response_cache.stats()["entries"] == 0
+
+    def test_lru_respects_byte_budget(self):
+        from web.api.serialization import _Body
+
+        cache = ResponseCache(max_bytes=10)
+        cache.put("a", _Body(b"123456"))
+        cache.put("b", _Body(b"7890"))
+        cache.put("c", _Body(b"xy"))
+        assert cache.get("a") is None and cache.get("c") is not None
+        assert cache.stats()["evictions"] == 1
+        cache.put("big", _Body(b"x" * 11))
+        assert cache.get("big") is None
+
+
+class TestEndpoints:
+    def _week(self, tmp_path, monkeypatch, names):
+        week_dir = tmp_path / "season=2020" / "week=3"
+        week_dir.mkdir(parents=True)
+        path = week_dir / "projections_half_ppr_20200920_000000.parquet"
+        pd.DataFrame(
+            {
+                "player_id": [f"p{i}" for i in range(len(names))],
+                "player_name": names,
+                "position": "WR",
+                "recent_team": "KC",
+                "projected_points": 10.0,
+            }
+        ).to_parquet(path, index=False)
+        monkeypatch.setattr(projection_service, "GOLD_PROJECTIONS_DIR", tmp_path)
+        return path
+
+    def test_search_polls_get_304_until_the_artifact_changes(
+        self, tmp_path, monkeypatch
+    ):
+        path = self._week(tmp_path, monkeypatch, ["Joe Alpha", "Jon Beta"])
+        client = TestClient(app)
+        url = "/api/players/search?q=jo&season=2020&week=3"
+        first = client.get(url)
+        assert [p["player_name"] for p in first.json()] == ["Joe Alpha", "Jon Beta"]
+        etag = first.headers["etag"]
+        assert client.get(url, headers={"If-None-Match": etag}).status_code == 304
+
+        pd.DataFrame(
+            {
+                "player_id": ["p9"],
+                "player_name": ["Joey Gamma"],
+                "position": "WR",
+                "recent_team": "KC",
+                "projected_points": 10.0,
+            }
+        ).to_parquet(path, index=False)
+        st = os.stat(path)
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        changed = client.get(url, headers={"If-None-Match": etag})
+        assert changed.status_code == 200
+        assert [p["player_name"] for p in changed.json()] == ["Joey Gamma"]
+
+    def test_projection_payload_matches_schema(self, tmp_path, monkeypatch):
+        self._week(tmp_path, monkeypatch, ["Joe Alpha", "Jon Beta"])
+        resp = TestClient(app).get(
+            "/api/projections?season=2020&week=3&scoring=half_ppr"
+        )
+        assert resp.status_code == 200
+        body = resp.json()
+        assert ProjectionResponse(**body).model_dump(mode="json") == body
+        for row in body["projections"]:
+            assert PlayerProjection(**row).model_dump() == row
+
+    def test_service_frames_carry_a_version(self, tmp_path, monkeypatch):
+        self._week(tmp_path, monkeypatch, ["Joe Alpha"])
+        df = projection_service._get_projections_parquet(2020, 3, "half_ppr")
+        assert df.attrs["artifact_version"] is not None
+        assert tag_version(df.copy(), "x").attrs["artifact_version"] == "x"
+
+    def test_cache_stats_include_response_counters(self):
+        body = TestClient(app).get("/api/ops/cache-stats").json()
+        for key in ("response_hits", "response_misses", "response_not_modified"):
+            assert key in body
@@ -52,3 +52,21 @@ VALID_POSITIONS = {"QB", "RB", "WR", "TE", "K"}
 # 14 days covers a typical bye week + one extra day of buffer.  Adjust here if
 # the production publish cadence changes.
 WEEKLY_STALENESS_THRESHOLD_DAYS: int = 14
+
+# ---------------------------------------------------------------------------
+# Gold artifact read cache
+# ---------------------------------------------------------------------------
+# Byte budget for the in-process Parquet frame cache shared by the Gold read
+# services (services/gold_cache.py). Least-recently-used frames are evicted
+# once the deep memory footprint of cached frames exceeds this. 0 disables
+# caching (every read goes to disk).
+GOLD_CACHE_MAX_BYTES: int = int(
+    os.getenv("GOLD_CACHE_MAX_BYTES", str(256 * 1024 * 1024))
+)
+
+# Byte budget for serialized JSON response bodies (serialization.py), cached
+# per (endpoint, query, artifact version) so repeat polls skip the read and
+# the serialization. 0 disables the byte cache (ETags / 304s still work).
+RESPONSE_CACHE_MAX_BYTES: int = int(
+    os.getenv("RESPONSE_CACHE_MAX_BYTES", str(64 * 1024 * 1024))
+)
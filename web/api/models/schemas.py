@@ -1081,6 +1081,15 @@ class PositionWait(BaseModel):
     wait_cost: float = Field(
         ..., description="best_now_vorp - expected_best_next_vorp, rounded 1dp"
     )
+    expected_best_vorp_by_pick: Dict[int, float] = Field(
+        default_factory=dict,
+        description=(
+            "Expected best-available VORP at each of the user's remaining "
+            "picks (overall pick number -> VORP, rounded 1dp) -- the cost-of-"
+            "waiting curve for the rest of the draft. The first entry is the "
+            "user's next pick (expected_best_next_vorp)."
+        ),
+    )
 
 
 class DraftRecommendationsResponse(BaseModel):
@@ -1272,6 +1281,78 @@ class MockDraftPickResponse(BaseModel):
     total_vorp: Optional[float] = None
 
 
+class MockDraftBatchRequest(MockDraftStartRequest):
+    """Request to simulate many seeded mock drafts from one slot.
+
+    Board fields (scoring/roster_format/platform/adp_source/season) resolve
+    exactly as for ``/draft/mock/start``; ``strategy`` is ignored.
+    """
+
+    n_drafts: int = Field(1000, ge=1, le=10000)
+    seed: int = Field(0, ge=0, description="Master seed; same seed, same drafts")
+    rounds: Optional[int] = Field(
+        None, ge=1, le=30, description="Rounds per draft (default: roster size)"
+    )
+    top_n: int = Field(
+        100, ge=1, le=1000, description="Players returned, by mean draft slot"
+    )
+
+
+class MockDraftBatchPlayer(BaseModel):
+    """One player's draft-slot distribution across the simulated drafts."""
+
+    player_id: str
+    player_name: str
+    position: str
+    adp_rank: Optional[float] = None
+    vorp: Optional[float] = None
+    p_drafted: float
+    p_user: float = Field(..., description="Share of drafts you drafted him")
+    mean_slot: Optional[float] = None
+    p10_slot: Optional[float] = None
+    median_slot: Optional[float] = None
+    p90_slot: Optional[float] = None
+
+
+class MockDraftBatchRosterVorp(BaseModel):
+    """Distribution of your roster's total VORP across the drafts."""
+
+    mean: float
+    std: float
+    p10: float
+    median: float
+    p90: float
+    expected_vorp: float
+    grades: Dict[str, float] = Field(
+        default_factory=dict, description="Letter grade -> share of drafts"
+    )
+
+
+class MockDraftBatchRound(BaseModel):
+    """Positional picks and runs for one (round, position)."""
+
+    round: int
+    position: str
+    mean_picks: float
+    mean_longest_run: float
+    run_rate: float = Field(
+        ..., description="Share of drafts with 3+ consecutive picks at position"
+    )
+
+
+class MockDraftBatchResponse(BaseModel):
+    """Response for POST /api/draft/mock/batch."""
+
+    n_drafts: int
+    n_teams: int
+    user_pick: int
+    seed: int
+    user_picks: List[int]
+    players: List[MockDraftBatchPlayer]
+    roster_vorp: MockDraftBatchRosterVorp
+    rounds: List[MockDraftBatchRound]
+
+
 class AdpPlayer(BaseModel):
     """A player's ADP entry."""
 
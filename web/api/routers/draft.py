@@ -7,6 +7,7 @@ in-memory session storage keyed by UUID.
 """
 
 import logging
+import os
 import uuid
 from datetime import datetime, timezone
 from pathlib import Path
@@ -14,7 +15,7 @@ from typing import Any, Dict, List, Optional
 
 import numpy as np
 import pandas as pd
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Query, Request, Response
 
 from ..models.schemas import (
     AdpPlayer,
@@ -33,6 +34,11 @@ from ..models.schemas import (
     LiveDraftKeyMoment,
     LiveDraftRecommendation,
     LiveDraftResponse,
+    MockDraftBatchPlayer,
+    MockDraftBatchRequest,
+    MockDraftBatchResponse,
+    MockDraftBatchRosterVorp,
+    MockDraftBatchRound,
     MockDraftPickRequest,
     MockDraftPickResponse,
     MockDraftReportAlternative,
@@ -48,6 +54,15 @@ from ..models.schemas import (
     PositionWait,
     RosterRisk,
 )
+from ..serialization import (
+    envelope,
+    frame_records,
+    integer,
+    json_response,
+    optional_number,
+    optional_text,
+    text,
+)
 
 # src/ is importable via the web.api package bootstrap (web/api/__init__.py).
 # _PROJECT_ROOT is still used below for data-file paths (ADP csv).
@@ -61,10 +76,11 @@ from draft_optimizer import (  # noqa: E402
     compute_value_scores,
 )
 from draft_availability import (  # noqa: E402
-    expected_best_vorp_at_pick,
+    expected_best_vorp_at_picks,
     prob_gone_before_vectorized,
 )
 from draft_tiers import compute_tiers  # noqa: E402
+from mock_draft_batch import MockDraftBatch  # noqa: E402
 from nfl_data_integration import NFLDataFetcher  # noqa: E402
 from projection_engine import _FLOOR_CEILING_MULT  # noqa: E402
 from projection_engine import generate_preseason_projections  # noqa: E402
@@ -377,7 +393,7 @@ def _rebuild_mock_state_from_history(session: Dict) -> None:
     simulator: MockDraftSimulator = session["simulator"]
     history: List[Dict] = session.get("pick_history", [])
 
-    board.available = board.all_players.copy()
+    board.reset_available()
     board.my_roster = []
     board.drafted_by_others = []
     simulator._opp_rosters = {}
@@ -482,62 +498,51 @@ def _load_draft_data(
     return enriched
 
 
-def _df_row_to_draft_player(row: pd.Series) -> DraftPlayer:
-    """Convert a single DataFrame row to a ``DraftPlayer`` schema."""
+def _board_columns(df: pd.DataFrame) -> Dict[str, Any]:
+    """Source columns shared by the ``DraftPlayer`` / ``DraftBoardEntry`` views."""
     pts_col = (
         "projected_season_points"
-        if "projected_season_points" in row.index
+        if "projected_season_points" in df.columns
         else "projected_points"
     )
-    return DraftPlayer(
-        player_id=str(row.get("player_id", "")),
-        player_name=str(row.get("player_name", "")),
-        position=str(row.get("position", "")),
-        team=str(row.get("recent_team", row.get("team", ""))) or None,
-        projected_points=_safe_round(row.get(pts_col)),
-        model_rank=_safe_int(row.get("model_rank"), 999),
-        adp_rank=_safe_float(row.get("adp_rank")),
-        adp_diff=_safe_float(row.get("adp_diff")),
-        adp_stdev=_safe_float(row.get("adp_stdev")),
-        value_tier=str(row.get("value_tier", "fair_value")),
-        vorp=_safe_round(row.get("vorp")),
-        tier=_safe_tier(row.get("tier")),
-        floor=_safe_round(row.get("projected_floor")),
-        ceiling=_safe_round(row.get("projected_ceiling")),
+    return {
+        "team": ("recent_team", "team"),
+        "projected_points": pts_col,
+        "floor": "projected_floor",
+        "ceiling": "projected_ceiling",
+    }
+
+
+_BOARD_CONVERTERS = {
+    "team": optional_text(),
+    "projected_points": optional_number(1),
+    "model_rank": integer(999),
+    "vorp": optional_number(1),
+    "floor": optional_number(1),
+    "ceiling": optional_number(1),
+}
+
+
+def _df_to_draft_players(df: pd.DataFrame) -> List[Dict[str, Any]]:
+    """Convert board rows to ``DraftPlayer``-shaped dicts."""
+    return frame_records(
+        df, DraftPlayer, columns=_board_columns(df), converters=_BOARD_CONVERTERS
     )
 
 
-def _df_row_to_board_entry(row: pd.Series) -> DraftBoardEntry:
-    """Convert a DataFrame row to an advisor-facing ``DraftBoardEntry``.
+def _df_to_board_entries(df: pd.DataFrame) -> List[Dict[str, Any]]:
+    """Convert board rows to advisor-facing ``DraftBoardEntry``-shaped dicts.
 
     The advisor schema (``getDraftBoard`` in ``chat/route.ts``) expects the
     friendlier ``adp`` / ``bye_week`` field names instead of ``adp_rank``.
     ``bye_week`` is passed through when the projection DataFrame carries it
     (it comes from ``generate_preseason_projections``); otherwise ``None``.
     """
-    pts_col = (
-        "projected_season_points"
-        if "projected_season_points" in row.index
-        else "projected_points"
-    )
-    bye_week_raw = row.get("bye_week") if "bye_week" in row.index else None
-    bye_week = _safe_int(bye_week_raw, default=0) if bye_week_raw is not None else None
-    if bye_week == 0 and bye_week_raw in (None, ""):
-        bye_week = None
-    return DraftBoardEntry(
-        player_id=str(row.get("player_id", "")),
-        player_name=str(row.get("player_name", "")),
-        position=str(row.get("position", "")),
-        team=str(row.get("recent_team", row.get("team", ""))) or None,
-        projected_points=_safe_round(row.get(pts_col)),
-        adp=_safe_float(row.get("adp_rank")),
-        adp_stdev=_safe_float(row.get("adp_stdev")),
-        vorp=_safe_round(row.get("vorp")),
-        value_tier=str(row.get("value_tier", "fair_value")),
-        bye_week=bye_week,
-        tier=_safe_tier(row.get("tier")),
-        floor=_safe_round(row.get("projected_floor")),
-        ceiling=_safe_round(row.get("projected_ceiling")),
+    return frame_records(
+        df,
+        DraftBoardEntry,
+        columns={**_board_columns(df), "adp": "adp_rank"},
+        converters=_BOARD_CONVERTERS,
     )
 
 
@@ -601,8 +606,32 @@ def _user_next_pick_number(
     return None
 
 
-def _board_to_response(session_id: str, session: Dict) -> DraftBoardResponse:
-    """Build a ``DraftBoardResponse`` from a session dict.
+def _user_remaining_pick_numbers(
+    session: Dict, board: DraftBoard, user_pick: Optional[int], next_pick_no: int
+) -> List[int]:
+    """The user's overall pick numbers from ``next_pick_no`` to draft end.
+
+    Same slot resolution and snake/linear math as
+    :func:`_user_next_pick_number`; the draft runs one round per roster slot
+    (``board.roster_config``). Always starts with ``next_pick_no`` itself.
+    """
+    slot = session.get("user_pick") or user_pick
+    simulator: Optional[MockDraftSimulator] = session.get("simulator")
+    draft_type = getattr(simulator, "draft_type", "snake") if simulator else "snake"
+    n_teams = board.n_teams
+    total_rounds = sum(board.roster_config.values())
+    picks = [next_pick_no]
+    for round_number in range((next_pick_no - 1) // n_teams + 2, total_rounds + 1):
+        if draft_type == "linear" or round_number % 2 == 1:
+            slot_on_clock = slot
+        else:
+            slot_on_clock = n_teams - slot + 1
+        picks.append((round_number - 1) * n_teams + slot_on_clock)
+    return picks
+
+
+def _board_to_response(session_id: str, session: Dict) -> Dict[str, Any]:
+    """Build a ``DraftBoardResponse``-shaped dict from a session dict.
 
     Populates two parallel views of the available player set:
 
@@ -615,18 +644,13 @@ def _board_to_response(session_id: str, session: Dict) -> DraftBoardResponse:
     strategy = session.get("strategy", "balanced")
 
     ordered_available = _reorder_by_strategy(board.available, strategy)
-    available_players: List[DraftPlayer] = []
-    board_entries: List[DraftBoardEntry] = []
-    for _, row in ordered_available.iterrows():
-        available_players.append(_df_row_to_draft_player(row))
-        board_entries.append(_df_row_to_board_entry(row))
-
     my_roster: List[DraftPlayer] = [_dict_to_draft_player(p) for p in board.my_roster]
 
-    return DraftBoardResponse(
+    return envelope(
+        DraftBoardResponse,
         session_id=session_id,
-        players=available_players,
-        board=board_entries,
+        players=_df_to_draft_players(ordered_available),
+        board=_df_to_board_entries(ordered_available),
         my_roster=my_roster,
         picks_taken=board.picks_taken(),
         my_pick_count=board.my_pick_count(),
@@ -647,6 +671,7 @@ def _board_to_response(session_id: str, session: Dict) -> DraftBoardResponse:
 
 @router.get("/board", response_model=DraftBoardResponse)
 def get_draft_board(
+    request: Request,
     scoring: Optional[str] = Query(
         None,
         description="Scoring format; defaults from platform preset, else half_ppr",
@@ -685,7 +710,7 @@ def get_draft_board(
         ),
         pattern="^(floor|balanced|ceiling)$",
     ),
-) -> DraftBoardResponse:
+) -> Response:
     """Return the current draft board.
 
     If ``session_id`` is provided and valid, the existing session is returned.
@@ -695,7 +720,9 @@ def get_draft_board(
     ``src/config.py``); an explicit value always wins over the preset.
     """
     if session_id and session_id in _sessions:
-        return _board_to_response(session_id, _sessions[session_id])
+        return json_response(
+            request, lambda: _board_to_response(session_id, _sessions[session_id])
+        )
 
     preset = PLATFORM_PRESETS.get(platform) if platform else None
     resolved_scoring = scoring or (preset or {}).get("scoring_format") or "half_ppr"
@@ -732,7 +759,9 @@ def get_draft_board(
         "created_at": datetime.now(timezone.utc).isoformat(),
     }
 
-    return _board_to_response(new_id, _sessions[new_id])
+    return json_response(
+        request, lambda: _board_to_response(new_id, _sessions[new_id])
+    )
 
 
 @router.post("/pick", response_model=DraftPickResponse)
@@ -824,12 +853,18 @@ def get_recommendations(
     wait_cost_by_position: Dict[str, float] = {}
     has_vorp = "vorp" in board.available.columns
     if next_pick_no is not None and not board.available.empty and has_vorp:
-        expected_next = expected_best_vorp_at_pick(board.available, next_pick_no)
+        # One batched pass gives the whole curve over the user's remaining
+        # picks; its first row is the next-pick expectation.
+        user_picks = _user_remaining_pick_numbers(
+            session, board, user_pick, next_pick_no
+        )
+        expected_curve = expected_best_vorp_at_picks(board.available, user_picks)
         for pos, group in board.available.groupby("position"):
             vorp_vals = pd.to_numeric(group["vorp"], errors="coerce").dropna()
-            expected_next_vorp = expected_next.get(pos)
-            if vorp_vals.empty or expected_next_vorp is None:
+            if vorp_vals.empty or str(pos) not in expected_curve.columns:
                 continue
+            curve = expected_curve[str(pos)]
+            expected_next_vorp = float(curve.iloc[0])
             best_now = float(vorp_vals.max())
             wait_cost = round(best_now - expected_next_vorp, 1)
             position_wait.append(
@@ -838,6 +873,9 @@ def get_recommendations(
                     best_now_vorp=round(best_now, 1),
                     expected_best_next_vorp=round(expected_next_vorp, 1),
                     wait_cost=wait_cost,
+                    expected_best_vorp_by_pick={
+                        int(pick_no): round(float(v), 1) for pick_no, v in curve.items()
+                    },
                 )
             )
             wait_cost_by_position[str(pos)] = wait_cost
@@ -1052,6 +1090,80 @@ def advance_mock_pick(req: MockDraftPickRequest) -> MockDraftPickResponse:
     )
 
 
+@router.post("/mock/batch", response_model=MockDraftBatchResponse)
+def simulate_mock_drafts(req: MockDraftBatchRequest) -> MockDraftBatchResponse:
+    """Simulate ``n_drafts`` seeded mock drafts from the user's slot.
+
+    Stateless (no session is created). Each draft follows the same opponent
+    model and advisor picks as ``/draft/mock/start`` + ``/draft/mock/pick``;
+    the response summarizes where players go, the user's roster VORP and
+    per-round positional runs across all of them.
+    """
+    if req.user_pick < 1 or req.user_pick > req.n_teams:
+        raise HTTPException(
+            status_code=400,
+            detail=f"user_pick must be between 1 and {req.n_teams}",
+        )
+
+    preset = PLATFORM_PRESETS.get(req.platform) if req.platform else None
+    scoring = req.scoring or (preset or {}).get("scoring_format") or "half_ppr"
+    roster_format = req.roster_format or (preset or {}).get("roster") or "standard"
+    adp_source = req.adp_source or (preset or {}).get("adp_source")
+
+    try:
+        players_df = _load_draft_data(scoring, req.season, adp_source)
+    except Exception as exc:
+        logger.exception("Failed to generate mock draft data")
+        raise HTTPException(
+            status_code=500, detail=f"Draft data generation failed: {exc}"
+        ) from exc
+
+    board = DraftBoard(players_df, roster_format=roster_format, n_teams=req.n_teams)
+    batch = MockDraftBatch(board, user_pick=req.user_pick, n_teams=req.n_teams)
+    result = batch.run(n_drafts=req.n_drafts, seed=req.seed, rounds=req.rounds)
+
+    dist = result.slot_distribution().head(req.top_n)
+    players = [
+        MockDraftBatchPlayer(
+            player_id=str(row.get("player_id", "")),
+            player_name=str(row.get("player_name", "")),
+            position=str(row.get("position", "")),
+            adp_rank=_safe_float(row.get("adp_rank")),
+            vorp=_safe_float(row.get("vorp")),
+            p_drafted=round(float(row["p_drafted"]), 4),
+            p_user=round(float(row["p_user"]), 4),
+            mean_slot=_safe_round(row["mean_slot"]),
+            p10_slot=_safe_round(row["p10_slot"]),
+            median_slot=_safe_round(row["median_slot"]),
+            p90_slot=_safe_round(row["p90_slot"]),
+        )
+        for row in dist.to_dict("records")
+    ]
+    summary = result.roster_vorp_summary()
+    rounds = [
+        MockDraftBatchRound(
+            round=int(row["round"]),
+            position=str(row["position"]),
+            mean_picks=round(float(row["mean_picks"]), 3),
+            mean_longest_run=round(float(row["mean_longest_run"]), 3),
+            run_rate=round(float(row["run_rate"]), 4),
+        )
+        for row in result.positional_runs().to_dict("records")
+    ]
+    return MockDraftBatchResponse(
+        n_drafts=result.n_drafts,
+        n_teams=req.n_teams,
+        user_pick=req.user_pick,
+        seed=req.seed,
+        user_picks=result.user_picks,
+        players=players,
+        roster_vorp=MockDraftBatchRosterVorp(
+            **{k: v for k, v in summary.items() if k != "n_drafts"}
+        ),
+        rounds=rounds,
+    )
+
+
 # ---------------------------------------------------------------------------
 # Post-draft report with receipts (new)
 # ---------------------------------------------------------------------------
@@ -1248,8 +1360,33 @@ def undo_mock_pick(req: MockDraftUndoRequest) -> MockDraftUndoResponse:
     )
 
 
+def _df_to_adp_players(df: pd.DataFrame) -> List[Dict[str, Any]]:
+    """Convert an ADP CSV to ``AdpPlayer``-shaped dicts.
+
+    Column names vary by source, so each field reads the first column whose
+    lower-cased name matches; a missing position reads ``"UNK"`` and a
+    missing rank ``0.0``.
+    """
+    aliases = {
+        "player_name": ("player_name", "name", "player"),
+        "position": ("position", "pos"),
+        "team": ("team", "recent_team"),
+        "adp_rank": ("adp_rank", "adp", "rank"),
+        "stdev": ("stdev",),
+    }
+    columns: Dict[str, Any] = {"player_name": df.columns[0]}
+    for field, names in aliases.items():
+        match = next((c for c in df.columns if c.lower() in names), None)
+        if match is not None:
+            columns[field] = match
+    return frame_records(
+        df, AdpPlayer, columns=columns, converters={"position": text("UNK")}
+    )
+
+
 @router.get("/adp", response_model=AdpResponse)
 def get_adp(
+    request: Request,
     source: Optional[str] = Query(
         None,
         pattern="^(ffc|espn|sleeper)$",
@@ -1265,7 +1402,7 @@ def get_adp(
         pattern="^(ppr|half_ppr|standard)$",
         description="Scoring format; only used to locate the per-source file",
     ),
-) -> AdpResponse:
+) -> Response:
     """Return ADP data, optionally from a specific real-ADP source.
 
     Returns 404 if no ADP file could be found (neither the per-source file
@@ -1281,65 +1418,26 @@ def get_adp(
     if not adp_path.exists():
         raise HTTPException(status_code=404, detail="ADP data file not found")
 
-    try:
-        df = pd.read_csv(str(adp_path))
-    except Exception as exc:
-        raise HTTPException(
-            status_code=500, detail=f"Failed to read ADP file: {exc}"
-        ) from exc
-
-    # Normalise column names
-    name_col = next(
-        (c for c in df.columns if c.lower() in ("player_name", "name", "player")),
-        df.columns[0],
-    )
-    pos_col = next(
-        (c for c in df.columns if c.lower() in ("position", "pos")),
-        None,
-    )
-    team_col = next(
-        (c for c in df.columns if c.lower() in ("team", "recent_team")),
-        None,
-    )
-    rank_col = next(
-        (c for c in df.columns if c.lower() in ("adp_rank", "adp", "rank")),
-        None,
-    )
-    stdev_col = next((c for c in df.columns if c.lower() == "stdev"), None)
-
-    players: List[AdpPlayer] = []
-    for _, row in df.iterrows():
-        players.append(
-            AdpPlayer(
-                player_name=str(row[name_col]),
-                position=str(row[pos_col]) if pos_col else "UNK",
-                team=(
-                    str(row[team_col]) if team_col and pd.notna(row[team_col]) else None
-                ),
-                adp_rank=(
-                    float(row[rank_col])
-                    if rank_col and pd.notna(row[rank_col])
-                    else 0.0
-                ),
-                stdev=(
-                    float(row[stdev_col])
-                    if stdev_col and pd.notna(row[stdev_col])
-                    else None
-                ),
-            )
-        )
-
-    # Try to get file modification time for updated_at
-    import os
-
+    # The CSV's path + mtime version the cached response bytes.
     stat = os.stat(str(adp_path))
+    version = (str(adp_path), stat.st_mtime_ns, stat.st_size)
     updated_at = datetime.fromtimestamp(stat.st_mtime, tz=timezone.utc).isoformat()
 
-    return AdpResponse(
-        players=players,
-        source=adp_path.name,
-        updated_at=updated_at,
-    )
+    def build() -> Dict[str, Any]:
+        try:
+            df = pd.read_csv(str(adp_path))
+        except Exception as exc:
+            raise HTTPException(
+                status_code=500, detail=f"Failed to read ADP file: {exc}"
+            ) from exc
+        return envelope(
+            AdpResponse,
+            players=_df_to_adp_players(df),
+            source=adp_path.name,
+            updated_at=updated_at,
+        )
+
+    return json_response(request, build, version=version)
 
 
 @router.get("/platforms", response_model=PlatformPresetsResponse)
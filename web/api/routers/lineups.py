@@ -5,7 +5,7 @@
 from datetime import datetime, timezone
 from typing import List, Optional
 
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Query, Request, Response
 
 from ..models.schemas import (
     FlatLineupPlayer,
@@ -14,6 +14,13 @@ from ..models.schemas import (
     StackInsight,
     TeamLineup,
 )
+from ..serialization import (
+    envelope,
+    frame_records,
+    integer,
+    json_response,
+    number,
+)
 from ..services import projection_service
 
 # src/ is importable via the web.api package bootstrap (web/api/__init__.py)
@@ -21,44 +28,18 @@ from ..services import projection_service
 router = APIRouter(prefix="/lineups", tags=["lineups"])
 
 
-def _safe_float(val) -> Optional[float]:
-    """Convert to float, returning None for NaN / missing."""
-    if val is None:
-        return None
-    try:
-        f = float(val)
-        if f != f:  # NaN check
-            return None
-        return f
-    except (ValueError, TypeError):
-        return None
-
-
-def _df_to_lineup_players(df) -> List[LineupPlayer]:
-    """Convert a starters DataFrame subset to a list of LineupPlayer models."""
-    players = []
-    for _, row in df.iterrows():
-        players.append(
-            LineupPlayer(
-                player_id=str(row.get("player_id", "")),
-                player_name=str(row.get("player_name", "")),
-                position=str(row.get("position", "")),
-                position_group=str(row.get("position_group", "")),
-                field_position=str(row.get("field_position", "")),
-                projected_points=_safe_float(row.get("projected_points")),
-                projected_floor=_safe_float(row.get("projected_floor")),
-                projected_ceiling=_safe_float(row.get("projected_ceiling")),
-                snap_pct=_safe_float(row.get("snap_pct")),
-                depth_rank=int(row.get("depth_rank", 1)),
-                is_starter=bool(row.get("is_starter", False)),
-                starter_confidence=float(row.get("starter_confidence", 0.0)),
-            )
-        )
-    return players
+def _df_to_lineup_players(df) -> List[dict]:
+    """Convert a starters DataFrame subset to ``LineupPlayer``-shaped dicts."""
+    return frame_records(
+        df,
+        LineupPlayer,
+        converters={"depth_rank": integer(1), "starter_confidence": number(0.0)},
+    )
 
 
 @router.get("", response_model=LineupResponse)
 def get_lineups(
+    request: Request,
     season: Optional[int] = Query(
         None, ge=1999, le=2030, description="NFL season (defaults to latest)"
     ),
@@ -73,7 +54,7 @@ def get_lineups(
         description="Scoring format for projections",
         pattern="^(ppr|half_ppr|standard)$",
     ),
-) -> LineupResponse:
+) -> Response:
     """Get starting lineups for all teams or a specific team.
 
     When ``team`` is provided, projections are included if available. When
@@ -190,8 +171,8 @@ def get_lineups(
             "Correlation edges unavailable — lineups served without stacks"
         )
 
-    lineups: List[TeamLineup] = []
-    flat_lineup: List[FlatLineupPlayer] = []
+    lineups: List[dict] = []
+    flat_lineup: List[dict] = []
     for team_code in sorted(df["team"].unique()):
         team_df = df[df["team"] == team_code]
         offense_df = team_df[team_df["side"] == "offense"]
@@ -218,7 +199,8 @@ def get_lineups(
                 proj_total = round(float(off_pts.sum()), 1)
 
         lineups.append(
-            TeamLineup(
+            envelope(
+                TeamLineup,
                 team=team_code,
                 season=season,
                 week=week,
@@ -231,33 +213,21 @@ def get_lineups(
         )
 
         # Flat lineup entries for the advisor contract.
-        for _, row in team_df.iterrows():
-            flat_lineup.append(
-                FlatLineupPlayer(
-                    player_id=str(row.get("player_id", "")),
-                    player_name=str(row.get("player_name", "")),
-                    team=str(team_code),
-                    position=str(row.get("position", "")),
-                    projected_points=_safe_float(row.get("projected_points")),
-                    projected_floor=_safe_float(row.get("projected_floor")),
-                    projected_ceiling=_safe_float(row.get("projected_ceiling")),
-                    injury_status=(
-                        str(row.get("injury_status"))
-                        if row.get("injury_status") is not None
-                        and str(row.get("injury_status")) != "nan"
-                        else None
-                    ),
-                    is_starter=bool(row.get("is_starter", False)),
-                )
-            )
+        flat_lineup.extend(
+            frame_records(team_df, FlatLineupPlayer, values={"team": str(team_code)})
+        )
 
-    return LineupResponse(
-        season=season,
-        week=week,
-        lineups=lineups,
-        lineup=flat_lineup,
-        generated_at=datetime.now(timezone.utc).isoformat(),
-        data_as_of=data_as_of,
-        defaulted=defaulted,
-        degraded=degraded,
+    return json_response(
+        request,
+        lambda: envelope(
+            LineupResponse,
+            season=season,
+            week=week,
+            lineups=lineups,
+            lineup=flat_lineup,
+            generated_at=datetime.now(timezone.utc).isoformat(),
+            data_as_of=data_as_of,
+            defaulted=defaulted,
+            degraded=degraded,
+        ),
     )
@@ -7,6 +7,7 @@ of the data surface.
 
     GET /api/ops/pipeline-status   -> JSON document
     GET /api/ops/dashboard         -> self-contained HTML dashboard
+    GET /api/ops/cache-stats       -> Gold read-cache and response-cache counters
 """
 
 import json
@@ -18,6 +19,9 @@ from typing import Any, Dict
 from fastapi import APIRouter, HTTPException
 from fastapi.responses import HTMLResponse
 
+from ..serialization import response_cache
+from ..services.gold_cache import gold_cache
+
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/ops", tags=["ops"])
@@ -62,6 +66,18 @@ def pipeline_status() -> Dict[str, Any]:
     return _load_status()
 
 
+@router.get("/cache-stats")
+def cache_stats() -> Dict[str, Any]:
+    """Return hit/miss counters and occupancy of the Gold read cache.
+
+    Counters of the serialized-response cache follow with a ``response_``
+    prefix (``response_hits``, ``response_not_modified``, ...).
+    """
+    stats = gold_cache.stats()
+    stats.update({f"response_{k}": v for k, v in response_cache.stats().items()})
+    return stats
+
+
 _DASHBOARD_HTML = """<!doctype html>
 <html><head><meta charset="utf-8"><title>Pipeline Status</title>
 <meta name="viewport" content="width=device-width, initial-scale=1">
@@ -7,7 +7,7 @@ from datetime import datetime, timezone
 from typing import List, Optional
 
 import pandas as pd
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Query, Request, Response
 
 from ..config import VALID_SCORING_FORMATS
 from ..models.schemas import (
@@ -18,6 +18,7 @@ from ..models.schemas import (
     PlayerProjectionHistoryWeek,
     PlayerSearchResult,
 )
+from ..serialization import artifact_version, frame_records, json_response
 from ..services import projection_service
 
 router = APIRouter(prefix="/players", tags=["players"])
@@ -132,25 +133,22 @@ def get_player_projection_history(
 
 @router.get("/search", response_model=List[PlayerSearchResult])
 def search_players(
+    request: Request,
     q: str = Query(..., min_length=2, description="Player name search query"),
     season: int = Query(2024, ge=1999, le=2030),
     week: int = Query(17, ge=1, le=18),
-) -> List[PlayerSearchResult]:
+) -> Response:
     """Search for players by name (case-insensitive partial match)."""
     try:
         df = projection_service.search_players(query=q, season=season, week=week)
     except FileNotFoundError as exc:
         raise HTTPException(status_code=404, detail=str(exc))
 
-    return [
-        PlayerSearchResult(
-            player_id=str(row["player_id"]),
-            player_name=str(row["player_name"]),
-            team=str(row["team"]),
-            position=str(row["position"]),
-        )
-        for _, row in df.iterrows()
-    ]
+    return json_response(
+        request,
+        lambda: frame_records(df, PlayerSearchResult),
+        version=artifact_version(df),
+    )
 
 
 @router.get("/{player_id}", response_model=PlayerProjection)
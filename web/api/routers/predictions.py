@@ -5,9 +5,16 @@
 from datetime import datetime, timezone
 from typing import Optional
 
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Query, Request, Response
 
 from ..models.schemas import GamePrediction, PredictionResponse
+from ..serialization import (
+    artifact_version,
+    envelope,
+    frame_records,
+    json_response,
+    text,
+)
 from ..services import prediction_service
 
 router = APIRouter(prefix="/predictions", tags=["predictions"])
@@ -43,15 +50,23 @@ def _row_to_prediction(row) -> GamePrediction:
     )
 
 
+def _df_to_prediction_list(df) -> list:
+    """Convert a predictions DataFrame to ``GamePrediction``-shaped dicts."""
+    return frame_records(
+        df, GamePrediction, converters={"confidence_tier": text("low")}
+    )
+
+
 @router.get("", response_model=PredictionResponse)
 def list_predictions(
+    request: Request,
     season: Optional[int] = Query(
         None, ge=1999, le=2030, description="NFL season (defaults to latest-played)"
     ),
     week: Optional[int] = Query(
         None, ge=1, le=18, description="Week number (defaults to latest-played)"
     ),
-) -> PredictionResponse:
+) -> Response:
     """Return game predictions for the given season and week.
 
     When ``season`` and/or ``week`` are omitted the service resolves them to
@@ -106,15 +121,18 @@ def list_predictions(
             defaulted=defaulted,
         )
 
-    predictions = [_row_to_prediction(row) for _, row in df.iterrows()]
-    return PredictionResponse(
-        season=season,
-        week=week,
-        predictions=predictions,
-        generated_at=datetime.now(timezone.utc).isoformat(),
-        data_as_of=data_as_of,
-        defaulted=defaulted,
-    )
+    def build() -> dict:
+        return envelope(
+            PredictionResponse,
+            season=season,
+            week=week,
+            predictions=_df_to_prediction_list(df),
+            generated_at=datetime.now(timezone.utc).isoformat(),
+            data_as_of=data_as_of,
+            defaulted=defaulted,
+        )
+
+    return json_response(request, build, version=artifact_version(df))
 
 
 @router.get("/latest-week")
@@ -5,7 +5,7 @@
 from datetime import datetime, timezone
 from typing import Optional
 
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Query, Request, Response
 
 from ..config import VALID_POSITIONS, VALID_SCORING_FORMATS
 from ..models.schemas import (
@@ -16,89 +16,33 @@ from ..models.schemas import (
     ProjectionMeta,
     ProjectionResponse,
 )
+from ..serialization import artifact_version, envelope, frame_records, json_response
 from ..services import projection_service
 
 router = APIRouter(prefix="/projections", tags=["projections"])
 
 
 def _df_to_projection_list(df, scoring_format: str) -> list:
-    """Convert a projection DataFrame to a list of PlayerProjection dicts."""
-    records = []
-    for _, row in df.iterrows():
-        records.append(
-            PlayerProjection(
-                player_id=str(row.get("player_id", "")),
-                player_name=str(row.get("player_name", "")),
-                team=str(row.get("team", "")),
-                position=str(row.get("position", "")),
-                projected_points=float(row.get("projected_points", 0)),
-                projected_floor=float(row.get("projected_floor", 0)),
-                projected_ceiling=float(row.get("projected_ceiling", 0)),
-                proj_pass_yards=_safe_float(row.get("proj_pass_yards")),
-                proj_pass_tds=_safe_float(row.get("proj_pass_tds")),
-                proj_interceptions=_safe_float(row.get("proj_interceptions")),
-                proj_rush_yards=_safe_float(row.get("proj_rush_yards")),
-                proj_rush_tds=_safe_float(row.get("proj_rush_tds")),
-                proj_carries=_safe_float(row.get("proj_carries")),
-                proj_rec=_safe_float(row.get("proj_rec")),
-                proj_rec_yards=_safe_float(row.get("proj_rec_yards")),
-                proj_rec_tds=_safe_float(row.get("proj_rec_tds")),
-                proj_targets=_safe_float(row.get("proj_targets")),
-                proj_fg_makes=_safe_float(row.get("proj_fg_makes")),
-                proj_xp_makes=_safe_float(row.get("proj_xp_makes")),
-                scoring_format=scoring_format,
-                season=_safe_int(row.get("season", 0)) or 0,
-                week=_safe_int(row.get("week", 0)) or 0,
-                position_rank=_safe_int(row.get("position_rank")),
-                injury_status=_safe_str(row.get("injury_status")),
-            )
-        )
-    return records
-
-
-def _safe_float(val) -> Optional[float]:
-    """Convert to float, returning None for NaN / missing."""
-    if val is None:
-        return None
-    try:
-        f = float(val)
-        if f != f:  # NaN check
-            return None
-        return f
-    except (ValueError, TypeError):
-        return None
-
+    """Convert a projection DataFrame to ``PlayerProjection``-shaped dicts.
 
-def _safe_int(val) -> Optional[int]:
-    if val is None:
-        return None
-    try:
-        f = float(val)
-        if f != f:
-            return None
-        return int(f)
-    except (ValueError, TypeError):
-        return None
-
-
-def _safe_str(val) -> Optional[str]:
-    if val is None:
-        return None
-    s = str(val)
-    if s.lower() in ("nan", "none", ""):
-        return None
-    return s
+    Column-wise (see ``serialization.frame_records``): NaN stat projections
+    become null, missing required numbers become 0.
+    """
+    return frame_records(
+        df, PlayerProjection, values={"scoring_format": scoring_format}
+    )
 
 
 @router.get("", response_model=ProjectionResponse)
 def list_projections(
+    request: Request,
     season: int = Query(..., ge=1999, le=2030, description="NFL season"),
     week: int = Query(..., ge=1, le=18, description="Week number"),
     scoring: str = Query("half_ppr", description="ppr / half_ppr / standard"),
     position: Optional[str] = Query(None, description="QB / RB / WR / TE / K"),
     team: Optional[str] = Query(None, description="Team abbreviation"),
     limit: int = Query(1000, ge=1, le=1000, description="Max results"),
-) -> ProjectionResponse:
+) -> Response:
     """Return player projections for the given season, week, and scoring format.
 
     Default ``limit`` is the API ceiling (1000) so unfiltered callers — like
@@ -106,6 +50,10 @@ def list_projections(
     always receive the full slate. Truncating to a top-N by projected_points
     silently drops mid-tier RB2/WR3/TE on lower-projected teams (NYJ/CHI/MIN)
     and renders their offensive cards blank.
+
+    The body is serialized straight from the DataFrame and cached per
+    (source parquet version, query); repeat polls with the returned ETag in
+    ``If-None-Match`` get a 304.
     """
     if scoring not in VALID_SCORING_FORMATS:
         raise HTTPException(
@@ -130,22 +78,26 @@ def list_projections(
     except FileNotFoundError as exc:
         raise HTTPException(status_code=404, detail=str(exc))
 
-    projections = _df_to_projection_list(df, scoring)
-    meta_info = projection_service.get_projection_meta(season=season, week=week)
-    return ProjectionResponse(
-        season=season,
-        week=week,
-        scoring_format=scoring,
-        projections=projections,
-        generated_at=datetime.now(timezone.utc).isoformat(),
-        meta=ProjectionMeta(
-            season=meta_info.season,
-            week=meta_info.week,
-            data_as_of=meta_info.data_as_of,
-            source_path=meta_info.source_path,
-            source=meta_info.source,
-        ),
-    )
+    def build() -> dict:
+        meta_info = projection_service.get_projection_meta(season=season, week=week)
+        return envelope(
+            ProjectionResponse,
+            season=season,
+            week=week,
+            scoring_format=scoring,
+            projections=_df_to_projection_list(df, scoring),
+            generated_at=datetime.now(timezone.utc).isoformat(),
+            meta=envelope(
+                ProjectionMeta,
+                season=meta_info.season,
+                week=meta_info.week,
+                data_as_of=meta_info.data_as_of,
+                source_path=meta_info.source_path,
+                source=meta_info.source,
+            ),
+        )
+
+    return json_response(request, build, version=artifact_version(df))
 
 
 @router.get("/latest-week", response_model=LatestWeekResponse)
@@ -213,14 +165,16 @@ def projections_comparison(
 
 @router.get("/top", response_model=ProjectionResponse)
 def top_projections(
+    request: Request,
     season: int = Query(..., ge=1999, le=2030),
     week: int = Query(..., ge=1, le=18),
     scoring: str = Query("half_ppr"),
     position: Optional[str] = Query(None),
     limit: int = Query(20, ge=1, le=100),
-) -> ProjectionResponse:
+) -> Response:
     """Convenience endpoint: top N projected players (shorthand for limit)."""
     return list_projections(
+        request,
         season=season,
         week=week,
         scoring=scoring,
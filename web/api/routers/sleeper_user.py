@@ -15,6 +15,7 @@ import math
 import os
 import time
 from datetime import datetime, timezone
+from functools import partial
 from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Tuple
 
 import pandas as pd
@@ -22,8 +23,13 @@ from fastapi import APIRouter, HTTPException, Query, Response
 
 from src.config import SENTIMENT_CONFIG
 from src.draft_models import PickEvent
+from src.http_client import fan_out
 from src.projection_store import load_latest_preseason
-from src.league_scoring import score_with_settings, unmodeled_offense_keys
+from src.league_scoring import (
+    ScoringEngine,
+    score_with_settings,
+    unmodeled_offense_keys,
+)
 from src.roster_optimizer import drop_candidates, optimal_lineup
 from src.sleeper_http import (
     fetch_sleeper_json,
@@ -186,6 +192,26 @@ def _cached_projections(season: int) -> Optional[pd.DataFrame]:
     return df
 
 
+def _scoring_engine(season: int) -> Optional[ScoringEngine]:
+    """Return the season's :class:`ScoringEngine`, rebuilt when projections reload.
+
+    The stat matrix is built once per projections frame and shared by every
+    league scored against it, so a league costs a weight vector and a shallow
+    frame rather than a full copy. The engine's base frame has ``vorp``
+    dropped (see :func:`_league_projections`).
+    """
+    projections = _cached_projections(season)
+    if projections is None or projections.empty:
+        return None
+    key = f"scoring_engine:{season}"
+    cached = _cache_get(key)
+    if cached is not None and cached[0] is projections:
+        return cached[1]
+    engine = ScoringEngine(projections.drop(columns=["vorp"], errors="ignore"))
+    _cache_set(key, (projections, engine))
+    return engine
+
+
 def _league_projections(
     league_id: str, season: int, scoring_settings: Dict[str, Any]
 ) -> Optional[pd.DataFrame]:
@@ -200,15 +226,33 @@ def _league_projections(
     cached = _cache_get(key)
     if cached is not None:
         return cached
+    return _score_leagues(season, {league_id: scoring_settings}).get(league_id)
+
+
+def _score_leagues(
+    season: int, settings_by_league: Dict[str, Dict[str, Any]]
+) -> Dict[str, pd.DataFrame]:
+    """Re-score projections for several leagues in one batch and cache each.
+
+    Leagues with no scoring settings get the preset projections unchanged.
+    Returned frames share the cached projections' columns; do not write into
+    them in place.
+
+    Returns:
+        league_id -> projections, or an empty dict when the season has none.
+    """
+    engine = _scoring_engine(season)
+    if engine is None:
+        return {}
     projections = _cached_projections(season)
-    if projections is None or projections.empty:
-        return None
-    if scoring_settings:
-        projections = score_with_settings(projections, scoring_settings)
-        if "vorp" in projections.columns:
-            projections = projections.drop(columns=["vorp"])
-    _cache_set(key, projections)
-    return projections
+    scored = engine.score_many(
+        {league_id: ss for league_id, ss in settings_by_league.items() if ss}
+    )
+    out: Dict[str, pd.DataFrame] = {}
+    for league_id in settings_by_league:
+        out[league_id] = scored.get(league_id, projections)
+        _cache_set(f"league_proj:{league_id}:{season}", out[league_id])
+    return out
 
 
 # ---------------------------------------------------------------------------
@@ -437,6 +481,49 @@ def _user_team_name(league_id: str, user_id: str) -> Optional[str]:
     return None
 
 
+def _prefetch_league_resources(league_id: str, resources: Tuple[str, ...]) -> None:
+    """Warm the TTL cache for several league resources concurrently.
+
+    The league endpoints need up to four independent Sleeper reads (league,
+    rosters, league users, drafts). Fetching the uncached ones through
+    :func:`~src.http_client.fan_out` costs one round trip instead of one per
+    resource; the regular cached helpers (``_require_league``,
+    ``_cached_rosters``, ...) then read from the cache. An invalid league
+    payload is not cached, so ``_require_league`` still raises its 404.
+
+    Args:
+        league_id: Numeric Sleeper league ID.
+        resources: Any of ``"league"``, ``"rosters"``, ``"league_users"``,
+            ``"drafts"``.
+    """
+    fetchers = {
+        "league": get_league,
+        "rosters": get_league_rosters,
+        "league_users": get_league_users,
+        "drafts": get_drafts_for_league,
+    }
+    missing = [
+        name
+        for name in dict.fromkeys(resources)
+        if _cache_get(f"{name}:{league_id}") is None
+    ]
+    if len(missing) < 2:
+        return  # nothing to overlap; the cached helpers fetch on demand
+    results = fan_out(
+        [
+            partial(fetchers[name], league_id, timeout=_SLEEPER_TIMEOUT_S)
+            for name in missing
+        ]
+    )
+    for name, value in zip(missing, results):
+        if name == "league":
+            if not value or not value.get("name"):
+                continue
+        elif value is None:
+            continue
+        _cache_set(f"{name}:{league_id}", value)
+
+
 def _require_league_projections(
     league_id: str, season: int, scoring_settings: Dict[str, Any]
 ) -> pd.DataFrame:
@@ -686,7 +773,9 @@ class _LeagueContext(NamedTuple):
     roster_format: str
 
 
-def _build_league_context(league_id: str, season: Optional[int]) -> "_LeagueContext":
+def _build_league_context(
+    league_id: str, season: Optional[int], prefetch: Tuple[str, ...] = ()
+) -> "_LeagueContext":
     """Validate, fetch, and assemble shared league context.
 
     Runs the three-step prologue every league endpoint shares: numeric-ID
@@ -697,6 +786,9 @@ def _build_league_context(league_id: str, season: Optional[int]) -> "_LeagueCont
     Args:
         league_id: Numeric Sleeper league ID string.
         season: Requested NFL season year, or ``None`` to default to current.
+        prefetch: Further league resources the endpoint will read (see
+            :func:`_prefetch_league_resources`), fetched concurrently with
+            the league itself.
 
     Returns:
         ``_LeagueContext`` with all fields populated.
@@ -706,6 +798,7 @@ def _build_league_context(league_id: str, season: Optional[int]) -> "_LeagueCont
         HTTPException 404: league not found on Sleeper.
     """
     _validate_numeric_league_id(league_id)
+    _prefetch_league_resources(league_id, ("league",) + tuple(prefetch))
     league = _require_league(league_id)
     use_season = season if season is not None else _current_year()
     scoring_settings: Dict[str, Any] = league.get("scoring_settings") or {}
@@ -757,7 +850,9 @@ def league_overview(
         HTTPException 400: non-numeric league_id.
         HTTPException 404: league not found on Sleeper.
     """
-    ctx = _build_league_context(league_id, season)
+    ctx = _build_league_context(
+        league_id, season, ("league_users", "rosters") if user_id else ()
+    )
     scoring_label = _scoring_format_label(ctx.scoring_settings)
     deltas = _scoring_delta_badges(ctx.scoring_settings)
     unmodeled = unmodeled_offense_keys(ctx.scoring_settings)
@@ -842,7 +937,7 @@ def league_roster_report(
         HTTPException 404: league not found or user not in league.
         HTTPException 503: projections unavailable (no preseason parquet on disk).
     """
-    ctx = _build_league_context(league_id, season)
+    ctx = _build_league_context(league_id, season, ("rosters",))
 
     # --- re-scored projections (cached) --------------------------------------
     projections = _require_league_projections(
@@ -958,7 +1053,7 @@ def league_waivers(
         HTTPException 404: league not found or user not in league.
         HTTPException 503: projections unavailable.
     """
-    ctx = _build_league_context(league_id, season)
+    ctx = _build_league_context(league_id, season, ("rosters",))
     projections = _require_league_projections(
         league_id, ctx.use_season, ctx.scoring_settings
     )
@@ -1312,7 +1407,7 @@ def league_my_week(
         HTTPException 400: non-numeric league_id.
         HTTPException 404: league not found or user not in league.
     """
-    ctx = _build_league_context(league_id, season)
+    ctx = _build_league_context(league_id, season, ("rosters",))
 
     # --- resolve week --------------------------------------------------------
     resolved_week = week
@@ -1698,7 +1793,7 @@ def league_draft_prep(
         HTTPException 400: non-numeric league_id.
         HTTPException 404: league not found on Sleeper.
     """
-    ctx = _build_league_context(league_id, season)
+    ctx = _build_league_context(league_id, season, ("rosters", "drafts"))
     league = ctx.league
     use_season = ctx.use_season
     scoring_settings = ctx.scoring_settings
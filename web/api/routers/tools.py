@@ -10,16 +10,21 @@ from __future__ import annotations
 
 import glob
 import logging
-from typing import Any, Dict, List, Optional
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
+import numpy as np
 import pandas as pd
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Query, Request, Response
 from pydantic import BaseModel, Field
 
 from src.projection_store import load_latest_preseason
 from src.scoring_calculator import calculate_fantasy_points_df
 
 from ..config import DATA_DIR
+from ..serialization import envelope, frame_records, json_response, optional_text
 from ..services import projection_service
 from ..services.team_roster_service import get_current_week
 
@@ -33,6 +38,8 @@ _INJURY_ZERO_STATUSES = {"OUT", "IR", "PUP", "NFI", "SUSPENDED"}
 _INJURY_DOUBTFUL_MULT = 0.85
 _MATCHUP_RANK_MIN, _MATCHUP_RANK_MAX = 1, 32
 _MATCHUP_FACTOR_MIN, _MATCHUP_FACTOR_MAX = 0.95, 1.05
+_ROS_CACHE_MAX_ENTRIES = 64
+_MAX_BATCH_TRADES = 500
 
 
 # ---------------------------------------------------------------------------
@@ -86,6 +93,25 @@ class TradeResponse(BaseModel):
     fairness_pct: float = Field(description="abs delta as % of larger side total")
 
 
+class TradeCandidate(BaseModel):
+    side_a: List[str] = Field(min_length=1, description="player_ids given away")
+    side_b: List[str] = Field(min_length=1, description="player_ids received")
+
+
+class BatchTradeRequest(BaseModel):
+    trades: List[TradeCandidate] = Field(min_length=1, max_length=_MAX_BATCH_TRADES)
+    season: int
+    week: Optional[int] = None
+    scoring: str = "half_ppr"
+
+
+class BatchTradeResponse(BaseModel):
+    season: int
+    from_week: int
+    scoring_format: str
+    trades: List[TradeResponse] = Field(description="One result per request trade")
+
+
 class ComparePlayer(BaseModel):
     player_id: str
     player_name: str
@@ -192,22 +218,58 @@ def _preseason_scored(season: int, scoring: str) -> pd.DataFrame:
     """Preseason projections re-scored to *scoring*, with ROS-ready columns.
 
     The committed preseason parquet is generated under half_ppr; for other
-    formats the season stat columns are re-scored vectorized.
+    formats the season stat columns are re-scored vectorized. The result is
+    cached per (season, scoring) until a newer parquet is loaded, and shared
+    between requests -- treat it as read-only.
     """
-    df = load_latest_preseason(season)
-    if df is None or df.empty:
+    raw = load_latest_preseason(season)
+    if raw is None or raw.empty:
         raise HTTPException(
             status_code=503,
             detail=f"No preseason projections on disk for season {season}.",
         )
-    df = df.copy()
+    key = ("scored", season, scoring)
+    cached = _ros_cache_get(key, (raw,))
+    if cached is not None:
+        return cached
+    df = raw.copy()
     if scoring != "half_ppr":
         df = calculate_fantasy_points_df(
             df, scoring_format=scoring, output_col="projected_season_points"
         )
+    _ros_cache_set(key, (raw,), df)
     return df
 
 
+def _latest_file(pattern: str, recursive: bool = False) -> Optional[str]:
+    files = sorted(glob.glob(pattern, recursive=recursive))
+    return files[-1] if files else None
+
+
+def _schedule_file(season: int) -> Optional[str]:
+    """Newest bronze schedule parquet for *season*."""
+    return _latest_file(
+        str(
+            DATA_DIR / "bronze" / "schedules" / f"season={season}" / "**" / "*.parquet"
+        ),
+        recursive=True,
+    )
+
+
+def _defense_rank_file() -> Optional[str]:
+    """Newest silver defense-vs-position rankings parquet (any season)."""
+    return _latest_file(
+        str(
+            DATA_DIR
+            / "silver"
+            / "defense"
+            / "positional"
+            / "season=*"
+            / "opp_rankings_*.parquet"
+        )
+    )
+
+
 def _remaining_schedule(
     season: int, from_week: int
 ) -> Optional[Dict[str, Dict[str, Any]]]:
@@ -219,22 +281,10 @@ def _remaining_schedule(
     disk so callers can fail open to linear proration.
     """
     try:
-        sched_files = sorted(
-            glob.glob(
-                str(
-                    DATA_DIR
-                    / "bronze"
-                    / "schedules"
-                    / f"season={season}"
-                    / "**"
-                    / "*.parquet"
-                ),
-                recursive=True,
-            )
-        )
-        if not sched_files:
+        sched_file = _schedule_file(season)
+        if sched_file is None:
             return None
-        sched = pd.read_parquet(sched_files[-1])
+        sched = pd.read_parquet(sched_file)
         if not {"week", "home_team", "away_team"}.issubset(sched.columns):
             return None
         if "game_type" in sched.columns:
@@ -265,21 +315,10 @@ def _latest_defense_rank_map() -> Dict[tuple, int]:
     1 = toughest matchup (fewest fantasy pts allowed), 32 = softest.
     """
     try:
-        pos_files = sorted(
-            glob.glob(
-                str(
-                    DATA_DIR
-                    / "silver"
-                    / "defense"
-                    / "positional"
-                    / "season=*"
-                    / "opp_rankings_*.parquet"
-                )
-            )
-        )
-        if not pos_files:
+        rank_file = _defense_rank_file()
+        if rank_file is None:
             return {}
-        ranks = pd.read_parquet(pos_files[-1])
+        ranks = pd.read_parquet(rank_file)
         if not {"week", "team", "position", "rank"}.issubset(ranks.columns):
             return {}
         ranks = ranks[ranks["week"] <= _SEASON_WEEKS]
@@ -297,6 +336,16 @@ def _latest_defense_rank_map() -> Dict[tuple, int]:
         return {}
 
 
+def _frame_season(df: pd.DataFrame) -> Optional[int]:
+    """The projections' ``proj_season`` (drives the schedule lookup), if any."""
+    if "proj_season" in df.columns and not df.empty:
+        try:
+            return int(df["proj_season"].dropna().iloc[0])
+        except (TypeError, ValueError, IndexError):
+            return None
+    return None
+
+
 def _with_ros(df: pd.DataFrame, from_week: int) -> pd.DataFrame:
     """Add ros_points = per-game rate x actual remaining games, tilted by
     matchup difficulty and discounted for injury status.
@@ -318,13 +367,7 @@ def _with_ros(df: pd.DataFrame, from_week: int) -> pd.DataFrame:
         df["projected_season_points"].fillna(0) * remaining_weeks / _SEASON_WEEKS
     ).round(1)
 
-    season: Optional[int] = None
-    if "proj_season" in df.columns and not df.empty:
-        try:
-            season = int(df["proj_season"].dropna().iloc[0])
-        except (TypeError, ValueError, IndexError):
-            season = None
-
+    season = _frame_season(df)
     sched = _remaining_schedule(season, from_week) if season else None
     if sched is None:
         df["ros_points"] = linear
@@ -394,6 +437,122 @@ def _to_ros_player(row: Dict[str, Any]) -> RosPlayer:
     )
 
 
+# ---------------------------------------------------------------------------
+# Shared ROS tables
+# ---------------------------------------------------------------------------
+
+# key -> (source key, sources, value); sources are held so their ids stay unique.
+_ros_cache: "OrderedDict[tuple, Tuple[tuple, tuple, Any]]" = OrderedDict()
+_ros_cache_lock = threading.Lock()
+
+
+def _source_key(sources: tuple) -> tuple:
+    """Frames compare by identity (cached reads), everything else by value."""
+    return tuple(id(x) if isinstance(x, pd.DataFrame) else x for x in sources)
+
+
+def _ros_cache_get(key: tuple, sources: tuple) -> Optional[Any]:
+    """Cached value for *key*, or None when absent or built from other sources."""
+    with _ros_cache_lock:
+        entry = _ros_cache.get(key)
+        if entry is None or entry[0] != _source_key(sources):
+            return None
+        _ros_cache.move_to_end(key)
+        return entry[2]
+
+
+def _ros_cache_set(key: tuple, sources: tuple, value: Any) -> None:
+    with _ros_cache_lock:
+        _ros_cache[key] = (_source_key(sources), sources, value)
+        _ros_cache.move_to_end(key)
+        while len(_ros_cache) > _ROS_CACHE_MAX_ENTRIES:
+            _ros_cache.popitem(last=False)
+
+
+def _file_stamp(path: Optional[str]) -> Optional[Tuple[str, int, int]]:
+    if path is None:
+        return None
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (path, st.st_mtime_ns, st.st_size)
+
+
+class RosTable:
+    """Rest-of-season points for one (season, scoring, from_week).
+
+    Built once from the scored preseason frame and shared by ``/ros``,
+    ``/trade``, ``/trades`` and ``/compare``: ``ros_points`` is the points
+    array in frame order, ``rows`` resolves player_ids to frame rows with one
+    index lookup, and ``ranking`` gives the rows sorted by ROS points.
+    ``frame`` is shared between requests -- treat it as read-only.
+    """
+
+    def __init__(self, scored: pd.DataFrame, from_week: int) -> None:
+        self.from_week = from_week
+        self.frame = _with_ros(scored, from_week)
+        self.ros_points = self.frame["ros_points"].to_numpy(dtype=np.float64)
+        self.positions = self.frame["position"].astype(str).str.upper().to_numpy()
+        self._rankings: Dict[Optional[str], np.ndarray] = {}
+        ids = self.frame["player_id"].astype(str)
+        first = ~ids.duplicated().to_numpy()
+        self._ids = pd.Index(ids.to_numpy()[first])
+        self._id_rows = np.flatnonzero(first)
+        self._records: Optional[List[Dict[str, Any]]] = None
+
+    def rows(self, player_ids: Sequence[str]) -> np.ndarray:
+        """Frame row of each player_id (its first row), -1 when absent."""
+        hit = self._ids.get_indexer([str(pid) for pid in player_ids])
+        if not len(self._id_rows):
+            return hit
+        return np.where(hit >= 0, self._id_rows[np.maximum(hit, 0)], -1)
+
+    def ranking(self, position: Optional[str] = None) -> np.ndarray:
+        """Rows sorted by ROS points (descending), optionally one position only.
+
+        Sorted with the same algorithm as ``DataFrame.sort_values`` on the
+        filtered frame, so ties keep the order the endpoint always returned.
+        """
+        key = position.upper() if position else None
+        ranking = self._rankings.get(key)
+        if ranking is None:
+            ros = pd.Series(self.ros_points)
+            if key is not None:
+                ros = ros[self.positions == key]
+            ranking = ros.sort_values(ascending=False).index.to_numpy()
+            self._rankings[key] = ranking
+        return ranking
+
+    def player(self, row: int) -> RosPlayer:
+        records = self._records
+        if records is None:
+            records = self._records = self.frame.to_dict("records")
+        return _to_ros_player(records[row])
+
+
+def _ros_table(season: int, scoring: str, from_week: int) -> RosTable:
+    """Cached :class:`RosTable`, rebuilt when projections, schedule or ranks change.
+
+    Raises:
+        HTTPException 503: no preseason projections for *season*.
+    """
+    scored = _preseason_scored(season, scoring)
+    data_season = _frame_season(scored)
+    sources = (
+        scored,
+        str(DATA_DIR),
+        _file_stamp(_schedule_file(data_season)) if data_season else None,
+        _file_stamp(_defense_rank_file()),
+    )
+    key = ("ros", season, scoring, from_week)
+    table = _ros_cache_get(key, sources)
+    if table is None:
+        table = RosTable(scored, from_week)
+        _ros_cache_set(key, sources, table)
+    return table
+
+
 def _check_scoring(scoring: str) -> None:
     if scoring not in ("ppr", "half_ppr", "standard"):
         raise HTTPException(status_code=400, detail=f"Invalid scoring: {scoring}")
@@ -437,16 +596,14 @@ def ros_rankings(
     """Rest-of-season player value rankings (powers trade + waiver decisions)."""
     _check_scoring(scoring)
     from_week = _resolve_week(season, week)
-    df = _with_ros(_preseason_scored(season, scoring), from_week)
-    if position:
-        df = df[df["position"].astype(str).str.upper() == position.upper()]
-    df = df.sort_values("ros_points", ascending=False).head(limit)
+    table = _ros_table(season, scoring, from_week)
+    order = table.ranking(position)
     return RosResponse(
         season=season,
         from_week=from_week,
         weeks_remaining=max(0, _SEASON_WEEKS - from_week + 1),
         scoring_format=scoring,
-        players=[_to_ros_player(r) for r in df.to_dict("records")],
+        players=[table.player(row) for row in order[:limit]],
     )
 
 
@@ -455,34 +612,42 @@ def ros_rankings(
 # ---------------------------------------------------------------------------
 
 
-def _match_side(df: pd.DataFrame, ids: List[str]) -> TradeSide:
-    rows: List[RosPlayer] = []
-    unmatched: List[str] = []
-    for pid in ids:
-        hit = df[df["player_id"].astype(str) == str(pid)]
-        if hit.empty:
-            unmatched.append(pid)
-            continue
-        rows.append(_to_ros_player(hit.iloc[0].to_dict()))
-    return TradeSide(
-        players=rows,
-        total_ros_points=round(sum(p.ros_points for p in rows), 1),
-        unmatched_player_ids=unmatched,
+def _evaluate_sides(
+    table: RosTable, trades: Sequence[Tuple[Sequence[str], Sequence[str]]]
+) -> List[Tuple[TradeSide, TradeSide]]:
+    """Resolve and total both sides of many trades with one id lookup.
+
+    Players with no projection count as 0 and are listed as unmatched.
+    """
+    sides = [ids for trade in trades for ids in trade]
+    flat_ids = [str(pid) for ids in sides for pid in ids]
+    labels = np.repeat(np.arange(len(sides)), [len(ids) for ids in sides])
+    rows = table.rows(flat_ids)
+    matched = rows >= 0
+    totals = np.bincount(
+        labels[matched],
+        weights=table.ros_points[rows[matched]],
+        minlength=len(sides),
     )
 
+    out: List[TradeSide] = []
+    start = 0
+    for k, ids in enumerate(sides):
+        side_rows = rows[start : start + len(ids)]
+        start += len(ids)
+        out.append(
+            TradeSide(
+                players=[table.player(r) for r in side_rows if r >= 0],
+                total_ros_points=round(float(totals[k]), 1),
+                unmatched_player_ids=[pid for pid, r in zip(ids, side_rows) if r < 0],
+            )
+        )
+    return list(zip(out[0::2], out[1::2]))
 
-@router.post("/trade", response_model=TradeResponse)
-def evaluate_trade(body: TradeRequest) -> TradeResponse:
-    """Evaluate a trade: rest-of-season value of each side + verdict.
 
-    ``side_a`` is what you give away, ``side_b`` what you receive.
-    """
-    _check_scoring(body.scoring)
-    from_week = _resolve_week(body.season, body.week)
-    df = _with_ros(_preseason_scored(body.season, body.scoring), from_week)
-
-    side_a = _match_side(df, body.side_a)
-    side_b = _match_side(df, body.side_b)
+def _trade_response(
+    season: int, from_week: int, scoring: str, side_a: TradeSide, side_b: TradeSide
+) -> TradeResponse:
     delta = round(side_b.total_ros_points - side_a.total_ros_points, 1)
     bigger = max(side_a.total_ros_points, side_b.total_ros_points)
     fairness = round(abs(delta) / bigger * 100, 1) if bigger > 0 else 0.0
@@ -503,9 +668,9 @@ def evaluate_trade(body: TradeRequest) -> TradeResponse:
         verdict += " (Some players had no projection and count as 0.)"
 
     return TradeResponse(
-        season=body.season,
+        season=season,
         from_week=from_week,
-        scoring_format=body.scoring,
+        scoring_format=scoring,
         side_a=side_a,
         side_b=side_b,
         delta_ros_points=delta,
@@ -514,6 +679,41 @@ def evaluate_trade(body: TradeRequest) -> TradeResponse:
     )
 
 
+@router.post("/trade", response_model=TradeResponse)
+def evaluate_trade(body: TradeRequest) -> TradeResponse:
+    """Evaluate a trade: rest-of-season value of each side + verdict.
+
+    ``side_a`` is what you give away, ``side_b`` what you receive.
+    """
+    _check_scoring(body.scoring)
+    from_week = _resolve_week(body.season, body.week)
+    table = _ros_table(body.season, body.scoring, from_week)
+    ((side_a, side_b),) = _evaluate_sides(table, [(body.side_a, body.side_b)])
+    return _trade_response(body.season, from_week, body.scoring, side_a, side_b)
+
+
+@router.post("/trades", response_model=BatchTradeResponse)
+def evaluate_trades(body: BatchTradeRequest) -> BatchTradeResponse:
+    """Evaluate many candidate trades against one rest-of-season table.
+
+    Each result is exactly what ``POST /tools/trade`` returns for that trade;
+    all trades share one season, from-week and scoring format.
+    """
+    _check_scoring(body.scoring)
+    from_week = _resolve_week(body.season, body.week)
+    table = _ros_table(body.season, body.scoring, from_week)
+    sides = _evaluate_sides(table, [(t.side_a, t.side_b) for t in body.trades])
+    return BatchTradeResponse(
+        season=body.season,
+        from_week=from_week,
+        scoring_format=body.scoring,
+        trades=[
+            _trade_response(body.season, from_week, body.scoring, a, b)
+            for a, b in sides
+        ],
+    )
+
+
 # ---------------------------------------------------------------------------
 # Start/Sit comparator
 # ---------------------------------------------------------------------------
@@ -526,22 +726,10 @@ def _opp_rank_lookup(season: int, week: int) -> Dict[tuple, int]:
     lineups service data; returns {} when unavailable.
     """
     try:
-        sched_files = sorted(
-            glob.glob(
-                str(
-                    DATA_DIR
-                    / "bronze"
-                    / "schedules"
-                    / f"season={season}"
-                    / "**"
-                    / "*.parquet"
-                ),
-                recursive=True,
-            )
-        )
-        if not sched_files:
+        sched_file = _schedule_file(season)
+        if sched_file is None:
             return {}
-        sched = pd.read_parquet(sched_files[-1])
+        sched = pd.read_parquet(sched_file)
         sched = sched[sched["week"] == week]
         opp: Dict[str, str] = {}
         for _, g in sched.iterrows():
@@ -583,30 +771,30 @@ def compare_players(
     except FileNotFoundError as exc:
         raise HTTPException(status_code=404, detail=str(exc))
 
-    ros_df = None
+    ros_points: Dict[str, float] = {}
     try:
-        ros_df = _with_ros(_preseason_scored(season, scoring), week)
+        table = _ros_table(season, scoring, week)
+        for pid, row in zip(id_list, table.rows(id_list)):
+            if row >= 0:
+                ros_points[pid] = float(table.ros_points[row])
     except HTTPException:
         pass  # ROS is optional context in the weekly comparison
 
     opp_ranks = _opp_rank_lookup(season, week)
 
+    weekly_ids = df["player_id"].astype(str).to_numpy()
     players: List[ComparePlayer] = []
     for pid in id_list:
-        hit = df[df["player_id"].astype(str) == pid]
-        if hit.empty:
+        hit = np.flatnonzero(weekly_ids == pid)
+        if not len(hit):
             raise HTTPException(
                 status_code=404,
                 detail=f"Player {pid} not found in season={season} week={week}",
             )
-        row = hit.iloc[0]
+        row = df.iloc[hit[0]]
         team = str(row.get("team") or "")
         pos = str(row.get("position") or "").upper()
-        ros_pts: Optional[float] = None
-        if ros_df is not None:
-            ros_hit = ros_df[ros_df["player_id"].astype(str) == pid]
-            if not ros_hit.empty:
-                ros_pts = float(ros_hit.iloc[0]["ros_points"])
+        ros_pts = ros_points.get(pid)
         inj = row.get("injury_status")
         players.append(
             ComparePlayer(
@@ -715,8 +903,9 @@ def auction_values(
 
 @router.get("/sos", response_model=SosResponse)
 def sos_grid(
+    request: Request,
     season: Optional[int] = Query(None, ge=1999, le=2030),
-) -> SosResponse:
+) -> Response:
     """All-32-team defense-vs-position grid from the Silver opp_rankings."""
     pattern = str(
         DATA_DIR
@@ -740,27 +929,25 @@ def sos_grid(
         raise HTTPException(
             status_code=404, detail="No defense-vs-position data on disk."
         )
-    df = pd.read_parquet(files[-1])
-    # Regular season only; playoff weeks cover few teams and would shrink the grid.
-    df = df[df["week"] <= _SEASON_WEEKS]
-    latest_season = int(df["season"].max())
-    df = df[df["season"] == latest_season]
-    # Latest available row per (team, position) — teams on bye lag a week.
-    df = df.sort_values("week").groupby(["team", "position"], as_index=False).last()
-    latest_week = int(df["week"].max())
-    return SosResponse(
-        season=latest_season,
-        week=latest_week,
-        cells=[
-            SosCell(
-                team=str(r["team"]),
-                position=str(r["position"]).upper(),
-                avg_pts_allowed=float(r["avg_pts_allowed"]),
-                rank=int(r["rank"]),
-            )
-            for _, r in df.iterrows()
-        ],
-    )
+
+    def build() -> Dict[str, Any]:
+        df = pd.read_parquet(files[-1])
+        # Regular season only; playoff weeks cover few teams and would shrink
+        # the grid.
+        df = df[df["week"] <= _SEASON_WEEKS]
+        latest_season = int(df["season"].max())
+        df = df[df["season"] == latest_season]
+        # Latest available row per (team, position) — teams on bye lag a week.
+        df = df.sort_values("week").groupby(["team", "position"], as_index=False).last()
+        df["position"] = df["position"].astype(str).str.upper()
+        return envelope(
+            SosResponse,
+            season=latest_season,
+            week=int(df["week"].max()),
+            cells=frame_records(df, SosCell),
+        )
+
+    return json_response(request, build, version=_file_stamp(files[-1]))
 
 
 # ---------------------------------------------------------------------------
@@ -772,9 +959,10 @@ _OFFENSE_GROUPS = {"offense"}
 
 @router.get("/depth-charts", response_model=DepthChartResponse)
 def depth_charts(
+    request: Request,
     season: int = Query(..., ge=1999, le=2030),
     team: Optional[str] = Query(None, description="Team abbreviation filter"),
-) -> DepthChartResponse:
+) -> Response:
     """Latest committed depth chart (offense skill positions) per team."""
     files = sorted(
         glob.glob(
@@ -785,31 +973,35 @@ def depth_charts(
         raise HTTPException(
             status_code=404, detail=f"No depth charts for season {season}."
         )
-    df = pd.read_parquet(files[-1])
-    # Parquet accumulates dated snapshots — keep only the newest per team.
-    if "dt" in df.columns:
-        latest_dt = df.groupby("team")["dt"].transform("max")
-        df = df[df["dt"] == latest_dt]
-    skill = df[df["pos_abb"].astype(str).str.upper().isin(("QB", "RB", "WR", "TE"))]
-    if team:
-        skill = skill[skill["team"].astype(str).str.upper() == team.upper()]
-    skill = skill.drop_duplicates(subset=["team", "pos_abb", "pos_rank", "player_name"])
-    skill = skill.sort_values(["team", "pos_abb", "pos_rank"])
-    as_of = str(df["dt"].max()) if "dt" in df.columns and len(df) else None
-    return DepthChartResponse(
-        season=season,
-        as_of=as_of,
-        entries=[
-            DepthChartEntry(
-                team=str(r["team"]),
-                position=str(r["pos_abb"]).upper(),
-                player_name=str(r["player_name"]),
-                depth_rank=int(r["pos_rank"]),
-                gsis_id=str(r["gsis_id"]) if pd.notna(r.get("gsis_id")) else None,
-            )
-            for _, r in skill.iterrows()
-        ],
-    )
+
+    def build() -> Dict[str, Any]:
+        df = pd.read_parquet(files[-1])
+        # Parquet accumulates dated snapshots — keep only the newest per team.
+        if "dt" in df.columns:
+            latest_dt = df.groupby("team")["dt"].transform("max")
+            df = df[df["dt"] == latest_dt]
+        pos = df["pos_abb"].astype(str).str.upper()
+        skill = df[pos.isin(("QB", "RB", "WR", "TE"))]
+        if team:
+            skill = skill[skill["team"].astype(str).str.upper() == team.upper()]
+        skill = skill.drop_duplicates(
+            subset=["team", "pos_abb", "pos_rank", "player_name"]
+        )
+        skill = skill.sort_values(["team", "pos_abb", "pos_rank"])
+        as_of = str(df["dt"].max()) if "dt" in df.columns and len(df) else None
+        return envelope(
+            DepthChartResponse,
+            season=season,
+            as_of=as_of,
+            entries=frame_records(
+                skill.assign(pos_abb=pos),
+                DepthChartEntry,
+                columns={"position": "pos_abb", "depth_rank": "pos_rank"},
+                converters={"gsis_id": optional_text()},
+            ),
+        )
+
+    return json_response(request, build, version=_file_stamp(files[-1]))
 
 
 # ---------------------------------------------------------------------------
@@ -0,0 +1,434 @@
+"""
+DataFrame -> JSON bytes serialization for the read endpoints.
+
+The list endpoints used to walk ``df.iterrows()`` and build one Pydantic
+model per row, so a 500-player projections payload paid for pandas row
+boxing plus full model validation on every request. This module keeps the
+response schemas in ``models/schemas.py`` as the contract but fills them
+column-wise:
+
+  * :func:`frame_records` converts a DataFrame slice to one dict per row in
+    a model's field order. Each field's coercion is inferred from its
+    annotation (``str`` / ``Optional[float]`` / ``int`` / ``bool`` ...) and
+    applied to the whole column at once -- NaN/None handling included --
+    with per-field overrides (:func:`text`, :func:`optional_number`, ...)
+    for endpoints that round or default differently.
+  * :func:`envelope` builds a response object in field order with the
+    model's defaults, rejecting unknown or missing required fields.
+  * :func:`dumps` encodes with ``orjson`` (stdlib ``json`` when it is not
+    installed).
+  * :func:`json_response` serves the bytes with an ``ETag``; a matching
+    ``If-None-Match`` gets a 304. When the caller passes the version of the
+    artifact the payload was built from (:func:`artifact_version`), the
+    bytes are cached per ``(path, query, version)`` so repeat polls skip
+    both the read and the serialization. A rewritten artifact has a new
+    version, so stale bytes are never served. ``generated_at`` in a cached
+    payload is the time it was first built.
+
+Hit/miss counters are served by ``GET /api/ops/cache-stats``.
+"""
+
+import hashlib
+import json
+import logging
+import threading
+import typing
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, List, Mapping, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from fastapi import Request, Response
+from pydantic import BaseModel
+
+from .config import RESPONSE_CACHE_MAX_BYTES
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is in web/requirements.txt
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+#: ``DataFrame.attrs`` key carrying the version of the artifact a frame was
+#: read from (set by the Parquet services, absent for the DB backend).
+ARTIFACT_VERSION_ATTR = "artifact_version"
+
+#: A column converter: ``(column or None when absent, n_rows) -> values``.
+Converter = Callable[[Optional[pd.Series], int], List[Any]]
+
+_NULL_STRINGS = ("nan", "none", "")
+
+
+# ---------------------------------------------------------------------------
+# Column converters
+# ---------------------------------------------------------------------------
+
+
+def _numeric(s: pd.Series) -> np.ndarray:
+    return pd.to_numeric(s, errors="coerce").to_numpy(dtype=float)
+
+
+def _rounded(values: List[Optional[float]], ndigits: Optional[int]) -> list:
+    if ndigits is None:
+        return values
+    # Builtin round(), matching the per-row helpers this replaces.
+    return [None if v is None else round(v, ndigits) for v in values]
+
+
+def text(default: str = "") -> Converter:
+    """``str(value)`` per row (``default`` when the column is absent)."""
+
+    def convert(s: Optional[pd.Series], n: int) -> List[Any]:
+        if s is None:
+            return [default] * n
+        return s.astype(str).tolist()
+
+    return convert
+
+
+def optional_text() -> Converter:
+    """``str(value)``, or None for missing / ``"nan"`` / ``"none"`` / ``""``."""
+
+    def convert(s: Optional[pd.Series], n: int) -> List[Any]:
+        if s is None:
+            return [None] * n
+        values = s.astype(str)
+        null = s.isna().to_numpy() | values.str.lower().isin(_NULL_STRINGS).to_numpy()
+        return [None if z else v for v, z in zip(values.tolist(), null)]
+
+    return convert
+
+
+def number(default: float = 0.0, ndigits: Optional[int] = None) -> Converter:
+    """Float per row; missing / non-numeric values become ``default``."""
+
+    def convert(s: Optional[pd.Series], n: int) -> List[Any]:
+        if s is None:
+            return [default] * n
+        values = _numeric(s)
+        values = np.where(np.isnan(values), default, values)
+        return _rounded(values.tolist(), ndigits)
+
+    return convert
+
+
+def optional_number(ndigits: Optional[int] = None) -> Converter:
+    """Float per row, None for missing / NaN / non-numeric values."""
+
+    def convert(s: Optional[pd.Series], n: int) -> List[Any]:
+        if s is None:
+            return [None] * n
+        values = _numeric(s)
+        null = np.isnan(values)
+        out = [None if z else v for v, z in zip(values.tolist(), null)]
+        return _rounded(out, ndigits)
+
+    return convert
+
+
+def integer(default: int = 0) -> Converter:
+    """``int(float(value))`` per row; missing values become ``default``."""
+
+    def convert(s: Optional[pd.Series], n: int) -> List[Any]:
+        if s is None:
+            return [default] * n
+        values = _numeric(s)
+        null = np.isnan(values)
+        ints = np.trunc(np.where(null, 0.0, values)).astype(np.int64).tolist()
+        return [default if z else v for v, z in zip(ints, null)]
+
+    return convert
+
+
+def optional_integer() -> Converter:
+    """``int(float(value))`` per row, None for missing values."""
+    convert_int = integer()
+
+    def convert(s: Optional[pd.Series], n: int) -> List[Any]:
+        if s is None:
+            return [None] * n
+        null = np.isnan(_numeric(s))
+        return [None if z else v for v, z in zip(convert_int(s, n), null)]
+
+    return convert
+
+
+def flag(default: bool = False) -> Converter:
+    """``bool(value)`` per row (NaN counts as set, like ``bool(nan)``)."""
+
+    def convert(s: Optional[pd.Series], n: int) -> List[Any]:
+        if s is None:
+            return [default] * n
+        return s.astype(bool).tolist()
+
+    return convert
+
+
+# ---------------------------------------------------------------------------
+# Schema-driven conversion
+# ---------------------------------------------------------------------------
+
+
+def _split_optional(annotation: Any) -> Tuple[Any, bool]:
+    if typing.get_origin(annotation) is typing.Union:
+        args = [a for a in typing.get_args(annotation) if a is not type(None)]
+        if len(args) == 1:
+            return args[0], True
+    return annotation, False
+
+
+def _default_converter(name: str, field: Any) -> Converter:
+    base, optional = _split_optional(field.annotation)
+    default = None if field.is_required() else field.default
+    if optional:
+        converters = {
+            str: optional_text,
+            float: optional_number,
+            int: optional_integer,
+        }
+        if base in converters:
+            return converters[base]()
+    elif base is str:
+        return text("" if default is None else default)
+    elif base is float:
+        return number(0.0 if default is None else default)
+    elif base is bool:
+        return flag(False if default is None else default)
+    elif base is int:
+        return integer(0 if default is None else default)
+    raise TypeError(
+        f"No column converter for {name}: {field.annotation!r}; "
+        "pass one in converters= or a constant in values="
+    )
+
+
+def frame_records(
+    df: pd.DataFrame,
+    model: typing.Type[BaseModel],
+    *,
+    columns: Optional[Mapping[str, Any]] = None,
+    values: Optional[Mapping[str, Any]] = None,
+    converters: Optional[Mapping[str, Converter]] = None,
+) -> List[Dict[str, Any]]:
+    """Convert ``df`` to one dict per row shaped like ``model``.
+
+    Args:
+        df: Rows to serialize, in output order.
+        model: Response schema; output keys are its fields, in order.
+        columns: Source column per field (default: the field name). A tuple
+            names fallbacks -- the first column present is used.
+        values: Constants for fields that do not come from ``df``.
+        converters: Per-field :data:`Converter` overriding the one inferred
+            from the field annotation.
+
+    Returns:
+        List of plain dicts, ready for :func:`dumps`.
+
+    Raises:
+        TypeError: A field's annotation has no inferred converter and none
+            was given.
+    """
+    columns = columns or {}
+    values = values or {}
+    converters = converters or {}
+    n = len(df)
+
+    names: List[str] = []
+    cols: List[List[Any]] = []
+    for name, field in model.model_fields.items():
+        names.append(name)
+        if name in values:
+            cols.append([values[name]] * n)
+            continue
+        source = columns.get(name, name)
+        candidates = source if isinstance(source, tuple) else (source,)
+        present = next((c for c in candidates if c in df.columns), None)
+        series = df[present] if present is not None else None
+        if isinstance(series, pd.DataFrame):  # duplicate column names
+            series = series.iloc[:, 0]
+        convert = converters.get(name) or _default_converter(name, field)
+        cols.append(convert(series, n))
+    return [dict(zip(names, row)) for row in zip(*cols)] if n else []
+
+
+def envelope(model: typing.Type[BaseModel], **fields: Any) -> Dict[str, Any]:
+    """A ``model``-shaped dict: field order, defaults filled in.
+
+    Nested models are dumped; lists of dicts from :func:`frame_records` are
+    passed through as-is.
+
+    Raises:
+        TypeError: Unknown field, or a required field is missing.
+    """
+    unknown = set(fields) - set(model.model_fields)
+    if unknown:
+        raise TypeError(f"{model.__name__} has no fields {sorted(unknown)}")
+    out: Dict[str, Any] = {}
+    for name, field in model.model_fields.items():
+        if name in fields:
+            value = fields[name]
+        elif field.is_required():
+            raise TypeError(f"{model.__name__}.{name} is required")
+        else:
+            value = field.get_default(call_default_factory=True)
+        if isinstance(value, BaseModel):
+            value = value.model_dump()
+        elif isinstance(value, list) and value and isinstance(value[0], BaseModel):
+            value = [v.model_dump() for v in value]
+        out[name] = value
+    return out
+
+
+def _json_default(obj: Any) -> Any:
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps(obj: Any) -> bytes:
+    """Encode ``obj`` as compact JSON bytes (NaN is written as ``null``)."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(obj, separators=(",", ":"), default=_json_default).encode()
+
+
+# ---------------------------------------------------------------------------
+# Artifact versions
+# ---------------------------------------------------------------------------
+
+
+def tag_version(df: pd.DataFrame, version: Hashable) -> pd.DataFrame:
+    """Record the version of the artifact ``df`` was read from."""
+    df.attrs[ARTIFACT_VERSION_ATTR] = version
+    return df
+
+
+def artifact_version(df: pd.DataFrame) -> Optional[Hashable]:
+    """Version set by :func:`tag_version`, or None (untagged / DB backend)."""
+    return df.attrs.get(ARTIFACT_VERSION_ATTR)
+
+
+# ---------------------------------------------------------------------------
+# Response cache
+# ---------------------------------------------------------------------------
+
+
+class _Body:
+    __slots__ = ("content", "etag")
+
+    def __init__(self, content: bytes) -> None:
+        self.content = content
+        digest = hashlib.blake2b(content, digest_size=16).hexdigest()
+        self.etag = f'"{digest}"'
+
+
+class ResponseCache:
+    """Thread-safe LRU of serialized response bodies under a byte budget.
+
+    Args:
+        max_bytes: Budget for cached bodies. ``0`` disables caching (ETags
+            and 304s still work).
+    """
+
+    def __init__(self, max_bytes: int = RESPONSE_CACHE_MAX_BYTES) -> None:
+        self.max_bytes = max_bytes
+        self._bodies: "OrderedDict[Hashable, _Body]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._counters = {"hits": 0, "misses": 0, "not_modified": 0, "evictions": 0}
+
+    def get(self, key: Hashable) -> Optional[_Body]:
+        with self._lock:
+            body = self._bodies.get(key)
+            if body is None:
+                self._counters["misses"] += 1
+                return None
+            self._bodies.move_to_end(key)
+            self._counters["hits"] += 1
+            return body
+
+    def put(self, key: Hashable, body: _Body) -> None:
+        size = len(body.content)
+        if self.max_bytes <= 0 or size > self.max_bytes:
+            return
+        with self._lock:
+            old = self._bodies.pop(key, None)
+            if old is not None:
+                self._bytes -= len(old.content)
+            self._bodies[key] = body
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                _, evicted = self._bodies.popitem(last=False)
+                self._bytes -= len(evicted.content)
+                self._counters["evictions"] += 1
+
+    def note_not_modified(self) -> None:
+        with self._lock:
+            self._counters["not_modified"] += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._bodies.clear()
+            self._bytes = 0
+            for k in self._counters:
+                self._counters[k] = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Counters plus current occupancy, for the ops router."""
+        with self._lock:
+            return {
+                **self._counters,
+                "entries": len(self._bodies),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+            }
+
+
+response_cache = ResponseCache()
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag == "*" or tag.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+def json_response(
+    request: Request,
+    build: Callable[[], Any],
+    version: Optional[Hashable] = None,
+) -> Response:
+    """Serve ``build()`` as JSON bytes with ETag / If-None-Match support.
+
+    Args:
+        request: Incoming request; its path and query string key the cache.
+        build: Returns the payload (see :func:`envelope`); only called on a
+            cache miss.
+        version: Version of the artifact the payload is built from. None
+            skips the byte cache (the ETag is still computed).
+
+    Returns:
+        200 with the JSON body, or an empty 304 when the client already
+        holds the current ETag.
+    """
+    key = None
+    body = None
+    if version is not None:
+        key = (request.url.path, tuple(sorted(request.query_params.multi_items())))
+        key = (key, version)
+        body = response_cache.get(key)
+    if body is None:
+        body = _Body(dumps(build()))
+        if key is not None:
+            response_cache.put(key, body)
+
+    headers = {"ETag": body.etag, "Cache-Control": "no-cache"}
+    if _etag_matches(request.headers.get("if-none-match"), body.etag):
+        response_cache.note_not_modified()
+        return Response(status_code=304, headers=headers)
+    return Response(body.content, media_type="application/json", headers=headers)
@@ -43,7 +43,6 @@ from __future__ import annotations
 
 import json
 import logging
-import re
 import time
 from datetime import datetime, timezone
 from pathlib import Path
@@ -52,6 +51,8 @@ from typing import Any, Dict, List, Optional, Tuple
 import pandas as pd
 import requests
 
+from partition_manifest import latest_parquet
+
 from ..config import DATA_DIR, GOLD_PROJECTIONS_DIR
 
 logger = logging.getLogger(__name__)
@@ -878,7 +879,6 @@ def get_external_rankings(
 # ---------------------------------------------------------------------------
 # Projection loader (reads our Gold data)
 # ---------------------------------------------------------------------------
-_FILENAME_TS_RE = re.compile(r"(\d{8}_\d{6})")
 
 
 def _latest_parquet(directory: Path) -> Optional[Path]:
@@ -888,15 +888,10 @@ def _latest_parquet(directory: Path) -> Optional[Path]:
     on mtime — the HF Spaces deployment clones the repo at build time, giving
     every file the same mtime. Directories here can mix filename prefixes
     (e.g. scoring formats), so the timestamp is extracted rather than relying
-    on a whole-name sort.
+    on a whole-name sort. Resolved through the partition manifest.
     """
-
-    def _key(p: Path) -> Tuple[str, str]:
-        m = _FILENAME_TS_RE.search(p.name)
-        return (m.group(1) if m else "", p.name)
-
-    parquets = sorted(directory.glob("*.parquet"), key=_key)
-    return parquets[-1] if parquets else None
+    latest = latest_parquet(directory)
+    return Path(latest) if latest else None
 
 
 def _load_our_projections(
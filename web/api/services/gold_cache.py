@@ -0,0 +1,225 @@
+"""
+In-process hot cache for Gold/Silver Parquet reads.
+
+The projection endpoints used to glob + sort a partition directory and
+``pd.read_parquet`` the newest file on every request. This module keeps:
+
+  * a **frame cache** keyed by ``(resolved path, mtime_ns, size)`` — a
+    rewritten or replaced file produces a new key, so staleness is never
+    served — with LRU eviction under a byte budget
+    (``GOLD_CACHE_MAX_BYTES``, measured with ``memory_usage(deep=True)``);
+  * per-frame **lookup indexes** (e.g. rows by upper-cased ``position`` or
+    by ``player_id``), built once per cached file and evicted with it. One
+    file backs each ``(season, week, scoring)`` slice, so these are the
+    per-slice indexes;
+  * a **directory-listing cache** for "newest file matching pattern",
+    revalidated against the directory's mtime — adding, removing or
+    renaming a file bumps it and forces a rescan.
+
+Cached frames are shared between requests: callers must treat them as
+read-only (``rename``/boolean filtering return new frames and are fine).
+
+Hit/miss counters are served by ``GET /api/ops/cache-stats``.
+"""
+
+import logging
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from ..config import GOLD_CACHE_MAX_BYTES
+
+logger = logging.getLogger(__name__)
+
+FrameKey = Tuple[str, int, int]
+
+
+def _frame_nbytes(df: pd.DataFrame) -> int:
+    return int(df.memory_usage(index=True, deep=True).sum())
+
+
+def _as_str(s: pd.Series) -> pd.Series:
+    """Default index normalizer: ``astype(str)``."""
+    return s.astype(str)
+
+
+class _Entry:
+    __slots__ = ("frame", "nbytes", "indexes")
+
+    def __init__(self, frame: pd.DataFrame, nbytes: int) -> None:
+        self.frame = frame
+        self.nbytes = nbytes
+        self.indexes: Dict[str, Dict[str, np.ndarray]] = {}
+
+
+class GoldCache:
+    """Thread-safe LRU cache of Parquet frames, indexes and directory scans.
+
+    Args:
+        max_bytes: Budget for cached frames plus their indexes. ``0``
+            disables frame caching (reads still go through ``read``).
+    """
+
+    def __init__(self, max_bytes: int = GOLD_CACHE_MAX_BYTES) -> None:
+        self.max_bytes = max_bytes
+        self._frames: "OrderedDict[FrameKey, _Entry]" = OrderedDict()
+        self._listings: Dict[Tuple[str, str], Tuple[int, Optional[Path]]] = {}
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._counters = {
+            "frame_hits": 0,
+            "frame_misses": 0,
+            "evictions": 0,
+            "index_builds": 0,
+            "listing_hits": 0,
+            "listing_misses": 0,
+        }
+
+    # ------------------------------------------------------------------
+    # Directory listings
+    # ------------------------------------------------------------------
+
+    def latest(
+        self,
+        directory: Path,
+        pattern: str,
+        sort_key: Callable[[Path], Any],
+    ) -> Optional[Path]:
+        """Last file in *directory* matching *pattern* under *sort_key*.
+
+        The scan result is reused until the directory's mtime changes, so
+        callers must use one ``sort_key`` per ``(directory, pattern)``.
+        """
+        try:
+            dir_mtime = os.stat(directory).st_mtime_ns
+        except OSError:
+            return None
+        key = (str(directory), pattern)
+        with self._lock:
+            cached = self._listings.get(key)
+            if cached is not None and cached[0] == dir_mtime:
+                self._counters["listing_hits"] += 1
+                return cached[1]
+            self._counters["listing_misses"] += 1
+
+        matches = sorted(Path(directory).glob(pattern), key=sort_key)
+        latest = matches[-1] if matches else None
+        with self._lock:
+            self._listings[key] = (dir_mtime, latest)
+        return latest
+
+    # ------------------------------------------------------------------
+    # Frames
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _key(path: Path) -> FrameKey:
+        resolved = Path(path).resolve()
+        st = os.stat(resolved)
+        return (str(resolved), st.st_mtime_ns, st.st_size)
+
+    def _get_entry(self, path: Path) -> Tuple[FrameKey, _Entry]:
+        key = self._key(path)
+        with self._lock:
+            entry = self._frames.get(key)
+            if entry is not None:
+                self._frames.move_to_end(key)
+                self._counters["frame_hits"] += 1
+                return key, entry
+            self._counters["frame_misses"] += 1
+
+        frame = pd.read_parquet(key[0])
+        entry = _Entry(frame, _frame_nbytes(frame))
+        with self._lock:
+            existing = self._frames.get(key)
+            if existing is not None:
+                # Another thread loaded the same file concurrently.
+                return key, existing
+            if self.max_bytes > 0 and entry.nbytes <= self.max_bytes:
+                self._frames[key] = entry
+                self._bytes += entry.nbytes
+                self._evict_locked()
+        return key, entry
+
+    def _evict_locked(self) -> None:
+        while self._bytes > self.max_bytes and self._frames:
+            _, old = self._frames.popitem(last=False)
+            self._bytes -= old.nbytes
+            self._counters["evictions"] += 1
+
+    def version(self, path: Path) -> FrameKey:
+        """Identity of *path*'s current contents: ``(path, mtime_ns, size)``."""
+        return self._key(path)
+
+    def read(self, path: Path) -> pd.DataFrame:
+        """Return the (shared, read-only) frame for *path*."""
+        return self._get_entry(path)[1].frame
+
+    def rows_where(
+        self,
+        path: Path,
+        column: str,
+        value: str,
+        normalize: Callable[[pd.Series], pd.Series] = _as_str,
+    ) -> pd.DataFrame:
+        """Rows of *path*'s frame whose normalized *column* equals *value*.
+
+        Equivalent to ``df[normalize(df[column]) == value]`` (same rows, same
+        order) but answered from an index built once per cached file. The
+        index is keyed by column and normalizer ``__name__``, so pass a
+        module-level function, not a lambda.
+        """
+        key, entry = self._get_entry(path)
+        index_name = f"{column}:{normalize.__name__}"
+        index = entry.indexes.get(index_name)
+        if index is None:
+            normalized = normalize(entry.frame[column])
+            index = {
+                k: np.asarray(v)
+                for k, v in normalized.groupby(normalized, sort=False).indices.items()
+            }
+            extra = sum(v.nbytes for v in index.values())
+            with self._lock:
+                entry.indexes[index_name] = index
+                self._counters["index_builds"] += 1
+                if self._frames.get(key) is entry:
+                    entry.nbytes += extra
+                    self._bytes += extra
+                    self._evict_locked()
+        positions = index.get(value)
+        if positions is None:
+            return entry.frame.iloc[0:0]
+        return entry.frame.iloc[positions]
+
+    # ------------------------------------------------------------------
+    # Introspection
+    # ------------------------------------------------------------------
+
+    def stats(self) -> Dict[str, int]:
+        """Counters plus current occupancy, for the ops router."""
+        with self._lock:
+            return {
+                **self._counters,
+                "entries": len(self._frames),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "listings": len(self._listings),
+            }
+
+    def clear(self) -> None:
+        """Drop every cached frame, index and listing and reset counters."""
+        with self._lock:
+            self._frames.clear()
+            self._listings.clear()
+            self._bytes = 0
+            for name in self._counters:
+                self._counters[name] = 0
+
+
+#: Process-wide cache shared by the Gold read services.
+gold_cache = GoldCache()
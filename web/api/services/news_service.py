@@ -11,11 +11,15 @@ and body text) enriched with Silver signal data (sentiment scores, event flags).
 This approach gives the frontend rich, readable news items rather than the sparse
 signal records in Silver.
 
+Bronze, Silver and sidecar JSON records are served through the columnar news
+store (``src/sentiment/storage/news_store.py``): files covered by the last
+compaction come out of its Parquet parts, newer files are parsed directly as
+an mtime-memoized tail, and both are cached in memory between requests.
+
 All reads fall back gracefully to empty results when files do not exist.
 This is intentional: the pipeline may not have ingested sentiment data yet.
 """
 
-import json
 import logging
 from collections import Counter
 from functools import lru_cache
@@ -24,7 +28,15 @@ from typing import Any, Dict, List, Optional, Tuple
 
 import pandas as pd
 
-from ..config import BRONZE_SENTIMENT_DIR, GOLD_SENTIMENT_DIR, SILVER_SENTIMENT_DIR
+from partition_manifest import latest_parquet
+from src.sentiment.storage.news_store import NewsStore, parse_published_at
+
+from ..config import (
+    BRONZE_SENTIMENT_DIR,
+    DATA_DIR,
+    GOLD_SENTIMENT_DIR,
+    SILVER_SENTIMENT_DIR,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -36,6 +48,12 @@ _GOLD_SENTIMENT_DIR = GOLD_SENTIMENT_DIR
 _SILVER_SIGNALS_DIR = SILVER_SENTIMENT_DIR / "signals"
 _SILVER_ENRICHED_DIR = SILVER_SENTIMENT_DIR / "signals_enriched"
 _BRONZE_SENTIMENT_DIR = BRONZE_SENTIMENT_DIR
+_NEWS_STORE_DIR = SILVER_SENTIMENT_DIR / "news_store"
+
+
+def _news_store() -> NewsStore:
+    """Compacted news store; files outside ``DATA_DIR`` are read as tail."""
+    return NewsStore(_NEWS_STORE_DIR, DATA_DIR)
 
 
 # ---------------------------------------------------------------------------
@@ -204,12 +222,11 @@ def _latest_parquet(directory: Path) -> Optional[Path]:
 
     Filenames carry a YYYYMMDD_HHMMSS generation timestamp, so a name sort is
     chronological. Do NOT sort on mtime: the HF Spaces deployment clones the
-    repo at build time, giving every file the same mtime.
+    repo at build time, giving every file the same mtime. Resolved through
+    the Gold partition manifest.
     """
-    if not directory.exists():
-        return None
-    parquets = sorted(directory.glob("*.parquet"), key=lambda p: p.name)
-    return parquets[-1] if parquets else None
+    latest = latest_parquet(directory)
+    return Path(latest) if latest else None
 
 
 def _load_gold_sentiment(season: int, week: int) -> pd.DataFrame:
@@ -298,26 +315,10 @@ def _load_silver_records(files: List[Path]) -> List[Dict[str, Any]]:
         files: List of paths to Silver signal JSON files.
 
     Returns:
-        Flat list of signal record dicts.
+        Flat list of signal record dicts, shared with the news-store cache
+        (copy before mutating).
     """
-    records: List[Dict[str, Any]] = []
-    for path in files:
-        try:
-            data = json.loads(path.read_text(encoding="utf-8"))
-        except Exception as exc:
-            logger.warning("Could not read Silver file %s: %s", path, exc)
-            continue
-
-        if isinstance(data, dict):
-            batch = data.get("records", [])
-        elif isinstance(data, list):
-            batch = data
-        else:
-            continue
-
-        records.extend(r for r in batch if isinstance(r, dict))
-
-    return records
+    return _news_store().load_records("signals", files)
 
 
 def _build_silver_index(
@@ -386,36 +387,21 @@ def _load_enriched_summary_index(season: int, week: int) -> Dict[str, Dict[str,
         return {}
 
     index: Dict[str, Dict[str, Any]] = {}
-    for path in files:
-        try:
-            data = json.loads(path.read_text(encoding="utf-8"))
-        except Exception as exc:
-            logger.warning("Could not read enriched sidecar %s: %s", path, exc)
-            continue
-
-        if not isinstance(data, dict):
+    for rec in _news_store().load_records("enriched", files):
+        doc_id = rec.get("doc_id") or rec.get("signal_id")
+        if doc_id is None:
             continue
-        records = data.get("records") or []
-        if not isinstance(records, list):
+        summary = rec.get("summary")
+        refined_category = rec.get("refined_category")
+        if summary is None and refined_category is None:
             continue
-
-        for rec in records:
-            if not isinstance(rec, dict):
-                continue
-            doc_id = rec.get("doc_id") or rec.get("signal_id")
-            if doc_id is None:
-                continue
-            summary = rec.get("summary")
-            refined_category = rec.get("refined_category")
-            if summary is None and refined_category is None:
-                continue
-            key = str(doc_id)
-            # Sidecars iterated newest-first above; keep the first match
-            if key not in index:
-                index[key] = {
-                    "summary": summary,
-                    "refined_category": refined_category,
-                }
+        key = str(doc_id)
+        # Sidecars iterated newest-first above; keep the first match
+        if key not in index:
+            index[key] = {
+                "summary": summary,
+                "refined_category": refined_category,
+            }
     return index
 
 
@@ -561,27 +547,10 @@ def _load_bronze_records(files: List[Path]) -> List[Dict[str, Any]]:
         files: List of paths to Bronze JSON files.
 
     Returns:
-        Flat list of document dicts.
+        Flat list of document dicts, shared with the news-store cache (copy
+        before mutating).
     """
-    records: List[Dict[str, Any]] = []
-    for path in files:
-        try:
-            data = json.loads(path.read_text(encoding="utf-8"))
-        except Exception as exc:
-            logger.warning("Could not read Bronze file %s: %s", path, exc)
-            continue
-
-        if isinstance(data, list):
-            records.extend(r for r in data if isinstance(r, dict))
-        elif isinstance(data, dict):
-            # Current pipeline uses "items"; legacy uses "documents"
-            items = data.get("items") or data.get("documents") or []
-            if items:
-                records.extend(r for r in items if isinstance(r, dict))
-            elif "external_id" in data or "title" in data:
-                records.append(data)
-
-    return records
+    return _news_store().load_records("bronze", files)
 
 
 def _build_bronze_index(
@@ -768,14 +737,36 @@ def get_player_news(
     Returns:
         List of news item dicts ordered newest first.
     """
-    # Load silver signals for enrichment
     silver_files = _find_silver_files(season, week)
+    bronze_files = _find_bronze_files_for_season(season)
+    by_player = _player_news_index(
+        season,
+        week,
+        _files_token(silver_files),
+        _files_token(bronze_files),
+        _files_token(_find_enriched_files(season, week)),
+    )
+    return [dict(r) for r in by_player.get(player_id, ())[:limit]]
+
+
+@lru_cache(maxsize=8)
+def _player_news_index(
+    season: int,
+    week: int,
+    silver_token: Tuple[Tuple[str, int, int], ...],
+    bronze_token: Tuple[Tuple[str, int, int], ...],
+    _enriched_token: Tuple[Tuple[str, int, int], ...],
+) -> Dict[str, Tuple[Dict[str, Any], ...]]:
+    """player_id -> that player's news items, newest first, for one
+    season/week's inputs (see :func:`get_player_news`). Cached per file-stat
+    token, so a player page is a dict lookup until an input file changes."""
+    # Load silver signals for enrichment
+    silver_files = [Path(t[0]) for t in silver_token]
     silver_records = _load_silver_records(silver_files) if silver_files else []
     silver_index = _build_silver_index(silver_records)
 
     # Load bronze documents
-    bronze_files = _find_bronze_files_for_season(season)
-    bronze_records = _load_bronze_records(bronze_files)
+    bronze_records = _load_bronze_records([Path(t[0]) for t in bronze_token])
 
     items: List[Dict[str, Any]] = []
 
@@ -785,7 +776,7 @@ def get_player_news(
         silver_rec = silver_index.get(ext_id)
         item = _build_news_item_from_bronze(bronze_rec, silver_rec)
 
-        if item.get("player_id") == player_id:
+        if item.get("player_id"):
             items.append(item)
 
     # Also add silver-only records that have no bronze match
@@ -794,7 +785,7 @@ def get_player_news(
     }
     for rec in silver_records:
         doc_id = str(rec.get("doc_id") or "")
-        if doc_id not in bronze_ids and rec.get("player_id") == player_id:
+        if doc_id not in bronze_ids and rec.get("player_id"):
             items.append(_build_news_item_from_silver(rec))
 
     # Optional LLM-enrichment merge (Plan 61-06) — silently no-ops when
@@ -807,9 +798,12 @@ def get_player_news(
         applied,
     )
 
-    # Sort newest first and paginate
+    # Sort newest first
     items.sort(key=lambda r: r.get("published_at") or "", reverse=True)
-    return items[:limit]
+    by_player: Dict[str, List[Dict[str, Any]]] = {}
+    for item in items:
+        by_player.setdefault(item["player_id"], []).append(item)
+    return {pid: tuple(player_items) for pid, player_items in by_player.items()}
 
 
 def get_active_alerts(season: int, week: int) -> List[Dict[str, Any]]:
@@ -924,12 +918,84 @@ def get_news_feed(
     else:
         silver_files = _find_silver_files_all_weeks(season)
 
+    # Load bronze documents (always load full season for richest feed)
+    bronze_files = _find_bronze_files_for_season(season)
+
+    # Optional LLM-enrichment merge (Plan 61-06). We look in every
+    # week subdirectory if week was not specified so sidecars can
+    # surface across the season-wide feed.
+    if week is not None:
+        enriched_weeks = [week]
+    else:
+        # Merge across every week folder that happens to exist.
+        enriched_weeks = []
+        season_root = _SILVER_ENRICHED_DIR / f"season={season}"
+        if season_root.exists():
+            for week_dir in season_root.iterdir():
+                if week_dir.is_dir() and week_dir.name.startswith("week="):
+                    try:
+                        enriched_weeks.append(int(week_dir.name.split("=", 1)[1]))
+                    except ValueError:
+                        continue
+    enriched_files = [
+        f for wk in enriched_weeks for f in _find_enriched_files(season, wk)
+    ]
+
+    # The merged, enriched, newest-first feed only changes when one of its
+    # input files does, so it is materialized once per file-stat token and
+    # every request after that is just filters + a slice.
+    items = _merged_feed_items(
+        season,
+        tuple(enriched_weeks),
+        _files_token(silver_files),
+        _files_token(bronze_files),
+        _files_token(enriched_files),
+    )
+
+    # Apply filters (the cached list is already sorted; filtering keeps it so)
+    if source:
+        items = [r for r in items if source in (r.get("source") or "")]
+    if team:
+        items = [r for r in items if r.get("team", "") == team]
+    if player_id:
+        items = [
+            r
+            for r in items
+            if r.get("player_id") == player_id
+            or player_id in (r.get("player_name") or "")
+        ]
+
+    # Paginate (copies -- the cached items are shared between requests)
+    return [dict(r) for r in items[offset : offset + limit]]
+
+
+def _files_token(files: List[Path]) -> Tuple[Tuple[str, int, int], ...]:
+    """(path, mtime_ns, size) per file -- changes whenever any file does."""
+    token = []
+    for path in files:
+        try:
+            st = path.stat()
+        except OSError:
+            continue
+        token.append((str(path), st.st_mtime_ns, st.st_size))
+    return tuple(token)
+
+
+@lru_cache(maxsize=8)
+def _merged_feed_items(
+    season: int,
+    enriched_weeks: Tuple[int, ...],
+    silver_token: Tuple[Tuple[str, int, int], ...],
+    bronze_token: Tuple[Tuple[str, int, int], ...],
+    _enriched_token: Tuple[Tuple[str, int, int], ...],
+) -> Tuple[Dict[str, Any], ...]:
+    """Bronze items joined to Silver signals, plus silver-only items,
+    enriched and sorted newest first (see :func:`get_news_feed`)."""
+    silver_files = [Path(t[0]) for t in silver_token]
     silver_records = _load_silver_records(silver_files) if silver_files else []
     silver_index = _build_silver_index(silver_records)
 
-    # Load bronze documents (always load full season for richest feed)
-    bronze_files = _find_bronze_files_for_season(season)
-    bronze_records = _load_bronze_records(bronze_files)
+    bronze_records = _load_bronze_records([Path(t[0]) for t in bronze_token])
 
     items: List[Dict[str, Any]] = []
 
@@ -953,24 +1019,10 @@ def get_news_feed(
             seen_ids.add(doc_id)
             items.append(_build_news_item_from_silver(rec))
 
-    # Optional LLM-enrichment merge (Plan 61-06). We look in every
-    # week subdirectory if week was not specified so sidecars can
-    # surface across the season-wide feed.
     enriched_index: Dict[str, Dict[str, Any]] = {}
-    if week is not None:
-        enriched_index = _load_enriched_summary_index(season, week)
-    else:
-        # Merge across every week folder that happens to exist.
-        season_root = _SILVER_ENRICHED_DIR / f"season={season}"
-        if season_root.exists():
-            for week_dir in season_root.iterdir():
-                if week_dir.is_dir() and week_dir.name.startswith("week="):
-                    try:
-                        wk = int(week_dir.name.split("=", 1)[1])
-                    except ValueError:
-                        continue
-                    for k, v in _load_enriched_summary_index(season, wk).items():
-                        enriched_index.setdefault(k, v)
+    for wk in enriched_weeks:
+        for k, v in _load_enriched_summary_index(season, wk).items():
+            enriched_index.setdefault(k, v)
     applied = _apply_enrichment(items, enriched_index)
     logger.info(
         "get_news_feed: enrichment used=%s (%d items updated)",
@@ -978,24 +1030,9 @@ def get_news_feed(
         applied,
     )
 
-    # Apply filters
-    if source:
-        items = [r for r in items if source in (r.get("source") or "")]
-    if team:
-        items = [r for r in items if r.get("team", "") == team]
-    if player_id:
-        items = [
-            r
-            for r in items
-            if r.get("player_id") == player_id
-            or player_id in (r.get("player_name") or "")
-        ]
-
     # Sort newest first
     items.sort(key=lambda r: r.get("published_at") or "", reverse=True)
-
-    # Paginate
-    return items[offset : offset + limit]
+    return tuple(items)
 
 
 def get_team_sentiment(season: int, week: int) -> List[Dict[str, Any]]:
@@ -1641,17 +1678,7 @@ _EVENT_STORY_WEIGHTS = {
 
 def _parse_published_at(value: Any) -> Optional["datetime"]:
     """Parse an ISO published_at string to an aware UTC datetime, or None."""
-    from datetime import datetime, timezone
-
-    if not value:
-        return None
-    try:
-        dt = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
-    except ValueError:
-        return None
-    if dt.tzinfo is None:
-        dt = dt.replace(tzinfo=timezone.utc)
-    return dt
+    return parse_published_at(value)
 
 
 def _load_recent_signal_records(days: int) -> List[Dict[str, Any]]:
@@ -1660,7 +1687,9 @@ def _load_recent_signal_records(days: int) -> List[Dict[str, Any]]:
 
     Offseason stories straddle season partition dirs (June articles live
     under season=2025 week=18, July+ under season=2026 week=01), so window
-    queries must scan every season and filter on ``published_at``.
+    queries must scan every season and filter on ``published_at``. The
+    cutoff is pushed down into the news-store read, so only in-window rows
+    of compacted history are decoded.
     """
     from datetime import datetime, timedelta, timezone
 
@@ -1677,11 +1706,10 @@ def _load_recent_signal_records(days: int) -> List[Dict[str, Any]]:
 
     cutoff = datetime.now(timezone.utc) - timedelta(days=days)
     recent: List[Dict[str, Any]] = []
-    for rec in _load_silver_records(files):
+    for rec in _news_store().load_records("signals", files, since=cutoff):
         published = _parse_published_at(rec.get("published_at"))
         if published is not None and published >= cutoff:
-            rec["_published_dt"] = published
-            recent.append(rec)
+            recent.append(dict(rec, _published_dt=published))
     return recent
 
 
@@ -16,6 +16,8 @@ import pandas as pd
 
 from ..config import GOLD_PREDICTIONS_DIR
 from ..db import get_connection, is_db_enabled
+from ..serialization import tag_version
+from .gold_cache import gold_cache
 
 logger = logging.getLogger(__name__)
 
@@ -75,7 +77,9 @@ def _get_predictions_parquet(season: int, week: int) -> pd.DataFrame:
         raise FileNotFoundError(f"No parquet files in {week_dir}")
 
     logger.info("Reading predictions from %s", parquet_path)
-    return pd.read_parquet(parquet_path)
+    # Shallow copy: the cached frame is shared, the version tag is per read.
+    df = gold_cache.read(parquet_path).copy(deep=False)
+    return tag_version(df, gold_cache.version(parquet_path))
 
 
 def _get_prediction_by_game_parquet(
@@ -29,9 +29,12 @@ import pandas as pd
 # src/ is importable via the web.api package bootstrap (web/api/__init__.py) --
 # same convention game_service.py uses for game_archive.
 from game_archive import get_player_game_log
+from partition_manifest import latest_parquet, layer_root
 
 from ..config import DATA_DIR, GOLD_PROJECTIONS_DIR, WEEKLY_STALENESS_THRESHOLD_DAYS
 from ..db import get_connection, is_db_enabled
+from ..serialization import tag_version
+from .gold_cache import gold_cache
 
 logger = logging.getLogger(__name__)
 
@@ -90,6 +93,11 @@ def _filename_sort_key(p: Path) -> Tuple[str, str]:
     return (m.group(1) if m else "", p.name)
 
 
+def _upper(s: pd.Series) -> pd.Series:
+    """Upper-cased string view of a column (position index normalizer)."""
+    return s.str.upper()
+
+
 def _latest_parquet(directory: Path, pattern: str = "*.parquet") -> Optional[Path]:
     """Return the newest Parquet in *directory* by filename-embedded timestamp.
 
@@ -97,11 +105,16 @@ def _latest_parquet(directory: Path, pattern: str = "*.parquet") -> Optional[Pat
         directory: Directory to scan (non-recursive).
         pattern: Glob pattern; pass e.g. ``"projections_half_ppr_*.parquet"``
             to scope weekly reads to one scoring format.
+
+    Directories under ``data/gold`` resolve through the partition manifest
+    (``partition_manifest``): an O(1) lookup while the directory is unchanged
+    since it was recorded, else a scan revalidated against the directory
+    mtime. Anything outside a layer uses the ``gold_cache`` listing cache.
     """
-    parquets = sorted(directory.glob(pattern), key=_filename_sort_key)
-    if not parquets:
-        return None
-    return parquets[-1]
+    if layer_root(str(Path(directory) / "_")) is None:
+        return gold_cache.latest(directory, pattern, _filename_sort_key)
+    latest = latest_parquet(directory, pattern)
+    return Path(latest) if latest else None
 
 
 # Project root anchored off this file: web/api/services/projection_service.py
@@ -285,7 +298,7 @@ def _get_preseason_projections_parquet(
         season,
         week,
     )
-    df = pd.read_parquet(parquet_path)
+    df = gold_cache.read(parquet_path)
     df = _normalize_preseason_df(df, season, week, scoring_format)
 
     if position:
@@ -294,7 +307,7 @@ def _get_preseason_projections_parquet(
         df = df[df["team"].str.upper() == team.upper()]
 
     df = df.sort_values("projected_points", ascending=False).head(limit)
-    return df
+    return tag_version(df, gold_cache.version(parquet_path))
 
 
 def get_projection_meta(season: int, week: int) -> ProjectionMetaInfo:
@@ -503,7 +516,12 @@ def _get_projections_parquet(
         raise FileNotFoundError(f"No projection data for season={season} week={week}")
 
     logger.info("Reading projections from %s", parquet_path)
-    df = pd.read_parquet(parquet_path)
+    if position:
+        df = gold_cache.rows_where(
+            parquet_path, "position", position.upper(), normalize=_upper
+        )
+    else:
+        df = gold_cache.read(parquet_path)
 
     rename_map = {
         "recent_team": "team",
@@ -526,13 +544,11 @@ def _get_projections_parquet(
     df = df.rename(columns={k: v for k, v in rename_map.items() if k in df.columns})
     df["scoring_format"] = scoring_format
 
-    if position:
-        df = df[df["position"].str.upper() == position.upper()]
     if team:
         df = df[df["team"].str.upper() == team.upper()]
 
     df = df.sort_values("projected_points", ascending=False).head(limit)
-    return df
+    return tag_version(df, gold_cache.version(parquet_path))
 
 
 def _search_players_parquet(
@@ -549,12 +565,13 @@ def _search_players_parquet(
     if parquet_path is None:
         raise FileNotFoundError(f"No parquet files in {week_dir}")
 
-    df = pd.read_parquet(parquet_path)
+    df = gold_cache.read(parquet_path)
     df = df.rename(columns={"recent_team": "team"})
 
     mask = df["player_name"].str.lower().str.contains(query.lower(), na=False)
     results = df.loc[mask, ["player_id", "player_name", "team", "position"]]
-    return results.drop_duplicates().head(50)
+    results = results.drop_duplicates().head(50)
+    return tag_version(results, gold_cache.version(parquet_path))
 
 
 # ---------------------------------------------------------------------------
@@ -766,7 +783,7 @@ def get_comparison(
         }
 
     try:
-        long = pd.read_parquet(latest)
+        long = gold_cache.read(latest)
     except Exception as exc:
         logger.warning("Could not read external Silver %s: %s", latest, exc)
         return {
@@ -1004,7 +1021,7 @@ def get_player_projection_weeks(
             continue
 
         try:
-            df = pd.read_parquet(parquet_path)
+            df = gold_cache.read(parquet_path)
         except Exception as exc:
             logger.warning(
                 "Could not read projections parquet %s: %s", parquet_path, exc
@@ -1015,12 +1032,17 @@ def get_player_projection_weeks(
             continue
         season_has_data = True
 
-        if "recent_team" in df.columns and "team" not in df.columns:
-            df = df.rename(columns={"recent_team": "team"})
-        if "projected_season_points" in df.columns and "projected_points" not in df.columns:
-            df = df.rename(columns={"projected_season_points": "projected_points"})
+        match = gold_cache.rows_where(parquet_path, "player_id", str(player_id))
+        if "recent_team" in match.columns and "team" not in match.columns:
+            match = match.rename(columns={"recent_team": "team"})
+        if (
+            "projected_season_points" in match.columns
+            and "projected_points" not in match.columns
+        ):
+            match = match.rename(
+                columns={"projected_season_points": "projected_points"}
+            )
 
-        match = df[df["player_id"].astype(str) == str(player_id)]
         if match.empty:
             continue
 
@@ -21,7 +21,6 @@ convention documented in CLAUDE.md. All API field shapes match
 
 from __future__ import annotations
 
-import glob
 import logging
 from datetime import date, timedelta
 from pathlib import Path
@@ -31,6 +30,8 @@ import numpy as np
 import pandas as pd
 
 # src/ is importable via the web.api package bootstrap (web/api/__init__.py)
+from partition_manifest import latest_parquet
+
 from ..config import DATA_DIR
 from ..models.schemas import (
     CurrentWeekResponse,
@@ -118,12 +119,11 @@ def _nan_to_none(val):
 
 
 def _latest_parquet(pattern: str) -> Optional[Path]:
-    """Return the newest Parquet file matching *pattern* (sorted alphabetically by
-    timestamped filename, which is equivalent to chronological for our scheme)."""
-    matches = sorted(glob.glob(pattern))
-    if not matches:
-        return None
-    return Path(matches[-1])
+    """Return the newest Parquet file matching *pattern* (a directory plus a
+    filename glob) by filename timestamp, via the Bronze partition manifest."""
+    path = Path(pattern)
+    latest = latest_parquet(path.parent, path.name)
+    return Path(latest) if latest else None
 
 
 def _available_seasons(root: Path) -> List[int]: